@@ -8,10 +8,10 @@ standard implementation that lazily loads AI functions.
 
 import hashlib
 import json
-import time
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from ai.response_cache import ResponseCache, get_response_cache
 from utils.structured_logging import get_logger
 
 from .ai_caller import AICallerProtocol, get_default_ai_caller
@@ -33,7 +33,7 @@ MAX_SYSTEM_MESSAGE_LENGTH = 10000
 # Maximum history entries to keep per agent (prevents memory growth)
 MAX_AGENT_HISTORY_SIZE = 100
 
-# Cache settings for agent responses
+# Cache settings for agent responses (defaults of the shared ResponseCache)
 AGENT_CACHE_TTL_SECONDS = 300  # 5 minutes
 MAX_CACHE_ENTRIES = 50  # Maximum cached responses per agent
 
@@ -59,8 +59,9 @@ class BaseAgent(ABC):
         self.history: list = []
         self._ai_caller = ai_caller or get_default_ai_caller()
 
-        # Response cache: {hash: (response, timestamp)}
-        self._response_cache: Dict[str, tuple] = {}
+        # Process-wide response cache, namespaced by agent name so instances
+        # of the same agent share entries
+        self._response_cache: ResponseCache = get_response_cache()
         self._cache_enabled = True
 
     @abstractmethod
@@ -501,16 +502,29 @@ Rules:
         Returns:
             SHA256 hash string as cache key
         """
-        # Include relevant parameters that would change the response
-        key_parts = [
-            prompt,
-            str(kwargs.get('model', self.config.model)),
-            str(kwargs.get('temperature', self.config.temperature)),
-            str(kwargs.get('system_message', '')[:500])  # First 500 chars of system message
-        ]
-        key_string = '|'.join(key_parts)
+        # Include relevant parameters that would change the response, using
+        # the same system prompt _call_ai would send (in full - the whole key
+        # is hashed, so long prompts differing late must not collide)
+        system_message = kwargs.get('system_message', self.config.system_prompt) or ""
+        key_parts = {
+            'prompt': prompt,
+            'provider': self.config.provider,
+            'model': kwargs.get('model', self.config.model),
+            'temperature': kwargs.get('temperature', self.config.temperature),
+            'max_tokens': kwargs.get('max_tokens', self.config.max_tokens),
+            'system_message': system_message,
+        }
+        # Any other generation parameter passed by the caller
+        for name, value in kwargs.items():
+            key_parts.setdefault(name, value)
+        key_string = json.dumps(key_parts, sort_keys=True, default=str)
         return hashlib.sha256(key_string.encode()).hexdigest()
 
+    @property
+    def _cache_namespace(self) -> str:
+        """Namespace of this agent's entries in the shared response cache."""
+        return self.config.name
+
     def _get_cached_response(self, cache_key: str) -> Optional[str]:
         """
         Get a cached response if it exists and hasn't expired.
@@ -524,21 +538,14 @@ Rules:
         if not self._cache_enabled:
             return None
 
-        if cache_key in self._response_cache:
-            response, timestamp = self._response_cache[cache_key]
-            if time.time() - timestamp < AGENT_CACHE_TTL_SECONDS:
-                logger.debug(f"Agent {self.config.name}: Cache hit for key {cache_key[:16]}...")
-                return response
-            else:
-                # Cache entry expired, remove it
-                del self._response_cache[cache_key]
-                logger.debug(f"Agent {self.config.name}: Cache entry expired for key {cache_key[:16]}...")
-
-        return None
+        response = self._response_cache.get(cache_key, namespace=self._cache_namespace)
+        if response is not None:
+            logger.debug(f"Agent {self.config.name}: Cache hit for key {cache_key[:16]}...")
+        return response
 
     def _cache_response(self, cache_key: str, response: str):
         """
-        Cache a response with the current timestamp.
+        Cache a response in the shared response cache.
 
         Args:
             cache_key: The cache key
@@ -547,41 +554,16 @@ Rules:
         if not self._cache_enabled:
             return
 
-        # Prune cache if too large
-        if len(self._response_cache) >= MAX_CACHE_ENTRIES:
-            self._prune_cache()
-
-        self._response_cache[cache_key] = (response, time.time())
+        self._response_cache.put(cache_key, response, namespace=self._cache_namespace)
         logger.debug(f"Agent {self.config.name}: Cached response for key {cache_key[:16]}...")
 
-    def _prune_cache(self):
-        """Remove expired and oldest cache entries to stay under limit."""
-        current_time = time.time()
-
-        # First, remove all expired entries
-        expired_keys = [
-            key for key, (_, timestamp) in self._response_cache.items()
-            if current_time - timestamp >= AGENT_CACHE_TTL_SECONDS
-        ]
-        for key in expired_keys:
-            del self._response_cache[key]
-
-        # If still too large, remove oldest entries
-        while len(self._response_cache) >= MAX_CACHE_ENTRIES:
-            oldest_key = min(
-                self._response_cache.keys(),
-                key=lambda k: self._response_cache[k][1]
-            )
-            del self._response_cache[oldest_key]
-
-        logger.debug(f"Agent {self.config.name}: Pruned cache to {len(self._response_cache)} entries")
-
     def _call_ai_cached(self, prompt: str, **kwargs) -> str:
         """
         Call AI with caching support.
 
-        Checks cache first, returns cached response if valid.
-        Otherwise calls AI and caches the response.
+        Checks the shared cache first. On a miss, concurrent identical
+        requests (from any instance of this agent) are coalesced into a
+        single AI call whose response is then cached.
 
         Args:
             prompt: The prompt to send
@@ -590,23 +572,25 @@ Rules:
         Returns:
             AI response text (from cache or fresh)
         """
-        cache_key = self._compute_cache_key(prompt, **kwargs)
-
-        # Check cache first
-        cached = self._get_cached_response(cache_key)
-        if cached is not None:
-            return cached
+        if not self._cache_enabled:
+            return self._call_ai(prompt, **kwargs)
 
-        # Call AI and cache result
-        response = self._call_ai(prompt, **kwargs)
-        self._cache_response(cache_key, response)
-        return response
+        cache_key = self._compute_cache_key(prompt, **kwargs)
+        return self._response_cache.get_or_compute(
+            cache_key,
+            lambda: self._call_ai(prompt, **kwargs),
+            namespace=self._cache_namespace
+        )
 
     def clear_cache(self):
-        """Clear all cached responses."""
-        self._response_cache.clear()
+        """Clear all cached responses for this agent."""
+        self._response_cache.invalidate(self._cache_namespace)
         logger.debug(f"Agent {self.config.name}: Cache cleared")
 
+    def get_cache_metrics(self) -> Dict[str, float]:
+        """Get hit/miss/coalesced counts and latency saved for this agent."""
+        return self._response_cache.get_metrics(self._cache_namespace)
+
     def set_cache_enabled(self, enabled: bool):
         """
         Enable or disable response caching.
@@ -3,11 +3,23 @@ Agent Chain Builder Module
 
 Provides functionality for building and executing chains of agents
 with conditional routing and data transformation.
+
+ChainExecutor plans a chain as a dependency graph and runs every node whose
+predecessors have finished concurrently on a shared worker pool, so
+independent branches take as long as the slowest branch rather than the sum.
+Nodes read an immutable snapshot of the context data and return their
+updates, which the scheduler applies. Agent-node results are memoized in the
+shared response cache, keyed by agent type, agent config and task input.
 """
 
+import hashlib
 import json
+import threading
 import uuid
-from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set
 
 from ai.agents.models import AgentChain, AgentResponse, AgentTask, AgentType, ChainNode, ChainNodeType
 from managers.agent_manager import agent_manager
@@ -16,6 +28,9 @@ from utils.structured_logging import get_logger
 
 logger = get_logger(__name__)
 
+# Response-cache namespace for memoized agent-node results
+CHAIN_CACHE_NAMESPACE = "agent_chain"
+
 
 class ExecutionContext:
     """Context for chain execution containing shared data."""
@@ -43,16 +58,77 @@ class ExecutionContext:
         """Add error message."""
         self.errors.append(error)
 
+    def snapshot(self) -> 'ContextSnapshot':
+        """Immutable view of the current data, safe to hand to worker threads."""
+        return ContextSnapshot(MappingProxyType(dict(self.data)))
+
+
+class ContextSnapshot:
+    """Read-only context data passed to nodes and condition functions."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Mapping[str, Any]):
+        self.data = data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get value from context data."""
+        return self.data.get(key, default)
+
+
+@dataclass
+class NodeOutcome:
+    """What a node produced; applied to the ExecutionContext by the scheduler."""
+    result: Any = None
+    updates: Dict[str, Any] = field(default_factory=dict)
+    responses: Dict[str, AgentResponse] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+    activated: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ExecutionPlan:
+    """Dependency graph of the nodes reachable from a chain's start node."""
+    order: List[str]
+    predecessors: Dict[str, Set[str]]
+    successors: Dict[str, List[str]]
+
 
 class ChainExecutor:
     """Executes agent chains with support for complex workflows."""
 
-    def __init__(self):
+    # Worker threads shared by every executor in the process
+    MAX_CONCURRENT_NODES = 8
+
+    _shared_pool: Optional[ThreadPoolExecutor] = None
+    _pool_lock = threading.Lock()
+
+    def __init__(self, memoize: bool = True):
+        """Initialize the executor.
+
+        Args:
+            memoize: Reuse agent-node results for identical agent, config and
+                input (within and across runs). Nodes can opt out with
+                config["memoize"] = False.
+        """
         self.transformers: Dict[str, Callable] = {}
         self.conditions: Dict[str, Callable] = {}
+        self.memoize = memoize
         self._register_default_transformers()
         self._register_default_conditions()
 
+    @classmethod
+    def _get_pool(cls) -> ThreadPoolExecutor:
+        """Get or create the shared node pool (thread-safe with double-checked locking)."""
+        if cls._shared_pool is None:
+            with cls._pool_lock:
+                if cls._shared_pool is None:
+                    cls._shared_pool = ThreadPoolExecutor(
+                        max_workers=cls.MAX_CONCURRENT_NODES,
+                        thread_name_prefix="agent_chain_"
+                    )
+        return cls._shared_pool
+
     def execute_chain(self, chain: AgentChain, initial_input: Dict[str, Any]) -> ExecutionContext:
         """Execute an agent chain.
 
@@ -74,80 +150,245 @@ class ChainExecutor:
             context.add_error(f"Start node {chain.start_node_id} not found")
             return context
 
-        # Execute chain
-        self._execute_node(chain.start_node_id, node_map, context)
+        plan = self.build_plan(chain.start_node_id, node_map, context)
+        self._run_plan(plan, chain.start_node_id, node_map, context)
 
         return context
 
-    def _execute_node(
+    @staticmethod
+    def _successors(node: ChainNode) -> List[str]:
+        """All nodes a node may hand control to."""
+        targets = list(node.outputs)
+        if node.type == ChainNodeType.CONDITION:
+            targets += node.config.get("true_outputs", []) + node.config.get("false_outputs", [])
+        elif node.type == ChainNodeType.PARALLEL:
+            targets += node.config.get("parallel_nodes", [])
+        return list(dict.fromkeys(targets))
+
+    def build_plan(
         self,
-        node_id: str,
+        start_node_id: str,
         node_map: Dict[str, ChainNode],
-        context: ExecutionContext
-    ) -> Optional[Any]:
-        """Execute a single node in the chain.
+        context: Optional[ExecutionContext] = None
+    ) -> ExecutionPlan:
+        """Compute the topological plan of nodes reachable from the start node.
+
+        Edges back to a node still on the walk (cycles) are dropped, so each
+        node runs at most once. Loop bodies are run by their loop node and
+        are only scheduled separately if some other node leads to them.
 
         Args:
-            node_id: ID of the node to execute
+            start_node_id: ID of the starting node
             node_map: Map of all nodes
-            context: Execution context
+            context: Optional context to record missing nodes in
 
         Returns:
-            Node execution result
+            ExecutionPlan
         """
-        if node_id in context.executed_nodes:
-            logger.warning(f"Node {node_id} already executed, skipping to prevent loops")
-            return None
+        successors: Dict[str, List[str]] = {}
+        order: List[str] = []
+        on_stack: Set[str] = set()
+
+        # Iterative DFS; post-order reversed gives a topological order
+        stack = [(start_node_id, iter(self._successors(node_map[start_node_id])))]
+        successors[start_node_id] = []
+        on_stack.add(start_node_id)
+        while stack:
+            node_id, children = stack[-1]
+            for child in children:
+                if child not in node_map:
+                    if context is not None:
+                        context.add_error(f"Node {child} not found")
+                    continue
+                if child in on_stack:
+                    logger.warning(f"Edge {node_id} -> {child} forms a cycle, skipping to prevent loops")
+                    continue
+                successors[node_id].append(child)
+                if child not in successors:
+                    successors[child] = []
+                    on_stack.add(child)
+                    stack.append((child, iter(self._successors(node_map[child]))))
+                    break
+            else:
+                stack.pop()
+                on_stack.discard(node_id)
+                order.append(node_id)
+        order.reverse()
+
+        # A parallel node's outputs wait for all of its branches (join),
+        # where that keeps the graph acyclic
+        position = {node_id: i for i, node_id in enumerate(order)}
+        for node_id in order:
+            node = node_map[node_id]
+            if node.type != ChainNodeType.PARALLEL:
+                continue
+            for branch in node.config.get("parallel_nodes", []):
+                for output_id in node.outputs:
+                    if (branch in position and output_id in position
+                            and position[branch] < position[output_id]
+                            and output_id not in successors[branch]):
+                        successors[branch].append(output_id)
+
+        predecessors: Dict[str, Set[str]] = {node_id: set() for node_id in order}
+        for node_id, children in successors.items():
+            for child in children:
+                predecessors[child].add(node_id)
+
+        return ExecutionPlan(order=order, predecessors=predecessors, successors=successors)
+
+    def _run_plan(
+        self,
+        plan: ExecutionPlan,
+        start_node_id: str,
+        node_map: Dict[str, ChainNode],
+        context: ExecutionContext
+    ):
+        """Run every node as soon as all of its predecessors have finished.
 
-        node = node_map.get(node_id)
-        if not node:
-            context.add_error(f"Node {node_id} not found")
-            return None
+        A node runs if at least one finished predecessor activated it (a
+        condition only activates its taken branch); otherwise it is skipped
+        and its successors are resolved in turn.
+        """
+        remaining = {node_id: set(preds) for node_id, preds in plan.predecessors.items()}
+        activated: Set[str] = {start_node_id}
+        ready = [start_node_id]
+        running: Dict[Future, str] = {}
+        pool = self._get_pool()
+        snapshot = context.snapshot()
+
+        def resolve(node_id: str, activate: List[str]):
+            activated.update(activate)
+            for child in plan.successors.get(node_id, []):
+                remaining[child].discard(node_id)
+                if not remaining[child]:
+                    ready.append(child)
+
+        while ready or running:
+            while ready:
+                node_id = ready.pop()
+                if node_id in activated:
+                    future = pool.submit(self._run_node, node_map[node_id], node_map, snapshot)
+                    running[future] = node_id
+                else:
+                    resolve(node_id, [])
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node_id = running.pop(future)
+                outcome = future.result()
+                for key, value in outcome.updates.items():
+                    context.set(key, value)
+                for result_id, response in outcome.responses.items():
+                    context.add_result(result_id, response)
+                context.errors.extend(outcome.errors)
+                resolve(node_id, outcome.activated)
+            snapshot = context.snapshot()
+
+    def _run_node(
+        self,
+        node: ChainNode,
+        node_map: Dict[str, ChainNode],
+        snapshot: ContextSnapshot
+    ) -> NodeOutcome:
+        """Execute a single node against a context snapshot.
 
+        Args:
+            node: The node to execute
+            node_map: Map of all nodes
+            snapshot: Context data when the node became ready
+
+        Returns:
+            NodeOutcome (never raises)
+        """
         logger.info(f"Executing node {node.name} (type: {node.type})")
 
         try:
             # Execute based on node type
             if node.type == ChainNodeType.AGENT:
-                result = self._execute_agent_node(node, context)
+                outcome = self._execute_agent_node(node, snapshot)
             elif node.type == ChainNodeType.CONDITION:
-                result = self._execute_condition_node(node, node_map, context)
+                outcome = self._execute_condition_node(node, snapshot)
             elif node.type == ChainNodeType.TRANSFORMER:
-                result = self._execute_transformer_node(node, context)
+                outcome = self._execute_transformer_node(node, snapshot)
             elif node.type == ChainNodeType.AGGREGATOR:
-                result = self._execute_aggregator_node(node, context)
+                outcome = self._execute_aggregator_node(node, snapshot)
             elif node.type == ChainNodeType.PARALLEL:
-                result = self._execute_parallel_node(node, node_map, context)
+                outcome = self._execute_parallel_node(node, snapshot)
             elif node.type == ChainNodeType.LOOP:
-                result = self._execute_loop_node(node, node_map, context)
+                outcome = self._execute_loop_node(node, node_map, snapshot)
             else:
-                context.add_error(f"Unknown node type: {node.type}")
-                return None
+                return NodeOutcome(errors=[f"Unknown node type: {node.type}"])
 
             # Execute output nodes
-            for output_id in node.outputs:
-                self._execute_node(output_id, node_map, context)
-
-            return result
+            if not outcome.errors:
+                outcome.activated = list(node.outputs) + outcome.activated
+            return outcome
 
         except Exception as e:
-            context.add_error(f"Error executing node {node.name}: {str(e)}")
             logger.error(f"Error executing node {node.name}", exc_info=True)
+            return NodeOutcome(errors=[f"Error executing node {node.name}: {str(e)}"])
+
+    def _agent_memo_key(self, agent_type: AgentType, task: AgentTask) -> Optional[str]:
+        """Hash of agent type, agent config and task input, or None if the agent is unavailable."""
+        agent = agent_manager.get_agent(agent_type)
+        if agent is None:
             return None
+        payload = json.dumps(
+            {
+                "agent": agent_type.value,
+                "config": agent.config.model_dump(mode="json"),
+                "task": task.model_dump(mode="json"),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
-    def _execute_agent_node(self, node: ChainNode, context: ExecutionContext) -> Optional[AgentResponse]:
+    def _run_agent_task(self, node: ChainNode, task: AgentTask) -> Optional[AgentResponse]:
+        """Run an agent task, reusing a memoized result when one exists.
+
+        Identical concurrent tasks share one execution; only successful
+        responses are memoized.
+        """
+        if not (self.memoize and node.config.get("memoize", True)):
+            return agent_manager.execute_agent_task(node.agent_type, task)
+
+        memo_key = self._agent_memo_key(node.agent_type, task)
+        if memo_key is None:
+            return agent_manager.execute_agent_task(node.agent_type, task)
+
+        from ai.response_cache import get_response_cache
+
+        computed: Dict[str, Optional[AgentResponse]] = {}
+
+        def compute() -> str:
+            response = agent_manager.execute_agent_task(node.agent_type, task)
+            computed["response"] = response
+            return response.model_dump_json() if response and response.success else ""
+
+        cached = get_response_cache().get_or_compute(memo_key, compute, namespace=CHAIN_CACHE_NAMESPACE)
+        if "response" in computed:
+            return computed["response"]
+        if cached:
+            return AgentResponse.model_validate_json(cached)
+        # Another node computed the same task and it failed; run our own
+        return agent_manager.execute_agent_task(node.agent_type, task)
+
+    def _execute_agent_node(self, node: ChainNode, snapshot: ContextSnapshot) -> NodeOutcome:
         """Execute an agent node.
 
         Args:
             node: The agent node
-            context: Execution context
+            snapshot: Context data
 
         Returns:
-            Agent response if successful
+            NodeOutcome with the agent response
         """
         if not node.agent_type:
-            context.add_error(f"Agent node {node.name} missing agent_type")
-            return None
+            return NodeOutcome(errors=[f"Agent node {node.name} missing agent_type"])
 
         # Prepare task from context
         task_description = node.config.get("task_description", "Execute agent task")
@@ -156,15 +397,15 @@ class ChainExecutor:
         # Format context template with context data
         if task_context:
             try:
-                task_context = task_context.format(**context.data)
+                task_context = task_context.format(**snapshot.data)
             except KeyError as e:
                 logger.warning(f"Missing context key: {e}")
 
         # Get input data
         input_data = {}
         for input_key in node.config.get("input_keys", []):
-            if input_key in context.data:
-                input_data[input_key] = context.data[input_key]
+            if input_key in snapshot.data:
+                input_data[input_key] = snapshot.data[input_key]
 
         # Create and execute task
         task = AgentTask(
@@ -173,117 +414,96 @@ class ChainExecutor:
             input_data=input_data
         )
 
-        response = agent_manager.execute_agent_task(node.agent_type, task)
+        response = self._run_agent_task(node, task)
 
+        outcome = NodeOutcome(result=response)
         if response:
-            context.add_result(node.id, response)
+            outcome.responses[node.id] = response
 
             # Store output in context
             output_key = node.config.get("output_key", f"{node.id}_result")
-            context.set(output_key, response.result)
+            outcome.updates[output_key] = response.result
 
-        return response
+        return outcome
 
-    def _execute_condition_node(
-        self,
-        node: ChainNode,
-        node_map: Dict[str, ChainNode],
-        context: ExecutionContext
-    ) -> bool:
+    def _execute_condition_node(self, node: ChainNode, snapshot: ContextSnapshot) -> NodeOutcome:
         """Execute a condition node.
 
         Args:
             node: The condition node
-            node_map: Map of all nodes
-            context: Execution context
+            snapshot: Context data
 
         Returns:
-            Condition result
+            NodeOutcome activating the taken branch
         """
         condition_name = node.config.get("condition")
         if not condition_name:
-            context.add_error(f"Condition node {node.name} missing condition")
-            return False
+            return NodeOutcome(result=False, errors=[f"Condition node {node.name} missing condition"])
 
         # Get condition function
         condition_func = self.conditions.get(condition_name)
         if not condition_func:
             # Safely evaluate as expression using safe_eval
-            result = safe_eval(condition_name, context.data, default=False)
+            result = safe_eval(condition_name, dict(snapshot.data), default=False)
             if result is False and condition_name not in ('false', 'False', '0'):
                 # Log if evaluation may have failed (returned default)
                 logger.debug(f"Condition '{condition_name}' evaluated to False")
         else:
-            result = condition_func(context)
+            result = condition_func(snapshot)
 
         # Execute appropriate branch
-        if result:
-            true_outputs = node.config.get("true_outputs", [])
-            for output_id in true_outputs:
-                if output_id in node_map:
-                    self._execute_node(output_id, node_map, context)
-        else:
-            false_outputs = node.config.get("false_outputs", [])
-            for output_id in false_outputs:
-                if output_id in node_map:
-                    self._execute_node(output_id, node_map, context)
+        branch = "true_outputs" if result else "false_outputs"
+        return NodeOutcome(result=result, activated=list(node.config.get(branch, [])))
 
-        return result
-
-    def _execute_transformer_node(self, node: ChainNode, context: ExecutionContext) -> Any:
+    def _execute_transformer_node(self, node: ChainNode, snapshot: ContextSnapshot) -> NodeOutcome:
         """Execute a transformer node.
 
         Args:
             node: The transformer node
-            context: Execution context
+            snapshot: Context data
 
         Returns:
-            Transformed data
+            NodeOutcome with the transformed data
         """
         transformer_name = node.config.get("transformer")
         if not transformer_name:
-            context.add_error(f"Transformer node {node.name} missing transformer")
-            return None
+            return NodeOutcome(errors=[f"Transformer node {node.name} missing transformer"])
 
         transformer_func = self.transformers.get(transformer_name)
         if not transformer_func:
-            context.add_error(f"Transformer {transformer_name} not found")
-            return None
+            return NodeOutcome(errors=[f"Transformer {transformer_name} not found"])
 
         # Get input data
         input_key = node.config.get("input_key")
-        input_data = context.get(input_key) if input_key else context.data
+        input_data = snapshot.get(input_key) if input_key else dict(snapshot.data)
 
         # Transform data
         result = transformer_func(input_data, node.config)
 
         # Store output
         output_key = node.config.get("output_key", f"{node.id}_result")
-        context.set(output_key, result)
-
-        return result
+        return NodeOutcome(result=result, updates={output_key: result})
 
-    def _execute_aggregator_node(self, node: ChainNode, context: ExecutionContext) -> Any:
+    def _execute_aggregator_node(self, node: ChainNode, snapshot: ContextSnapshot) -> NodeOutcome:
         """Execute an aggregator node.
 
         Args:
             node: The aggregator node
-            context: Execution context
+            snapshot: Context data
 
         Returns:
-            Aggregated data
+            NodeOutcome with the aggregated data
         """
         # Get input keys
         input_keys = node.config.get("input_keys", [])
         if not input_keys:
-            context.add_error(f"Aggregator node {node.name} missing input_keys")
-            return None
+            return NodeOutcome(errors=[f"Aggregator node {node.name} missing input_keys"])
 
         # Collect input data
         inputs = {}
         for key in input_keys:
-            if key in context.data:
-                inputs[key] = context.data[key]
+            if key in snapshot.data:
+                inputs[key] = snapshot.data[key]
 
         # Perform aggregation
         aggregation_type = node.config.get("type", "combine")
@@ -298,93 +518,50 @@ class ChainExecutor:
         elif aggregation_type == "list":
             result = list(inputs.values())
         else:
-            context.add_error(f"Unknown aggregation type: {aggregation_type}")
-            return None
+            return NodeOutcome(errors=[f"Unknown aggregation type: {aggregation_type}"])
 
         # Store output
         output_key = node.config.get("output_key", f"{node.id}_result")
-        context.set(output_key, result)
+        return NodeOutcome(result=result, updates={output_key: result})
 
-        return result
-
-    def _execute_parallel_node(
-        self,
-        node: ChainNode,
-        node_map: Dict[str, ChainNode],
-        context: ExecutionContext
-    ) -> List[Any]:
+    def _execute_parallel_node(self, node: ChainNode, snapshot: ContextSnapshot) -> NodeOutcome:
         """Execute a parallel node.
 
+        The scheduler already runs independent nodes concurrently, so a
+        parallel node just activates all of its branches at once. Each
+        branch reads the same snapshot and writes its own output keys.
+
         Args:
             node: The parallel node
-            node_map: Map of all nodes
-            context: Execution context
+            snapshot: Context data
 
         Returns:
-            List of results from parallel execution
+            NodeOutcome activating every branch
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
         parallel_nodes = node.config.get("parallel_nodes", [])
         if not parallel_nodes:
-            context.add_error(f"Parallel node {node.name} missing parallel_nodes")
-            return []
-
-        results = []
-
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = {}
-
-            for node_id in parallel_nodes:
-                if node_id in node_map:
-                    # Create separate context for parallel execution
-                    parallel_context = ExecutionContext()
-                    parallel_context.data.update(context.data)
-
-                    future = executor.submit(
-                        self._execute_node,
-                        node_id,
-                        node_map,
-                        parallel_context
-                    )
-                    futures[future] = (node_id, parallel_context)
-
-            # Collect results
-            for future in as_completed(futures):
-                node_id, parallel_context = futures[future]
+            return NodeOutcome(result=[], errors=[f"Parallel node {node.name} missing parallel_nodes"])
 
-                try:
-                    result = future.result()
-                    results.append(result)
-
-                    # Merge results back to main context
-                    context.results.update(parallel_context.results)
-                    context.errors.extend(parallel_context.errors)
-
-                    # Optionally merge data
-                    if node.config.get("merge_data", False):
-                        context.data.update(parallel_context.data)
-
-                except Exception as e:
-                    context.add_error(f"Error in parallel execution of {node_id}: {e}")
-
-        return results
+        return NodeOutcome(result=list(parallel_nodes), activated=list(parallel_nodes))
 
     def _execute_loop_node(
         self,
         node: ChainNode,
         node_map: Dict[str, ChainNode],
-        context: ExecutionContext
-    ) -> List[Any]:
+        snapshot: ContextSnapshot
+    ) -> NodeOutcome:
         """Execute a loop node.
 
+        The loop body runs in order on this worker against a private copy
+        of the data, so each iteration sees the previous one's outputs.
+
         Args:
             node: The loop node
             node_map: Map of all nodes
-            context: Execution context
+            snapshot: Context data
 
         Returns:
-            List of results from loop iterations
+            NodeOutcome with results from loop iterations
         """
         # Get loop configuration
         loop_type = node.config.get("loop_type", "count")
@@ -392,10 +569,10 @@ class ChainExecutor:
         loop_nodes = node.config.get("loop_nodes", [])
 
         if not loop_nodes:
-            context.add_error(f"Loop node {node.name} missing loop_nodes")
-            return []
+            return NodeOutcome(result=[], errors=[f"Loop node {node.name} missing loop_nodes"])
 
-        results = []
+        outcome = NodeOutcome(result=[])
+        data = dict(snapshot.data)
         iteration = 0
 
         while iteration < max_iterations:
@@ -410,18 +587,24 @@ class ChainExecutor:
                 condition = node.config.get("condition")
                 if condition:
                     # Use safe_eval instead of eval for security
-                    if not safe_eval(condition, context.data, default=False):
+                    if not safe_eval(condition, data, default=False):
                         break
 
             # Execute loop body
-            context.set("loop_iteration", iteration)
+            data["loop_iteration"] = iteration
+            outcome.updates["loop_iteration"] = iteration
 
             for node_id in loop_nodes:
-                if node_id in node_map:
-                    result = self._execute_node(node_id, node_map, context)
-                    results.append(result)
+                if node_id not in node_map:
+                    continue
+                body = self._run_node(node_map[node_id], node_map, ContextSnapshot(MappingProxyType(data)))
+                data.update(body.updates)
+                outcome.updates.update(body.updates)
+                outcome.responses.update(body.responses)
+                outcome.errors.extend(body.errors)
+                outcome.result.append(body.result)
 
-        return results
+        return outcome
 
     def register_transformer(self, name: str, func: Callable):
         """Register a custom transformer function.
@@ -474,18 +657,18 @@ class ChainExecutor:
     def _register_default_conditions(self):
         """Register default conditions."""
 
-        def has_key(context: ExecutionContext) -> bool:
+        def has_key(context: ContextSnapshot) -> bool:
             """Check if context has a specific key."""
             key = context.get("condition_key")
             return key in context.data if key else False
 
-        def is_not_empty(context: ExecutionContext) -> bool:
+        def is_not_empty(context: ContextSnapshot) -> bool:
             """Check if a value is not empty."""
             key = context.get("condition_key")
             value = context.get(key)
             return bool(value)
 
-        def contains_text(context: ExecutionContext) -> bool:
+        def contains_text(context: ContextSnapshot) -> bool:
             """Check if text contains substring."""
             text_key = context.get("text_key")
             search_text = context.get("search_text")
@@ -520,7 +703,9 @@ class ChainBuilder:
         agent_type: AgentType,
         task_description: str = "",
         context_template: str = "",
-        output_key: str = ""
+        output_key: str = "",
+        input_keys: Optional[List[str]] = None,
+        depends_on: Optional[List[str]] = None
     ) -> 'ChainBuilder':
         """Add an agent node to the chain.
 
@@ -530,23 +715,30 @@ class ChainBuilder:
             task_description: Task description
             context_template: Context template
             output_key: Key to store output
+            input_keys: Context keys passed to the agent as input data
+            depends_on: Names of the nodes this one waits for (default:
+                the previously added node)
 
         Returns:
             Self for chaining
         """
+        config = {
+            "task_description": task_description,
+            "context_template": context_template,
+            "output_key": output_key or f"{name}_result"
+        }
+        if input_keys:
+            config["input_keys"] = list(input_keys)
+
         node = ChainNode(
             id=str(uuid.uuid4()),
             type=ChainNodeType.AGENT,
             name=name,
             agent_type=agent_type,
-            config={
-                "task_description": task_description,
-                "context_template": context_template,
-                "output_key": output_key or f"{name}_result"
-            }
+            config=config
         )
 
-        self._add_node(node)
+        self._add_node(node, depends_on)
         return self
 
     def add_condition_node(
@@ -587,6 +779,7 @@ class ChainBuilder:
         transformer: str,
         input_key: Optional[str] = None,
         output_key: Optional[str] = None,
+        depends_on: Optional[List[str]] = None,
         **config
     ) -> 'ChainBuilder':
         """Add a transformer node to the chain.
@@ -596,6 +789,8 @@ class ChainBuilder:
             transformer: Transformer name
             input_key: Input data key
             output_key: Output data key
+            depends_on: Names of the nodes this one waits for (default:
+                the previously added node)
             **config: Additional configuration
 
         Returns:
@@ -618,7 +813,42 @@ class ChainBuilder:
             config=node_config
         )
 
-        self._add_node(node)
+        self._add_node(node, depends_on)
+        return self
+
+    def add_aggregator_node(
+        self,
+        name: str,
+        input_keys: List[str],
+        aggregation_type: str = "combine",
+        output_key: Optional[str] = None,
+        depends_on: Optional[List[str]] = None
+    ) -> 'ChainBuilder':
+        """Add an aggregator node to the chain.
+
+        Args:
+            name: Node name
+            input_keys: Context keys to aggregate
+            aggregation_type: "combine", "merge" or "list"
+            output_key: Output data key
+            depends_on: Names of the nodes this one waits for (default:
+                the previously added node)
+
+        Returns:
+            Self for chaining
+        """
+        node = ChainNode(
+            id=str(uuid.uuid4()),
+            type=ChainNodeType.AGGREGATOR,
+            name=name,
+            config={
+                "input_keys": list(input_keys),
+                "type": aggregation_type,
+                "output_key": output_key or f"{name}_result"
+            }
+        )
+
+        self._add_node(node, depends_on)
         return self
 
     def connect(self, from_node: str, to_node: str) -> 'ChainBuilder':
@@ -668,12 +898,15 @@ class ChainBuilder:
 
         return self.chain
 
-    def _add_node(self, node: ChainNode):
+    def _add_node(self, node: ChainNode, depends_on: Optional[List[str]] = None):
         """Add a node to the chain."""
         self.chain.nodes.append(node)
 
+        if depends_on is not None:
+            for name in depends_on:
+                self.connect(name, node.name)
         # Auto-connect to previous node
-        if self._current_node:
+        elif self._current_node:
             self.connect(self._current_node.name, node.name)
 
         self._current_node = node
@@ -4,6 +4,9 @@ Chat agent with tool-calling capabilities.
 
 import json
 import re
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any, Tuple, TYPE_CHECKING
 
 from .base import BaseAgent
@@ -11,6 +14,7 @@ from .models import AgentConfig, AgentTask, AgentResponse, ToolCall
 from ..tools import ToolExecutor, ToolResult
 from ..tools.tool_registry import tool_registry
 from ..debug import chat_debugger
+from settings.settings_manager import settings_manager
 from utils.structured_logging import get_logger
 
 if TYPE_CHECKING:
@@ -19,6 +23,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Default upper bound on tool calls from one response executed concurrently
+DEFAULT_MAX_PARALLEL_TOOLS = 4
+
 
 class ChatAgent(BaseAgent):
     """Agent specialized for chat interactions with tool-calling capabilities."""
@@ -80,6 +87,11 @@ Remember: ALWAYS use tools for medical information queries to ensure accuracy an
         max_tokens=1000,
         available_tools=[]  # Will be populated from registry
     )
+
+    # Worker threads for parallel tool calls, shared by every chat agent in
+    # the process so short-lived agents don't each leave a pool behind
+    _shared_tool_pool: Optional[ThreadPoolExecutor] = None
+    _tool_pool_lock = threading.Lock()
     
     def __init__(self, config: Optional[AgentConfig] = None,
                  tool_executor: Optional[ToolExecutor] = None,
@@ -107,6 +119,11 @@ Remember: ALWAYS use tools for medical information queries to ensure accuracy an
         # Track cache version to avoid unnecessary refreshes
         self._last_cache_version = -1
 
+        # Independent tool calls run concurrently on the shared pool
+        self.max_parallel_tools = settings_manager.get_nested(
+            "tool_execution.max_parallel_tools", DEFAULT_MAX_PARALLEL_TOOLS
+        )
+
         # Update available tools in config
         self.refresh_available_tools()
 
@@ -181,9 +198,8 @@ Remember: ALWAYS use tools for medical information queries to ensure accuracy an
                 # Execute the tools
                 tool_results = self._execute_tools(tool_calls)
                 
-                # Log tool results
-                for tool_call in tool_calls:
-                    result = tool_results.get(tool_call.tool_name)
+                # Log tool results (results are in request order)
+                for tool_call, result in zip(tool_calls, tool_results.values()):
                     chat_debugger.log_tool_call(
                         tool_call.tool_name,
                         tool_call.arguments,
@@ -307,20 +323,70 @@ Remember: ALWAYS use tools for medical information queries to ensure accuracy an
         return tool_calls, remaining_text.strip()
         
     def _execute_tools(self, tool_calls: List[ToolCall]) -> Dict[str, ToolResult]:
-        """Execute the requested tools."""
+        """Execute the requested tools.
+
+        Tool calls in a single response are independent of each other, so
+        they run concurrently on a bounded pool. Per-tool timeouts are applied
+        by the ToolExecutor. Results keep the order the model requested them
+        in; a repeated tool name gets a " #n" suffix so no result is dropped.
+        """
+        keys = self._result_keys(tool_calls)
+
+        if len(tool_calls) <= 1 or self.max_parallel_tools <= 1:
+            results = {}
+            for key, tool_call in zip(keys, tool_calls):
+                logger.info(f"Executing tool: {tool_call.tool_name}")
+                results[key] = self.tool_executor.execute_tool(
+                    tool_call.tool_name,
+                    tool_call.arguments
+                )
+            return results
+
+        batch_id = uuid.uuid4().hex[:8]
+        logger.info(
+            f"Executing {len(tool_calls)} tools in parallel (batch {batch_id}): "
+            f"{[tc.tool_name for tc in tool_calls]}"
+        )
+        pool = self._get_tool_pool()
+        futures = [
+            pool.submit(self.tool_executor.execute_tool, tc.tool_name, tc.arguments, batch_id)
+            for tc in tool_calls
+        ]
+
         results = {}
-        
-        for tool_call in tool_calls:
-            logger.info(f"Executing tool: {tool_call.tool_name}")
-            
-            result = self.tool_executor.execute_tool(
-                tool_call.tool_name,
-                tool_call.arguments
-            )
-            
-            results[tool_call.tool_name] = result
-            
+        for key, future in zip(keys, futures):
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                logger.error(f"Parallel tool execution failed for {key}: {e}")
+                results[key] = ToolResult(
+                    success=False,
+                    output=None,
+                    error=f"Execution failed: {str(e)}"
+                )
         return results
+
+    @staticmethod
+    def _result_keys(tool_calls: List[ToolCall]) -> List[str]:
+        """Build unique, order-preserving result keys for a list of tool calls."""
+        counts: Dict[str, int] = {}
+        keys = []
+        for tool_call in tool_calls:
+            counts[tool_call.tool_name] = counts.get(tool_call.tool_name, 0) + 1
+            n = counts[tool_call.tool_name]
+            keys.append(tool_call.tool_name if n == 1 else f"{tool_call.tool_name} #{n}")
+        return keys
+
+    def _get_tool_pool(self) -> ThreadPoolExecutor:
+        """Get or create the shared tool pool (thread-safe with double-checked locking)."""
+        if ChatAgent._shared_tool_pool is None:
+            with ChatAgent._tool_pool_lock:
+                if ChatAgent._shared_tool_pool is None:
+                    ChatAgent._shared_tool_pool = ThreadPoolExecutor(
+                        max_workers=max(1, self.max_parallel_tools),
+                        thread_name_prefix="chat_tool"
+                    )
+        return ChatAgent._shared_tool_pool
         
     def _build_follow_up_prompt(self, task: AgentTask, initial_response: str, 
                                tool_results: Dict[str, ToolResult]) -> str:
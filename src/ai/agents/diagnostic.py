@@ -293,14 +293,14 @@ Format your response as:
         # Extract ICD codes from the text
         codes = extract_icd_codes(analysis)
 
-        for code in codes:
-            result = validator.validate(code)
+        for result in validator.validate_batch(codes):
             validation_results.append({
                 'code': result.code,
                 'is_valid': result.is_valid,
                 'code_system': result.code_system.value if result.code_system else 'Unknown',
                 'description': result.description,
-                'warning': result.warning
+                'warning': result.warning,
+                'suggested_code': result.suggested_code
             })
 
         return validation_results
@@ -322,7 +322,10 @@ Format your response as:
                 warnings.append(f"Invalid ICD code format: {result['code']}")
             elif result.get('warning'):
                 # Code has valid format but not in known database
-                warnings.append(f"Unverified code {result['code']}: {result['warning']}")
+                warning = f"Unverified code {result['code']}: {result['warning']}"
+                if result.get('suggested_code'):
+                    warning += f" Closest known code: {result['suggested_code']}."
+                warnings.append(warning)
 
         return warnings
 
@@ -12,6 +12,7 @@ from utils.structured_logging import get_logger
 
 if TYPE_CHECKING:
     from .ai_caller import AICallerProtocol
+    from rag.drug_interactions import DrugInteractionKB, InteractionCheck
 
 
 logger = get_logger(__name__)
@@ -235,15 +236,23 @@ Always:
         max_tokens=2000  # Increased for more comprehensive output
     )
     
-    def __init__(self, config: Optional[AgentConfig] = None, ai_caller: Optional['AICallerProtocol'] = None):
+    def __init__(
+        self,
+        config: Optional[AgentConfig] = None,
+        ai_caller: Optional['AICallerProtocol'] = None,
+        interaction_kb: Optional['DrugInteractionKB'] = None,
+    ):
         """
         Initialize the medication agent.
 
         Args:
             config: Optional custom configuration. Uses default if not provided.
             ai_caller: Optional AI caller for dependency injection.
+            interaction_kb: Optional drug-interaction knowledge base. Uses the
+                shared one if not provided.
         """
         super().__init__(config or self.DEFAULT_CONFIG, ai_caller=ai_caller)
+        self._interaction_kb = interaction_kb
         
     def execute(self, task: AgentTask) -> AgentResponse:
         """
@@ -337,7 +346,12 @@ Always:
         return response
     
     def _check_interactions(self, task: AgentTask) -> AgentResponse:
-        """Check for drug-drug interactions."""
+        """Check for drug-drug interactions.
+
+        Pairs found in the local interaction database are reported directly;
+        only the pairs it cannot resolve (or an explicitly requested
+        narrative summary) are sent to the AI.
+        """
         medications = task.input_data.get('medications', [])
         
         if not medications or len(medications) < 2:
@@ -347,18 +361,38 @@ Always:
                 error="Insufficient medications for interaction check"
             )
         
-        prompt = self._build_interaction_prompt(medications, task.context)
-        
-        # Call AI to check interactions
-        interaction_analysis = self._call_ai(prompt)
-        
+        check = self._lookup_known_interactions(medications)
+
+        if check is None or not check.known:
+            prompt = self._build_interaction_prompt(medications, task.context)
+
+            # Call AI to check interactions
+            interaction_analysis = self._call_ai(prompt)
+            known = []
+            unresolved_count = len(check.unresolved) if check else None
+        else:
+            sections = [self._format_known_interactions(check.known)]
+            if check.unnormalized:
+                # A name the database could not read may still interact with
+                # anything on the list, so the AI checks the full list
+                prompt = self._build_interaction_prompt(medications, task.context)
+                sections.append(self._call_ai_cached(prompt))
+            elif check.unresolved or task.input_data.get('include_summary'):
+                prompt = self._build_pair_interaction_prompt(
+                    medications, check.unresolved, check.known, task.context
+                )
+                sections.append(self._call_ai_cached(prompt))
+            interaction_analysis = "\n\n".join(sections)
+            known = check.known
+            unresolved_count = len(check.unresolved)
+
         # Parse interaction severity
-        has_major_interaction = any(
+        has_major_interaction = any(i.is_major for i in known) or any(
             severity in interaction_analysis.upper() 
             for severity in ["CONTRAINDICATED", "MAJOR", "SERIOUS"]
         )
         
-        # Simulate tool call for drug interaction database
+        # Record the drug interaction database lookup
         tool_calls = [
             ToolCall(
                 tool_name="lookup_drug_interactions",
@@ -375,6 +409,8 @@ Always:
             metadata={
                 'medication_count': len(medications),
                 'has_major_interaction': has_major_interaction,
+                'known_interactions': [i.to_dict() for i in known],
+                'unresolved_pair_count': unresolved_count,
                 'model_used': self.config.model
             }
         )
@@ -383,6 +419,42 @@ Always:
         self.add_to_history(task, response)
         
         return response
+
+    def _lookup_known_interactions(self, medications: List[str]) -> Optional['InteractionCheck']:
+        """Resolve medication pairs from the interaction database.
+
+        Returns:
+            InteractionCheck, or None if the database is unavailable
+        """
+        try:
+            kb = self._interaction_kb
+            if kb is None:
+                from rag.drug_interactions import get_drug_interaction_kb
+                kb = self._interaction_kb = get_drug_interaction_kb()
+            if kb is None:
+                return None
+            return kb.check(medications)
+        except Exception as e:
+            logger.debug(f"Drug interaction database unavailable: {e}")
+            return None
+
+    @staticmethod
+    def _format_known_interactions(interactions: List[Any]) -> str:
+        """Format interactions from the database, most severe first."""
+        lines = ["## INTERACTIONS FROM DRUG INTERACTION DATABASE"]
+        for interaction in interactions:
+            lines.append("")
+            lines.append(
+                f"- **Medications:** {interaction.drug1.title()} + {interaction.drug2.title()}"
+            )
+            lines.append(f"- **Severity:** {interaction.severity.upper()}")
+            if interaction.description:
+                lines.append(f"- **Risk:** {interaction.description}")
+            if interaction.clinical_significance:
+                lines.append(f"- **Clinical significance:** {interaction.clinical_significance}")
+            if interaction.management:
+                lines.append(f"- **Action:** {interaction.management}")
+        return "\n".join(lines)
     
     def _generate_prescription(self, task: AgentTask) -> AgentResponse:
         """Generate prescription information."""
@@ -5,7 +5,46 @@ Mixin providing prompt construction methods for the MedicationAgent.
 Extracted to keep the main agent file focused on execution logic.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence, Tuple
+
+# Response structure shared by the full-list and pairwise interaction prompts
+_INTERACTION_RESPONSE_FORMAT = """
+
+STRUCTURE YOUR RESPONSE BY PRIORITY LEVEL:
+
+## \U0001f534 HIGH PRIORITY INTERACTIONS (Contraindicated/Major)
+For each CONTRAINDICATED or MAJOR interaction:
+- **Medications:** [Drug A] + [Drug B]
+- **Risk:** [Specific clinical consequence, e.g., "Life-threatening bone marrow suppression"]
+- **Mechanism:** [Brief explanation of why this occurs]
+- **Action:** [STOP one medication / Contraindicated / Avoid combination]
+- **Timeline:** [Immediate / Before next dose / Within 24 hours]
+
+## \U0001f7e1 MODERATE PRIORITY INTERACTIONS
+For each MODERATE interaction:
+- **Medications:** [Drug A] + [Drug B]
+- **Risk:** [Clinical concern]
+- **Action:** [Monitor closely / Dose adjustment / Timing separation]
+- **Monitoring:** [Specific labs/parameters and timing]
+
+## \U0001f7e2 LOW PRIORITY INTERACTIONS (Minor)
+For each MINOR interaction:
+- **Medications:** [Drug A] + [Drug B]
+- **Note:** [Brief clinical note]
+- **Monitoring:** [If any needed]
+
+## ACTIONABLE RECOMMENDATIONS
+\u25a1 [Specific action items based on the interactions found]
+\u25a1 [Labs to order with timing]
+\u25a1 [Follow-up recommendations]
+
+## PATIENT COUNSELING
+Key points to discuss with patient about these drug interactions:
+\u2022 [Important warnings in lay language]
+\u2022 [Signs/symptoms to watch for]
+\u2022 [When to seek immediate medical attention]
+
+If no interactions are found at a priority level, state "None identified." """
 
 
 class MedicationPromptMixin:
@@ -42,43 +81,53 @@ class MedicationPromptMixin:
         for med in medications:
             prompt_parts.append(f"- {med}")
 
-        prompt_parts.append("""
-
-STRUCTURE YOUR RESPONSE BY PRIORITY LEVEL:
-
-## \U0001f534 HIGH PRIORITY INTERACTIONS (Contraindicated/Major)
-For each CONTRAINDICATED or MAJOR interaction:
-- **Medications:** [Drug A] + [Drug B]
-- **Risk:** [Specific clinical consequence, e.g., "Life-threatening bone marrow suppression"]
-- **Mechanism:** [Brief explanation of why this occurs]
-- **Action:** [STOP one medication / Contraindicated / Avoid combination]
-- **Timeline:** [Immediate / Before next dose / Within 24 hours]
+        prompt_parts.append(_INTERACTION_RESPONSE_FORMAT)
 
-## \U0001f7e1 MODERATE PRIORITY INTERACTIONS
-For each MODERATE interaction:
-- **Medications:** [Drug A] + [Drug B]
-- **Risk:** [Clinical concern]
-- **Action:** [Monitor closely / Dose adjustment / Timing separation]
-- **Monitoring:** [Specific labs/parameters and timing]
+        return "\n".join(prompt_parts)
 
-## \U0001f7e2 LOW PRIORITY INTERACTIONS (Minor)
-For each MINOR interaction:
-- **Medications:** [Drug A] + [Drug B]
-- **Note:** [Brief clinical note]
-- **Monitoring:** [If any needed]
+    def _build_pair_interaction_prompt(
+        self,
+        medications: Sequence[str],
+        unresolved_pairs: Sequence[Tuple[str, str]],
+        known_interactions: Sequence[Any] = (),
+        context: Optional[str] = None
+    ) -> str:
+        """Build prompt for the pairs the local interaction database could not resolve.
 
-## ACTIONABLE RECOMMENDATIONS
-\u25a1 [Specific action items based on the interactions found]
-\u25a1 [Labs to order with timing]
-\u25a1 [Follow-up recommendations]
+        With no unresolved pairs this asks only for the narrative
+        recommendations and counseling around the known interactions.
+        """
+        prompt_parts = []
 
-## PATIENT COUNSELING
-Key points to discuss with patient about these drug interactions:
-\u2022 [Important warnings in lay language]
-\u2022 [Signs/symptoms to watch for]
-\u2022 [When to seek immediate medical attention]
+        if context:
+            prompt_parts.append(f"Additional Context: {context}\n")
 
-If no interactions are found at a priority level, state "None identified." """)
+        prompt_parts.append(f"Medication list: {', '.join(medications)}\n")
+
+        if known_interactions:
+            prompt_parts.append("Already identified from the interaction database (do not repeat):")
+            for interaction in known_interactions:
+                prompt_parts.append(
+                    f"- {interaction.drug1} + {interaction.drug2}: {interaction.severity.upper()}"
+                )
+            prompt_parts.append("")
+
+        if unresolved_pairs:
+            prompt_parts.append("Check ONLY the following medication pairs for drug-drug interactions:")
+            for drug1, drug2 in unresolved_pairs:
+                prompt_parts.append(f"- {drug1} + {drug2}")
+        else:
+            prompt_parts.append(
+                "Every pair was resolved from the interaction database. "
+                "Do not list interactions again; complete only the recommendations "
+                "and patient counseling sections below."
+            )
+
+        prompt_parts.append(_INTERACTION_RESPONSE_FORMAT)
+        prompt_parts.append(
+            "Base the recommendations and patient counseling on all interactions, "
+            "including those already identified."
+        )
 
         return "\n".join(prompt_parts)
 
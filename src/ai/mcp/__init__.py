@@ -5,7 +5,7 @@ This module provides integration with MCP servers to extend the chat agent's
 capabilities with external tools and services.
 """
 
-from .mcp_manager import MCPManager
+from .mcp_manager import MCPManager, MCPTransportError
 from .mcp_tool_wrapper import MCPToolWrapper
 
-__all__ = ['MCPManager', 'MCPToolWrapper']
\ No newline at end of file
+__all__ = ['MCPManager', 'MCPToolWrapper', 'MCPTransportError']
\ No newline at end of file
@@ -7,7 +7,8 @@ import json
 import subprocess
 import os
 import sys
-from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 import threading
 import queue
@@ -71,65 +72,126 @@ class MCPServer:
         }
 
 
-class MCPProtocol:
-    """Handles JSON-RPC 2.0 communication with MCP servers"""
+class MCPTransportError(Exception):
+    """Raised when the MCP server connection fails or a request times out."""
+
 
-    def __init__(self, process: subprocess.Popen, server: MCPServer = None):
+class MCPProtocol:
+    """Handles JSON-RPC 2.0 communication with MCP servers.
+
+    Requests are multiplexed over the server's stdin/stdout: each request id
+    maps to a Future that the reader thread resolves directly when the
+    matching response arrives, so callers block on the Future instead of
+    polling. Outgoing messages are queued to a single writer thread that
+    coalesces everything queued into one write and flush, which lets many
+    concurrent callers pipeline requests without interleaving partial lines.
+    """
+
+    def __init__(self, process: subprocess.Popen, server: MCPServer = None,
+                 on_tools_changed: Optional[Callable[[], None]] = None):
         self.process = process
         self.server = server  # Reference to store errors
+        self.on_tools_changed = on_tools_changed
         self.request_id = 0
-        self._pending_requests: Dict[int, queue.Queue] = {}
+        self._pending_requests: Dict[int, Future] = {}
         self._pending_lock = threading.Lock()
+        self._closed = False
+
+        # Outgoing messages: (serialized line, request ids carried by the line)
+        self._outbox: "queue.Queue[Optional[Tuple[str, List[int]]]]" = queue.Queue()
+        self._write_lock = threading.Lock()
+
         self.reader_thread = threading.Thread(target=self._read_responses, daemon=True)
         self.reader_thread.start()
+        self.writer_thread = threading.Thread(target=self._write_requests, daemon=True)
+        self.writer_thread.start()
         # Start stderr reader to capture errors
         self.stderr_thread = threading.Thread(target=self._read_stderr, daemon=True)
         self.stderr_thread.start()
 
     def _read_responses(self):
-        """Read responses from the MCP server stdout"""
+        """Read responses from the MCP server stdout and resolve their futures"""
         try:
             while True:
                 line = self.process.stdout.readline()
                 if not line:
-                    # Check if process has terminated
-                    if self.process.poll() is not None:
-                        logger.warning(f"MCP server process terminated with code: {self.process.returncode}")
-                        break
-                    continue
+                    # EOF on a pipe is permanent: the server closed stdout or exited
+                    logger.warning(f"MCP server stdout closed (exit code: {self.process.poll()})")
+                    break
 
                 try:
-                    response = json.loads(line)
-                    logger.debug(f"MCP response: {response}")
-                    resp_id = response.get("id")
-                    with self._pending_lock:
-                        req_queue = self._pending_requests.get(resp_id)
-                    if req_queue is not None:
-                        req_queue.put(response)
-                    else:
-                        logger.warning(f"Received response for unknown request id {resp_id}, discarding")
+                    message = json.loads(line)
                 except json.JSONDecodeError:
                     logger.warning(f"Invalid JSON from MCP server: {line}")
+                    continue
+
+                logger.debug(f"MCP response: {message}")
+                # A batch request is answered with an array of responses
+                for response in (message if isinstance(message, list) else [message]):
+                    self._dispatch(response)
         except Exception as e:
             logger.error(f"Error reading MCP responses: {e}")
         finally:
-            # Notify all pending waiters that the reader has exited so they don't hang forever
-            exit_msg = {"error": {"code": -1, "message": "MCP reader thread exited"}}
-            with self._pending_lock:
-                for req_queue in self._pending_requests.values():
-                    req_queue.put(exit_msg)
-    
+            # Fail all pending waiters so they don't hang until their timeout
+            self._fail_pending(MCPTransportError("MCP reader thread exited"))
+
+    def _dispatch(self, response: Dict[str, Any]) -> None:
+        """Route one incoming message to its waiting Future or notification handler."""
+        if not isinstance(response, dict):
+            logger.warning(f"Unexpected MCP message: {response}")
+            return
+
+        resp_id = response.get("id")
+        if resp_id is None:
+            # Server-initiated notification
+            if response.get("method") == "notifications/tools/list_changed" and self.on_tools_changed:
+                self.on_tools_changed()
+            return
+
+        with self._pending_lock:
+            future = self._pending_requests.pop(resp_id, None)
+        if future is not None:
+            if not future.done():
+                future.set_result(response)
+        else:
+            logger.warning(f"Received response for unknown request id {resp_id}, discarding")
+
+    def _write_requests(self):
+        """Writer thread: coalesce queued messages into a single write + flush."""
+        while True:
+            item = self._outbox.get()
+            if item is None:
+                return
+            batch = [item]
+            # Drain whatever else is already queued so it goes out in the same write
+            while True:
+                try:
+                    nxt = self._outbox.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    self._outbox.put(None)
+                    break
+                batch.append(nxt)
+
+            payload = "".join(line for line, _ in batch)
+            try:
+                with self._write_lock:
+                    self.process.stdin.write(payload)
+                    self.process.stdin.flush()
+            except Exception as e:
+                error = MCPTransportError(f"Failed to send request to MCP server: {e}")
+                for _, ids in batch:
+                    self._fail_ids(ids, error)
+
     def _read_stderr(self):
         """Read stderr output from the MCP server"""
         try:
             while True:
                 line = self.process.stderr.readline()
                 if not line:
-                    # Check if process has terminated
-                    if self.process.poll() is not None:
-                        logger.warning(f"MCP server stderr reader: process terminated")
-                        break
-                    continue
+                    logger.warning(f"MCP server stderr reader: stream closed")
+                    break
 
                 stderr_msg = line.strip()
                 logger.info(f"MCP server stderr: {stderr_msg}")
@@ -139,72 +201,142 @@ class MCPProtocol:
                     self.server.add_error(stderr_msg)
         except Exception as e:
             logger.error(f"Error reading MCP stderr: {e}")
-    
-    def send_request(self, method: str, params: Dict[str, Any] = None, timeout: float = 30.0) -> Any:
-        """Send a JSON-RPC request and wait for response"""
-        # Check if process is still running
+
+    def _fail_ids(self, ids: List[int], error: Exception) -> None:
+        with self._pending_lock:
+            futures = [self._pending_requests.pop(i, None) for i in ids]
+        for future in futures:
+            if future is not None and not future.done():
+                future.set_exception(error)
+
+    def _fail_pending(self, error: Exception) -> None:
+        with self._pending_lock:
+            self._closed = True
+            futures = list(self._pending_requests.values())
+            self._pending_requests.clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+    def _register(self, method: str, params: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], Future]:
+        """Allocate a request id and Future for a request. Caller enqueues the message."""
         if self.process.poll() is not None:
-            raise Exception(f"MCP server process has terminated with code: {self.process.returncode}")
+            raise MCPTransportError(f"MCP server process has terminated with code: {self.process.returncode}")
 
-        # Allocate a per-request queue and atomically assign request_id
-        req_queue = queue.Queue()
+        future: Future = Future()
         with self._pending_lock:
+            if self._closed:
+                raise MCPTransportError("MCP connection is closed")
             self.request_id += 1
             current_id = self.request_id
-            self._pending_requests[current_id] = req_queue
+            self._pending_requests[current_id] = future
 
+        request = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "id": current_id
+        }
+        if params:
+            request["params"] = params
+        return request, future
+
+    @staticmethod
+    def _unwrap(response: Dict[str, Any]) -> Any:
+        """Return the result of a response, raising for JSON-RPC errors."""
+        if "error" in response:
+            error = response['error']
+            # Extract error details
+            if isinstance(error, dict):
+                code = error.get('code', 'Unknown')
+                message = error.get('message', 'Unknown error')
+                data = error.get('data', {}) or {}
+
+                # Check for rate limit error
+                if code == 429 or 'rate' in str(message).lower():
+                    retry_after = data.get('retry_after', 60) if isinstance(data, dict) else 60
+                    raise Exception(f"Rate limit exceeded: {message}. Retry after {retry_after} seconds")
+                raise Exception(f"MCP error (code {code}): {message}")
+            raise Exception(f"MCP error: {error}")
+        return response.get("result")
+
+    def _await(self, future: Future, request_id: int, method: str, timeout: float) -> Dict[str, Any]:
         try:
-            request = {
-                "jsonrpc": "2.0",
-                "method": method,
-                "id": current_id
-            }
-            if params:
-                request["params"] = params
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            with self._pending_lock:
+                self._pending_requests.pop(request_id, None)
+            raise MCPTransportError(f"Timeout waiting for MCP response to {method}")
 
-            # Send request
-            request_str = json.dumps(request) + "\n"
-            logger.debug(f"Sending MCP request: {request_str.strip()}")
+    def send_request_future(self, method: str, params: Dict[str, Any] = None) -> Tuple[int, Future]:
+        """Send a JSON-RPC request without waiting.
+
+        Returns:
+            Tuple of (request id, Future resolving to the raw response message)
+        """
+        request, future = self._register(method, params)
+        request_str = json.dumps(request) + "\n"
+        logger.debug(f"Sending MCP request: {request_str.strip()}")
+        self._outbox.put((request_str, [request["id"]]))
+        return request["id"], future
+
+    def send_request(self, method: str, params: Dict[str, Any] = None, timeout: float = 30.0) -> Any:
+        """Send a JSON-RPC request and wait for response"""
+        request_id, future = self.send_request_future(method, params)
+        response = self._await(future, request_id, method, timeout)
+        return self._unwrap(response)
+
+    def send_batch(self, requests: List[Tuple[str, Optional[Dict[str, Any]]]],
+                   timeout: float = 30.0) -> List[Any]:
+        """Send several requests as one JSON-RPC batch.
+
+        Args:
+            requests: List of (method, params) tuples
+            timeout: Seconds to wait for all responses
+
+        Returns:
+            Results in request order. A request that failed is represented by
+            the Exception describing its error instead of a result.
+        """
+        if not requests:
+            return []
+
+        registered = [self._register(method, params) for method, params in requests]
+        ids = [request["id"] for request, _ in registered]
+        batch_str = json.dumps([request for request, _ in registered]) + "\n"
+        logger.debug(f"Sending MCP batch of {len(registered)} requests")
+        self._outbox.put((batch_str, ids))
+
+        deadline = time.monotonic() + timeout
+        results: List[Any] = []
+        for (request, future), (method, _) in zip(registered, requests):
+            remaining = max(0.0, deadline - time.monotonic())
             try:
-                self.process.stdin.write(request_str)
-                self.process.stdin.flush()
+                response = self._await(future, request["id"], method, remaining)
+                results.append(self._unwrap(response))
             except Exception as e:
-                raise Exception(f"Failed to send request to MCP server: {e}")
+                results.append(e)
+        return results
 
-            # Wait for response on our dedicated queue
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                # Check if process terminated while waiting
-                if self.process.poll() is not None:
-                    raise Exception(f"MCP server process terminated while waiting for response (code: {self.process.returncode})")
-
-                try:
-                    response = req_queue.get(timeout=0.1)
-                    if "error" in response:
-                        error = response['error']
-                        # Extract error details
-                        if isinstance(error, dict):
-                            code = error.get('code', 'Unknown')
-                            message = error.get('message', 'Unknown error')
-                            data = error.get('data', {})
-
-                            # Check for rate limit error
-                            if code == 429 or 'rate' in str(message).lower():
-                                retry_after = data.get('retry_after', 60)
-                                raise Exception(f"Rate limit exceeded: {message}. Retry after {retry_after} seconds")
-                            else:
-                                raise Exception(f"MCP error (code {code}): {message}")
-                        else:
-                            raise Exception(f"MCP error: {error}")
-                    return response.get("result")
-                except queue.Empty:
-                    continue
+    async def send_request_async(self, method: str, params: Dict[str, Any] = None,
+                                 timeout: float = 30.0) -> Any:
+        """Asyncio-compatible variant of send_request.
 
-            raise Exception(f"Timeout waiting for MCP response to {method}")
-        finally:
-            # Always clean up the per-request queue
+        The reader thread resolves the underlying Future; this coroutine
+        awaits it on the running event loop without blocking a thread.
+        """
+        request_id, future = self.send_request_future(method, params)
+        try:
+            response = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
             with self._pending_lock:
-                self._pending_requests.pop(current_id, None)
+                self._pending_requests.pop(request_id, None)
+            raise MCPTransportError(f"Timeout waiting for MCP response to {method}")
+        return self._unwrap(response)
+
+    def close(self) -> None:
+        """Stop the writer thread and fail any outstanding requests."""
+        self._outbox.put(None)
+        self._fail_pending(MCPTransportError("MCP connection closed"))
 
 
 class MCPManager:
@@ -213,6 +345,13 @@ class MCPManager:
     def __init__(self):
         self.servers: Dict[str, MCPServer] = {}
         self._lock = threading.Lock()
+        # Flattened (server_name, tool) list; rebuilt only after a server's
+        # tool set changes (start, stop, restart or list_changed notification)
+        self._tools_cache: Optional[List[Tuple[str, Dict[str, Any]]]] = None
+
+    def _invalidate_tools_cache(self) -> None:
+        """Drop the cached tool list. Caller may or may not hold self._lock."""
+        self._tools_cache = None
     
     def load_config(self, mcp_config: Dict[str, Any]) -> None:
         """Load MCP configuration from settings"""
@@ -274,7 +413,10 @@ class MCPManager:
                 logger.info(f"Started MCP server {name} (PID: {server.process.pid})")
 
                 # Initialize communication (pass server reference for error logging)
-                server.protocol = MCPProtocol(server.process, server)
+                server.protocol = MCPProtocol(
+                    server.process, server,
+                    on_tools_changed=lambda: self._schedule_tool_refresh(name)
+                )
                 
                 # Initialize the connection
                 server.protocol.send_request("initialize", {
@@ -288,10 +430,14 @@ class MCPManager:
                 
                 # Discover tools
                 server.tools = self._discover_tools(server.protocol)
+                self._invalidate_tools_cache()
                 logger.info(f"Discovered {len(server.tools)} tools from {name}")
                 
             except Exception as e:
                 logger.error(f"Failed to start MCP server {name}: {e}")
+                if server.protocol:
+                    server.protocol.close()
+                    server.protocol = None
                 if server.process:
                     server.process.terminate()
                     server.process = None
@@ -304,6 +450,9 @@ class MCPManager:
             if not server or not server.process:
                 return
             
+            if server.protocol:
+                server.protocol.close()
+
             try:
                 # Try graceful shutdown first
                 server.process.terminate()
@@ -315,6 +464,7 @@ class MCPManager:
             server.process = None
             server.protocol = None
             server.tools = None
+            self._invalidate_tools_cache()
             logger.info(f"Stopped MCP server {name}")
     
     def restart_server(self, name: str) -> None:
@@ -347,6 +497,32 @@ class MCPManager:
         except Exception as e:
             logger.error(f"Failed to discover tools: {e}")
             return []
+
+    def refresh_tools(self, name: str) -> None:
+        """Re-discover the tools of a running server and invalidate the cache."""
+        with self._lock:
+            server = self.servers.get(name)
+            protocol = server.protocol if server else None
+        if protocol is None:
+            return
+
+        tools = self._discover_tools(protocol)
+        with self._lock:
+            if server.protocol is protocol:
+                server.tools = tools
+                self._invalidate_tools_cache()
+        logger.info(f"Refreshed {len(tools)} tools from {name}")
+
+    def _schedule_tool_refresh(self, name: str) -> None:
+        """Handle a tools/list_changed notification off the reader thread.
+
+        The reader thread resolves responses, so it must not block waiting
+        for the tools/list reply itself.
+        """
+        threading.Thread(
+            target=self.refresh_tools, args=(name,), daemon=True,
+            name=f"MCP-ToolRefresh-{name}"
+        ).start()
     
     def execute_tool(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Execute a tool on an MCP server"""
@@ -376,14 +552,20 @@ class MCPManager:
             raise
     
     def get_all_tools(self) -> List[Tuple[str, Dict[str, Any]]]:
-        """Get all available tools from all running servers"""
-        all_tools = []
+        """Get all available tools from all running servers.
+
+        Served from the tool-list cache; servers are not queried again until
+        one of them is started, stopped or reports a tool list change.
+        """
         with self._lock:
-            for server_name, server in self.servers.items():
-                if server.process and server.tools:
-                    for tool in server.tools:
-                        all_tools.append((server_name, tool))
-        return all_tools
+            if self._tools_cache is None:
+                all_tools = []
+                for server_name, server in self.servers.items():
+                    if server.process and server.tools:
+                        for tool in server.tools:
+                            all_tools.append((server_name, tool))
+                self._tools_cache = all_tools
+            return list(self._tools_cache)
     
     def add_server(self, name: str, config: Dict[str, Any]) -> None:
         """Add a new MCP server configuration"""
@@ -514,9 +696,12 @@ class HealthMonitor:
                     # Process has terminated — collect name and clean up stale refs
                     exit_code = server.process.returncode
                     logger.warning(f"MCP server '{name}' crashed with exit code {exit_code}")
+                    if server.protocol:
+                        server.protocol.close()
                     server.process = None
                     server.protocol = None
                     server.tools = None
+                    self.mcp_manager._invalidate_tools_cache()
                     crashed_servers.append(name)
 
         # Handle restarts outside the lock
@@ -7,27 +7,46 @@ from ai.providers.base import get_model_key_for_task
 from ai.providers.openai_provider import (
     call_openai,
     call_openai_streaming,
+    call_openai_async,
+    call_openai_streaming_async,
 )
 from ai.providers.anthropic_provider import (
     call_anthropic,
     call_anthropic_streaming,
+    call_anthropic_async,
+    call_anthropic_streaming_async,
 )
 from ai.providers.ollama_provider import (
     call_ollama,
+    call_ollama_async,
     fallback_ollama_generate,
 )
-from ai.providers.gemini_provider import call_gemini
-from ai.providers.groq_provider import call_groq, call_groq_streaming
-from ai.providers.cerebras_provider import call_cerebras, call_cerebras_streaming
-from ai.providers.router import call_ai, call_ai_streaming
+from ai.providers.gemini_provider import call_gemini, call_gemini_async
+from ai.providers.groq_provider import (
+    call_groq, call_groq_streaming, call_groq_async, call_groq_streaming_async,
+)
+from ai.providers.cerebras_provider import (
+    call_cerebras, call_cerebras_streaming, call_cerebras_async, call_cerebras_streaming_async,
+)
+from ai.providers.router import (
+    call_ai, call_ai_streaming,
+    call_ai_async, call_ai_streaming_async,
+    call_ai_many, gather_ai_calls,
+)
+from ai.providers.event_loop import get_ai_event_loop, run_coroutine_sync
 
 __all__ = [
     'get_model_key_for_task',
     'call_openai', 'call_openai_streaming',
+    'call_openai_async', 'call_openai_streaming_async',
     'call_anthropic', 'call_anthropic_streaming',
-    'call_ollama', 'fallback_ollama_generate',
-    'call_gemini',
-    'call_groq', 'call_groq_streaming',
-    'call_cerebras', 'call_cerebras_streaming',
+    'call_anthropic_async', 'call_anthropic_streaming_async',
+    'call_ollama', 'call_ollama_async', 'fallback_ollama_generate',
+    'call_gemini', 'call_gemini_async',
+    'call_groq', 'call_groq_streaming', 'call_groq_async', 'call_groq_streaming_async',
+    'call_cerebras', 'call_cerebras_streaming', 'call_cerebras_async', 'call_cerebras_streaming_async',
     'call_ai', 'call_ai_streaming',
+    'call_ai_async', 'call_ai_streaming_async',
+    'call_ai_many', 'gather_ai_calls',
+    'get_ai_event_loop', 'run_coroutine_sync',
 ]
@@ -5,14 +5,15 @@ Handles all API calls to Anthropic's Claude models including streaming support.
 Return Types:
     - call_anthropic: Returns AIResult for type-safe error handling
     - call_anthropic_streaming: Returns AIResult for type-safe error handling
+    - call_anthropic_async / call_anthropic_streaming_async: asyncio counterparts
     - str(result) provides backward compatibility with code expecting strings
 """
 
+import asyncio
 import httpx
-from typing import List, Dict, Callable
-
-from anthropic import Anthropic
+from typing import TYPE_CHECKING, List, Dict, Callable, Optional, Tuple, Union
 
+from utils.lazy_loader import lazy_import
 from utils.structured_logging import get_logger
 
 logger = get_logger(__name__)
@@ -55,7 +56,12 @@ def _normalize_model_name(model: str) -> str:
     return model
 
 
-from anthropic.types import Message as AnthropicMessage
+if TYPE_CHECKING:
+    from anthropic import Anthropic, AsyncAnthropic
+    from anthropic.types import Message as AnthropicMessage
+
+# The SDK is imported on the first API call, keeping it off the startup path
+anthropic = lazy_import("anthropic")
 
 from ai.logging_utils import log_api_call_debug
 from utils.error_codes import get_error_message, format_api_error
@@ -80,7 +86,7 @@ from utils.constants import PROVIDER_ANTHROPIC
     failure_threshold=5,
     recovery_timeout=60
 )
-def _anthropic_api_call(client: Anthropic, model: str, messages: List[Dict[str, str]], temperature: float, max_tokens: int = 4096) -> AnthropicMessage:
+def _anthropic_api_call(client: 'Anthropic', model: str, messages: List[Dict[str, str]], temperature: float, max_tokens: int = 4096) -> 'AnthropicMessage':
     """Make the actual API call to Anthropic with explicit timeout.
 
     Args:
@@ -100,17 +106,7 @@ def _anthropic_api_call(client: Anthropic, model: str, messages: List[Dict[str,
     timeout_seconds = get_timeout(PROVIDER_ANTHROPIC)
 
     try:
-        # Convert OpenAI-style messages to Anthropic format
-        system_message = None
-        user_messages = []
-
-        for msg in messages:
-            if msg["role"] == "system":
-                system_message = msg["content"]
-            elif msg["role"] == "user":
-                user_messages.append({"role": "user", "content": msg["content"]})
-            elif msg["role"] == "assistant":
-                user_messages.append({"role": "assistant", "content": msg["content"]})
+        system_message, user_messages = _split_messages(messages)
 
         # Create the message with Anthropic's API
         response = client.messages.create(
@@ -121,45 +117,79 @@ def _anthropic_api_call(client: Anthropic, model: str, messages: List[Dict[str,
             messages=user_messages
         )
         return response
-    except httpx.TimeoutException as e:
-        raise APITimeoutError(
+    except Exception as e:
+        raise _map_anthropic_error(e, timeout_seconds)
+
+
+@secure_api_call(PROVIDER_ANTHROPIC)
+@resilient_api_call(
+    max_retries=3,
+    initial_delay=1.0,
+    backoff_factor=2.0,
+    failure_threshold=5,
+    recovery_timeout=60
+)
+async def _anthropic_api_call_async(client: 'AsyncAnthropic', model: str, messages: List[Dict[str, str]], temperature: float, max_tokens: int = 4096) -> 'AnthropicMessage':
+    """Async counterpart of _anthropic_api_call."""
+    timeout_seconds = get_timeout(PROVIDER_ANTHROPIC)
+
+    try:
+        system_message, user_messages = _split_messages(messages)
+        return await client.messages.create(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system_message if system_message else None,
+            messages=user_messages
+        )
+    except Exception as e:
+        raise _map_anthropic_error(e, timeout_seconds)
+
+
+def _split_messages(messages: List[Dict[str, str]]) -> Tuple[Optional[str], List[Dict[str, str]]]:
+    """Convert OpenAI-style messages to Anthropic's (system, messages) format."""
+    system_message = None
+    user_messages = []
+
+    for msg in messages:
+        if msg["role"] == "system":
+            system_message = msg["content"]
+        elif msg["role"] == "user":
+            user_messages.append({"role": "user", "content": msg["content"]})
+        elif msg["role"] == "assistant":
+            user_messages.append({"role": "assistant", "content": msg["content"]})
+    return system_message, user_messages
+
+
+def _map_anthropic_error(e: Exception, timeout_seconds: float) -> Exception:
+    """Translate an SDK/transport exception into the application error hierarchy."""
+    if isinstance(e, httpx.TimeoutException):
+        return APITimeoutError(
             f"Anthropic request timed out after {timeout_seconds}s: {e}",
             timeout_seconds=timeout_seconds,
             service=PROVIDER_ANTHROPIC
         )
-    except Exception as e:
-        error_msg = str(e)
-        if "rate_limit" in error_msg.lower():
-            raise RateLimitError(f"Anthropic rate limit exceeded: {error_msg}")
-        elif "authentication" in error_msg.lower() or "api key" in error_msg.lower():
-            raise AuthenticationError(f"Anthropic authentication failed: {error_msg}")
-        elif "timeout" in error_msg.lower():
-            raise APITimeoutError(
-                f"Anthropic request timeout: {error_msg}",
-                timeout_seconds=timeout_seconds,
-                service=PROVIDER_ANTHROPIC
-            )
-        else:
-            raise APIError(f"Anthropic API error: {error_msg}")
+    error_msg = str(e)
+    if "rate_limit" in error_msg.lower():
+        return RateLimitError(f"Anthropic rate limit exceeded: {error_msg}")
+    elif "authentication" in error_msg.lower() or "api key" in error_msg.lower():
+        return AuthenticationError(f"Anthropic authentication failed: {error_msg}")
+    elif "timeout" in error_msg.lower():
+        return APITimeoutError(
+            f"Anthropic request timeout: {error_msg}",
+            timeout_seconds=timeout_seconds,
+            service=PROVIDER_ANTHROPIC
+        )
+    else:
+        return APIError(f"Anthropic API error: {error_msg}")
 
 
-def call_anthropic(model: str, system_message: str, prompt: str, temperature: float) -> AIResult:
-    """Call Anthropic's Claude API with explicit timeout.
-
-    Args:
-        model: Model to use (e.g., claude-opus-4-20250514)
-        system_message: System message to guide the AI's response
-        prompt: User prompt
-        temperature: Temperature parameter (0.0 to 1.0)
+def _prepare_call(model: str, system_message: str, prompt: str) -> Union[AIResult, Tuple[str, List[Dict[str, str]]]]:
+    """Check the API key, validate the model and sanitize inputs.
 
     Returns:
-        AIResult: Type-safe result wrapper. Use result.text for content,
-                  result.is_success to check status. str(result) returns
-                  text or error string for backward compatibility.
+        (api_key, messages), or a failed AIResult if a check failed
     """
-    # Normalize deprecated model names to current equivalents
-    model = _normalize_model_name(model)
-
     # Get security manager
     security_manager = get_security_manager()
 
@@ -187,56 +217,145 @@ def call_anthropic(model: str, system_message: str, prompt: str, temperature: fl
     prompt = security_manager.sanitize_input(prompt, "prompt")
     system_message = security_manager.sanitize_input(system_message, "prompt")
 
+    return api_key, [
+        {"role": "system", "content": system_message},
+        {"role": "user", "content": prompt}
+    ]
+
+
+def _prepare_streaming_call(model: str, system_message: str, prompt: str) -> Union[AIResult, Tuple[str, str, str]]:
+    """Streaming variant of _prepare_call.
+
+    Returns:
+        (api_key, system_message, prompt), or a failed AIResult if a check failed
+    """
+    security_manager = get_security_manager()
+
+    # Get API key
+    api_key = security_manager.get_api_key(PROVIDER_ANTHROPIC)
+    if not api_key:
+        return AIResult.failure("Anthropic API key not found", error_code="API_KEY_MISSING")
+
+    # Validate inputs
+    is_valid, error = validate_api_key(PROVIDER_ANTHROPIC, api_key)
+    if not is_valid:
+        return AIResult.failure(f"Invalid Anthropic API key: {error}", error_code="API_KEY_INVALID")
+
+    is_valid, error = validate_model_name(model, PROVIDER_ANTHROPIC)
+    if not is_valid:
+        return AIResult.failure(f"Invalid model: {error}", error_code="CFG_INVALID_SETTINGS")
+
+    # Enhanced sanitization
+    prompt = security_manager.sanitize_input(prompt, "prompt")
+    system_message = security_manager.sanitize_input(system_message, "prompt")
+    return api_key, system_message, prompt
+
+
+def _message_result(response: 'AnthropicMessage', model: str) -> AIResult:
+    """Convert an Anthropic message into an AIResult."""
+    if not response.content:
+        return AIResult.failure("Anthropic returned empty response (no content)", error_code="API_EMPTY_RESPONSE")
+    block = response.content[0]
+    text = getattr(block, 'text', None)
+    if not text:
+        return AIResult.failure("Anthropic returned non-text content block (e.g., tool_use)", error_code="API_EMPTY_RESPONSE")
+    text = text.strip()
+    usage_data = {}
+    if response.usage:
+        prompt_tokens = getattr(response.usage, 'input_tokens', 0)
+        completion_tokens = getattr(response.usage, 'output_tokens', 0)
+        usage_data = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+    return AIResult.success(text, usage=usage_data, model=model, provider=PROVIDER_ANTHROPIC)
+
+
+def _failure_result(e: Exception, model: str) -> AIResult:
+    """Convert an exception raised during a call into a failed AIResult."""
+    if isinstance(e, APITimeoutError):
+        logger.error(f"Anthropic API timeout with model {model}: {str(e)}")
+        title, message = get_error_message("CONN_TIMEOUT", f"Request timed out after {e.timeout_seconds}s")
+        return AIResult.failure(message, error_code=title, exception=e)
+    if isinstance(e, (APIError, ServiceUnavailableError)):
+        logger.error(f"Anthropic API error with model {model}: {str(e)}")
+        error_code, details = format_api_error(PROVIDER_ANTHROPIC, e)
+        title, message = get_error_message(error_code, details, model)
+        return AIResult.failure(message, error_code=title, exception=e)
+    logger.error(f"Unexpected error calling Anthropic: {str(e)}")
+    title, message = get_error_message("API_UNEXPECTED_ERROR", str(e))
+    return AIResult.failure(message, error_code=title, exception=e)
+
+
+def call_anthropic(model: str, system_message: str, prompt: str, temperature: float) -> AIResult:
+    """Call Anthropic's Claude API with explicit timeout.
+
+    Args:
+        model: Model to use (e.g., claude-opus-4-20250514)
+        system_message: System message to guide the AI's response
+        prompt: User prompt
+        temperature: Temperature parameter (0.0 to 1.0)
+
+    Returns:
+        AIResult: Type-safe result wrapper. Use result.text for content,
+                  result.is_success to check status. str(result) returns
+                  text or error string for backward compatibility.
+    """
+    # Normalize deprecated model names to current equivalents
+    model = _normalize_model_name(model)
+
+    prepared = _prepare_call(model, system_message, prompt)
+    if isinstance(prepared, AIResult):
+        return prepared
+    api_key, messages = prepared
+
     try:
         logger.info(f"Making Anthropic API call with model: {model}")
 
         # Use consolidated debug logging
-        log_api_call_debug("Anthropic", model, temperature, system_message, prompt)
+        log_api_call_debug("Anthropic", model, temperature, messages[0]["content"], messages[1]["content"])
 
         # Use pooled HTTP client for connection reuse (saves 50-200ms per call)
         timeout_seconds = get_timeout(PROVIDER_ANTHROPIC)
         http_client = get_http_client_manager().get_httpx_client(PROVIDER_ANTHROPIC, timeout_seconds)
-        client = Anthropic(
+        client = anthropic.Anthropic(
             api_key=api_key,
             http_client=http_client
         )
 
-        messages = [
-            {"role": "system", "content": system_message},
-            {"role": "user", "content": prompt}
-        ]
-
         response = _anthropic_api_call(client, model, messages, temperature)
-        if not response.content:
-            return AIResult.failure("Anthropic returned empty response (no content)", error_code="API_EMPTY_RESPONSE")
-        block = response.content[0]
-        text = getattr(block, 'text', None)
-        if not text:
-            return AIResult.failure("Anthropic returned non-text content block (e.g., tool_use)", error_code="API_EMPTY_RESPONSE")
-        text = text.strip()
-        usage_data = {}
-        if response.usage:
-            prompt_tokens = getattr(response.usage, 'input_tokens', 0)
-            completion_tokens = getattr(response.usage, 'output_tokens', 0)
-            usage_data = {
-                "prompt_tokens": prompt_tokens,
-                "completion_tokens": completion_tokens,
-                "total_tokens": prompt_tokens + completion_tokens,
-            }
-        return AIResult.success(text, usage=usage_data, model=model, provider=PROVIDER_ANTHROPIC)
-    except APITimeoutError as e:
-        logger.error(f"Anthropic API timeout with model {model}: {str(e)}")
-        title, message = get_error_message("CONN_TIMEOUT", f"Request timed out after {e.timeout_seconds}s")
-        return AIResult.failure(message, error_code=title, exception=e)
-    except (APIError, ServiceUnavailableError) as e:
-        logger.error(f"Anthropic API error with model {model}: {str(e)}")
-        error_code, details = format_api_error(PROVIDER_ANTHROPIC, e)
-        title, message = get_error_message(error_code, details, model)
-        return AIResult.failure(message, error_code=title, exception=e)
+        return _message_result(response, model)
     except Exception as e:
-        logger.error(f"Unexpected error calling Anthropic: {str(e)}")
-        title, message = get_error_message("API_UNEXPECTED_ERROR", str(e))
-        return AIResult.failure(message, error_code=title, exception=e)
+        return _failure_result(e, model)
+
+
+async def call_anthropic_async(model: str, system_message: str, prompt: str, temperature: float) -> AIResult:
+    """Async counterpart of call_anthropic.
+
+    Returns:
+        AIResult: Same contract as call_anthropic.
+    """
+    model = _normalize_model_name(model)
+
+    # API key lookup may hit the keyring/disk; keep it off the event loop
+    prepared = await asyncio.to_thread(_prepare_call, model, system_message, prompt)
+    if isinstance(prepared, AIResult):
+        return prepared
+    api_key, messages = prepared
+
+    try:
+        logger.info(f"Making async Anthropic API call with model: {model}")
+        log_api_call_debug("Anthropic (async)", model, temperature, messages[0]["content"], messages[1]["content"])
+
+        timeout_seconds = get_timeout(PROVIDER_ANTHROPIC)
+        http_client = get_http_client_manager().get_async_httpx_client(PROVIDER_ANTHROPIC, timeout_seconds)
+        client = anthropic.AsyncAnthropic(api_key=api_key, http_client=http_client)
+
+        response = await _anthropic_api_call_async(client, model, messages, temperature)
+        return _message_result(response, model)
+    except Exception as e:
+        return _failure_result(e, model)
 
 
 def call_anthropic_streaming(
@@ -266,31 +385,11 @@ def call_anthropic_streaming(
     # Normalize deprecated model names to current equivalents
     model = _normalize_model_name(model)
 
-    security_manager = get_security_manager()
-
-    # Get API key
-    api_key = security_manager.get_api_key(PROVIDER_ANTHROPIC)
-    if not api_key:
-        result = AIResult.failure("Anthropic API key not found", error_code="API_KEY_MISSING")
-        on_chunk(str(result))
-        return result
-
-    # Validate inputs
-    is_valid, error = validate_api_key(PROVIDER_ANTHROPIC, api_key)
-    if not is_valid:
-        result = AIResult.failure(f"Invalid Anthropic API key: {error}", error_code="API_KEY_INVALID")
-        on_chunk(str(result))
-        return result
-
-    is_valid, error = validate_model_name(model, PROVIDER_ANTHROPIC)
-    if not is_valid:
-        result = AIResult.failure(f"Invalid model: {error}", error_code="CFG_INVALID_SETTINGS")
-        on_chunk(str(result))
-        return result
-
-    # Enhanced sanitization
-    prompt = security_manager.sanitize_input(prompt, "prompt")
-    system_message = security_manager.sanitize_input(system_message, "prompt")
+    prepared = _prepare_streaming_call(model, system_message, prompt)
+    if isinstance(prepared, AIResult):
+        on_chunk(str(prepared))
+        return prepared
+    api_key, system_message, prompt = prepared
 
     try:
         logger.info(f"Making streaming Anthropic API call with model: {model}")
@@ -298,7 +397,7 @@ def call_anthropic_streaming(
 
         timeout_seconds = get_timeout(PROVIDER_ANTHROPIC)
         http_client = get_http_client_manager().get_httpx_client(PROVIDER_ANTHROPIC, timeout_seconds)
-        client = Anthropic(api_key=api_key, http_client=http_client)
+        client = anthropic.Anthropic(api_key=api_key, http_client=http_client)
 
         full_response = ""
         with client.messages.stream(
@@ -319,3 +418,52 @@ def call_anthropic_streaming(
         result = AIResult.failure(str(e), error_code="STREAMING_ERROR", exception=e)
         on_chunk(str(result))
         return result
+
+
+async def call_anthropic_streaming_async(
+    model: str,
+    system_message: str,
+    prompt: str,
+    temperature: float,
+    on_chunk: Callable[[str], None]
+) -> AIResult:
+    """Async counterpart of call_anthropic_streaming.
+
+    Returns:
+        AIResult: Same contract as call_anthropic_streaming.
+    """
+    model = _normalize_model_name(model)
+
+    prepared = await asyncio.to_thread(_prepare_streaming_call, model, system_message, prompt)
+    if isinstance(prepared, AIResult):
+        on_chunk(str(prepared))
+        return prepared
+    api_key, system_message, prompt = prepared
+
+    try:
+        logger.info(f"Making async streaming Anthropic API call with model: {model}")
+        log_api_call_debug("Anthropic (async streaming)", model, temperature, system_message, prompt)
+
+        timeout_seconds = get_timeout(PROVIDER_ANTHROPIC)
+        http_client = get_http_client_manager().get_async_httpx_client(PROVIDER_ANTHROPIC, timeout_seconds)
+        client = anthropic.AsyncAnthropic(api_key=api_key, http_client=http_client)
+
+        full_response = ""
+        async with client.messages.stream(
+            model=model,
+            max_tokens=4096,
+            temperature=temperature,
+            system=system_message,
+            messages=[{"role": "user", "content": prompt}]
+        ) as stream:
+            async for text in stream.text_stream:
+                full_response += text
+                on_chunk(text)
+
+        return AIResult.success(full_response.strip(), model=model, provider=PROVIDER_ANTHROPIC)
+
+    except Exception as e:
+        logger.error(f"Async streaming Anthropic error with model {model}: {str(e)}")
+        result = AIResult.failure(str(e), error_code="STREAMING_ERROR", exception=e)
+        on_chunk(str(result))
+        return result
@@ -0,0 +1,94 @@
+"""Shared Event Loop for Async Provider Calls.
+
+Synchronous code (Tkinter callbacks, worker threads) cannot await the
+``*_async`` provider functions directly. This module runs one long-lived
+asyncio event loop on a daemon thread and lets sync callers submit
+coroutines to it, so every async call in the process shares a single loop
+and its pooled httpx.AsyncClient connections.
+
+Usage:
+    from ai.providers.event_loop import run_coroutine_sync
+
+    result = run_coroutine_sync(call_ai_async(model, system, prompt, 0.7))
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+
+class AIEventLoop:
+    """A dedicated asyncio event loop running on a daemon thread."""
+
+    def __init__(self, name: str = "ai-event-loop"):
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._started.clear()
+                self._thread = threading.Thread(target=self._run_loop, daemon=True, name=self._name)
+                self._thread.start()
+                self._started.wait(timeout=5.0)
+            return self._loop
+
+    def _run_loop(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The underlying event loop (started on first access)."""
+        return self._ensure_started()
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Schedule a coroutine on the loop and return a concurrent Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_started())
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the loop and block until it completes.
+
+        Must not be called from the loop's own thread.
+        """
+        if self._thread is not None and threading.current_thread() is self._thread:
+            raise RuntimeError("run() called from the AI event loop thread; await the coroutine instead")
+        return self.submit(coro).result(timeout=timeout)
+
+    def stop(self) -> None:
+        """Stop the loop and its thread."""
+        with self._lock:
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._thread is not None:
+                self._thread.join(timeout=2.0)
+            self._loop = None
+            self._thread = None
+
+
+_ai_event_loop: Optional[AIEventLoop] = None
+_ai_event_loop_lock = threading.Lock()
+
+
+def get_ai_event_loop() -> AIEventLoop:
+    """Get the process-wide AI event loop."""
+    global _ai_event_loop
+    if _ai_event_loop is None:
+        with _ai_event_loop_lock:
+            if _ai_event_loop is None:
+                _ai_event_loop = AIEventLoop()
+    return _ai_event_loop
+
+
+def run_coroutine_sync(coro: Coroutine, timeout: Optional[float] = None) -> Any:
+    """Run a coroutine on the shared AI event loop from synchronous code."""
+    return get_ai_event_loop().run(coro, timeout=timeout)
@@ -4,24 +4,23 @@ Handles all API calls to Google's Gemini models using the new google-genai SDK.
 
 Return Types:
     - call_gemini: Returns AIResult for type-safe error handling
+    - call_gemini_async: asyncio counterpart (uses the SDK's client.aio surface)
     - str(result) provides backward compatibility with code expecting strings
 """
 
+import asyncio
 import os
+from typing import Tuple, Union
 
+from utils.lazy_loader import lazy_import, module_available
 from utils.structured_logging import get_logger
 
 logger = get_logger(__name__)
 
-# Import new google-genai SDK
-try:
-    from google import genai
-    from google.genai import types
-    GENAI_AVAILABLE = True
-except ImportError:
-    GENAI_AVAILABLE = False
-    genai = None
-    types = None
+# The google-genai SDK is imported on the first API call
+GENAI_AVAILABLE = module_available("google.genai")
+genai = lazy_import("google.genai")
+types = lazy_import("google.genai.types")
 
 from ai.logging_utils import log_api_call_debug
 from utils.error_codes import get_error_message, format_api_error
@@ -86,42 +85,79 @@ def _gemini_api_call(
             contents=prompt_content,
             config=config,
         )
-        if not getattr(response, 'candidates', None):
-            raise APIError("Gemini returned empty response (no candidates)")
-        if response.text is None:
-            raise APIError("Gemini returned empty response text")
-        return response.text
-    except (APIError, RateLimitError, AuthenticationError, APITimeoutError):
-        raise
+        return _response_text(response)
     except Exception as e:
-        error_msg = str(e)
-        if "quota" in error_msg.lower() or "rate" in error_msg.lower():
-            raise RateLimitError(f"Gemini rate limit exceeded: {error_msg}")
-        elif "api key" in error_msg.lower() or "invalid" in error_msg.lower() or "permission" in error_msg.lower():
-            raise AuthenticationError(f"Gemini authentication failed: {error_msg}")
-        elif "timeout" in error_msg.lower() or "deadline" in error_msg.lower():
-            raise APITimeoutError(
-                f"Gemini request timeout: {error_msg}",
-                timeout_seconds=timeout_seconds,
-                service=PROVIDER_GEMINI
-            )
-        else:
-            raise APIError(f"Gemini API error: {error_msg}")
+        raise _map_gemini_error(e, timeout_seconds)
 
 
-def call_gemini(model_name: str, system_message: str, prompt: str, temperature: float) -> AIResult:
-    """Call Google Gemini API.
+@secure_api_call(PROVIDER_GEMINI)
+@resilient_api_call(
+    max_retries=3,
+    initial_delay=1.0,
+    backoff_factor=2.0,
+    failure_threshold=5,
+    recovery_timeout=60
+)
+async def _gemini_api_call_async(
+    client,
+    model_name: str,
+    prompt_content: str,
+    system_message: str,
+    temperature: float,
+    max_output_tokens: int = 4096
+) -> str:
+    """Async counterpart of _gemini_api_call."""
+    timeout_seconds = get_timeout(PROVIDER_GEMINI)
 
-    Args:
-        model_name: Model to use (e.g., gemini-2.0-flash, gemini-1.5-pro)
-        system_message: System message to guide the AI's response
-        prompt: User prompt
-        temperature: Temperature parameter (0.0 to 1.0)
+    try:
+        config = types.GenerateContentConfig(
+            system_instruction=system_message if system_message else None,
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+        )
+        response = await client.aio.models.generate_content(
+            model=model_name,
+            contents=prompt_content,
+            config=config,
+        )
+        return _response_text(response)
+    except Exception as e:
+        raise _map_gemini_error(e, timeout_seconds)
+
+
+def _response_text(response) -> str:
+    """Extract the text of a generate_content response, raising if empty."""
+    if not getattr(response, 'candidates', None):
+        raise APIError("Gemini returned empty response (no candidates)")
+    if response.text is None:
+        raise APIError("Gemini returned empty response text")
+    return response.text
+
+
+def _map_gemini_error(e: Exception, timeout_seconds: float) -> Exception:
+    """Translate an SDK exception into the application error hierarchy."""
+    if isinstance(e, (APIError, RateLimitError, AuthenticationError, APITimeoutError)):
+        return e
+    error_msg = str(e)
+    if "quota" in error_msg.lower() or "rate" in error_msg.lower():
+        return RateLimitError(f"Gemini rate limit exceeded: {error_msg}")
+    elif "api key" in error_msg.lower() or "invalid" in error_msg.lower() or "permission" in error_msg.lower():
+        return AuthenticationError(f"Gemini authentication failed: {error_msg}")
+    elif "timeout" in error_msg.lower() or "deadline" in error_msg.lower():
+        return APITimeoutError(
+            f"Gemini request timeout: {error_msg}",
+            timeout_seconds=timeout_seconds,
+            service=PROVIDER_GEMINI
+        )
+    else:
+        return APIError(f"Gemini API error: {error_msg}")
+
+
+def _prepare_call(system_message: str, prompt: str) -> Union[AIResult, Tuple[str, str, str]]:
+    """Check SDK availability and the API key, and sanitize inputs.
 
     Returns:
-        AIResult: Type-safe result wrapper. Use result.text for content,
-                  result.is_success to check status. str(result) returns
-                  text or error string for backward compatibility.
+        (api_key, system_message, prompt), or a failed AIResult if a check failed
     """
     if not GENAI_AVAILABLE:
         logger.error("google-genai SDK not installed")
@@ -153,6 +189,43 @@ def call_gemini(model_name: str, system_message: str, prompt: str, temperature:
     # Enhanced sanitization
     prompt = security_manager.sanitize_input(prompt, "prompt")
     system_message = security_manager.sanitize_input(system_message, "prompt")
+    return api_key, system_message, prompt
+
+
+def _failure_result(e: Exception, model_name: str) -> AIResult:
+    """Convert an exception raised during a call into a failed AIResult."""
+    if isinstance(e, APITimeoutError):
+        logger.error(f"Gemini API timeout with model {model_name}: {str(e)}")
+        title, message = get_error_message("CONN_TIMEOUT", f"Request timed out after {e.timeout_seconds}s")
+        return AIResult.failure(message, error_code=title, exception=e)
+    if isinstance(e, (APIError, ServiceUnavailableError)):
+        logger.error(f"Gemini API error with model {model_name}: {str(e)}")
+        error_code, details = format_api_error(PROVIDER_GEMINI, e)
+        title, message = get_error_message(error_code, details, model_name)
+        return AIResult.failure(message, error_code=title, exception=e)
+    logger.error(f"Unexpected error calling Gemini: {str(e)}")
+    title, message = get_error_message("API_UNEXPECTED_ERROR", str(e))
+    return AIResult.failure(message, error_code=title, exception=e)
+
+
+def call_gemini(model_name: str, system_message: str, prompt: str, temperature: float) -> AIResult:
+    """Call Google Gemini API.
+
+    Args:
+        model_name: Model to use (e.g., gemini-2.0-flash, gemini-1.5-pro)
+        system_message: System message to guide the AI's response
+        prompt: User prompt
+        temperature: Temperature parameter (0.0 to 1.0)
+
+    Returns:
+        AIResult: Type-safe result wrapper. Use result.text for content,
+                  result.is_success to check status. str(result) returns
+                  text or error string for backward compatibility.
+    """
+    prepared = _prepare_call(system_message, prompt)
+    if isinstance(prepared, AIResult):
+        return prepared
+    api_key, system_message, prompt = prepared
 
     try:
         logger.info(f"Making Gemini API call with model: {model_name}")
@@ -172,17 +245,34 @@ def call_gemini(model_name: str, system_message: str, prompt: str, temperature:
             temperature=temperature
         )
         return AIResult.success(response_text.strip(), model=model_name, provider=PROVIDER_GEMINI)
+    except Exception as e:
+        return _failure_result(e, model_name)
 
-    except APITimeoutError as e:
-        logger.error(f"Gemini API timeout with model {model_name}: {str(e)}")
-        title, message = get_error_message("CONN_TIMEOUT", f"Request timed out after {e.timeout_seconds}s")
-        return AIResult.failure(message, error_code=title, exception=e)
-    except (APIError, ServiceUnavailableError) as e:
-        logger.error(f"Gemini API error with model {model_name}: {str(e)}")
-        error_code, details = format_api_error(PROVIDER_GEMINI, e)
-        title, message = get_error_message(error_code, details, model_name)
-        return AIResult.failure(message, error_code=title, exception=e)
+
+async def call_gemini_async(model_name: str, system_message: str, prompt: str, temperature: float) -> AIResult:
+    """Async counterpart of call_gemini.
+
+    Returns:
+        AIResult: Same contract as call_gemini.
+    """
+    # API key lookup may hit the keyring/disk; keep it off the event loop
+    prepared = await asyncio.to_thread(_prepare_call, system_message, prompt)
+    if isinstance(prepared, AIResult):
+        return prepared
+    api_key, system_message, prompt = prepared
+
+    try:
+        logger.info(f"Making async Gemini API call with model: {model_name}")
+        log_api_call_debug("Gemini (async)", model_name, temperature, system_message, prompt)
+
+        client = genai.Client(api_key=api_key)
+        response_text = await _gemini_api_call_async(
+            client=client,
+            model_name=model_name,
+            prompt_content=prompt,
+            system_message=system_message,
+            temperature=temperature
+        )
+        return AIResult.success(response_text.strip(), model=model_name, provider=PROVIDER_GEMINI)
     except Exception as e:
-        logger.error(f"Unexpected error calling Gemini: {str(e)}")
-        title, message = get_error_message("API_UNEXPECTED_ERROR", str(e))
-        return AIResult.failure(message, error_code=title, exception=e)
+        return _failure_result(e, model_name)
@@ -6,18 +6,21 @@ via their OpenAI-compatible API, including streaming support.
 Return Types:
     - call_groq: Returns AIResult for type-safe error handling
     - call_groq_streaming: Returns AIResult for type-safe error handling
+    - call_groq_async / call_groq_streaming_async: asyncio counterparts
     - str(result) provides backward compatibility with code expecting strings
 """
 
 import httpx
-from typing import List, Dict, Callable
-
-from openai import OpenAI
+from typing import List, Dict, Callable, Union
 
+from utils.lazy_loader import lazy_import
 from utils.structured_logging import get_logger
 
 logger = get_logger(__name__)
 
+# The OpenAI-compatible SDK is imported on the first API call
+openai = lazy_import("openai")
+
 from ai.logging_utils import log_api_call_debug
 from utils.error_codes import get_error_message, format_api_error
 from utils.validation import validate_model_name
@@ -67,7 +70,7 @@ def _groq_api_call(model: str, messages: List[Dict[str, str]], temperature: floa
             raise AuthenticationError("Groq API key not configured")
 
         http_client = get_http_client_manager().get_httpx_client(PROVIDER_GROQ, timeout_seconds)
-        client = OpenAI(
+        client = openai.OpenAI(
             api_key=api_key,
             base_url=GROQ_BASE_URL,
             http_client=http_client,
@@ -79,39 +82,105 @@ def _groq_api_call(model: str, messages: List[Dict[str, str]], temperature: floa
             temperature=temperature,
         )
         return response
-    except httpx.TimeoutException as e:
-        raise APITimeoutError(
+    except Exception as e:
+        raise _map_groq_error(e, timeout_seconds)
+
+
+@secure_api_call(PROVIDER_GROQ)
+@resilient_api_call(
+    max_retries=3,
+    initial_delay=1.0,
+    backoff_factor=2.0,
+    failure_threshold=5,
+    recovery_timeout=60
+)
+async def _groq_api_call_async(model: str, messages: List[Dict[str, str]], temperature: float):
+    """Async counterpart of _groq_api_call using the pooled httpx.AsyncClient."""
+    timeout_seconds = get_timeout(PROVIDER_GROQ)
+
+    try:
+        api_key = get_security_manager().get_api_key(PROVIDER_GROQ)
+        if not api_key:
+            raise AuthenticationError("Groq API key not configured")
+
+        http_client = get_http_client_manager().get_async_httpx_client(PROVIDER_GROQ, timeout_seconds)
+        client = openai.AsyncOpenAI(
+            api_key=api_key,
+            base_url=GROQ_BASE_URL,
+            http_client=http_client,
+        )
+
+        return await client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+        )
+    except Exception as e:
+        raise _map_groq_error(e, timeout_seconds)
+
+
+def _map_groq_error(e: Exception, timeout_seconds: float) -> Exception:
+    """Translate an SDK/transport exception into the application error hierarchy."""
+    if isinstance(e, httpx.TimeoutException):
+        return APITimeoutError(
             f"Groq request timed out after {timeout_seconds}s: {e}",
             timeout_seconds=timeout_seconds,
             service=PROVIDER_GROQ
         )
-    except Exception as e:
-        error_msg = str(e)
-        if "rate limit" in error_msg.lower():
-            raise RateLimitError(f"Groq rate limit exceeded: {error_msg}")
-        elif "authentication" in error_msg.lower() or "invalid api key" in error_msg.lower():
-            raise AuthenticationError(f"Groq authentication failed: {error_msg}")
-        elif "timeout" in error_msg.lower():
-            raise APITimeoutError(
-                f"Groq request timeout: {error_msg}",
-                timeout_seconds=timeout_seconds,
-                service=PROVIDER_GROQ
-            )
-        else:
-            raise APIError(f"Groq API error: {error_msg}")
-
+    error_msg = str(e)
+    if "rate limit" in error_msg.lower():
+        return RateLimitError(f"Groq rate limit exceeded: {error_msg}")
+    elif "authentication" in error_msg.lower() or "invalid api key" in error_msg.lower():
+        return AuthenticationError(f"Groq authentication failed: {error_msg}")
+    elif "timeout" in error_msg.lower():
+        return APITimeoutError(
+            f"Groq request timeout: {error_msg}",
+            timeout_seconds=timeout_seconds,
+            service=PROVIDER_GROQ
+        )
+    else:
+        return APIError(f"Groq API error: {error_msg}")
+
+
+def _completion_result(response, model: str) -> AIResult:
+    """Convert a chat completion into an AIResult."""
+    if not response.choices:
+        return AIResult.failure("Groq returned empty response (no choices)", error_code="API_EMPTY_RESPONSE")
+    content = response.choices[0].message.content
+    if not content:
+        return AIResult.failure("Groq returned empty content (model may have returned tool calls only)", error_code="API_EMPTY_RESPONSE")
+    text = content.strip()
+    usage_data = {}
+    if response.usage:
+        usage_data = {
+            "prompt_tokens": response.usage.prompt_tokens,
+            "completion_tokens": response.usage.completion_tokens,
+            "total_tokens": response.usage.total_tokens,
+        }
+    return AIResult.success(text, usage=usage_data, model=model, provider=PROVIDER_GROQ)
+
+
+def _failure_result(e: Exception, model: str) -> AIResult:
+    """Convert an exception raised during a call into a failed AIResult."""
+    if isinstance(e, APITimeoutError):
+        logger.error(f"Groq API timeout with model {model}: {str(e)}")
+        title, message = get_error_message("CONN_TIMEOUT", f"Request timed out after {e.timeout_seconds}s")
+        return AIResult.failure(message, error_code=title, exception=e)
+    if isinstance(e, (APIError, ServiceUnavailableError)):
+        logger.error(f"Groq API error with model {model}: {str(e)}")
+        error_code, details = format_api_error(PROVIDER_GROQ, e)
+        title, message = get_error_message(error_code, details, model)
+        return AIResult.failure(message, error_code=title, exception=e)
+    logger.error(f"Unexpected error calling Groq: {str(e)}")
+    title, message = get_error_message("API_UNEXPECTED_ERROR", str(e))
+    return AIResult.failure(message, error_code=title, exception=e)
 
-def call_groq(model: str, system_message: str, prompt: str, temperature: float) -> AIResult:
-    """Call Groq API to generate a response.
 
-    Args:
-        model: Model to use (e.g., llama-3.3-70b-versatile)
-        system_message: System message to guide the AI's response
-        prompt: User prompt
-        temperature: Temperature parameter (0.0 to 1.0)
+def _prepare_messages(model: str, system_message: str, prompt: str) -> Union[AIResult, List[Dict[str, str]]]:
+    """Validate the model and sanitize inputs.
 
     Returns:
-        AIResult: Type-safe result wrapper.
+        The chat messages to send, or a failed AIResult if validation failed
     """
     security_manager = get_security_manager()
 
@@ -122,44 +191,56 @@ def call_groq(model: str, system_message: str, prompt: str, temperature: float)
 
     prompt = security_manager.sanitize_input(prompt, "prompt")
     system_message = security_manager.sanitize_input(system_message, "prompt")
+    return [
+        {"role": "system", "content": system_message},
+        {"role": "user", "content": prompt}
+    ]
+
+
+def call_groq(model: str, system_message: str, prompt: str, temperature: float) -> AIResult:
+    """Call Groq API to generate a response.
+
+    Args:
+        model: Model to use (e.g., llama-3.3-70b-versatile)
+        system_message: System message to guide the AI's response
+        prompt: User prompt
+        temperature: Temperature parameter (0.0 to 1.0)
+
+    Returns:
+        AIResult: Type-safe result wrapper.
+    """
+    messages = _prepare_messages(model, system_message, prompt)
+    if isinstance(messages, AIResult):
+        return messages
 
     try:
         logger.info(f"Making Groq API call with model: {model}")
-        log_api_call_debug("Groq", model, temperature, system_message, prompt)
-
-        messages = [
-            {"role": "system", "content": system_message},
-            {"role": "user", "content": prompt}
-        ]
+        log_api_call_debug("Groq", model, temperature, messages[0]["content"], messages[1]["content"])
 
         response = _groq_api_call(model, messages, temperature)
-        if not response.choices:
-            return AIResult.failure("Groq returned empty response (no choices)", error_code="API_EMPTY_RESPONSE")
-        content = response.choices[0].message.content
-        if not content:
-            return AIResult.failure("Groq returned empty content (model may have returned tool calls only)", error_code="API_EMPTY_RESPONSE")
-        text = content.strip()
-        usage_data = {}
-        if response.usage:
-            usage_data = {
-                "prompt_tokens": response.usage.prompt_tokens,
-                "completion_tokens": response.usage.completion_tokens,
-                "total_tokens": response.usage.total_tokens,
-            }
-        return AIResult.success(text, usage=usage_data, model=model, provider=PROVIDER_GROQ)
-    except APITimeoutError as e:
-        logger.error(f"Groq API timeout with model {model}: {str(e)}")
-        title, message = get_error_message("CONN_TIMEOUT", f"Request timed out after {e.timeout_seconds}s")
-        return AIResult.failure(message, error_code=title, exception=e)
-    except (APIError, ServiceUnavailableError) as e:
-        logger.error(f"Groq API error with model {model}: {str(e)}")
-        error_code, details = format_api_error(PROVIDER_GROQ, e)
-        title, message = get_error_message(error_code, details, model)
-        return AIResult.failure(message, error_code=title, exception=e)
+        return _completion_result(response, model)
     except Exception as e:
-        logger.error(f"Unexpected error calling Groq: {str(e)}")
-        title, message = get_error_message("API_UNEXPECTED_ERROR", str(e))
-        return AIResult.failure(message, error_code=title, exception=e)
+        return _failure_result(e, model)
+
+
+async def call_groq_async(model: str, system_message: str, prompt: str, temperature: float) -> AIResult:
+    """Async counterpart of call_groq.
+
+    Returns:
+        AIResult: Same contract as call_groq.
+    """
+    messages = _prepare_messages(model, system_message, prompt)
+    if isinstance(messages, AIResult):
+        return messages
+
+    try:
+        logger.info(f"Making async Groq API call with model: {model}")
+        log_api_call_debug("Groq (async)", model, temperature, messages[0]["content"], messages[1]["content"])
+
+        response = await _groq_api_call_async(model, messages, temperature)
+        return _completion_result(response, model)
+    except Exception as e:
+        return _failure_result(e, model)
 
 
 def call_groq_streaming(
@@ -205,7 +286,7 @@ def call_groq_streaming(
 
         timeout_seconds = get_timeout(PROVIDER_GROQ)
         http_client = get_http_client_manager().get_httpx_client(PROVIDER_GROQ, timeout_seconds)
-        client = OpenAI(
+        client = openai.OpenAI(
             api_key=api_key,
             base_url=GROQ_BASE_URL,
             http_client=http_client,
@@ -236,3 +317,61 @@ def call_groq_streaming(
         result = AIResult.failure(str(e), error_code="STREAMING_ERROR", exception=e)
         on_chunk(str(result))
         return result
+
+
+async def call_groq_streaming_async(
+    model: str,
+    system_message: str,
+    prompt: str,
+    temperature: float,
+    on_chunk: Callable[[str], None]
+) -> AIResult:
+    """Async counterpart of call_groq_streaming.
+
+    Returns:
+        AIResult: Same contract as call_groq_streaming.
+    """
+    messages = _prepare_messages(model, system_message, prompt)
+    if isinstance(messages, AIResult):
+        on_chunk(str(messages))
+        return messages
+
+    try:
+        logger.info(f"Making async streaming Groq API call with model: {model}")
+        log_api_call_debug("Groq (async streaming)", model, temperature, messages[0]["content"], messages[1]["content"])
+
+        api_key = get_security_manager().get_api_key(PROVIDER_GROQ)
+        if not api_key:
+            result = AIResult.failure("Groq API key not configured", error_code="AUTH_ERROR")
+            on_chunk(str(result))
+            return result
+
+        timeout_seconds = get_timeout(PROVIDER_GROQ)
+        http_client = get_http_client_manager().get_async_httpx_client(PROVIDER_GROQ, timeout_seconds)
+        client = openai.AsyncOpenAI(
+            api_key=api_key,
+            base_url=GROQ_BASE_URL,
+            http_client=http_client,
+        )
+
+        full_response = ""
+        stream = await client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            stream=True
+        )
+        async with stream:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    text = chunk.choices[0].delta.content
+                    full_response += text
+                    on_chunk(text)
+
+        return AIResult.success(full_response.strip(), model=model, provider=PROVIDER_GROQ)
+
+    except Exception as e:
+        logger.error(f"Async streaming Groq error with model {model}: {str(e)}")
+        result = AIResult.failure(str(e), error_code="STREAMING_ERROR", exception=e)
+        on_chunk(str(result))
+        return result
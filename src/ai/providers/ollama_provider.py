@@ -5,12 +5,15 @@ Handles all API calls to local Ollama models.
 Return Types:
     - call_ollama: Returns AIResult for type-safe error handling
     - fallback_ollama_generate: Returns AIResult for type-safe error handling
+    - call_ollama_async: asyncio counterpart of call_ollama (httpx.AsyncClient)
     - str(result) provides backward compatibility with code expecting strings
 """
 
+import asyncio
 import os
 import json
 import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from utils.structured_logging import get_logger
 
@@ -54,6 +57,65 @@ def _get_first_available_model(session, base_url: str) -> str:
     return ""
 
 
+def _resolve_model(system_message: str, prompt: str, model: str) -> str:
+    """Resolve the model from the explicit argument, then task settings, then the global default."""
+    if not model:
+        model_key = get_model_key_for_task(system_message, prompt)
+        model = settings_manager.get_nested(f"{model_key}.ollama_model", "")
+    if not model:
+        model = settings_manager.get("ollama_default_model", "")
+    return model
+
+
+def _endpoint_payloads(model: str, system_message: str, prompt: str,
+                       temperature: float) -> List[Tuple[str, Dict[str, Any]]]:
+    """Endpoints to try in order: /api/chat (model-agnostic), then /api/generate."""
+    return [
+        ("chat", {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": temperature,
+            "stream": False
+        }),
+        ("generate", {
+            "model": model,
+            "prompt": f"{system_message}\n\n{prompt}",
+            "temperature": temperature,
+            "stream": False,
+        }),
+    ]
+
+
+def _extract_text(result: Dict[str, Any]) -> Optional[str]:
+    """Extract the reply from a chat or generate response, or None if unrecognised."""
+    # Chat API format
+    if "message" in result and "content" in result["message"]:
+        return result["message"]["content"].strip()
+    # Generate API format
+    if "response" in result:
+        return result["response"].strip()
+    return None
+
+
+def _exhausted_result(last_error: Optional[str], model: str) -> AIResult:
+    """Failure result once both endpoints have been tried."""
+    if last_error and "404" in str(last_error):
+        title, message = get_error_message(
+            "CFG_MODEL_NOT_INSTALLED",
+            f"Model '{model}' may not be installed. Run: ollama pull {model}",
+            model,
+        )
+    else:
+        title, message = get_error_message(
+            "CONN_SERVICE_DOWN",
+            f"Failed after trying both /api/chat and /api/generate with model '{model}'. Last error: {last_error}",
+        )
+    return AIResult.failure(message, error_code=title)
+
+
 def call_ollama(system_message: str, prompt: str, temperature: float, model: str = "") -> AIResult:
     """Call local Ollama API to generate a response.
 
@@ -80,14 +142,10 @@ def call_ollama(system_message: str, prompt: str, temperature: float, model: str
     ollama_url = get_ollama_url()
     base_url = ollama_url.rstrip("/")  # Remove trailing slash if present
 
-    # Use explicitly passed model, or fall back to settings-based resolution
-    if not model:
-        model_key = get_model_key_for_task(system_message, prompt)
-        model = settings_manager.get_nested(f"{model_key}.ollama_model", "")
+    # Use explicitly passed model, or fall back to settings / global default
+    model = _resolve_model(system_message, prompt, model)
 
-    # If still no model, use global default or auto-detect
-    if not model:
-        model = settings_manager.get("ollama_default_model", "")
+    # If still no model, auto-detect
     if not model:
         model = _get_first_available_model(session, base_url)
     if not model:
@@ -98,18 +156,6 @@ def call_ollama(system_message: str, prompt: str, temperature: float, model: str
     # Use consolidated debug logging
     log_api_call_debug("Ollama", model, temperature, system_message, prompt)
 
-    # Format the request payload for Ollama chat API
-    # Use the 'chat' endpoint which handles prompt formatting for all models
-    payload = {
-        "model": model,
-        "messages": [
-            {"role": "system", "content": system_message},
-            {"role": "user", "content": prompt}
-        ],
-        "temperature": temperature,
-        "stream": False
-    }
-
     # Implement retry logic with increasing timeouts
     # Local models need longer timeouts, especially on cold start (loading weights)
     max_retries = 3
@@ -127,15 +173,7 @@ def call_ollama(system_message: str, prompt: str, temperature: float, model: str
         return AIResult.failure(message, error_code=title, exception=e)
 
     # Try /api/chat first (model-agnostic), fall back to /api/generate
-    endpoints = [
-        ("chat", payload),
-        ("generate", {
-            "model": model,
-            "prompt": f"{system_message}\n\n{prompt}",
-            "temperature": temperature,
-            "stream": False,
-        }),
-    ]
+    endpoints = _endpoint_payloads(model, system_message, prompt, temperature)
 
     last_error = None
     for endpoint_name, endpoint_payload in endpoints:
@@ -168,12 +206,9 @@ def call_ollama(system_message: str, prompt: str, temperature: float, model: str
 
                 result = json.loads(response_text)
 
-                # Chat API format
-                if "message" in result and "content" in result["message"]:
-                    return AIResult.success(result["message"]["content"].strip(), model=model, provider=PROVIDER_OLLAMA)
-                # Generate API format
-                if "response" in result:
-                    return AIResult.success(result["response"].strip(), model=model, provider=PROVIDER_OLLAMA)
+                text = _extract_text(result)
+                if text is not None:
+                    return AIResult.success(text, model=model, provider=PROVIDER_OLLAMA)
 
                 logger.warning(f"Unexpected Ollama response keys: {list(result.keys())}")
                 last_error = f"Unexpected response format from /api/{endpoint_name}"
@@ -208,18 +243,87 @@ def call_ollama(system_message: str, prompt: str, temperature: float, model: str
         continue
 
     # Both endpoints failed
-    if last_error and "404" in str(last_error):
-        title, message = get_error_message(
-            "CFG_MODEL_NOT_INSTALLED",
-            f"Model '{model}' may not be installed. Run: ollama pull {model}",
-            model,
-        )
-    else:
-        title, message = get_error_message(
-            "CONN_SERVICE_DOWN",
-            f"Failed after trying both /api/chat and /api/generate with model '{model}'. Last error: {last_error}",
-        )
-    return AIResult.failure(message, error_code=title)
+    return _exhausted_result(last_error, model)
+
+
+async def call_ollama_async(system_message: str, prompt: str, temperature: float, model: str = "") -> AIResult:
+    """Async counterpart of call_ollama using a pooled httpx.AsyncClient.
+
+    Follows the same sequence as call_ollama: health check, then /api/chat
+    with /api/generate as fallback, retrying with increasing timeouts.
+
+    Returns:
+        AIResult: Same contract as call_ollama.
+    """
+    prompt = sanitize_prompt(prompt)
+    system_message = sanitize_prompt(system_message)
+
+    client = get_http_client_manager().get_async_httpx_client(PROVIDER_OLLAMA)
+
+    from utils.constants import get_ollama_url
+    ollama_url = get_ollama_url()
+    base_url = ollama_url.rstrip("/")
+
+    model = _resolve_model(system_message, prompt, model)
+    if not model:
+        # Model auto-detection is cached and rarely hits the network
+        session = get_http_client_manager().get_requests_session(PROVIDER_OLLAMA)
+        model = await asyncio.to_thread(_get_first_available_model, session, base_url)
+    if not model:
+        model = "llama3"  # last-resort default
+
+    logger.info(f"Making async Ollama API call with model: {model}")
+    log_api_call_debug("Ollama (async)", model, temperature, system_message, prompt)
+
+    try:
+        health_check = await client.get(f"{base_url}/api/version", timeout=5)
+        if health_check.status_code != 200:
+            title, message = get_error_message("CONN_OLLAMA_NOT_RUNNING", f"Service at {ollama_url} returned status {health_check.status_code}")
+            return AIResult.failure(message, error_code=title)
+    except Exception as e:
+        logger.error(f"Ollama service not reachable: {str(e)}")
+        title, message = get_error_message("CONN_OLLAMA_NOT_RUNNING", str(e))
+        return AIResult.failure(message, error_code=title, exception=e)
+
+    max_retries = 3
+    timeout_values = [120, 180, 300]
+    last_error = None
+
+    for endpoint_name, endpoint_payload in _endpoint_payloads(model, system_message, prompt, temperature):
+        url = f"{base_url}/api/{endpoint_name}"
+
+        for attempt in range(max_retries):
+            try:
+                response = await client.post(url, json=endpoint_payload, timeout=timeout_values[attempt])
+
+                if response.status_code == 404:
+                    error_body = response.text[:200]
+                    logger.warning(f"Ollama {endpoint_name} returned 404: {error_body}")
+                    last_error = f"404 from /api/{endpoint_name}: {error_body}"
+                    break
+
+                response.raise_for_status()
+
+                response_text = response.text.strip()
+                if not response_text:
+                    raise ValueError("Empty response from Ollama API")
+
+                text = _extract_text(json.loads(response_text))
+                if text is not None:
+                    return AIResult.success(text, model=model, provider=PROVIDER_OLLAMA)
+
+                last_error = f"Unexpected response format from /api/{endpoint_name}"
+                break
+
+            except Exception as e:
+                last_error = str(e)
+                logger.error(f"Ollama {endpoint_name} error (attempt {attempt+1}/{max_retries}): {str(e)}")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(2)
+                    continue
+                break
+
+    return _exhausted_result(last_error, model)
 
 
 def fallback_ollama_generate(model: str, system_message: str, prompt: str, temperature: float, timeout: int) -> AIResult:
@@ -5,18 +5,23 @@ Handles all API calls to OpenAI's GPT models including streaming support.
 Return Types:
     - call_openai: Returns AIResult for type-safe error handling
     - call_openai_streaming: Returns AIResult for type-safe error handling
+    - call_openai_async / call_openai_streaming_async: asyncio counterparts
     - str(result) provides backward compatibility with code expecting strings
 """
 
 import httpx
-from typing import List, Dict, Callable, Union
-
-from openai import OpenAI
+from typing import TYPE_CHECKING, List, Dict, Callable, Union
 
+from utils.lazy_loader import lazy_import
 from utils.structured_logging import get_logger
 
 logger = get_logger(__name__)
-from openai.types.chat import ChatCompletion
+
+if TYPE_CHECKING:
+    from openai.types.chat import ChatCompletion
+
+# The SDK is imported on the first API call, keeping it off the startup path
+openai = lazy_import("openai")
 
 from ai.logging_utils import log_api_call_debug
 from utils.error_codes import get_error_message, format_api_error
@@ -41,7 +46,7 @@ from utils.constants import PROVIDER_OPENAI
     failure_threshold=5,
     recovery_timeout=60
 )
-def _openai_api_call(model: str, messages: List[Dict[str, str]], temperature: float) -> ChatCompletion:
+def _openai_api_call(model: str, messages: List[Dict[str, str]], temperature: float) -> 'ChatCompletion':
     """Make the actual API call to OpenAI with explicit timeout.
 
     Args:
@@ -61,7 +66,7 @@ def _openai_api_call(model: str, messages: List[Dict[str, str]], temperature: fl
     try:
         # Use pooled HTTP client for connection reuse (saves 50-200ms per call)
         http_client = get_http_client_manager().get_httpx_client(PROVIDER_OPENAI, timeout_seconds)
-        client = OpenAI(http_client=http_client)
+        client = openai.OpenAI(http_client=http_client)
 
         response = client.chat.completions.create(
             model=model,
@@ -69,26 +74,111 @@ def _openai_api_call(model: str, messages: List[Dict[str, str]], temperature: fl
             temperature=temperature,
         )
         return response
-    except httpx.TimeoutException as e:
-        raise APITimeoutError(
+    except Exception as e:
+        raise _map_openai_error(e, timeout_seconds)
+
+
+@secure_api_call(PROVIDER_OPENAI)
+@resilient_api_call(
+    max_retries=3,
+    initial_delay=1.0,
+    backoff_factor=2.0,
+    failure_threshold=5,
+    recovery_timeout=60
+)
+async def _openai_api_call_async(model: str, messages: List[Dict[str, str]], temperature: float) -> 'ChatCompletion':
+    """Async counterpart of _openai_api_call using the pooled httpx.AsyncClient."""
+    timeout_seconds = get_timeout(PROVIDER_OPENAI)
+
+    try:
+        http_client = get_http_client_manager().get_async_httpx_client(PROVIDER_OPENAI, timeout_seconds)
+        client = openai.AsyncOpenAI(http_client=http_client)
+
+        return await client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+        )
+    except Exception as e:
+        raise _map_openai_error(e, timeout_seconds)
+
+
+def _map_openai_error(e: Exception, timeout_seconds: float) -> Exception:
+    """Translate an SDK/transport exception into the application error hierarchy."""
+    if isinstance(e, httpx.TimeoutException):
+        return APITimeoutError(
             f"OpenAI request timed out after {timeout_seconds}s: {e}",
             timeout_seconds=timeout_seconds,
             service=PROVIDER_OPENAI
         )
-    except Exception as e:
-        error_msg = str(e)
-        if "rate limit" in error_msg.lower():
-            raise RateLimitError(f"OpenAI rate limit exceeded: {error_msg}")
-        elif "authentication" in error_msg.lower() or "invalid api key" in error_msg.lower():
-            raise AuthenticationError(f"OpenAI authentication failed: {error_msg}")
-        elif "timeout" in error_msg.lower():
-            raise APITimeoutError(
-                f"OpenAI request timeout: {error_msg}",
-                timeout_seconds=timeout_seconds,
-                service=PROVIDER_OPENAI
-            )
-        else:
-            raise APIError(f"OpenAI API error: {error_msg}")
+    error_msg = str(e)
+    if "rate limit" in error_msg.lower():
+        return RateLimitError(f"OpenAI rate limit exceeded: {error_msg}")
+    elif "authentication" in error_msg.lower() or "invalid api key" in error_msg.lower():
+        return AuthenticationError(f"OpenAI authentication failed: {error_msg}")
+    elif "timeout" in error_msg.lower():
+        return APITimeoutError(
+            f"OpenAI request timeout: {error_msg}",
+            timeout_seconds=timeout_seconds,
+            service=PROVIDER_OPENAI
+        )
+    else:
+        return APIError(f"OpenAI API error: {error_msg}")
+
+
+def _completion_result(response: 'ChatCompletion', model: str) -> AIResult:
+    """Convert a chat completion into an AIResult."""
+    if not response.choices:
+        return AIResult.failure("OpenAI returned empty response (no choices)", error_code="API_EMPTY_RESPONSE")
+    content = response.choices[0].message.content
+    if not content:
+        return AIResult.failure("OpenAI returned empty content (model may have returned tool calls only)", error_code="API_EMPTY_CONTENT")
+    text = content.strip()
+    usage_data = {}
+    if response.usage:
+        usage_data = {
+            "prompt_tokens": response.usage.prompt_tokens,
+            "completion_tokens": response.usage.completion_tokens,
+            "total_tokens": response.usage.total_tokens,
+        }
+    return AIResult.success(text, usage=usage_data, model=model, provider=PROVIDER_OPENAI)
+
+
+def _failure_result(e: Exception, model: str) -> AIResult:
+    """Convert an exception raised during a call into a failed AIResult."""
+    if isinstance(e, APITimeoutError):
+        logger.error(f"OpenAI API timeout with model {model}: {str(e)}")
+        title, message = get_error_message("CONN_TIMEOUT", f"Request timed out after {e.timeout_seconds}s")
+        return AIResult.failure(message, error_code=title, exception=e)
+    if isinstance(e, (APIError, ServiceUnavailableError)):
+        logger.error(f"OpenAI API error with model {model}: {str(e)}")
+        error_code, details = format_api_error(PROVIDER_OPENAI, e)
+        title, message = get_error_message(error_code, details, model)
+        return AIResult.failure(message, error_code=title, exception=e)
+    logger.error(f"Unexpected error calling OpenAI: {str(e)}")
+    title, message = get_error_message("API_UNEXPECTED_ERROR", str(e))
+    return AIResult.failure(message, error_code=title, exception=e)
+
+
+def _prepare_messages(model: str, system_message: str, prompt: str) -> Union[AIResult, List[Dict[str, str]]]:
+    """Validate the model and sanitize inputs.
+
+    Returns:
+        The chat messages to send, or a failed AIResult if validation failed
+    """
+    security_manager = get_security_manager()
+
+    is_valid, error = validate_model_name(model, PROVIDER_OPENAI)
+    if not is_valid:
+        title, message = get_error_message("CFG_INVALID_SETTINGS", error)
+        return AIResult.failure(message, error_code=title)
+
+    prompt = security_manager.sanitize_input(prompt, "prompt")
+    system_message = security_manager.sanitize_input(system_message, "prompt")
+    return [
+        {"role": "system", "content": system_message},
+        {"role": "user", "content": prompt}
+    ]
 
 
 def call_openai(model: str, system_message: str, prompt: str, temperature: float) -> AIResult:
@@ -105,58 +195,43 @@ def call_openai(model: str, system_message: str, prompt: str, temperature: float
                   result.is_success to check status. str(result) returns
                   text or error string for backward compatibility.
     """
-    # Get security manager
-    security_manager = get_security_manager()
-
-    # Validate inputs
-    is_valid, error = validate_model_name(model, PROVIDER_OPENAI)
-    if not is_valid:
-        title, message = get_error_message("CFG_INVALID_SETTINGS", error)
-        return AIResult.failure(message, error_code=title)
-
-    # Enhanced sanitization
-    prompt = security_manager.sanitize_input(prompt, "prompt")
-    system_message = security_manager.sanitize_input(system_message, "prompt")
+    messages = _prepare_messages(model, system_message, prompt)
+    if isinstance(messages, AIResult):
+        return messages
 
     try:
         logger.info(f"Making OpenAI API call with model: {model}")
 
         # Use consolidated debug logging
-        log_api_call_debug("OpenAI", model, temperature, system_message, prompt)
-
-        messages = [
-            {"role": "system", "content": system_message},
-            {"role": "user", "content": prompt}
-        ]
+        log_api_call_debug("OpenAI", model, temperature, messages[0]["content"], messages[1]["content"])
 
         response = _openai_api_call(model, messages, temperature)
-        if not response.choices:
-            return AIResult.failure("OpenAI returned empty response (no choices)", error_code="API_EMPTY_RESPONSE")
-        content = response.choices[0].message.content
-        if not content:
-            return AIResult.failure("OpenAI returned empty content (model may have returned tool calls only)", error_code="API_EMPTY_CONTENT")
-        text = content.strip()
-        usage_data = {}
-        if response.usage:
-            usage_data = {
-                "prompt_tokens": response.usage.prompt_tokens,
-                "completion_tokens": response.usage.completion_tokens,
-                "total_tokens": response.usage.total_tokens,
-            }
-        return AIResult.success(text, usage=usage_data, model=model, provider=PROVIDER_OPENAI)
-    except APITimeoutError as e:
-        logger.error(f"OpenAI API timeout with model {model}: {str(e)}")
-        title, message = get_error_message("CONN_TIMEOUT", f"Request timed out after {e.timeout_seconds}s")
-        return AIResult.failure(message, error_code=title, exception=e)
-    except (APIError, ServiceUnavailableError) as e:
-        logger.error(f"OpenAI API error with model {model}: {str(e)}")
-        error_code, details = format_api_error(PROVIDER_OPENAI, e)
-        title, message = get_error_message(error_code, details, model)
-        return AIResult.failure(message, error_code=title, exception=e)
+        return _completion_result(response, model)
     except Exception as e:
-        logger.error(f"Unexpected error calling OpenAI: {str(e)}")
-        title, message = get_error_message("API_UNEXPECTED_ERROR", str(e))
-        return AIResult.failure(message, error_code=title, exception=e)
+        return _failure_result(e, model)
+
+
+async def call_openai_async(model: str, system_message: str, prompt: str, temperature: float) -> AIResult:
+    """Async counterpart of call_openai.
+
+    Runs on the caller's event loop using a pooled httpx.AsyncClient, so many
+    concurrent calls share one thread.
+
+    Returns:
+        AIResult: Same contract as call_openai.
+    """
+    messages = _prepare_messages(model, system_message, prompt)
+    if isinstance(messages, AIResult):
+        return messages
+
+    try:
+        logger.info(f"Making async OpenAI API call with model: {model}")
+        log_api_call_debug("OpenAI (async)", model, temperature, messages[0]["content"], messages[1]["content"])
+
+        response = await _openai_api_call_async(model, messages, temperature)
+        return _completion_result(response, model)
+    except Exception as e:
+        return _failure_result(e, model)
 
 
 def call_openai_streaming(
@@ -203,7 +278,7 @@ def call_openai_streaming(
 
         timeout_seconds = get_timeout(PROVIDER_OPENAI)
         http_client = get_http_client_manager().get_httpx_client(PROVIDER_OPENAI, timeout_seconds)
-        client = OpenAI(http_client=http_client)
+        client = openai.OpenAI(http_client=http_client)
 
         messages = [
             {"role": "system", "content": system_message},
@@ -230,3 +305,53 @@ def call_openai_streaming(
         result = AIResult.failure(str(e), error_code="STREAMING_ERROR", exception=e)
         on_chunk(str(result))
         return result
+
+
+async def call_openai_streaming_async(
+    model: str,
+    system_message: str,
+    prompt: str,
+    temperature: float,
+    on_chunk: Callable[[str], None]
+) -> AIResult:
+    """Async counterpart of call_openai_streaming.
+
+    on_chunk is called on the event loop thread for each text chunk.
+
+    Returns:
+        AIResult: Same contract as call_openai_streaming.
+    """
+    messages = _prepare_messages(model, system_message, prompt)
+    if isinstance(messages, AIResult):
+        on_chunk(str(messages))
+        return messages
+
+    try:
+        logger.info(f"Making async streaming OpenAI API call with model: {model}")
+        log_api_call_debug("OpenAI (async streaming)", model, temperature, messages[0]["content"], messages[1]["content"])
+
+        timeout_seconds = get_timeout(PROVIDER_OPENAI)
+        http_client = get_http_client_manager().get_async_httpx_client(PROVIDER_OPENAI, timeout_seconds)
+        client = openai.AsyncOpenAI(http_client=http_client)
+
+        full_response = ""
+        stream = await client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            stream=True
+        )
+        async with stream:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    text = chunk.choices[0].delta.content
+                    full_response += text
+                    on_chunk(text)
+
+        return AIResult.success(full_response.strip(), model=model, provider=PROVIDER_OPENAI)
+
+    except Exception as e:
+        logger.error(f"Async streaming OpenAI error with model {model}: {str(e)}")
+        result = AIResult.failure(str(e), error_code="STREAMING_ERROR", exception=e)
+        on_chunk(str(result))
+        return result
@@ -22,22 +22,40 @@ Usage:
         response_text = result.text
     else:
         handle_error(result.error)
+
+Async:
+    call_ai_async / call_ai_streaming_async are asyncio-native counterparts
+    with the same routing, temperature overrides and fallback chain. Many
+    concurrent calls share one event loop instead of one thread each.
+    Synchronous code can fan out through call_ai_many, which runs the calls
+    concurrently on the shared AI event loop.
 """
 
+import asyncio
 import logging
-from typing import Callable
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from utils.structured_logging import get_logger, timed
+from utils.tracing import get_tracer
 
 logger = get_logger(__name__)
 
 from ai.providers.base import get_model_key_for_task
-from ai.providers.openai_provider import call_openai, call_openai_streaming
-from ai.providers.anthropic_provider import call_anthropic, call_anthropic_streaming
-from ai.providers.ollama_provider import call_ollama
-from ai.providers.gemini_provider import call_gemini
-from ai.providers.groq_provider import call_groq, call_groq_streaming
-from ai.providers.cerebras_provider import call_cerebras, call_cerebras_streaming
+from ai.providers.openai_provider import (
+    call_openai, call_openai_streaming, call_openai_async, call_openai_streaming_async
+)
+from ai.providers.anthropic_provider import (
+    call_anthropic, call_anthropic_streaming, call_anthropic_async, call_anthropic_streaming_async
+)
+from ai.providers.ollama_provider import call_ollama, call_ollama_async
+from ai.providers.gemini_provider import call_gemini, call_gemini_async
+from ai.providers.groq_provider import (
+    call_groq, call_groq_streaming, call_groq_async, call_groq_streaming_async
+)
+from ai.providers.cerebras_provider import (
+    call_cerebras, call_cerebras_streaming, call_cerebras_async, call_cerebras_streaming_async
+)
+from ai.providers.event_loop import run_coroutine_sync
 
 from utils.constants import (
     PROVIDER_OPENAI, PROVIDER_ANTHROPIC,
@@ -50,6 +68,23 @@ from utils.exceptions import AIResult
 # Ollama (local) and Gemini excluded: different availability characteristics.
 FALLBACK_CHAIN = [PROVIDER_OPENAI, PROVIDER_ANTHROPIC, PROVIDER_GROQ, PROVIDER_CEREBRAS]
 
+# Settings key and default model per provider (OpenAI falls back to the caller's model)
+_PROVIDER_MODEL_SETTINGS = {
+    PROVIDER_ANTHROPIC: ("anthropic_model", "claude-sonnet-4-20250514"),
+    PROVIDER_GEMINI: ("gemini_model", "gemini-1.5-flash"),
+    PROVIDER_GROQ: ("groq_model", "llama-3.3-70b-versatile"),
+    PROVIDER_CEREBRAS: ("cerebras_model", "llama-3.3-70b"),
+}
+
+
+def _select_model(provider: str, model: str, current_settings: dict, model_key: str,
+                  provider_explicitly_set: bool) -> str:
+    """Pick the model for a provider: the caller's if the provider was explicit, else settings."""
+    if provider_explicitly_set and model:
+        return model
+    setting_key, default = _PROVIDER_MODEL_SETTINGS.get(provider, ("model", model))
+    return current_settings.get(model_key, {}).get(setting_key, default)
+
 
 def _call_provider(provider: str, model: str, system_message: str, prompt: str,
                    temperature: float, current_settings: dict, model_key: str,
@@ -57,42 +92,69 @@ def _call_provider(provider: str, model: str, system_message: str, prompt: str,
     """Dispatch a single AI call to a specific provider.
 
     This is a pure extraction of the provider dispatch logic from call_ai(),
-    enabling the fallback chain to retry with different providers.
+    enabling the fallback chain to retry with different providers. Each
+    attempt is traced as an ``ai_provider`` span for per-provider latency.
     """
+    with get_tracer().span("ai_provider", provider=provider) as span:
+        result = _dispatch_provider(provider, model, system_message, prompt, temperature,
+                                    current_settings, model_key, provider_explicitly_set)
+        if not result.is_success:
+            span.set_error(result.error)
+        return result
+
+
+def _dispatch_provider(provider: str, model: str, system_message: str, prompt: str,
+                       temperature: float, current_settings: dict, model_key: str,
+                       provider_explicitly_set: bool) -> AIResult:
+    """Call the provider's API function with the model selected for it."""
     if provider == PROVIDER_OLLAMA:
         return call_ollama(system_message, prompt, temperature)
-    elif provider == PROVIDER_ANTHROPIC:
-        if provider_explicitly_set and model:
-            actual_model = model
-        else:
-            actual_model = current_settings.get(model_key, {}).get("anthropic_model", "claude-sonnet-4-20250514")
+
+    actual_model = _select_model(provider, model, current_settings, model_key, provider_explicitly_set)
+    if provider == PROVIDER_ANTHROPIC:
         return call_anthropic(actual_model, system_message, prompt, temperature)
     elif provider == PROVIDER_GEMINI:
-        if provider_explicitly_set and model:
-            actual_model = model
-        else:
-            actual_model = current_settings.get(model_key, {}).get("gemini_model", "gemini-1.5-flash")
         return call_gemini(actual_model, system_message, prompt, temperature)
     elif provider == PROVIDER_GROQ:
-        if provider_explicitly_set and model:
-            actual_model = model
-        else:
-            actual_model = current_settings.get(model_key, {}).get("groq_model", "llama-3.3-70b-versatile")
         return call_groq(actual_model, system_message, prompt, temperature)
     elif provider == PROVIDER_CEREBRAS:
-        if provider_explicitly_set and model:
-            actual_model = model
-        else:
-            actual_model = current_settings.get(model_key, {}).get("cerebras_model", "llama-3.3-70b")
         return call_cerebras(actual_model, system_message, prompt, temperature)
     else:  # OpenAI is the default
-        if provider_explicitly_set and model:
-            actual_model = model
-        else:
-            actual_model = current_settings.get(model_key, {}).get("model", model)
         return call_openai(actual_model, system_message, prompt, temperature)
 
 
+async def _call_provider_async(provider: str, model: str, system_message: str, prompt: str,
+                               temperature: float, current_settings: dict, model_key: str,
+                               provider_explicitly_set: bool) -> AIResult:
+    """Async counterpart of _call_provider."""
+    with get_tracer().span("ai_provider", provider=provider) as span:
+        result = await _dispatch_provider_async(provider, model, system_message, prompt, temperature,
+                                                current_settings, model_key, provider_explicitly_set)
+        if not result.is_success:
+            span.set_error(result.error)
+        return result
+
+
+async def _dispatch_provider_async(provider: str, model: str, system_message: str, prompt: str,
+                                   temperature: float, current_settings: dict, model_key: str,
+                                   provider_explicitly_set: bool) -> AIResult:
+    """Async counterpart of _dispatch_provider."""
+    if provider == PROVIDER_OLLAMA:
+        return await call_ollama_async(system_message, prompt, temperature)
+
+    actual_model = _select_model(provider, model, current_settings, model_key, provider_explicitly_set)
+    if provider == PROVIDER_ANTHROPIC:
+        return await call_anthropic_async(actual_model, system_message, prompt, temperature)
+    elif provider == PROVIDER_GEMINI:
+        return await call_gemini_async(actual_model, system_message, prompt, temperature)
+    elif provider == PROVIDER_GROQ:
+        return await call_groq_async(actual_model, system_message, prompt, temperature)
+    elif provider == PROVIDER_CEREBRAS:
+        return await call_cerebras_async(actual_model, system_message, prompt, temperature)
+    else:  # OpenAI is the default
+        return await call_openai_async(actual_model, system_message, prompt, temperature)
+
+
 def _log_usage(result: AIResult, provider: str, model: str) -> AIResult:
     """Log token usage from an AI result if present.
 
@@ -146,16 +208,16 @@ def call_ai_streaming(
     model_key = get_model_key_for_task(system_message, prompt)
 
     if provider == PROVIDER_ANTHROPIC:
-        actual_model = current_settings.get(model_key, {}).get("anthropic_model", "claude-sonnet-4-20250514")
+        actual_model = _select_model(provider, model, current_settings, model_key, False)
         return call_anthropic_streaming(actual_model, system_message, prompt, temperature, on_chunk)
     elif provider == PROVIDER_GROQ:
-        actual_model = current_settings.get(model_key, {}).get("groq_model", "llama-3.3-70b-versatile")
+        actual_model = _select_model(provider, model, current_settings, model_key, False)
         return call_groq_streaming(actual_model, system_message, prompt, temperature, on_chunk)
     elif provider == PROVIDER_CEREBRAS:
-        actual_model = current_settings.get(model_key, {}).get("cerebras_model", "llama-3.3-70b")
+        actual_model = _select_model(provider, model, current_settings, model_key, False)
         return call_cerebras_streaming(actual_model, system_message, prompt, temperature, on_chunk)
     elif provider == PROVIDER_OPENAI:
-        actual_model = current_settings.get(model_key, {}).get("model", model)
+        actual_model = _select_model(provider, model, current_settings, model_key, False)
         return call_openai_streaming(actual_model, system_message, prompt, temperature, on_chunk)
     else:
         # Fall back to non-streaming for unsupported providers
@@ -165,27 +227,11 @@ def call_ai_streaming(
         return result
 
 
-@timed("ai_call", level=logging.INFO)
-def call_ai(model: str, system_message: str, prompt: str, temperature: float,
-            provider: str = None) -> AIResult:
-    """Route API calls to the appropriate provider based on the selected AI provider in settings.
-
-    Args:
-        model: Model to use (may be overridden by provider-specific settings)
-        system_message: System message to guide the AI's response
-        prompt: Content to send to the model
-        temperature: Temperature parameter to control randomness (may be overridden by settings)
-        provider: Optional override for AI provider (if None, uses global ai_provider setting)
-
-    Returns:
-        AIResult: Type-safe result wrapper. Use result.text for content,
-                  result.is_success to check status. str(result) returns
-                  text or error string for backward compatibility.
-    """
+def _write_debug_prompt(model: str, system_message: str, prompt: str, temperature: float) -> None:
+    """Save the sanitized prompt to a debug file (only in debug mode to protect PHI/PII)."""
     from settings.settings_manager import settings_manager
     from utils.validation import sanitize_for_logging
 
-    # Save prompt to debug file (only in debug mode to protect PHI/PII)
     # SECURITY: This logs medical data - only enable for development debugging
     if settings_manager.get("enable_llm_debug_logging", False):
         try:
@@ -208,6 +254,16 @@ def call_ai(model: str, system_message: str, prompt: str, temperature: float,
         except Exception as e:
             logger.debug(f"Failed to save prompt to debug file: {e}")
 
+
+def _resolve_call(system_message: str, prompt: str, temperature: float,
+                  provider: Optional[str]) -> Tuple[str, float, dict, str, bool]:
+    """Resolve provider, temperature and model settings key for a call.
+
+    Returns:
+        (provider, temperature, current_settings, model_key, provider_explicitly_set)
+    """
+    from settings.settings_manager import settings_manager
+
     # Reload settings from file to ensure we have the latest provider selection
     current_settings = settings_manager.get_all()
 
@@ -240,6 +296,43 @@ def call_ai(model: str, system_message: str, prompt: str, temperature: float,
         if generic_temp is not None:
             temperature = generic_temp
 
+    return provider, temperature, current_settings, model_key, provider_explicitly_set
+
+
+def _fallback_providers(primary: str) -> List[str]:
+    """Providers from FALLBACK_CHAIN (other than primary) that have an API key configured."""
+    from utils.security import get_security_manager
+    security_manager = get_security_manager()
+
+    return [
+        fallback_provider for fallback_provider in FALLBACK_CHAIN
+        if fallback_provider != primary and security_manager.get_api_key(fallback_provider)
+    ]
+
+
+@timed("ai_call", level=logging.INFO)
+def call_ai(model: str, system_message: str, prompt: str, temperature: float,
+            provider: str = None) -> AIResult:
+    """Route API calls to the appropriate provider based on the selected AI provider in settings.
+
+    Args:
+        model: Model to use (may be overridden by provider-specific settings)
+        system_message: System message to guide the AI's response
+        prompt: Content to send to the model
+        temperature: Temperature parameter to control randomness (may be overridden by settings)
+        provider: Optional override for AI provider (if None, uses global ai_provider setting)
+
+    Returns:
+        AIResult: Type-safe result wrapper. Use result.text for content,
+                  result.is_success to check status. str(result) returns
+                  text or error string for backward compatibility.
+    """
+    _write_debug_prompt(model, system_message, prompt, temperature)
+
+    provider, temperature, current_settings, model_key, provider_explicitly_set = _resolve_call(
+        system_message, prompt, temperature, provider
+    )
+
     # Try primary provider, then fallback chain if it fails
     result = _call_provider(provider, model, system_message, prompt, temperature,
                             current_settings, model_key, provider_explicitly_set)
@@ -254,18 +347,7 @@ def call_ai(model: str, system_message: str, prompt: str, temperature: float,
     # Fallback chain: try other providers that have API keys configured
     logger.warning(f"Primary provider {provider} failed: {result.error}. Trying fallbacks...")
 
-    from utils.security import get_security_manager
-    security_manager = get_security_manager()
-
-    for fallback_provider in FALLBACK_CHAIN:
-        if fallback_provider == provider:
-            continue  # Already tried
-
-        # Check if API key exists for this provider
-        api_key = security_manager.get_api_key(fallback_provider)
-        if not api_key:
-            continue
-
+    for fallback_provider in _fallback_providers(provider):
         logger.info(f"Attempting fallback provider: {fallback_provider}")
         fallback_result = _call_provider(fallback_provider, model, system_message, prompt,
                                          temperature, current_settings, model_key,
@@ -278,3 +360,127 @@ def call_ai(model: str, system_message: str, prompt: str, temperature: float,
     # All providers failed
     logger.error("All providers in fallback chain failed")
     return result  # Return original error
+
+
+@timed("ai_call_async", level=logging.INFO)
+async def call_ai_async(model: str, system_message: str, prompt: str, temperature: float,
+                        provider: str = None) -> AIResult:
+    """Asyncio-native counterpart of call_ai.
+
+    Same provider routing, temperature overrides and fallback chain, but the
+    request runs on the caller's event loop over a pooled httpx.AsyncClient.
+    The blocking setup (settings reload, debug prompt file, API key lookups)
+    is dispatched to a worker thread so it never stalls the loop.
+
+    Returns:
+        AIResult: Same contract as call_ai.
+    """
+    await asyncio.to_thread(_write_debug_prompt, model, system_message, prompt, temperature)
+
+    provider, temperature, current_settings, model_key, provider_explicitly_set = await asyncio.to_thread(
+        _resolve_call, system_message, prompt, temperature, provider
+    )
+
+    result = await _call_provider_async(provider, model, system_message, prompt, temperature,
+                                        current_settings, model_key, provider_explicitly_set)
+
+    if result.is_success:
+        return _log_usage(result, provider, model)
+
+    if provider_explicitly_set:
+        return result
+
+    logger.warning(f"Primary provider {provider} failed: {result.error}. Trying fallbacks...")
+
+    for fallback_provider in await asyncio.to_thread(_fallback_providers, provider):
+        logger.info(f"Attempting fallback provider: {fallback_provider}")
+        fallback_result = await _call_provider_async(fallback_provider, model, system_message, prompt,
+                                                     temperature, current_settings, model_key,
+                                                     provider_explicitly_set=False)
+        if fallback_result.is_success:
+            logger.info(f"Fallback to {fallback_provider} succeeded")
+            return _log_usage(fallback_result, fallback_provider, model)
+        logger.warning(f"Fallback {fallback_provider} also failed: {fallback_result.error}")
+
+    logger.error("All providers in fallback chain failed")
+    return result
+
+
+@timed("ai_call_streaming_async", level=logging.INFO)
+async def call_ai_streaming_async(
+    model: str,
+    system_message: str,
+    prompt: str,
+    temperature: float,
+    on_chunk: Callable[[str], None]
+) -> AIResult:
+    """Asyncio-native counterpart of call_ai_streaming.
+
+    on_chunk is invoked on the event loop thread for each text chunk.
+
+    Returns:
+        AIResult: Same contract as call_ai_streaming.
+    """
+    from settings.settings_manager import settings_manager
+    current_settings = await asyncio.to_thread(settings_manager.get_all)
+
+    provider = current_settings.get("ai_provider", PROVIDER_OPENAI)
+    model_key = get_model_key_for_task(system_message, prompt)
+
+    if provider == PROVIDER_ANTHROPIC:
+        actual_model = _select_model(provider, model, current_settings, model_key, False)
+        return await call_anthropic_streaming_async(actual_model, system_message, prompt, temperature, on_chunk)
+    elif provider == PROVIDER_GROQ:
+        actual_model = _select_model(provider, model, current_settings, model_key, False)
+        return await call_groq_streaming_async(actual_model, system_message, prompt, temperature, on_chunk)
+    elif provider == PROVIDER_CEREBRAS:
+        actual_model = _select_model(provider, model, current_settings, model_key, False)
+        return await call_cerebras_streaming_async(actual_model, system_message, prompt, temperature, on_chunk)
+    elif provider == PROVIDER_OPENAI:
+        actual_model = _select_model(provider, model, current_settings, model_key, False)
+        return await call_openai_streaming_async(actual_model, system_message, prompt, temperature, on_chunk)
+    else:
+        logger.info(f"Streaming not supported for {provider}, using non-streaming")
+        result = await call_ai_async(model, system_message, prompt, temperature)
+        on_chunk(str(result))
+        return result
+
+
+async def gather_ai_calls(requests: Sequence[Dict], max_concurrency: Optional[int] = None) -> List[AIResult]:
+    """Run several call_ai_async requests concurrently on the current event loop.
+
+    Args:
+        requests: Keyword-argument dicts for call_ai_async
+            (model, system_message, prompt, temperature[, provider])
+        max_concurrency: Optional cap on in-flight requests
+
+    Returns:
+        AIResults in request order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def run(kwargs: Dict) -> AIResult:
+        if semaphore is None:
+            return await call_ai_async(**kwargs)
+        async with semaphore:
+            return await call_ai_async(**kwargs)
+
+    return list(await asyncio.gather(*(run(kwargs) for kwargs in requests)))
+
+
+def call_ai_many(requests: Sequence[Dict], max_concurrency: Optional[int] = None,
+                 timeout: Optional[float] = None) -> List[AIResult]:
+    """Synchronous shim: run many AI calls concurrently on the shared AI event loop.
+
+    Lets thread-based callers (batch reprocessing, periodic analysis) issue
+    N concurrent requests without N threads.
+
+    Args:
+        requests: Keyword-argument dicts for call_ai
+        max_concurrency: Optional cap on in-flight requests
+        timeout: Optional overall timeout in seconds
+
+    Returns:
+        AIResults in request order
+    """
+    return run_coroutine_sync(gather_ai_calls(requests, max_concurrency), timeout=timeout)
@@ -95,9 +95,11 @@ class RagProcessor(RagQueryMixin, RagResponseMixin, RagUIMixin, RagFeedbackMixin
         self.app = app
         self.is_processing = False
 
-        # Check for local RAG mode (Neon database)
+        # Check for local RAG mode (Neon database, or the embedded local index)
         self.neon_database_url = os.getenv("NEON_DATABASE_URL")
-        self.use_local_rag = bool(self.neon_database_url)
+        from rag.local_vector_store import get_vector_backend
+        self.uses_local_index = get_vector_backend() == "local"
+        self.use_local_rag = bool(self.neon_database_url) or self.uses_local_index
         self._hybrid_retriever = None
         self._streaming_retriever = None
 
@@ -106,7 +108,9 @@ class RagProcessor(RagQueryMixin, RagResponseMixin, RagUIMixin, RagFeedbackMixin
         self._use_streaming = True  # Enable streaming by default for local RAG
 
         # Log RAG mode configuration for debugging
-        if self.use_local_rag:
+        if self.uses_local_index:
+            logger.info("Local RAG mode enabled (embedded vector index)")
+        elif self.use_local_rag:
             # Mask the URL for security (hide credentials)
             try:
                 import urllib.parse
@@ -266,6 +270,12 @@ class RagProcessor(RagQueryMixin, RagResponseMixin, RagUIMixin, RagFeedbackMixin
 
         return False
 
+    @staticmethod
+    def is_configured() -> bool:
+        """Check whether local RAG is configured, without building a processor."""
+        from rag.local_vector_store import get_vector_backend
+        return bool(os.getenv("NEON_DATABASE_URL")) or get_vector_backend() == "local"
+
     def get_rag_mode(self) -> str:
         """Get current RAG mode.
 
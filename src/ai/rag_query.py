@@ -292,6 +292,7 @@ class RagQueryMixin:
                 top_k=5,
                 use_graph_search=True,
                 similarity_threshold=0.3,  # Lower threshold - scores typically 0.3-0.6
+                is_followup=is_followup,
             )
 
             response = retriever.search(request)
@@ -0,0 +1,448 @@
+"""
+Shared LLM Response Cache
+
+Process-wide cache for AI responses used by agents (``BaseAgent._call_ai_cached``)
+and any other caller that wants to avoid repeating identical LLM requests.
+
+Features:
+- O(1) per-namespace LRU eviction with a uniform TTL (expired entries dropped lazily)
+- Single-flight coalescing: concurrent identical requests share one API call
+- Optional on-disk SQLite persistence so responses survive restarts; values
+  are encrypted at rest with the installation's key storage cipher
+- Per-namespace (per-agent) hit/miss/coalesced counts and latency saved
+
+Usage:
+    from ai.response_cache import get_response_cache
+
+    cache = get_response_cache()
+    text = cache.get_or_compute(key, lambda: call_ai(...), namespace="diagnostic")
+"""
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Optional, Protocol
+
+from utils.structured_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Defaults (overridable through the "agent_response_cache" settings block)
+DEFAULT_CACHE_TTL_SECONDS = 300
+DEFAULT_MAX_ENTRIES = 50  # per namespace
+DEFAULT_MAX_DISK_ENTRIES = 5000
+DISK_PRUNE_INTERVAL = 100  # persisted writes between disk prunes
+
+
+class CipherProtocol(Protocol):
+    """Minimal interface for encrypting cached values at rest."""
+
+    def encrypt_data(self, data: bytes) -> bytes: ...
+
+    def decrypt_data(self, token: bytes) -> bytes: ...
+
+
+@dataclass
+class _CacheEntry:
+    """A cached response and the cost of producing it."""
+    value: str
+    created_at: float
+    compute_seconds: float = 0.0
+
+
+@dataclass
+class _InFlight:
+    """A request currently being computed by a leader thread."""
+    event: threading.Event = field(default_factory=threading.Event)
+    value: Optional[str] = None
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class CacheMetrics:
+    """Counters for one cache namespace."""
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    disk_hits: int = 0
+    evictions: int = 0
+    latency_saved_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "disk_hits": self.disk_hits,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "latency_saved_seconds": round(self.latency_saved_seconds, 3),
+        }
+
+
+class _DiskStore:
+    """SQLite persistence for cached responses (values encrypted at rest)."""
+
+    def __init__(self, db_path: Path, cipher: Optional[CipherProtocol], max_entries: int):
+        self._db_path = str(db_path)
+        self._cipher = cipher
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._db_path, timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS response_cache (
+                cache_key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                compute_seconds REAL NOT NULL DEFAULT 0
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_response_cache_created ON response_cache(created_at)"
+        )
+        self._conn.commit()
+
+    def _encode(self, value: str) -> bytes:
+        data = value.encode("utf-8")
+        return self._cipher.encrypt_data(data) if self._cipher else data
+
+    def _decode(self, blob: bytes) -> str:
+        data = self._cipher.decrypt_data(bytes(blob)) if self._cipher else bytes(blob)
+        return data.decode("utf-8")
+
+    def get(self, cache_key: str, min_created_at: float) -> Optional[_CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at, compute_seconds FROM response_cache "
+                "WHERE cache_key = ? AND created_at >= ?",
+                (cache_key, min_created_at)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return _CacheEntry(self._decode(row[0]), row[1], row[2])
+        except Exception as e:
+            # Cipher changed (e.g. new master key) - treat as a miss
+            logger.debug(f"Discarding undecryptable cache entry: {e}")
+            self.delete(cache_key)
+            return None
+
+    def put(self, cache_key: str, entry: _CacheEntry) -> None:
+        blob = self._encode(entry.value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO response_cache "
+                "(cache_key, value, created_at, compute_seconds) VALUES (?, ?, ?, ?)",
+                (cache_key, blob, entry.created_at, entry.compute_seconds)
+            )
+            self._conn.commit()
+
+    def delete(self, cache_key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM response_cache WHERE cache_key = ?", (cache_key,))
+            self._conn.commit()
+
+    def delete_prefix(self, prefix: Optional[str]) -> None:
+        with self._lock:
+            if prefix is None:
+                self._conn.execute("DELETE FROM response_cache")
+            else:
+                self._conn.execute(
+                    "DELETE FROM response_cache WHERE substr(cache_key, 1, ?) = ?",
+                    (len(prefix), prefix)
+                )
+            self._conn.commit()
+
+    def prune(self, min_created_at: float) -> None:
+        """Drop expired rows and keep at most max_entries newest rows."""
+        with self._lock:
+            self._conn.execute("DELETE FROM response_cache WHERE created_at < ?", (min_created_at,))
+            self._conn.execute(
+                "DELETE FROM response_cache WHERE cache_key IN ("
+                "SELECT cache_key FROM response_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,)
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """Thread-safe LRU+TTL response cache with single-flight deduplication."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        persist_path: Optional[Path] = None,
+        cipher: Optional[CipherProtocol] = None,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum in-memory entries per namespace
+            ttl_seconds: Entry lifetime in seconds
+            persist_path: Optional SQLite file for persistence across restarts
+            cipher: Cipher used to encrypt persisted values (plaintext if None)
+            max_disk_entries: Maximum rows kept in the persistent store
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, "OrderedDict[str, _CacheEntry]"] = {}
+        self._in_flight: Dict[str, _InFlight] = {}
+        self._metrics: Dict[str, CacheMetrics] = {}
+        self._lock = threading.Lock()
+
+        self._disk: Optional[_DiskStore] = None
+        self._disk_puts_since_prune = 0
+        if persist_path is not None:
+            try:
+                Path(persist_path).parent.mkdir(parents=True, exist_ok=True)
+                self._disk = _DiskStore(Path(persist_path), cipher, max_disk_entries)
+                self._disk.prune(time.time() - self.ttl_seconds)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Response cache persistence unavailable: {e}")
+                self._disk = None
+
+    @staticmethod
+    def _full_key(key: str, namespace: str) -> str:
+        return f"{namespace}:{key}"
+
+    def _namespace_metrics(self, namespace: str) -> CacheMetrics:
+        metrics = self._metrics.get(namespace)
+        if metrics is None:
+            metrics = self._metrics[namespace] = CacheMetrics()
+        return metrics
+
+    def _lookup_locked(self, key: str, namespace: str, now: float) -> Optional[_CacheEntry]:
+        """Return a live in-memory entry, dropping it if expired. Caller holds the lock."""
+        bucket = self._entries.get(namespace)
+        entry = bucket.get(key) if bucket is not None else None
+        if entry is None:
+            return None
+        if now - entry.created_at >= self.ttl_seconds:
+            del bucket[key]
+            return None
+        bucket.move_to_end(key)
+        return entry
+
+    def _store_locked(self, key: str, entry: _CacheEntry, namespace: str) -> None:
+        """Insert an entry and evict LRU entries over capacity. Caller holds the lock."""
+        bucket = self._entries.get(namespace)
+        if bucket is None:
+            bucket = self._entries[namespace] = OrderedDict()
+        bucket[key] = entry
+        bucket.move_to_end(key)
+        while len(bucket) > self.max_entries:
+            bucket.popitem(last=False)
+            self._namespace_metrics(namespace).evictions += 1
+
+    def get(self, key: str, namespace: str = "default") -> Optional[str]:
+        """Return a cached response, or None if absent or expired.
+
+        Args:
+            key: Cache key (typically a hash of prompt and parameters)
+            namespace: Namespace (agent name) the key belongs to
+        """
+        now = time.time()
+        with self._lock:
+            metrics = self._namespace_metrics(namespace)
+            entry = self._lookup_locked(key, namespace, now)
+            if entry is not None:
+                metrics.hits += 1
+                metrics.latency_saved_seconds += entry.compute_seconds
+                return entry.value
+
+        if self._disk is not None:
+            entry = self._disk.get(self._full_key(key, namespace), now - self.ttl_seconds)
+            if entry is not None:
+                with self._lock:
+                    self._store_locked(key, entry, namespace)
+                    metrics.hits += 1
+                    metrics.disk_hits += 1
+                    metrics.latency_saved_seconds += entry.compute_seconds
+                return entry.value
+
+        with self._lock:
+            metrics.misses += 1
+        return None
+
+    def put(self, key: str, value: str, namespace: str = "default",
+            compute_seconds: float = 0.0) -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key
+            value: Response text
+            namespace: Namespace (agent name) the key belongs to
+            compute_seconds: How long the response took to produce (for metrics)
+        """
+        entry = _CacheEntry(value, time.time(), compute_seconds)
+        with self._lock:
+            self._store_locked(key, entry, namespace)
+        if self._disk is not None:
+            try:
+                self._disk.put(self._full_key(key, namespace), entry)
+                self._maybe_prune_disk(entry.created_at)
+            except sqlite3.Error as e:
+                logger.debug(f"Failed to persist cached response: {e}")
+
+    def _maybe_prune_disk(self, now: float) -> None:
+        """Prune the persistent store every DISK_PRUNE_INTERVAL writes.
+
+        Keeps a long-running process from growing the table past
+        max_disk_entries or holding expired rows until the next restart.
+        """
+        with self._lock:
+            self._disk_puts_since_prune += 1
+            if self._disk_puts_since_prune < DISK_PRUNE_INTERVAL:
+                return
+            self._disk_puts_since_prune = 0
+        self._disk.prune(now - self.ttl_seconds)
+
+    def get_or_compute(self, key: str, compute: Callable[[], str],
+                       namespace: str = "default") -> str:
+        """Return a cached response or compute it exactly once.
+
+        If another thread is already computing the same key, this call waits
+        for that result instead of issuing a duplicate request. Errors are
+        propagated to every waiter and nothing is cached.
+
+        Args:
+            key: Cache key
+            compute: Callable producing the response on a miss
+            namespace: Namespace (agent name) the key belongs to
+
+        Returns:
+            Response text
+        """
+        cached = self.get(key, namespace)
+        if cached is not None:
+            return cached
+
+        full_key = self._full_key(key, namespace)
+        with self._lock:
+            flight = self._in_flight.get(full_key)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[full_key] = _InFlight()
+            else:
+                self._namespace_metrics(namespace).coalesced += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        start = time.perf_counter()
+        try:
+            value = compute()
+            flight.value = value
+            if value:
+                self.put(key, value, namespace, compute_seconds=time.perf_counter() - start)
+            return value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(full_key, None)
+            flight.event.set()
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """Remove cached responses for a namespace, or everything if None."""
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(namespace, None)
+        if self._disk is not None:
+            self._disk.delete_prefix(None if namespace is None else f"{namespace}:")
+
+    def size(self, namespace: Optional[str] = None) -> int:
+        """Number of in-memory entries, optionally limited to a namespace."""
+        with self._lock:
+            if namespace is None:
+                return sum(len(bucket) for bucket in self._entries.values())
+            return len(self._entries.get(namespace, ()))
+
+    def get_metrics(self, namespace: Optional[str] = None) -> Dict:
+        """Return metrics for one namespace, or a dict of all namespaces."""
+        with self._lock:
+            if namespace is not None:
+                return self._namespace_metrics(namespace).to_dict()
+            return {ns: m.to_dict() for ns, m in self._metrics.items()}
+
+    def close(self) -> None:
+        """Close the persistent store, if any."""
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+
+# Global instance with thread-safe initialization
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def _create_from_settings() -> ResponseCache:
+    """Build the shared cache from the "agent_response_cache" settings block."""
+    try:
+        from settings.settings_manager import settings_manager
+        cache_settings = settings_manager.get("agent_response_cache", {}) or {}
+    except Exception:
+        cache_settings = {}
+
+    persist_path = None
+    cipher = None
+    if cache_settings.get("persist_to_disk", False):
+        try:
+            from managers.data_folder_manager import data_folder_manager
+            from utils.security import get_security_manager
+            persist_path = data_folder_manager.data_folder / "response_cache.db"
+            cipher = get_security_manager().key_storage
+        except Exception as e:
+            logger.warning(f"Response cache persistence disabled: {e}")
+            persist_path = None
+
+    return ResponseCache(
+        max_entries=cache_settings.get("max_entries", DEFAULT_MAX_ENTRIES),
+        ttl_seconds=cache_settings.get("ttl_seconds", DEFAULT_CACHE_TTL_SECONDS),
+        persist_path=persist_path,
+        cipher=cipher,
+    )
+
+
+def get_response_cache() -> ResponseCache:
+    """Get or create the process-wide ResponseCache.
+
+    Thread-safe implementation using double-checked locking pattern.
+
+    Returns:
+        ResponseCache instance
+    """
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = _create_from_settings()
+    return _response_cache
+
+
+def reset_response_cache() -> None:
+    """Discard the global cache (used by tests and on settings changes)."""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is not None:
+            _response_cache.close()
+        _response_cache = None
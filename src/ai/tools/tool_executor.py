@@ -27,22 +27,48 @@ class ToolExecutor:
             confirm_callback: Optional callback for user confirmation
         """
         self.confirm_callback = confirm_callback
-        self._executor = ThreadPoolExecutor(max_workers=3)
         self._execution_history = []
+        self._history_lock = threading.Lock()
+        # Only one confirmation prompt at a time when tools run concurrently
+        self._confirm_lock = threading.Lock()
         
         # Load settings
         self.timeout_seconds = settings_manager.get_nested("tool_execution.timeout_seconds", 30)
+        self.tool_timeouts = settings_manager.get_nested("tool_execution.tool_timeouts", {}) or {}
         self.require_confirmation = settings_manager.get_nested("tool_execution.require_confirmation", True)
         self.log_executions = settings_manager.get_nested("tool_execution.log_executions", True)
         self.max_retries = settings_manager.get_nested("tool_execution.max_retries", 2)
+        self.max_parallel_tools = settings_manager.get_nested("tool_execution.max_parallel_tools", 4)
+
+        # Sized so every concurrently running tool call gets its own worker
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(3, self.max_parallel_tools),
+            thread_name_prefix="tool_exec"
+        )
+
+    def get_timeout(self, tool_name: str) -> float:
+        """Get the timeout for a tool, honouring per-tool overrides.
+
+        Args:
+            tool_name: Name of the tool
+
+        Returns:
+            Timeout in seconds
+        """
+        return self.tool_timeouts.get(tool_name, self.timeout_seconds)
         
-    def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> ToolResult:
+    def execute_tool(self, tool_name: str, arguments: Dict[str, Any],
+                     batch_id: Optional[str] = None) -> ToolResult:
         """
         Execute a tool with the given arguments.
+
+        Safe to call from several threads at once; ChatAgent does so to run
+        independent tool calls from one model response in parallel.
         
         Args:
             tool_name: Name of the tool to execute
             arguments: Arguments to pass to the tool
+            batch_id: Optional identifier of the parallel batch this call belongs to
             
         Returns:
             ToolResult from the tool execution
@@ -64,14 +90,16 @@ class ToolExecutor:
             
         try:
             # Execute the tool once
-            result = self._execute_with_timeout(tool, arguments)
+            result = self._execute_with_timeout(tool, arguments, self.get_timeout(tool_name))
 
             # If the tool signals it needs confirmation, ask the user
             # before re-executing (the first call returned early without
             # performing the destructive action).
             if result.requires_confirmation and self.require_confirmation and self.confirm_callback:
                 message = result.confirmation_message or f"Tool '{tool_name}' requires confirmation to proceed."
-                if not self.confirm_callback(message):
+                with self._confirm_lock:
+                    confirmed = self.confirm_callback(message)
+                if not confirmed:
                     return ToolResult(
                         success=False,
                         output=None,
@@ -80,11 +108,11 @@ class ToolExecutor:
                 # User confirmed — re-execute to perform the actual operation.
                 # Tools that return requires_confirmation=True must NOT perform
                 # the action on that first call (they return early as a gate).
-                result = self._execute_with_timeout(tool, arguments)
+                result = self._execute_with_timeout(tool, arguments, self.get_timeout(tool_name))
 
             # Record execution
             execution_time = time.time() - start_time
-            self._record_execution(tool_name, arguments, result, execution_time)
+            self._record_execution(tool_name, arguments, result, execution_time, batch_id)
 
             return result
             
@@ -96,18 +124,21 @@ class ToolExecutor:
                 error=f"Execution failed: {str(e)}"
             )
             
-    def _execute_with_timeout(self, tool, arguments: Dict[str, Any]) -> ToolResult:
+    def _execute_with_timeout(self, tool, arguments: Dict[str, Any],
+                              timeout: Optional[float] = None) -> ToolResult:
         """Execute a tool with timeout protection."""
+        if timeout is None:
+            timeout = self.timeout_seconds
         future = self._executor.submit(tool.safe_execute, **arguments)
         
         try:
-            return future.result(timeout=self.timeout_seconds)
+            return future.result(timeout=timeout)
         except TimeoutError:
             future.cancel()
             return ToolResult(
                 success=False,
                 output=None,
-                error=f"Tool execution timed out after {self.timeout_seconds} seconds"
+                error=f"Tool execution timed out after {timeout} seconds"
             )
         except Exception as e:
             return ToolResult(
@@ -117,7 +148,8 @@ class ToolExecutor:
             )
             
     def _record_execution(self, tool_name: str, arguments: Dict[str, Any], 
-                         result: ToolResult, execution_time: float):
+                         result: ToolResult, execution_time: float,
+                         batch_id: Optional[str] = None):
         """Record tool execution for history and debugging."""
         record = {
             'tool_name': tool_name,
@@ -125,22 +157,26 @@ class ToolExecutor:
             'success': result.success,
             'execution_time': execution_time,
             'timestamp': time.time(),
-            'error': result.error
+            'error': result.error,
+            'batch_id': batch_id
         }
         
-        self._execution_history.append(record)
-        
-        # Keep only recent history (last 100 executions)
-        if len(self._execution_history) > 100:
-            self._execution_history = self._execution_history[-100:]
+        with self._history_lock:
+            self._execution_history.append(record)
+
+            # Keep only recent history (last 100 executions)
+            if len(self._execution_history) > 100:
+                self._execution_history = self._execution_history[-100:]
             
     def get_execution_history(self) -> list:
         """Get the tool execution history."""
-        return self._execution_history.copy()
+        with self._history_lock:
+            return self._execution_history.copy()
         
     def clear_history(self):
         """Clear the execution history."""
-        self._execution_history.clear()
+        with self._history_lock:
+            self._execution_history.clear()
         
     def shutdown(self):
         """Shutdown the executor."""
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
 from settings.settings_manager import settings_manager
 from managers.vocabulary_manager import vocabulary_manager
 from utils.structured_logging import get_logger
+from utils.tracing import get_tracer
 from utils.constants import (
     STT_ELEVENLABS, STT_DEEPGRAM, STT_GROQ, STT_WHISPER, STT_MODULATE,
 )
@@ -186,22 +187,31 @@ class TranscriptionMixin:
         Returns:
             Transcription text or empty string if failed
         """
-        try:
-            if provider == STT_ELEVENLABS:
-                return self.elevenlabs_provider.transcribe(segment, **kwargs)
-            elif provider == STT_DEEPGRAM:
-                return self.deepgram_provider.transcribe(segment)
-            elif provider == STT_GROQ:
-                return self.groq_provider.transcribe(segment)
-            elif provider == STT_WHISPER:
-                return self.whisper_provider.transcribe(segment)
-            elif provider == STT_MODULATE:
-                return self.modulate_provider.transcribe(segment, **kwargs)
-            else:
-                logger.warning(f"Unknown provider: {provider}")
+        with get_tracer().span("stt", provider=provider) as span:
+            try:
+                text = self._call_stt_provider(segment, provider, **kwargs)
+            except Exception as e:
+                logger.error(f"Error with {provider} transcription: {str(e)}", exc_info=True)
+                span.set_error(e)
                 return ""
-        except Exception as e:
-            logger.error(f"Error with {provider} transcription: {str(e)}", exc_info=True)
+            if not text:
+                span.set_error("Empty transcription")
+            return text
+
+    def _call_stt_provider(self, segment: AudioSegment, provider: str, **kwargs) -> str:
+        """Dispatch a transcription to the named provider."""
+        if provider == STT_ELEVENLABS:
+            return self.elevenlabs_provider.transcribe(segment, **kwargs)
+        elif provider == STT_DEEPGRAM:
+            return self.deepgram_provider.transcribe(segment)
+        elif provider == STT_GROQ:
+            return self.groq_provider.transcribe(segment)
+        elif provider == STT_WHISPER:
+            return self.whisper_provider.transcribe(segment)
+        elif provider == STT_MODULATE:
+            return self.modulate_provider.transcribe(segment, **kwargs)
+        else:
+            logger.warning(f"Unknown provider: {provider}")
             return ""
 
 
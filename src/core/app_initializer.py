@@ -18,7 +18,6 @@ from tkinter.constants import DISABLED
 import ttkbootstrap as ttk
 
 from settings.settings_manager import settings_manager
-from ui.dialogs.unified_settings_dialog import show_unified_settings_dialog
 from utils.constants import (
     PROVIDER_OPENAI, PROVIDER_ANTHROPIC, PROVIDER_GEMINI,
     STT_DEEPGRAM, STT_ELEVENLABS, STT_GROQ, STT_MODULATE,
@@ -28,17 +27,12 @@ from processing.text_processor import TextProcessor
 from ui.workflow_ui import WorkflowUI
 from ui.chat_ui import ChatUI
 from ai.chat_processor import ChatProcessor
-from ai.rag_processor import RagProcessor
-from managers.rag_document_manager import get_rag_document_manager
 from ui.status_manager import StatusManager
 from audio.recording_manager import RecordingManager
 from audio.audio_state_manager import AudioStateManager
 from ai.ai_processor import AIProcessor
 from managers.file_manager import FileManager
 from database.db_manager import DatabaseManager
-from ui.dialogs.recordings_dialog_manager import RecordingsDialogManager
-from ui.dialogs.audio_dialogs import AudioDialogManager
-from ui.dialogs.folder_dialogs import FolderDialogManager
 from ui.theme_manager import ThemeManager
 from ui.theme_observer import ThemeObserver
 from processing.document_generators import DocumentGenerators
@@ -57,6 +51,8 @@ from core.controllers.persistence_controller import PersistenceController
 from core.controllers.processing_controller import ProcessingController
 from core.controllers.recording_controller import RecordingController
 from utils.security import get_security_manager
+from utils.lazy_loader import LazyComponent
+from utils.startup_profiler import get_startup_profiler
 
 
 class AppInitializer:
@@ -71,18 +67,28 @@ class AppInitializer:
         self.app = app_instance
         
     def initialize_application(self):
-        """Initialize the complete application."""
-        self._setup_executors()
-        self._configure_window()
-        self._setup_api_keys()
-        self._initialize_audio_handler()
-        self._initialize_variables()
-        self._initialize_database()
-        self._create_ui()
-        self._initialize_managers()
-        self._finalize_ui()  # Phase 2: UI setup that requires controllers
-        self._setup_api_dependent_features()
-        self._finalize_setup()
+        """Initialize the complete application.
+
+        Each phase is timed by the startup profiler; the report is logged
+        once the first frame has been drawn.
+        """
+        phases = (
+            self._setup_executors,
+            self._configure_window,
+            self._setup_api_keys,
+            self._initialize_audio_handler,
+            self._initialize_variables,
+            self._initialize_database,
+            self._create_ui,
+            self._initialize_managers,
+            self._finalize_ui,  # Phase 2: UI setup that requires controllers
+            self._setup_api_dependent_features,
+            self._finalize_setup,
+        )
+        profiler = get_startup_profiler()
+        for phase in phases:
+            with profiler.measure(phase.__name__.lstrip("_")):
+                phase()
         
     def _setup_executors(self):
         """Set up thread executors for concurrent operations."""
@@ -329,6 +335,7 @@ class AppInitializer:
                 "Please configure your API keys."
             )
             # Open the unified settings dialog on the API Keys tab
+            from ui.dialogs.unified_settings_dialog import show_unified_settings_dialog
             result = show_unified_settings_dialog(self.app, initial_tab="API Keys")
             if result:
                 # Update the keys after dialog closes (re-check encrypted storage)
@@ -488,18 +495,15 @@ class AppInitializer:
         self.app.ai_processor = AIProcessor()  # Uses security manager internally
         self.app.file_manager = FileManager(settings_manager.get("default_folder", ""))
         self.app.db_manager = DatabaseManager()
-        self.app.recordings_dialog_manager = RecordingsDialogManager(self.app)
-        self.app.audio_dialog_manager = AudioDialogManager(self.app)
-        self.app.folder_dialog_manager = FolderDialogManager(self.app)
+        self._initialize_dialog_managers()
         self.app.theme_manager = ThemeManager(self.app)
         self.app.document_generators = DocumentGenerators(self.app)
         self.app.soap_processor = SOAPProcessor(self.app)
         self.app.soap_audio_processor = SOAPAudioProcessor(self.app)
         self.app.file_processor = FileProcessor(self.app)
         self.app.chat_processor = ChatProcessor(self.app)
-        self.app.rag_processor = RagProcessor(self.app)
 
-        # Initialize RAG document manager (lazy initialization)
+        # RAG components are imported and built on first use
         self._initialize_rag_system()
 
         # Initialize clinical guidelines system (background refresh)
@@ -636,39 +640,46 @@ class AppInitializer:
         # Initialize periodic analyzer
         self.app.periodic_analyzer = None  # Will be created when needed
 
+    def _initialize_dialog_managers(self):
+        """Register the dialog managers, each built the first time it is used."""
+        def recordings_dialog_manager():
+            from ui.dialogs.recordings_dialog_manager import RecordingsDialogManager
+            return RecordingsDialogManager(self.app)
+
+        def audio_dialog_manager():
+            from ui.dialogs.audio_dialogs import AudioDialogManager
+            return AudioDialogManager(self.app)
+
+        def folder_dialog_manager():
+            from ui.dialogs.folder_dialogs import FolderDialogManager
+            return FolderDialogManager(self.app)
+
+        self.app.recordings_dialog_manager = LazyComponent("recordings_dialog_manager", recordings_dialog_manager)
+        self.app.audio_dialog_manager = LazyComponent("audio_dialog_manager", audio_dialog_manager)
+        self.app.folder_dialog_manager = LazyComponent("folder_dialog_manager", folder_dialog_manager)
+
     def _initialize_rag_system(self):
         """Initialize the RAG document management system.
 
-        This sets up the RAG document manager and logs system status.
-        The actual connections (Neon, embeddings) are lazily initialized
-        when first needed to avoid slowing down app startup.
+        The RAG processor and document manager are imported and built on
+        first use. The status check and, when RAG is configured, the
+        remote sync run in a background thread so they never delay the
+        first frame.
         """
-        try:
-            # Get the RAG document manager singleton
-            self.app.rag_document_manager = get_rag_document_manager()
+        def rag_processor():
+            from ai.rag_processor import RagProcessor
+            return RagProcessor(self.app)
 
-            # Check if RAG is configured
-            rag_mode = self.app.rag_processor.get_rag_mode()
-            if rag_mode == "local":
-                logger.info("RAG system initialized in local mode (Neon pgvector)")
-                # Get document count for status
-                try:
-                    doc_count = self.app.rag_document_manager.get_document_count()
-                    logger.info(f"RAG document library contains {doc_count} documents")
-                except Exception as e:
-                    logger.debug(f"Could not get document count: {e}")
-
-                # Background sync from remote Neon store
-                self._sync_rag_documents_background()
-            else:
-                logger.info("RAG system not configured (NEON_DATABASE_URL not set)")
+        def rag_document_manager():
+            from managers.rag_document_manager import get_rag_document_manager
+            return get_rag_document_manager()
 
-        except Exception as e:
-            logger.warning(f"RAG system initialization warning: {e}")
-            self.app.rag_document_manager = None
+        self.app.rag_processor = LazyComponent("rag_processor", rag_processor)
+        self.app.rag_document_manager = LazyComponent("rag_document_manager", rag_document_manager)
+        self._sync_rag_documents_background()
 
     def _sync_rag_documents_background(self):
-        """Sync RAG documents from remote Neon store in a background thread.
+        """Check RAG status and sync documents from remote Neon in a background thread.
 
         Non-blocking - failures are logged but don't prevent startup.
         """
@@ -676,8 +687,29 @@ class AppInitializer:
 
         def _sync():
             try:
-                manager = get_rag_document_manager()
-                synced = manager.sync_from_remote()
+                from ai.rag_processor import RagProcessor
+                if not RagProcessor.is_configured():
+                    logger.info("RAG system not configured (NEON_DATABASE_URL not set)")
+                    return
+                logger.info("RAG system initialized in local mode (Neon pgvector)")
+                # Get document count for status
+                try:
+                    doc_count = self.app.rag_document_manager.get_document_count()
+                    logger.info(f"RAG document library contains {doc_count} documents")
+                except Exception as e:
+                    logger.debug(f"Could not get document count: {e}")
+            except Exception as e:
+                logger.warning(f"RAG system initialization warning: {e}")
+                return
+            try:
+                # Mirror Neon into the local vector index first (no-op unless
+                # the local backend is selected) so the library sees its documents
+                from rag.local_index_sync import sync_local_index
+                sync_local_index()
+            except Exception as e:
+                logger.debug(f"Background local index sync failed (non-critical): {e}")
+            try:
+                synced = self.app.rag_document_manager.sync_from_remote()
                 if synced > 0:
                     logger.info(f"Background sync: added {synced} remote document(s) to local library")
             except Exception as e:
@@ -785,6 +817,37 @@ class AppInitializer:
         # first launch and re-activation
         self.app._macos_fully_initialized = True
         logger.debug("macOS initialization flag set to True")
+
+        # Open (or start rebuilding) the terminology index off the UI thread
+        # so the first code lookup does not pay for it
+        self._warm_terminology_index_background()
+
+        # The first idle callback runs once the window has been drawn
+        self.app.after_idle(self._on_first_frame)
+
+    def _warm_terminology_index_background(self):
+        """Open the ICD-10-CM / RxNorm terminology index in a background thread.
+
+        A missing or outdated index is rebuilt on its own thread; lookups
+        fall back to the built-in dictionaries until it is ready.
+        """
+        import threading
+
+        def _warm():
+            try:
+                from utils.terminology_index import get_terminology_index
+                get_terminology_index()
+            except Exception as e:
+                logger.debug(f"Terminology index warm-up failed (non-critical): {e}")
+
+        thread = threading.Thread(target=_warm, daemon=True, name="terminology-warmup")
+        thread.start()
+
+    def _on_first_frame(self):
+        """Record time to the first interactive frame and log the startup report."""
+        profiler = get_startup_profiler()
+        profiler.mark_interactive()
+        logger.info(profiler.report())
     
     def _on_queue_status_update(self, task_id: str, status: str, queue_size: int):
         """Handle queue status updates.
@@ -13,6 +13,7 @@ from ui.dialogs.dialogs import (
     show_about_dialog,
     show_shortcuts_dialog,
     show_letter_options_dialog,
+    show_pipeline_timing_dialog,
 )
 from ui.dialogs.unified_settings_dialog import (
     show_unified_settings_dialog,
@@ -82,6 +83,10 @@ class AppDialogMixin:
         """Show the keyboard shortcuts dialog."""
         show_shortcuts_dialog(self)
 
+    def show_pipeline_timing(self) -> None:
+        """Show per-stage pipeline latency and trace export."""
+        show_pipeline_timing_dialog(self)
+
     def show_letter_options_dialog(self) -> Optional[Tuple]:
         """Show the letter options dialog."""
         return show_letter_options_dialog(self)
@@ -299,6 +299,38 @@ class DatabaseManager:
             logger.error(f"Failed to search recordings: {e}")
             return []
 
+    def search_recordings_ranked(
+        self,
+        query: str,
+        limit: int = 50,
+        cursor: Optional[Tuple[float, int]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        patient_name: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Relevance-ranked search with highlighted snippets.
+
+        Args:
+            query: Search query; "quoted text" matches as a phrase
+            limit: Maximum results per page
+            cursor: next_cursor from the previous page
+            start_date: Optional ISO date lower bound
+            end_date: Optional ISO date upper bound (inclusive)
+            patient_name: Optional patient filter
+
+        Returns:
+            Dictionary with "results" and "next_cursor" (None on the last page)
+        """
+        try:
+            return self._db.search_recordings_ranked(
+                query, limit=limit, cursor=cursor, start_date=start_date,
+                end_date=end_date, patient_name=patient_name
+            )
+
+        except sqlite3.Error as e:
+            logger.error(f"Failed to search recordings: {e}")
+            return {"results": [], "next_cursor": None}
+
     def get_statistics(self) -> Dict[str, Any]:
         """Get database statistics using a single efficient query.
 
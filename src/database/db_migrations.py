@@ -150,6 +150,8 @@ class MigrationManager:
             # Special handling for migration 12 - conditionally add patient_name column
             if migration.version == 12:
                 self._apply_migration_12(conn)
+            elif migration.version == 19:
+                self._apply_migration_19(conn, migration)
             else:
                 # Execute migration SQL
                 if ";" in migration.up_sql:
@@ -192,6 +194,34 @@ class MigrationManager:
             "CREATE INDEX IF NOT EXISTS idx_recordings_timestamp_desc ON recordings(timestamp DESC)"
         )
     
+    def _apply_migration_19(self, conn, migration: Migration):
+        """Apply migration 19 with conditional column additions.
+
+        Adds the has_transcript/has_soap/has_referral/has_letter columns (and
+        duration and processing_status, which the queue schema normally adds
+        after migrations on a fresh install) before running the backfill and
+        covering index SQL.
+
+        Args:
+            conn: Database connection within transaction
+            migration: Migration 19, whose up_sql backfills and indexes
+        """
+        cursor = conn.execute("PRAGMA table_info(recordings)")
+        columns = {row[1] for row in cursor.fetchall()}
+
+        if 'duration' not in columns:
+            conn.execute("ALTER TABLE recordings ADD COLUMN duration REAL")
+        if 'processing_status' not in columns:
+            # Same definition as the queue schema, which then skips the column
+            conn.execute("ALTER TABLE recordings ADD COLUMN processing_status TEXT DEFAULT 'pending'")
+
+        for flag in ('has_transcript', 'has_soap', 'has_referral', 'has_letter'):
+            if flag not in columns:
+                self.logger.info(f"Adding {flag} column to recordings table")
+                conn.execute(f"ALTER TABLE recordings ADD COLUMN {flag} INTEGER NOT NULL DEFAULT 0")
+
+        conn.executescript(migration.up_sql)
+
     def rollback(self, target_version: int = 0) -> int:
         """Rollback migrations to target version.
         
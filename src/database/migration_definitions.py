@@ -1112,4 +1112,180 @@ def get_all_migrations() -> List[Migration]:
         """
     ))
 
+    # Migration 18: Rebuild recordings FTS for ranked search
+    # Adds filename/patient_name to the index so search never falls back to a
+    # table scan, and replaces the UPDATE-based triggers with the 'delete'
+    # command external-content FTS5 tables require. The update trigger only
+    # fires for indexed columns, so status changes no longer touch the index.
+    migrations.append(Migration(
+        version=18,
+        name="Ranked recording search index",
+        up_sql="""
+        DROP TRIGGER IF EXISTS recordings_ai;
+        DROP TRIGGER IF EXISTS recordings_ad;
+        DROP TRIGGER IF EXISTS recordings_au;
+        DROP TABLE IF EXISTS recordings_fts;
+
+        CREATE VIRTUAL TABLE IF NOT EXISTS recordings_fts USING fts5(
+            filename,
+            patient_name,
+            transcript,
+            soap_note,
+            referral,
+            letter,
+            chat,
+            content=recordings,
+            content_rowid=id,
+            tokenize='unicode61 remove_diacritics 2'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS recordings_ai AFTER INSERT ON recordings BEGIN
+            INSERT INTO recordings_fts(rowid, filename, patient_name, transcript, soap_note, referral, letter, chat)
+            VALUES (new.id, new.filename, new.patient_name, new.transcript, new.soap_note, new.referral, new.letter, new.chat);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS recordings_ad AFTER DELETE ON recordings BEGIN
+            INSERT INTO recordings_fts(recordings_fts, rowid, filename, patient_name, transcript, soap_note, referral, letter, chat)
+            VALUES ('delete', old.id, old.filename, old.patient_name, old.transcript, old.soap_note, old.referral, old.letter, old.chat);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS recordings_au
+        AFTER UPDATE OF filename, patient_name, transcript, soap_note, referral, letter, chat ON recordings BEGIN
+            INSERT INTO recordings_fts(recordings_fts, rowid, filename, patient_name, transcript, soap_note, referral, letter, chat)
+            VALUES ('delete', old.id, old.filename, old.patient_name, old.transcript, old.soap_note, old.referral, old.letter, old.chat);
+            INSERT INTO recordings_fts(rowid, filename, patient_name, transcript, soap_note, referral, letter, chat)
+            VALUES (new.id, new.filename, new.patient_name, new.transcript, new.soap_note, new.referral, new.letter, new.chat);
+        END;
+
+        -- Populate from the content table
+        INSERT INTO recordings_fts(recordings_fts) VALUES ('rebuild');
+        """,
+        down_sql="""
+        DROP TRIGGER IF EXISTS recordings_ai;
+        DROP TRIGGER IF EXISTS recordings_ad;
+        DROP TRIGGER IF EXISTS recordings_au;
+        DROP TABLE IF EXISTS recordings_fts;
+
+        -- Restore the migration 6 index and triggers
+        CREATE VIRTUAL TABLE IF NOT EXISTS recordings_fts USING fts5(
+            transcript,
+            soap_note,
+            referral,
+            letter,
+            chat,
+            content=recordings,
+            content_rowid=id
+        );
+
+        CREATE TRIGGER IF NOT EXISTS recordings_ai AFTER INSERT ON recordings BEGIN
+            INSERT INTO recordings_fts(rowid, transcript, soap_note, referral, letter, chat)
+            VALUES (new.id, new.transcript, new.soap_note, new.referral, new.letter, new.chat);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS recordings_ad AFTER DELETE ON recordings BEGIN
+            DELETE FROM recordings_fts WHERE rowid = old.id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS recordings_au AFTER UPDATE ON recordings BEGIN
+            UPDATE recordings_fts
+            SET transcript = new.transcript,
+                soap_note = new.soap_note,
+                referral = new.referral,
+                letter = new.letter,
+                chat = new.chat
+            WHERE rowid = new.id;
+        END;
+
+        INSERT INTO recordings_fts(recordings_fts) VALUES ('rebuild');
+        """
+    ))
+
+    # Migration 19: Materialized document-presence flags and covering list index
+    # Columns are added conditionally (duration and processing_status may not
+    # exist yet on a fresh install), so this is handled specially in
+    # _apply_migration_19
+    migrations.append(Migration(
+        version=19,
+        name="Document-presence flags and covering list index",
+        up_sql="""
+        -- has_* columns (and duration, if missing) are added in _apply_migration_19
+
+        -- Backfill flags from the existing text
+        UPDATE recordings SET
+            has_transcript = (transcript IS NOT NULL AND transcript != ''),
+            has_soap = (soap_note IS NOT NULL AND soap_note != ''),
+            has_referral = (referral IS NOT NULL AND referral != ''),
+            has_letter = (letter IS NOT NULL AND letter != '');
+
+        -- Covers every column the recordings list reads
+        CREATE INDEX IF NOT EXISTS idx_recordings_list ON recordings(
+            timestamp, id, filename, patient_name, duration, processing_status,
+            has_transcript, has_soap, has_referral, has_letter
+        );
+        """,
+        down_sql="""
+        DROP INDEX IF EXISTS idx_recordings_list;
+
+        -- DROP COLUMN needs SQLite 3.35+ (bundled with Python 3.10+). duration
+        -- and processing_status are kept: the processing queue schema relies on them
+        ALTER TABLE recordings DROP COLUMN has_transcript;
+        ALTER TABLE recordings DROP COLUMN has_soap;
+        ALTER TABLE recordings DROP COLUMN has_referral;
+        ALTER TABLE recordings DROP COLUMN has_letter;
+        """
+    ))
+
+    # Migration 20: Flag counts in feedback aggregates
+    # Boost lookups read a single aggregates row per chunk instead of also
+    # counting flags in rag_result_feedback
+    migrations.append(Migration(
+        version=20,
+        name="Feedback flag counts in aggregates",
+        up_sql="""
+        ALTER TABLE rag_feedback_aggregates ADD COLUMN flag_count INTEGER DEFAULT 0;
+
+        UPDATE rag_feedback_aggregates SET flag_count = (
+            SELECT COUNT(*) FROM rag_result_feedback f
+            WHERE f.result_document_id = rag_feedback_aggregates.document_id
+              AND f.result_chunk_index = rag_feedback_aggregates.chunk_index
+              AND f.feedback_type = 'flag'
+        );
+
+        -- Per-chunk recount in _update_aggregates
+        CREATE INDEX IF NOT EXISTS idx_feedback_chunk
+            ON rag_result_feedback(result_document_id, result_chunk_index);
+        """,
+        down_sql="""
+        DROP INDEX IF EXISTS idx_feedback_chunk;
+
+        -- DROP COLUMN needs SQLite 3.35+ (bundled with Python 3.10+)
+        ALTER TABLE rag_feedback_aggregates DROP COLUMN flag_count;
+        """
+    ))
+
+    # Migration 21: Track imported drug-interaction datasets
+    migrations.append(Migration(
+        version=21,
+        name="Drug interaction dataset imports",
+        up_sql="""
+        ALTER TABLE drug_interactions ADD COLUMN source TEXT;
+
+        CREATE INDEX IF NOT EXISTS idx_interactions_source ON drug_interactions(source);
+
+        CREATE TABLE IF NOT EXISTS drug_interaction_imports (
+            source TEXT PRIMARY KEY,
+            fingerprint TEXT NOT NULL,
+            row_count INTEGER DEFAULT 0,
+            imported_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        );
+        """,
+        down_sql="""
+        DROP TABLE IF EXISTS drug_interaction_imports;
+        DROP INDEX IF EXISTS idx_interactions_source;
+
+        -- DROP COLUMN needs SQLite 3.35+ (bundled with Python 3.10+)
+        ALTER TABLE drug_interactions DROP COLUMN source;
+        """
+    ))
+
     return migrations
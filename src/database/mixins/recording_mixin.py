@@ -6,14 +6,15 @@ Provides recording CRUD operations for the Database class.
 
 import datetime
 import json
-from typing import Optional, Dict, List, Any, Union, Generator
+import re
+from typing import Optional, Dict, List, Any, Union, Generator, Tuple
 
 from utils.retry_decorator import db_retry
 from database.schema import (
     RecordingSchema,
-    RECORDING_FIELDS, RECORDING_INSERT_FIELDS, RECORDING_UPDATE_FIELDS
+    RECORDING_FIELDS, RECORDING_INSERT_FIELDS, RECORDING_UPDATE_FIELDS, RECORDING_FLAG_FIELDS
 )
-from utils.structured_logging import get_logger
+from utils.structured_logging import get_logger, timed
 
 logger = get_logger(__name__)
 
@@ -43,6 +44,49 @@ def _validate_fields(fields: List[str], allowlist, context: str = "query") -> Li
     return [_validate_field_name(f, allowlist, context) for f in fields]
 
 
+# bm25() column weights for ranked search; FTS columns not listed weigh 1.0.
+# A hit in the patient name or the SOAP note says more about a recording
+# than the same word buried in a long transcript or chat.
+RECORDING_SEARCH_WEIGHTS: Dict[str, float] = {
+    'filename': 2.0,
+    'patient_name': 8.0,
+    'transcript': 1.0,
+    'soap_note': 3.0,
+    'referral': 1.5,
+    'letter': 1.5,
+    'chat': 0.5,
+}
+
+_PHRASE_PATTERN = re.compile(r'"([^"]*)"')
+_TERM_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+# Substring match over every searchable text column (the pre-FTS search)
+_LIKE_SEARCH_COLUMNS = ('filename', 'patient_name', 'transcript', 'soap_note', 'referral', 'letter')
+_LIKE_SEARCH_CONDITION = ' OR '.join(f"{c} LIKE ?" for c in _LIKE_SEARCH_COLUMNS)
+
+
+def _build_fts_query(text: str) -> str:
+    """Translate free-text search input into an FTS5 MATCH expression.
+
+    Double-quoted sections become exact phrases and every other word becomes
+    a prefix term, so `"chest pain" hyper` matches notes containing the
+    phrase and any word starting with "hyper". FTS operators and punctuation
+    in the input are never passed through, so user text cannot produce a
+    syntax error.
+
+    Returns:
+        MATCH expression, or "" if the text contains no searchable words
+    """
+    parts = []
+    for phrase in _PHRASE_PATTERN.findall(text):
+        words = _TERM_PATTERN.findall(phrase)
+        if words:
+            parts.append('"' + ' '.join(words) + '"')
+    remainder = _PHRASE_PATTERN.sub(' ', text)
+    parts.extend(f'"{word}"*' for word in _TERM_PATTERN.findall(remainder))
+    return ' '.join(parts)
+
+
 class RecordingMixin:
     """Mixin providing recording CRUD operations."""
 
@@ -63,7 +107,11 @@ class RecordingMixin:
                 letter TEXT,
                 timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
                 processing_status TEXT DEFAULT 'pending',
-                patient_name TEXT
+                patient_name TEXT,
+                has_transcript INTEGER NOT NULL DEFAULT 0,
+                has_soap INTEGER NOT NULL DEFAULT 0,
+                has_referral INTEGER NOT NULL DEFAULT 0,
+                has_letter INTEGER NOT NULL DEFAULT 0
             )
             ''')
 
@@ -106,8 +154,16 @@ class RecordingMixin:
                 value = json.dumps(value)
             values.append(value)
 
+        # Document-presence flags for list views
+        field_values = dict(zip(fields, values))
+        for text_field, flag in RecordingSchema.DOCUMENT_FLAGS.items():
+            fields.append(flag)
+            values.append(1 if field_values.get(text_field) else 0)
+
         # Validate all fields before building query (defense in depth)
-        validated_fields = _validate_fields(fields, RECORDING_INSERT_FIELDS, "add_recording")
+        validated_fields = _validate_fields(
+            fields, RECORDING_INSERT_FIELDS | RECORDING_FLAG_FIELDS, "add_recording"
+        )
 
         # Build query with validated field names
         placeholders = ','.join(['?' for _ in validated_fields])
@@ -119,6 +175,7 @@ class RecordingMixin:
             return cursor.lastrowid
 
     @db_retry(max_retries=3, initial_delay=0.2)
+    @timed("db_update_recording")
     def update_recording(self, recording_id: int, **kwargs: Any) -> bool:
         """
         Update a recording in the database
@@ -147,8 +204,15 @@ class RecordingMixin:
         if not update_fields:
             return False
 
+        # Keep document-presence flags in step with their text columns
+        for text_field, flag in RecordingSchema.DOCUMENT_FLAGS.items():
+            if text_field in update_fields:
+                update_fields[flag] = 1 if update_fields[text_field] else 0
+
         # Build parameterized query with validated field names
-        validated_field_names = list(update_fields.keys())
+        validated_field_names = _validate_fields(
+            list(update_fields.keys()), RECORDING_UPDATE_FIELDS | RECORDING_FLAG_FIELDS, "update_recording"
+        )
         query = "UPDATE recordings SET "
         query += ", ".join([f"{field} = ?" for field in validated_field_names])
         query += " WHERE id = ?"
@@ -271,13 +335,9 @@ class RecordingMixin:
         # Choose columns based on lightweight flag
         if lightweight:
             columns = ', '.join(RecordingSchema.LIGHTWEIGHT_COLUMNS)
-            # Add has_* flags for UI compatibility
+            # Add materialized has_* flags for UI compatibility
             query = f"""
-                SELECT {columns},
-                       CASE WHEN transcript IS NOT NULL AND transcript != '' THEN 1 ELSE 0 END as has_transcript,
-                       CASE WHEN soap_note IS NOT NULL AND soap_note != '' THEN 1 ELSE 0 END as has_soap,
-                       CASE WHEN referral IS NOT NULL AND referral != '' THEN 1 ELSE 0 END as has_referral,
-                       CASE WHEN letter IS NOT NULL AND letter != '' THEN 1 ELSE 0 END as has_letter
+                SELECT {columns}, has_transcript, has_soap, has_referral, has_letter
                 FROM recordings
                 ORDER BY {order_by} {order_direction}
                 LIMIT ? OFFSET ?
@@ -357,13 +417,10 @@ class RecordingMixin:
         # Use lightweight columns that exclude large text fields
         columns = ', '.join(RecordingSchema.LIGHTWEIGHT_COLUMNS)
 
-        # Compute has_* flags as derived columns (avoids loading full text)
+        # Materialized has_* flags keep this covered by idx_recordings_list,
+        # so the large text columns' overflow pages are never read
         query = f"""
-            SELECT {columns},
-                   CASE WHEN transcript IS NOT NULL AND transcript != '' THEN 1 ELSE 0 END as has_transcript,
-                   CASE WHEN soap_note IS NOT NULL AND soap_note != '' THEN 1 ELSE 0 END as has_soap,
-                   CASE WHEN referral IS NOT NULL AND referral != '' THEN 1 ELSE 0 END as has_referral,
-                   CASE WHEN letter IS NOT NULL AND letter != '' THEN 1 ELSE 0 END as has_letter
+            SELECT {columns}, has_transcript, has_soap, has_referral, has_letter
             FROM recordings
             ORDER BY {order_by} {order_direction}
             LIMIT ? OFFSET ?
@@ -389,6 +446,63 @@ class RecordingMixin:
 
             return result
 
+    def get_recordings_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[Tuple[str, int]] = None,
+    ) -> Dict[str, Any]:
+        """Get one page of lightweight recordings, newest first, by keyset.
+
+        Unlike OFFSET pagination the cost of a page does not grow with its
+        depth: the (timestamp, id) cursor seeks straight into
+        idx_recordings_list.
+
+        Args:
+            limit: Maximum number of recordings to return
+            cursor: next_cursor from the previous page, or None for the first page
+
+        Returns:
+            {"results": [...], "next_cursor": (timestamp, id) or None}. Results
+            have the same shape as get_recordings_lightweight().
+        """
+        columns = ', '.join(RecordingSchema.LIGHTWEIGHT_COLUMNS)
+        where = ""
+        params: List[Any] = []
+        if cursor is not None:
+            where = "WHERE (timestamp, id) < (?, ?)"
+            params.extend(cursor)
+        params.append(limit)
+
+        query = f"""
+            SELECT {columns}, has_transcript, has_soap, has_referral, has_letter
+            FROM recordings
+            {where}
+            ORDER BY timestamp DESC, id DESC
+            LIMIT ?
+        """
+        extended_columns = RecordingSchema.LIGHTWEIGHT_COLUMNS + RecordingSchema.FLAG_COLUMNS
+
+        with self.connection() as (conn, cur):
+            cur.execute(query, params)
+            results = []
+            for r in cur.fetchall():
+                record = dict(zip(extended_columns, r))
+                for flag in RecordingSchema.FLAG_COLUMNS:
+                    record[flag] = bool(record[flag])
+                results.append(record)
+
+        next_cursor = None
+        if len(results) == limit:
+            next_cursor = (results[-1]['timestamp'], results[-1]['id'])
+        return {"results": results, "next_cursor": next_cursor}
+
+    def get_recordings_count(self) -> int:
+        """Get the total number of recordings."""
+        with self.connection() as (conn, cursor):
+            cursor.execute("SELECT COUNT(*) FROM recordings")
+            result = cursor.fetchone()
+            return result[0] if result else 0
+
     def get_recordings_by_ids(self, recording_ids: List[int]) -> List[Dict[str, Any]]:
         """Get multiple recordings by their IDs.
 
@@ -412,26 +526,72 @@ class RecordingMixin:
 
             return [RecordingSchema.row_to_dict(r, RecordingSchema.SELECT_COLUMNS) for r in recordings]
 
+    def iter_recordings_by_ids(
+        self,
+        recording_ids: List[int],
+        batch_size: int = 200
+    ) -> Generator[List[Dict[str, Any]], None, None]:
+        """Yield full recordings for the given IDs in ascending-ID batches.
+
+        IDs are sorted and fetched in keyset order, one IN query per
+        batch, so exporting thousands of recordings holds at most one
+        batch in memory and stays under SQLite's bound-parameter limit.
+
+        Args:
+            recording_ids: IDs to fetch; unknown IDs are skipped
+            batch_size: Maximum recordings per query
+
+        Yields:
+            List of recording dictionaries for each batch
+        """
+        ids = sorted({int(rid) for rid in recording_ids})
+        columns = ', '.join(RecordingSchema.SELECT_COLUMNS)
+        for start in range(0, len(ids), batch_size):
+            chunk = ids[start:start + batch_size]
+            placeholders = ','.join('?' * len(chunk))
+            with self.connection() as (conn, cursor):
+                cursor.execute(
+                    f"SELECT {columns} FROM recordings WHERE id IN ({placeholders}) ORDER BY id",
+                    chunk
+                )
+                rows = cursor.fetchall()
+            if rows:
+                yield [RecordingSchema.row_to_dict(r, RecordingSchema.SELECT_COLUMNS) for r in rows]
+
+    def _recordings_fts_columns(self) -> List[str]:
+        """Return the indexed columns of recordings_fts, or [] if it does not exist."""
+        with self.connection() as (conn, cursor):
+            cursor.execute("PRAGMA table_info(recordings_fts)")
+            return [row[1] for row in cursor.fetchall()]
+
     def search_recordings(self, search_term: str) -> List[Dict[str, Any]]:
         """Search for recordings containing the search term in any text field
 
+        Returns the union of recordings_fts word-prefix matches (when the
+        index covers the filename) and a LIKE substring scan, so substrings
+        inside a word (e.g. "ertension" or part of an MRN) are still found
+        alongside word matches such as unquoted multi-word queries.
+
         Parameters:
-        - search_term: Text to search for in filename, transcript, soap_note, referral, or letter
+        - search_term: Text to search for in filename, patient_name, transcript, soap_note, referral, or letter
 
         Returns:
-        - List of matching recordings
+        - List of matching recordings, newest first
         """
         # Use explicit column selection to guarantee order matches schema
         columns = ', '.join(RecordingSchema.SELECT_COLUMNS)
+        search_pattern = f"%{search_term}%"
+        conditions = [_LIKE_SEARCH_CONDITION]
+        params: List[Any] = [search_pattern] * len(_LIKE_SEARCH_COLUMNS)
+
+        match = _build_fts_query(search_term)
+        if match and 'filename' in self._recordings_fts_columns():
+            conditions.insert(0, "id IN (SELECT rowid FROM recordings_fts WHERE recordings_fts MATCH ?)")
+            params.insert(0, match)
+
         query = f"""SELECT {columns} FROM recordings
-                 WHERE filename LIKE ?
-                 OR transcript LIKE ?
-                 OR soap_note LIKE ?
-                 OR referral LIKE ?
-                 OR letter LIKE ?
+                 WHERE {' OR '.join(conditions)}
                  ORDER BY timestamp DESC"""
-        search_pattern = f"%{search_term}%"
-        params = (search_pattern, search_pattern, search_pattern, search_pattern, search_pattern)
 
         with self.connection() as (conn, cursor):
             cursor.execute(query, params)
@@ -439,6 +599,167 @@ class RecordingMixin:
 
             return [RecordingSchema.row_to_dict(r, RecordingSchema.SELECT_COLUMNS) for r in recordings]
 
+    def search_recordings_ranked(
+        self,
+        search_term: str,
+        limit: int = 50,
+        cursor: Optional[Tuple[float, int]] = None,
+        start_date: Optional[Union[str, datetime.datetime]] = None,
+        end_date: Optional[Union[str, datetime.datetime]] = None,
+        patient_name: Optional[str] = None,
+        highlight: Tuple[str, str] = ("[", "]"),
+    ) -> Dict[str, Any]:
+        """Relevance-ranked recording search with snippets and keyset pagination.
+
+        Matches against recordings_fts using _build_fts_query (prefix terms and
+        "quoted phrases"), ranks with bm25() weighted by
+        RECORDING_SEARCH_WEIGHTS and returns one highlighted snippet per hit.
+        Recordings that only match as a LIKE substring (or every match, without
+        an FTS index) follow the ranked hits, newest first with a score of 0.0
+        and no snippet.
+
+        Args:
+            search_term: Free-text search input
+            limit: Maximum results per page
+            cursor: next_cursor from the previous page, or None for the first page
+            start_date: Only recordings on or after this date
+            end_date: Only recordings on or before this date (inclusive)
+            patient_name: Only recordings for this patient (case-insensitive)
+            highlight: Opening and closing markers around matched terms
+
+        Returns:
+            {"results": [...], "next_cursor": (score, id) or None}. Each result
+            has the lightweight list columns, has_* flags, score and snippet.
+        """
+        if not search_term.strip():
+            return {"results": [], "next_cursor": None}
+
+        filters = []
+        params: List[Any] = []
+        if start_date is not None:
+            if isinstance(start_date, str):
+                start_date = datetime.datetime.fromisoformat(start_date)
+            filters.append("r.timestamp >= ?")
+            params.append(start_date.isoformat())
+        if end_date is not None:
+            if isinstance(end_date, str):
+                end_date = datetime.datetime.fromisoformat(end_date)
+            filters.append("r.timestamp < ?")
+            params.append((end_date + datetime.timedelta(days=1)).isoformat())
+        if patient_name:
+            filters.append("r.patient_name = ? COLLATE NOCASE")
+            params.append(patient_name)
+
+        fts_columns = self._recordings_fts_columns()
+        match = _build_fts_query(search_term) if fts_columns else ""
+        results: List[Dict[str, Any]] = []
+        # FTS hits come first, ranked by (negative) bm25; substring-only hits
+        # follow with a 0.0 score, so the cursor score says which phase it is in
+        if match and (cursor is None or cursor[0] < 0):
+            # Unlisted columns weigh 1.0; the column list comes from the schema
+            weights = ', '.join(str(RECORDING_SEARCH_WEIGHTS.get(c, 1.0)) for c in fts_columns)
+            results = self._ranked_search_page(
+                f"bm25(recordings_fts, {weights})",
+                "recordings_fts JOIN recordings r ON r.id = recordings_fts.rowid",
+                ["recordings_fts MATCH ?", *filters], [match, *params],
+                cursor, limit, match, highlight
+            )
+
+        # Top the page up with LIKE matches the index missed: substrings
+        # inside a word (e.g. "ertension" or part of an MRN)
+        if len(results) < limit:
+            like_filters = [f"({_LIKE_SEARCH_CONDITION})"]
+            like_params: List[Any] = [f"%{search_term}%"] * len(_LIKE_SEARCH_COLUMNS)
+            if match:
+                like_filters.append(
+                    "r.id NOT IN (SELECT rowid FROM recordings_fts WHERE recordings_fts MATCH ?)"
+                )
+                like_params.append(match)
+            like_cursor = cursor if cursor is not None and cursor[0] >= 0 else None
+            results += self._ranked_search_page(
+                "0.0", "recordings r",
+                [*like_filters, *filters], like_params + params,
+                like_cursor, limit - len(results), "", highlight
+            )
+
+        next_cursor = None
+        if len(results) == limit:
+            next_cursor = (results[-1]['score'], results[-1]['id'])
+        return {"results": results, "next_cursor": next_cursor}
+
+    def _ranked_search_page(
+        self,
+        score_sql: str,
+        source_sql: str,
+        filters: List[str],
+        params: List[Any],
+        cursor: Optional[Tuple[float, int]],
+        limit: int,
+        match: str,
+        highlight: Tuple[str, str],
+    ) -> List[Dict[str, Any]]:
+        """Run one page of search_recordings_ranked.
+
+        Args:
+            score_sql: Score expression (lower ranks first)
+            source_sql: FROM clause, with recordings aliased as r
+            filters: WHERE conditions, joined with AND
+            params: Parameters for filters, in order
+            cursor: (score, id) keyset cursor, or None for the first page
+            limit: Maximum results
+            match: FTS MATCH expression for snippets, or "" for none
+            highlight: Opening and closing markers around matched terms
+
+        Returns:
+            Result dictionaries in rank order
+        """
+        filters = list(filters)
+        params = list(params)
+        # bm25 is lower-is-better; ties break newest id first
+        if cursor is not None:
+            filters.append(f"({score_sql} > ? OR ({score_sql} = ? AND r.id < ?))")
+            params.extend([cursor[0], cursor[0], cursor[1]])
+
+        columns = ', '.join(f"r.{c}" for c in RecordingSchema.LIGHTWEIGHT_COLUMNS)
+        query = f"""
+            SELECT {columns}, r.has_transcript, r.has_soap, r.has_referral, r.has_letter,
+                   {score_sql} AS score
+            FROM {source_sql}
+            WHERE {' AND '.join(filters)}
+            ORDER BY score, r.id DESC
+            LIMIT ?
+        """
+        params.append(limit)
+
+        extended_columns = RecordingSchema.LIGHTWEIGHT_COLUMNS + (
+            'has_transcript', 'has_soap', 'has_referral', 'has_letter', 'score'
+        )
+        with self.connection() as (conn, cur):
+            cur.execute(query, params)
+            results = []
+            for r in cur.fetchall():
+                record = dict(zip(extended_columns, r))
+                for flag in ('has_transcript', 'has_soap', 'has_referral', 'has_letter'):
+                    record[flag] = bool(record[flag])
+                record['snippet'] = None
+                results.append(record)
+
+            # Snippets only for the page being returned, not every match
+            if match and results:
+                ids = [record['id'] for record in results]
+                placeholders = ','.join('?' for _ in ids)
+                cur.execute(
+                    f"""SELECT rowid, snippet(recordings_fts, -1, ?, ?, '…', 12)
+                        FROM recordings_fts
+                        WHERE recordings_fts MATCH ? AND rowid IN ({placeholders})""",
+                    [highlight[0], highlight[1], match, *ids]
+                )
+                snippets = dict(cur.fetchall())
+                for record in results:
+                    record['snippet'] = snippets.get(record['id'])
+
+        return results
+
     def get_recordings_by_date_range(self, start_date: Union[str, datetime.datetime], end_date: Union[str, datetime.datetime]) -> List[Dict[str, Any]]:
         """Get recordings created within a date range
 
@@ -140,6 +140,16 @@ class RecordingSchema:
         'processing_status'
     )
 
+    # Materialized document-presence flags (migration 19), kept in sync on
+    # write so list views never read the large text columns
+    DOCUMENT_FLAGS: Dict[str, str] = {
+        'transcript': 'has_transcript',
+        'soap_note': 'has_soap',
+        'referral': 'has_referral',
+        'letter': 'has_letter',
+    }
+    FLAG_COLUMNS: Tuple[str, ...] = tuple(DOCUMENT_FLAGS.values())
+
     # Full column set for comprehensive queries (22 columns with all migration 4 additions)
     FULL_COLUMNS: Tuple[str, ...] = (
         'id', 'filename', 'transcript', 'soap_note', 'referral', 'letter',
@@ -340,6 +350,7 @@ class BatchSchema:
 RECORDING_FIELDS = RecordingSchema.ALL_FIELDS
 RECORDING_INSERT_FIELDS = RecordingSchema.INSERT_FIELDS
 RECORDING_UPDATE_FIELDS = RecordingSchema.UPDATE_FIELDS
+RECORDING_FLAG_FIELDS = frozenset(RecordingSchema.FLAG_COLUMNS)
 QUEUE_UPDATE_FIELDS = QueueSchema.UPDATE_FIELDS
 BATCH_UPDATE_FIELDS = BatchSchema.UPDATE_FIELDS
 
@@ -5,14 +5,17 @@ Provides document export functionality for various formats including:
 - FHIR R4 (for EHR/EMR import)
 - Word (.docx)
 - PDF with letterhead
+- Bulk export of many recordings to a folder, ZIP or FHIR Bundle
 """
 
 from exporters.base_exporter import BaseExporter
 from exporters.fhir_exporter import FHIRExporter
 from exporters.docx_exporter import DocxExporter
+from exporters.bulk_exporter import BulkExporter
 
 __all__ = [
     "BaseExporter",
     "FHIRExporter",
     "DocxExporter",
+    "BulkExporter",
 ]
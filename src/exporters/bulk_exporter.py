@@ -0,0 +1,513 @@
+"""
+Bulk Exporter Module
+
+Exports many recordings at once. Recordings are read in ascending-ID
+batches, each recording's documents are rendered on a worker pool, and
+the finished files are streamed into a directory, a ZIP archive or a
+single FHIR collection Bundle. Only a bounded window of recordings and
+rendered files exists at any time, so memory stays flat however many
+recordings are selected.
+
+Word and PDF rendering is CPU-bound pure Python, so large exports in
+those formats render in a process pool, a chunk of recordings per task;
+text and FHIR output render on threads.
+
+Usage:
+    from exporters.bulk_exporter import BulkExporter, DEST_ZIP, FORMAT_PDF
+
+    exporter = BulkExporter(db, FORMAT_PDF)
+    result = exporter.export(recording_ids, "march.zip", DEST_ZIP,
+                             on_progress=update_bar, cancel_event=cancel)
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import zipfile
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from utils.exceptions import ExportError
+from utils.structured_logging import get_logger
+from utils.tracing import get_tracer
+
+logger = get_logger(__name__)
+
+# Output formats
+FORMAT_TEXT = "text"
+FORMAT_DOCX = "docx"
+FORMAT_PDF = "pdf"
+FORMAT_FHIR = "fhir"
+EXPORT_FORMATS = (FORMAT_TEXT, FORMAT_DOCX, FORMAT_PDF, FORMAT_FHIR)
+
+# Destinations
+DEST_DIRECTORY = "directory"
+DEST_ZIP = "zip"
+DEST_FHIR_BUNDLE = "fhir_bundle"
+EXPORT_DESTINATIONS = (DEST_DIRECTORY, DEST_ZIP, DEST_FHIR_BUNDLE)
+
+DEFAULT_WORKERS = 4
+DEFAULT_BATCH_SIZE = 200
+
+# Formats rendered in worker processes, and the export size from which
+# spawning workers (each re-imports the exporters) pays off
+_CPU_BOUND_FORMATS = {FORMAT_DOCX, FORMAT_PDF}
+PROCESS_MIN_RECORDINGS = 50
+PROCESS_CHUNK_SIZE = 8
+
+# Minimum seconds between progress callbacks
+PROGRESS_INTERVAL = 0.1
+
+_EXTENSIONS = {FORMAT_TEXT: "txt", FORMAT_DOCX: "docx", FORMAT_PDF: "pdf", FORMAT_FHIR: "json"}
+
+# Already compressed; deflating them again only costs time
+_STORED_EXTENSIONS = {".docx", ".pdf"}
+
+# (recording field, filename suffix, document title)
+_DOCUMENTS = (
+    ("transcript", "transcript", "Transcript"),
+    ("soap_note", "soap", "SOAP Note"),
+    ("referral", "referral", "Referral"),
+    ("letter", "letter", "Letter"),
+)
+
+_DOCX_TYPES = {"soap_note": "soap", "referral": "referral", "letter": "letter"}
+
+# Per-thread exporter instances; exporters keep per-document state
+_worker_state = threading.local()
+
+# (recording id, written paths, error message or None)
+RenderOutcome = Tuple[int, List[str], Optional[str]]
+
+
+@dataclass
+class BulkExportProgress:
+    """Running totals reported while an export is in progress."""
+    total: int
+    exported: int = 0
+    failed: int = 0
+    files: int = 0
+
+    @property
+    def done(self) -> int:
+        return self.exported + self.failed
+
+
+@dataclass
+class BulkExportResult:
+    """Outcome of a bulk export."""
+    output_path: str
+    exported: int = 0
+    failed: int = 0
+    files: int = 0
+    cancelled: bool = False
+    elapsed: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+
+def _base_filename(recording: Dict[str, Any]) -> str:
+    """recording_<id>_<timestamp>, safe for every filesystem."""
+    timestamp = str(recording.get("timestamp") or "")
+    timestamp = timestamp.replace(":", "-").replace(" ", "_").replace("/", "-")
+    return f"recording_{recording['id']}_{timestamp}" if timestamp else f"recording_{recording['id']}"
+
+
+class _DirectorySink:
+    """Rendered files are written straight into the target directory."""
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.staging_dir = directory
+
+    def add(self, paths: List[str]) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def abort(self) -> None:
+        pass  # Completed files are kept; the result reports how many
+
+
+class _ZipSink:
+    """Streams rendered files into a ZIP archive, deleting each once added."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.staging_dir = tempfile.mkdtemp(prefix="bulk_export_")
+        fd, self._tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        os.close(fd)
+        self._zip = zipfile.ZipFile(self._tmp_path, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def add(self, paths: List[str]) -> None:
+        for path in paths:
+            stored = os.path.splitext(path)[1] in _STORED_EXTENSIONS
+            self._zip.write(
+                path, arcname=os.path.basename(path),
+                compress_type=zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED,
+            )
+            os.remove(path)
+
+    def close(self) -> None:
+        self._zip.close()
+        os.replace(self._tmp_path, self.path)
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+    def abort(self) -> None:
+        self._zip.close()
+        os.remove(self._tmp_path)
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+
+class _FhirBundleSink:
+    """Streams per-document FHIR resources into one collection Bundle."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.staging_dir = tempfile.mkdtemp(prefix="bulk_export_")
+        fd, self._tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        self._file = os.fdopen(fd, "w", encoding="utf-8")
+        self._file.write(
+            '{"resourceType": "Bundle", "id": "%s", "type": "collection", "timestamp": "%s", "entry": ['
+            % (uuid.uuid4(), datetime.now(timezone.utc).isoformat())
+        )
+        self._entries = 0
+
+    def add(self, paths: List[str]) -> None:
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                resource = f.read()
+            separator = "," if self._entries else ""
+            self._file.write(f'{separator}\n{{"fullUrl": "urn:uuid:{uuid.uuid4()}", "resource": {resource}}}')
+            self._entries += 1
+            os.remove(path)
+
+    def close(self) -> None:
+        self._file.write("\n]}\n")
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+    def abort(self) -> None:
+        self._file.close()
+        os.remove(self._tmp_path)
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+
+def _exporter_for(export_format: str, clinic_name: str, doctor_name: str):
+    """This thread's exporter for the format, created on first use."""
+    key = (export_format, clinic_name, doctor_name)
+    exporters = getattr(_worker_state, "exporters", None)
+    if exporters is None:
+        exporters = _worker_state.exporters = {}
+    exporter = exporters.get(key)
+    if exporter is not None:
+        return exporter
+
+    if export_format == FORMAT_DOCX:
+        from exporters.docx_exporter import DocxExporter
+        exporter = DocxExporter(clinic_name, doctor_name)
+    elif export_format == FORMAT_PDF:
+        from utils.pdf_exporter import PDFExporter
+        exporter = PDFExporter()
+        if clinic_name or doctor_name:
+            exporter.set_simple_letterhead(clinic_name, doctor_name)
+    else:
+        from exporters.fhir_config import FHIRExportConfig
+        from exporters.fhir_exporter import FHIRExporter
+        exporter = FHIRExporter(FHIRExportConfig(
+            organization_name=clinic_name,
+            practitioner_name=doctor_name,
+            include_patient=False,
+            include_practitioner=bool(doctor_name),
+            include_organization=bool(clinic_name),
+        ))
+    exporters[key] = exporter
+    return exporter
+
+
+def _render_document(
+    export_format: str, key: str, title: str, text: str, path: str,
+    clinic_name: str, doctor_name: str,
+) -> None:
+    """Write one document of a recording in the given format."""
+    if export_format == FORMAT_TEXT:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return
+
+    exporter = _exporter_for(export_format, clinic_name, doctor_name)
+    if export_format == FORMAT_DOCX:
+        content = {
+            "document_type": _DOCX_TYPES.get(key, "generic"),
+            "content": text,
+            "title": title,
+            "include_letterhead": bool(clinic_name or doctor_name),
+        }
+        ok = exporter.export(content, Path(path))
+    elif export_format == FORMAT_PDF:
+        if key in ("referral", "letter"):
+            ok = exporter.generate_referral_letter_pdf({"body": text, "subject": title}, path)
+        else:
+            ok = exporter.generate_generic_document_pdf(title, text, path)
+    else:
+        content = {
+            "soap_data": text,
+            "title": title,
+            "export_type": "bundle" if key == "soap_note" else "document_reference",
+            "document_type": key,
+        }
+        ok = exporter.export(content, Path(path))
+    if not ok:
+        raise ExportError(getattr(exporter, "last_error", None) or f"Export of {title} failed")
+
+
+def _render_recording(
+    recording: Dict[str, Any], directory: str, export_format: str,
+    clinic_name: str = "", doctor_name: str = "",
+) -> List[str]:
+    """Write each non-empty document of a recording and return the paths."""
+    base = _base_filename(recording)
+    extension = _EXTENSIONS[export_format]
+    paths = []
+    for key, suffix, title in _DOCUMENTS:
+        text = recording.get(key) or ""
+        if not text.strip():
+            continue
+        path = os.path.join(directory, f"{base}_{suffix}.{extension}")
+        _render_document(export_format, key, title, text, path, clinic_name, doctor_name)
+        paths.append(path)
+    return paths
+
+
+def _render_chunk(
+    recordings: List[Dict[str, Any]], directory: str, export_format: str,
+    clinic_name: str, doctor_name: str,
+) -> List[RenderOutcome]:
+    """Render a chunk of recordings (runs on a worker thread or process).
+
+    A failing recording is reported in its outcome rather than raised, so
+    one bad note does not lose the rest of the chunk.
+    """
+    outcomes = []
+    for recording in recordings:
+        try:
+            paths = _render_recording(recording, directory, export_format, clinic_name, doctor_name)
+        except Exception as e:
+            outcomes.append((recording["id"], [], str(e)))
+        else:
+            outcomes.append((recording["id"], paths, None))
+    return outcomes
+
+
+class BulkExporter:
+    """Exports selected recordings in parallel with bounded memory.
+
+    The calling thread reads batches from the database, keeps at most two
+    render tasks per worker in flight and hands finished files to the
+    destination in recording order. Run export() off the UI thread.
+    """
+
+    def __init__(
+        self,
+        db,
+        export_format: str = FORMAT_TEXT,
+        max_workers: int = DEFAULT_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        clinic_name: str = "",
+        doctor_name: str = "",
+    ):
+        """Initialize the bulk exporter.
+
+        Args:
+            db: Database providing iter_recordings_by_ids()
+            export_format: One of EXPORT_FORMATS
+            max_workers: Render threads; render processes are further
+                capped at the CPU count
+            batch_size: Recordings fetched per database query
+            clinic_name: Letterhead clinic name (DOCX, PDF and FHIR)
+            doctor_name: Letterhead doctor name (DOCX, PDF and FHIR)
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {export_format}")
+        self.db = db
+        self.export_format = export_format
+        self.max_workers = max(1, max_workers)
+        self.batch_size = batch_size
+        self.clinic_name = clinic_name
+        self.doctor_name = doctor_name
+
+    def export(
+        self,
+        recording_ids: Iterable[int],
+        output_path: str,
+        destination: str = DEST_DIRECTORY,
+        on_progress: Optional[Callable[[BulkExportProgress], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> BulkExportResult:
+        """Export the recordings' documents to output_path.
+
+        Args:
+            recording_ids: Recordings to export
+            output_path: Directory, ZIP file or Bundle JSON file
+            destination: One of EXPORT_DESTINATIONS
+            on_progress: Called on the exporting thread at most every
+                PROGRESS_INTERVAL seconds, and once at the end
+            cancel_event: Set to stop; ZIP and Bundle outputs are then
+                discarded, files already written to a directory are kept and
+                counted in the result
+
+        Returns:
+            BulkExportResult with counts and per-recording errors
+
+        Raises:
+            ValueError: If the destination is unknown or does not suit
+                the format
+        """
+        if destination == DEST_FHIR_BUNDLE and self.export_format != FORMAT_FHIR:
+            raise ValueError("A FHIR Bundle destination requires the FHIR format")
+        if destination not in EXPORT_DESTINATIONS:
+            raise ValueError(f"Unknown export destination: {destination}")
+
+        ids = list(recording_ids)
+        cancel_event = cancel_event or threading.Event()
+        progress = BulkExportProgress(total=len(ids))
+        result = BulkExportResult(output_path=output_path)
+        finished_ids: set = set()
+        start = time.perf_counter()
+        last_report = 0.0
+
+        def report(force: bool = False) -> None:
+            nonlocal last_report
+            now = time.perf_counter()
+            if on_progress and (force or now - last_report >= PROGRESS_INTERVAL):
+                last_report = now
+                on_progress(progress)
+
+        if destination == DEST_ZIP:
+            sink = _ZipSink(output_path)
+        elif destination == DEST_FHIR_BUNDLE:
+            sink = _FhirBundleSink(output_path)
+        else:
+            sink = _DirectorySink(output_path)
+
+        def run(run_ids: List[int], use_processes: bool) -> None:
+            pool: Executor
+            if use_processes:
+                workers = process_workers
+                pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                chunk_size = PROCESS_CHUNK_SIZE
+            else:
+                workers = self.max_workers
+                pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk_export")
+                chunk_size = 1
+            window = workers * 2
+            in_flight: deque[Future] = deque()
+
+            def drain(limit: int) -> None:
+                """Hand finished renders to the sink until at most limit remain."""
+                while len(in_flight) > limit:
+                    future = in_flight.popleft()
+                    if future.cancelled():
+                        continue
+                    for recording_id, paths, error in future.result():
+                        if error is None:
+                            try:
+                                sink.add(paths)
+                            except OSError as e:
+                                error = str(e)
+                        finished_ids.add(recording_id)
+                        if error is None:
+                            progress.exported += 1
+                            progress.files += len(paths)
+                        else:
+                            progress.failed += 1
+                            result.errors.append(f"Recording {recording_id}: {error}")
+                            logger.error("Failed to export recording", recording_id=recording_id, error=error)
+                    report()
+
+            def submit(chunk: List[Dict[str, Any]]) -> None:
+                in_flight.append(pool.submit(
+                    _render_chunk, chunk, sink.staging_dir, self.export_format,
+                    self.clinic_name, self.doctor_name,
+                ))
+                drain(window)
+
+            def feed() -> None:
+                chunk = []
+                for batch in self.db.iter_recordings_by_ids(run_ids, self.batch_size):
+                    for recording in batch:
+                        if cancel_event.is_set():
+                            return
+                        chunk.append(recording)
+                        if len(chunk) >= chunk_size:
+                            submit(chunk)
+                            chunk = []
+                if chunk and not cancel_event.is_set():
+                    submit(chunk)
+
+            try:
+                feed()
+                # On cancel, renders already running still finish and write
+                # their files; drain them too so the result matches the output
+                pool.shutdown(wait=True, cancel_futures=cancel_event.is_set())
+                drain(0)
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        process_workers = min(self.max_workers, os.cpu_count() or 1)
+        use_processes = (
+            self.export_format in _CPU_BOUND_FORMATS
+            and len(ids) >= PROCESS_MIN_RECORDINGS
+            and process_workers > 1
+        )
+        try:
+            with get_tracer().span("bulk_export", format=self.export_format,
+                                   destination=destination, recordings=len(ids)):
+                try:
+                    run(ids, use_processes)
+                except BrokenProcessPool as e:
+                    # Frozen builds or restricted environments can refuse to
+                    # spawn; finish on threads rather than failing the export
+                    logger.warning(f"Export worker pool unavailable, rendering on threads: {e}")
+                    run([i for i in ids if i not in finished_ids], False)
+        except BaseException:
+            sink.abort()
+            raise
+
+        result.cancelled = cancel_event.is_set()
+        if result.cancelled:
+            sink.abort()
+        else:
+            sink.close()
+
+        result.exported = progress.exported
+        result.failed = progress.failed
+        result.files = progress.files
+        result.elapsed = time.perf_counter() - start
+        report(force=True)
+        logger.info(
+            "Bulk export finished",
+            format=self.export_format,
+            destination=destination,
+            exported=result.exported,
+            failed=result.failed,
+            cancelled=result.cancelled,
+            elapsed_s=round(result.elapsed, 2),
+        )
+        return result
@@ -5,6 +5,7 @@ Creates FHIR R4 resources for clinical documents including
 Composition, DocumentReference, Bundle, Patient, Practitioner, and Organization.
 """
 
+import itertools
 import uuid
 import re
 from datetime import datetime, timezone
@@ -42,6 +43,10 @@ from exporters.fhir_config import (
 
 logger = get_logger(__name__)
 
+# Shared by all builders so IDs stay unique when documents built on
+# different threads end up in the same Bundle
+_resource_ids = itertools.count(1)
+
 
 class FHIRResourceBuilder:
     """Builder class for creating FHIR R4 resources.
@@ -65,12 +70,10 @@ class FHIRResourceBuilder:
                 "Install it with: pip install fhir.resources"
             )
         self.config = config or FHIRExportConfig()
-        self._resource_index = 0
 
     def _next_id(self, resource_type: str) -> str:
         """Generate next unique resource ID."""
-        self._resource_index += 1
-        return generate_resource_id(resource_type, self._resource_index)
+        return generate_resource_id(resource_type, next(_resource_ids))
 
     def _create_narrative(self, text: str, status: str = "generated") -> Narrative:
         """Create a FHIR Narrative element with HTML div.
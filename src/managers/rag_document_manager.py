@@ -28,6 +28,8 @@ from rag.models import (
     UploadStatus,
 )
 from rag.cancellation import CancellationError, CancellationToken
+from rag.extraction_cache import forget_extraction
+from rag.query_cache import invalidate_query_cache
 from utils.structured_logging import get_logger
 
 logger = get_logger(__name__)
@@ -172,8 +174,19 @@ class RAGDocumentManager:
             # Step 1: Extract text
             report_progress(UploadStatus.EXTRACTING, 10, "Extracting text...")
 
+            def report_pages(pages_done: int, total_pages: int):
+                # Progress only; the stored status stays EXTRACTING
+                if progress_callback:
+                    progress_callback(DocumentUploadProgress(
+                        document_id=document_id,
+                        filename=filename,
+                        status=UploadStatus.EXTRACTING,
+                        progress_percent=10 + 20 * pages_done / total_pages,
+                        current_step=f"Extracting page {pages_done} of {total_pages}...",
+                    ))
+
             text, metadata, page_count, ocr_used = processor.extract_text(
-                file_path, enable_ocr=enable_ocr
+                file_path, enable_ocr=enable_ocr, progress_callback=report_pages
             )
 
             doc.page_count = page_count
@@ -235,6 +248,7 @@ class RAGDocumentManager:
                 chunk.neon_id = str(neon_id)
 
             doc.neon_synced = True
+            invalidate_query_cache()
 
             # Step 5: Add to knowledge graph (optional) - runs in BACKGROUND
             if enable_graph:
@@ -428,6 +442,7 @@ class RAGDocumentManager:
                 chunk.neon_id = str(neon_id)
 
             doc.neon_synced = True
+            invalidate_query_cache()
 
             # Step 5: Add to knowledge graph (optional) - runs in BACKGROUND
             if enable_graph:
@@ -492,6 +507,7 @@ class RAGDocumentManager:
             try:
                 vector_store = self._get_vector_store()
                 vector_store.delete_document(document_id)
+                invalidate_query_cache()
                 logger.debug(f"Rolled back Neon data for {document_id}")
             except Exception as e:
                 logger.warning(f"Could not rollback Neon data for {document_id}: {e}")
@@ -583,9 +599,14 @@ class RAGDocumentManager:
             # Delete from Neon
             vector_store = self._get_vector_store()
             vector_store.delete_document(document_id)
+            invalidate_query_cache()
 
             # Delete from local database
             db = self._get_db_manager()
+            row = db.fetchone(
+                "SELECT file_path, metadata_json FROM rag_documents WHERE document_id = ?",
+                (document_id,)
+            )
 
             # Delete chunks first (foreign key)
             db.execute(
@@ -599,6 +620,9 @@ class RAGDocumentManager:
                 (document_id,)
             )
 
+            if row:
+                self._forget_cached_extraction(row)
+
             logger.info(f"Deleted document: {document_id}")
             return True
 
@@ -606,6 +630,19 @@ class RAGDocumentManager:
             logger.error(f"Failed to delete document {document_id}: {e}")
             return False
 
+    def _forget_cached_extraction(self, row: tuple):
+        """Drop a deleted document's cached extracted text (never fails the delete).
+
+        Args:
+            row: (file_path, metadata_json) of the deleted document
+        """
+        try:
+            file_path, metadata_json = row
+            file_hash = json.loads(metadata_json).get("file_hash") if metadata_json else None
+            forget_extraction(file_hash, file_path)
+        except Exception as e:
+            logger.warning(f"Could not drop cached extraction: {e}")
+
     def get_documents(
         self,
         status_filter: Optional[UploadStatus] = None,
@@ -699,6 +736,7 @@ class RAGDocumentManager:
             "keywords": doc.metadata.keywords,
             "category": doc.metadata.category,
             "custom_tags": doc.metadata.custom_tags,
+            "file_hash": doc.metadata.file_hash,
         })
 
         db.execute(
@@ -917,6 +955,7 @@ class RAGDocumentManager:
             "keywords": doc.metadata.keywords,
             "category": doc.metadata.category,
             "custom_tags": doc.metadata.custom_tags,
+            "file_hash": doc.metadata.file_hash,
         })
 
         db.execute(
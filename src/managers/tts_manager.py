@@ -21,6 +21,9 @@ from pydub import AudioSegment
 from pydub.playback import play
 
 from tts_providers.base import BaseTTSProvider
+from managers.tts_streaming import (
+    StreamingPlaybackStats, StreamingTTSPipeline, TTSAudioCache, split_sentences
+)
 from utils.structured_logging import get_logger
 from tts_providers.pyttsx_provider import PyttsxProvider
 from tts_providers.elevenlabs_tts import ElevenLabsTTSProvider
@@ -46,6 +49,12 @@ class TTSManager:
         self._current_provider = None
         self._provider_instance = None
         self.security_manager = get_security_manager()
+
+        # Synthesized audio cache and active streaming run (for stop_playback)
+        tts_settings = settings_manager.get("tts", {}) or {}
+        self._audio_cache = TTSAudioCache(tts_settings.get("audio_cache_size", 128))
+        self._active_stream: Optional[StreamingTTSPipeline] = None
+        self._stream_lock = threading.Lock()
         
         # Initialize pygame mixer for audio playback
         if PYGAME_AVAILABLE:
@@ -132,17 +141,7 @@ class TTSManager:
 
         try:
             provider = self.get_provider()
-
-            # Get language from settings if not provided
-            if language is None:
-                tts_settings = settings_manager.get("tts", {})
-                translation_settings = settings_manager.get("translation", {})
-                language = tts_settings.get("language", translation_settings.get("patient_language", "en"))
-
-            # Get voice from settings if not provided
-            if voice is None:
-                tts_settings = settings_manager.get("tts", {})
-                voice = tts_settings.get("voice", None)
+            language, voice = self._resolve_language_and_voice(language, voice)
 
             # Synthesize speech
             audio = provider.synthesize(text, language, voice, **kwargs)
@@ -154,6 +153,62 @@ class TTSManager:
             self.logger.error(f"TTS synthesis failed: {e}")
             raise
 
+    def _resolve_language_and_voice(self, language: Optional[str],
+                                    voice: Optional[str]) -> tuple:
+        """Fill in language and voice from settings when not provided.
+
+        Args:
+            language: Language code or None
+            voice: Voice ID/name or None
+
+        Returns:
+            Tuple of (language, voice)
+        """
+        if language is None:
+            tts_settings = settings_manager.get("tts", {})
+            translation_settings = settings_manager.get("translation", {})
+            language = tts_settings.get("language", translation_settings.get("patient_language", "en"))
+
+        if voice is None:
+            tts_settings = settings_manager.get("tts", {})
+            voice = tts_settings.get("voice", None)
+
+        return language, voice
+
+    def synthesize_cached(self, text: str, language: str = None, voice: str = None, **kwargs) -> AudioSegment:
+        """Synthesize text to speech, reusing previously rendered audio.
+
+        Audio is cached by (provider, voice, language, text). Calls with extra
+        provider-specific kwargs bypass the cache since they may change output.
+
+        Args:
+            text: Text to synthesize
+            language: Language code (if None, uses settings)
+            voice: Voice ID/name (if None, uses default)
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            AudioSegment containing synthesized speech
+        """
+        if kwargs:
+            return self.synthesize(text, language, voice, **kwargs)
+
+        # Resolve the provider first so the cache key reflects the active one
+        self.get_provider()
+        language, voice = self._resolve_language_and_voice(language, voice)
+        key = TTSAudioCache.make_key(self._current_provider or "", voice, language, text)
+        audio = self._audio_cache.get(key)
+        if audio is not None:
+            return audio
+
+        audio = self.synthesize(text, language, voice)
+        self._audio_cache.put(key, audio)
+        return audio
+
+    def clear_audio_cache(self):
+        """Discard all cached synthesized audio."""
+        self._audio_cache.clear()
+
     def synthesize_safe(self, text: str, language: str = None, voice: str = None, **kwargs) -> OperationResult[AudioSegment]:
         """Synthesize text to speech with OperationResult return type.
 
@@ -228,6 +283,72 @@ class TTSManager:
             self.logger.error(f"Failed to synthesize and play: {e}")
             raise
     
+    def synthesize_and_play_streaming(self, text: str, language: str = None, voice: str = None,
+                                      blocking: bool = False, output_device: str = None,
+                                      max_concurrency: int = None) -> Optional[StreamingPlaybackStats]:
+        """Synthesize text sentence by sentence and start playing as soon as possible.
+
+        Sentences are rendered concurrently (bounded by ``max_concurrency``)
+        and played in order, so playback of the first sentence begins while
+        the rest are still being synthesized. Rendered sentences are cached.
+
+        Args:
+            text: Text to synthesize
+            language: Language code
+            voice: Voice ID/name
+            blocking: If True, wait for playback of all sentences to complete
+            output_device: Specific output device to use for playback
+            max_concurrency: Maximum concurrent synthesis calls (if None, uses settings)
+
+        Returns:
+            StreamingPlaybackStats when blocking, otherwise None
+        """
+        if not text:
+            raise ValueError("Text cannot be empty")
+
+        self.stop_playback()
+
+        language, voice = self._resolve_language_and_voice(language, voice)
+        if max_concurrency is None:
+            tts_settings = settings_manager.get("tts", {}) or {}
+            max_concurrency = tts_settings.get("stream_concurrency", 3)
+
+        pipeline = StreamingTTSPipeline(
+            synthesize_fn=lambda sentence: self.synthesize_cached(sentence, language, voice),
+            play_fn=lambda audio: self._play_audio_blocking(audio, output_device),
+            max_concurrency=max_concurrency,
+        )
+        with self._stream_lock:
+            self._active_stream = pipeline
+
+        sentences = split_sentences(text)
+
+        def _run() -> StreamingPlaybackStats:
+            try:
+                stats = pipeline.run(sentences)
+                self.logger.info(
+                    f"Streamed {stats.played}/{stats.sentences} sentences, "
+                    f"time to first audio {stats.time_to_first_audio or 0:.2f}s"
+                )
+                return stats
+            finally:
+                with self._stream_lock:
+                    if self._active_stream is pipeline:
+                        self._active_stream = None
+
+        if blocking:
+            return _run()
+
+        def _safe_run():
+            try:
+                _run()
+            except Exception as e:
+                self.logger.error(f"Streaming playback failed in background: {e}")
+
+        thread = threading.Thread(target=_safe_run, daemon=True)
+        thread.start()
+        return None
+
     def _play_audio_blocking(self, audio: AudioSegment, output_device: str = None):
         """Play audio synchronously (blocking).
 
@@ -297,6 +418,12 @@ class TTSManager:
         """Stop any ongoing audio playback."""
         import time
 
+        # Cancel any sentence-streaming run so it doesn't start the next sentence
+        with self._stream_lock:
+            if self._active_stream is not None:
+                self._active_stream.cancel()
+                self._active_stream = None
+
         # Stop sounddevice playback
         try:
             import sounddevice as sd
@@ -455,6 +582,7 @@ class TTSManager:
         # Clear current provider to force recreation
         self._current_provider = None
         self._provider_instance = None
+        self._audio_cache.clear()
 
         self.logger.info("TTS settings updated")
 
@@ -0,0 +1,266 @@
+"""
+Sentence-streaming TTS pipeline.
+
+This module splits text into sentences, synthesizes them concurrently
+(with a bounded look-ahead) through a provider's ``synthesize`` method and
+plays each sentence as soon as it and all earlier sentences are ready.
+Playback of the first sentence therefore begins while later sentences are
+still rendering, instead of after the whole reply has been synthesized.
+
+A small LRU cache of synthesized audio keyed by
+``(provider, voice, language, text)`` lets repeated phrases (greetings,
+canned responses, replays from history) skip synthesis entirely.
+
+Usage:
+    pipeline = StreamingTTSPipeline(synthesize_fn, play_fn, max_concurrency=3)
+    stats = pipeline.run(split_sentences(text))
+    print(stats.time_to_first_audio)
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+from utils.structured_logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# A sentence ends at Latin terminators (plus closing quotes/brackets) followed by
+# whitespace, at CJK terminators, or at the end of the text
+_SENTENCE = re.compile(r'.+?(?:[.!?]+["\')\]]*(?=\s|$)|[。！？]+|$)', re.S)
+
+# Sentences shorter than this are merged into the following one so that
+# abbreviations and short interjections don't each become a synthesis call
+MIN_SENTENCE_CHARS = 20
+
+# Hard upper bound on a single chunk; longer sentences are split on commas/spaces
+MAX_SENTENCE_CHARS = 400
+
+CacheKey = Tuple[str, str, str, str]
+
+
+def split_sentences(text: str,
+                    min_chars: int = MIN_SENTENCE_CHARS,
+                    max_chars: int = MAX_SENTENCE_CHARS) -> List[str]:
+    """Split text into sentence-sized chunks suitable for streaming synthesis.
+
+    Args:
+        text: Text to split
+        min_chars: Fragments shorter than this are merged with the next one
+        max_chars: Chunks longer than this are broken at a comma or space
+
+    Returns:
+        List of non-empty chunks in reading order
+    """
+    if not text or not text.strip():
+        return []
+
+    raw = [part.strip() for part in _SENTENCE.findall(text.strip())]
+    raw = [part for part in raw if part]
+
+    # Merge short fragments forward
+    merged: List[str] = []
+    pending = ""
+    for part in raw:
+        pending = f"{pending} {part}".strip() if pending else part
+        if len(pending) >= min_chars:
+            merged.append(pending)
+            pending = ""
+    if pending:
+        if merged:
+            merged[-1] = f"{merged[-1]} {pending}"
+        else:
+            merged.append(pending)
+
+    # Break overly long sentences
+    chunks: List[str] = []
+    for sentence in merged:
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(", ", 0, max_chars)
+            if cut <= 0:
+                cut = sentence.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            else:
+                cut += 1
+            chunks.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if sentence:
+            chunks.append(sentence)
+
+    return chunks
+
+
+class TTSAudioCache:
+    """Thread-safe LRU cache of synthesized audio segments.
+
+    Keys are ``(provider, voice, language, text)`` tuples so that changing
+    any of the synthesis parameters produces a fresh rendering.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of audio segments to keep
+        """
+        self.max_entries = max(0, max_entries)
+        self._entries: "OrderedDict[CacheKey, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(provider: str, voice: Optional[str], language: Optional[str], text: str) -> CacheKey:
+        """Build a cache key from synthesis parameters."""
+        return (provider or "", voice or "", language or "", text)
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Return cached audio for key, or None on a miss."""
+        with self._lock:
+            audio = self._entries.get(key)
+            if audio is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return audio
+
+    def put(self, key: CacheKey, audio: Any) -> None:
+        """Store audio under key, evicting the least recently used entry if full."""
+        if self.max_entries == 0 or audio is None:
+            return
+        with self._lock:
+            self._entries[key] = audio
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached audio."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_stats(self) -> dict:
+        """Return cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+@dataclass
+class StreamingPlaybackStats:
+    """Timing results of a streaming synthesis/playback run."""
+    sentences: int = 0
+    played: int = 0
+    time_to_first_audio: Optional[float] = None
+    total_time: float = 0.0
+    cancelled: bool = False
+
+
+class StreamingTTSPipeline:
+    """Synthesize sentences concurrently and play them back in order.
+
+    At most ``max_concurrency`` sentences are rendering at any time, so a
+    very long reply never queues its whole text against the provider.
+    """
+
+    def __init__(self,
+                 synthesize_fn: Callable[[str], Any],
+                 play_fn: Callable[[Any], None],
+                 max_concurrency: int = 3,
+                 cancel_event: Optional[threading.Event] = None):
+        """Initialize the pipeline.
+
+        Args:
+            synthesize_fn: Callable that renders one sentence to audio
+            play_fn: Callable that plays one audio segment to completion
+            max_concurrency: Maximum number of sentences synthesized concurrently
+            cancel_event: Optional event that aborts the run when set
+        """
+        self.synthesize_fn = synthesize_fn
+        self.play_fn = play_fn
+        self.max_concurrency = max(1, max_concurrency)
+        self.cancel_event = cancel_event or threading.Event()
+
+    def cancel(self) -> None:
+        """Stop playback after the current sentence and drop pending work."""
+        self.cancel_event.set()
+
+    def run(self, sentences: List[str]) -> StreamingPlaybackStats:
+        """Synthesize and play the sentences, blocking until done or cancelled.
+
+        Args:
+            sentences: Sentence chunks in reading order
+
+        Returns:
+            StreamingPlaybackStats for the run
+
+        Raises:
+            Exception: The first synthesis or playback error encountered
+        """
+        stats = StreamingPlaybackStats(sentences=len(sentences))
+        start = time.perf_counter()
+        if not sentences:
+            return stats
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(sentences)),
+            thread_name_prefix="tts_stream"
+        )
+        in_flight: Deque[Future] = deque()
+        next_index = 0
+
+        def fill() -> None:
+            nonlocal next_index
+            while (next_index < len(sentences)
+                   and len(in_flight) < self.max_concurrency
+                   and not self.cancel_event.is_set()):
+                in_flight.append(executor.submit(self.synthesize_fn, sentences[next_index]))
+                next_index += 1
+
+        try:
+            fill()
+            while in_flight and not self.cancel_event.is_set():
+                audio = in_flight.popleft().result()
+                # Keep the renderers busy while this sentence plays
+                fill()
+                if self.cancel_event.is_set():
+                    break
+                if stats.time_to_first_audio is None:
+                    stats.time_to_first_audio = time.perf_counter() - start
+                self.play_fn(audio)
+                stats.played += 1
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+            stats.cancelled = self.cancel_event.is_set()
+            stats.total_time = time.perf_counter() - start
+
+        logger.debug(
+            f"Streamed {stats.played}/{stats.sentences} sentences, "
+            f"first audio after {stats.time_to_first_audio or 0:.3f}s"
+        )
+        return stats
+
+
+__all__ = [
+    "split_sentences",
+    "TTSAudioCache",
+    "StreamingPlaybackStats",
+    "StreamingTTSPipeline",
+]
@@ -4,8 +4,10 @@ Base Generators Module
 Provides streaming helpers and shared utilities for document generation.
 """
 
+import threading
+import time
 from tkinter.constants import DISABLED, NORMAL, RIGHT
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from utils.structured_logging import get_logger
 from utils.safe_ui import schedule_ui_update
@@ -15,40 +17,176 @@ logger = get_logger(__name__)
 if TYPE_CHECKING:
     from core.app import MedicalAssistantApp
 
+# One display frame at 60 Hz
+FRAME_INTERVAL_MS = 16
+# Longest gap between flushes when the UI is falling behind
+MAX_FRAME_INTERVAL_MS = 100
+# Buffered characters at which the streaming thread waits for the UI
+MAX_PENDING_CHARS = 32_000
+# Longest a streaming thread waits for one flush before carrying on
+BACKPRESSURE_TIMEOUT = 2.0
+
+
+class StreamingTextBuffer:
+    """Coalesces streamed chunks into one widget insert per display frame.
+
+    append() may be called from any thread; chunks are buffered and a
+    single flush is scheduled on the Tk main loop, which inserts all
+    pending text at once and scrolls to the end. A flush that takes long
+    stretches the interval to the next one so input events still get
+    through, and once MAX_PENDING_CHARS are waiting the streaming thread
+    blocks until the UI catches up.
+    """
+
+    def __init__(
+        self,
+        app,
+        widget,
+        frame_ms: int = FRAME_INTERVAL_MS,
+        max_pending_chars: int = MAX_PENDING_CHARS,
+    ):
+        """Initialize the buffer.
+
+        Args:
+            app: Widget whose after() schedules flushes on the main loop
+            widget: Text widget to append to
+            frame_ms: Minimum interval between flushes in milliseconds
+            max_pending_chars: Buffered characters that trigger backpressure
+        """
+        self.app = app
+        self.widget = widget
+        self.frame_ms = frame_ms
+        self.max_pending_chars = max_pending_chars
+        self.flush_count = 0
+
+        self._interval_ms = frame_ms
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._scheduled = False
+        self._closed = False
+        self._lock = threading.Lock()
+        self._drained = threading.Condition(self._lock)
+
+    @property
+    def pending_chars(self) -> int:
+        return self._pending_chars
+
+    def append(self, chunk: str) -> None:
+        """Buffer a chunk and make sure a flush is scheduled."""
+        if not chunk:
+            return
+
+        on_main_thread = threading.current_thread() is threading.main_thread()
+        with self._lock:
+            if self._closed:
+                return
+            # Backpressure: let the main loop drain before buffering more.
+            # The main thread cannot wait on itself, so it flushes below.
+            if not on_main_thread:
+                deadline = time.monotonic() + BACKPRESSURE_TIMEOUT
+                while self._pending_chars >= self.max_pending_chars and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._drained.wait(remaining)
+                if self._closed:
+                    return
+
+            self._pending.append(chunk)
+            self._pending_chars += len(chunk)
+            overfull = self._pending_chars >= self.max_pending_chars
+            if self._scheduled and not (on_main_thread and overfull):
+                return
+            self._scheduled = True
+            delay = self._interval_ms
+
+        if on_main_thread and overfull:
+            self.flush()
+            return
+
+        try:
+            self.app.after(delay, self.flush)
+        except Exception:
+            self.close()  # Main window destroyed
+
+    def flush(self) -> None:
+        """Insert all pending text in one go. Runs on the main thread."""
+        with self._lock:
+            text = "".join(self._pending)
+            self._pending.clear()
+            self._pending_chars = 0
+            self._scheduled = False
+            self._drained.notify_all()
+
+        if not text:
+            return
+
+        start = time.perf_counter()
+        widget = self.widget
+        try:
+            if not widget.winfo_exists():
+                self.close()
+                return
+            # Enable editing temporarily
+            current_state = widget.cget('state')
+            widget.configure(state='normal')
+            widget.insert('end', text)
+            # Auto-scroll to show new content
+            widget.see('end')
+            # Restore state if it was disabled
+            if current_state == 'disabled':
+                widget.configure(state='disabled')
+        except Exception as e:
+            logger.warning(f"Error appending streaming chunk: {e}")
+        self.flush_count += 1
+
+        # Leave the main loop at least three times the flush cost for
+        # other events before the next flush
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._interval_ms = int(min(MAX_FRAME_INTERVAL_MS, max(self.frame_ms, elapsed_ms * 4)))
+
+    def discard(self) -> None:
+        """Drop pending text, e.g. before the widget content is replaced."""
+        with self._lock:
+            self._pending.clear()
+            self._pending_chars = 0
+            self._drained.notify_all()
+
+    def close(self) -> None:
+        """Drop pending text and ignore further chunks."""
+        with self._lock:
+            self._closed = True
+            self._pending.clear()
+            self._pending_chars = 0
+            self._drained.notify_all()
+
 
 class StreamingMixin:
     """Mixin providing streaming display utilities for document generation."""
 
     app: "MedicalAssistantApp"  # Type hint for inherited attribute
 
+    def _stream_buffer(self, widget, create: bool = True) -> Optional[StreamingTextBuffer]:
+        """Get the frame-coalescing buffer for a widget."""
+        buffers = getattr(self, '_stream_buffers', None)
+        if buffers is None:
+            buffers = self._stream_buffers = {}
+        buffer = buffers.get(id(widget))
+        if buffer is None and create:
+            buffer = buffers[id(widget)] = StreamingTextBuffer(self.app, widget)
+        return buffer
+
     def _append_streaming_chunk(self, widget, chunk: str) -> None:
         """Append a chunk of text to widget during streaming.
 
         Thread-safe method to update text widget from streaming callback.
+        Chunks are buffered and written at most once per display frame.
 
         Args:
             widget: The text widget to update
             chunk: The text chunk to append
         """
-        def update():
-            try:
-                # Enable editing temporarily
-                current_state = widget.cget('state')
-                widget.configure(state='normal')
-                # Insert chunk at end
-                widget.insert('end', chunk)
-                # Auto-scroll to show new content
-                widget.see('end')
-                # Restore state if it was disabled
-                if current_state == 'disabled':
-                    widget.configure(state='disabled')
-                # Force update to show changes immediately
-                widget.update_idletasks()
-            except Exception as e:
-                logger.warning(f"Error appending streaming chunk: {e}")
-
-        # Schedule UI update on main thread (safe from worker threads)
-        schedule_ui_update(self.app, update)
+        self._stream_buffer(widget).append(chunk)
 
     def _start_streaming_display(self, widget, status_msg: str) -> None:
         """Prepare widget for streaming display.
@@ -57,6 +195,11 @@ class StreamingMixin:
             widget: The text widget to prepare
             status_msg: Status message to display
         """
+        # Drop anything still buffered from a previous stream
+        previous = getattr(self, '_stream_buffers', {}).pop(id(widget), None)
+        if previous is not None:
+            previous.close()
+
         def setup():
             try:
                 # Clear the widget
@@ -79,6 +222,10 @@ class StreamingMixin:
         """
         def finish():
             try:
+                # Write out the last buffered chunks
+                buffer = self._stream_buffer(widget, create=False)
+                if buffer is not None:
+                    buffer.flush()
                 # Add edit separator for undo history
                 widget.edit_separator()
                 # Stop progress
@@ -103,6 +250,11 @@ class StreamingMixin:
             widget: The text widget to update
             content: The new content to display
         """
+        # Buffered chunks are superseded by the new content
+        buffer = self._stream_buffer(widget, create=False)
+        if buffer is not None:
+            buffer.discard()
+
         try:
             widget.configure(state='normal')
             widget.delete('1.0', 'end')
@@ -133,4 +285,4 @@ class StreamingMixin:
             logger.error(f"Failed to update analysis panel: {e}")
 
 
-__all__ = ["StreamingMixin"]
+__all__ = ["StreamingMixin", "StreamingTextBuffer"]
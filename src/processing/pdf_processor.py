@@ -5,7 +5,9 @@ Extracts text from PDF files with OCR fallback for scanned documents.
 Uses pdfplumber for text-based PDFs and pytesseract for OCR.
 """
 
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional, Tuple
 from utils.structured_logging import get_logger
 
@@ -18,6 +20,9 @@ class PDFProcessor:
     # Minimum characters per page to consider PDF as text-based
     MIN_CHARS_PER_PAGE = 50
 
+    # Concurrent tesseract processes for scanned PDFs
+    OCR_WORKERS = min(4, os.cpu_count() or 1)
+
     def __init__(self):
         """Initialize the PDF processor."""
         self._pdfplumber_available = None
@@ -182,20 +187,21 @@ class PDFProcessor:
             Tuple of (extracted_text, page_count)
         """
         import pdfplumber
-
-        text_parts = []
-        page_count = 0
+        from rag.pdf_page_extractor import PDFPageExtractor
 
         with pdfplumber.open(file_path) as pdf:
             page_count = len(pdf.pages)
 
-            for i, page in enumerate(pdf.pages):
-                if progress_callback:
-                    progress_callback(f"Processing page {i + 1} of {page_count}...")
+        def report_pages(pages_done: int, total_pages: int):
+            if progress_callback:
+                progress_callback(f"Processing page {pages_done} of {total_pages}...")
 
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
+        # Pages are parsed in parallel and reassembled in order
+        text_parts = [
+            page.text
+            for page in PDFPageExtractor().iter_pages(file_path, page_count, progress_callback=report_pages)
+            if page.text
+        ]
 
         return "\n\n".join(text_parts), page_count
 
@@ -241,17 +247,19 @@ class PDFProcessor:
                 "  Windows: Download from https://github.com/oschwartz10612/poppler-windows"
             )
 
-        text_parts = []
         total_pages = len(images)
+        if progress_callback:
+            progress_callback(f"Running OCR on {total_pages} pages...")
 
-        for i, image in enumerate(images):
-            if progress_callback:
-                progress_callback(f"Running OCR on page {i + 1} of {total_pages}...")
-
-            # Run OCR on the image
-            page_text = pytesseract.image_to_string(image)
-            if page_text.strip():
-                text_parts.append(page_text.strip())
+        # Each call runs a tesseract subprocess, so threads OCR pages in
+        # parallel; map() keeps page order
+        text_parts = []
+        with ThreadPoolExecutor(max_workers=self.OCR_WORKERS) as pool:
+            for i, page_text in enumerate(pool.map(pytesseract.image_to_string, images)):
+                if progress_callback:
+                    progress_callback(f"Running OCR on page {i + 1} of {total_pages}...")
+                if page_text.strip():
+                    text_parts.append(page_text.strip())
 
         return "\n\n".join(text_parts)
 
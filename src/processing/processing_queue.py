@@ -294,6 +294,7 @@ class ProcessingQueue(
             # Add timestamp and task ID
             recording_data["task_id"] = task_id
             recording_data["queued_at"] = datetime.now()
+            recording_data["queued_perf"] = time.perf_counter()  # For queue-wait tracing
             recording_data["priority"] = recording_data.get("priority", 5)
             recording_data["retry_count"] = 0
             recording_data["status"] = "queued"
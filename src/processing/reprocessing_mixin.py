@@ -216,6 +216,7 @@ class ReprocessingMixin:
         def delayed_retry():
             time.sleep(delay)
             if not self.shutdown_event.is_set():
+                recording_data["queued_perf"] = time.perf_counter()
                 self.queue.put((recording_data["priority"] - 1, task_id, recording_data))
 
         threading.Thread(target=delayed_retry, daemon=True).start()
@@ -25,6 +25,7 @@ from utils.exceptions import (
     APITimeoutError,
 )
 from utils.structured_logging import get_logger
+from utils.tracing import get_tracer
 
 logger = get_logger(__name__)
 
@@ -40,9 +41,29 @@ class TaskExecutorMixin:
         if task_type == "guideline_upload":
             return self._process_guideline_upload(task_id, recording_data)
 
-        # Normal recording processing
+        # Normal recording processing, traced from the moment it was queued
+        tracer = get_tracer()
+        queued_perf = recording_data.get("queued_perf")
+        with tracer.span(
+            "recording_pipeline",
+            start=queued_perf,
+            task_id=task_id,
+            recording_id=recording_data.get("recording_id"),
+            attempt=recording_data.get("retry_count", 0) + 1,
+        ) as pipeline_span:
+            if queued_perf is not None:
+                tracer.record_span("queue_wait", queued_perf)
+            self._process_audio_recording(task_id, recording_data)
+            if recording_data.get("status") != "completed":
+                pipeline_span.set_error(
+                    recording_data.get("error_message") or recording_data.get("last_error") or "not completed"
+                )
+
+    def _process_audio_recording(self, task_id: str, recording_data: Dict[str, Any]):
+        """Transcribe a recording and generate its documents, handling failures."""
         start_time = time.time()
         recording_id = recording_data.get("recording_id")
+        tracer = get_tracer()
 
         try:
             logger.info("Starting processing for task", task_id=task_id, recording_id=recording_id)
@@ -72,7 +93,8 @@ class TaskExecutorMixin:
                 transcript = recording_data.get("transcript", "")
                 if not transcript and recording_data.get("audio_data"):
                     # Transcribe the audio
-                    transcript = self._transcribe_audio(task_id, recording_id, recording_data)
+                    with tracer.span("transcribe"):
+                        transcript = self._transcribe_audio(task_id, recording_id, recording_data)
 
                 else:
                     if transcript:
@@ -92,7 +114,8 @@ class TaskExecutorMixin:
                         context = recording_data.get("context", "")
                         if context:
                             logger.info("Including context in SOAP generation", context_length=len(context))
-                        soap_result = self._generate_soap_note(transcript, context)
+                        with tracer.span("generate_soap"):
+                            soap_result = self._generate_soap_note(transcript, context)
                         if soap_result:
                             results["soap_note"] = soap_result
                             # Update database
@@ -109,7 +132,8 @@ class TaskExecutorMixin:
 
                 # Generate referral if requested
                 if process_options.get("generate_referral") and results.get("soap_note"):
-                    referral_result = self._generate_referral(results["soap_note"])
+                    with tracer.span("generate_referral"):
+                        referral_result = self._generate_referral(results["soap_note"])
                     if referral_result:
                         results["referral"] = referral_result
                         # Update database
@@ -119,7 +143,8 @@ class TaskExecutorMixin:
                 if process_options.get("generate_letter"):
                     content = results.get("soap_note") or recording_data.get("transcript", "")
                     if content:
-                        letter_result = self._generate_letter(content)
+                        with tracer.span("generate_letter"):
+                            letter_result = self._generate_letter(content)
                         if letter_result:
                             results["letter"] = letter_result
                             # Update database
@@ -301,7 +326,8 @@ class TaskExecutorMixin:
             if hasattr(self.app, 'audio_handler'):
                 # Convert audio_data to list if needed
                 audio_segments = [audio_data] if not isinstance(audio_data, list) else audio_data
-                save_result = self.app.audio_handler.save_audio(audio_segments, audio_path)
+                with get_tracer().span("save_audio"):
+                    save_result = self.app.audio_handler.save_audio(audio_segments, audio_path)
                 logger.debug("Audio save result", save_result=save_result, audio_path=audio_path)
 
                 if save_result:
@@ -2,7 +2,8 @@
 BM25-style full-text search for RAG system.
 
 Uses PostgreSQL's ts_vector/ts_query for keyword-based search
-to complement vector similarity search.
+to complement vector similarity search. With the local vector
+backend, searches go to its SQLite FTS5 index instead.
 """
 
 from utils.structured_logging import get_logger
@@ -11,6 +12,7 @@ import re
 import threading
 from typing import Optional
 
+from rag.local_vector_store import LocalVectorStore
 from rag.search_config import SearchQualityConfig, get_search_quality_config
 
 logger = get_logger(__name__)
@@ -81,11 +83,15 @@ class BM25Searcher:
 
         try:
             vector_store = self._get_vector_store()
-            pool = vector_store._get_pool()
 
             # Build search query with expanded terms
             search_terms = self._build_search_query(query, expanded_terms)
 
+            if isinstance(vector_store, LocalVectorStore):
+                return self._search_local(vector_store, search_terms, top_k, filter_document_ids)
+
+            pool = vector_store._get_pool()
+
             with pool.connection() as conn:
                 with conn.cursor() as cur:
                     # Build SQL query using ts_vector search
@@ -174,6 +180,10 @@ class BM25Searcher:
 
         try:
             vector_store = self._get_vector_store()
+            if isinstance(vector_store, LocalVectorStore):
+                # FTS5 matching already ORs the terms together
+                return self.search(query, expanded_terms, top_k, filter_document_ids)
+
             pool = vector_store._get_pool()
 
             # Build websearch-style query
@@ -236,6 +246,27 @@ class BM25Searcher:
             # Fall back to simple search
             return self.search(query, expanded_terms, top_k, filter_document_ids)
 
+    def _search_local(
+        self,
+        vector_store: LocalVectorStore,
+        search_terms: str,
+        top_k: int,
+        filter_document_ids: Optional[list[str]],
+    ) -> list[BM25SearchResult]:
+        """Run the search against the local store's FTS5 index."""
+        results = [
+            BM25SearchResult(
+                document_id=r.document_id,
+                chunk_index=r.chunk_index,
+                chunk_text=r.chunk_text,
+                bm25_score=r.similarity_score,
+                metadata=r.metadata,
+            )
+            for r in vector_store.search_bm25(search_terms, top_k, filter_document_ids)
+        ]
+        logger.debug(f"BM25 search (local): '{search_terms}' -> {len(results)} results")
+        return results
+
     def _build_search_query(
         self,
         query: str,
@@ -317,6 +348,9 @@ class BM25Searcher:
         """
         try:
             vector_store = self._get_vector_store()
+            if isinstance(vector_store, LocalVectorStore):
+                return vector_store.has_search_vector_column()
+
             pool = vector_store._get_pool()
 
             with pool.connection() as conn:
@@ -15,8 +15,9 @@ import io
 from utils.structured_logging import get_logger
 import os
 import re
+import sqlite3
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 import tiktoken
 
@@ -27,6 +28,8 @@ from rag.models import (
     RAGDocument,
     UploadStatus,
 )
+from rag.extraction_cache import ExtractionCache, get_extraction_cache, hash_file
+from rag.pdf_page_extractor import PageProgressCallback, PageText, PDFPageExtractor
 
 logger = get_logger(__name__)
 
@@ -58,6 +61,7 @@ class DocumentProcessor:
         chunk_overlap_tokens: int = 50,
         encoding_name: str = "cl100k_base",
         ocr_language: str = "eng",
+        extraction_cache: Optional[ExtractionCache] = None,
     ):
         """Initialize the document processor.
 
@@ -66,10 +70,13 @@ class DocumentProcessor:
             chunk_overlap_tokens: Overlap between chunks in tokens
             encoding_name: Tiktoken encoding name for token counting
             ocr_language: Language code for OCR (e.g., 'eng', 'fra')
+            extraction_cache: Cache for extraction results (default: shared cache)
         """
         self.chunk_size_tokens = chunk_size_tokens
         self.chunk_overlap_tokens = chunk_overlap_tokens
         self.ocr_language = ocr_language
+        self._page_extractor = PDFPageExtractor()
+        self._extraction_cache = extraction_cache
 
         # Initialize tiktoken encoder
         try:
@@ -126,12 +133,18 @@ class DocumentProcessor:
         return EXTENSION_TO_TYPE.get(ext)
 
 
-    def extract_text(self, file_path: str, enable_ocr: bool = True) -> tuple[str, DocumentMetadata, int, bool]:
+    def extract_text(
+        self,
+        file_path: str,
+        enable_ocr: bool = True,
+        progress_callback: Optional[PageProgressCallback] = None,
+    ) -> tuple[str, DocumentMetadata, int, bool]:
         """Extract text from a document.
 
         Args:
             file_path: Path to the document
             enable_ocr: Whether to use OCR for scanned documents/images
+            progress_callback: Called with (pages_done, page_count) for PDFs
 
         Returns:
             Tuple of (extracted_text, metadata, page_count, ocr_was_used)
@@ -140,8 +153,27 @@ class DocumentProcessor:
         if not doc_type:
             raise ValueError(f"Unsupported file type: {file_path}")
 
+        if doc_type == DocumentType.TXT:
+            # Reading the file is as cheap as hashing it
+            return self._extract_from_txt(file_path)
+
+        mode = f"{doc_type.value}:ocr:{self._ocr_cache_tag()}" if enable_ocr else f"{doc_type.value}:text"
+        return self._cached_extraction(
+            file_path, mode,
+            lambda: self._extract_by_type(doc_type, file_path, enable_ocr, progress_callback),
+            progress_callback,
+        )
+
+    def _extract_by_type(
+        self,
+        doc_type: DocumentType,
+        file_path: str,
+        enable_ocr: bool,
+        progress_callback: Optional[PageProgressCallback],
+    ) -> tuple[str, DocumentMetadata, int, bool]:
+        """Run the extractor for a document type (no caching)."""
         if doc_type == DocumentType.PDF:
-            return self._extract_from_pdf(file_path, enable_ocr)
+            return self._extract_from_pdf(file_path, enable_ocr, progress_callback)
         elif doc_type == DocumentType.DOCX:
             return self._extract_from_docx(file_path)
         elif doc_type == DocumentType.TXT:
@@ -151,29 +183,140 @@ class DocumentProcessor:
         else:
             raise ValueError(f"Unsupported document type: {doc_type}")
 
-    def _extract_from_pdf(self, file_path: str, enable_ocr: bool) -> tuple[str, DocumentMetadata, int, bool]:
+    def _ocr_cache_tag(self) -> str:
+        """OCR provider, model and language; OCR text differs between them."""
+        provider = None
+        try:
+            ocr_manager = self._get_ocr_manager()
+            provider = ocr_manager.get_provider() if ocr_manager else None
+        except Exception as e:
+            logger.debug(f"OCR provider unavailable for cache key: {e}")
+        name = getattr(provider, "provider_name", None) or "none"
+        model = getattr(provider, "model_id", None) or ""
+        return f"{name}/{model}:{self.ocr_language}"
+
+    def _get_extraction_cache(self) -> Optional[ExtractionCache]:
+        """Get the extraction cache, or None if caching is disabled."""
+        if self._extraction_cache is None:
+            self._extraction_cache = get_extraction_cache()
+        return self._extraction_cache
+
+    def _cached_extraction(
+        self,
+        file_path: str,
+        mode: str,
+        extract: Callable[[], tuple[str, DocumentMetadata, int, bool]],
+        progress_callback: Optional[PageProgressCallback] = None,
+    ) -> tuple[str, DocumentMetadata, int, bool]:
+        """Return a cached extraction for the file's bytes, or extract and cache it.
+
+        Args:
+            file_path: Path to the document
+            mode: Extraction variant (results differ per mode for the same bytes)
+            extract: Performs the extraction on a miss
+            progress_callback: Reported complete on a hit
+
+        Returns:
+            Tuple of (text, metadata, page_count, ocr_used)
+        """
+        cache = self._get_extraction_cache()
+        if cache is None:
+            return extract()
+
+        try:
+            file_hash = hash_file(file_path)
+            cached = cache.get(file_hash, mode)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Extraction cache lookup failed: {e}")
+            return extract()
+
+        if cached is not None:
+            logger.info(
+                "Extraction cache hit",
+                file=os.path.basename(file_path), mode=mode, page_count=cached.page_count
+            )
+            if progress_callback and cached.page_count:
+                progress_callback(cached.page_count, cached.page_count)
+            metadata = DocumentMetadata(**cached.metadata)
+            metadata.file_hash = file_hash
+            return cached.text, metadata, cached.page_count, cached.ocr_used
+
+        text, metadata, page_count, ocr_used = extract()
+        # Recorded so deleting the document can drop its cached text
+        metadata.file_hash = file_hash
+        if text and text.strip():
+            try:
+                cache.put(file_hash, mode, text, metadata.model_dump(mode="json"), page_count, ocr_used)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to cache extraction: {e}")
+        return text, metadata, page_count, ocr_used
+
+    def _extract_from_pdf(
+        self,
+        file_path: str,
+        enable_ocr: bool,
+        progress_callback: Optional[PageProgressCallback] = None,
+    ) -> tuple[str, DocumentMetadata, int, bool]:
         """Extract text from PDF using pdfplumber, with OCR for scanned pages.
 
         Args:
             file_path: Path to PDF file
             enable_ocr: Whether to use OCR for scanned pages
+            progress_callback: Called with (pages_done, page_count)
 
         Returns:
             Tuple of (text, metadata, page_count, ocr_used)
         """
+        metadata, page_count = self._read_pdf_info(file_path)
+
+        text_parts = []
+        ocr_used = False
+        for page in self.iter_pdf_pages(file_path, enable_ocr, progress_callback, page_count=page_count):
+            ocr_used = ocr_used or page.ocr_used
+            if page.text:
+                text_parts.append(f"[Page {page.page_number}]\n{page.text}")
+
+        return "\n\n".join(text_parts), metadata, page_count, ocr_used
+
+    def iter_pdf_pages(
+        self,
+        file_path: str,
+        enable_ocr: bool = True,
+        progress_callback: Optional[PageProgressCallback] = None,
+        page_count: Optional[int] = None,
+    ) -> Iterator[PageText]:
+        """Yield a PDF's pages in order as they are extracted.
+
+        Pages are parsed in parallel and scanned pages are OCRed
+        concurrently (see PDFPageExtractor); each page is yielded as soon
+        as every earlier page is done.
+
+        Args:
+            file_path: Path to PDF file
+            enable_ocr: Whether to use OCR for scanned pages
+            progress_callback: Called with (pages_done, page_count)
+            page_count: Page count if already known
+
+        Yields:
+            PageText per page
+        """
+        if page_count is None:
+            _, page_count = self._read_pdf_info(file_path)
+
+        ocr_func = self._ocr_pil_image if enable_ocr else None
+        yield from self._page_extractor.iter_pages(file_path, page_count, ocr_func, progress_callback)
+
+    def _read_pdf_info(self, file_path: str) -> tuple[DocumentMetadata, int]:
+        """Read a PDF's document metadata and page count."""
         try:
             import pdfplumber
         except ImportError:
             raise ImportError("pdfplumber is required for PDF processing. Install with: pip install pdfplumber")
 
-        text_parts = []
-        ocr_used = False
         metadata = DocumentMetadata()
-
         with pdfplumber.open(file_path) as pdf:
             page_count = len(pdf.pages)
 
-            # Extract metadata
             if pdf.metadata:
                 metadata.title = pdf.metadata.get("Title")
                 metadata.author = pdf.metadata.get("Author")
@@ -181,21 +324,7 @@ class DocumentProcessor:
                 if pdf.metadata.get("Keywords"):
                     metadata.keywords = [k.strip() for k in pdf.metadata.get("Keywords", "").split(",") if k.strip()]
 
-            for i, page in enumerate(pdf.pages):
-                page_text = page.extract_text() or ""
-
-                # Check if page might be scanned (very little text extracted)
-                if enable_ocr and len(page_text.strip()) < 50:
-                    # Try OCR
-                    ocr_text = self._ocr_pdf_page(page)
-                    if ocr_text and len(ocr_text) > len(page_text):
-                        page_text = ocr_text
-                        ocr_used = True
-
-                if page_text:
-                    text_parts.append(f"[Page {i + 1}]\n{page_text}")
-
-        return "\n\n".join(text_parts), metadata, page_count, ocr_used
+        return metadata, page_count
 
     def _ocr_pdf_page(self, page) -> str:
         """Perform OCR on a PDF page using Azure Document Intelligence.
@@ -215,9 +344,22 @@ class DocumentProcessor:
         try:
             # Convert page to image
             img = page.to_image(resolution=300)
-            pil_image = img.original
+            return self._ocr_pil_image(img.original)
+
+        except Exception as e:
+            logger.warning(f"OCR failed for page: {e}")
+            return ""
+
+    def _ocr_pil_image(self, pil_image) -> str:
+        """Perform OCR on a rendered page image.
 
-            # Use OCR provider manager
+        Args:
+            pil_image: PIL Image of the page
+
+        Returns:
+            OCR extracted text
+        """
+        try:
             ocr_manager = self._get_ocr_manager()
             if ocr_manager:
                 result = ocr_manager.extract_from_pil_image(pil_image)
@@ -346,7 +488,10 @@ class DocumentProcessor:
         return "", metadata, 1, False
 
     def extract_text_with_layout(
-        self, file_path: str, enable_ocr: bool = True
+        self,
+        file_path: str,
+        enable_ocr: bool = True,
+        progress_callback: Optional[PageProgressCallback] = None,
     ) -> tuple[str, DocumentMetadata, int, bool]:
         """Extract text using Azure Document Intelligence prebuilt-layout model.
 
@@ -357,28 +502,29 @@ class DocumentProcessor:
         Args:
             file_path: Path to the document (PDF recommended)
             enable_ocr: Whether to use OCR
+            progress_callback: Passed to extract_text() on fallback
 
         Returns:
             Tuple of (extracted_text, metadata, page_count, ocr_was_used)
         """
         if not enable_ocr:
-            return self.extract_text(file_path, enable_ocr=False)
+            return self.extract_text(file_path, enable_ocr=False, progress_callback=progress_callback)
 
         try:
             from azure.ai.documentintelligence import DocumentIntelligenceClient
             from azure.core.credentials import AzureKeyCredential
         except ImportError:
             logger.debug("Azure Document Intelligence SDK not installed, falling back to standard extraction")
-            return self.extract_text(file_path, enable_ocr=enable_ocr)
+            return self.extract_text(file_path, enable_ocr=enable_ocr, progress_callback=progress_callback)
 
         endpoint = os.environ.get("AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT")
         key = os.environ.get("AZURE_DOCUMENT_INTELLIGENCE_KEY")
 
         if not endpoint or not key:
             logger.debug("Azure Document Intelligence not configured, falling back to standard extraction")
-            return self.extract_text(file_path, enable_ocr=enable_ocr)
+            return self.extract_text(file_path, enable_ocr=enable_ocr, progress_callback=progress_callback)
 
-        try:
+        def analyze() -> tuple[str, DocumentMetadata, int, bool]:
             client = DocumentIntelligenceClient(
                 endpoint=endpoint, credential=AzureKeyCredential(key)
             )
@@ -427,9 +573,13 @@ class DocumentProcessor:
             )
             return full_text, metadata, page_count, True
 
+        try:
+            return self._cached_extraction(
+                file_path, f"layout:ocr:{self._ocr_cache_tag()}", analyze, progress_callback
+            )
         except Exception as e:
             logger.warning(f"Azure layout extraction failed, falling back: {e}")
-            return self.extract_text(file_path, enable_ocr=enable_ocr)
+            return self.extract_text(file_path, enable_ocr=enable_ocr, progress_callback=progress_callback)
 
     @staticmethod
     def _inject_markdown_tables(table) -> str:
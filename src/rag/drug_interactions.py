@@ -0,0 +1,459 @@
+"""
+Local drug-interaction knowledge base.
+
+Resolves drug-drug interactions from the ``drug_interactions`` table before
+anything is sent to an LLM. Medication lists are normalized (dose, route and
+salt stripped, brand names mapped to generics) and expanded into unordered
+pairs, and all pairs are looked up in one indexed query per batch.
+
+The table can be filled from a local interaction dataset - a CSV/TSV file
+with one row per pair, e.g. a DDInter export (``Drug_A, Drug_B, Level``) or
+a file with ``drug1, drug2, severity, description, management`` columns.
+
+Usage:
+    from rag.drug_interactions import get_drug_interaction_kb
+
+    kb = get_drug_interaction_kb()
+    check = kb.check(["Warfarin 5mg", "Aspirin 81mg", "Metformin"])
+    check.known       # DrugInteraction rows from the table
+    check.unresolved  # pairs the table has no answer for
+"""
+
+import csv
+import hashlib
+import itertools
+import os
+import re
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from rag.medical_dictionaries import MEDICATIONS_DICT
+from utils.structured_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Severity values allowed by the drug_interactions table, most severe first
+SEVERITIES = ("contraindicated", "major", "moderate", "minor")
+MAJOR_SEVERITIES = frozenset(("contraindicated", "major"))
+
+# Dataset spellings mapped onto table severities
+_SEVERITY_ALIASES = {
+    "contraindicated": "contraindicated",
+    "contraindication": "contraindicated",
+    "major": "major",
+    "severe": "major",
+    "serious": "major",
+    "high": "major",
+    "moderate": "moderate",
+    "medium": "moderate",
+    "minor": "minor",
+    "low": "minor",
+}
+
+# Dataset column names (lower-cased, spaces as underscores) per field
+_COLUMN_ALIASES = {
+    "drug1": ("drug1_name", "drug1", "drug_1", "drug_a", "drug_name_1"),
+    "drug2": ("drug2_name", "drug2", "drug_2", "drug_b", "drug_name_2"),
+    "severity": ("severity", "level", "interaction_level"),
+    "description": ("description", "interaction", "interaction_description"),
+    "clinical_significance": ("clinical_significance", "significance", "effect"),
+    "management": ("management", "recommendation", "action"),
+}
+
+# Words that end the drug name in an order line ("metformin ER 500 mg PO BID");
+# before the name ("IV heparin") they are skipped
+_FORM_WORDS = frozenset((
+    "tablet", "tablets", "tab", "tabs", "capsule", "capsules", "cap", "caps",
+    "solution", "suspension", "injection", "inj", "cream", "ointment", "patch",
+    "er", "xr", "sr", "xl", "ir", "dr", "ec", "odt",
+    "po", "iv", "im", "sc", "subq", "sq", "sl", "pr", "oral", "topical",
+    "daily", "bid", "tid", "qid", "qd", "qhs", "prn", "once", "twice",
+))
+
+# Salt forms dropped from the end of a name ("metoprolol succinate")
+_SALT_WORDS = frozenset((
+    "hydrochloride", "hcl", "sodium", "potassium", "calcium", "magnesium",
+    "succinate", "tartrate", "besylate", "maleate", "mesylate", "sulfate",
+    "citrate", "acetate", "phosphate", "bromide", "fumarate",
+))
+
+_PAREN_RE = re.compile(r"\([^)]*\)")
+_PUNCT_RE = re.compile(r"[^a-z0-9\s\-/#]")
+# Numbered combination products ("Tylenol #3" contains codeine)
+_PRODUCT_NUMBER_RE = re.compile(r"#\s*(\d+)")
+
+# SQLite parameter limit is 999 on older builds; each pair binds 4 values
+PAIR_QUERY_BATCH = 200
+
+DrugPair = tuple[str, str]
+
+
+def normalize_drug_name(name: str) -> str:
+    """Reduce a medication string to a lower-case generic name.
+
+    Strips parentheticals, dose, form, route and frequency, trailing salt
+    forms, and maps known brand names to their generic. The first name
+    word is always kept, so names starting with a digit ("5-fluorouracil")
+    survive; a product number ("Tylenol #3") stays part of the name.
+
+    Args:
+        name: Medication as written ("Lipitor 20mg PO daily")
+
+    Returns:
+        Normalized name ("atorvastatin"), or "" if nothing is left
+    """
+    text = _PRODUCT_NUMBER_RE.sub(r" #\1", name.lower())
+    text = _PUNCT_RE.sub(" ", _PAREN_RE.sub(" ", text))
+    tokens = [t for t in text.split() if t.strip("#")]
+    start = 0
+    while start < len(tokens) - 1 and tokens[start] in _FORM_WORDS:
+        start += 1
+    words = tokens[start:start + 1]
+    for word in tokens[start + 1:]:
+        if word.startswith("#"):
+            words.append(word)
+            continue
+        if word[0].isdigit() or word in _FORM_WORDS:
+            break
+        words.append(word)
+    while len(words) > 1 and words[-1] in _SALT_WORDS:
+        words.pop()
+    text = " ".join(words)
+    return MEDICATIONS_DICT.get(text, text)
+
+
+def _drug_names(medications: Iterable[str]) -> tuple[list[str], list[str]]:
+    """Normalized names of a medication list, plus the inputs that did not normalize.
+
+    An input that normalizes to "" is kept under its raw lower-cased
+    spelling so it is still paired (and left unresolved) rather than lost.
+    """
+    names = set()
+    unnormalized = []
+    for medication in medications:
+        name = normalize_drug_name(medication)
+        if not name:
+            name = " ".join(medication.lower().split())
+            if not name:
+                continue
+            unnormalized.append(medication)
+        names.add(name)
+    return sorted(names), unnormalized
+
+
+def interaction_pairs(medications: Iterable[str]) -> list[DrugPair]:
+    """Normalize a medication list and expand it into unordered pairs.
+
+    Duplicates after normalization (e.g. brand and generic) collapse into
+    one drug. Each pair is ordered alphabetically. No medication is
+    dropped; see _drug_names().
+    """
+    names, _ = _drug_names(medications)
+    return list(itertools.combinations(names, 2))
+
+
+def normalize_severity(value: str) -> Optional[str]:
+    """Map a dataset severity label onto the table's severities."""
+    return _SEVERITY_ALIASES.get((value or "").strip().lower())
+
+
+@dataclass
+class DrugInteraction:
+    """A known interaction between two drugs."""
+    drug1: str
+    drug2: str
+    severity: str
+    description: Optional[str] = None
+    clinical_significance: Optional[str] = None
+    management: Optional[str] = None
+    source: Optional[str] = None
+
+    @property
+    def pair(self) -> DrugPair:
+        return (self.drug1, self.drug2) if self.drug1 <= self.drug2 else (self.drug2, self.drug1)
+
+    @property
+    def is_major(self) -> bool:
+        return self.severity in MAJOR_SEVERITIES
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class InteractionCheck:
+    """Result of resolving a medication list against the knowledge base."""
+    medications: list[str]
+    known: list[DrugInteraction] = field(default_factory=list)
+    unresolved: list[DrugPair] = field(default_factory=list)
+    # Inputs that did not normalize; paired under their raw spelling
+    unnormalized: list[str] = field(default_factory=list)
+
+    @property
+    def pair_count(self) -> int:
+        return len(self.known) + len(self.unresolved)
+
+    @property
+    def has_major(self) -> bool:
+        return any(i.is_major for i in self.known)
+
+
+def _severity_rank(interaction: DrugInteraction) -> int:
+    try:
+        return SEVERITIES.index(interaction.severity)
+    except ValueError:
+        return len(SEVERITIES)
+
+
+def iter_interaction_dataset(path: str) -> Iterator[DrugInteraction]:
+    """Read interactions from a CSV/TSV dataset.
+
+    Rows without both drug names or with an unrecognized severity (e.g.
+    DDInter's "Unknown") are skipped.
+
+    Args:
+        path: Dataset file; tab-delimited if it ends in .tsv or .txt
+
+    Yields:
+        DrugInteraction with normalized drug names
+    """
+    delimiter = "\t" if path.lower().endswith((".tsv", ".txt")) else ","
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f, delimiter=delimiter)
+        headers = {
+            (h or "").strip().lower().replace(" ", "_"): h for h in (reader.fieldnames or [])
+        }
+        columns = {
+            name: next((headers[a] for a in aliases if a in headers), None)
+            for name, aliases in _COLUMN_ALIASES.items()
+        }
+        if not (columns["drug1"] and columns["drug2"] and columns["severity"]):
+            raise ValueError(f"{path}: expected drug1, drug2 and severity columns")
+
+        for row in reader:
+            drug1 = normalize_drug_name(row.get(columns["drug1"]) or "")
+            drug2 = normalize_drug_name(row.get(columns["drug2"]) or "")
+            severity = normalize_severity(row.get(columns["severity"]))
+            if not drug1 or not drug2 or drug1 == drug2 or severity is None:
+                continue
+            if drug2 < drug1:
+                drug1, drug2 = drug2, drug1
+            yield DrugInteraction(
+                drug1=drug1,
+                drug2=drug2,
+                severity=severity,
+                description=(row.get(columns["description"]) or None) if columns["description"] else None,
+                clinical_significance=(
+                    (row.get(columns["clinical_significance"]) or None)
+                    if columns["clinical_significance"] else None
+                ),
+                management=(row.get(columns["management"]) or None) if columns["management"] else None,
+            )
+
+
+def dataset_fingerprint(path: str) -> str:
+    """Identify a dataset file version by path, size and modification time."""
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}|{stat.st_size}|{int(stat.st_mtime)}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+class DrugInteractionKB:
+    """Pairwise drug-interaction lookups against the drug_interactions table."""
+
+    def __init__(self, db_manager=None):
+        """Initialize the knowledge base.
+
+        Args:
+            db_manager: DatabaseConnectionManager (defaults to the app database)
+        """
+        self._db = db_manager
+
+    def _get_db(self):
+        if self._db is None:
+            from database.db_pool import get_db_manager
+            self._db = get_db_manager()
+        return self._db
+
+    def lookup(self, pairs: Iterable[DrugPair]) -> dict[DrugPair, DrugInteraction]:
+        """Resolve normalized pairs from the table.
+
+        Each batch of PAIR_QUERY_BATCH pairs is one query on the
+        (drug1_name, drug2_name) index; both orientations are matched.
+
+        Args:
+            pairs: Alphabetically ordered pairs from interaction_pairs()
+
+        Returns:
+            Known interactions keyed by pair; pairs without a row are absent
+        """
+        pairs = list(dict.fromkeys(pairs))
+        found: dict[DrugPair, DrugInteraction] = {}
+        for start in range(0, len(pairs), PAIR_QUERY_BATCH):
+            for interaction in self._fetch(pairs[start:start + PAIR_QUERY_BATCH]):
+                pair = interaction.pair
+                current = found.get(pair)
+                if current is None or _severity_rank(interaction) < _severity_rank(current):
+                    found[pair] = interaction
+        return found
+
+    def _fetch(self, pairs: list[DrugPair]) -> list[DrugInteraction]:
+        """Read the rows for a batch of pairs in a single query."""
+        values = ", ".join("(?, ?)" for _ in range(len(pairs) * 2))
+        params = tuple(value for a, b in pairs for value in (a, b, b, a))
+        rows = self._get_db().fetchall(
+            f"""WITH wanted(drug1_name, drug2_name) AS (VALUES {values})
+                SELECT d.drug1_name, d.drug2_name, d.severity, d.description,
+                       d.clinical_significance, d.management, d.source
+                FROM wanted
+                JOIN drug_interactions d
+                  ON d.drug1_name = wanted.drug1_name
+                 AND d.drug2_name = wanted.drug2_name""",
+            params
+        )
+        return [DrugInteraction(*row) for row in rows if row[2]]
+
+    def check(self, medications: Iterable[str]) -> InteractionCheck:
+        """Resolve every pair in a medication list.
+
+        Args:
+            medications: Medication strings as written
+
+        Returns:
+            InteractionCheck with known interactions (most severe first)
+            and the pairs the table could not answer
+        """
+        names, unnormalized = _drug_names(medications)
+        pairs = list(itertools.combinations(names, 2))
+        found = self.lookup(pairs)
+        known = sorted(found.values(), key=lambda i: (_severity_rank(i), i.pair))
+        return InteractionCheck(
+            medications=names,
+            known=known,
+            unresolved=[pair for pair in pairs if pair not in found],
+            unnormalized=unnormalized,
+        )
+
+    def import_dataset(self, path: str, source: Optional[str] = None) -> int:
+        """Load a local interaction dataset into the table.
+
+        Rows previously imported from the same source are replaced; rows
+        from other sources and manual entries are kept. Existing pairs are
+        updated in place.
+
+        Args:
+            path: CSV/TSV dataset file
+            source: Source label stored on each row (default: file name)
+
+        Returns:
+            Number of interactions imported
+        """
+        source = source or Path(path).name
+        interactions = {i.pair: i for i in iter_interaction_dataset(path)}
+        rows = [
+            (i.drug1, i.drug2, i.severity, i.description, i.clinical_significance, i.management, source)
+            for i in interactions.values()
+        ]
+
+        db = self._get_db()
+        with db.transaction() as conn:
+            conn.execute("DELETE FROM drug_interactions WHERE source = ?", (source,))
+            conn.executemany(
+                """INSERT INTO drug_interactions
+                       (drug1_name, drug2_name, severity, description,
+                        clinical_significance, management, source)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(drug1_name, drug2_name) DO UPDATE SET
+                       severity = excluded.severity,
+                       description = excluded.description,
+                       clinical_significance = excluded.clinical_significance,
+                       management = excluded.management,
+                       source = excluded.source""",
+                rows
+            )
+            conn.execute(
+                """INSERT INTO drug_interaction_imports (source, fingerprint, row_count, imported_at)
+                   VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                   ON CONFLICT(source) DO UPDATE SET
+                       fingerprint = excluded.fingerprint,
+                       row_count = excluded.row_count,
+                       imported_at = excluded.imported_at""",
+                (source, dataset_fingerprint(path), len(rows))
+            )
+
+        logger.info(f"Imported {len(rows)} drug interactions from {source}")
+        return len(rows)
+
+    def imported_fingerprint(self, source: str) -> Optional[str]:
+        """Fingerprint of the last import from a source, if any."""
+        row = self._get_db().fetchone(
+            "SELECT fingerprint FROM drug_interaction_imports WHERE source = ?", (source,)
+        )
+        return row[0] if row else None
+
+
+# Global instance with thread-safe initialization
+_drug_interaction_kb: Optional[DrugInteractionKB] = None
+_drug_interaction_kb_initialized = False
+_drug_interaction_kb_lock = threading.Lock()
+
+
+def _create_from_settings() -> Optional[DrugInteractionKB]:
+    """Build the shared knowledge base, importing the configured dataset if it changed."""
+    try:
+        from settings.settings_manager import settings_manager
+        kb_settings = settings_manager.get("drug_interactions", {}) or {}
+    except Exception:
+        kb_settings = {}
+
+    if not kb_settings.get("enabled", True):
+        return None
+
+    kb = DrugInteractionKB()
+    dataset_path = kb_settings.get("dataset_path") or None
+    if dataset_path:
+        try:
+            if kb.imported_fingerprint(Path(dataset_path).name) != dataset_fingerprint(dataset_path):
+                kb.import_dataset(dataset_path)
+        except Exception as e:
+            logger.warning(f"Drug interaction dataset not imported: {e}")
+    return kb
+
+
+def get_drug_interaction_kb() -> Optional[DrugInteractionKB]:
+    """Get the process-wide DrugInteractionKB, or None if disabled.
+
+    Thread-safe implementation using double-checked locking pattern.
+    """
+    global _drug_interaction_kb, _drug_interaction_kb_initialized
+    if not _drug_interaction_kb_initialized:
+        with _drug_interaction_kb_lock:
+            if not _drug_interaction_kb_initialized:
+                _drug_interaction_kb = _create_from_settings()
+                _drug_interaction_kb_initialized = True
+    return _drug_interaction_kb
+
+
+def reset_drug_interaction_kb() -> None:
+    """Forget the shared knowledge base (settings changes, tests)."""
+    global _drug_interaction_kb, _drug_interaction_kb_initialized
+    with _drug_interaction_kb_lock:
+        _drug_interaction_kb = None
+        _drug_interaction_kb_initialized = False
+
+
+__all__ = [
+    "DrugInteraction",
+    "DrugInteractionKB",
+    "InteractionCheck",
+    "SEVERITIES",
+    "dataset_fingerprint",
+    "get_drug_interaction_kb",
+    "interaction_pairs",
+    "iter_interaction_dataset",
+    "normalize_drug_name",
+    "normalize_severity",
+    "reset_drug_interaction_kb",
+]
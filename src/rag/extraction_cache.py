@@ -0,0 +1,281 @@
+"""
+Content-addressed cache for document text extraction.
+
+Text extraction (and especially OCR) is the most expensive step of
+document and guideline ingest. Results are cached under the SHA-256 of
+the file's bytes, so re-uploading the same file - a retried batch, a
+re-ingest with different chunking settings, or a copy under a different
+name - skips extraction entirely and the content-hash duplicate checks
+run before any OCR is paid for.
+
+Extracted text may contain PHI, so it is encrypted at rest with the
+installation's key storage cipher when one is available.
+
+Usage:
+    from rag.extraction_cache import get_extraction_cache, hash_file
+
+    cache = get_extraction_cache()
+    entry = cache.get(hash_file(path), "pdf:text") if cache else None
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from utils.structured_logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_ENTRIES = 200
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def hash_file(file_path: str) -> str:
+    """SHA-256 of a file's bytes, read in 1 MB chunks.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class CachedExtraction:
+    """A cached extraction result."""
+    text: str
+    metadata: Dict[str, Any]
+    page_count: int
+    ocr_used: bool
+    created_at: float
+
+
+class ExtractionCache:
+    """SQLite store of extraction results keyed by (file hash, extraction mode).
+
+    The mode distinguishes results that differ for the same bytes, e.g.
+    layout extraction (markdown tables) vs plain text, or OCR on vs off.
+    """
+
+    def __init__(self, db_path: Path, cipher=None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Initialize the cache.
+
+        Args:
+            db_path: SQLite file for the cache
+            cipher: Object with encrypt_data/decrypt_data (plaintext if None)
+            max_entries: Maximum cached extractions (least recently used dropped)
+        """
+        self._cipher = cipher
+        self._max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS extraction_cache (
+                file_hash TEXT NOT NULL,
+                mode TEXT NOT NULL,
+                text BLOB NOT NULL,
+                metadata_json TEXT NOT NULL,
+                page_count INTEGER NOT NULL,
+                ocr_used INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL,
+                PRIMARY KEY (file_hash, mode)
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_extraction_cache_accessed ON extraction_cache(last_accessed)"
+        )
+        self._conn.commit()
+
+    def _encode(self, text: str) -> bytes:
+        data = text.encode("utf-8")
+        return self._cipher.encrypt_data(data) if self._cipher else data
+
+    def _decode(self, blob: bytes) -> str:
+        data = self._cipher.decrypt_data(bytes(blob)) if self._cipher else bytes(blob)
+        return data.decode("utf-8")
+
+    def get(self, file_hash: str, mode: str) -> Optional[CachedExtraction]:
+        """Return the cached extraction for a file hash and mode, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, metadata_json, page_count, ocr_used, created_at "
+                "FROM extraction_cache WHERE file_hash = ? AND mode = ?",
+                (file_hash, mode)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE extraction_cache SET last_accessed = ? WHERE file_hash = ? AND mode = ?",
+                (time.time(), file_hash, mode)
+            )
+            self._conn.commit()
+
+        try:
+            text = self._decode(row[0])
+        except Exception as e:
+            # Cipher changed (e.g. new master key) - treat as a miss
+            logger.debug(f"Discarding undecryptable extraction cache entry: {e}")
+            self.delete(file_hash)
+            return None
+        return CachedExtraction(text, json.loads(row[1]), row[2], bool(row[3]), row[4])
+
+    def put(
+        self,
+        file_hash: str,
+        mode: str,
+        text: str,
+        metadata: Dict[str, Any],
+        page_count: int,
+        ocr_used: bool,
+    ) -> None:
+        """Store an extraction result, evicting least recently used entries."""
+        blob = self._encode(text)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO extraction_cache "
+                "(file_hash, mode, text, metadata_json, page_count, ocr_used, created_at, last_accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (file_hash, mode, blob, json.dumps(metadata, default=str), page_count, int(ocr_used), now, now)
+            )
+            self._conn.execute(
+                "DELETE FROM extraction_cache WHERE rowid IN ("
+                "SELECT rowid FROM extraction_cache ORDER BY last_accessed DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,)
+            )
+            self._conn.commit()
+
+    def delete(self, file_hash: str) -> None:
+        """Drop every cached mode for a file hash."""
+        with self._lock:
+            self._conn.execute("DELETE FROM extraction_cache WHERE file_hash = ?", (file_hash,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Drop all cached extractions."""
+        with self._lock:
+            self._conn.execute("DELETE FROM extraction_cache")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM extraction_cache").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# Global instance with thread-safe initialization
+_extraction_cache: Optional[ExtractionCache] = None
+_extraction_cache_initialized = False
+_extraction_cache_lock = threading.Lock()
+
+
+def _create_from_settings() -> Optional[ExtractionCache]:
+    """Build the shared cache from the "extraction_cache" settings block."""
+    try:
+        from settings.settings_manager import settings_manager
+        cache_settings = settings_manager.get("extraction_cache", {}) or {}
+    except Exception:
+        cache_settings = {}
+
+    if not cache_settings.get("enabled", True):
+        return None
+
+    try:
+        from managers.data_folder_manager import data_folder_manager
+        db_path = data_folder_manager.data_folder / "extraction_cache.db"
+    except Exception as e:
+        logger.warning(f"Extraction cache disabled: {e}")
+        return None
+
+    cipher = None
+    try:
+        from utils.security import get_security_manager
+        cipher = get_security_manager().key_storage
+    except Exception as e:
+        logger.warning(f"Extraction cache will store text unencrypted: {e}")
+
+    try:
+        return ExtractionCache(
+            db_path,
+            cipher=cipher,
+            max_entries=cache_settings.get("max_entries", DEFAULT_MAX_ENTRIES),
+        )
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Extraction cache unavailable: {e}")
+        return None
+
+
+def get_extraction_cache() -> Optional[ExtractionCache]:
+    """Get the process-wide ExtractionCache, or None if disabled.
+
+    Thread-safe implementation using double-checked locking pattern.
+    """
+    global _extraction_cache, _extraction_cache_initialized
+    if not _extraction_cache_initialized:
+        with _extraction_cache_lock:
+            if not _extraction_cache_initialized:
+                _extraction_cache = _create_from_settings()
+                _extraction_cache_initialized = True
+    return _extraction_cache
+
+
+def forget_extraction(file_hash: Optional[str] = None, file_path: Optional[str] = None) -> None:
+    """Drop a deleted document's cached text from the shared cache.
+
+    Extracted text may contain PHI, so it should not outlive the document.
+    Documents ingested before the hash was recorded are identified by
+    hashing their stored file, if it still exists.
+
+    Args:
+        file_hash: Hash recorded at ingest (DocumentMetadata.file_hash)
+        file_path: Stored source file, used when no hash was recorded
+    """
+    cache = get_extraction_cache()
+    if cache is None:
+        return
+    try:
+        if not file_hash and file_path and Path(file_path).is_file():
+            file_hash = hash_file(file_path)
+        if file_hash:
+            cache.delete(file_hash)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Failed to drop cached extraction: {e}")
+
+
+def reset_extraction_cache() -> None:
+    """Close and forget the shared cache (settings changes, tests)."""
+    global _extraction_cache, _extraction_cache_initialized
+    with _extraction_cache_lock:
+        if _extraction_cache is not None:
+            _extraction_cache.close()
+        _extraction_cache = None
+        _extraction_cache_initialized = False
+
+
+__all__ = [
+    "CachedExtraction",
+    "ExtractionCache",
+    "forget_extraction",
+    "get_extraction_cache",
+    "hash_file",
+    "reset_extraction_cache",
+]
@@ -5,15 +5,36 @@ Manages user feedback (upvote/downvote) and relevance score adjustments
 for search results.
 """
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Iterable, Optional
 
 from utils.structured_logging import get_logger
 
 logger = get_logger(__name__)
 
+ChunkKey = tuple[str, int]
+
+# Bumped on every feedback write in this process. Boost caches remember the
+# version they were filled at and drop their entries when it moves, so a
+# write through one manager is seen by every other instance.
+_feedback_version = 0
+_feedback_version_lock = threading.Lock()
+
+
+def _bump_feedback_version() -> None:
+    global _feedback_version
+    with _feedback_version_lock:
+        _feedback_version += 1
+
+
+def get_feedback_version() -> int:
+    """Counter that changes whenever feedback is recorded or removed."""
+    return _feedback_version
+
 
 class FeedbackType(str, Enum):
     """Types of user feedback."""
@@ -82,6 +103,8 @@ class RAGFeedbackManager:
     MIN_FEEDBACK_FOR_BOOST = 3  # Minimum feedback count for full confidence
     FLAG_PENALTY = 0.5        # Penalty multiplier for flagged content
     CONFIDENCE_DECAY = 0.9    # Decay factor for older feedback (per week)
+    MAX_CACHED_BOOSTS = 4096  # LRU bound on cached per-chunk boosts
+    BOOST_QUERY_BATCH = 400   # (document_id, chunk_index) pairs per lookup query
 
     def __init__(self, db_manager=None):
         """Initialize the feedback manager.
@@ -90,7 +113,9 @@ class RAGFeedbackManager:
             db_manager: Database manager for persistence
         """
         self._db = db_manager
-        self._boost_cache: dict[tuple[str, int], RelevanceBoost] = {}
+        self._boost_cache: OrderedDict[ChunkKey, RelevanceBoost] = OrderedDict()
+        self._cache_version = _feedback_version
+        self._cache_lock = threading.Lock()
 
     def record_feedback(
         self,
@@ -141,10 +166,8 @@ class RAGFeedbackManager:
             # Update aggregates
             self._update_aggregates(document_id, chunk_index)
 
-            # Invalidate cache for this chunk
-            cache_key = (document_id, chunk_index)
-            if cache_key in self._boost_cache:
-                del self._boost_cache[cache_key]
+            # Invalidate cached boosts in every manager
+            _bump_feedback_version()
 
             logger.info(
                 f"Recorded {feedback_type.value} feedback for {document_id}:{chunk_index}"
@@ -188,14 +211,15 @@ class RAGFeedbackManager:
             self._db.execute(
                 """INSERT INTO rag_feedback_aggregates
                    (document_id, chunk_index, upvote_count, downvote_count,
-                    relevance_boost, last_calculated_at)
-                   VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                    flag_count, relevance_boost, last_calculated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
                    ON CONFLICT(document_id, chunk_index) DO UPDATE SET
                      upvote_count = excluded.upvote_count,
                      downvote_count = excluded.downvote_count,
+                     flag_count = excluded.flag_count,
                      relevance_boost = excluded.relevance_boost,
                      last_calculated_at = excluded.last_calculated_at""",
-                (document_id, chunk_index, upvotes, downvotes, boost_factor)
+                (document_id, chunk_index, upvotes, downvotes, flags, boost_factor)
             )
 
         except Exception as e:
@@ -254,73 +278,111 @@ class RAGFeedbackManager:
         Returns:
             RelevanceBoost with current boost factor
         """
-        cache_key = (document_id, chunk_index)
-
-        # Check cache first
-        if cache_key in self._boost_cache:
-            return self._boost_cache[cache_key]
-
-        # Default boost (no feedback)
-        default_boost = RelevanceBoost(
-            document_id=document_id,
-            chunk_index=chunk_index,
-            boost_factor=0.0,
-            confidence=0.0,
-            upvotes=0,
-            downvotes=0,
-            flags=0,
-        )
+        return self.get_boosts([(document_id, chunk_index)])[(document_id, chunk_index)]
 
-        if not self._db:
-            return default_boost
+    def get_boosts(self, keys: Iterable[ChunkKey]) -> dict[ChunkKey, RelevanceBoost]:
+        """Get relevance boosts for many chunks at once.
 
-        try:
-            # Query aggregates
-            row = self._db.fetchone(
-                """SELECT upvote_count, downvote_count, relevance_boost
-                   FROM rag_feedback_aggregates
-                   WHERE document_id = ? AND chunk_index = ?""",
-                (document_id, chunk_index)
-            )
+        Cached chunks are served from the LRU cache; the rest are read from
+        the aggregates table in one query per BOOST_QUERY_BATCH pairs.
+        Chunks without feedback get a zero boost, which is cached too.
 
-            if not row:
-                return default_boost
-
-            upvotes = row[0] or 0
-            downvotes = row[1] or 0
-            boost_factor = row[2] or 0.0
+        Args:
+            keys: (document_id, chunk_index) pairs
 
-            # Query flag count separately
-            flag_row = self._db.fetchone(
-                """SELECT COUNT(*) FROM rag_result_feedback
-                   WHERE result_document_id = ? AND result_chunk_index = ?
-                   AND feedback_type = 'flag'""",
-                (document_id, chunk_index)
-            )
-            flags = flag_row[0] if flag_row else 0
+        Returns:
+            Dictionary mapping every requested pair to its RelevanceBoost
+        """
+        boosts: dict[ChunkKey, RelevanceBoost] = {}
+        missing: list[ChunkKey] = []
+
+        with self._cache_lock:
+            self._check_cache_version()
+            version = self._cache_version
+            for key in dict.fromkeys(keys):
+                boost = self._boost_cache.get(key)
+                if boost is not None:
+                    self._boost_cache.move_to_end(key)
+                    boosts[key] = boost
+                else:
+                    missing.append(key)
+
+        if not missing:
+            return boosts
+
+        fetched = {key: self._default_boost(*key) for key in missing}
+        if self._db:
+            try:
+                for start in range(0, len(missing), self.BOOST_QUERY_BATCH):
+                    fetched.update(self._fetch_boosts(missing[start:start + self.BOOST_QUERY_BATCH]))
+            except Exception as e:
+                # Serve zero boosts but don't cache them
+                logger.warning(f"Failed to get boosts: {e}")
+                boosts.update(fetched)
+                return boosts
+
+        boosts.update(fetched)
+        with self._cache_lock:
+            self._check_cache_version()
+            # Skip caching if feedback was written while we were reading
+            if self._cache_version == version:
+                self._boost_cache.update(fetched)
+                while len(self._boost_cache) > self.MAX_CACHED_BOOSTS:
+                    self._boost_cache.popitem(last=False)
+        return boosts
+
+    def _fetch_boosts(self, keys: list[ChunkKey]) -> dict[ChunkKey, RelevanceBoost]:
+        """Read aggregates for a batch of chunks in a single query."""
+        values = ", ".join("(?, ?)" for _ in keys)
+        params = tuple(value for key in keys for value in key)
+        rows = self._db.fetchall(
+            f"""WITH wanted(document_id, chunk_index) AS (VALUES {values})
+                SELECT a.document_id, a.chunk_index, a.upvote_count,
+                       a.downvote_count, a.flag_count, a.relevance_boost
+                FROM wanted
+                JOIN rag_feedback_aggregates a
+                  ON a.document_id = wanted.document_id
+                 AND a.chunk_index = wanted.chunk_index""",
+            params
+        )
 
-            # Calculate confidence
+        boosts = {}
+        for document_id, chunk_index, upvotes, downvotes, flags, boost_factor in rows:
+            upvotes = upvotes or 0
+            downvotes = downvotes or 0
             total = upvotes + downvotes
-            confidence = min(1.0, total / self.MIN_FEEDBACK_FOR_BOOST) if total > 0 else 0.0
-
-            boost = RelevanceBoost(
+            boosts[(document_id, chunk_index)] = RelevanceBoost(
                 document_id=document_id,
                 chunk_index=chunk_index,
-                boost_factor=boost_factor,
-                confidence=confidence,
+                boost_factor=boost_factor or 0.0,
+                confidence=min(1.0, total / self.MIN_FEEDBACK_FOR_BOOST) if total > 0 else 0.0,
                 upvotes=upvotes,
                 downvotes=downvotes,
-                flags=flags,
+                flags=flags or 0,
             )
+        return boosts
 
-            # Cache the result
-            self._boost_cache[cache_key] = boost
+    @staticmethod
+    def _default_boost(document_id: str, chunk_index: int) -> RelevanceBoost:
+        """Boost for a chunk with no feedback."""
+        return RelevanceBoost(
+            document_id=document_id,
+            chunk_index=chunk_index,
+            boost_factor=0.0,
+            confidence=0.0,
+            upvotes=0,
+            downvotes=0,
+            flags=0,
+        )
 
-            return boost
+    def _check_cache_version(self):
+        """Drop cached boosts if feedback has been written since they were read.
 
-        except Exception as e:
-            logger.warning(f"Failed to get boost: {e}")
-            return default_boost
+        Must be called with _cache_lock held.
+        """
+        if self._cache_version != _feedback_version:
+            self._boost_cache.clear()
+            self._cache_version = _feedback_version
 
     def apply_boosts(self, results: list) -> list:
         """Apply feedback boosts to search results.
@@ -337,16 +399,17 @@ class RAGFeedbackManager:
         if not results:
             return results
 
-        for result in results:
-            # Get document_id and chunk_index from result
-            doc_id = getattr(result, 'document_id', None)
-            chunk_idx = getattr(result, 'chunk_index', 0)
+        keyed = [
+            (result, (getattr(result, 'document_id', None), getattr(result, 'chunk_index', 0)))
+            for result in results
+        ]
+        boosts = self.get_boosts(key for _, key in keyed if key[0] is not None)
 
-            if doc_id is None:
+        for result, key in keyed:
+            if key[0] is None:
                 continue
 
-            # Get boost for this chunk
-            boost = self.get_boost(doc_id, chunk_idx)
+            boost = boosts[key]
 
             # Apply boost to score
             current_score = getattr(result, 'combined_score', 0.0)
@@ -423,7 +486,8 @@ class RAGFeedbackManager:
 
     def clear_cache(self):
         """Clear the boost cache."""
-        self._boost_cache.clear()
+        with self._cache_lock:
+            self._boost_cache.clear()
 
     def remove_feedback(
         self,
@@ -457,10 +521,8 @@ class RAGFeedbackManager:
             # Update aggregates
             self._update_aggregates(document_id, chunk_index)
 
-            # Invalidate cache
-            cache_key = (document_id, chunk_index)
-            if cache_key in self._boost_cache:
-                del self._boost_cache[cache_key]
+            # Invalidate cached boosts in every manager
+            _bump_feedback_version()
 
             return True
 
@@ -344,11 +344,58 @@ class RelationshipConfidenceCalculator:
         return edge1
 
 
+class _NodeList(list):
+    """List of nodes that reports every change, so lookups never go stale."""
+
+    __slots__ = ("_on_change",)
+
+    def __init__(self, items=(), on_change=None):
+        super().__init__(items)
+        self._on_change = on_change
+
+
+def _notifying(name: str):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        on_change = getattr(self, "_on_change", None)
+        if on_change is not None:
+            on_change()
+        return result
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in (
+    "append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+    "__setitem__", "__delitem__", "__iadd__", "__imul__",
+):
+    setattr(_NodeList, _name, _notifying(_name))
+
+
 @dataclass
 class GraphData:
-    """Container for graph nodes and edges."""
+    """Container for graph nodes and edges.
+
+    A page of a larger graph sets next_offset to the offset of the
+    following page (None when there is nothing more to load).
+    """
     nodes: list[GraphNode] = field(default_factory=list)
     edges: list[GraphEdge] = field(default_factory=list)
+    next_offset: Optional[int] = None
+    # Built on the first lookup, dropped whenever nodes changes
+    _node_index: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        if name == "nodes":
+            value = _NodeList(value, self._invalidate_node_index)
+            object.__setattr__(self, "_node_index", None)
+        object.__setattr__(self, name, value)
+
+    def _invalidate_node_index(self) -> None:
+        self._node_index = None
 
     @property
     def node_count(self) -> int:
@@ -360,10 +407,39 @@ class GraphData:
 
     def get_node(self, node_id: str) -> Optional[GraphNode]:
         """Get a node by ID."""
-        for node in self.nodes:
-            if node.id == node_id:
-                return node
-        return None
+        if self._node_index is None:
+            self._node_index = {node.id: node for node in self.nodes}
+        return self._node_index.get(node_id)
+
+    def merge(self, other: "GraphData") -> "GraphData":
+        """Add the nodes and edges of another page that are not already present.
+
+        Args:
+            other: Page to merge in
+
+        Returns:
+            GraphData holding only the newly added nodes and edges
+        """
+        self.get_node("")  # make sure the index is current
+        index = self._node_index
+        edge_ids = {edge.id for edge in self.edges}
+
+        added_nodes = []
+        for node in other.nodes:
+            if node.id not in index:
+                index[node.id] = node
+                added_nodes.append(node)
+        self.nodes.extend(added_nodes)
+        self._node_index = index  # kept current above
+
+        added_edges = []
+        for edge in other.edges:
+            if edge.id not in edge_ids:
+                edge_ids.add(edge.id)
+                self.edges.append(edge)
+                added_edges.append(edge)
+
+        return GraphData(nodes=added_nodes, edges=added_edges)
 
     def get_edges_for_node(self, node_id: str) -> list[GraphEdge]:
         """Get all edges connected to a node."""
@@ -403,6 +479,62 @@ class GraphData:
         return [node for node in self.nodes if node.matches_search(query)]
 
 
+# Labels used by Graphiti and the document ingestion pipeline
+_NODE_LABEL_FILTER = """
+    n:EntityNode OR n:EpisodicNode OR n:Entity OR n:Episode
+    OR n:Medication OR n:Condition OR n:Symptom OR n:Procedure
+    OR n:Document OR n:Chunk
+"""
+
+_NODE_RETURN = """
+    elementId(n) as id,
+    coalesce(n.name, n.title, n.content, n.text, 'Unknown') as name,
+    coalesce(n.entity_type, n.type, labels(n)[0], 'entity') as entity_type,
+    properties(n) as props
+"""
+
+
+def _node_from_record(record) -> GraphNode:
+    """Build a GraphNode from a node query record."""
+    props = record["props"] or {}
+    # Remove large properties that aren't needed for visualization
+    props.pop("embedding", None)
+    props.pop("content", None)
+
+    node = GraphNode(
+        id=record["id"],
+        name=record["name"],
+        entity_type=EntityType.from_string(record["entity_type"]),
+        properties=props,
+    )
+
+    # Enrich with medical codes (Fix 13 - best effort)
+    try:
+        from rag.medical_code_lookup import enrich_entity_codes
+        codes = enrich_entity_codes(node.name, node.entity_type.value)
+        if codes:
+            node.properties.update(codes)
+    except Exception:
+        pass  # Non-blocking enrichment
+
+    return node
+
+
+def _edge_from_record(record) -> GraphEdge:
+    """Build a GraphEdge from an edge query record."""
+    props = record["props"] or {}
+    props.pop("embedding", None)
+
+    return GraphEdge(
+        id=record["id"],
+        source_id=record["source"],
+        target_id=record["target"],
+        relationship_type=record["rel_type"],
+        fact=record["fact"],
+        properties=props,
+    )
+
+
 class GraphDataProvider:
     """Provides graph data from Neo4j for visualization.
 
@@ -422,6 +554,8 @@ class GraphDataProvider:
         self._driver = None
         self._driver_lock = threading.Lock()
         self._env_prefix = env_prefix
+        # Set once the graph turns out to have none of _NODE_LABEL_FILTER's labels
+        self._match_all_labels = False
 
     def _get_neo4j_driver(self):
         """Get or create Neo4j driver with connection timeout."""
@@ -556,28 +690,7 @@ class GraphDataProvider:
                         if entity_type.value not in entity_types:
                             continue
 
-                    props = record["props"] or {}
-                    # Remove large properties that aren't needed for visualization
-                    props.pop("embedding", None)
-                    props.pop("content", None)
-
-                    node = GraphNode(
-                        id=node_id,
-                        name=record["name"],
-                        entity_type=EntityType.from_string(entity_type_str),
-                        properties=props,
-                    )
-
-                    # Enrich with medical codes (Fix 13 - best effort)
-                    try:
-                        from rag.medical_code_lookup import enrich_entity_codes
-                        codes = enrich_entity_codes(node.name, node.entity_type.value)
-                        if codes:
-                            node.properties.update(codes)
-                    except Exception:
-                        pass  # Non-blocking enrichment
-
-                    nodes.append(node)
+                    nodes.append(_node_from_record(record))
                     node_ids.add(node_id)
 
                 # If no nodes found with specific labels, try querying ALL nodes
@@ -612,27 +725,7 @@ class GraphDataProvider:
                             if entity_type.value not in entity_types:
                                 continue
 
-                        props = record["props"] or {}
-                        props.pop("embedding", None)
-                        props.pop("content", None)
-
-                        node = GraphNode(
-                            id=node_id,
-                            name=record["name"],
-                            entity_type=EntityType.from_string(entity_type_str),
-                            properties=props,
-                        )
-
-                        # Enrich with medical codes (Fix 13 - best effort)
-                        try:
-                            from rag.medical_code_lookup import enrich_entity_codes
-                            codes = enrich_entity_codes(node.name, node.entity_type.value)
-                            if codes:
-                                node.properties.update(codes)
-                        except Exception:
-                            pass  # Non-blocking enrichment
-
-                        nodes.append(node)
+                        nodes.append(_node_from_record(record))
                         node_ids.add(node_id)
 
                 if not node_ids:
@@ -655,18 +748,7 @@ class GraphDataProvider:
                 result = session.run(edge_query, node_ids=list(node_ids))
 
                 for record in result:
-                    props = record["props"] or {}
-                    props.pop("embedding", None)
-
-                    edge = GraphEdge(
-                        id=record["id"],
-                        source_id=record["source"],
-                        target_id=record["target"],
-                        relationship_type=record["rel_type"],
-                        fact=record["fact"],
-                        properties=props,
-                    )
-                    edges.append(edge)
+                    edges.append(_edge_from_record(record))
 
                 logger.info(f"Retrieved {len(nodes)} nodes and {len(edges)} edges")
                 self._record_success()
@@ -677,6 +759,237 @@ class GraphDataProvider:
             self._record_failure()
             raise
 
+    def _is_circuit_open(self) -> bool:
+        """Whether the Neo4j circuit breaker is currently failing fast."""
+        try:
+            from rag.rag_resilience import get_neo4j_circuit_breaker
+            from utils.resilience import CircuitState
+
+            return get_neo4j_circuit_breaker().state == CircuitState.OPEN
+        except ImportError:
+            return False  # Resilience module not available
+
+    def get_cluster_summary(self) -> dict[EntityType, int]:
+        """Count the nodes of each entity type without transferring them.
+
+        Lets the visualization show the size of the whole graph before
+        any page of nodes has been loaded.
+
+        Returns:
+            Node count per entity type (empty if Neo4j is unavailable)
+        """
+        if self._is_circuit_open():
+            logger.warning("Neo4j circuit breaker open, returning empty cluster summary")
+            return {}
+
+        try:
+            driver = self._get_neo4j_driver()
+        except Exception as e:
+            logger.error(f"Failed to get Neo4j driver: {e}")
+            self._record_failure()
+            return {}
+
+        def count_by_type(session) -> dict[EntityType, int]:
+            counts: dict[EntityType, int] = {}
+            result = session.run(f"""
+                MATCH (n)
+                WHERE {self._node_filter()}
+                RETURN
+                    coalesce(n.entity_type, n.type, labels(n)[0], 'entity') as entity_type,
+                    count(*) as count
+            """)
+            for record in result:
+                entity_type = EntityType.from_string(record["entity_type"])
+                counts[entity_type] = counts.get(entity_type, 0) + record["count"]
+            return counts
+
+        try:
+            with driver.session() as session:
+                summary = count_by_type(session)
+                if not summary and self._fall_back_to_all_labels(session):
+                    summary = count_by_type(session)
+
+            self._record_success()
+            return summary
+
+        except Exception as e:
+            logger.error(f"Failed to retrieve cluster summary: {e}")
+            self._record_failure()
+            raise
+
+    def get_graph_page(
+        self,
+        offset: int = 0,
+        limit: int = 200,
+        entity_types: Optional[list[str]] = None,
+        known_node_ids: Optional[set[str]] = None,
+    ) -> GraphData:
+        """Get one page of nodes, most connected first, with their edges.
+
+        Pages are ordered by node degree so the first page is the core
+        of the graph. Edges are returned between nodes of the page and
+        between the page and nodes already loaded by the caller.
+
+        Args:
+            offset: Number of nodes to skip (next_offset of the previous page)
+            limit: Maximum number of nodes in the page
+            entity_types: Optional list of entity types to filter by
+            known_node_ids: IDs of nodes loaded from earlier pages
+
+        Returns:
+            GraphData for the page; next_offset is None on the last page
+        """
+        if self._is_circuit_open():
+            logger.warning("Neo4j circuit breaker open, returning empty graph page")
+            return GraphData()
+
+        try:
+            driver = self._get_neo4j_driver()
+        except Exception as e:
+            logger.error(f"Failed to get Neo4j driver: {e}")
+            self._record_failure()
+            return GraphData()
+
+        def fetch_page(session) -> list:
+            return list(session.run(f"""
+                MATCH (n)
+                WHERE {self._node_filter()}
+                WITH n, COUNT {{ (n)--() }} as degree
+                ORDER BY degree DESC, elementId(n)
+                SKIP $offset
+                LIMIT $limit
+                RETURN {_NODE_RETURN}
+            """, offset=offset, limit=limit))
+
+        try:
+            with driver.session() as session:
+                records = fetch_page(session)
+                if not records and offset == 0 and self._fall_back_to_all_labels(session):
+                    records = fetch_page(session)
+
+                nodes = []
+                fetched = 0
+                for record in records:
+                    fetched += 1
+                    node = _node_from_record(record)
+                    if entity_types and node.entity_type.value not in entity_types:
+                        continue
+                    nodes.append(node)
+
+                edges = self._fetch_edges(session, nodes, known_node_ids)
+
+            next_offset = offset + fetched if fetched == limit else None
+            logger.info(f"Retrieved page at {offset}: {len(nodes)} nodes and {len(edges)} edges")
+            self._record_success()
+            return GraphData(nodes=nodes, edges=edges, next_offset=next_offset)
+
+        except Exception as e:
+            logger.error(f"Failed to retrieve graph page: {e}")
+            self._record_failure()
+            raise
+
+    def get_neighborhood(
+        self,
+        node_id: str,
+        limit: int = 50,
+        known_node_ids: Optional[set[str]] = None,
+    ) -> GraphData:
+        """Get the most connected neighbours of a node, with their edges.
+
+        Used to expand a node in place without loading further pages.
+
+        Args:
+            node_id: ID of the node to expand
+            limit: Maximum number of neighbours to return
+            known_node_ids: IDs of nodes already loaded by the caller
+
+        Returns:
+            GraphData with the neighbours and their edges to loaded nodes
+        """
+        if self._is_circuit_open():
+            logger.warning("Neo4j circuit breaker open, returning empty neighbourhood")
+            return GraphData()
+
+        try:
+            driver = self._get_neo4j_driver()
+        except Exception as e:
+            logger.error(f"Failed to get Neo4j driver: {e}")
+            self._record_failure()
+            return GraphData()
+
+        known = set(known_node_ids or ())
+        known.add(node_id)
+        try:
+            with driver.session() as session:
+                result = session.run(f"""
+                    MATCH (c)--(n)
+                    WHERE elementId(c) = $node_id
+                    WITH DISTINCT n
+                    WITH n, COUNT {{ (n)--() }} as degree
+                    ORDER BY degree DESC, elementId(n)
+                    LIMIT $limit
+                    RETURN {_NODE_RETURN}
+                """, node_id=node_id, limit=limit)
+
+                nodes = [_node_from_record(record) for record in result]
+                edges = self._fetch_edges(session, nodes, known)
+
+            self._record_success()
+            return GraphData(nodes=nodes, edges=edges)
+
+        except Exception as e:
+            logger.error(f"Failed to expand node {node_id}: {e}")
+            self._record_failure()
+            raise
+
+    def _node_filter(self) -> str:
+        """WHERE condition selecting the nodes to visualize."""
+        return "true" if self._match_all_labels else _NODE_LABEL_FILTER
+
+    def _fall_back_to_all_labels(self, session) -> bool:
+        """Match every node from now on if the graph has none with the expected labels.
+
+        Returns:
+            True if the filter changed and the caller should query again
+        """
+        if self._match_all_labels:
+            return False
+        logger.info("No nodes found with expected labels, trying all nodes...")
+        record = session.run("CALL db.labels() YIELD label RETURN collect(label) as labels").single()
+        labels = record["labels"] if record else None
+        if not labels:
+            return False
+        logger.info(f"Available labels in database: {labels}")
+        self._match_all_labels = True
+        return True
+
+    def _fetch_edges(
+        self,
+        session,
+        nodes: list[GraphNode],
+        known_node_ids: Optional[set[str]] = None,
+    ) -> list[GraphEdge]:
+        """Get edges touching the given nodes whose other end is loaded."""
+        if not nodes:
+            return []
+
+        page_ids = [node.id for node in nodes]
+        loaded_ids = list(set(page_ids) | set(known_node_ids or ()))
+        result = session.run("""
+            MATCH (n)-[r]->(m)
+            WHERE (elementId(n) IN $page_ids AND elementId(m) IN $loaded_ids)
+               OR (elementId(m) IN $page_ids AND elementId(n) IN $loaded_ids)
+            RETURN
+                elementId(r) as id,
+                elementId(n) as source,
+                elementId(m) as target,
+                type(r) as rel_type,
+                coalesce(r.fact, '') as fact,
+                properties(r) as props
+        """, page_ids=page_ids, loaded_ids=loaded_ids)
+
+        return [_edge_from_record(record) for record in result]
+
     def health_check(self) -> bool:
         """Check if Neo4j connection is available.
 
@@ -12,6 +12,7 @@ Architecture Note:
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
 from rag.guidelines_models import (
@@ -26,6 +27,14 @@ from utils.structured_logging import get_logger
 
 logger = get_logger(__name__)
 
+# Concurrent searches in a batch (matches the guidelines vector store pool size)
+MAX_CONCURRENT_SEARCHES = 8
+
+
+def _result_key(result: GuidelineSearchResult) -> str:
+    """Dedupe key for a guideline chunk."""
+    return f"{result.guideline_id}_{result.chunk_index}"
+
 
 class GuidelinesRetriever:
     """Retrieves relevant clinical guidelines for compliance checking.
@@ -115,6 +124,17 @@ class GuidelinesRetriever:
         Returns:
             Embedding vector
         """
+        return self._get_embeddings([text])[0]
+
+    def _get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Get embeddings for several query texts in one API request.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors, in the same order as texts
+        """
         try:
             from openai import OpenAI
             import os
@@ -132,14 +152,30 @@ class GuidelinesRetriever:
             client = OpenAI(api_key=api_key)
             response = client.embeddings.create(
                 model=self._embedding_model,
-                input=text,
+                input=texts,
             )
-            return response.data[0].embedding
+            data = sorted(response.data, key=lambda d: d.index)
+            return [d.embedding for d in data]
 
         except Exception as e:
             logger.error(f"Failed to get embedding: {e}")
             raise
 
+    def _expand_query(self, query: str) -> str:
+        """Expand medical abbreviations/synonyms, falling back to the original."""
+        if not self._enable_query_expansion:
+            return query
+        try:
+            expander = self._get_query_expander()
+            if expander:
+                expansion = expander.expand_query(query)
+                if expansion and hasattr(expansion, 'expanded_query'):
+                    logger.debug(f"Query expanded: '{query}' -> '{expansion.expanded_query}'")
+                    return expansion.expanded_query
+        except Exception as e:
+            logger.debug(f"Query expansion failed, using original: {e}")
+        return query
+
     def search(
         self,
         query: str,
@@ -149,6 +185,8 @@ class GuidelinesRetriever:
         recommendation_class: Optional[str] = None,
         evidence_level: Optional[str] = None,
         similarity_threshold: float = 0.5,
+        query_embedding: Optional[list[float]] = None,
+        expanded_query: Optional[str] = None,
     ) -> list[GuidelineSearchResult]:
         """Search for relevant clinical guidelines.
 
@@ -162,6 +200,9 @@ class GuidelinesRetriever:
             recommendation_class: Filter by recommendation class (I, IIa, IIb, III)
             evidence_level: Filter by evidence level (A, B, C)
             similarity_threshold: Minimum similarity score
+            query_embedding: Precomputed embedding of the expanded query
+                (used by search_batch to embed all queries in one request)
+            expanded_query: Precomputed query expansion
 
         Returns:
             List of GuidelineSearchResult objects, sorted by combined score
@@ -169,24 +210,16 @@ class GuidelinesRetriever:
         start_time = time.time()
 
         # Step 0: Query expansion (expand medical abbreviations/synonyms)
-        expanded_query = query
-        if self._enable_query_expansion:
-            try:
-                expander = self._get_query_expander()
-                if expander:
-                    expansion = expander.expand_query(query)
-                    if expansion and hasattr(expansion, 'expanded_query'):
-                        expanded_query = expansion.expanded_query
-                        logger.debug(f"Query expanded: '{query}' -> '{expanded_query}'")
-            except Exception as e:
-                logger.debug(f"Query expansion failed, using original: {e}")
+        if expanded_query is None:
+            expanded_query = self._expand_query(query)
 
         # Get embedding for (potentially expanded) query
-        try:
-            query_embedding = self._get_embedding(expanded_query)
-        except Exception as e:
-            logger.error(f"Failed to get query embedding: {e}")
-            return []
+        if query_embedding is None:
+            try:
+                query_embedding = self._get_embedding(expanded_query)
+            except Exception as e:
+                logger.error(f"Failed to get query embedding: {e}")
+                return []
 
         # Determine effective threshold
         effective_threshold = similarity_threshold
@@ -321,38 +354,110 @@ class GuidelinesRetriever:
 
         return sorted_results
 
-    def search_for_conditions(
+    def search_batch(
         self,
-        conditions: list[str],
-        top_k: int = 5,
-    ) -> list[GuidelineSearchResult]:
-        """Search for guidelines related to specific conditions.
+        queries: list[str],
+        top_k: int = 10,
+        max_workers: int = MAX_CONCURRENT_SEARCHES,
+        **search_kwargs: Any,
+    ) -> list[list[GuidelineSearchResult]]:
+        """Run several guideline searches as one batch.
+
+        All queries are embedded in a single embedding request, then the
+        per-query vector/BM25/graph searches run concurrently on a bounded
+        pool, so the batch takes about as long as its slowest query.
 
         Args:
-            conditions: List of medical conditions to search for
-            top_k: Number of results per condition
+            queries: Search query texts (duplicates are searched once)
+            top_k: Number of results per query
+            max_workers: Maximum concurrent searches
+            **search_kwargs: Filters passed through to search()
 
         Returns:
-            Deduplicated list of GuidelineSearchResult objects
+            One result list per query, in the same order as queries
         """
-        results_map: dict[str, GuidelineSearchResult] = {}
+        return self._search_many(
+            [(query, top_k) for query in queries], max_workers, **search_kwargs
+        )
+
+    def _search_many(
+        self,
+        specs: list[tuple[str, int]],
+        max_workers: int = MAX_CONCURRENT_SEARCHES,
+        **search_kwargs: Any,
+    ) -> list[list[GuidelineSearchResult]]:
+        """search_batch() with a per-query top_k; specs are (query, top_k)."""
+        unique = list(dict.fromkeys(specs))
+        if not unique:
+            return []
 
-        for condition in conditions:
-            condition_results = self.search(
-                query=f"clinical guidelines for {condition} management treatment",
+        start_time = time.time()
+        expanded_by_query = {q: self._expand_query(q) for q, _ in unique}
+        texts = list(dict.fromkeys(expanded_by_query.values()))
+        try:
+            embeddings = dict(zip(texts, self._get_embeddings(texts)))
+        except Exception as e:
+            logger.error(f"Failed to get query embeddings: {e}")
+            return [[] for _ in specs]
+
+        # Create lazy helpers before fanning out to worker threads
+        if self._enable_adaptive_threshold:
+            self._get_threshold_calculator()
+        if self._enable_mmr:
+            self._get_mmr_reranker()
+
+        def run(spec: tuple[str, int]) -> list[GuidelineSearchResult]:
+            query, top_k = spec
+            expanded = expanded_by_query[query]
+            return self.search(
+                query=query,
                 top_k=top_k,
+                query_embedding=embeddings[expanded],
+                expanded_query=expanded,
+                **search_kwargs,
             )
 
-            for result in condition_results:
-                key = f"{result.guideline_id}_{result.chunk_index}"
+        workers = max(1, min(max_workers, len(unique)))
+        if workers == 1:
+            results = [run(spec) for spec in unique]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="guidelines_search_") as executor:
+                results = list(executor.map(run, unique))
+
+        elapsed_ms = (time.time() - start_time) * 1000
+        logger.info(f"Guidelines batch of {len(unique)} searches completed in {elapsed_ms:.1f}ms")
+
+        by_spec = dict(zip(unique, results))
+        return [by_spec[spec] for spec in specs]
+
+    @staticmethod
+    def _merge_results(
+        result_lists: list[list[GuidelineSearchResult]],
+    ) -> list[GuidelineSearchResult]:
+        """Deduplicate chunks across several searches.
+
+        A chunk matched by more than one search keeps its best score, with a
+        10% boost for repeat matches. Inputs are not modified.
+
+        Returns:
+            Deduplicated results sorted by score
+        """
+        results_map: dict[str, GuidelineSearchResult] = {}
+
+        for result_list in result_lists:
+            for result in result_list:
+                key = _result_key(result)
                 if key not in results_map:
                     results_map[key] = result
                 else:
-                    # Boost score if matched multiple conditions
-                    results_map[key].similarity_score = max(
+                    # Boost score if matched multiple queries
+                    boosted = max(
                         results_map[key].similarity_score,
                         result.similarity_score * 1.1,  # 10% boost
                     )
+                    results_map[key] = results_map[key].model_copy(
+                        update={"similarity_score": boosted}
+                    )
 
         return sorted(
             results_map.values(),
@@ -360,6 +465,32 @@ class GuidelinesRetriever:
             reverse=True,
         )
 
+    @staticmethod
+    def _condition_query(condition: str) -> str:
+        return f"clinical guidelines for {condition} management treatment"
+
+    @staticmethod
+    def _medication_query(medication: str) -> str:
+        return f"guideline recommendations for {medication} indication dosing"
+
+    def search_for_conditions(
+        self,
+        conditions: list[str],
+        top_k: int = 5,
+    ) -> list[GuidelineSearchResult]:
+        """Search for guidelines related to specific conditions.
+
+        Args:
+            conditions: List of medical conditions to search for
+            top_k: Number of results per condition
+
+        Returns:
+            Deduplicated list of GuidelineSearchResult objects
+        """
+        return self._merge_results(self.search_batch(
+            [self._condition_query(c) for c in conditions], top_k=top_k
+        ))
+
     def search_for_medications(
         self,
         medications: list[str],
@@ -374,29 +505,9 @@ class GuidelinesRetriever:
         Returns:
             Deduplicated list of GuidelineSearchResult objects
         """
-        results_map: dict[str, GuidelineSearchResult] = {}
-
-        for medication in medications:
-            med_results = self.search(
-                query=f"guideline recommendations for {medication} indication dosing",
-                top_k=top_k,
-            )
-
-            for result in med_results:
-                key = f"{result.guideline_id}_{result.chunk_index}"
-                if key not in results_map:
-                    results_map[key] = result
-                else:
-                    results_map[key].similarity_score = max(
-                        results_map[key].similarity_score,
-                        result.similarity_score * 1.1,
-                    )
-
-        return sorted(
-            results_map.values(),
-            key=lambda x: x.similarity_score,
-            reverse=True,
-        )
+        return self._merge_results(self.search_batch(
+            [self._medication_query(m) for m in medications], top_k=top_k
+        ))
 
     def get_guidelines_for_conditions(
         self,
@@ -405,9 +516,10 @@ class GuidelinesRetriever:
     ) -> dict[str, list]:
         """Retrieve guidelines for each extracted condition.
 
-        Uses existing search_for_conditions() and search_for_medications()
-        methods which leverage conditions_covered[] and medications_covered[]
-        GIN-indexed arrays in the database.
+        Every condition and medication query runs in a single search batch,
+        so a note with many problems costs one embedding request and roughly
+        the latency of its slowest search. A medication listed under several
+        conditions is searched once.
 
         Args:
             conditions: List of dicts with 'condition' and optional 'medications' keys
@@ -416,32 +528,34 @@ class GuidelinesRetriever:
         Returns:
             Dict mapping condition name to list of matching GuidelineSearchResult
         """
-        results = {}
-        for item in conditions:
-            name = item.get("condition", "")
-            if not name:
-                continue
-
-            meds = item.get("medications", [])
+        items = [
+            (item["condition"], item.get("medications") or [])
+            for item in conditions
+            if item.get("condition")
+        ]
+        if not items:
+            return {}
+
+        condition_specs = [
+            (self._condition_query(name), top_k_per_condition) for name, _ in items
+        ]
+        med_specs = list(dict.fromkeys(
+            (self._medication_query(m), 3) for _, meds in items for m in meds
+        ))
+        batch = self._search_many(condition_specs + med_specs)
+        condition_lists = batch[:len(condition_specs)]
+        med_results = {query: found for (query, _), found in zip(med_specs, batch[len(condition_specs):])}
 
-            # Search by condition using existing method
-            condition_results = self.search_for_conditions(
-                [name], top_k=top_k_per_condition
-            )
-
-            # Search by medications using existing method
-            med_results = (
-                self.search_for_medications(meds, top_k=3) if meds else []
+        results = {}
+        for (name, meds), condition_results in zip(items, condition_lists):
+            med_merged = self._merge_results(
+                [med_results[self._medication_query(m)] for m in meds]
             )
 
             # Merge and deduplicate
-            merged = {
-                f"{r.guideline_id}_{r.chunk_index}": r for r in condition_results
-            }
-            for r in med_results:
-                key = f"{r.guideline_id}_{r.chunk_index}"
-                if key not in merged:
-                    merged[key] = r
+            merged = {_result_key(r): r for r in condition_results}
+            for r in med_merged:
+                merged.setdefault(_result_key(r), r)
 
             results[name] = sorted(
                 merged.values(),
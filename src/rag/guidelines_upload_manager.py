@@ -5,7 +5,7 @@ Orchestrates the clinical guideline upload pipeline:
 1. Validate file
 2. Extract text (with OCR if needed)
 3. Chunk text semantically (smaller chunks for guidelines)
-4. Generate embeddings
+4. Generate embeddings, streamed batch by batch into
 5. Store metadata + embeddings in Neon PostgreSQL (guidelines DB)
 6. Sync to Neo4j knowledge graph (optional)
 
@@ -20,10 +20,12 @@ import os
 import threading
 from datetime import date
 from pathlib import Path
-from typing import Callable, Optional
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional
 from uuid import uuid4
 
 from rag.guidelines_models import GuidelineUploadStatus
+from rag.ingest_pipeline import StreamingIngestPipeline
 from utils.structured_logging import get_logger
 
 logger = get_logger(__name__)
@@ -38,6 +40,19 @@ GUIDELINES_CHUNK_OVERLAP = 100
 # Supported file extensions
 SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".doc", ".txt", ".md"}
 
+# Streaming ingest: chunks per embedding request, embedded batches allowed
+# ahead of the database writer, and rows per executemany
+INGEST_EMBED_BATCH_SIZE = 64
+INGEST_MAX_PENDING_BATCHES = 2
+INGEST_UPSERT_BATCH_SIZE = 64
+
+
+def _micro_batches(rows: Iterable[tuple], size: int) -> Iterator[list[tuple]]:
+    """Group an iterable of rows into lists of at most size rows."""
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
 
 class GuidelinesUploadManager:
     """Manages the clinical guideline upload lifecycle.
@@ -196,14 +211,17 @@ class GuidelinesUploadManager:
 
             processor = self._get_document_processor()
 
+            def report_pages(pages_done: int, page_count: int):
+                report(GuidelineUploadStatus.EXTRACTING, 5 + 20 * pages_done / page_count)
+
             # Prefer layout extraction for PDFs (preserves tables)
             if ext == '.pdf' and enable_ocr:
                 text, metadata, page_count, ocr_used = processor.extract_text_with_layout(
-                    file_path, enable_ocr=enable_ocr
+                    file_path, enable_ocr=enable_ocr, progress_callback=report_pages
                 )
             else:
                 text, metadata, page_count, ocr_used = processor.extract_text(
-                    file_path, enable_ocr=enable_ocr
+                    file_path, enable_ocr=enable_ocr, progress_callback=report_pages
                 )
 
             if not text or not text.strip():
@@ -309,24 +327,15 @@ class GuidelinesUploadManager:
                 except Exception as e:
                     logger.debug(f"Recommendation extractor not available: {e}")
 
-            # --- Step 3: Generate embeddings (50-75%) ---
+            # --- Steps 3-4: Embed and store in Neon (50-90%) ---
+            # Embedding batches stream into the upsert as they complete, so
+            # network stages overlap and only a few batches of vectors are
+            # held at once.
             report(GuidelineUploadStatus.EMBEDDING, 55)
 
             embedding_manager = self._get_embedding_manager()
-            if use_structured_chunks:
-                chunk_texts = [c.chunk_text for c in chunks]
-            else:
-                chunk_texts = [c.chunk_text for c in chunks]
-            embedding_response = embedding_manager.generate_embeddings(chunk_texts)
-
-            report(GuidelineUploadStatus.EMBEDDING, 75)
-
-            # --- Step 4: Store in Neon (75-90%) ---
-            report(GuidelineUploadStatus.SYNCING, 78)
-
             vector_store = self._get_vector_store()
 
-            # 4a: Insert guideline metadata row
             guideline_metadata = {
                 "file_size_bytes": file_size,
                 "page_count": page_count,
@@ -337,59 +346,25 @@ class GuidelinesUploadManager:
             }
             if content_warning:
                 guideline_metadata["content_warning"] = content_warning
+            if metadata.file_hash:
+                guideline_metadata["file_hash"] = metadata.file_hash
 
-            report(GuidelineUploadStatus.SYNCING, 82)
-
-            # 4b: Upsert chunk embeddings
-            batch_data = []
-            for chunk, embedding in zip(chunks, embedding_response.embeddings):
-                chunk_text = chunk.chunk_text
-                chunk_idx = chunk.chunk_index
-                token_count = getattr(chunk, 'token_count', len(chunk_text) // 4)
-
-                # Extract recommendation metadata per chunk (Issue 9)
-                section_type = "recommendation"
-                recommendation_class = None
-                evidence_level = None
+            pipeline = StreamingIngestPipeline(
+                lambda texts: embedding_manager.generate_embeddings(texts).embeddings,
+                embed_batch_size=INGEST_EMBED_BATCH_SIZE,
+                max_pending_batches=INGEST_MAX_PENDING_BATCHES,
+            )
 
-                if rec_extractor:
-                    try:
-                        extraction = rec_extractor.extract(chunk_text)
-                        section_type = extraction.section_type
-                        recommendation_class = extraction.recommendation_class
-                        evidence_level = extraction.evidence_level
-                    except Exception:
-                        pass
-
-                # Use structured chunk metadata if available
-                if use_structured_chunks and hasattr(chunk, 'section_heading'):
-                    section_heading = chunk.section_heading
-                    is_rec = getattr(chunk, 'is_recommendation', False)
-                else:
-                    section_heading = None
-                    is_rec = False
-
-                chunk_metadata = {
-                    "filename": filename,
-                    "chunk_index": chunk_idx,
-                    "token_count": token_count,
-                }
-                if section_heading:
-                    chunk_metadata["section_heading"] = section_heading
-                if is_rec:
-                    chunk_metadata["is_recommendation"] = True
-                if content_warning:
-                    chunk_metadata["content_warning"] = content_warning
-
-                batch_data.append((
-                    chunk_idx,               # chunk_index
-                    chunk_text,              # chunk_text
-                    embedding,               # embedding
-                    section_type,            # section_type
-                    recommendation_class,    # recommendation_class
-                    evidence_level,          # evidence_level
-                    chunk_metadata,          # metadata
-                ))
+            def chunk_rows():
+                rows_done = 0
+                for batch in pipeline.stream(chunks, text_of=lambda c: c.chunk_text):
+                    for chunk, embedding in batch:
+                        yield self._build_chunk_row(
+                            chunk, embedding, filename, use_structured_chunks,
+                            rec_extractor, content_warning,
+                        )
+                    rows_done += len(batch)
+                    report(GuidelineUploadStatus.EMBEDDING, 55 + 33 * rows_done / chunk_count)
 
             # Atomic transaction: metadata + embeddings in single transaction (Fix 8)
             self._atomic_neon_sync(
@@ -407,9 +382,11 @@ class GuidelinesUploadManager:
                 content_hash=content_hash,
                 simhash=text_simhash,
                 metadata=guideline_metadata,
-                batch_data=batch_data,
+                batch_data=chunk_rows(),
             )
 
+            report(GuidelineUploadStatus.SYNCING, 88)
+
             # Supersede older version if found (Fix 3)
             if older_version_id:
                 try:
@@ -470,6 +447,64 @@ class GuidelinesUploadManager:
             report(GuidelineUploadStatus.FAILED, 0, error_msg)
             raise
 
+    @staticmethod
+    def _build_chunk_row(
+        chunk,
+        embedding: list[float],
+        filename: str,
+        use_structured_chunks: bool,
+        rec_extractor=None,
+        content_warning: Optional[str] = None,
+    ) -> tuple:
+        """Build one guideline_embeddings row for _atomic_neon_sync."""
+        chunk_text = chunk.chunk_text
+        chunk_idx = chunk.chunk_index
+        token_count = getattr(chunk, 'token_count', len(chunk_text) // 4)
+
+        # Extract recommendation metadata per chunk (Issue 9)
+        section_type = "recommendation"
+        recommendation_class = None
+        evidence_level = None
+
+        if rec_extractor:
+            try:
+                extraction = rec_extractor.extract(chunk_text)
+                section_type = extraction.section_type
+                recommendation_class = extraction.recommendation_class
+                evidence_level = extraction.evidence_level
+            except Exception:
+                pass
+
+        # Use structured chunk metadata if available
+        if use_structured_chunks and hasattr(chunk, 'section_heading'):
+            section_heading = chunk.section_heading
+            is_rec = getattr(chunk, 'is_recommendation', False)
+        else:
+            section_heading = None
+            is_rec = False
+
+        chunk_metadata = {
+            "filename": filename,
+            "chunk_index": chunk_idx,
+            "token_count": token_count,
+        }
+        if section_heading:
+            chunk_metadata["section_heading"] = section_heading
+        if is_rec:
+            chunk_metadata["is_recommendation"] = True
+        if content_warning:
+            chunk_metadata["content_warning"] = content_warning
+
+        return (
+            chunk_idx,               # chunk_index
+            chunk_text,              # chunk_text
+            embedding,               # embedding
+            section_type,            # section_type
+            recommendation_class,    # recommendation_class
+            evidence_level,          # evidence_level
+            chunk_metadata,          # metadata
+        )
+
     def _atomic_neon_sync(
         self,
         vector_store,
@@ -486,11 +521,14 @@ class GuidelinesUploadManager:
         content_hash: Optional[str],
         simhash: Optional[int] = None,
         metadata: Optional[dict] = None,
-        batch_data: list = None,
+        batch_data: Optional[Iterable[tuple]] = None,
     ) -> None:
         """Atomically insert metadata and embeddings in a single transaction (Fix 8).
 
         If any step fails, the entire transaction is rolled back - no orphaned rows.
+        batch_data may be a generator (e.g. rows streaming out of the embedding
+        pipeline); rows are upserted in micro-batches as they arrive, and an
+        exception raised while producing them rolls back the transaction too.
         """
         pool = vector_store._get_pool()
 
@@ -532,12 +570,9 @@ class GuidelinesUploadManager:
                         ),
                     )
 
-                    # Upsert all chunk embeddings
-                    for chunk in batch_data:
-                        (chunk_index, chunk_text, embedding, section_type,
-                         recommendation_class, evidence_level, chunk_metadata) = chunk
-
-                        cur.execute(
+                    # Upsert chunk embeddings in micro-batches
+                    for rows in _micro_batches(batch_data or [], INGEST_UPSERT_BATCH_SIZE):
+                        cur.executemany(
                             """
                             INSERT INTO guideline_embeddings
                             (guideline_id, chunk_index, chunk_text, embedding,
@@ -553,11 +588,15 @@ class GuidelinesUploadManager:
                                 metadata = EXCLUDED.metadata,
                                 updated_at = NOW()
                             """,
-                            (
-                                guideline_id, chunk_index, chunk_text, embedding,
-                                section_type, recommendation_class, evidence_level,
-                                json.dumps(chunk_metadata) if chunk_metadata else None,
-                            ),
+                            [
+                                (
+                                    guideline_id, chunk_index, chunk_text, embedding,
+                                    section_type, recommendation_class, evidence_level,
+                                    json.dumps(chunk_metadata) if chunk_metadata else None,
+                                )
+                                for (chunk_index, chunk_text, embedding, section_type,
+                                     recommendation_class, evidence_level, chunk_metadata) in rows
+                            ],
                         )
 
                     # Both succeeded - commit the transaction
@@ -16,6 +16,7 @@ import os
 import threading
 from typing import Any, Optional
 
+import numpy as np
 from utils.structured_logging import get_logger, timed
 
 from rag.guidelines_env import load_guidelines_env
@@ -336,16 +337,15 @@ class GuidelinesVectorStore:
                 ef_search_val = ef_search or DEFAULT_HNSW_EF_SEARCH
                 cur.execute(f"SET hnsw.ef_search = {ef_search_val}")
 
-                # Convert embedding to string format
-                embedding_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
-
-                # Build query with joins to guidelines table for metadata
+                # Build query with joins to guidelines table for metadata.
+                # The query vector is bound once, as a binary vector parameter.
                 query = """
+                    WITH q AS (SELECT %s::vector AS embedding)
                     SELECT
                         ge.guideline_id,
                         ge.chunk_index,
                         ge.chunk_text,
-                        1 - (ge.embedding <=> %s::vector) as similarity,
+                        1 - (ge.embedding <=> q.embedding) as similarity,
                         ge.section_type,
                         ge.recommendation_class,
                         ge.evidence_level,
@@ -356,10 +356,11 @@ class GuidelinesVectorStore:
                         g.effective_date,
                         ge.metadata
                     FROM guideline_embeddings ge
+                    CROSS JOIN q
                     LEFT JOIN guidelines g ON g.id = ge.guideline_id
                     WHERE 1=1
                 """
-                params = [embedding_str]
+                params = [np.asarray(query_embedding, dtype=np.float32)]
 
                 # Apply expiration filter
                 if not include_expired:
@@ -389,11 +390,11 @@ class GuidelinesVectorStore:
                     params.append(filter_evidence_level)
 
                 if similarity_threshold > 0:
-                    query += " AND 1 - (ge.embedding <=> %s::vector) >= %s"
-                    params.extend([embedding_str, similarity_threshold])
+                    query += " AND ge.embedding <=> q.embedding <= %s"
+                    params.append(1 - similarity_threshold)
 
-                query += " ORDER BY ge.embedding <=> %s::vector LIMIT %s"
-                params.extend([embedding_str, top_k])
+                query += " ORDER BY ge.embedding <=> q.embedding LIMIT %s"
+                params.append(top_k)
 
                 cur.execute(query, params)
                 rows = cur.fetchall()
@@ -844,13 +845,20 @@ class GuidelinesVectorStore:
 
                 # Delete the guideline record
                 cur.execute(
-                    "DELETE FROM guidelines WHERE id = %s::uuid",
+                    "DELETE FROM guidelines WHERE id = %s::uuid "
+                    "RETURNING file_path, metadata->>'file_hash'",
                     (guideline_id,)
                 )
-                guideline_deleted = cur.rowcount
+                deleted_rows = cur.fetchall()
+                guideline_deleted = len(deleted_rows)
 
                 conn.commit()
 
+        # Cached extracted text may contain PHI; it goes with the guideline
+        from rag.extraction_cache import forget_extraction
+        for file_path, file_hash in deleted_rows:
+            forget_extraction(file_hash, file_path)
+
         logger.info(
             f"Deleted guideline {guideline_id}: "
             f"{guideline_deleted} record(s), {embeddings_deleted} embedding(s)"
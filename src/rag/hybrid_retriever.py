@@ -12,6 +12,7 @@ Enhanced with:
 - User feedback boosts
 - Temporal reasoning (time-decay and temporal filtering)
 - Advanced search syntax filtering
+- Query-result cache (exact and semantic tiers)
 """
 
 import re
@@ -75,6 +76,7 @@ class HybridRetriever:
         self._bm25_searcher = None
         self._feedback_manager = None
         self._temporal_reasoner = None
+        self._query_cache = None
 
         # Load config
         self.config = config or get_search_quality_config()
@@ -193,6 +195,33 @@ class HybridRetriever:
                 return None
         return self._temporal_reasoner
 
+    def _get_query_cache(self):
+        """Get the shared query-result cache, or None if disabled."""
+        if self._query_cache is None:
+            try:
+                from rag.query_cache import get_query_cache
+                self._query_cache = get_query_cache()
+            except Exception as e:
+                logger.debug(f"Query cache not available: {e}")
+                return None
+        return self._query_cache
+
+    def _query_cache_options(self, request: RAGQueryRequest, parsed_query) -> str:
+        """Options fingerprint for the query cache."""
+        extra = None
+        if request.enable_feedback_boost:
+            from rag.feedback_manager import get_feedback_version
+            extra = {"feedback_version": get_feedback_version()}
+        return self._query_cache.options_key(request, parsed_query, self.config, extra)
+
+    @staticmethod
+    def _cached_response(response: RAGQueryResponse, start_time: float) -> RAGQueryResponse:
+        """Copy a cached response for the caller, marked as a cache hit."""
+        return response.model_copy(deep=True, update={
+            "cache_hit": True,
+            "processing_time_ms": (time.time() - start_time) * 1000,
+        })
+
     @timed("rag_hybrid_search")
     def search(
         self,
@@ -211,6 +240,17 @@ class HybridRetriever:
         start_time = time.time()
         filters_applied = False
 
+        # Step 0: Exact query-cache lookup
+        cache = self._get_query_cache() if request.enable_cache else None
+        if cache is not None:
+            cache_generation = cache.generation
+            cache_options = self._query_cache_options(request, parsed_query)
+            cache_key = cache.query_key(request.query, cache_options)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Query cache hit (exact)")
+                return self._cached_response(cached, start_time)
+
         # Track search quality features used
         query_expansion: Optional[QueryExpansion] = None
         adaptive_threshold_used: Optional[float] = None
@@ -240,6 +280,14 @@ class HybridRetriever:
         embedding_manager = self._get_embedding_manager()
         query_embedding = embedding_manager.generate_embedding(request.query)
 
+        # Step 2b: Semantic query-cache lookup (paraphrases of a cached query)
+        if cache is not None:
+            cached = None if request.is_followup else cache.get_similar(cache_options, query_embedding)
+            if cached is not None:
+                logger.debug("Query cache hit (semantic)")
+                return self._cached_response(cached, start_time)
+            cache.record_miss()
+
         # Step 3: Vector search (get more for re-ranking)
         vector_store = self._get_vector_store()
         fetch_k = request.top_k * 3  # Get extra for filtering and diversity
@@ -369,7 +417,7 @@ class HybridRetriever:
                 decay_applied=not temporal_query.has_temporal_reference,  # Decay when no explicit reference
             )
 
-        return RAGQueryResponse(
+        response = RAGQueryResponse(
             query=request.query,
             results=combined_results,
             total_results=len(combined_results),
@@ -384,6 +432,17 @@ class HybridRetriever:
             temporal_filtering_applied=temporal_filtering_applied,
         )
 
+        if cache is not None:
+            cache.put(
+                cache_key,
+                cache_options,
+                response.model_copy(deep=True),
+                embedding=query_embedding,
+                generation=cache_generation,
+            )
+
+        return response
+
     def search_simple(
         self,
         query: str,
@@ -870,8 +929,13 @@ class HybridRetriever:
             "graph_search_available": False,
             "embedding_model": "unknown",
             "circuit_breakers": {},
+            "query_cache": {},
         }
 
+        cache = self._get_query_cache()
+        if cache is not None:
+            stats["query_cache"] = cache.get_metrics()
+
         # Get circuit breaker states
         try:
             from rag.rag_resilience import get_circuit_breaker_states
@@ -0,0 +1,148 @@
+"""
+Streaming ingest pipeline for document and guideline uploads.
+
+Embedding requests run on background threads a bounded number of batches
+ahead of the consumer, which upserts each batch as soon as it is ready.
+Network time for embeddings and database writes overlaps, and at most
+``max_pending_batches`` embedded batches are held in memory instead of
+one vector per chunk for the whole document.
+
+Usage:
+    pipeline = StreamingIngestPipeline(embed_texts, embed_batch_size=64)
+    for batch in pipeline.stream(chunks, text_of=lambda c: c.chunk_text):
+        upsert([(chunk, vector) for chunk, vector in batch])
+"""
+
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Generic, Iterable, Iterator, List, Tuple, TypeVar
+
+from utils.structured_logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Texts -> one embedding per text, in order
+EmbedFunction = Callable[[List[str]], List[List[float]]]
+
+_DONE = object()
+
+
+@dataclass
+class _Failure:
+    """Carries an exception from the producer thread to the consumer."""
+    error: BaseException
+
+
+@dataclass
+class IngestStats:
+    """Counters for one pipeline run."""
+    items: int = 0
+    batches: int = 0
+
+
+class StreamingIngestPipeline(Generic[T]):
+    """Embeds items in batches ahead of a consumer, preserving input order."""
+
+    def __init__(
+        self,
+        embed_fn: EmbedFunction,
+        embed_batch_size: int = 64,
+        max_pending_batches: int = 2,
+        embed_workers: int = 1,
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            embed_fn: Embeds a list of texts
+            embed_batch_size: Items per embedding request
+            max_pending_batches: Embedded or in-flight batches allowed ahead of the consumer
+            embed_workers: Concurrent embedding requests
+        """
+        self.embed_fn = embed_fn
+        self.embed_batch_size = max(1, embed_batch_size)
+        self.max_pending_batches = max(1, max_pending_batches)
+        self.embed_workers = max(1, embed_workers)
+        self.stats = IngestStats()
+
+    def stream(
+        self,
+        items: Iterable[T],
+        text_of: Callable[[T], str],
+    ) -> Iterator[List[Tuple[T, List[float]]]]:
+        """Yield batches of (item, embedding) in input order.
+
+        Items are pulled from ``items`` lazily on a producer thread. If the
+        consumer stops early (exception or close()), outstanding work is
+        abandoned and the producer exits.
+
+        Args:
+            items: Items to embed (e.g. chunks); may be a generator
+            text_of: Text to embed for an item
+
+        Yields:
+            Lists of (item, embedding) of up to embed_batch_size entries
+
+        Raises:
+            Any exception raised by items or embed_fn
+        """
+        self.stats = IngestStats()
+        pending: "queue.Queue" = queue.Queue(maxsize=self.max_pending_batches)
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=self.embed_workers, thread_name_prefix="ingest-embed")
+
+        def put(entry) -> bool:
+            # Bounded put that gives up once the consumer has gone away
+            while not stop.is_set():
+                try:
+                    pending.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def embed(batch: List[T]) -> List[Tuple[T, List[float]]]:
+            vectors = self.embed_fn([text_of(item) for item in batch])
+            if len(vectors) != len(batch):
+                raise ValueError(f"Embedding count mismatch: {len(vectors)} for {len(batch)} texts")
+            return list(zip(batch, vectors))
+
+        def produce():
+            try:
+                batch: List[T] = []
+                for item in items:
+                    if stop.is_set():
+                        return
+                    batch.append(item)
+                    if len(batch) == self.embed_batch_size:
+                        if not put(executor.submit(embed, batch)):
+                            return
+                        batch = []
+                if batch and not put(executor.submit(embed, batch)):
+                    return
+                put(_DONE)
+            except BaseException as e:
+                put(_Failure(e))
+
+        producer = threading.Thread(target=produce, daemon=True, name="ingest-producer")
+        producer.start()
+        try:
+            while True:
+                entry = pending.get()
+                if entry is _DONE:
+                    break
+                if isinstance(entry, _Failure):
+                    raise entry.error
+                result = entry.result() if isinstance(entry, Future) else entry
+                self.stats.items += len(result)
+                self.stats.batches += 1
+                yield result
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = ["StreamingIngestPipeline", "IngestStats", "EmbedFunction"]
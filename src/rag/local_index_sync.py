@@ -0,0 +1,178 @@
+"""
+Mirror documents from the remote Neon store into the local vector index.
+
+When the local backend is selected and Neon is reachable, each run compares
+per-document version markers (chunk count + latest write) and copies only
+new or changed documents, streaming their embeddings in batches. Documents
+deleted remotely are dropped locally; documents uploaded while using the
+local backend are left alone.
+
+Usage:
+    from rag.local_index_sync import sync_local_index
+
+    stats = sync_local_index()  # None when not applicable
+"""
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from utils.structured_logging import get_logger
+
+logger = get_logger(__name__)
+
+# (documents_done, documents_to_copy)
+SyncProgressCallback = Callable[[int, int], None]
+
+
+@dataclass
+class LocalIndexSyncStats:
+    """Outcome of one sync run."""
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    chunks_copied: int = 0
+    failed: int = 0
+
+
+class LocalIndexSync:
+    """Copies remote document embeddings into a LocalVectorStore."""
+
+    def __init__(self, remote, local, batch_size: int = 500):
+        """Initialize the sync job.
+
+        Args:
+            remote: NeonVectorStore to read from
+            local: LocalVectorStore to write to
+            batch_size: Chunks fetched and upserted per batch
+        """
+        self.remote = remote
+        self.local = local
+        self.batch_size = batch_size
+
+    def run(
+        self,
+        cancel_event: Optional[threading.Event] = None,
+        progress_callback: Optional[SyncProgressCallback] = None,
+    ) -> LocalIndexSyncStats:
+        """Bring the local index up to date with the remote store.
+
+        Args:
+            cancel_event: Set to stop after the current document
+            progress_callback: Called with (documents_done, documents_to_copy)
+
+        Returns:
+            LocalIndexSyncStats for the run
+        """
+        stats = LocalIndexSyncStats()
+        remote_versions = self.remote.get_document_versions()
+        local_versions = self.local.get_synced_versions()
+
+        for document_id in local_versions.keys() - remote_versions.keys():
+            self.local.delete_document(document_id)
+            stats.removed += 1
+
+        pending = [
+            (document_id, version) for document_id, version in remote_versions.items()
+            if local_versions.get(document_id) != version
+        ]
+        stats.unchanged = len(remote_versions) - len(pending)
+
+        for done, (document_id, version) in enumerate(pending, start=1):
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            try:
+                stats.chunks_copied += self._copy_document(document_id, version)
+                if document_id in local_versions:
+                    stats.updated += 1
+                else:
+                    stats.added += 1
+            except Exception as e:
+                # Drop the partial copy and leave the version unrecorded so
+                # the next run retries it
+                logger.warning(f"Local index sync failed for document {document_id}: {e}")
+                self.local.delete_document(document_id)
+                stats.failed += 1
+            if progress_callback:
+                progress_callback(done, len(pending))
+
+        if stats.added or stats.updated or stats.removed or stats.failed:
+            from rag.query_cache import invalidate_query_cache
+            invalidate_query_cache()
+
+        logger.info(
+            "Local vector index sync complete",
+            added=stats.added,
+            updated=stats.updated,
+            removed=stats.removed,
+            unchanged=stats.unchanged,
+            chunks=stats.chunks_copied,
+            failed=stats.failed,
+        )
+        return stats
+
+    def _copy_document(self, document_id: str, version: str) -> int:
+        """Replace a document's local chunks with the remote ones."""
+        self.local.delete_document(document_id)
+        copied = 0
+        for batch in self.remote.iter_document_embeddings(document_id, batch_size=self.batch_size):
+            self.local.upsert_embeddings_batch(document_id, batch)
+            copied += len(batch)
+        self.local.mark_synced(document_id, version)
+        return copied
+
+
+_sync_lock = threading.Lock()
+
+
+def sync_local_index(
+    cancel_event: Optional[threading.Event] = None,
+    progress_callback: Optional[SyncProgressCallback] = None,
+) -> Optional[LocalIndexSyncStats]:
+    """Mirror Neon into the shared local index if the local backend is in use.
+
+    Overlapping calls return immediately rather than running twice.
+
+    Returns:
+        LocalIndexSyncStats, or None if the local backend is not selected,
+        Neon is not configured, or a sync is already running
+    """
+    from rag.local_vector_store import LocalVectorStore, get_vector_backend
+    from rag.neon_vector_store import NeonVectorStore, get_vector_store
+
+    if get_vector_backend() != "local":
+        return None
+
+    try:
+        from settings.settings_manager import settings_manager
+        index_settings = settings_manager.get("vector_index", {}) or {}
+        neon_url = os.environ.get("NEON_DATABASE_URL") or settings_manager.get("neon_database_url")
+    except Exception:
+        index_settings, neon_url = {}, os.environ.get("NEON_DATABASE_URL")
+    if not neon_url or not index_settings.get("sync_from_remote", True):
+        return None
+
+    if not _sync_lock.acquire(blocking=False):
+        logger.debug("Local index sync already running")
+        return None
+    remote = None
+    try:
+        remote = NeonVectorStore(neon_url, pool_size=1)
+        local = get_vector_store()
+        if not isinstance(local, LocalVectorStore):
+            return None
+        return LocalIndexSync(remote, local).run(cancel_event, progress_callback)
+    finally:
+        if remote is not None:
+            remote.close()
+        _sync_lock.release()
+
+
+__all__ = [
+    "LocalIndexSync",
+    "LocalIndexSyncStats",
+    "SyncProgressCallback",
+    "sync_local_index",
+]
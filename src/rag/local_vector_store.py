@@ -0,0 +1,770 @@
+"""
+Embedded local vector store for RAG.
+
+A drop-in alternative to NeonVectorStore that needs no network, for
+offline clinics and to take WAN latency out of every query:
+
+- Vectors: L2-normalized float32 rows in a memory-mapped file, one row
+  per slot
+- ANN index: IVF (inverted file) over spherical k-means centroids; small
+  collections are scanned exactly
+- Chunk text and metadata: SQLite
+- Keyword search: SQLite FTS5 with BM25 ranking
+
+Cosine similarity is the dot product of normalized vectors, so scores are
+on the same scale as pgvector's ``1 - (a <=> b)``.
+
+Usage:
+    from rag.local_vector_store import LocalVectorStore
+
+    store = LocalVectorStore(data_folder / "vector_index")
+    store.upsert_embeddings_batch(document_id, chunks)
+    results = store.search(query_embedding, top_k=10)
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from utils.structured_logging import get_logger, timed
+
+from rag.exceptions import VectorSearchError
+from rag.models import VectorSearchQuery, VectorSearchResult
+
+logger = get_logger(__name__)
+
+# Slot markers in the IVF assignment file
+_EMPTY = -1        # slot holds no chunk
+_UNASSIGNED = -2   # live chunk added before the index was trained
+
+_INITIAL_CAPACITY = 1024
+_ASSIGN_BLOCK_ROWS = 16384
+_TRAIN_POINTS_PER_LIST = 64
+_KMEANS_ITERATIONS = 10
+
+DEFAULT_IVF_MIN_VECTORS = 20000
+DEFAULT_NPROBE = 16
+# NeonVectorStore's default; ef_search values are scaled relative to it
+_REFERENCE_EF_SEARCH = 40
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS chunks (
+        slot INTEGER PRIMARY KEY,
+        document_id TEXT NOT NULL,
+        chunk_index INTEGER NOT NULL,
+        chunk_text TEXT NOT NULL,
+        metadata TEXT,
+        created_at REAL NOT NULL,
+        UNIQUE (document_id, chunk_index)
+    );
+    CREATE TABLE IF NOT EXISTS documents (
+        document_id TEXT PRIMARY KEY,
+        origin TEXT NOT NULL DEFAULT 'local',
+        remote_version TEXT
+    );
+    CREATE TABLE IF NOT EXISTS free_slots (slot INTEGER PRIMARY KEY);
+    CREATE TABLE IF NOT EXISTS index_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+_FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
+        chunk_text, content='chunks', content_rowid='slot', tokenize='porter unicode61'
+    );
+    CREATE TRIGGER IF NOT EXISTS chunks_fts_insert AFTER INSERT ON chunks BEGIN
+        INSERT INTO chunks_fts(rowid, chunk_text) VALUES (new.slot, new.chunk_text);
+    END;
+    CREATE TRIGGER IF NOT EXISTS chunks_fts_delete AFTER DELETE ON chunks BEGIN
+        INSERT INTO chunks_fts(chunks_fts, rowid, chunk_text) VALUES ('delete', old.slot, old.chunk_text);
+    END;
+    CREATE TRIGGER IF NOT EXISTS chunks_fts_update AFTER UPDATE OF chunk_text ON chunks BEGIN
+        INSERT INTO chunks_fts(chunks_fts, rowid, chunk_text) VALUES ('delete', old.slot, old.chunk_text);
+        INSERT INTO chunks_fts(rowid, chunk_text) VALUES (new.slot, new.chunk_text);
+    END;
+"""
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length (zero rows stay zero)."""
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
+
+
+def _nearest_centroids(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Index of the most similar centroid for each row."""
+    labels = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), _ASSIGN_BLOCK_ROWS):
+        block = np.asarray(vectors[start:start + _ASSIGN_BLOCK_ROWS])
+        labels[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return labels
+
+
+def _spherical_kmeans(data: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+    """Cluster unit vectors by cosine similarity; returns unit centroids."""
+    centroids = data[rng.choice(len(data), size=k, replace=False)].copy()
+    for _ in range(_KMEANS_ITERATIONS):
+        labels = _nearest_centroids(data, centroids)
+        counts = np.bincount(labels, minlength=k)
+        order = np.argsort(labels, kind="stable")
+        starts = np.searchsorted(labels[order], np.arange(k))
+        filled = counts > 0
+
+        sums = np.empty_like(centroids)
+        sums[filled] = np.add.reduceat(data[order], starts[filled], axis=0)
+        # Re-seed empty clusters from random points so every list is usable
+        sums[~filled] = data[rng.choice(len(data), size=int((~filled).sum()))]
+        centroids = _normalize(sums)
+    return centroids
+
+
+def _fts_query(text: str) -> str:
+    """FTS5 MATCH expression: any query term, each quoted to disable syntax."""
+    terms = dict.fromkeys(re.findall(r"\w+", text.lower()))
+    return " OR ".join(f'"{term}"' for term in terms)
+
+
+def _load_metadata(value: Optional[str]) -> Optional[dict]:
+    if value is None:
+        return None
+    try:
+        return json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return {}
+
+
+class LocalVectorStore:
+    """Vector store on the local disk with the NeonVectorStore interface."""
+
+    def __init__(
+        self,
+        directory,
+        ivf_min_vectors: int = DEFAULT_IVF_MIN_VECTORS,
+        nprobe: int = DEFAULT_NPROBE,
+    ):
+        """Open (or create) a local vector store.
+
+        Args:
+            directory: Folder holding the index files
+            ivf_min_vectors: Collections smaller than this are searched exactly
+            nprobe: IVF lists scanned per query (higher = better recall, slower)
+        """
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._vector_path = self._dir / "vectors.f32"
+        self._lists_path = self._dir / "ivf_lists.i32"
+        self._centroids_path = self._dir / "ivf_centroids.npy"
+        self.ivf_min_vectors = max(1, ivf_min_vectors)
+        self.nprobe = max(1, nprobe)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self._dir / "chunks.db"), timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        try:
+            self._conn.executescript(_FTS_SCHEMA)
+            self._fts_available = True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite FTS5 unavailable, local BM25 search disabled: {e}")
+            self._fts_available = False
+        self._conn.commit()
+
+        meta = dict(self._conn.execute("SELECT key, value FROM index_meta").fetchall())
+        self._dimensions: Optional[int] = int(meta["dimensions"]) if "dimensions" in meta else None
+        self._capacity = int(meta.get("capacity", 0))
+        self._trained_count = int(meta.get("trained_count", 0))
+        self._next_slot, self._count = self._conn.execute(
+            "SELECT COALESCE(MAX(slot) + 1, 0), COUNT(*) FROM chunks"
+        ).fetchone()
+        # Trailing freed slots are handed out again as fresh ones
+        self._conn.execute("DELETE FROM free_slots WHERE slot >= ?", (self._next_slot,))
+        self._conn.commit()
+
+        self._vectors: Optional[np.memmap] = None
+        self._lists: Optional[np.memmap] = None
+        self._centroids: Optional[np.ndarray] = None
+        self._postings = None
+
+        if self._dimensions and self._capacity:
+            self._open_arrays()
+            if self._centroids_path.exists():
+                self._centroids = np.load(self._centroids_path)
+            self._reconcile()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _set_meta(self, key: str, value) -> None:
+        self._conn.execute(
+            "INSERT INTO index_meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, str(value))
+        )
+
+    def _open_arrays(self) -> None:
+        self._vectors = np.memmap(
+            self._vector_path, dtype=np.float32, mode="r+", shape=(self._capacity, self._dimensions)
+        )
+        self._lists = np.memmap(self._lists_path, dtype=np.int32, mode="r+", shape=(self._capacity,))
+
+    def _release_arrays(self) -> None:
+        # Mappings must be dropped before the files can be resized (Windows)
+        for array in (self._vectors, self._lists):
+            if array is not None:
+                array.flush()
+        self._vectors = None
+        self._lists = None
+
+    def _ensure_capacity(self, needed: int) -> None:
+        if needed <= self._capacity:
+            return
+        old_capacity = self._capacity
+        new_capacity = max(needed, old_capacity * 2, _INITIAL_CAPACITY)
+        self._release_arrays()
+        for path, row_bytes in ((self._vector_path, self._dimensions * 4), (self._lists_path, 4)):
+            with open(path, "r+b" if path.exists() else "w+b") as f:
+                f.truncate(new_capacity * row_bytes)
+        self._capacity = new_capacity
+        self._open_arrays()
+        self._lists[old_capacity:] = _EMPTY
+        self._set_meta("capacity", new_capacity)
+
+    def _reconcile(self) -> None:
+        """Make slot markers agree with SQLite after an interrupted write."""
+        live = np.zeros(self._capacity, dtype=bool)
+        slots = np.fromiter((row[0] for row in self._conn.execute("SELECT slot FROM chunks")), dtype=np.int64)
+        live[slots] = True
+        lists = self._lists
+        lists[~live] = _EMPTY
+        if self._centroids is None:
+            lists[live] = _UNASSIGNED
+        else:
+            lists[live & ((lists == _EMPTY) | (lists >= len(self._centroids)))] = _UNASSIGNED
+        lists.flush()
+
+    def _allocate_slots(self, count: int) -> list[int]:
+        free = [row[0] for row in self._conn.execute("SELECT slot FROM free_slots ORDER BY slot LIMIT ?", (count,))]
+        if free:
+            self._conn.executemany("DELETE FROM free_slots WHERE slot = ?", [(slot,) for slot in free])
+        fresh = list(range(self._next_slot, self._next_slot + count - len(free)))
+        self._next_slot += len(fresh)
+        return free + fresh
+
+    def _assign(self, slots: np.ndarray, vectors: np.ndarray) -> None:
+        if self._centroids is None:
+            self._lists[slots] = _UNASSIGNED
+        else:
+            self._lists[slots] = _nearest_centroids(vectors, self._centroids)
+        self._postings = None
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert_embedding(
+        self,
+        document_id: str,
+        chunk_index: int,
+        chunk_text: str,
+        embedding: list[float],
+        metadata: Optional[dict] = None,
+    ) -> int:
+        """Upsert a single embedding.
+
+        Returns:
+            Slot of the inserted/updated chunk
+        """
+        return self.upsert_embeddings_batch(document_id, [(chunk_index, chunk_text, embedding, metadata)])[0]
+
+    def upsert_embeddings_batch(
+        self,
+        document_id: str,
+        chunks: list[tuple[int, str, list[float], Optional[dict]]],
+    ) -> list[int]:
+        """Upsert multiple embeddings for a document.
+
+        Args:
+            document_id: ID of the document
+            chunks: List of (chunk_index, chunk_text, embedding, metadata) tuples
+
+        Returns:
+            Slot of each chunk, in input order (slots are the local row IDs)
+        """
+        if not chunks:
+            return []
+
+        latest = {chunk[0]: chunk for chunk in chunks}
+        matrix = np.asarray([chunk[2] for chunk in latest.values()], dtype=np.float32)
+        if matrix.ndim != 2:
+            raise ValueError("Embeddings must all have the same number of dimensions")
+
+        with self._lock:
+            if self._dimensions is None:
+                self._dimensions = int(matrix.shape[1])
+                self._set_meta("dimensions", self._dimensions)
+            elif matrix.shape[1] != self._dimensions:
+                raise ValueError(
+                    f"Embedding has {matrix.shape[1]} dimensions; local index uses {self._dimensions}"
+                )
+
+            existing = dict(self._conn.execute(
+                "SELECT chunk_index, slot FROM chunks WHERE document_id = ?", (document_id,)
+            ).fetchall())
+            new_indexes = [index for index in latest if index not in existing]
+            self._count += len(new_indexes)
+            slot_by_index = {**existing, **dict(zip(new_indexes, self._allocate_slots(len(new_indexes))))}
+
+            slots = np.array([slot_by_index[index] for index in latest], dtype=np.int64)
+            self._ensure_capacity(int(slots.max()) + 1)
+            matrix = _normalize(matrix)
+            self._vectors[slots] = matrix
+            self._assign(slots, matrix)
+            self._vectors.flush()
+            self._lists.flush()
+
+            now = time.time()
+            self._conn.executemany(
+                "INSERT INTO chunks (slot, document_id, chunk_index, chunk_text, metadata, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(slot) DO UPDATE SET chunk_text = excluded.chunk_text, "
+                "metadata = excluded.metadata, created_at = excluded.created_at",
+                [
+                    (slot_by_index[index], document_id, index, text,
+                     json.dumps(metadata) if metadata else None, now)
+                    for index, text, _, metadata in latest.values()
+                ]
+            )
+            self._conn.execute("INSERT OR IGNORE INTO documents (document_id) VALUES (?)", (document_id,))
+            self._conn.commit()
+
+            self._maybe_build_index()
+
+        return [slot_by_index[chunk[0]] for chunk in chunks]
+
+    def _release_rows(self, where: str, params: tuple) -> int:
+        slots = [row[0] for row in self._conn.execute(f"SELECT slot FROM chunks WHERE {where}", params)]
+        if not slots:
+            return 0
+        self._conn.execute(f"DELETE FROM chunks WHERE {where}", params)
+        self._conn.executemany("INSERT OR IGNORE INTO free_slots (slot) VALUES (?)", [(s,) for s in slots])
+        self._lists[np.array(slots, dtype=np.int64)] = _EMPTY
+        self._count -= len(slots)
+        self._lists.flush()
+        self._postings = None
+        return len(slots)
+
+    def delete_document(self, document_id: str) -> int:
+        """Delete all embeddings for a document.
+
+        Returns:
+            Number of chunks deleted
+        """
+        with self._lock:
+            deleted = self._release_rows("document_id = ?", (document_id,)) if self._lists is not None else 0
+            self._conn.execute("DELETE FROM documents WHERE document_id = ?", (document_id,))
+            self._conn.commit()
+
+        logger.info(f"Deleted {deleted} local embeddings for document {document_id}")
+        return deleted
+
+    def delete_chunk(self, document_id: str, chunk_index: int) -> bool:
+        """Delete a specific chunk.
+
+        Returns:
+            True if deleted, False if not found
+        """
+        with self._lock:
+            if self._lists is None:
+                return False
+            deleted = self._release_rows("document_id = ? AND chunk_index = ?", (document_id, chunk_index))
+            self._conn.commit()
+        return deleted > 0
+
+    # ------------------------------------------------------------------
+    # IVF index
+    # ------------------------------------------------------------------
+
+    def _maybe_build_index(self) -> None:
+        count = self._count
+        if count >= self.ivf_min_vectors and (self._centroids is None or count > 2 * self._trained_count):
+            self.build_index()
+
+    def build_index(self, n_lists: Optional[int] = None) -> None:
+        """(Re)train IVF centroids and reassign every vector.
+
+        Runs automatically when the collection first reaches
+        ``ivf_min_vectors`` and whenever it has doubled since the last
+        training, so list sizes stay balanced as documents are added.
+
+        Args:
+            n_lists: Number of inverted lists (default: sqrt of the collection size)
+        """
+        with self._lock:
+            if self._lists is None:
+                return
+            live_slots = np.flatnonzero(self._lists[:self._next_slot] != _EMPTY)
+            if len(live_slots) == 0:
+                return
+
+            started = time.perf_counter()
+            k = n_lists or int(round(np.sqrt(len(live_slots))))
+            k = max(1, min(k, 4096, len(live_slots)))
+            rng = np.random.default_rng(0)
+            sample = np.sort(rng.choice(live_slots, size=min(len(live_slots), k * _TRAIN_POINTS_PER_LIST),
+                                        replace=False))
+            centroids = _spherical_kmeans(np.asarray(self._vectors[sample]), k, rng)
+
+            for start in range(0, len(live_slots), _ASSIGN_BLOCK_ROWS):
+                block = live_slots[start:start + _ASSIGN_BLOCK_ROWS]
+                self._lists[block] = _nearest_centroids(self._vectors[block], centroids)
+            self._lists.flush()
+
+            tmp_path = self._centroids_path.with_suffix(".tmp.npy")
+            np.save(tmp_path, centroids)
+            os.replace(tmp_path, self._centroids_path)
+            self._centroids = centroids
+            self._trained_count = len(live_slots)
+            self._set_meta("trained_count", self._trained_count)
+            self._conn.commit()
+            self._postings = None
+
+        logger.info(
+            "Built local IVF index",
+            vectors=len(live_slots),
+            lists=k,
+            duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+
+    def _get_postings(self) -> tuple[np.ndarray, np.ndarray]:
+        """Slots grouped by list: (slots sorted by list, boundaries per list value)."""
+        if self._postings is None:
+            lists = np.asarray(self._lists[:self._next_slot])
+            order = np.argsort(lists, kind="stable")
+            k = len(self._centroids) if self._centroids is not None else 0
+            # bounds[v - _UNASSIGNED] is where list value v starts in order
+            bounds = np.searchsorted(lists[order], np.arange(_UNASSIGNED, k + 1))
+            self._postings = (order, bounds)
+        return self._postings
+
+    def _candidate_slots(self, query: np.ndarray, nprobe: int) -> Optional[np.ndarray]:
+        """Slots to score for a query, or None to scan everything."""
+        if self._centroids is None or self._count < self.ivf_min_vectors:
+            return None
+        order, bounds = self._get_postings()
+        offset = -_UNASSIGNED
+        probes = np.argsort(-(self._centroids @ query))[:nprobe]
+        parts = [order[bounds[0]:bounds[1]]]  # unassigned: always scanned
+        parts.extend(order[bounds[p + offset]:bounds[p + offset + 1]] for p in probes)
+        return np.concatenate(parts)
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _fetch_rows(self, slots: list[int]) -> dict[int, tuple]:
+        rows = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(slots), 500):
+            batch = slots[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            for row in self._conn.execute(
+                f"SELECT slot, document_id, chunk_index, chunk_text, metadata FROM chunks "
+                f"WHERE slot IN ({placeholders})",
+                batch
+            ):
+                rows[row[0]] = row[1:]
+        return rows
+
+    @timed("rag_local_vector_search")
+    def search(
+        self,
+        query_embedding: list[float],
+        top_k: int = 10,
+        similarity_threshold: float = 0.0,
+        filter_document_ids: Optional[list[str]] = None,
+        ef_search: Optional[int] = None,
+    ) -> list[VectorSearchResult]:
+        """Search for similar embeddings using cosine similarity.
+
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of results to return
+            similarity_threshold: Minimum similarity score (0-1 for cosine)
+            filter_document_ids: Optional list of document IDs to filter (searched exactly)
+            ef_search: NeonVectorStore's recall knob; scales nprobe relative to its default of 40
+
+        Returns:
+            List of VectorSearchResult objects with cosine similarity scores
+        """
+        with self._lock:
+            if self._vectors is None or self._next_slot == 0:
+                return []
+            query = np.asarray(query_embedding, dtype=np.float32)
+            if query.shape != (self._dimensions,):
+                raise VectorSearchError(
+                    f"Query has {query.size} dimensions; local index uses {self._dimensions}",
+                    store_type="local",
+                    query_type="similarity",
+                )
+            query = _normalize(query)
+
+            if filter_document_ids:
+                placeholders = ",".join("?" * len(filter_document_ids))
+                candidates = np.array([row[0] for row in self._conn.execute(
+                    f"SELECT slot FROM chunks WHERE document_id IN ({placeholders})", filter_document_ids
+                )], dtype=np.int64)
+            else:
+                nprobe = self.nprobe
+                if ef_search:
+                    nprobe = max(1, round(self.nprobe * ef_search / _REFERENCE_EF_SEARCH))
+                candidates = self._candidate_slots(query, nprobe)
+
+            if candidates is None:
+                scores = np.asarray(self._vectors[:self._next_slot]) @ query
+                scores[np.asarray(self._lists[:self._next_slot]) == _EMPTY] = -np.inf
+                candidates = np.arange(self._next_slot)
+            else:
+                scores = self._vectors[candidates] @ query
+
+            keep = scores >= similarity_threshold if similarity_threshold > 0 else np.isfinite(scores)
+            candidates, scores = candidates[keep], scores[keep]
+            if len(scores) > top_k:
+                top = np.argpartition(-scores, top_k - 1)[:top_k]
+                candidates, scores = candidates[top], scores[top]
+            ranked = np.argsort(-scores, kind="stable")
+            slots = [int(candidates[i]) for i in ranked]
+            rows = self._fetch_rows(slots)
+
+        results = []
+        for slot, score in zip(slots, scores[ranked]):
+            document_id, chunk_index, chunk_text, metadata = rows[slot]
+            results.append(VectorSearchResult(
+                document_id=document_id,
+                chunk_index=chunk_index,
+                chunk_text=chunk_text,
+                similarity_score=float(score),
+                metadata=_load_metadata(metadata),
+            ))
+        return results
+
+    def search_with_query(self, query: VectorSearchQuery) -> list[VectorSearchResult]:
+        """Search using a VectorSearchQuery object."""
+        if not query.query_embedding:
+            raise ValueError("query_embedding is required for search")
+
+        return self.search(
+            query_embedding=query.query_embedding,
+            top_k=query.top_k,
+            similarity_threshold=query.similarity_threshold,
+            filter_document_ids=query.filter_document_ids,
+        )
+
+    @timed("rag_local_bm25_search")
+    def search_bm25(
+        self,
+        query: str,
+        top_k: int = 10,
+        filter_document_ids: Optional[list[str]] = None,
+    ) -> list[VectorSearchResult]:
+        """Perform BM25 full-text search using SQLite FTS5.
+
+        Any query term may match (ranking favours chunks matching more of
+        them), since FTS5 has no stop-word list to drop words like "the".
+
+        Args:
+            query: Search query text
+            top_k: Number of results to return
+            filter_document_ids: Optional list of document IDs to filter
+
+        Returns:
+            List of VectorSearchResult objects with BM25 scores normalized to 0-1
+        """
+        match = _fts_query(query)
+        if not self._fts_available or not match:
+            return []
+
+        sql = """
+            SELECT c.document_id, c.chunk_index, c.chunk_text, bm25(chunks_fts) AS rank, c.metadata
+            FROM chunks_fts
+            JOIN chunks c ON c.slot = chunks_fts.rowid
+            WHERE chunks_fts MATCH ?
+        """
+        params: list = [match]
+        if filter_document_ids:
+            sql += f" AND c.document_id IN ({','.join('?' * len(filter_document_ids))})"
+            params.extend(filter_document_ids)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(top_k)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        results = []
+        for document_id, chunk_index, chunk_text, rank, metadata in rows:
+            # FTS5 bm25() is negative, more negative = better match
+            strength = max(0.0, -float(rank))
+            results.append(VectorSearchResult(
+                document_id=document_id,
+                chunk_index=chunk_index,
+                chunk_text=chunk_text,
+                similarity_score=strength / (1.0 + strength),
+                metadata=_load_metadata(metadata),
+            ))
+        return results
+
+    def has_search_vector_column(self) -> bool:
+        """Whether keyword (BM25) search is available."""
+        return self._fts_available
+
+    # ------------------------------------------------------------------
+    # Documents and sync bookkeeping
+    # ------------------------------------------------------------------
+
+    def get_document_chunks(self, document_id: str) -> list[dict]:
+        """Get all chunks for a document."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT slot, chunk_index, chunk_text, metadata, created_at FROM chunks "
+                "WHERE document_id = ? ORDER BY chunk_index",
+                (document_id,)
+            ).fetchall()
+        return [
+            {
+                "id": slot,
+                "chunk_index": chunk_index,
+                "chunk_text": chunk_text,
+                "metadata": _load_metadata(metadata),
+                "created_at": created_at,
+            }
+            for slot, chunk_index, chunk_text, metadata, created_at in rows
+        ]
+
+    def get_remote_document_summaries(self) -> list[dict]:
+        """Summaries of every document in the local index.
+
+        Same shape as NeonVectorStore.get_remote_document_summaries so the
+        document library can list locally indexed documents.
+        """
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT c.document_id, COUNT(*),
+                       (SELECT metadata FROM chunks s WHERE s.document_id = c.document_id
+                        ORDER BY s.chunk_index LIMIT 1)
+                FROM chunks c
+                GROUP BY c.document_id
+            """).fetchall()
+
+        results = []
+        for document_id, chunk_count, metadata_val in rows:
+            metadata = _load_metadata(metadata_val) or {}
+            results.append({
+                "document_id": document_id,
+                "filename": metadata.get("filename", "Unknown"),
+                "category": metadata.get("category"),
+                "tags": metadata.get("tags", []),
+                "chunk_count": chunk_count,
+            })
+        return results
+
+    def get_synced_versions(self) -> dict[str, Optional[str]]:
+        """Remote version of each document mirrored from Neon."""
+        with self._lock:
+            return dict(self._conn.execute(
+                "SELECT document_id, remote_version FROM documents WHERE origin = 'remote'"
+            ).fetchall())
+
+    def mark_synced(self, document_id: str, remote_version: str) -> None:
+        """Record that a document's chunks mirror the given remote version."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO documents (document_id, origin, remote_version) VALUES (?, 'remote', ?) "
+                "ON CONFLICT(document_id) DO UPDATE SET origin = 'remote', remote_version = excluded.remote_version",
+                (document_id, remote_version)
+            )
+            self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Status
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> dict:
+        """Get vector store statistics."""
+        with self._lock:
+            total_embeddings, total_documents = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT document_id) FROM chunks"
+            ).fetchone()
+        avg_chunks = total_embeddings / total_documents if total_documents else 0
+        return {
+            "total_embeddings": total_embeddings,
+            "total_documents": total_documents,
+            "avg_chunks_per_document": round(float(avg_chunks), 1),
+        }
+
+    def health_check(self) -> bool:
+        """Check if the local index is readable."""
+        try:
+            with self._lock:
+                return self._conn.execute("SELECT 1").fetchone()[0] == 1
+        except sqlite3.Error as e:
+            logger.error(f"Local vector store health check failed: {e}")
+            return False
+
+    def get_index_health(self) -> dict:
+        """Get health and statistics for the local index."""
+        with self._lock:
+            total = self._count
+            size_bytes = sum(p.stat().st_size for p in (self._vector_path, self._lists_path) if p.exists())
+            return {
+                "backend": "local",
+                "ivf_index_exists": self._centroids is not None,
+                "ivf_lists": len(self._centroids) if self._centroids is not None else 0,
+                "ivf_trained_count": self._trained_count,
+                "index_size_mb": round(size_bytes / (1024 * 1024), 2),
+                "search_vector_index_exists": self._fts_available,
+                "total_embeddings": total,
+                "dimensions": self._dimensions,
+            }
+
+    def close(self) -> None:
+        """Flush the vector files and close the database."""
+        with self._lock:
+            self._release_arrays()
+            self._conn.close()
+
+
+def get_vector_backend() -> str:
+    """Configured vector store backend: "neon" (default) or "local"."""
+    try:
+        from settings.settings_manager import settings_manager
+        index_settings = settings_manager.get("vector_index", {}) or {}
+    except Exception:
+        index_settings = {}
+    return index_settings.get("backend", "neon")
+
+
+def create_local_vector_store() -> LocalVectorStore:
+    """Open the local store in the data folder with the "vector_index" settings."""
+    from managers.data_folder_manager import data_folder_manager
+    from settings.settings_manager import settings_manager
+
+    index_settings = settings_manager.get("vector_index", {}) or {}
+    return LocalVectorStore(
+        data_folder_manager.data_folder / "vector_index",
+        ivf_min_vectors=index_settings.get("ivf_min_vectors", DEFAULT_IVF_MIN_VECTORS),
+        nprobe=index_settings.get("nprobe", DEFAULT_NPROBE),
+    )
+
+
+__all__ = [
+    "LocalVectorStore",
+    "create_local_vector_store",
+    "get_vector_backend",
+]
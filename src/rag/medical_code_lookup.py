@@ -2,7 +2,9 @@
 Lightweight Medical Code Lookup for Knowledge Graph Enrichment.
 
 Best-effort term-to-code mapper for common medical conditions and medications.
-Uses static dictionaries with ~100 common mappings each.
+Uses static dictionaries with ~100 common mappings each, then the local
+ICD-10-CM/RxNorm terminology index (exact or close typo-tolerant name
+match) when release files are configured.
 Non-blocking: returns None for unknown terms.
 
 Code systems:
@@ -12,6 +14,11 @@ Code systems:
 
 from typing import Optional
 
+from utils.terminology_index import ICD10CM, RXNORM, get_terminology_index
+
+# Minimum fuzzy score for a terminology-index match to be used
+MIN_TERMINOLOGY_SCORE = 0.85
+
 
 # Common ICD-10-CM codes for frequently encountered conditions
 ICD10_CODES: dict[str, str] = {
@@ -205,36 +212,52 @@ RXNORM_CODES: dict[str, str] = {
 }
 
 
-def lookup_icd10(condition: str) -> Optional[str]:
+def lookup_icd10(condition: str, fuzzy: bool = False) -> Optional[str]:
     """Look up ICD-10-CM code for a medical condition.
 
-    Best-effort lookup using a static dictionary of ~100 common conditions.
+    Best-effort lookup using a static dictionary of ~100 common conditions,
+    then the terminology index if configured.
 
     Args:
         condition: Medical condition name or abbreviation
+        fuzzy: Accept a close (typo-tolerant) index match when no name
+            matches exactly
 
     Returns:
         ICD-10-CM code string, or None if not found
     """
     if not condition:
         return None
-    return ICD10_CODES.get(condition.lower().strip())
+    code = ICD10_CODES.get(condition.lower().strip())
+    if code is None:
+        index = get_terminology_index()
+        match = index.find_code(condition, ICD10CM, MIN_TERMINOLOGY_SCORE, fuzzy=fuzzy) if index else None
+        code = match.code if match else None
+    return code
 
 
-def lookup_rxnorm(medication: str) -> Optional[str]:
+def lookup_rxnorm(medication: str, fuzzy: bool = False) -> Optional[str]:
     """Look up RxNorm code for a medication.
 
-    Best-effort lookup using a static dictionary of ~80 common medications.
+    Best-effort lookup using a static dictionary of ~80 common medications,
+    then the terminology index if configured.
 
     Args:
         medication: Medication name
+        fuzzy: Accept a close (typo-tolerant) index match when no name
+            matches exactly
 
     Returns:
         RxNorm code string, or None if not found
     """
     if not medication:
         return None
-    return RXNORM_CODES.get(medication.lower().strip())
+    code = RXNORM_CODES.get(medication.lower().strip())
+    if code is None:
+        index = get_terminology_index()
+        match = index.find_code(medication, RXNORM, MIN_TERMINOLOGY_SCORE, fuzzy=fuzzy) if index else None
+        code = f"RxNorm:{match.code}" if match else None
+    return code
 
 
 def enrich_entity_codes(name: str, entity_type: str) -> dict[str, str]:
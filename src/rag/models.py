@@ -41,6 +41,8 @@ class DocumentMetadata(BaseModel):
     language: str = "en"
     category: Optional[str] = None
     custom_tags: list[str] = Field(default_factory=list)
+    # SHA-256 of the source file's bytes, the extraction cache key
+    file_hash: Optional[str] = None
 
 
 class DocumentChunk(BaseModel):
@@ -166,6 +168,8 @@ class RAGQueryRequest(BaseModel):
     enable_mmr: bool = True
     enable_feedback_boost: bool = True  # Apply user feedback relevance boosts
     enable_temporal_reasoning: bool = True  # Apply temporal decay and filtering
+    enable_cache: bool = True  # Reuse cached results for repeated queries
+    is_followup: bool = False  # Follow-up queries only reuse exact cache matches
 
 
 class TemporalInfo(BaseModel):
@@ -192,6 +196,7 @@ class RAGQueryResponse(BaseModel):
     feedback_boosts_applied: bool = False  # Whether user feedback boosts were applied
     temporal_info: Optional[TemporalInfo] = None  # Temporal reasoning info
     temporal_filtering_applied: bool = False  # Whether results were time-filtered
+    cache_hit: bool = False  # Whether results came from the query cache
 
 
 class DocumentUploadRequest(BaseModel):
@@ -17,6 +17,7 @@ import os
 import pathlib
 from typing import Any, Optional
 
+import numpy as np
 from dotenv import load_dotenv
 from utils.structured_logging import get_logger, timed
 
@@ -61,6 +62,20 @@ logger = get_logger(__name__)
 DEFAULT_HNSW_EF_SEARCH = 40
 
 
+def _as_vector(embedding) -> "np.ndarray":
+    """Embedding as float32 array, sent in pgvector's binary format."""
+    return np.asarray(embedding, dtype=np.float32)
+
+
+def _embedding_from_db(value) -> "np.ndarray":
+    """Embedding column value as float32 array, whichever way it was loaded."""
+    if hasattr(value, "to_numpy"):  # pgvector.Vector (pgvector >= 0.3 loaders)
+        return value.to_numpy()
+    if isinstance(value, str):  # vector type not registered
+        return np.asarray(json.loads(value), dtype=np.float32)
+    return np.asarray(value, dtype=np.float32)
+
+
 class NeonVectorStore:
     """Vector store using Neon PostgreSQL with pgvector."""
 
@@ -202,53 +217,75 @@ class NeonVectorStore:
     ) -> list[int]:
         """Upsert multiple embeddings for a document.
 
+        Rows are streamed into a temporary staging table with binary COPY and
+        merged into document_embeddings with one INSERT ... SELECT, so a batch
+        costs a constant number of round trips instead of one per chunk.
+
         Args:
             document_id: UUID of the document
             chunks: List of (chunk_index, chunk_text, embedding, metadata) tuples
 
         Returns:
-            List of inserted/updated row IDs
+            List of inserted/updated row IDs, in input order
         """
         if not chunks:
             return []
 
+        from psycopg.types.json import Jsonb
+
+        # ON CONFLICT cannot touch the same row twice in one statement;
+        # keep the last occurrence of a repeated chunk index
+        latest = {chunk[0]: chunk for chunk in chunks}
+
         pool = self._get_pool()
-        ids = []
 
         with pool.connection() as conn:
             self._ensure_pgvector(conn)
 
             with conn.cursor() as cur:
-                # Use executemany for batch insert
-                for chunk_index, chunk_text, embedding, metadata in chunks:
-                    cur.execute(
-                        """
-                        INSERT INTO document_embeddings
-                        (document_id, chunk_index, chunk_text, embedding, metadata)
-                        VALUES (%s::uuid, %s, %s, %s, %s)
-                        ON CONFLICT (document_id, chunk_index)
-                        DO UPDATE SET
-                            chunk_text = EXCLUDED.chunk_text,
-                            embedding = EXCLUDED.embedding,
-                            metadata = EXCLUDED.metadata,
-                            created_at = NOW()
-                        RETURNING id
-                        """,
-                        (
-                            document_id,
+                cur.execute(
+                    """
+                    CREATE TEMP TABLE document_embeddings_staging (
+                        chunk_index INTEGER NOT NULL,
+                        chunk_text TEXT NOT NULL,
+                        embedding vector NOT NULL,
+                        metadata JSONB
+                    ) ON COMMIT DROP
+                    """
+                )
+                with cur.copy(
+                    "COPY document_embeddings_staging (chunk_index, chunk_text, embedding, metadata) "
+                    "FROM STDIN WITH (FORMAT BINARY)"
+                ) as copy:
+                    copy.set_types(["int4", "text", "vector", "jsonb"])
+                    for chunk_index, chunk_text, embedding, metadata in latest.values():
+                        copy.write_row((
                             chunk_index,
                             chunk_text,
-                            embedding,
-                            json.dumps(metadata) if metadata else None,
-                        )
-                    )
-                    result = cur.fetchone()
-                    if result:
-                        ids.append(result[0])
+                            _as_vector(embedding),
+                            Jsonb(metadata) if metadata else None,
+                        ))
 
+                cur.execute(
+                    """
+                    INSERT INTO document_embeddings
+                    (document_id, chunk_index, chunk_text, embedding, metadata)
+                    SELECT %s::uuid, chunk_index, chunk_text, embedding, metadata
+                    FROM document_embeddings_staging
+                    ON CONFLICT (document_id, chunk_index)
+                    DO UPDATE SET
+                        chunk_text = EXCLUDED.chunk_text,
+                        embedding = EXCLUDED.embedding,
+                        metadata = EXCLUDED.metadata,
+                        created_at = NOW()
+                    RETURNING id, chunk_index
+                    """,
+                    (document_id,)
+                )
+                ids_by_index = {chunk_index: row_id for row_id, chunk_index in cur.fetchall()}
                 conn.commit()
 
-        return ids
+        return [ids_by_index[chunk[0]] for chunk in chunks if chunk[0] in ids_by_index]
 
     @timed("rag_vector_search")
     def search(
@@ -287,35 +324,34 @@ class NeonVectorStore:
                 ef_search_val = ef_search or DEFAULT_HNSW_EF_SEARCH
                 cur.execute(f"SET hnsw.ef_search = {ef_search_val}")
 
-                # Convert embedding to string format for vector cast
-                embedding_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
-
                 # Build query using cosine distance operator (<=>)
                 # Cosine similarity = 1 - cosine_distance
-                # The <=> operator uses HNSW index when available
+                # The query vector is bound once, as a binary vector parameter;
+                # the CTE is inlined so the <=> ordering still uses HNSW
                 query = """
+                    WITH q AS (SELECT %s::vector AS embedding)
                     SELECT
-                        document_id,
-                        chunk_index,
-                        chunk_text,
-                        1 - (embedding <=> %s::vector) as similarity,
-                        metadata
-                    FROM document_embeddings
+                        e.document_id,
+                        e.chunk_index,
+                        e.chunk_text,
+                        1 - (e.embedding <=> q.embedding) as similarity,
+                        e.metadata
+                    FROM document_embeddings e, q
                     WHERE 1=1
                 """
-                params = [embedding_str]
+                params = [_as_vector(query_embedding)]
 
                 if filter_document_ids:
                     placeholders = ",".join(["%s::uuid"] * len(filter_document_ids))
-                    query += f" AND document_id IN ({placeholders})"
+                    query += f" AND e.document_id IN ({placeholders})"
                     params.extend(filter_document_ids)
 
                 if similarity_threshold > 0:
-                    query += " AND 1 - (embedding <=> %s::vector) >= %s"
-                    params.extend([embedding_str, similarity_threshold])
+                    query += " AND e.embedding <=> q.embedding <= %s"
+                    params.append(1 - similarity_threshold)
 
-                query += " ORDER BY embedding <=> %s::vector LIMIT %s"
-                params.extend([embedding_str, top_k])
+                query += " ORDER BY e.embedding <=> q.embedding LIMIT %s"
+                params.append(top_k)
 
                 cur.execute(query, params)
                 rows = cur.fetchall()
@@ -681,6 +717,78 @@ class NeonVectorStore:
 
         return results
 
+    def get_document_versions(self) -> dict[str, str]:
+        """Get a change marker for every document in the remote store.
+
+        The marker combines chunk count and latest write time, so it changes
+        whenever a document is re-ingested or partially rewritten.
+
+        Returns:
+            Dict of document_id -> version string
+        """
+        pool = self._get_pool()
+
+        with pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT document_id, COUNT(*), MAX(created_at)
+                    FROM document_embeddings
+                    GROUP BY document_id
+                """)
+                rows = cur.fetchall()
+
+        return {
+            str(doc_id): f"{chunk_count}:{latest.isoformat() if latest else ''}"
+            for doc_id, chunk_count, latest in rows
+        }
+
+    def iter_document_embeddings(
+        self,
+        document_id: str,
+        batch_size: int = 500,
+    ):
+        """Stream a document's chunks with their embeddings.
+
+        Uses a server-side cursor so large documents are not loaded at once.
+
+        Args:
+            document_id: UUID of the document
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Lists of (chunk_index, chunk_text, embedding, metadata) tuples,
+            ready for upsert_embeddings_batch
+        """
+        pool = self._get_pool()
+
+        with pool.connection() as conn:
+            self._ensure_pgvector(conn)
+
+            with conn.cursor(name=f"embeddings_{document_id.replace('-', '')}") as cur:
+                cur.execute(
+                    """
+                    SELECT chunk_index, chunk_text, embedding, metadata
+                    FROM document_embeddings
+                    WHERE document_id = %s::uuid
+                    ORDER BY chunk_index
+                    """,
+                    (document_id,)
+                )
+                while True:
+                    rows = cur.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield [
+                        (
+                            chunk_index,
+                            chunk_text,
+                            _embedding_from_db(embedding),
+                            metadata if isinstance(metadata, dict) or metadata is None
+                            else json.loads(metadata),
+                        )
+                        for chunk_index, chunk_text, embedding, metadata in rows
+                    ]
+
     def get_index_health(self) -> dict:
         """Get health and statistics for vector indexes.
 
@@ -769,12 +877,20 @@ _vector_store: Optional[NeonVectorStore] = None
 def get_vector_store() -> NeonVectorStore:
     """Get the global vector store instance.
 
+    Settings select the backend ("vector_index" -> "backend"): "neon"
+    (default) or "local" for the embedded index in the data folder, which
+    implements the same search/upsert/delete interface.
+
     Returns:
-        NeonVectorStore instance
+        NeonVectorStore instance, or LocalVectorStore when "local" is selected
     """
     global _vector_store
     if _vector_store is None:
-        _vector_store = NeonVectorStore()
+        from rag.local_vector_store import create_local_vector_store, get_vector_backend
+        if get_vector_backend() == "local":
+            _vector_store = create_local_vector_store()
+        else:
+            _vector_store = NeonVectorStore()
     return _vector_store
 
 
@@ -0,0 +1,234 @@
+"""
+Page-parallel PDF extraction for RAG ingestion.
+
+pdfplumber parsing and page rendering are CPU-bound and run in a process
+pool, a batch of pages per task. Sparse (probably scanned) pages are
+rendered in the worker and handed back as PNG bytes; OCR calls are
+network-bound and run on a small thread pool so that at most
+``ocr_concurrency`` requests are in flight. Pages are yielded strictly in
+page order as soon as every earlier page is done, so consumers can start
+chunking before the whole document has been read.
+
+Small documents are parsed in-process: spawning workers costs more than
+it saves below a few dozen pages.
+"""
+
+import io
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from utils.structured_logging import get_logger
+
+logger = get_logger(__name__)
+
+# (pages_done, page_count)
+PageProgressCallback = Callable[[int, int], None]
+# PIL image -> OCR text ("" on failure)
+OCRFunction = Callable[[object], str]
+
+# Pages with fewer characters than this are treated as scanned
+MIN_CHARS_PER_PAGE = 50
+
+
+@dataclass
+class PageText:
+    """Extracted text for one PDF page."""
+
+    page_number: int  # 1-based
+    text: str
+    ocr_used: bool = False
+
+
+def _extract_page_batch(
+    file_path: str,
+    page_numbers: List[int],
+    render_sparse: bool,
+    resolution: int,
+    min_chars: int,
+) -> List[Tuple[int, str, Optional[bytes]]]:
+    """Extract text for a batch of pages (runs in a worker process).
+
+    Returns:
+        (page_number, text, png_bytes) per page. png_bytes is the rendered
+        page when it is sparse and rendering was requested, else None.
+    """
+    import pdfplumber
+
+    results = []
+    with pdfplumber.open(file_path) as pdf:
+        for page_number in page_numbers:
+            page = pdf.pages[page_number - 1]
+            text = page.extract_text() or ""
+            image = None
+            if render_sparse and len(text.strip()) < min_chars:
+                try:
+                    buffer = io.BytesIO()
+                    page.to_image(resolution=resolution).original.save(buffer, format="PNG")
+                    image = buffer.getvalue()
+                except Exception as e:
+                    logger.warning(f"Failed to render page {page_number} for OCR: {e}")
+            results.append((page_number, text, image))
+            # Release the page's parsed objects; large PDFs otherwise grow unbounded
+            page.close()
+    return results
+
+
+class PDFPageExtractor:
+    """Extracts PDF pages in parallel and yields them in page order."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        ocr_concurrency: int = 4,
+        pages_per_task: int = 8,
+        render_resolution: int = 300,
+        min_chars_per_page: int = MIN_CHARS_PER_PAGE,
+        parallel_threshold: int = 32,
+    ):
+        """Initialize the extractor.
+
+        Args:
+            max_workers: Parser processes (default: CPU count, at most 8)
+            ocr_concurrency: Maximum concurrent OCR calls
+            pages_per_task: Pages parsed per worker task
+            render_resolution: DPI used to render sparse pages for OCR
+            min_chars_per_page: Pages with less text than this are OCRed
+            parallel_threshold: Documents with more pages use the process pool
+        """
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.ocr_concurrency = max(1, ocr_concurrency)
+        self.pages_per_task = max(1, pages_per_task)
+        self.render_resolution = render_resolution
+        self.min_chars_per_page = min_chars_per_page
+        self.parallel_threshold = parallel_threshold
+
+    def iter_pages(
+        self,
+        file_path: str,
+        page_count: int,
+        ocr_func: Optional[OCRFunction] = None,
+        progress_callback: Optional[PageProgressCallback] = None,
+    ) -> Iterator[PageText]:
+        """Yield every page's text in page order.
+
+        Args:
+            file_path: Path to the PDF
+            page_count: Number of pages in the PDF
+            ocr_func: OCR for sparse pages; None disables OCR
+            progress_callback: Called with (pages_done, page_count)
+
+        Yields:
+            PageText for pages 1..page_count
+        """
+        if page_count <= 0:
+            return
+
+        batches = [
+            list(range(start, min(start + self.pages_per_task, page_count + 1)))
+            for start in range(1, page_count + 1, self.pages_per_task)
+        ]
+
+        use_processes = page_count > self.parallel_threshold and self.max_workers > 1
+        emitted = 0
+        try:
+            for page in self._run(file_path, batches, page_count, use_processes, ocr_func, progress_callback):
+                emitted = page.page_number
+                yield page
+        except BrokenProcessPool as e:
+            # Frozen builds or restricted environments can refuse to spawn;
+            # finish the document in-process rather than failing the upload
+            logger.warning(f"PDF worker pool unavailable, extracting serially: {e}")
+            rest = [[n for n in batch if n > emitted] for batch in batches]
+            yield from self._run(
+                file_path, [batch for batch in rest if batch], page_count, False, ocr_func, progress_callback
+            )
+
+    def _run(
+        self,
+        file_path: str,
+        batches: List[List[int]],
+        page_count: int,
+        use_processes: bool,
+        ocr_func: Optional[OCRFunction],
+        progress_callback: Optional[PageProgressCallback],
+    ) -> Iterator[PageText]:
+        parse_pool: Executor
+        if use_processes:
+            parse_pool = ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(batches)),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            parse_pool = ThreadPoolExecutor(max_workers=1)
+
+        # Bound parsed-but-unconsumed batches so rendered pages don't pile up
+        window = (self.max_workers if use_processes else 1) * 2
+        ready: Dict[int, Union[PageText, "Future[PageText]"]] = {}
+        next_page = batches[0][0] if batches else page_count + 1
+
+        with parse_pool, ThreadPoolExecutor(max_workers=self.ocr_concurrency) as ocr_pool:
+            remaining = deque(batches)
+            in_flight: deque = deque()
+
+            def fill():
+                while remaining and len(in_flight) < window:
+                    in_flight.append(parse_pool.submit(
+                        _extract_page_batch, file_path, remaining.popleft(),
+                        ocr_func is not None, self.render_resolution, self.min_chars_per_page,
+                    ))
+
+            fill()
+            while in_flight:
+                batch = in_flight.popleft().result()
+                fill()
+
+                for page_number, text, image in batch:
+                    if image is not None:
+                        ready[page_number] = ocr_pool.submit(self._ocr_page, ocr_func, page_number, text, image)
+                    else:
+                        ready[page_number] = PageText(page_number, text)
+
+                # Emit what is finished without waiting on OCR, so OCR for
+                # later batches can be queued meanwhile
+                while next_page in ready:
+                    item = ready[next_page]
+                    if isinstance(item, Future):
+                        if not item.done():
+                            break
+                        item = item.result()
+                    del ready[next_page]
+                    yield item
+                    if progress_callback:
+                        progress_callback(next_page, page_count)
+                    next_page += 1
+
+            while next_page <= page_count:
+                item = ready.pop(next_page)
+                if isinstance(item, Future):
+                    item = item.result()
+                yield item
+                if progress_callback:
+                    progress_callback(next_page, page_count)
+                next_page += 1
+
+    def _ocr_page(self, ocr_func: OCRFunction, page_number: int, text: str, image: bytes) -> PageText:
+        """OCR one rendered page, keeping the parsed text if OCR found less."""
+        try:
+            from PIL import Image
+            with Image.open(io.BytesIO(image)) as pil_image:
+                ocr_text = ocr_func(pil_image)
+        except Exception as e:
+            logger.warning(f"OCR failed for page {page_number}: {e}")
+            ocr_text = ""
+
+        if ocr_text and len(ocr_text) > len(text):
+            return PageText(page_number, ocr_text, ocr_used=True)
+        return PageText(page_number, text)
+
+
+__all__ = ["PDFPageExtractor", "PageText", "PageProgressCallback", "MIN_CHARS_PER_PAGE"]
@@ -0,0 +1,315 @@
+"""
+Query-result cache for hybrid RAG search.
+
+Clinicians often re-ask the same question, or a close paraphrase, within a
+session. Each hybrid search pays for an embedding, vector and BM25 search,
+graph search, MMR and feedback boosts, so finished responses are cached in
+two tiers:
+
+- Exact: keyed on the normalized query text plus every request option,
+  parsed search filter and search-quality setting that affects results.
+- Semantic (optional): a query whose embedding is within a cosine
+  threshold of a cached query with the same options reuses its results.
+  Follow-up queries skip this tier - they are rewritten with conversation
+  context, so a close embedding does not mean the same question.
+
+Entries expire after a TTL and the whole cache is invalidated whenever
+documents are added or removed.
+
+Usage:
+    from rag.query_cache import get_query_cache, invalidate_query_cache
+
+    cache = get_query_cache()
+    response = cache.get(key) if cache else None
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from utils.structured_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Defaults (overridable through the "rag_query_cache" settings block)
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 600
+DEFAULT_SEMANTIC_THRESHOLD = 0.97
+
+
+def normalize_query(query: str) -> str:
+    """Lower-case, collapse whitespace and drop trailing punctuation."""
+    return " ".join(query.lower().split()).rstrip("?.! ")
+
+
+@dataclass
+class _CacheEntry:
+    """A cached response and the query embedding that produced it."""
+    response: Any
+    options_key: str
+    embedding: Optional[np.ndarray]
+    created_at: float
+
+
+@dataclass
+class QueryCacheMetrics:
+    """Lookup counters for the query cache."""
+    exact_hits: int = 0
+    semantic_hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    def to_dict(self) -> Dict[str, float]:
+        lookups = self.exact_hits + self.semantic_hits + self.misses
+        return {
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": (self.exact_hits + self.semantic_hits) / lookups if lookups else 0.0,
+        }
+
+
+class QueryResultCache:
+    """Thread-safe LRU+TTL cache of RAG query responses."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        semantic_threshold: Optional[float] = DEFAULT_SEMANTIC_THRESHOLD,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached responses
+            ttl_seconds: Entry lifetime in seconds
+            semantic_threshold: Minimum cosine similarity for a semantic hit
+                (None disables the semantic tier)
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.semantic_threshold = semantic_threshold
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._generation = 0
+        self._metrics = QueryCacheMetrics()
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Incremented by every invalidation; pass it back to put()."""
+        return self._generation
+
+    @staticmethod
+    def options_key(request, parsed_query=None, config=None, extra: Optional[dict] = None) -> str:
+        """Fingerprint everything except the query text that affects results.
+
+        Args:
+            request: RAGQueryRequest
+            parsed_query: Optional ParsedQuery with search filters
+            config: SearchQualityConfig in effect
+            extra: Other inputs that change results (e.g. feedback state)
+
+        Returns:
+            Hex digest
+        """
+        options = {
+            "request": request.model_dump(exclude={"query", "is_followup", "enable_cache"}),
+            "filters": None,
+            "config": config.to_dict() if config is not None else None,
+            "extra": extra,
+        }
+        if parsed_query is not None and parsed_query.has_filters:
+            filters = parsed_query.to_dict()
+            filters.pop("text", None)
+            filters.pop("original_query", None)
+            options["filters"] = filters
+        encoded = json.dumps(options, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def query_key(query: str, options_key: str) -> str:
+        """Exact-tier key for a query under the given options."""
+        digest = hashlib.sha256(normalize_query(query).encode("utf-8")).hexdigest()
+        return f"{options_key}:{digest}"
+
+    def _expired(self, entry: _CacheEntry, now: float) -> bool:
+        return now - entry.created_at > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for an exact key, if fresh."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._expired(entry, now):
+                if entry is not None:
+                    del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            self._metrics.exact_hits += 1
+            return entry.response
+
+    def get_similar(self, options_key: str, embedding) -> Optional[Any]:
+        """Return the response for the closest cached query above the threshold.
+
+        Only entries with the same options are considered.
+
+        Args:
+            options_key: Result of options_key() for the request
+            embedding: Query embedding
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        if self.semantic_threshold is None:
+            return None
+        query = self._normalize(embedding)
+        if query is None:
+            return None
+
+        now = time.time()
+        with self._lock:
+            candidates = [
+                (key, entry) for key, entry in self._entries.items()
+                if entry.options_key == options_key
+                and entry.embedding is not None
+                and entry.embedding.shape == query.shape
+                and not self._expired(entry, now)
+            ]
+            if candidates:
+                similarities = np.stack([entry.embedding for _, entry in candidates]) @ query
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.semantic_threshold:
+                    key, entry = candidates[best]
+                    self._entries.move_to_end(key)
+                    self._metrics.semantic_hits += 1
+                    return entry.response
+            return None
+
+    def record_miss(self) -> None:
+        """Count a lookup that fell through both tiers."""
+        with self._lock:
+            self._metrics.misses += 1
+
+    def put(
+        self,
+        key: str,
+        options_key: str,
+        response: Any,
+        embedding=None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Cache a response.
+
+        Args:
+            key: Exact-tier key from query_key()
+            options_key: Options fingerprint, for semantic lookups
+            response: Response to cache (callers should store a copy)
+            embedding: Query embedding, or None to skip the semantic tier
+            generation: generation read before the search started; the
+                response is dropped if the cache was invalidated since
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = _CacheEntry(response, options_key, self._normalize(embedding), time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every entry (documents were added or removed)."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._metrics.invalidations += 1
+
+    def get_metrics(self) -> Dict[str, float]:
+        """Lookup counters and current size."""
+        with self._lock:
+            metrics = self._metrics.to_dict()
+            metrics["entries"] = len(self._entries)
+        return metrics
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @staticmethod
+    def _normalize(embedding) -> Optional[np.ndarray]:
+        if embedding is None:
+            return None
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else None
+
+
+# Global instance with thread-safe initialization
+_query_cache: Optional[QueryResultCache] = None
+_query_cache_initialized = False
+_query_cache_lock = threading.Lock()
+
+
+def _create_from_settings() -> Optional[QueryResultCache]:
+    """Build the shared cache from the "rag_query_cache" settings block."""
+    try:
+        from settings.settings_manager import settings_manager
+        cache_settings = settings_manager.get("rag_query_cache", {}) or {}
+    except Exception:
+        cache_settings = {}
+
+    if not cache_settings.get("enabled", True):
+        return None
+
+    semantic_threshold = cache_settings.get("semantic_threshold", DEFAULT_SEMANTIC_THRESHOLD)
+    if not cache_settings.get("semantic_enabled", True):
+        semantic_threshold = None
+    return QueryResultCache(
+        max_entries=cache_settings.get("max_entries", DEFAULT_MAX_ENTRIES),
+        ttl_seconds=cache_settings.get("ttl_seconds", DEFAULT_TTL_SECONDS),
+        semantic_threshold=semantic_threshold,
+    )
+
+
+def get_query_cache() -> Optional[QueryResultCache]:
+    """Get the process-wide QueryResultCache, or None if disabled.
+
+    Thread-safe implementation using double-checked locking pattern.
+    """
+    global _query_cache, _query_cache_initialized
+    if not _query_cache_initialized:
+        with _query_cache_lock:
+            if not _query_cache_initialized:
+                _query_cache = _create_from_settings()
+                _query_cache_initialized = True
+    return _query_cache
+
+
+def invalidate_query_cache() -> None:
+    """Invalidate the shared cache if it has been created."""
+    if _query_cache is not None:
+        _query_cache.invalidate()
+
+
+def reset_query_cache() -> None:
+    """Forget the shared cache (settings changes, tests)."""
+    global _query_cache, _query_cache_initialized
+    with _query_cache_lock:
+        _query_cache = None
+        _query_cache_initialized = False
+
+
+__all__ = [
+    "QueryCacheMetrics",
+    "QueryResultCache",
+    "get_query_cache",
+    "invalidate_query_cache",
+    "normalize_query",
+    "reset_query_cache",
+]
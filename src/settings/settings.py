@@ -442,7 +442,9 @@ _DEFAULTS_TRANSLATION_TTS = {
         "rate": 150,
         "volume": 1.0,
         "language": "en",
-        "elevenlabs_model": "eleven_turbo_v2_5"
+        "elevenlabs_model": "eleven_turbo_v2_5",
+        "stream_concurrency": 3,
+        "audio_cache_size": 128
     },
     "translation_canned_responses": {
         "categories": ["greeting", "symptom", "history", "instruction", "clarify", "general"],
@@ -568,6 +570,49 @@ _DEFAULTS_RAG_RESILIENCE = {
     }
 }
 
+# Vector store backend defaults
+_DEFAULTS_VECTOR_INDEX = {
+    "vector_index": {
+        "backend": "neon",  # "neon" (remote pgvector) or "local" (embedded index in the data folder)
+        "ivf_min_vectors": 20000,  # Smaller local collections are searched exactly
+        "nprobe": 16,  # IVF lists scanned per local query
+        "sync_from_remote": True,  # Mirror Neon documents into the local index at startup
+    }
+}
+
+# Local ICD-10-CM / RxNorm terminology index (built from release files on disk)
+_DEFAULTS_TERMINOLOGY = {
+    "terminology": {
+        "enabled": True,
+        "icd10cm_path": "",  # CMS icd10cm_order_YYYY.txt or icd10cm_codes_YYYY.txt
+        "rxnorm_path": "",  # RxNorm full release RXNCONSO.RRF
+    },
+    "drug_interactions": {
+        "enabled": True,  # Resolve known pairs locally before asking the LLM
+        "dataset_path": "",  # CSV/TSV interaction dataset, re-imported when the file changes
+    },
+}
+
+
+# Performance / caching defaults
+_DEFAULTS_PERFORMANCE = {
+    "agent_response_cache": {
+        "max_entries": 50,  # Per agent
+        "ttl_seconds": 300,
+        "persist_to_disk": False,  # Encrypted SQLite store in the data folder
+    },
+    "extraction_cache": {
+        "enabled": True,  # Reuse extracted document text keyed by file hash
+        "max_entries": 200,
+    },
+    "rag_query_cache": {
+        "enabled": True,  # Reuse hybrid search results for repeated queries
+        "max_entries": 256,
+        "ttl_seconds": 600,
+        "semantic_enabled": True,  # Also reuse results for close paraphrases
+        "semantic_threshold": 0.97,  # Minimum query-embedding cosine similarity
+    },
+}
 
 # =============================================================================
 # COMBINED DEFAULT SETTINGS
@@ -589,6 +634,9 @@ _DEFAULT_SETTINGS: Dict[str, Any] = {
     **_DEFAULTS_RAG_SEARCH_QUALITY,
     **_DEFAULTS_LOGGING,
     **_DEFAULTS_RAG_RESILIENCE,
+    **_DEFAULTS_VECTOR_INDEX,
+    **_DEFAULTS_TERMINOLOGY,
+    **_DEFAULTS_PERFORMANCE,
 }
 
 
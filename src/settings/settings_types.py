@@ -69,6 +69,8 @@ class TTSSettings(TypedDict, total=False):
     voice_id: str
     model: str
     rate: float
+    stream_concurrency: int
+    audio_cache_size: int
 
 
 class ElevenLabsSettings(TypedDict, total=False):
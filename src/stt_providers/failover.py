@@ -11,6 +11,7 @@ from pydub import AudioSegment
 from stt_providers.base import BaseSTTProvider, TranscriptionResult
 from utils.constants import STT_DEEPGRAM, STT_GROQ, STT_ELEVENLABS, STT_MODULATE
 from utils.structured_logging import get_logger
+from utils.tracing import get_tracer
 
 
 logger = get_logger(__name__)
@@ -108,41 +109,46 @@ class STTFailoverManager:
             providers_tried.append(provider_name)
             logger.info(f"Attempting transcription with {provider_name}")
 
-            try:
-                # Try transcription
-                if hasattr(provider, 'transcribe_with_result'):
-                    result = provider.transcribe_with_result(segment)
-                    if result.success and result.text:
-                        self._record_success(provider_name)
-                        result.metadata['provider'] = provider_name
-                        result.metadata['failover_attempts'] = len(providers_tried)
-                        return result
-                    else:
-                        error_msg = result.error or "Empty transcription"
-                        errors.append(f"{provider_name}: {error_msg}")
-                        self._record_failure(provider_name)
-                else:
-                    # Fallback to basic transcribe method
-                    text = provider.transcribe(segment)
-                    if text:
-                        self._record_success(provider_name)
-                        return TranscriptionResult.success_result(
-                            text=text,
-                            duration_seconds=len(segment) / 1000.0,
-                            metadata={
-                                'provider': provider_name,
-                                'failover_attempts': len(providers_tried)
-                            }
-                        )
+            failures = len(errors)
+            with get_tracer().span("stt", provider=provider_name) as span:
+                try:
+                    # Try transcription
+                    if hasattr(provider, 'transcribe_with_result'):
+                        result = provider.transcribe_with_result(segment)
+                        if result.success and result.text:
+                            self._record_success(provider_name)
+                            result.metadata['provider'] = provider_name
+                            result.metadata['failover_attempts'] = len(providers_tried)
+                            return result
+                        else:
+                            error_msg = result.error or "Empty transcription"
+                            errors.append(f"{provider_name}: {error_msg}")
+                            self._record_failure(provider_name)
                     else:
-                        errors.append(f"{provider_name}: Empty transcription")
-                        self._record_failure(provider_name)
-
-            except Exception as e:
-                error_msg = f"{provider_name}: {str(e)}"
-                logger.warning(f"Transcription failed with {provider_name}: {e}")
-                errors.append(error_msg)
-                self._record_failure(provider_name)
+                        # Fallback to basic transcribe method
+                        text = provider.transcribe(segment)
+                        if text:
+                            self._record_success(provider_name)
+                            return TranscriptionResult.success_result(
+                                text=text,
+                                duration_seconds=len(segment) / 1000.0,
+                                metadata={
+                                    'provider': provider_name,
+                                    'failover_attempts': len(providers_tried)
+                                }
+                            )
+                        else:
+                            errors.append(f"{provider_name}: Empty transcription")
+                            self._record_failure(provider_name)
+
+                except Exception as e:
+                    error_msg = f"{provider_name}: {str(e)}"
+                    logger.warning(f"Transcription failed with {provider_name}: {e}")
+                    errors.append(error_msg)
+                    self._record_failure(provider_name)
+
+                if len(errors) > failures:
+                    span.set_error(errors[-1])
 
         # All providers failed
         all_errors = "; ".join(errors) if errors else "No configured providers available"
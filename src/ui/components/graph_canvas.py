@@ -3,6 +3,9 @@ Graph Canvas Widget for Knowledge Graph visualization.
 
 Custom Tkinter Canvas widget that renders nodes and edges from
 a knowledge graph using NetworkX for layout calculation.
+
+Only nodes inside the viewport are drawn, found through a spatial grid;
+when too many are visible, dense regions collapse into cluster glyphs.
 """
 
 import math
@@ -16,6 +19,12 @@ except ImportError:
     HAS_NETWORKX = False
 
 from rag.graph_data_provider import EntityType, GraphData, GraphEdge, GraphNode
+from ui.components.graph_spatial_index import (
+    MAX_DETAIL_NODES,
+    NodeCluster,
+    SpatialGrid,
+    place_nodes,
+)
 from utils.structured_logging import get_logger
 
 logger = get_logger(__name__)
@@ -49,11 +58,20 @@ class GraphCanvas(tk.Canvas):
     EDGE_WIDTH = 2
     EDGE_WIDTH_HIGHLIGHTED = 3
 
+    # Level of detail
+    MAX_DETAIL_NODES = MAX_DETAIL_NODES
+    MAX_EDGES = 3000
+    CLUSTER_RADIUS_MIN = 14
+    CLUSTER_RADIUS_MAX = 40
+    VIEW_CHANGE_DELAY_MS = 250
+
     def __init__(
         self,
         parent: tk.Widget,
         on_node_select: Optional[Callable[[Optional[GraphNode]], None]] = None,
         on_node_hover: Optional[Callable[[Optional[GraphNode]], None]] = None,
+        on_node_expand: Optional[Callable[[GraphNode], None]] = None,
+        on_view_change: Optional[Callable[[float], None]] = None,
         **kwargs
     ):
         """Initialize the graph canvas.
@@ -62,6 +80,8 @@ class GraphCanvas(tk.Canvas):
             parent: Parent widget
             on_node_select: Callback when a node is selected
             on_node_hover: Callback when hovering over a node
+            on_node_expand: Callback when a node is double-clicked
+            on_view_change: Callback with the zoom level once zooming settles
             **kwargs: Additional canvas arguments
         """
         # Set default background - dark for contrast with white labels
@@ -72,6 +92,8 @@ class GraphCanvas(tk.Canvas):
 
         self.on_node_select = on_node_select
         self.on_node_hover = on_node_hover
+        self.on_node_expand = on_node_expand
+        self.on_view_change = on_view_change
 
         # Graph data
         self._graph_data: Optional[GraphData] = None
@@ -79,6 +101,13 @@ class GraphCanvas(tk.Canvas):
         self._label_items: dict[str, int] = {}  # node_id -> label item id
         self._edge_items: dict[str, int] = {}  # edge_id -> canvas item id
 
+        # Spatial index and adjacency for culling and hit-testing
+        self._grid = SpatialGrid()
+        self._adjacency: dict[str, list[GraphEdge]] = {}
+        self._clusters: list[NodeCluster] = []  # clusters drawn by the last render
+        self._layout_size: tuple[int, int] = (0, 0)
+        self._view_change_after_id = None
+
         # View state
         self._zoom_level = 1.0
         self._pan_x = 0.0
@@ -101,6 +130,7 @@ class GraphCanvas(tk.Canvas):
 
         # Bind events
         self.bind("<Button-1>", self._on_click)
+        self.bind("<Double-Button-1>", self._on_double_click)
         self.bind("<B1-Motion>", self._on_drag)
         self.bind("<ButtonRelease-1>", self._on_release)
         self.bind("<Motion>", self._on_motion)
@@ -115,7 +145,8 @@ class GraphCanvas(tk.Canvas):
         Args:
             data: GraphData containing nodes and edges
         """
-        self._graph_data = data
+        # Own the lists so pages merged here do not leak into the caller's data
+        self._graph_data = GraphData(nodes=list(data.nodes), edges=list(data.edges))
         self._selected_node_id = None
         self._highlighted_nodes.clear()
 
@@ -124,9 +155,43 @@ class GraphCanvas(tk.Canvas):
         self._pan_x = 0.0
         self._pan_y = 0.0
 
+        self._adjacency.clear()
+        self._index_edges(self._graph_data.edges)
         self._calculate_layout()
+        self._grid.rebuild(self._graph_data.nodes)
+        self._render()
+
+    def add_graph_data(self, data: GraphData) -> None:
+        """Add a page of nodes and edges without resetting the view.
+
+        New nodes are placed next to the loaded nodes they connect to;
+        existing nodes keep their positions.
+
+        Args:
+            data: GraphData with the nodes and edges to add
+        """
+        if self._graph_data is None:
+            self.set_graph_data(data)
+            return
+
+        placed = {node.id: node for node in self._graph_data.nodes}
+        added = self._graph_data.merge(data)
+        if not added.nodes and not added.edges:
+            return
+
+        spacing = self.NODE_RADIUS * 3
+        place_nodes(added.nodes, self._graph_data.edges, placed, spacing=spacing)
+        for node in added.nodes:
+            self._grid.insert(node)
+        self._index_edges(added.edges)
         self._render()
 
+    def _index_edges(self, edges: list[GraphEdge]) -> None:
+        """Add edges to the per-node adjacency lists."""
+        for edge in edges:
+            self._adjacency.setdefault(edge.source_id, []).append(edge)
+            self._adjacency.setdefault(edge.target_id, []).append(edge)
+
     def _calculate_layout(self) -> None:
         """Calculate node positions using NetworkX spring layout."""
         if not self._graph_data or not self._graph_data.nodes:
@@ -163,11 +228,14 @@ class GraphCanvas(tk.Canvas):
         # Get canvas dimensions
         width = self.winfo_width() or 800
         height = self.winfo_height() or 600
+        self._layout_size = (width, height)
 
-        # Scale positions to canvas with padding
+        # Scale positions to canvas with padding, growing with the node
+        # count so large graphs spread out and are explored by zooming
         padding = 100
-        scale_x = (width - 2 * padding) / 2
-        scale_y = (height - 2 * padding) / 2
+        spread = max(1.0, math.sqrt(len(G.nodes()) / self.MAX_DETAIL_NODES))
+        scale_x = (width - 2 * padding) / 2 * spread
+        scale_y = (height - 2 * padding) / 2 * spread
         center_x = width / 2
         center_y = height / 2
 
@@ -185,10 +253,13 @@ class GraphCanvas(tk.Canvas):
 
         width = self.winfo_width() or 800
         height = self.winfo_height() or 600
+        self._layout_size = (width, height)
 
         center_x = width / 2
         center_y = height / 2
         radius = min(width, height) / 3
+        # Keep neighbouring nodes at least a node diameter apart
+        radius = max(radius, len(self._graph_data.nodes) * self.NODE_RADIUS / math.pi)
 
         num_nodes = len(self._graph_data.nodes)
         for i, node in enumerate(self._graph_data.nodes):
@@ -197,11 +268,12 @@ class GraphCanvas(tk.Canvas):
             node.y = center_y + radius * math.sin(angle)
 
     def _render(self) -> None:
-        """Render all nodes and edges."""
+        """Render the nodes and edges inside the viewport."""
         self.delete("all")
         self._node_items.clear()
         self._label_items.clear()
         self._edge_items.clear()
+        self._clusters = []
 
         if not self._graph_data:
             self._render_empty_message()
@@ -219,11 +291,37 @@ class GraphCanvas(tk.Canvas):
             )
             return
 
+        keep = {self._selected_node_id} if self._selected_node_id else set()
+        nodes, clusters = self._grid.level_of_detail(
+            self._viewport_bounds(),
+            self._zoom_level,
+            max_nodes=self.MAX_DETAIL_NODES,
+            keep=keep,
+        )
+        self._clusters = clusters
+
         # Draw edges first (so nodes appear on top)
-        self._render_edges()
+        if clusters:
+            self._render_cluster_edges(nodes, clusters)
+        else:
+            self._render_edges(nodes)
 
         # Draw nodes
-        self._render_nodes()
+        self._render_nodes(nodes)
+        for cluster in clusters:
+            self._render_cluster(cluster)
+
+    def _viewport_bounds(self) -> tuple[float, float, float, float]:
+        """Visible world rectangle, padded by a node radius."""
+        margin = self.NODE_RADIUS_SELECTED
+        width = self.winfo_width() or 800
+        height = self.winfo_height() or 600
+        return (
+            self._inverse_transform_x(0) - margin,
+            self._inverse_transform_y(0) - margin,
+            self._inverse_transform_x(width) + margin,
+            self._inverse_transform_y(height) + margin,
+        )
 
     def _render_empty_message(self, message: str = "No graph data") -> None:
         """Render an empty state message."""
@@ -240,49 +338,114 @@ class GraphCanvas(tk.Canvas):
             justify=tk.CENTER,
         )
 
-    def _render_edges(self) -> None:
-        """Render all edges."""
+    def _render_edges(self, nodes: list[GraphNode]) -> None:
+        """Render the edges touching the given nodes."""
         if not self._graph_data:
             return
 
-        for edge in self._graph_data.edges:
-            source_node = self._graph_data.get_node(edge.source_id)
-            target_node = self._graph_data.get_node(edge.target_id)
-
-            if not source_node or not target_node:
-                continue
-
-            # Transform coordinates
-            x1 = self._transform_x(source_node.x)
-            y1 = self._transform_y(source_node.y)
-            x2 = self._transform_x(target_node.x)
-            y2 = self._transform_y(target_node.y)
-
-            # Check if edge should be highlighted
-            is_highlighted = (
-                edge.source_id == self._selected_node_id or
-                edge.target_id == self._selected_node_id
-            )
+        drawn = set()
+        for node in nodes:
+            for edge in self._adjacency.get(node.id, ()):
+                if edge.id in drawn:
+                    continue
+                drawn.add(edge.id)
+                self._render_edge(edge)
+                if len(drawn) >= self.MAX_EDGES:
+                    return
+
+    def _render_edge(self, edge: GraphEdge) -> None:
+        """Render a single edge."""
+        source_node = self._graph_data.get_node(edge.source_id)
+        target_node = self._graph_data.get_node(edge.target_id)
+
+        if not source_node or not target_node:
+            return
 
-            color = self.EDGE_COLOR_HIGHLIGHTED if is_highlighted else self.EDGE_COLOR
-            width = self.EDGE_WIDTH_HIGHLIGHTED if is_highlighted else self.EDGE_WIDTH
+        # Transform coordinates
+        x1 = self._transform_x(source_node.x)
+        y1 = self._transform_y(source_node.y)
+        x2 = self._transform_x(target_node.x)
+        y2 = self._transform_y(target_node.y)
 
-            item_id = self.create_line(
-                x1, y1, x2, y2,
-                fill=color,
-                width=width,
-                tags=("edge", f"edge_{edge.id}"),
-            )
-            self._edge_items[edge.id] = item_id
+        # Check if edge should be highlighted
+        is_highlighted = (
+            edge.source_id == self._selected_node_id or
+            edge.target_id == self._selected_node_id
+        )
 
-    def _render_nodes(self) -> None:
-        """Render all nodes."""
-        if not self._graph_data:
-            return
+        color = self.EDGE_COLOR_HIGHLIGHTED if is_highlighted else self.EDGE_COLOR
+        width = self.EDGE_WIDTH_HIGHLIGHTED if is_highlighted else self.EDGE_WIDTH
 
-        for node in self._graph_data.nodes:
+        item_id = self.create_line(
+            x1, y1, x2, y2,
+            fill=color,
+            width=width,
+            tags=("edge", f"edge_{edge.id}"),
+        )
+        self._edge_items[edge.id] = item_id
+
+    def _render_cluster_edges(self, nodes: list[GraphNode], clusters: list[NodeCluster]) -> None:
+        """Render one line per pair of connected clusters or lone nodes."""
+        anchors: dict[str, tuple[float, float]] = {node.id: (node.x, node.y) for node in nodes}
+        for cluster in clusters:
+            for node in cluster.nodes:
+                anchors[node.id] = (cluster.x, cluster.y)
+
+        links: dict[tuple, int] = {}
+        for node_id in anchors:
+            for edge in self._adjacency.get(node_id, ()):
+                if edge.source_id != node_id:
+                    continue  # counted from the source end
+                source = anchors.get(edge.source_id)
+                target = anchors.get(edge.target_id)
+                if source is None or target is None or source == target:
+                    continue
+                key = (source, target) if source < target else (target, source)
+                links[key] = links.get(key, 0) + 1
+
+        for ((x1, y1), (x2, y2)), count in list(links.items())[:self.MAX_EDGES]:
+            self.create_line(
+                self._transform_x(x1), self._transform_y(y1),
+                self._transform_x(x2), self._transform_y(y2),
+                fill=self.EDGE_COLOR,
+                width=min(self.EDGE_WIDTH + math.log2(count), 8),
+                tags=("edge",),
+            )
+
+    def _render_nodes(self, nodes: list[GraphNode]) -> None:
+        """Render the given nodes."""
+        for node in nodes:
             self._render_node(node)
 
+    def _render_cluster(self, cluster: NodeCluster) -> None:
+        """Render an aggregate glyph for a cluster of nodes."""
+        x = self._transform_x(cluster.x)
+        y = self._transform_y(cluster.y)
+        radius = min(
+            self.CLUSTER_RADIUS_MAX,
+            self.CLUSTER_RADIUS_MIN + 4 * math.log2(cluster.count),
+        )
+
+        color = self.ENTITY_COLORS.get(cluster.dominant_type, self.ENTITY_COLORS[EntityType.UNKNOWN])
+        has_match = any(node.id in self._highlighted_nodes for node in cluster.nodes)
+
+        self.create_oval(
+            x - radius, y - radius,
+            x + radius, y + radius,
+            fill=self._adjust_brightness(color, 0.7),
+            outline="#FFFFFF" if has_match else color,
+            width=3 if has_match else 2,
+            tags=("cluster",),
+        )
+        self.create_text(
+            x, y,
+            text=str(cluster.count),
+            fill="#FFFFFF",
+            font=("TkDefaultFont", 10, "bold"),
+            anchor="center",
+            tags=("cluster",),
+        )
+
     def _render_node(self, node: GraphNode) -> None:
         """Render a single node."""
         x = self._transform_x(node.x)
@@ -356,22 +519,34 @@ class GraphCanvas(tk.Canvas):
         if not self._graph_data:
             return None
 
-        # Check from top to bottom (reverse order)
-        for node in reversed(self._graph_data.nodes):
-            x = self._transform_x(node.x)
-            y = self._transform_y(node.y)
-            radius = self.NODE_RADIUS * self._zoom_level
-
-            if (canvas_x - x) ** 2 + (canvas_y - y) ** 2 <= radius ** 2:
-                return node
-
+        clustered = {node.id for cluster in self._clusters for node in cluster.nodes}
+        node = self._grid.nearest(
+            self._inverse_transform_x(canvas_x),
+            self._inverse_transform_y(canvas_y),
+            self.NODE_RADIUS,  # world units, i.e. NODE_RADIUS * zoom on screen
+        )
+        if node is None or node.id in clustered:
+            return None
+        return node
+
+    def _get_cluster_at(self, canvas_x: float, canvas_y: float) -> Optional[NodeCluster]:
+        """Get the cluster glyph at canvas coordinates."""
+        for cluster in self._clusters:
+            x = self._transform_x(cluster.x)
+            y = self._transform_y(cluster.y)
+            if (canvas_x - x) ** 2 + (canvas_y - y) ** 2 <= self.CLUSTER_RADIUS_MAX ** 2:
+                return cluster
         return None
 
     def _on_click(self, event: tk.Event) -> None:
         """Handle mouse click."""
         node = self._get_node_at(event.x, event.y)
+        cluster = None if node else self._get_cluster_at(event.x, event.y)
 
-        if node:
+        if cluster:
+            # Clicked on a cluster - zoom into it
+            self._zoom_to(cluster.x, cluster.y, self._zoom_level * 2)
+        elif node:
             # Clicked on a node - start potential drag
             self._drag_node_id = node.id
             self._drag_start_x = event.x
@@ -408,6 +583,7 @@ class GraphCanvas(tk.Canvas):
                 dy = (event.y - self._drag_start_y) / self._zoom_level
                 node.x += dx
                 node.y += dy
+                self._grid.move(node)
 
                 self._drag_start_x = event.x
                 self._drag_start_y = event.y
@@ -427,6 +603,12 @@ class GraphCanvas(tk.Canvas):
 
             self._render()
 
+    def _on_double_click(self, event: tk.Event) -> None:
+        """Handle double click to expand a node's neighbourhood."""
+        node = self._get_node_at(event.x, event.y)
+        if node and self.on_node_expand:
+            self.on_node_expand(node)
+
     def _on_release(self, event: tk.Event) -> None:
         """Handle mouse release."""
         self._drag_node_id = None
@@ -474,23 +656,50 @@ class GraphCanvas(tk.Canvas):
             self._pan_y -= (new_mouse_world_y - mouse_world_y)
 
             self._render()
+            self._schedule_view_change()
+
+    def _zoom_to(self, world_x: float, world_y: float, zoom: float) -> None:
+        """Center the view on a world position at the given zoom."""
+        self._zoom_level = max(0.1, min(5.0, zoom))
+        self._pan_x = world_x - self.winfo_width() / 2
+        self._pan_y = world_y - self.winfo_height() / 2
+        self._render()
+        self._schedule_view_change()
+
+    def _schedule_view_change(self) -> None:
+        """Notify on_view_change once zooming has paused."""
+        if not self.on_view_change:
+            return
+        if self._view_change_after_id is not None:
+            self.after_cancel(self._view_change_after_id)
+        self._view_change_after_id = self.after(self.VIEW_CHANGE_DELAY_MS, self._fire_view_change)
+
+    def _fire_view_change(self) -> None:
+        self._view_change_after_id = None
+        if self.on_view_change:
+            self.on_view_change(self._zoom_level)
 
     def _on_resize(self, event: tk.Event) -> None:
         """Handle canvas resize."""
         if self._graph_data and self._graph_data.nodes:
-            # Recalculate layout on resize
-            self._calculate_layout()
+            # Lay out again only if the first layout ran before the canvas
+            # had its real size; later pages are placed incrementally
+            if self._layout_size[0] <= 1 or self._layout_size[1] <= 1:
+                self._calculate_layout()
+                self._grid.rebuild(self._graph_data.nodes)
             self._render()
 
     def zoom_in(self) -> None:
         """Zoom in."""
         self._zoom_level = min(5.0, self._zoom_level * 1.2)
         self._render()
+        self._schedule_view_change()
 
     def zoom_out(self) -> None:
         """Zoom out."""
         self._zoom_level = max(0.1, self._zoom_level / 1.2)
         self._render()
+        self._schedule_view_change()
 
     def fit_to_view(self) -> None:
         """Fit all nodes in view."""
@@ -0,0 +1,247 @@
+"""
+Graph Spatial Index
+
+Uniform grid over knowledge-graph node positions for the graph canvas.
+Answers viewport and hit-test queries without scanning every node, and
+collapses dense regions into clusters for level-of-detail rendering.
+Tk-free so it can be tested without a display.
+"""
+
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from rag.graph_data_provider import EntityType, GraphEdge, GraphNode
+
+# World units per grid cell; roughly four node diameters at zoom 1.0
+DEFAULT_CELL_SIZE = 200.0
+
+# Above this many visible nodes the view is drawn as clusters
+MAX_DETAIL_NODES = 400
+
+# Screen size of a cluster cell when the view is aggregated
+CLUSTER_PIXELS = 72.0
+
+# Angle between successive nodes placed around the same anchor
+_GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+
+Bounds = tuple[float, float, float, float]  # (min_x, min_y, max_x, max_y)
+
+
+@dataclass
+class NodeCluster:
+    """Nodes that share a cluster cell, drawn as one aggregate glyph."""
+    key: tuple[int, int]
+    nodes: list[GraphNode] = field(default_factory=list)
+    x: float = 0.0  # Centroid in world coordinates
+    y: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def dominant_type(self) -> EntityType:
+        """Most common entity type in the cluster."""
+        return Counter(n.entity_type for n in self.nodes).most_common(1)[0][0]
+
+
+class SpatialGrid:
+    """Bucket grid mapping cells to the nodes positioned inside them.
+
+    Nodes are stored by reference, so after moving a node (dragging,
+    incremental placement) call move() to re-bucket it.
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], dict[str, GraphNode]] = {}
+        self._node_cells: dict[str, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._node_cells)
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def rebuild(self, nodes: Iterable[GraphNode]) -> None:
+        """Replace the index contents with the given nodes."""
+        self._cells.clear()
+        self._node_cells.clear()
+        for node in nodes:
+            self.insert(node)
+
+    def insert(self, node: GraphNode) -> None:
+        """Add a node, or re-bucket it if already indexed."""
+        if node.id in self._node_cells:
+            self.remove(node.id)
+        key = self._cell(node.x, node.y)
+        self._cells.setdefault(key, {})[node.id] = node
+        self._node_cells[node.id] = key
+
+    def remove(self, node_id: str) -> None:
+        """Remove a node from the index (no-op if absent)."""
+        key = self._node_cells.pop(node_id, None)
+        if key is None:
+            return
+        bucket = self._cells[key]
+        del bucket[node_id]
+        if not bucket:
+            del self._cells[key]
+
+    def move(self, node: GraphNode) -> None:
+        """Update the index after a node's position changed."""
+        if self._node_cells.get(node.id) != self._cell(node.x, node.y):
+            self.insert(node)
+
+    def _buckets_in(self, bounds: Bounds) -> Iterable[dict[str, GraphNode]]:
+        """Buckets overlapping bounds, walking whichever set is smaller."""
+        min_x, min_y, max_x, max_y = bounds
+        cx0, cy0 = self._cell(min_x, min_y)
+        cx1, cy1 = self._cell(max_x, max_y)
+        span = (cx1 - cx0 + 1) * (cy1 - cy0 + 1)
+
+        if span > len(self._cells):
+            return [
+                bucket for (cx, cy), bucket in self._cells.items()
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1
+            ]
+        return [
+            self._cells[(cx, cy)]
+            for cx in range(cx0, cx1 + 1)
+            for cy in range(cy0, cy1 + 1)
+            if (cx, cy) in self._cells
+        ]
+
+    def query(self, bounds: Bounds) -> list[GraphNode]:
+        """Nodes whose position lies inside bounds."""
+        min_x, min_y, max_x, max_y = bounds
+        return [
+            node
+            for bucket in self._buckets_in(bounds)
+            for node in bucket.values()
+            if min_x <= node.x <= max_x and min_y <= node.y <= max_y
+        ]
+
+    def nearest(self, x: float, y: float, radius: float) -> Optional[GraphNode]:
+        """Closest node within radius of (x, y), or None."""
+        best, best_dist = None, radius * radius
+        for node in self.query((x - radius, y - radius, x + radius, y + radius)):
+            dist = (node.x - x) ** 2 + (node.y - y) ** 2
+            if dist <= best_dist:
+                best, best_dist = node, dist
+        return best
+
+    def level_of_detail(
+        self,
+        bounds: Bounds,
+        zoom: float,
+        max_nodes: int = MAX_DETAIL_NODES,
+        cluster_pixels: float = CLUSTER_PIXELS,
+        keep: Optional[set[str]] = None,
+    ) -> tuple[list[GraphNode], list[NodeCluster]]:
+        """Split the visible nodes into individually drawn nodes and clusters.
+
+        When at most max_nodes are visible every node is drawn. Otherwise
+        visible nodes are grouped into cells cluster_pixels wide on screen;
+        cells holding a single node are still drawn as that node.
+
+        Args:
+            bounds: Viewport in world coordinates
+            zoom: Current zoom level (screen pixels per world unit)
+            max_nodes: Visible node count above which the view aggregates
+            cluster_pixels: On-screen width of a cluster cell
+            keep: Node IDs that are never folded into a cluster
+
+        Returns:
+            Tuple of (nodes, clusters)
+        """
+        visible = self.query(bounds)
+        if len(visible) <= max_nodes:
+            return visible, []
+
+        keep = keep or set()
+        size = cluster_pixels / max(zoom, 1e-6)
+        groups: dict[tuple[int, int], NodeCluster] = {}
+        nodes = []
+        for node in visible:
+            if node.id in keep:
+                nodes.append(node)
+                continue
+            key = (math.floor(node.x / size), math.floor(node.y / size))
+            cluster = groups.get(key)
+            if cluster is None:
+                cluster = groups[key] = NodeCluster(key)
+            cluster.nodes.append(node)
+
+        clusters = []
+        for cluster in groups.values():
+            if cluster.count == 1:
+                nodes.append(cluster.nodes[0])
+                continue
+            cluster.x = sum(n.x for n in cluster.nodes) / cluster.count
+            cluster.y = sum(n.y for n in cluster.nodes) / cluster.count
+            clusters.append(cluster)
+        return nodes, clusters
+
+
+def place_nodes(
+    new_nodes: list[GraphNode],
+    edges: Iterable[GraphEdge],
+    placed: dict[str, GraphNode],
+    spacing: float = 80.0,
+) -> None:
+    """Position paged-in nodes next to the already placed nodes they touch.
+
+    A node with placed neighbours goes around their centroid; siblings
+    around the same anchor spiral outwards so they do not overlap. Nodes
+    with no placed neighbour go on a spiral outside the current graph.
+    Existing positions are left untouched so the view does not jump.
+
+    Args:
+        new_nodes: Nodes to position (updated in place)
+        edges: Edges that may connect new nodes to placed ones
+        placed: Already positioned nodes by ID
+        spacing: Distance between a node and its anchor, in world units
+    """
+    if not new_nodes:
+        return
+
+    new_ids = {n.id for n in new_nodes}
+    anchors: dict[str, list[GraphNode]] = {}
+    for edge in edges:
+        if edge.source_id in new_ids and edge.target_id in placed:
+            anchors.setdefault(edge.source_id, []).append(placed[edge.target_id])
+        elif edge.target_id in new_ids and edge.source_id in placed:
+            anchors.setdefault(edge.target_id, []).append(placed[edge.source_id])
+
+    if placed:
+        xs = [n.x for n in placed.values()]
+        ys = [n.y for n in placed.values()]
+        center_x, center_y = (min(xs) + max(xs)) / 2, (min(ys) + max(ys)) / 2
+        outer = max(max(xs) - min(xs), max(ys) - min(ys)) / 2 + spacing
+    else:
+        center_x = center_y = 0.0
+        outer = 0.0
+
+    siblings: Counter = Counter()
+    orphans = 0
+    for node in new_nodes:
+        neighbours = anchors.get(node.id)
+        if neighbours:
+            ax = sum(n.x for n in neighbours) / len(neighbours)
+            ay = sum(n.y for n in neighbours) / len(neighbours)
+            key = (round(ax), round(ay))
+            k = siblings[key]
+            siblings[key] += 1
+            radius = spacing * math.sqrt(k + 1)
+        else:
+            ax, ay = center_x, center_y
+            k = orphans
+            orphans += 1
+            radius = outer + spacing * math.sqrt(k + 1)
+        angle = k * _GOLDEN_ANGLE
+        node.x = ax + radius * math.cos(angle)
+        node.y = ay + radius * math.sin(angle)
+        placed[node.id] = node
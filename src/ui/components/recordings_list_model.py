@@ -0,0 +1,164 @@
+"""
+Recordings List Model
+
+Windowed, keyset-paginated view over a recordings query for the
+virtualized recordings list. Tk-free so it can be driven from worker
+threads and tested without a display.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.structured_logging import get_logger
+
+logger = get_logger(__name__)
+
+# (limit, cursor) -> {"results": [...], "next_cursor": cursor or None}
+PageFetcher = Callable[[int, Optional[Any]], Dict[str, Any]]
+
+
+class RecordingsListModel:
+    """Page cache over a keyset-paginated recordings source.
+
+    Rows are addressed by absolute position. Pages are fetched on demand
+    with the cursor returned by the previous page; cursors are kept for
+    every page seen so revisiting any page is a single query. Only the
+    pages around the viewport are held in memory (least recently used
+    pages are evicted).
+
+    Sources that report a total (the plain list) get an exact row count.
+    Sources that do not (search results) report the rows loaded so far
+    plus one page, until the last page has been seen.
+    """
+
+    def __init__(
+        self,
+        fetch_page: PageFetcher,
+        page_size: int = 100,
+        total: Optional[int] = None,
+        max_cached_pages: int = 4,
+    ):
+        """Initialize the model.
+
+        Args:
+            fetch_page: Callable returning one page for (limit, cursor)
+            page_size: Rows per fetched page
+            total: Exact row count if the source can provide it
+            max_cached_pages: Pages kept in memory (see set_viewport)
+        """
+        self._fetch_page = fetch_page
+        self.page_size = page_size
+        self._total = total
+        self._max_cached_pages = max(2, max_cached_pages)
+
+        self._pages: "OrderedDict[int, List[Dict[str, Any]]]" = OrderedDict()
+        self._cursors: Dict[int, Optional[Any]] = {0: None}
+        self._last_page: Optional[int] = None
+        self._lock = threading.Lock()
+        # Serializes fetches so a page is never requested twice concurrently
+        self._load_lock = threading.Lock()
+
+    def set_viewport(self, visible_rows: int) -> None:
+        """Size the page cache to the viewport: the visible pages plus one either side."""
+        with self._lock:
+            self._max_cached_pages = max(2, math.ceil(visible_rows / self.page_size) + 2)
+            self._evict()
+
+    @property
+    def row_count(self) -> int:
+        """Known row count, or a lower bound that grows while paging."""
+        with self._lock:
+            if self._total is not None:
+                return self._total
+            if self._last_page is not None:
+                return self._last_page * self.page_size + len(self._pages.get(self._last_page, []))
+            highest = max(self._cursors)
+            return highest * self.page_size + self.page_size
+
+    @property
+    def is_complete(self) -> bool:
+        """True once the row count is exact."""
+        with self._lock:
+            return self._total is not None or self._last_page is not None
+
+    def _page_range(self, start: int, count: int) -> range:
+        first = max(0, start) // self.page_size
+        last = max(0, start + count - 1) // self.page_size
+        return range(first, last + 1)
+
+    def rows(self, start: int, count: int) -> List[Optional[Dict[str, Any]]]:
+        """Return cached rows for [start, start + count).
+
+        Rows on pages that have not been loaded yet are None; rows past the
+        end of the data are omitted.
+        """
+        end = min(start + count, self.row_count)
+        result: List[Optional[Dict[str, Any]]] = []
+        with self._lock:
+            for position in range(max(0, start), end):
+                page_index, offset = divmod(position, self.page_size)
+                page = self._pages.get(page_index)
+                if page is None:
+                    result.append(None)
+                    continue
+                self._pages.move_to_end(page_index)
+                if offset < len(page):
+                    result.append(page[offset])
+        return result
+
+    def missing_pages(self, start: int, count: int) -> List[int]:
+        """Page indexes needed for [start, start + count) that are not cached."""
+        with self._lock:
+            pages = [p for p in self._page_range(start, count) if p not in self._pages]
+            if self._last_page is not None:
+                pages = [p for p in pages if p <= self._last_page]
+            return pages
+
+    def load_pages(self, pages: List[int]) -> None:
+        """Fetch pages (blocking). Call from a worker thread.
+
+        Pages whose cursor is not known yet are reached by walking forward
+        from the nearest known page.
+        """
+        with self._load_lock:
+            for target in sorted(pages):
+                with self._lock:
+                    if target in self._pages:
+                        continue
+                    known = max(p for p in self._cursors if p <= target)
+
+                for page_index in range(known, target + 1):
+                    with self._lock:
+                        if self._last_page is not None and page_index > self._last_page:
+                            return
+                        if page_index in self._pages and page_index != target:
+                            continue
+                        cursor = self._cursors[page_index]
+
+                    page = self._fetch_page(self.page_size, cursor)
+                    results = page.get("results", [])
+                    next_cursor = page.get("next_cursor")
+
+                    with self._lock:
+                        self._pages[page_index] = results
+                        self._pages.move_to_end(page_index)
+                        if next_cursor is None or len(results) < self.page_size:
+                            self._last_page = page_index
+                        else:
+                            self._cursors[page_index + 1] = next_cursor
+                        self._evict()
+
+    def _evict(self) -> None:
+        while len(self._pages) > self._max_cached_pages:
+            self._pages.popitem(last=False)
+
+    @property
+    def cached_page_count(self) -> int:
+        """Number of pages currently held in memory."""
+        with self._lock:
+            return len(self._pages)
+
+
+__all__ = ["RecordingsListModel", "PageFetcher"]
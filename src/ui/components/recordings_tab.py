@@ -91,6 +91,18 @@ class RecordingsTab(RecordingsTabUIMixin, RecordingsTabDataMixin, RecordingsTabE
         # Refresh-in-progress flag (used by data mixin)
         self._refresh_in_progress = False
 
+        # Ranked search state (used by data and events mixins)
+        self.SEARCH_DEBOUNCE_MS = 250
+        self.SEARCH_RESULT_LIMIT = 200
+        self._search_job = None
+
+        # Virtualized list: rows are paged from the database by keyset and
+        # only the visible window is rendered into the treeview
+        self.LIST_PAGE_SIZE = 100
+        self._list_model = None
+        self._view_start = 0
+        self._search_snippets: Dict[int, str] = {}
+
     @property
     def data_provider(self) -> RecordingsDataProvider:
         """Get the data provider, falling back to parent.db if not set.
@@ -13,6 +13,9 @@ import time
 from typing import Optional, List, Dict, Any
 from utils.structured_logging import get_logger
 
+from ui.components.recordings_list_model import RecordingsListModel
+from ui.ui_constants import Colors
+
 logger = get_logger(__name__)
 
 
@@ -31,6 +34,13 @@ class RecordingsTabDataMixin:
     - _auto_refresh_interval: Auto-refresh interval in ms
     - _auto_refresh_job: After job ID for auto-refresh
     - _refresh_in_progress: Flag to prevent concurrent refreshes
+    - SEARCH_DEBOUNCE_MS: Delay after the last keystroke before searching
+    - SEARCH_RESULT_LIMIT: Maximum ranked search results shown
+    - _search_job: After job ID for the pending debounced search
+    - _search_snippets: Recording ID -> highlighted snippet for search hits
+    - LIST_PAGE_SIZE: Rows fetched per page for the virtualized list
+    - _list_model: RecordingsListModel backing the virtualized list, if any
+    - _view_start: Position of the first visible row in the list model
     """
 
     def _refresh_recordings_list(self, force_refresh: bool = False) -> None:
@@ -55,17 +65,26 @@ class RecordingsTabDataMixin:
 
             # Check cache first
             if (not force_refresh
-                    and self._recordings_cache is not None
                     and current_time - self._recordings_cache_time < self.RECORDINGS_CACHE_TTL):
-                self._refresh_lock.release()
-                self._populate_recordings_tree(self._recordings_cache)
-                return
-
-            self._show_loading_state()
+                if self._list_model is not None:
+                    self._refresh_lock.release()
+                    self._render_recordings_window()
+                    return
+                if self._recordings_cache is not None:
+                    self._refresh_lock.release()
+                    self._populate_recordings_tree(self._recordings_cache)
+                    return
+
+            if self._list_model is None:
+                self._show_loading_state()
         except Exception:
             self._refresh_lock.release()
             raise
 
+        if hasattr(self.data_provider, 'get_recordings_page'):
+            self._refresh_paged_recordings()
+            return
+
         def task():
             try:
                 if hasattr(self.data_provider, 'get_recordings_lightweight'):
@@ -94,9 +113,75 @@ class RecordingsTabDataMixin:
 
         threading.Thread(target=task, daemon=True).start()
 
+    def _refresh_paged_recordings(self) -> None:
+        """Rebuild the virtualized list model from the database (lock held).
+
+        Counts the recordings and loads the pages under the current scroll
+        position in a background thread; further pages load on demand.
+        """
+        view_start = self._view_start
+
+        def task():
+            try:
+                model = RecordingsListModel(
+                    self.data_provider.get_recordings_page,
+                    page_size=self.LIST_PAGE_SIZE,
+                    total=self.data_provider.get_recordings_count(),
+                )
+                model.load_pages(model.missing_pages(view_start, self.LIST_PAGE_SIZE))
+                self._recordings_cache_time = time.time()
+
+                if self.parent and hasattr(self.parent, 'after'):
+                    try:
+                        self.parent.after(0, lambda: self._on_model_ready(model, searching=False))
+                    except RuntimeError:
+                        pass
+            except Exception as e:
+                logger.error(f"Error loading recordings: {e}")
+                if self.parent and hasattr(self.parent, 'after') and hasattr(self, 'recording_count_label'):
+                    try:
+                        error_msg = str(e)
+                        self.parent.after(0, lambda msg=error_msg: self._on_refresh_error(msg))
+                    except RuntimeError:
+                        pass
+            finally:
+                self._refresh_lock.release()
+
+        threading.Thread(target=task, daemon=True).start()
+
+    def _on_model_ready(self, model: RecordingsListModel, searching: bool) -> None:
+        """Swap in a freshly loaded list model on the main thread."""
+        search_active = bool(self.recordings_search_var is not None and self.recordings_search_var.get().strip())
+        if search_active and not searching:
+            # An active search owns the list; re-run it against fresh data
+            self._filter_recordings()
+            return
+        if searching:
+            self._view_start = 0
+        self._list_model = model
+        self._render_recordings_window()
+
+    def _load_model_pages(self, model: RecordingsListModel, pages: List[int]) -> None:
+        """Load list model pages in the background, then redraw the window."""
+        def task():
+            try:
+                model.load_pages(pages)
+            except Exception as e:
+                logger.error(f"Error loading recordings page: {e}")
+                return
+            try:
+                self.parent.after(0, lambda: model is self._list_model and self._render_recordings_window())
+            except RuntimeError:
+                pass
+
+        threading.Thread(target=task, daemon=True).start()
+
     def _on_refresh_complete(self, recordings: List[Dict[str, Any]]) -> None:
         """Handle successful refresh completion on main thread."""
         self._populate_recordings_tree(recordings)
+        # Keep an active search applied across (auto-)refreshes
+        if self.recordings_search_var is not None and self.recordings_search_var.get().strip():
+            self._filter_recordings()
 
     def _on_refresh_error(self, error_msg: str) -> None:
         """Handle refresh error on main thread."""
@@ -153,7 +238,84 @@ class RecordingsTabDataMixin:
     # ========================================
 
     def _filter_recordings(self) -> None:
-        """Filter recordings based on search text."""
+        """Search recordings as the user types.
+
+        When the data provider supports ranked full-text search the query runs
+        against the whole database, debounced and off the UI thread. Otherwise
+        the rows already loaded into the tree are filtered.
+        """
+        if not hasattr(self.data_provider, 'search_recordings_ranked'):
+            self._filter_loaded_recordings()
+            return
+
+        if self._search_job is not None:
+            try:
+                self.parent.after_cancel(self._search_job)
+            except Exception:
+                pass
+        self._search_job = self.parent.after(self.SEARCH_DEBOUNCE_MS, self._run_recordings_search)
+
+    def _run_recordings_search(self) -> None:
+        """Run the debounced ranked search in a background thread."""
+        self._search_job = None
+        search_text = self.recordings_search_var.get().strip()
+
+        if not search_text:
+            self._search_snippets = {}
+            if self._list_model is None and self._recordings_cache is not None:
+                self._populate_recordings_tree(self._recordings_cache)
+            else:
+                self._view_start = 0
+                self._refresh_recordings_list(force_refresh=True)
+            return
+
+        paged = hasattr(self.data_provider, 'get_recordings_page')
+
+        def fetch_page(limit, cursor):
+            return self.data_provider.search_recordings_ranked(search_text, limit=limit, cursor=cursor)
+
+        def task():
+            try:
+                if paged:
+                    # Ranked results are paged by (score, id) keyset like the plain list
+                    model = RecordingsListModel(fetch_page, page_size=self.LIST_PAGE_SIZE)
+                    model.load_pages([0])
+                else:
+                    page = self.data_provider.search_recordings_ranked(
+                        search_text, limit=self.SEARCH_RESULT_LIMIT
+                    )
+            except Exception as e:
+                logger.error(f"Error searching recordings: {e}")
+                return
+            try:
+                if paged:
+                    self.parent.after(0, lambda: self._on_search_model_ready(search_text, model))
+                else:
+                    self.parent.after(0, lambda: self._on_search_complete(search_text, page["results"]))
+            except RuntimeError:
+                pass
+
+        threading.Thread(target=task, daemon=True).start()
+
+    def _on_search_model_ready(self, search_text: str, model: RecordingsListModel) -> None:
+        """Show a paged search result model, unless the query has changed."""
+        if self.recordings_search_var.get().strip() != search_text:
+            return
+        self._search_snippets = {}
+        self._on_model_ready(model, searching=True)
+
+    def _on_search_complete(self, search_text: str, results: List[Dict[str, Any]]) -> None:
+        """Show ranked search results on the main thread, unless the query has changed."""
+        if self.recordings_search_var.get().strip() != search_text:
+            return
+
+        self._search_snippets = {r['id']: r['snippet'] for r in results if r.get('snippet')}
+        self._populate_recordings_tree(results)
+        if not results:
+            self.recording_count_label.config(text="No matching recordings", foreground=Colors.STATUS_IDLE)
+
+    def _filter_loaded_recordings(self) -> None:
+        """Filter the rows already in the tree by substring match."""
         search_text = self.recordings_search_var.get().lower()
 
         if not search_text:
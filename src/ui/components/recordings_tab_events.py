@@ -66,8 +66,12 @@ class RecordingsTabEventsMixin:
 
         self.invalidate_recordings_cache()
 
-        total_count = len(self.recordings_tree.get_children())
-        self.recording_count_label.config(text=f"{total_count} recording{'s' if total_count != 1 else ''}")
+        if self._list_model is not None:
+            # Positions shift after a delete; reload the visible window
+            self._refresh_recordings_list(force_refresh=True)
+        else:
+            total_count = self._recordings_total()
+            self.recording_count_label.config(text=f"{total_count} recording{'s' if total_count != 1 else ''}")
 
         if deleted_count == count:
             self.parent.status_manager.success(f"{deleted_count} recording{'s' if deleted_count > 1 else ''} deleted")
@@ -106,6 +110,8 @@ class RecordingsTabEventsMixin:
             if success:
                 for item in self.recordings_tree.get_children():
                     self.recordings_tree.delete(item)
+                self._list_model = None
+                self._view_start = 0
 
                 self.recording_count_label.config(text="0 recordings")
 
@@ -325,16 +331,29 @@ class RecordingsTabEventsMixin:
     # Selection Change
     # ========================================
 
+    def _recordings_total(self) -> int:
+        """Total recordings in the list, including rows outside the visible window."""
+        if self._list_model is not None:
+            return self._list_model.row_count
+        return len(self.recordings_tree.get_children())
+
     def _on_selection_change(self, event) -> None:
         """Handle selection change in recordings tree."""
         selection = self.recordings_tree.selection()
-        total_count = len(self.recordings_tree.get_children())
+        total_count = self._recordings_total()
         selected_count = len(selection)
 
         if selected_count > 1:
             self.recording_count_label.config(
                 text=f"{selected_count} of {total_count} recordings selected"
             )
+        elif selected_count == 1 and self._search_snippets:
+            # Show why the selected search hit matched
+            rec_id = int(self.recordings_tree.item(selection[0], 'text'))
+            snippet = self._search_snippets.get(rec_id)
+            self.recording_count_label.config(
+                text=snippet or f"{total_count} recording{'s' if total_count != 1 else ''}"
+            )
         else:
             self.recording_count_label.config(
                 text=f"{total_count} recording{'s' if total_count != 1 else ''}"
@@ -32,6 +32,9 @@ class RecordingsTabUIMixin:
     - recordings_search_var: StringVar for search
     - recording_count_label: PulsingLabel for count display
     - recordings_context_menu: Context menu
+    - recordings_scrollbar: Scrollbar driven by the list model when virtualized
+    - _list_model: RecordingsListModel backing the virtualized list, if any
+    - _view_start: Position of the first visible row in the list model
     """
 
     def create_recordings_tab(self, command_map: dict) -> ttk.Frame:
@@ -99,8 +102,10 @@ class RecordingsTabUIMixin:
 
         scrollbar = ttk.Scrollbar(tree_container)
         scrollbar.pack(side=RIGHT, fill=Y)
+        self.recordings_scrollbar = scrollbar
 
-        # Create compact treeview
+        # Create compact treeview. The tree only ever holds the visible
+        # window of rows; the scrollbar is mapped onto the list model.
         columns = ("date", "time", "transcription", "soap", "referral", "letter")
         self.recordings_tree = ttk.Treeview(
             tree_container,
@@ -110,7 +115,7 @@ class RecordingsTabUIMixin:
             selectmode="extended",
             yscrollcommand=scrollbar.set
         )
-        scrollbar.config(command=self.recordings_tree.yview)
+        scrollbar.config(command=self._on_recordings_scroll)
         self.recordings_tree.pack(side=LEFT, fill=BOTH, expand=True)
 
         # Configure columns
@@ -290,6 +295,114 @@ class RecordingsTabUIMixin:
         self.recordings_tree.bind("<<TreeviewSelect>>", self._on_selection_change)
         self.recordings_tree.bind("<Button-3>", self._show_recordings_context_menu)
 
+        # Virtualized scrolling: wheel and resize move/resize the model window
+        self.recordings_tree.bind("<MouseWheel>", self._on_recordings_wheel)
+        self.recordings_tree.bind("<Button-4>", lambda e: self._scroll_recordings(-3))
+        self.recordings_tree.bind("<Button-5>", lambda e: self._scroll_recordings(3))
+        self.recordings_tree.bind("<Configure>", lambda e: self._render_recordings_window())
+
+    # ========================================
+    # Virtualized List
+    # ========================================
+
+    def _visible_row_count(self) -> int:
+        """Number of rows that fit in the treeview's current height."""
+        row_height = ttk.Style().lookup("Treeview", "rowheight")
+        try:
+            row_height = int(row_height) if row_height else 20
+        except (TypeError, ValueError):
+            row_height = 20
+        height = self.recordings_tree.winfo_height()
+        # Header row takes roughly one row's height
+        rows = height // row_height - 1 if height > 1 else int(self.recordings_tree.cget("height"))
+        return max(1, rows)
+
+    def _on_recordings_scroll(self, *args) -> None:
+        """Scrollbar command: map moveto/scroll onto the list model."""
+        if self._list_model is None:
+            self.recordings_tree.yview(*args)
+            return
+
+        visible = self._visible_row_count()
+        total = self._list_model.row_count
+        if args[0] == "moveto":
+            self._view_start = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = int(args[1]) * (visible if args[2] == "pages" else 1)
+            self._view_start += step
+        self._render_recordings_window()
+
+    def _on_recordings_wheel(self, event) -> str:
+        """Scroll the virtualized list by mouse wheel."""
+        self._scroll_recordings(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def _scroll_recordings(self, rows: int) -> Optional[str]:
+        """Move the visible window by rows."""
+        if self._list_model is None:
+            self.recordings_tree.yview_scroll(rows, "units")
+            return None
+        self._view_start += rows
+        self._render_recordings_window()
+        return "break"
+
+    def _render_recordings_window(self) -> None:
+        """Show the model rows in the visible window, loading missing pages."""
+        model = self._list_model
+        if model is None or self.recordings_tree is None:
+            return
+
+        visible = self._visible_row_count()
+        model.set_viewport(visible)
+        total = model.row_count
+        self._view_start = max(0, min(self._view_start, total - visible))
+        rows = model.rows(self._view_start, visible)
+
+        selected = set(self.recordings_tree.selection())
+        for item in self.recordings_tree.get_children():
+            self.recordings_tree.delete(item)
+
+        # Rows on pages still loading are skipped; the window is redrawn
+        # once they arrive.
+        for recording in rows:
+            if recording is None:
+                continue
+            try:
+                values, tag = self._recording_row_values(recording)
+                iid = str(recording['id'])
+                self.recordings_tree.insert("", "end", iid=iid, text=iid, values=values, tags=(tag,))
+                if recording.get('snippet'):
+                    self._search_snippets[recording['id']] = recording['snippet']
+            except Exception as e:
+                logger.error(f"Error adding recording to tree: {e}")
+
+        still_visible = [item for item in selected if self.recordings_tree.exists(item)]
+        if still_visible:
+            self.recordings_tree.selection_set(still_visible)
+
+        if total:
+            self.recordings_scrollbar.set(self._view_start / total, min(1.0, (self._view_start + visible) / total))
+        else:
+            self.recordings_scrollbar.set(0.0, 1.0)
+
+        if self.recording_count_label and hasattr(self.recording_count_label, 'stop_pulse'):
+            self.recording_count_label.stop_pulse()
+        if total == 0:
+            if self.recordings_search_var is not None and self.recordings_search_var.get().strip():
+                self.recording_count_label.config(text="No matching recordings", foreground=Colors.STATUS_IDLE)
+            else:
+                self._show_empty_state()
+        elif not selected:
+            suffix = "" if model.is_complete else "+"
+            self.recording_count_label.config(
+                text=f"{total}{suffix} recording{'s' if total != 1 else ''}",
+                foreground=Colors.STATUS_IDLE
+            )
+
+        missing = model.missing_pages(self._view_start, visible)
+        if missing:
+            self._load_model_pages(model, missing)
+
     def _create_recordings_context_menu(self) -> None:
         """Create the context menu for recordings tree."""
         self.recordings_context_menu = tk.Menu(self.parent, tearoff=0)
@@ -381,6 +494,69 @@ class RecordingsTabUIMixin:
                 foreground=Colors.CONTENT_NONE
             )
 
+    def _recording_row_values(self, recording: Dict[str, Any]) -> tuple:
+        """Build the treeview values and status tag for a recording row.
+
+        Args:
+            recording: Recording dictionary (full or lightweight)
+
+        Returns:
+            (values, tag) for Treeview.insert
+        """
+        # Parse timestamp
+        timestamp = recording.get('timestamp', '')
+        if timestamp:
+            try:
+                dt_obj = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                date_str = dt_obj.strftime("%Y-%m-%d")
+                time_str = dt_obj.strftime("%H:%M")
+            except (ValueError, AttributeError):
+                date_str = timestamp.split()[0] if ' ' in timestamp else timestamp
+                time_str = timestamp.split()[1] if ' ' in timestamp else ""
+        else:
+            date_str = "Unknown"
+            time_str = ""
+
+        # Determine completion status (lightweight rows carry has_* flags
+        # instead of the document text)
+        has_transcript = recording.get('has_transcript', bool(recording.get('transcript')))
+        has_soap = recording.get('has_soap', bool(recording.get('soap_note')))
+        has_referral = recording.get('has_referral', bool(recording.get('referral')))
+        has_letter = recording.get('has_letter', bool(recording.get('letter')))
+        processing_status = recording.get('processing_status', '')
+
+        # Status indicators
+        if processing_status == 'processing':
+            transcript_status = "🔄" if not has_transcript else "✓"
+            soap_status = "🔄" if not has_soap else "✓"
+            referral_status = "🔄" if not has_referral else "✓"
+            letter_status = "🔄" if not has_letter else "✓"
+            tag = "processing"
+        elif processing_status == 'failed':
+            transcript_status = "❌" if not has_transcript else "✓"
+            soap_status = "❌" if not has_soap else "✓"
+            referral_status = "❌" if not has_referral else "✓"
+            letter_status = "❌" if not has_letter else "✓"
+            tag = "failed"
+        else:
+            transcript_status = "✓" if has_transcript else "—"
+            soap_status = "✓" if has_soap else "—"
+            referral_status = "✓" if has_referral else "—"
+            letter_status = "✓" if has_letter else "—"
+
+            content_count = sum([has_transcript, has_soap, has_referral, has_letter])
+            if content_count == 4:
+                tag = "complete"
+            elif content_count >= 2:
+                tag = "partial"
+            elif content_count == 1:
+                tag = "has_content"
+            else:
+                tag = "no_content"
+
+        values = (date_str, time_str, transcript_status, soap_status, referral_status, letter_status)
+        return values, tag
+
     def _populate_recordings_tree(self, recordings: List[Dict[str, Any]]) -> None:
         """Populate the recordings tree with data.
 
@@ -401,60 +577,12 @@ class RecordingsTabUIMixin:
             try:
                 rec_id = recording['id']
 
-                # Parse timestamp
-                timestamp = recording.get('timestamp', '')
-                if timestamp:
-                    try:
-                        dt_obj = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                        date_str = dt_obj.strftime("%Y-%m-%d")
-                        time_str = dt_obj.strftime("%H:%M")
-                    except (ValueError, AttributeError):
-                        date_str = timestamp.split()[0] if ' ' in timestamp else timestamp
-                        time_str = timestamp.split()[1] if ' ' in timestamp else ""
-                else:
-                    date_str = "Unknown"
-                    time_str = ""
-
-                # Determine completion status
-                has_transcript = bool(recording.get('transcript'))
-                has_soap = bool(recording.get('soap_note'))
-                has_referral = bool(recording.get('referral'))
-                has_letter = bool(recording.get('letter'))
-                processing_status = recording.get('processing_status', '')
-
-                # Status indicators
-                if processing_status == 'processing':
-                    transcript_status = "🔄" if not has_transcript else "✓"
-                    soap_status = "🔄" if not has_soap else "✓"
-                    referral_status = "🔄" if not has_referral else "✓"
-                    letter_status = "🔄" if not has_letter else "✓"
-                    tag = "processing"
-                elif processing_status == 'failed':
-                    transcript_status = "❌" if not has_transcript else "✓"
-                    soap_status = "❌" if not has_soap else "✓"
-                    referral_status = "❌" if not has_referral else "✓"
-                    letter_status = "❌" if not has_letter else "✓"
-                    tag = "failed"
-                else:
-                    transcript_status = "✓" if has_transcript else "—"
-                    soap_status = "✓" if has_soap else "—"
-                    referral_status = "✓" if has_referral else "—"
-                    letter_status = "✓" if has_letter else "—"
-
-                    content_count = sum([has_transcript, has_soap, has_referral, has_letter])
-                    if content_count == 4:
-                        tag = "complete"
-                    elif content_count >= 2:
-                        tag = "partial"
-                    elif content_count == 1:
-                        tag = "has_content"
-                    else:
-                        tag = "no_content"
+                values, tag = self._recording_row_values(recording)
 
                 self.recordings_tree.insert(
                     "", "end",
                     text=str(rec_id),
-                    values=(date_str, time_str, transcript_status, soap_status, referral_status, letter_status),
+                    values=values,
                     tags=(tag,)
                 )
             except Exception as e:
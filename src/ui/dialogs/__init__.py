@@ -1,5 +1,13 @@
-"""UI Dialogs package."""
+"""UI Dialogs package.
 
-from ui.dialogs.rsvp_dialog import RSVPDialog
+Exports are imported on first use, so importing one dialog module does not
+load the others.
+"""
+
+from utils.lazy_loader import lazy_exports
 
 __all__ = ["RSVPDialog"]
+
+__getattr__ = lazy_exports(__name__, {
+    "RSVPDialog": "ui.dialogs.rsvp_dialog",
+})
@@ -14,12 +14,18 @@ from utils.structured_logging import get_logger
 logger = get_logger(__name__)
 from tkinter import messagebox
 
-from ui.dialogs.elevenlabs_settings_dialog import show_elevenlabs_settings_dialog
-from ui.dialogs.deepgram_settings_dialog import show_deepgram_settings_dialog
-from ui.dialogs.groq_settings_dialog import show_groq_settings_dialog
-from ui.dialogs.translation_settings_dialog import show_translation_settings_dialog
-from ui.dialogs.tts_settings_dialog import show_tts_settings_dialog, _fetch_tts_voices
-from ui.dialogs.custom_suggestions_dialog import show_custom_suggestions_dialog
+from utils.lazy_loader import lazy_exports
+
+# Re-exported dialogs are imported on first use
+__getattr__ = lazy_exports(__name__, {
+    "show_elevenlabs_settings_dialog": "ui.dialogs.elevenlabs_settings_dialog",
+    "show_deepgram_settings_dialog": "ui.dialogs.deepgram_settings_dialog",
+    "show_groq_settings_dialog": "ui.dialogs.groq_settings_dialog",
+    "show_translation_settings_dialog": "ui.dialogs.translation_settings_dialog",
+    "show_tts_settings_dialog": "ui.dialogs.tts_settings_dialog",
+    "_fetch_tts_voices": "ui.dialogs.tts_settings_dialog",
+    "show_custom_suggestions_dialog": "ui.dialogs.custom_suggestions_dialog",
+})
 
 
 def test_ollama_connection(_: tk.Tk, ollama_url: str = None) -> bool:
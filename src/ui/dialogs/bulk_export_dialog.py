@@ -0,0 +1,205 @@
+"""
+Bulk Export Dialog
+
+Lets the user pick a format and destination for exporting many
+recordings, then runs BulkExporter on a background thread with a
+progress bar and a Cancel button.
+"""
+
+import os
+import threading
+from datetime import datetime
+from typing import List, Optional
+
+import tkinter as tk
+from tkinter import filedialog, messagebox
+import ttkbootstrap as ttk
+
+from exporters.bulk_exporter import (
+    BulkExporter,
+    BulkExportProgress,
+    BulkExportResult,
+    DEST_DIRECTORY,
+    DEST_FHIR_BUNDLE,
+    DEST_ZIP,
+    FORMAT_DOCX,
+    FORMAT_FHIR,
+    FORMAT_PDF,
+    FORMAT_TEXT,
+)
+from settings.settings_manager import settings_manager
+from ui.dialogs.dialog_utils import create_toplevel_dialog
+from utils.structured_logging import get_logger
+
+logger = get_logger(__name__)
+
+_FORMAT_LABELS = {
+    "Plain text (.txt)": FORMAT_TEXT,
+    "Word (.docx)": FORMAT_DOCX,
+    "PDF (.pdf)": FORMAT_PDF,
+    "FHIR R4 (.json)": FORMAT_FHIR,
+}
+
+_DESTINATION_LABELS = (
+    ("Folder", DEST_DIRECTORY),
+    ("ZIP archive", DEST_ZIP),
+    ("Single FHIR Bundle", DEST_FHIR_BUNDLE),
+)
+
+
+class BulkExportDialog:
+    """Dialog for exporting selected recordings in bulk."""
+
+    def __init__(self, app, db, recording_ids: List[int]):
+        """Initialize the bulk export dialog.
+
+        Args:
+            app: The main application (for after() and the status bar)
+            db: Database to read recordings from
+            recording_ids: Recordings to export
+        """
+        self.app = app
+        self.db = db
+        self.recording_ids = recording_ids
+        self.cancel_event = threading.Event()
+        self._running = False
+
+        self.dialog = create_toplevel_dialog(app, "Export Recordings", "460x320")
+        self.dialog.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        self.format_var = tk.StringVar(value=next(iter(_FORMAT_LABELS)))
+        self.destination_var = tk.StringVar(value=DEST_DIRECTORY)
+        self.status_var = tk.StringVar(value=f"{len(recording_ids)} recording(s) selected")
+
+        self._create_ui()
+
+    def _create_ui(self) -> None:
+        frame = ttk.Frame(self.dialog, padding=15)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(frame, text="Format:").grid(row=0, column=0, sticky="w", pady=(0, 8))
+        format_combo = ttk.Combobox(
+            frame, textvariable=self.format_var, values=list(_FORMAT_LABELS),
+            state="readonly", width=24,
+        )
+        format_combo.grid(row=0, column=1, sticky="w", pady=(0, 8))
+        format_combo.bind("<<ComboboxSelected>>", lambda e: self._update_destinations())
+
+        ttk.Label(frame, text="Export to:").grid(row=1, column=0, sticky="nw")
+        destination_frame = ttk.Frame(frame)
+        destination_frame.grid(row=1, column=1, sticky="w")
+        self._destination_buttons = {}
+        for label, value in _DESTINATION_LABELS:
+            button = ttk.Radiobutton(destination_frame, text=label, value=value, variable=self.destination_var)
+            button.pack(anchor="w")
+            self._destination_buttons[value] = button
+
+        self.progress = ttk.Progressbar(frame, mode="determinate", maximum=max(1, len(self.recording_ids)))
+        self.progress.grid(row=2, column=0, columnspan=2, sticky="ew", pady=(15, 5))
+        ttk.Label(frame, textvariable=self.status_var, foreground="gray").grid(
+            row=3, column=0, columnspan=2, sticky="w"
+        )
+        frame.columnconfigure(1, weight=1)
+
+        button_frame = ttk.Frame(frame)
+        button_frame.grid(row=4, column=0, columnspan=2, sticky="ew", pady=(15, 0))
+        self.export_button = ttk.Button(button_frame, text="Export", command=self._start, bootstyle="success")
+        self.export_button.pack(side=tk.RIGHT)
+        self.cancel_button = ttk.Button(button_frame, text="Cancel", command=self._on_close, bootstyle="secondary")
+        self.cancel_button.pack(side=tk.RIGHT, padx=5)
+
+        self._update_destinations()
+
+    def _update_destinations(self) -> None:
+        """Only FHIR exports can go into a single Bundle."""
+        is_fhir = _FORMAT_LABELS[self.format_var.get()] == FORMAT_FHIR
+        self._destination_buttons[DEST_FHIR_BUNDLE].configure(state=tk.NORMAL if is_fhir else tk.DISABLED)
+        if not is_fhir and self.destination_var.get() == DEST_FHIR_BUNDLE:
+            self.destination_var.set(DEST_DIRECTORY)
+
+    def _ask_output_path(self, destination: str) -> Optional[str]:
+        initial_dir = settings_manager.get("default_folder", "")
+        if destination == DEST_DIRECTORY:
+            return filedialog.askdirectory(parent=self.dialog, title="Select Export Directory", initialdir=initial_dir)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if destination == DEST_ZIP:
+            return filedialog.asksaveasfilename(
+                parent=self.dialog, title="Save Export Archive", initialdir=initial_dir,
+                defaultextension=".zip", initialfile=f"recordings_{stamp}.zip",
+                filetypes=[("ZIP archive", "*.zip")],
+            )
+        return filedialog.asksaveasfilename(
+            parent=self.dialog, title="Save FHIR Bundle", initialdir=initial_dir,
+            defaultextension=".json", initialfile=f"recordings_bundle_{stamp}.json",
+            filetypes=[("FHIR JSON", "*.json")],
+        )
+
+    def _start(self) -> None:
+        export_format = _FORMAT_LABELS[self.format_var.get()]
+        destination = self.destination_var.get()
+        output_path = self._ask_output_path(destination)
+        if not output_path:
+            return
+
+        exporter = BulkExporter(
+            self.db, export_format,
+            clinic_name=settings_manager.get("clinic_name", ""),
+            doctor_name=settings_manager.get("doctor_name", ""),
+        )
+        self._running = True
+        self.export_button.configure(state=tk.DISABLED)
+        self.status_var.set("Exporting...")
+
+        def run():
+            try:
+                result = exporter.export(
+                    self.recording_ids, output_path, destination,
+                    on_progress=lambda p: self.app.after(0, lambda: self._on_progress(p)),
+                    cancel_event=self.cancel_event,
+                )
+            except Exception as e:
+                logger.error(f"Bulk export failed: {e}", exc_info=True)
+                self.app.after(0, lambda err=e: self._on_error(err))
+                return
+            self.app.after(0, lambda: self._on_finished(result))
+
+        threading.Thread(target=run, name="bulk_export", daemon=True).start()
+
+    def _on_progress(self, progress: BulkExportProgress) -> None:
+        if not self.dialog.winfo_exists():
+            return
+        self.progress.configure(value=progress.done)
+        text = f"Exported {progress.exported} of {progress.total}"
+        if progress.failed:
+            text += f" ({progress.failed} failed)"
+        self.status_var.set(text)
+
+    def _on_finished(self, result: BulkExportResult) -> None:
+        self._running = False
+        if result.cancelled:
+            self.app.status_manager.warning(f"Export cancelled after {result.exported} recording(s)")
+        else:
+            message = f"Exported {result.exported} recording(s) in {result.elapsed:.1f}s"
+            if result.failed:
+                message += f" ({result.failed} errors)"
+                self.app.status_manager.warning(message)
+            else:
+                self.app.status_manager.success(message)
+            logger.info(f"Bulk export written to {os.path.abspath(result.output_path)}")
+        if self.dialog.winfo_exists():
+            self.dialog.destroy()
+
+    def _on_error(self, error: Exception) -> None:
+        self._running = False
+        if self.dialog.winfo_exists():
+            messagebox.showerror("Export Failed", f"Could not export recordings:\n{error}", parent=self.dialog)
+            self.dialog.destroy()
+
+    def _on_close(self) -> None:
+        """Cancel a running export, or close the dialog."""
+        if self._running:
+            self.cancel_event.set()
+            self.cancel_button.configure(state=tk.DISABLED)
+            self.status_var.set("Cancelling...")
+            return
+        self.dialog.destroy()
@@ -11,121 +11,64 @@ Functions are organized into submodules for better maintainability:
 - settings_dialogs: Settings dialog with prompt and model configuration
 - api_keys_dialog: Update API keys dialog
 - help_dialogs: Shortcuts and about dialogs
+- pipeline_timing_dialog: Pipeline latency percentiles and trace export
 - document_dialogs: Letter options and letterhead dialogs
 
 For backward compatibility, all functions are re-exported from this module.
+Each one is imported from its submodule on first use, so importing this
+facade for one helper does not load every dialog.
 """
 
-# Import from model_providers submodule
-from ui.dialogs.model_providers import (
-    clear_model_cache,
-    get_openai_models,
-    get_fallback_openai_models,
-    get_ollama_models,
-    get_anthropic_models,
-    get_fallback_anthropic_models,
-    get_gemini_models,
-    get_fallback_gemini_models,
-    _model_cache,
-    _cache_ttl,
-)
+from utils.lazy_loader import lazy_exports
 
-# Import from dialog_utils submodule
-from ui.dialogs.dialog_utils import (
-    create_toplevel_dialog,
-    create_model_selector,
-    create_model_selection_dialog,
-    askstring_min,
-    ask_conditions_dialog,
-)
-
-# Import from audio_settings submodule
-from ui.dialogs.audio_settings import (
-    show_elevenlabs_settings_dialog,
-    show_deepgram_settings_dialog,
-    show_groq_settings_dialog,
-    show_translation_settings_dialog,
-    show_tts_settings_dialog,
-    show_custom_suggestions_dialog,
-    test_ollama_connection,
-    _fetch_tts_voices,
-)
-
-# Import from api_key_dialogs submodule
-from ui.dialogs.api_key_dialogs import (
-    prompt_for_api_key,
-    save_api_key_to_env,
-)
-
-# Import from settings_dialogs submodule
-from ui.dialogs.settings_dialogs import (
-    _create_prompt_tab,
-    _create_soap_prompts_tab,
-    _create_models_tab,
-    _create_temperature_tab,
-    show_settings_dialog,
-)
-
-# Import from api_keys_dialog submodule
-from ui.dialogs.api_keys_dialog import (
-    show_api_keys_dialog,
-)
-
-# Import from help_dialogs submodule
-from ui.dialogs.help_dialogs import (
-    show_shortcuts_dialog,
-    show_about_dialog,
-)
-
-# Import from document_dialogs submodule
-from ui.dialogs.document_dialogs import (
-    show_letter_options_dialog,
-    show_letterhead_dialog,
-)
-
-
-__all__ = [
+_EXPORTS = {
     # model_providers
-    "clear_model_cache",
-    "get_openai_models",
-    "get_fallback_openai_models",
-    "get_ollama_models",
-    "get_anthropic_models",
-    "get_fallback_anthropic_models",
-    "get_gemini_models",
-    "get_fallback_gemini_models",
-    "_model_cache",
-    "_cache_ttl",
+    "clear_model_cache": "ui.dialogs.model_providers",
+    "get_openai_models": "ui.dialogs.model_providers",
+    "get_fallback_openai_models": "ui.dialogs.model_providers",
+    "get_ollama_models": "ui.dialogs.model_providers",
+    "get_anthropic_models": "ui.dialogs.model_providers",
+    "get_fallback_anthropic_models": "ui.dialogs.model_providers",
+    "get_gemini_models": "ui.dialogs.model_providers",
+    "get_fallback_gemini_models": "ui.dialogs.model_providers",
+    "_model_cache": "ui.dialogs.model_providers",
+    "_cache_ttl": "ui.dialogs.model_providers",
     # dialog_utils
-    "create_toplevel_dialog",
-    "create_model_selector",
-    "create_model_selection_dialog",
-    "askstring_min",
-    "ask_conditions_dialog",
+    "create_toplevel_dialog": "ui.dialogs.dialog_utils",
+    "create_model_selector": "ui.dialogs.dialog_utils",
+    "create_model_selection_dialog": "ui.dialogs.dialog_utils",
+    "askstring_min": "ui.dialogs.dialog_utils",
+    "ask_conditions_dialog": "ui.dialogs.dialog_utils",
     # audio_settings
-    "show_elevenlabs_settings_dialog",
-    "show_deepgram_settings_dialog",
-    "show_groq_settings_dialog",
-    "show_translation_settings_dialog",
-    "show_tts_settings_dialog",
-    "show_custom_suggestions_dialog",
-    "test_ollama_connection",
-    "_fetch_tts_voices",
+    "show_elevenlabs_settings_dialog": "ui.dialogs.elevenlabs_settings_dialog",
+    "show_deepgram_settings_dialog": "ui.dialogs.deepgram_settings_dialog",
+    "show_groq_settings_dialog": "ui.dialogs.groq_settings_dialog",
+    "show_translation_settings_dialog": "ui.dialogs.translation_settings_dialog",
+    "show_tts_settings_dialog": "ui.dialogs.tts_settings_dialog",
+    "show_custom_suggestions_dialog": "ui.dialogs.custom_suggestions_dialog",
+    "test_ollama_connection": "ui.dialogs.audio_settings",
+    "_fetch_tts_voices": "ui.dialogs.tts_settings_dialog",
     # api_key_dialogs
-    "prompt_for_api_key",
-    "save_api_key_to_env",
+    "prompt_for_api_key": "ui.dialogs.api_key_dialogs",
+    "save_api_key_to_env": "ui.dialogs.api_key_dialogs",
     # settings_dialogs
-    "_create_prompt_tab",
-    "_create_soap_prompts_tab",
-    "_create_models_tab",
-    "_create_temperature_tab",
-    "show_settings_dialog",
+    "_create_prompt_tab": "ui.dialogs.settings_dialogs",
+    "_create_soap_prompts_tab": "ui.dialogs.settings_dialogs",
+    "_create_models_tab": "ui.dialogs.settings_dialogs",
+    "_create_temperature_tab": "ui.dialogs.settings_dialogs",
+    "show_settings_dialog": "ui.dialogs.settings_dialogs",
     # api_keys_dialog
-    "show_api_keys_dialog",
+    "show_api_keys_dialog": "ui.dialogs.api_keys_dialog",
     # help_dialogs
-    "show_shortcuts_dialog",
-    "show_about_dialog",
+    "show_shortcuts_dialog": "ui.dialogs.help_dialogs",
+    "show_about_dialog": "ui.dialogs.help_dialogs",
+    # pipeline_timing_dialog
+    "show_pipeline_timing_dialog": "ui.dialogs.pipeline_timing_dialog",
     # document_dialogs
-    "show_letter_options_dialog",
-    "show_letterhead_dialog",
-]
+    "show_letter_options_dialog": "ui.dialogs.document_dialogs",
+    "show_letterhead_dialog": "ui.dialogs.document_dialogs",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
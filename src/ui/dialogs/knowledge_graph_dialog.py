@@ -3,6 +3,9 @@ Knowledge Graph Visualization Dialog.
 
 Displays an interactive visualization of entities and relationships
 from the Neo4j knowledge graph using a custom canvas widget.
+
+The graph is loaded a page at a time, most connected nodes first; more
+pages are fetched on demand, when zooming in, or by expanding a node.
 """
 
 import threading
@@ -21,6 +24,11 @@ logger = get_logger(__name__)
 class KnowledgeGraphDialog(tk.Toplevel):
     """Dialog for visualizing the knowledge graph."""
 
+    PAGE_SIZE = 200
+    NEIGHBORHOOD_SIZE = 50
+    # Zoom factor past the last paged zoom level that loads another page
+    ZOOM_PAGE_STEP = 1.5
+
     def __init__(
         self,
         parent: tk.Widget,
@@ -41,6 +49,11 @@ class KnowledgeGraphDialog(tk.Toplevel):
         self._data_provider: Optional[GraphDataProvider] = None
         self._graph_data: Optional[GraphData] = None
         self._loading = False
+        self._paging = False
+        self._load_generation = 0  # Discards pages from a previous load
+        self._next_offset: Optional[int] = None
+        self._total_nodes = 0
+        self._paged_zoom = 1.0
         self._data_source = "patient"  # "patient" or "guidelines"
         self._search_after_id = None  # For debounced search
         self._search_trace_id = None  # For trace cleanup
@@ -84,6 +97,8 @@ class KnowledgeGraphDialog(tk.Toplevel):
             canvas_frame,
             on_node_select=self._on_node_select,
             on_node_hover=self._on_node_hover,
+            on_node_expand=self._on_node_expand,
+            on_view_change=self._on_view_change,
         )
         self.graph_canvas.pack(fill=tk.BOTH, expand=True)
 
@@ -172,6 +187,14 @@ class KnowledgeGraphDialog(tk.Toplevel):
         )
         fit_btn.pack(side=tk.LEFT, padx=(0, 2))
 
+        self.load_more_btn = ttk.Button(
+            toolbar,
+            text="Load More",
+            command=self._load_more,
+            state=tk.DISABLED,
+        )
+        self.load_more_btn.pack(side=tk.LEFT, padx=(10, 0))
+
         # Refresh button
         refresh_btn = ttk.Button(
             toolbar,
@@ -309,6 +332,11 @@ class KnowledgeGraphDialog(tk.Toplevel):
             return
 
         self._loading = True
+        self._load_generation += 1
+        self._next_offset = None
+        self._total_nodes = 0
+        self._paged_zoom = 1.0
+        self.load_more_btn.config(state=tk.DISABLED)
         self._show_loading()
 
         def load_thread():
@@ -328,8 +356,13 @@ class KnowledgeGraphDialog(tk.Toplevel):
                     ))
                     return
 
-                # Load data
-                self._graph_data = self._data_provider.get_full_graph_data(limit=500)
+                # Load the graph size, then only the first page of nodes
+                summary = self._data_provider.get_cluster_summary()
+                self._total_nodes = sum(summary.values())
+                self._graph_data = self._data_provider.get_graph_page(
+                    offset=0, limit=self.PAGE_SIZE
+                )
+                self._next_offset = self._graph_data.next_offset
 
                 # Check if we got any data
                 if not self._graph_data or self._graph_data.node_count == 0:
@@ -475,12 +508,110 @@ class KnowledgeGraphDialog(tk.Toplevel):
         if self._graph_data:
             self.graph_canvas.set_graph_data(self._graph_data)
             self._update_stats()
+            self._update_load_more()
+
+    def _load_more(self) -> None:
+        """Load the next page of nodes into the graph."""
+        if self._next_offset is None or not self._data_provider:
+            return
+
+        offset = self._next_offset
+        provider = self._data_provider
+        self._fetch_in_background(
+            lambda known: provider.get_graph_page(
+                offset=offset, limit=self.PAGE_SIZE, known_node_ids=known
+            ),
+            advances_paging=True,
+        )
+
+    def _on_node_expand(self, node: GraphNode) -> None:
+        """Load the neighbours of a double-clicked node."""
+        if not self._data_provider:
+            return
+
+        provider = self._data_provider
+        self._fetch_in_background(
+            lambda known: provider.get_neighborhood(
+                node.id, limit=self.NEIGHBORHOOD_SIZE, known_node_ids=known
+            ),
+            advances_paging=False,
+        )
+
+    def _on_view_change(self, zoom: float) -> None:
+        """Page in more nodes as the user zooms into the graph."""
+        if zoom >= self._paged_zoom * self.ZOOM_PAGE_STEP and self._next_offset is not None:
+            self._paged_zoom = zoom
+            self._load_more()
+
+    def _fetch_in_background(self, fetch, advances_paging: bool) -> None:
+        """Run a page fetch off the UI thread and merge the result.
+
+        Args:
+            fetch: Callable taking the loaded node IDs and returning GraphData
+            advances_paging: Whether the result moves the next page offset
+        """
+        if self._loading or self._paging or not self._graph_data:
+            return
+
+        self._paging = True
+        self.load_more_btn.config(state=tk.DISABLED)
+        self.stats_label.config(text="Loading more...")
+        generation = self._load_generation
+        known = {node.id for node in self._graph_data.nodes}
+
+        def fetch_thread():
+            try:
+                page = fetch(known)
+                self.after(0, lambda: self._on_page_loaded(page, generation, advances_paging))
+            except Exception as e:
+                logger.error(f"Failed to load more graph data: {e}")
+                self.after(0, lambda: self._on_page_loaded(None, generation, advances_paging))
+
+        thread = threading.Thread(target=fetch_thread, daemon=True)
+        thread.start()
+
+    def _on_page_loaded(
+        self,
+        page: Optional[GraphData],
+        generation: int,
+        advances_paging: bool,
+    ) -> None:
+        """Merge a fetched page into the loaded graph and the canvas."""
+        self._paging = False
+        if generation != self._load_generation or not self._graph_data:
+            return  # Data was reloaded while the page was in flight
+
+        if page is not None:
+            if advances_paging:
+                self._next_offset = page.next_offset
+
+            added = self._graph_data.merge(page)
+            filter_value = self.filter_var.get()
+            if filter_value != "All":
+                # Keep all edges so new nodes also link to ones already shown
+                entity_type = EntityType.from_string(filter_value.lower())
+                added = GraphData(
+                    nodes=[n for n in added.nodes if n.entity_type == entity_type],
+                    edges=added.edges,
+                )
+            self.graph_canvas.add_graph_data(added)
+
+        self._update_stats()
+        self._update_load_more()
+
+    def _update_load_more(self) -> None:
+        """Enable the Load More button while pages remain."""
+        state = tk.NORMAL if self._next_offset is not None else tk.DISABLED
+        self.load_more_btn.config(state=state)
 
     def _update_stats(self) -> None:
         """Update statistics label."""
         if self._graph_data:
+            nodes = f"Nodes: {self._graph_data.node_count}"
+            if self._total_nodes > self._graph_data.node_count:
+                nodes += f" of {self._total_nodes}"
             self.stats_label.config(
-                text=f"Nodes: {self._graph_data.node_count}  |  Edges: {self._graph_data.edge_count}"
+                text=f"{nodes}  |  Edges: {self._graph_data.edge_count}"
             )
         else:
             self.stats_label.config(text="No data")
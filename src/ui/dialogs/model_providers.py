@@ -15,12 +15,15 @@ import requests
 from typing import List, Dict, Tuple, Optional
 from functools import lru_cache
 
-from openai import OpenAI
+from utils.lazy_loader import lazy_import
 
 from utils.constants import (
     PROVIDER_ANTHROPIC, PROVIDER_GEMINI, PROVIDER_GROQ, PROVIDER_CEREBRAS
 )
 
+# The SDK is only needed when a model list is fetched
+openai = lazy_import("openai")
+
 # Cache TTL constant (seconds)
 MODEL_CACHE_TTL_SECONDS = 3600  # 1 hour
 
@@ -49,7 +52,6 @@ def clear_model_cache(provider: str = None) -> None:
 
 def get_openai_models() -> List[str]:
     """Fetch available models from OpenAI API."""
-    import openai
     try:
         # Create OpenAI client
         client = openai.OpenAI()
@@ -294,7 +296,7 @@ def get_groq_models() -> List[str]:
 
         if api_key:
             logger.info("Attempting to fetch Groq models from API")
-            client = OpenAI(
+            client = openai.OpenAI(
                 api_key=api_key,
                 base_url="https://api.groq.com/openai/v1"
             )
@@ -346,7 +348,7 @@ def get_cerebras_models() -> List[str]:
 
         if api_key:
             logger.info("Attempting to fetch Cerebras models from API")
-            client = OpenAI(
+            client = openai.OpenAI(
                 api_key=api_key,
                 base_url="https://api.cerebras.ai/v1"
             )
@@ -0,0 +1,113 @@
+"""
+Pipeline Timing Dialog
+
+Shows per-stage and per-provider latency percentiles collected by the
+pipeline tracer, with export of the recorded spans as a Chrome trace.
+"""
+
+import tkinter as tk
+from tkinter import filedialog, messagebox
+import ttkbootstrap as ttk
+
+from ui.dialogs.dialog_utils import create_toplevel_dialog
+from utils.structured_logging import get_logger
+from utils.tracing import StageStats, get_tracer
+
+logger = get_logger(__name__)
+
+_COLUMNS = (
+    ("stage", "Stage", 180, "w"),
+    ("provider", "Provider", 110, "w"),
+    ("count", "Count", 60, "e"),
+    ("errors", "Errors", 60, "e"),
+    ("p50", "p50", 80, "e"),
+    ("p95", "p95", 80, "e"),
+    ("p99", "p99", 80, "e"),
+    ("max", "Max", 80, "e"),
+)
+
+
+def _format_ms(value: float) -> str:
+    """Milliseconds below 10 s, seconds above."""
+    if value >= 10_000:
+        return f"{value / 1000:.1f} s"
+    return f"{value:.0f} ms" if value >= 10 else f"{value:.1f} ms"
+
+
+def format_stage_row(stats: StageStats) -> tuple:
+    """Treeview values for one summary row."""
+    return (
+        stats.stage,
+        stats.provider or "",
+        stats.count,
+        stats.errors,
+        _format_ms(stats.p50_ms),
+        _format_ms(stats.p95_ms),
+        _format_ms(stats.p99_ms),
+        _format_ms(stats.max_ms),
+    )
+
+
+def show_pipeline_timing_dialog(parent: tk.Tk) -> None:
+    """Show latency percentiles for each pipeline stage."""
+    tracer = get_tracer()
+    dialog = create_toplevel_dialog(parent, "Pipeline Timing", "800x450")
+
+    frame = ttk.Frame(dialog, padding=10)
+    frame.pack(fill=tk.BOTH, expand=True)
+
+    status = "" if tracer.enabled else " (tracing disabled by MEDICAL_ASSISTANT_TRACING)"
+    ttk.Label(
+        frame, text=f"Latency per stage since startup or last reset{status}"
+    ).pack(anchor="w", pady=(0, 8))
+
+    tree_frame = ttk.Frame(frame)
+    tree_frame.pack(fill=tk.BOTH, expand=True)
+    tree = ttk.Treeview(tree_frame, columns=[c[0] for c in _COLUMNS], show="headings", height=14)
+    for key, heading, width, anchor in _COLUMNS:
+        tree.heading(key, text=heading)
+        tree.column(key, width=width, anchor=anchor)
+    scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
+    tree.configure(yscrollcommand=scrollbar.set)
+    tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+    def refresh():
+        tree.delete(*tree.get_children())
+        for stats in tracer.summary():
+            tree.insert("", tk.END, values=format_stage_row(stats))
+
+    def export():
+        path = filedialog.asksaveasfilename(
+            parent=dialog,
+            title="Export Pipeline Trace",
+            defaultextension=".json",
+            initialfile="pipeline_trace.json",
+            filetypes=[("Chrome trace", "*.json"), ("All files", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            count = tracer.export_chrome_trace(path)
+        except OSError as e:
+            logger.error(f"Failed to export pipeline trace: {e}")
+            messagebox.showerror("Export Failed", f"Could not write trace:\n{e}", parent=dialog)
+            return
+        messagebox.showinfo(
+            "Trace Exported",
+            f"Exported {count} spans.\nOpen the file in chrome://tracing or ui.perfetto.dev.",
+            parent=dialog,
+        )
+
+    def reset():
+        tracer.reset()
+        refresh()
+
+    button_frame = ttk.Frame(frame)
+    button_frame.pack(fill=tk.X, pady=(10, 0))
+    ttk.Button(button_frame, text="Refresh", command=refresh, bootstyle="info").pack(side=tk.LEFT)
+    ttk.Button(button_frame, text="Export Trace...", command=export).pack(side=tk.LEFT, padx=5)
+    ttk.Button(button_frame, text="Reset", command=reset, bootstyle="warning").pack(side=tk.LEFT)
+    ttk.Button(button_frame, text="Close", command=dialog.destroy).pack(side=tk.RIGHT)
+
+    refresh()
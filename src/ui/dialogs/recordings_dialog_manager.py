@@ -5,17 +5,14 @@ Handles the recordings database dialog, including listing, searching,
 loading, deleting, and exporting recordings.
 """
 
-import os
 import threading
-from datetime import datetime
 from typing import Optional, List, Dict, Any, Callable
 import tkinter as tk
-from tkinter import messagebox, filedialog
+from tkinter import messagebox
 import ttkbootstrap as ttk
 
 from database.database import Database
 from ui.dialogs.dialogs import create_toplevel_dialog
-from settings.settings_manager import settings_manager
 from ui.status_manager import StatusManager
 from utils.structured_logging import get_logger
 from utils.error_handling import ErrorContext
@@ -35,6 +32,16 @@ class RecordingsDialogManager:
         self.app = parent_app
         self.db = parent_app.db
         self.status_manager = parent_app.status_manager
+
+        # Keyset paging: further pages are appended as the list is scrolled
+        # towards the bottom instead of loading a fixed number of rows
+        self.PAGE_SIZE = 100
+        self.SEARCH_DEBOUNCE_MS = 250
+        self._fetch_page: Optional[Callable[[int, Any], Dict[str, Any]]] = None
+        self._next_cursor = None
+        self._page_loading = False
+        self._total_count: Optional[int] = None
+        self._search_job = None
         
     def show_dialog(self) -> None:
         """Show the recordings database dialog."""
@@ -100,7 +107,7 @@ class RecordingsDialogManager:
             tree_frame, 
             columns=columns, 
             show="headings",
-            yscrollcommand=y_scrollbar.set, 
+            yscrollcommand=lambda first, last: self._on_tree_scrolled(y_scrollbar, first, last),
             xscrollcommand=x_scrollbar.set
         )
         
@@ -192,7 +199,7 @@ class RecordingsDialogManager:
         """Bind event handlers."""
         # Search functionality
         search_var = controls_frame.search_var
-        search_var.trace("w", lambda *args: self._filter_recordings(search_var.get()))
+        search_var.trace("w", lambda *args: self._schedule_search(search_var.get()))
         
         # Double-click to load
         tree.bind("<Double-Button-1>", lambda event: self._load_selected_recording(tree))
@@ -202,20 +209,48 @@ class RecordingsDialogManager:
         self.dialog.bind("<Delete>", lambda event: self._delete_selected_recordings(tree))
         self.dialog.bind("<Return>", lambda event: self._load_selected_recording(tree))
     
-    def _load_recordings(self):
-        """Load recordings from database."""
+    def _load_recordings(self, search_text: str = ""):
+        """Load the first page of recordings (or search results) from the database.
+
+        Args:
+            search_text: Full-text query; empty for the plain newest-first list
+        """
+        if hasattr(self.db, 'get_recordings_page'):
+            if search_text and hasattr(self.db, 'search_recordings_ranked'):
+                self._fetch_page = lambda limit, cursor: self.db.search_recordings_ranked(
+                    search_text, limit=limit, cursor=cursor
+                )
+            else:
+                self._fetch_page = self.db.get_recordings_page
+        else:
+            self._fetch_page = None
+        self._next_cursor = None
+        fetch_page = self._fetch_page
+
         def task():
             try:
-                # Use lightweight query - fetches only essential columns + has_* flags
-                # This avoids loading large text fields (transcript, soap_note, etc.)
-                # saving 50-100x data transfer compared to get_all_recordings()
-                if hasattr(self.db, 'get_recordings_lightweight'):
+                if fetch_page is not None:
+                    page = fetch_page(self.PAGE_SIZE, None)
+                    recordings = page["results"]
+                    next_cursor = page["next_cursor"]
+                    total = None if search_text else self.db.get_recordings_count()
+                elif hasattr(self.db, 'get_recordings_lightweight'):
+                    # Lightweight query: essential columns + has_* flags only
                     recordings = self.db.get_recordings_lightweight(limit=500)
+                    next_cursor, total = None, None
                 else:
                     recordings = self.db.get_all_recordings()
+                    next_cursor, total = None, None
+
+                def apply():
+                    if fetch_page is not self._fetch_page:
+                        return  # superseded by a newer search
+                    self._next_cursor = next_cursor
+                    self._total_count = total
+                    self._update_tree_view(recordings)
 
                 # Update UI on main thread
-                self.app.after(0, lambda: self._update_tree_view(recordings))
+                self.app.after(0, apply)
 
             except Exception as e:
                 ctx = ErrorContext.capture(
@@ -228,12 +263,49 @@ class RecordingsDialogManager:
 
         # Run in background
         threading.Thread(target=task, daemon=True).start()
-    
-    def _update_tree_view(self, recordings: List[Dict[str, Any]]):
-        """Update treeview with recordings data."""
+
+    def _on_tree_scrolled(self, scrollbar: ttk.Scrollbar, first: str, last: str):
+        """Update the scrollbar and fetch the next page near the bottom."""
+        scrollbar.set(first, last)
+        if float(last) > 0.9 and self._next_cursor is not None and not self._page_loading:
+            self._load_next_page()
+
+    def _load_next_page(self):
+        """Append the page after the last loaded row."""
+        fetch_page = self._fetch_page
+        cursor = self._next_cursor
+        self._page_loading = True
+
+        def task():
+            try:
+                page = fetch_page(self.PAGE_SIZE, cursor)
+            except Exception as e:
+                logger.error(f"Error loading recordings page: {e}")
+                self.app.after(0, lambda: setattr(self, '_page_loading', False))
+                return
+
+            def apply():
+                self._page_loading = False
+                if fetch_page is not self._fetch_page:
+                    return
+                self._next_cursor = page["next_cursor"]
+                self._update_tree_view(page["results"], append=True)
+
+            self.app.after(0, apply)
+
+        threading.Thread(target=task, daemon=True).start()
+
+    def _update_tree_view(self, recordings: List[Dict[str, Any]], append: bool = False):
+        """Update treeview with recordings data.
+
+        Args:
+            recordings: Recording rows to show
+            append: Add after the rows already shown instead of replacing them
+        """
         # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        if not append:
+            for item in self.tree.get_children():
+                self.tree.delete(item)
         
         # Add recordings
         for recording in recordings:
@@ -292,13 +364,34 @@ class RecordingsDialogManager:
         
         # Update status
         count = len(self.tree.get_children())
+        if self._total_count is not None:
+            count = self._total_count
         if hasattr(self, 'dialog'):
             for widget in self.dialog.winfo_children():
                 if isinstance(widget, ttk.Frame) and hasattr(widget, 'status_label'):
                     widget.status_label.config(text=f"{count} recordings")
     
+    def _schedule_search(self, search_text: str):
+        """Debounce search input, then query the database for matches."""
+        if self._search_job is not None:
+            try:
+                self.app.after_cancel(self._search_job)
+            except Exception:
+                pass
+            self._search_job = None
+
+        if not hasattr(self.db, 'search_recordings_ranked') or not hasattr(self.db, 'get_recordings_page'):
+            self._filter_recordings(search_text)
+            return
+
+        def run():
+            self._search_job = None
+            self._load_recordings(search_text.strip())
+
+        self._search_job = self.app.after(self.SEARCH_DEBOUNCE_MS, run)
+
     def _filter_recordings(self, search_text: str):
-        """Filter recordings based on search text."""
+        """Filter the loaded recordings based on search text."""
         search_text = search_text.lower()
         
         # Show all items if search is empty
@@ -486,82 +579,21 @@ class RecordingsDialogManager:
         if deleted > 0:
             self.status_manager.success(f"Deleted {deleted} recording(s)")
             # Update count
+            if self._total_count is not None:
+                self._total_count = max(0, self._total_count - deleted)
             for widget in self.dialog.winfo_children():
                 if isinstance(widget, ttk.Frame) and hasattr(widget, 'status_label'):
-                    count = len(tree.get_children())
+                    count = len(tree.get_children()) if self._total_count is None else self._total_count
                     widget.status_label.config(text=f"{count} recordings")
     
     def _export_selected_recordings(self, tree: ttk.Treeview):
-        """Export selected recordings to files."""
+        """Export selected recordings through the bulk export dialog."""
         selection = tree.selection()
         if not selection:
             messagebox.showwarning("No Selection", "Please select recordings to export.")
             return
-        
-        # Ask for export directory
-        export_dir = filedialog.askdirectory(
-            title="Select Export Directory",
-            initialdir=settings_manager.get("default_folder", "")
-        )
-        
-        if not export_dir:
-            return
-        
-        # Export recordings
-        def export_task():
-            exported = 0
-            errors = 0
-            
-            for item in selection:
-                values = tree.item(item, "values")
-                recording_id = values[0]
-                
-                try:
-                    # Get full recording data
-                    recording = self.db.get_recording(recording_id)
-                    if recording:
-                        # Export to file
-                        self._export_recording_to_file(recording, export_dir)
-                        exported += 1
-                except Exception as e:
-                    ctx = ErrorContext.capture(
-                        operation="Exporting recording",
-                        exception=e,
-                        input_summary=f"recording_id={recording_id}"
-                    )
-                    logger.error(ctx.to_log_string())
-                    errors += 1
-            
-            # Update status on main thread
-            message = f"Exported {exported} recording(s)"
-            if errors > 0:
-                message += f" ({errors} errors)"
-            
-            self.app.after(0, lambda: self.status_manager.success(message))
-        
-        # Run in background
-        threading.Thread(target=export_task, daemon=True).start()
-    
-    def _export_recording_to_file(self, recording: Dict[str, Any], export_dir: str):
-        """Export a single recording to file."""
-        rec_id = recording['id']
-        filename = recording['filename']
-        created_at = recording['timestamp']
-        transcript = recording.get('transcript', '')
-        soap_note = recording.get('soap_note', '')
-        
-        # Create filename
-        timestamp = created_at.replace(":", "-").replace(" ", "_")
-        base_filename = f"recording_{rec_id}_{timestamp}"
-        
-        # Export transcript
-        if transcript:
-            transcript_path = os.path.join(export_dir, f"{base_filename}_transcript.txt")
-            with open(transcript_path, 'w', encoding='utf-8') as f:
-                f.write(transcript)
-        
-        # Export SOAP note
-        if soap_note:
-            soap_path = os.path.join(export_dir, f"{base_filename}_soap.txt")
-            with open(soap_path, 'w', encoding='utf-8') as f:
-                f.write(soap_note)
\ No newline at end of file
+
+        from ui.dialogs.bulk_export_dialog import BulkExportDialog
+
+        recording_ids = [int(tree.item(item, "values")[0]) for item in selection]
+        BulkExportDialog(self.app, self.db, recording_ids)
\ No newline at end of file
@@ -87,6 +87,20 @@ class RagGuidelinesTabMixin:
         ToolTip(btn_frame_neon.winfo_children()[1], "Test PostgreSQL connection")
         row += 1
 
+        # Vector store backend
+        backend_label = ttk.Label(scrollable_frame, text="Vector Index:")
+        backend_label.grid(row=row, column=0, sticky="w", pady=10)
+        ToolTip(backend_label, "Where document embeddings are searched")
+        index_settings = settings_manager.get("vector_index", {}) or {}
+        backend_var = tk.StringVar(value=index_settings.get("backend", "neon"))
+        self.widgets['rag_guidelines']['vector_backend'] = backend_var
+        backend_combo = ttk.Combobox(scrollable_frame, textvariable=backend_var, width=30,
+                                     values=["neon", "local"], state="readonly")
+        backend_combo.grid(row=row, column=1, sticky="w", padx=(10, 5), pady=10)
+        ToolTip(backend_combo, "neon: remote pgvector; local: on-disk index, works offline "
+                               "(mirrors Neon documents at startup when a URL is set). Applies after restart.")
+        row += 1
+
         # --- Knowledge Graph ---
         ttk.Label(scrollable_frame, text="Knowledge Graph",
                  font=("Segoe UI", 11, "bold")).grid(row=row, column=0, columnspan=3,
@@ -315,7 +315,7 @@ class HistoryMixin:
 
         def play_audio():
             try:
-                self.tts_manager.synthesize_and_play(
+                self.tts_manager.synthesize_and_play_streaming(
                     display_translation,
                     language=entry.target_language,
                     blocking=True,
@@ -51,7 +51,7 @@ class TTSMixin:
 
         def synthesize_and_play():
             try:
-                self.tts_manager.synthesize_and_play(
+                self.tts_manager.synthesize_and_play_streaming(
                     translated_text,
                     language=self.patient_language,
                     blocking=True,
@@ -115,7 +115,7 @@ class TTSMixin:
 
         def preview_audio():
             try:
-                self.tts_manager.synthesize_and_play(
+                self.tts_manager.synthesize_and_play_streaming(
                     translated_text,
                     language=self.patient_language,
                     blocking=True,
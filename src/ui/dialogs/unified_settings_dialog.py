@@ -314,6 +314,9 @@ class UnifiedSettingsDialog(
                 if 'neon_database_url' in rag:
                     settings_manager.set('neon_database_url', rag['neon_database_url'].get().strip(), auto_save=False)
 
+                if 'vector_backend' in rag:
+                    settings_manager.set_nested('vector_index.backend', rag['vector_backend'].get(), auto_save=False)
+
                 for key in ['neo4j_uri', 'neo4j_user', 'neo4j_password']:
                     if key in rag:
                         settings_manager.set(key, rag[key].get().strip(), auto_save=False)
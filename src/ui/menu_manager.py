@@ -336,6 +336,7 @@ class MenuManager:
         
         helpmenu.add_command(label="About", command=self.app.show_about)
         helpmenu.add_command(label="Keyboard Shortcuts", command=self.app.show_shortcuts)
+        helpmenu.add_command(label="Pipeline Timing...", command=self.app.show_pipeline_timing)
         
         # Create logs submenu
         self._create_logs_submenu(helpmenu)
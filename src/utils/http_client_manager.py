@@ -3,14 +3,18 @@ Singleton HTTP client manager with connection pooling.
 
 Provides persistent connections per provider with configurable pool sizes.
 This eliminates the 100-500ms overhead of creating new connections for each API call.
+
+Async clients (httpx.AsyncClient) are bound to the event loop they were
+first used on, so they are pooled per (provider, event loop).
 """
 
+import asyncio
 import httpx
 import requests
 import threading
 import time
 import atexit
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
 
@@ -64,9 +68,15 @@ class HTTPClientManager:
         "rag": (5.0, 30.0),
     }
 
+    # A single event loop multiplexes many in-flight requests, so async
+    # clients get a larger pool than the per-thread sync clients
+    ASYNC_MAX_CONNECTIONS = 100
+
     def __init__(self):
         """Initialize client manager. Use get_instance() instead of direct instantiation."""
         self._httpx_clients: Dict[str, httpx.Client] = {}
+        # (provider, id(loop)) -> (loop, client)
+        self._async_clients: Dict[Tuple[str, int], Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
         self._requests_sessions: Dict[str, requests.Session] = {}
         self._client_lock = threading.Lock()
         self._shutdown = False
@@ -132,6 +142,75 @@ class HTTPClientManager:
 
             return self._httpx_clients[provider]
 
+    def get_async_httpx_client(
+        self,
+        provider: str,
+        timeout: Optional[float] = None,
+    ) -> httpx.AsyncClient:
+        """
+        Get or create an httpx.AsyncClient for a provider on the running event loop.
+
+        Must be called from a coroutine. Clients created on event loops that
+        have since been closed are discarded.
+
+        Args:
+            provider: Provider name (e.g., "openai", "anthropic")
+            timeout: Optional custom read timeout (uses provider default if not specified)
+
+        Returns:
+            Configured httpx.AsyncClient with connection pooling
+        """
+        if self._shutdown:
+            raise RuntimeError("HTTPClientManager has been shut down")
+
+        loop = asyncio.get_running_loop()
+        key = (provider, id(loop))
+
+        with self._client_lock:
+            entry = self._async_clients.get(key)
+            if entry is not None and entry[0] is loop:
+                return entry[1]
+
+            # Drop clients whose loop is gone (their connections died with it)
+            for stale_key, (stale_loop, _) in list(self._async_clients.items()):
+                if stale_loop.is_closed():
+                    del self._async_clients[stale_key]
+
+            config = self.POOL_CONFIG.get(provider, {"max_connections": 5, "max_keepalive": 3})
+            connect_timeout, read_timeout = self.PROVIDER_TIMEOUTS.get(provider, (5.0, 60.0))
+            if timeout:
+                read_timeout = timeout
+
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.ASYNC_MAX_CONNECTIONS,
+                    max_keepalive_connections=config["max_connections"],
+                    keepalive_expiry=30.0,
+                ),
+                timeout=httpx.Timeout(
+                    connect=connect_timeout,
+                    read=read_timeout,
+                    write=30.0,
+                    pool=None,  # Waiting for a free connection is the backpressure
+                ),
+                http2=HTTP2_AVAILABLE,
+                verify=True,
+            )
+            self._async_clients[key] = (loop, client)
+            return client
+
+    async def aclose_async_clients(self) -> None:
+        """Close the async clients bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._client_lock:
+            keys = [key for key, (client_loop, _) in self._async_clients.items() if client_loop is loop]
+            clients = [self._async_clients.pop(key)[1] for key in keys]
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing async httpx client: {e}")
+
     def get_requests_session(
         self,
         provider: str,
@@ -227,11 +306,16 @@ class HTTPClientManager:
                     logger.debug(f"Error closing requests session for {provider}: {e}")
             self._requests_sessions.clear()
 
+            # Async clients can only be closed from their own loop; drop the
+            # references and let the loops' shutdown release the sockets.
+            self._async_clients.clear()
+
     def get_stats(self) -> Dict[str, Dict]:
         """Get statistics about active connections (for debugging)."""
         stats = {
             "httpx_clients": list(self._httpx_clients.keys()),
             "requests_sessions": list(self._requests_sessions.keys()),
+            "async_httpx_clients": sorted({provider for provider, _ in self._async_clients}),
         }
         return stats
 
@@ -2,7 +2,9 @@
 ICD Code Validator
 
 Validates ICD-9 and ICD-10 diagnostic codes with pattern matching and
-common code lookup. Supports both code systems as requested.
+common code lookup. Supports both code systems as requested. When ICD-10-CM
+release files are configured, ICD-10 lookups and suggestions also use the
+full local terminology index (utils.terminology_index).
 
 Usage:
     validator = ICDValidator()
@@ -12,6 +14,7 @@ Usage:
 """
 
 import re
+from bisect import bisect_left
 from typing import Optional, List, Dict
 from dataclasses import dataclass
 from enum import Enum
@@ -21,6 +24,9 @@ from utils.structured_logging import get_logger
 
 logger = get_logger(__name__)
 
+# Codes sharing a prefix that closest_code() ranks by edit distance
+_CLOSEST_CANDIDATES = 50
+
 
 class ICDCodeSystem(Enum):
     """Supported ICD code systems."""
@@ -80,7 +86,8 @@ class ICDValidator:
     def __init__(
         self,
         icd10_codes: Optional[Dict[str, str]] = None,
-        icd9_codes: Optional[Dict[str, str]] = None
+        icd9_codes: Optional[Dict[str, str]] = None,
+        terminology=None
     ):
         """
         Initialize the validator.
@@ -88,9 +95,24 @@ class ICDValidator:
         Args:
             icd10_codes: Optional custom ICD-10 code dictionary
             icd9_codes: Optional custom ICD-9 code dictionary
+            terminology: Optional TerminologyIndex for ICD-10-CM (defaults to
+                the shared index unless custom ICD-10 codes are given)
         """
         self.icd10_codes = icd10_codes or COMMON_ICD10_CODES
         self.icd9_codes = icd9_codes or COMMON_ICD9_CODES
+        self._terminology = terminology
+        self._use_shared_terminology = terminology is None and icd10_codes is None
+
+        # Sorted once so prefix suggestions are a binary search, not a scan
+        self._sorted_icd10 = sorted(self.icd10_codes)
+        self._sorted_icd9 = sorted(self.icd9_codes)
+
+    def _get_terminology(self):
+        """Get the terminology index; the shared one may still be building."""
+        if self._use_shared_terminology:
+            from utils.terminology_index import get_terminology_index
+            return get_terminology_index()
+        return self._terminology
 
     def validate(self, code: str) -> ICDValidationResult:
         """
@@ -144,6 +166,7 @@ class ICDValidator:
                 f"Code {normalized} has valid {code_system.value} format but is not in "
                 "the common codes database. Please verify with official ICD reference."
             )
+            result.suggested_code = self.closest_code(normalized)
 
         return result
 
@@ -190,6 +213,9 @@ class ICDValidator:
         """
         Suggest similar valid codes for a potentially incorrect code.
 
+        These are the known codes in the same 3-character category, in code
+        order; use closest_code() for the single nearest one.
+
         Args:
             code: The code to find similar codes for
             limit: Maximum number of suggestions
@@ -198,30 +224,78 @@ class ICDValidator:
             List of similar code suggestions
         """
         normalized = self._normalize_code(code)
-        suggestions = []
+        if not normalized:
+            return []
+        prefix = normalized[:3] if len(normalized) >= 3 else normalized
+        return self._known_codes_with_prefix(normalized, prefix, limit)
 
-        # Determine likely code system
-        code_system = self._detect_code_system(normalized)
+    def closest_code(self, code: str) -> Optional[str]:
+        """
+        Nearest known code to an unknown one.
 
-        if code_system == ICDCodeSystem.ICD10 or normalized[0].isalpha():
+        Prefers the known code sharing the longest prefix beyond the
+        category (E11.99 -> E11.9), ranked by edit distance, then the bare
+        category (I10.1 -> I10). Codes that only share the category are
+        not close: E11.99 is never matched to E11.21.
+
+        Args:
+            code: The code to find a neighbour for
+
+        Returns:
+            The closest known code, or None if none is close
+        """
+        normalized = self._normalize_code(code)
+        category = normalized.split(".")[0]
+        if len(category) < 3:
+            return None
+
+        from utils.terminology_index import edit_distance
+        # Longest shared prefix first, down to one character past the dot
+        for length in range(len(normalized) - 1, len(category) + 1, -1):
+            candidates = [
+                c for c in self._known_codes_with_prefix(normalized, normalized[:length], _CLOSEST_CANDIDATES)
+                if c != normalized
+            ]
+            if candidates:
+                return min(candidates, key=lambda c: (edit_distance(c, normalized), c))
+
+        if category != normalized and self._lookup_description(category, self._detect_code_system(category)):
+            return category
+        return None
+
+    def _known_codes_with_prefix(self, code: str, prefix: str, limit: int) -> List[str]:
+        """Known codes starting with prefix, from the code system of code."""
+        code_system = self._detect_code_system(code)
+        if code_system == ICDCodeSystem.ICD10 or code[0].isalpha():
             # Search ICD-10 codes
-            prefix = normalized[:3] if len(normalized) >= 3 else normalized
-            for valid_code in self.icd10_codes.keys():
-                if valid_code.startswith(prefix):
-                    suggestions.append(valid_code)
-                    if len(suggestions) >= limit:
-                        break
+            suggestions = self._codes_with_prefix(self._sorted_icd10, prefix, limit)
+            terminology = self._get_terminology()
+            if terminology is not None and len(suggestions) < limit:
+                from utils.terminology_index import ICD10CM
+                for valid_code in terminology.codes_with_prefix(ICD10CM, prefix, limit):
+                    if valid_code not in suggestions:
+                        suggestions.append(valid_code)
+                        if len(suggestions) >= limit:
+                            break
         else:
             # Search ICD-9 codes
-            prefix = normalized[:3] if len(normalized) >= 3 else normalized
-            for valid_code in self.icd9_codes.keys():
-                if valid_code.startswith(prefix):
-                    suggestions.append(valid_code)
-                    if len(suggestions) >= limit:
-                        break
+            suggestions = self._codes_with_prefix(self._sorted_icd9, prefix, limit)
 
         return suggestions
 
+    @staticmethod
+    def _codes_with_prefix(sorted_codes: List[str], prefix: str, limit: int) -> List[str]:
+        """Codes starting with prefix from a sorted code list."""
+        matches = []
+        position = bisect_left(sorted_codes, prefix)
+        while position < len(sorted_codes) and len(matches) < limit:
+            valid_code = sorted_codes[position]
+            if not valid_code.startswith(prefix):
+                break
+            matches.append(valid_code)
+            position += 1
+        return matches
+
     def _normalize_code(self, code: str) -> str:
         """Normalize an ICD code for consistent processing."""
         # Remove extra whitespace
@@ -267,7 +341,12 @@ class ICDValidator:
     ) -> Optional[str]:
         """Look up description for a code in the appropriate database."""
         if code_system == ICDCodeSystem.ICD10:
-            return self.icd10_codes.get(code)
+            description = self.icd10_codes.get(code)
+            terminology = self._get_terminology()
+            if description is None and terminology is not None:
+                from utils.terminology_index import ICD10CM
+                description = terminology.get_description(ICD10CM, code)
+            return description
         elif code_system == ICDCodeSystem.ICD9:
             return self.icd9_codes.get(code)
         return None
@@ -0,0 +1,165 @@
+"""
+Lazy Loading Utilities
+
+Defers importing heavy modules and building rarely used components until
+they are first touched, keeping them off the startup path. Each deferred
+import or construction is timed by the startup profiler.
+
+Usage:
+    from utils.lazy_loader import LazyComponent, lazy_import
+
+    # Module proxy: ``openai`` is imported on the first attribute access
+    openai = lazy_import("openai")
+    client = openai.OpenAI()
+
+    # Component proxy: the processor is built on the first attribute access
+    app.rag_processor = LazyComponent("rag_processor", lambda: RagProcessor(app))
+    app.rag_processor.get_rag_mode()
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+from typing import Any, Callable, Dict, Generic, TypeVar
+
+from utils.startup_profiler import IMPORT, INIT, get_startup_profiler
+
+T = TypeVar('T')
+
+
+def module_available(module_name: str) -> bool:
+    """Check whether a module can be imported without importing it."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule:
+    """Module proxy that imports the real module on first attribute access.
+
+    Attribute lookups are forwarded on every access, so patching the real
+    module (``patch("openai.OpenAI")``) is seen through the proxy.
+    """
+
+    __slots__ = ("_name", "_module", "_lock")
+
+    def __init__(self, module_name: str):
+        object.__setattr__(self, "_name", module_name)
+        object.__setattr__(self, "_module", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _load(self) -> ModuleType:
+        module = self._module
+        if module is None:
+            with self._lock:
+                module = self._module
+                if module is None:
+                    with get_startup_profiler().measure(self._name, kind=IMPORT):
+                        module = importlib.import_module(self._name)
+                    object.__setattr__(self, "_module", module)
+        return module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(module_name: str) -> LazyModule:
+    """Return a proxy that imports ``module_name`` when first used."""
+    return LazyModule(module_name)
+
+
+class LazyComponent(Generic[T]):
+    """Proxy that builds a component with ``factory`` on first use.
+
+    Attribute reads and writes are forwarded to the built component, so
+    the proxy can stand in for it wherever the component is only used
+    through its attributes. The proxy is always truthy and building it is
+    thread-safe; a factory that raises is retried on the next access. The
+    proxy has no public methods of its own, so it never shadows the
+    component's; use resolve() and is_loaded() to work with the proxy.
+    """
+
+    __slots__ = ("_name", "_factory", "_instance", "_lock")
+
+    def __init__(self, name: str, factory: Callable[[], T]):
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _get(self) -> T:
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                instance = self._instance
+                if instance is None:
+                    with get_startup_profiler().measure(self._name, kind=INIT):
+                        instance = self._factory()
+                    object.__setattr__(self, "_instance", instance)
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._get(), name, value)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._instance is not None else "not loaded"
+        return f"<lazy component {self._name!r} ({state})>"
+
+
+def resolve(value: Any) -> Any:
+    """Unwrap a LazyComponent, building it if needed; other values pass through."""
+    if isinstance(value, LazyComponent):
+        return value._get()
+    return value
+
+
+def is_loaded(value: Any) -> bool:
+    """Whether a lazy proxy has loaded its target; plain values always have."""
+    if isinstance(value, LazyComponent):
+        return value._instance is not None
+    if isinstance(value, LazyModule):
+        return value._module is not None
+    return True
+
+
+def lazy_exports(module_name: str, exports: Dict[str, str]) -> Callable[[str], Any]:
+    """Build a module ``__getattr__`` that imports re-exported names on demand.
+
+    Lets a facade module keep its public names without importing every
+    submodule up front (PEP 562). Each resolved name is cached in the
+    facade's namespace, so later lookups are plain attribute reads.
+
+    Example:
+        __getattr__ = lazy_exports(__name__, {"RSVPDialog": "ui.dialogs.rsvp_dialog"})
+
+    Args:
+        module_name: ``__name__`` of the facade module
+        exports: Mapping of exported name to the module that defines it
+    """
+    def __getattr__(name: str) -> Any:
+        source = exports.get(name)
+        if source is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        if source in sys.modules:
+            module = sys.modules[source]
+        else:
+            with get_startup_profiler().measure(source, kind=IMPORT):
+                module = importlib.import_module(source)
+        value = getattr(module, name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
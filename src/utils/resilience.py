@@ -14,6 +14,10 @@ Error Handling:
     - Does not retry: AuthenticationError, InvalidRequestError, validation errors
     - Raises ServiceUnavailableError: When circuit breaker is OPEN
 
+All decorators also accept ``async def`` functions and return a coroutine
+function in that case, sleeping with asyncio.sleep between retries so the
+event loop is never blocked.
+
 Usage:
     # For AI provider calls (recommended):
     @resilient_api_call(max_retries=3, failure_threshold=5)
@@ -38,8 +42,10 @@ Note:
     For database-specific retry logic, see utils.retry_decorator.
 """
 
+import asyncio
 import time
 import functools
+import inspect
 from typing import Callable, Any, Optional, Union, Tuple, Type
 from datetime import datetime, timedelta
 from enum import Enum
@@ -167,6 +173,34 @@ def retry(
         exclude_exceptions: Tuple of exceptions to not retry on
     """
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                delay = initial_delay
+
+                for attempt in range(max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exclude_exceptions:
+                        raise
+                    except exceptions as e:
+                        if attempt == max_retries:
+                            logger.error(f"Max retries ({max_retries}) reached for {func.__name__}")
+                            raise
+
+                        if isinstance(e, RateLimitError) and e.retry_after:
+                            delay = min(e.retry_after, max_delay)
+
+                        logger.warning(
+                            f"Retry {attempt + 1}/{max_retries} for {func.__name__} "
+                            f"after {delay:.1f}s due to: {str(e)}"
+                        )
+
+                        await asyncio.sleep(delay)
+                        delay = min(delay * backoff_factor, max_delay)
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             delay = initial_delay
@@ -341,6 +375,24 @@ class CircuitBreaker:
         except self.expected_exception as e:
             self._on_failure()
             raise
+
+    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
+        """Await a coroutine function through the circuit breaker.
+
+        Same semantics as call(), for ``async def`` functions.
+        """
+        if self.state == CircuitState.OPEN:
+            raise ServiceUnavailableError(
+                f"Circuit breaker {self.name} is OPEN. Service unavailable."
+            )
+
+        try:
+            result = await func(*args, **kwargs)
+            self._on_success()
+            return result
+        except self.expected_exception:
+            self._on_failure()
+            raise
     
     def _on_success(self):
         """Handle successful call."""
@@ -401,9 +453,14 @@ def circuit_breaker(
             name=breaker_name
         )
         
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs) -> Any:
-            return breaker.call(func, *args, **kwargs)
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs) -> Any:
+                return await breaker.call_async(func, *args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs) -> Any:
+                return breaker.call(func, *args, **kwargs)
         
         # Attach circuit breaker instance for manual control
         wrapper.circuit_breaker = breaker
@@ -431,22 +488,26 @@ def resilient_api_call(
         recovery_timeout: Seconds to wait before attempting recovery
     """
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs) -> Any:
+                return await func(*args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs) -> Any:
+                return func(*args, **kwargs)
+
         # Apply circuit breaker first, then retry
-        @circuit_breaker(
-            failure_threshold=failure_threshold,
-            recovery_timeout=recovery_timeout,
-            expected_exception=APIError
-        )
-        @retry(
+        wrapper = retry(
             max_retries=max_retries,
             initial_delay=initial_delay,
             backoff_factor=backoff_factor,
             exceptions=(APIError, ServiceUnavailableError)
-        )
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs) -> Any:
-            return func(*args, **kwargs)
-        
-        return wrapper
+        )(wrapper)
+        return circuit_breaker(
+            failure_threshold=failure_threshold,
+            recovery_timeout=recovery_timeout,
+            expected_exception=APIError
+        )(wrapper)
     
     return decorator
\ No newline at end of file
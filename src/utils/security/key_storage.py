@@ -417,6 +417,33 @@ class SecureKeyStorage:
         key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
         return Fernet(key)
 
+    def encrypt_data(self, data: bytes) -> bytes:
+        """Encrypt arbitrary bytes with this installation's cipher.
+
+        Used by local caches that hold PHI-bearing text at rest.
+
+        Args:
+            data: Plaintext bytes
+
+        Returns:
+            Fernet token bytes
+        """
+        return self._cipher_suite.encrypt(data)
+
+    def decrypt_data(self, token: bytes) -> bytes:
+        """Decrypt bytes produced by encrypt_data.
+
+        Args:
+            token: Fernet token bytes
+
+        Returns:
+            Plaintext bytes
+
+        Raises:
+            cryptography.fernet.InvalidToken: If the token cannot be decrypted
+        """
+        return self._cipher_suite.decrypt(token)
+
     def store_key(self, provider: str, api_key: str) -> None:
         """Store an encrypted API key.
 
@@ -1,15 +1,21 @@
 """
 Rate Limiter Module
 
-Provides persistent rate limiting for API calls with sliding window algorithm.
+Provides persistent rate limiting for API calls with a sliding window
+algorithm. Each key keeps its most recent calls in a fixed-size ring, so a
+check is constant time, and state is written to disk by a periodic
+background flush rather than on the request path.
 """
 
+import atexit
 import os
 import json
 import time
 import threading
+import weakref
+import zlib
 from pathlib import Path
-from typing import Dict, Optional, Any, Tuple, List
+from typing import Dict, Optional, Any, Tuple, List, Iterable
 from threading import Lock
 from utils.structured_logging import get_logger
 
@@ -23,32 +29,77 @@ from utils.constants import (
 )
 
 
+class _CallWindow:
+    """Timestamps of the most recent calls for one key, kept in a ring.
+
+    The ring holds at most ``max_calls`` timestamps. Once it is full, the
+    slot at ``_head`` is the oldest call: if that call is still inside the
+    window, the window is at its limit; otherwise it is overwritten by the
+    new call. This gives exact sliding-window limiting in constant time.
+    """
+
+    __slots__ = ("max_calls", "window_seconds", "_slots", "_head")
+
+    def __init__(self, max_calls: int, window_seconds: int, calls: Iterable[float] = ()):
+        self.max_calls = max(1, max_calls)
+        self.window_seconds = window_seconds
+        self._slots: List[float] = []
+        self._head = 0  # index of the oldest call once the ring is full
+        for timestamp in sorted(calls)[-self.max_calls:]:
+            self._slots.append(timestamp)
+
+    def acquire(self, now: float) -> Optional[float]:
+        """Record a call at ``now`` if the window has room.
+
+        Returns:
+            None if the call was recorded, otherwise seconds until a slot frees
+        """
+        slots = self._slots
+        if len(slots) < self.max_calls:
+            slots.append(now)
+            return None
+
+        wait_time = self.window_seconds - (now - slots[self._head])
+        if wait_time > 0:
+            return wait_time
+
+        slots[self._head] = now
+        self._head = (self._head + 1) % self.max_calls
+        return None
+
+    @property
+    def calls(self) -> List[float]:
+        """Recorded timestamps, oldest first."""
+        return self._slots[self._head:] + self._slots[:self._head]
+
+    def live_calls(self, now: float) -> List[float]:
+        """Timestamps still inside the window, oldest first."""
+        window_start = now - self.window_seconds
+        return [ts for ts in self.calls if ts > window_start]
+
+
 class RateLimiter:
     """Persistent rate limiter for API calls with sliding window algorithm.
 
     This implementation provides:
     - Persistence across application restarts via JSON file storage
     - Sliding window rate limiting with configurable time windows
-    - Automatic cleanup of expired entries
-    - Thread-safe operations with per-key locking
+    - Constant-time checks: each key keeps its last N calls in a ring
+    - Thread-safe operations with a fixed set of striped locks
+    - Coalesced persistence: the request path only marks state dirty and a
+      background thread writes it every SAVE_INTERVAL seconds
     - Graceful degradation if persistence fails
-    - Memory-bounded lock management with time-based expiry
 
     The sliding window algorithm uses timestamps to track calls within a
     rolling time window, providing more accurate rate limiting than fixed
     windows.
     """
 
-    # File save interval in seconds (avoid excessive disk writes)
+    # Seconds between background flushes of dirty state
     SAVE_INTERVAL = 30
 
-    # Maximum age of rate limit data to keep (in seconds)
-    MAX_DATA_AGE = 3600  # 1 hour
-
-    # Lock management constants
-    MAX_LOCKS = 100  # Maximum number of locks to keep
-    LOCK_EXPIRY_SECONDS = 3600  # Remove locks unused for 1 hour
-    LOCK_CLEANUP_INTERVAL = 300  # Run cleanup every 5 minutes
+    # Number of locks shared by all keys (keys hash to a stripe)
+    LOCK_STRIPES = 16
 
     def __init__(self, storage_path: Optional[Path] = None):
         """Initialize rate limiter with persistent storage.
@@ -56,17 +107,15 @@ class RateLimiter:
         Args:
             storage_path: Path to rate limit data file (default: config/.rate_limits.json)
         """
-        # Using module-level logger
         self._global_lock = Lock()
-        # Changed from defaultdict to regular dict with timestamps
-        # Format: {key: (Lock, last_access_time)}
-        self._key_locks: Dict[str, Tuple[Lock, float]] = {}
-        self._last_save_time = 0.0
-        self._last_lock_cleanup = 0.0
+        self._save_lock = Lock()
+        self._lock_stripes = [Lock() for _ in range(self.LOCK_STRIPES)]
+        self._dirty = False
+        self._flusher: Optional[threading.Thread] = None
+        self._stop_flusher = threading.Event()
 
-        # In-memory cache of rate limit data
-        # Format: {key: {"calls": [timestamp, ...], "window_seconds": int}}
-        self._limits: Dict[str, Dict[str, Any]] = {}
+        # In-memory rate limit state, one ring of recent calls per key
+        self._limits: Dict[str, _CallWindow] = {}
 
         # Set up storage path
         if storage_path is None:
@@ -94,11 +143,17 @@ class RateLimiter:
 
         # Load persisted data on startup
         self._load_from_disk()
+        _live_limiters.add(self)
+
+    @staticmethod
+    def _key(provider: str, identifier: Optional[str]) -> str:
+        return f"{provider}:{identifier}" if identifier else provider
 
     def _get_key_lock(self, key: str) -> Lock:
-        """Get or create a lock for a specific key.
+        """Get the lock stripe guarding a key.
 
-        Thread-safe method that manages lock lifecycle with time-based expiry.
+        Keys are spread over a fixed set of locks by a stable hash, so lock
+        lookup never allocates and never needs cleanup.
 
         Args:
             key: The rate limit key
@@ -106,67 +161,11 @@ class RateLimiter:
         Returns:
             Lock for the key
         """
-        now = time.time()
-
-        with self._global_lock:
-            # Run periodic lock cleanup
-            if now - self._last_lock_cleanup > self.LOCK_CLEANUP_INTERVAL:
-                self._cleanup_expired_locks(now)
-                self._last_lock_cleanup = now
-
-            if key in self._key_locks:
-                # Update last access time
-                lock, _ = self._key_locks[key]
-                self._key_locks[key] = (lock, now)
-                return lock
-            else:
-                # Create new lock
-                lock = Lock()
-                self._key_locks[key] = (lock, now)
-                return lock
-
-    def _cleanup_expired_locks(self, now: float) -> None:
-        """Remove locks that haven't been used recently.
+        return self._lock_stripes[zlib.crc32(key.encode("utf-8")) % self.LOCK_STRIPES]
 
-        Must be called with _global_lock held.
-
-        Args:
-            now: Current timestamp
-        """
-        # Find locks that have expired (not used for LOCK_EXPIRY_SECONDS)
-        expired_keys = []
-        for key, (lock, last_access) in list(self._key_locks.items()):
-            if now - last_access > self.LOCK_EXPIRY_SECONDS:
-                # Only remove if the lock is not currently held
-                if lock.acquire(blocking=False):
-                    lock.release()
-                    expired_keys.append(key)
-
-        # Remove expired locks
-        for key in expired_keys:
-            del self._key_locks[key]
-
-        if expired_keys:
-            logger.debug(f"Cleaned up {len(expired_keys)} expired locks")
-
-        # Safety limit: if still over MAX_LOCKS, remove oldest
-        if len(self._key_locks) > self.MAX_LOCKS:
-            # Sort by last access time and remove oldest
-            provider_keys = set(self.default_limits.keys())
-            sorted_locks = sorted(
-                [(k, v[1]) for k, v in self._key_locks.items() if k not in provider_keys],
-                key=lambda x: x[1]  # Sort by last access time
-            )
-            # Remove oldest locks until under limit
-            remove_count = len(self._key_locks) - self.MAX_LOCKS
-            for key, _ in sorted_locks[:remove_count]:
-                if key in self._key_locks:
-                    lock, _ = self._key_locks[key]
-                    if lock.acquire(blocking=False):
-                        lock.release()
-                        del self._key_locks[key]
-
-            logger.debug(f"Removed {remove_count} locks to stay under MAX_LOCKS")
+    def _limit_for(self, key: str) -> Tuple[int, int]:
+        """(max_calls, window_seconds) for a key, from its provider part."""
+        return self.default_limits.get(key.split(":", 1)[0], (60, 60))
 
     def _load_from_disk(self) -> None:
         """Load rate limit data from disk."""
@@ -189,10 +188,8 @@ class RateLimiter:
 
                         # Only keep if there are valid calls
                         if valid_calls:
-                            self._limits[key] = {
-                                "calls": valid_calls,
-                                "window_seconds": window
-                            }
+                            max_calls, _ = self._limit_for(key)
+                            self._limits[key] = _CallWindow(max_calls, window, valid_calls)
 
                 logger.debug(f"Loaded rate limit data for {len(self._limits)} keys")
 
@@ -203,121 +200,71 @@ class RateLimiter:
             logger.warning(f"Could not load rate limit data: {e}")
             self._limits = {}
 
+    def _mark_dirty(self) -> None:
+        """Flag state for the next background flush, starting the flusher if needed."""
+        self._dirty = True
+        if self._flusher is None:
+            with self._global_lock:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=_flush_periodically,
+                        args=(weakref.ref(self), self._stop_flusher, self.SAVE_INTERVAL),
+                        daemon=True,
+                        name="rate-limit-flush",
+                    )
+                    self._flusher.start()
+
     def _save_to_disk(self, force: bool = False) -> None:
-        """Save rate limit data to disk asynchronously.
+        """Persist rate limit data.
 
-        This method schedules a save operation in a background thread to avoid
-        blocking API calls. The save is rate-limited by SAVE_INTERVAL.
+        Without ``force`` the write is coalesced into the next periodic
+        background flush. With ``force`` the data is written now.
 
         Args:
-            force: If True, save immediately; otherwise respect SAVE_INTERVAL
+            force: If True, save immediately; otherwise defer to the flusher
         """
-        now = time.time()
-
-        # Respect save interval unless forced
-        if not force and now - self._last_save_time < self.SAVE_INTERVAL:
+        if not force:
+            self._mark_dirty()
             return
 
-        # Update timestamp immediately to prevent multiple concurrent saves
-        self._last_save_time = now
-
-        # Take a snapshot of data for async save (quick operation under lock)
-        with self._global_lock:
-            data_snapshot = {k: dict(v) for k, v in self._limits.items()}
+        with self._save_lock:
+            # Clear first so calls made during the write are flushed next time
+            self._dirty = False
+            self._cleanup_expired_data()
+            now = time.time()
+            data = {}
+            for key, window in list(self._limits.items()):
+                with self._get_key_lock(key):
+                    calls = window.live_calls(now)
+                if calls:
+                    data[key] = {"calls": calls, "window_seconds": window.window_seconds}
 
-        # Schedule async save in background thread
-        def _do_save():
             try:
-                # Ensure directory exists
                 self.storage_path.parent.mkdir(parents=True, exist_ok=True)
 
-                # Cleanup old data from snapshot
-                cutoff = time.time() - self.MAX_DATA_AGE
-                cleaned_data = {}
-                for key, limit_data in data_snapshot.items():
-                    calls = limit_data.get("calls", [])
-                    window = limit_data.get("window_seconds", 60)
-                    if calls and max(calls) > cutoff:
-                        # Keep only calls within window
-                        window_start = time.time() - window
-                        limit_data["calls"] = [ts for ts in calls if ts > window_start]
-                        cleaned_data[key] = limit_data
-
-                # Write to disk (no lock needed - working with snapshot)
-                with open(self.storage_path, 'w') as f:
-                    json.dump(cleaned_data, f)
+                # Write to a temporary file and swap it in, so a crash
+                # mid-write never leaves a truncated file behind
+                tmp_path = self.storage_path.with_name(self.storage_path.name + ".tmp")
+                with open(tmp_path, 'w') as f:
+                    json.dump(data, f)
 
                 # Set file permissions (Unix-like systems)
                 if os.name == 'posix':
-                    os.chmod(self.storage_path, 0o600)
+                    os.chmod(tmp_path, 0o600)
+                os.replace(tmp_path, self.storage_path)
 
-                logger.debug(f"Saved rate limit data for {len(cleaned_data)} keys")
+                logger.debug(f"Saved rate limit data for {len(data)} keys")
 
             except Exception as e:
                 logger.warning(f"Could not save rate limit data: {e}")
 
-        # Run save in background thread to avoid blocking
-        save_thread = threading.Thread(target=_do_save, daemon=True)
-        save_thread.start()
-
     def _cleanup_expired_data(self) -> None:
-        """Remove expired entries from rate limit data and stale locks."""
+        """Remove keys whose calls have all left their window."""
         now = time.time()
-        keys_to_remove = []
-
-        for key, limit_data in self._limits.items():
-            window = limit_data.get("window_seconds", 60)
-            calls = limit_data.get("calls", [])
-
-            # Filter out expired calls
-            valid_calls = [ts for ts in calls if now - ts < window]
-
-            if valid_calls:
-                limit_data["calls"] = valid_calls
-            else:
-                keys_to_remove.append(key)
-
-        # Remove empty entries
-        for key in keys_to_remove:
-            del self._limits[key]
-
-        # Clean up stale locks (locks for keys that no longer have data)
-        self._cleanup_stale_locks(keys_to_remove)
-
-    def _cleanup_stale_locks(self, removed_keys: List[str]) -> None:
-        """Remove locks for keys that have been removed from rate limit data.
-
-        This is called during data cleanup to remove locks for keys that
-        no longer have rate limit data.
-
-        Args:
-            removed_keys: List of keys that were removed from rate limit data
-        """
-        with self._global_lock:
-            # Remove locks for explicitly removed keys
-            for key in removed_keys:
-                if key in self._key_locks:
-                    # Only remove if the lock is not currently held
-                    lock, _ = self._key_locks[key]
-                    if lock.acquire(blocking=False):
-                        lock.release()
-                        del self._key_locks[key]
-
-            # Also clean up locks for keys without active rate limit data
-            active_keys = set(self._limits.keys())
-            stale_lock_keys = [
-                k for k in list(self._key_locks.keys())
-                if k not in active_keys
-            ]
-
-            for key in stale_lock_keys:
-                if key in self._key_locks:
-                    lock, _ = self._key_locks[key]
-                    if lock.acquire(blocking=False):
-                        lock.release()
-                        del self._key_locks[key]
-
-            # Note: MAX_LOCKS enforcement is now handled in _cleanup_expired_locks()
+        for key, window in list(self._limits.items()):
+            with self._get_key_lock(key):
+                if self._limits.get(key) is window and not window.live_calls(now):
+                    del self._limits[key]
 
     def check_rate_limit(self, provider: str, identifier: Optional[str] = None) -> Tuple[bool, Optional[float]]:
         """Check if a request is within rate limits using sliding window.
@@ -329,50 +276,23 @@ class RateLimiter:
         Returns:
             Tuple of (is_allowed, wait_time_seconds)
         """
-        key = f"{provider}:{identifier}" if identifier else provider
-        key_lock = self._get_key_lock(key)
-
-        with key_lock:
-            now = time.time()
-
-            # Get rate limit configuration for provider
-            limit_config = self.default_limits.get(provider, (60, 60))
-            max_calls, window_seconds = limit_config
-
-            # Initialize limit data if not exists
-            if key not in self._limits:
-                self._limits[key] = {
-                    "calls": [],
-                    "window_seconds": window_seconds
-                }
-
-            limit_data = self._limits[key]
-            calls = limit_data["calls"]
+        key = self._key(provider, identifier)
+        max_calls, window_seconds = self.default_limits.get(provider, (60, 60))
 
-            # Sliding window: remove calls outside the current window
-            window_start = now - window_seconds
-            valid_calls = [ts for ts in calls if ts > window_start]
-            limit_data["calls"] = valid_calls
+        with self._get_key_lock(key):
+            window = self._limits.get(key)
+            if window is None or window.max_calls != max(1, max_calls) or window.window_seconds != window_seconds:
+                # New key, or its limit changed: carry recorded calls over
+                window = _CallWindow(max_calls, window_seconds, window.calls if window else ())
+                self._limits[key] = window
 
-            # Check if we're at the limit
-            if len(valid_calls) >= max_calls:
-                # Calculate wait time until oldest call expires
-                if valid_calls:
-                    oldest_call = min(valid_calls)
-                    wait_time = window_seconds - (now - oldest_call)
-                    if wait_time > 0:
-                        return False, wait_time
+            wait_time = window.acquire(time.time())
 
-                # All calls have expired, reset
-                limit_data["calls"] = []
+        if wait_time is not None:
+            return False, wait_time
 
-            # Record this call
-            limit_data["calls"].append(now)
-
-            # Trigger async save
-            self._save_to_disk()
-
-            return True, None
+        self._mark_dirty()
+        return True, None
 
     def set_limit(self, provider: str, calls_per_window: int, window_seconds: int = 60) -> None:
         """Set custom rate limit for a provider.
@@ -395,53 +315,29 @@ class RateLimiter:
         Returns:
             Usage statistics
         """
-        key = f"{provider}:{identifier}" if identifier else provider
-        key_lock = self._get_key_lock(key)
+        key = self._key(provider, identifier)
+        max_calls, window_seconds = self.default_limits.get(provider, (60, 60))
 
-        with key_lock:
+        with self._get_key_lock(key):
+            window = self._limits.get(key)
             now = time.time()
-
-            # Get rate limit configuration
-            limit_config = self.default_limits.get(provider, (60, 60))
-            max_calls, window_seconds = limit_config
-
-            if key not in self._limits:
-                return {
-                    "provider": provider,
-                    "identifier": identifier,
-                    "calls_in_window": 0,
-                    "rate_limit": max_calls,
-                    "window_seconds": window_seconds,
-                    "available": max_calls,
-                    "utilization": 0.0,
-                    "reset_in_seconds": None
-                }
-
-            limit_data = self._limits[key]
-            calls = limit_data["calls"]
-
-            # Filter to current window
-            window_start = now - window_seconds
-            valid_calls = [ts for ts in calls if ts > window_start]
-
-            # Calculate reset time
-            reset_in = None
-            if valid_calls:
-                oldest_call = min(valid_calls)
-                reset_in = window_seconds - (now - oldest_call)
-                if reset_in < 0:
-                    reset_in = 0
-
-            return {
-                "provider": provider,
-                "identifier": identifier,
-                "calls_in_window": len(valid_calls),
-                "rate_limit": max_calls,
-                "window_seconds": window_seconds,
-                "available": max(0, max_calls - len(valid_calls)),
-                "utilization": len(valid_calls) / max_calls if max_calls > 0 else 0,
-                "reset_in_seconds": reset_in
-            }
+            valid_calls = window.live_calls(now) if window is not None else []
+
+        # Calculate reset time
+        reset_in = None
+        if valid_calls:
+            reset_in = max(0, window_seconds - (now - valid_calls[0]))
+
+        return {
+            "provider": provider,
+            "identifier": identifier,
+            "calls_in_window": len(valid_calls),
+            "rate_limit": max_calls,
+            "window_seconds": window_seconds,
+            "available": max(0, max_calls - len(valid_calls)),
+            "utilization": len(valid_calls) / max_calls if max_calls > 0 else 0.0,
+            "reset_in_seconds": reset_in
+        }
 
     def reset_provider(self, provider: str, identifier: Optional[str] = None) -> None:
         """Reset rate limit data for a provider.
@@ -450,25 +346,57 @@ class RateLimiter:
             provider: API provider name
             identifier: Optional identifier for more granular reset
         """
-        key = f"{provider}:{identifier}" if identifier else provider
-        key_lock = self._get_key_lock(key)
+        key = self._key(provider, identifier)
 
-        with key_lock:
-            if key in self._limits:
-                del self._limits[key]
-                self._save_to_disk(force=True)
-                logger.info(f"Reset rate limit data for {key}")
+        with self._get_key_lock(key):
+            removed = self._limits.pop(key, None)
+
+        if removed is not None:
+            self._save_to_disk(force=True)
+            logger.info(f"Reset rate limit data for {key}")
 
     def reset_all(self) -> None:
         """Reset all rate limit data."""
-        with self._global_lock:
-            self._limits = {}
-            self._save_to_disk(force=True)
-            logger.info("Reset all rate limit data")
+        self._limits = {}
+        self._save_to_disk(force=True)
+        logger.info("Reset all rate limit data")
 
     def flush(self) -> None:
         """Force save current state to disk."""
         self._save_to_disk(force=True)
 
+    def close(self) -> None:
+        """Stop the background flusher and write any pending state."""
+        self._stop_flusher.set()
+        if self._dirty:
+            self._save_to_disk(force=True)
+
+
+def _flush_periodically(limiter_ref: "weakref.ref[RateLimiter]", stop: threading.Event,
+                        interval: float) -> None:
+    """Background loop writing a limiter's dirty state every ``interval`` seconds.
+
+    Holds only a weak reference, so the thread ends once the limiter is
+    garbage collected or closed.
+    """
+    while not stop.wait(interval):
+        limiter = limiter_ref()
+        if limiter is None:
+            return
+        if limiter._dirty:
+            limiter._save_to_disk(force=True)
+        del limiter
+
+
+# Limiters with state to write at interpreter exit
+_live_limiters: "weakref.WeakSet[RateLimiter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_on_exit() -> None:
+    for limiter in list(_live_limiters):
+        if limiter._dirty:
+            limiter.close()
+
 
 __all__ = ["RateLimiter"]
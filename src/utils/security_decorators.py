@@ -1,8 +1,15 @@
 """
 Security decorators and utilities for Medical Assistant.
+
+Every decorator accepts both regular and ``async def`` functions; for a
+coroutine function the returned wrapper is itself a coroutine function.
+Checks that may block (rate limiter state, API key storage on disk) run on
+a worker thread there, so they never stall the event loop.
 """
 
+import asyncio
 import functools
+import inspect
 import time
 from typing import Callable, Any, Optional
 
@@ -30,8 +37,7 @@ def rate_limited(provider: str, identifier_arg: Optional[str] = None):
             ...
     """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs) -> Any:
+        def check(kwargs) -> None:
             security_manager = get_security_manager()
             
             # Get identifier if specified
@@ -47,7 +53,17 @@ def rate_limited(provider: str, identifier_arg: Optional[str] = None):
                     f"Rate limit exceeded for {provider}. Please wait {wait_time:.1f} seconds.",
                     retry_after=int(wait_time) + 1
                 )
-            
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                await asyncio.to_thread(check, kwargs)
+                return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            check(kwargs)
             # Call the function
             return func(*args, **kwargs)
         
@@ -68,12 +84,10 @@ def sanitize_inputs(*input_args: str, input_type: str = "prompt"):
             ...
     """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs) -> Any:
+        def sanitize(args, kwargs):
             security_manager = get_security_manager()
             
             # Get function signature
-            import inspect
             sig = inspect.signature(func)
             bound_args = sig.bind(*args, **kwargs)
             bound_args.apply_defaults()
@@ -93,6 +107,18 @@ def sanitize_inputs(*input_args: str, input_type: str = "prompt"):
                                 f"Sanitized {arg_name} in {func.__name__}"
                             )
             
+            return bound_args
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                bound_args = sanitize(args, kwargs)
+                return await func(*bound_args.args, **bound_args.kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            bound_args = sanitize(args, kwargs)
             # Call function with sanitized arguments
             return func(*bound_args.args, **bound_args.kwargs)
         
@@ -113,8 +139,7 @@ def require_api_key(provider: str):
             ...
     """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs) -> Any:
+        def check() -> None:
             security_manager = get_security_manager()
             
             # Check if API key is available
@@ -130,7 +155,17 @@ def require_api_key(provider: str):
             is_valid, error = security_manager.validate_api_key(provider, api_key)
             if not is_valid:
                 raise APIError(f"Invalid {provider} API key: {error}")
-            
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                await asyncio.to_thread(check)
+                return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            check()
             # Call the function
             return func(*args, **kwargs)
         
@@ -151,9 +186,9 @@ def log_api_call(provider: str, log_response: bool = False):
             ...
     """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs) -> Any:
-            audit_logger = get_logger(f"api_audit.{provider}")
+        audit_logger = get_logger(f"api_audit.{provider}")
+
+        def log_start():
             security_manager = get_security_manager()
             
             # Log the call
@@ -165,34 +200,54 @@ def log_api_call(provider: str, log_response: bool = False):
                 f"Function: {func.__name__}, "
                 f"Provider: {provider}"
             )
+            return call_id, start_time
 
-            try:
-                # Call the function
-                result = func(*args, **kwargs)
+        def log_success(call_id, start_time, result):
+            elapsed = time.time() - start_time
+            audit_logger.info(
+                f"API call succeeded - ID: {call_id}, "
+                f"Duration: {elapsed:.3f}s"
+            )
 
-                # Log success
-                elapsed = time.time() - start_time
-                audit_logger.info(
-                    f"API call succeeded - ID: {call_id}, "
-                    f"Duration: {elapsed:.3f}s"
-                )
+            if log_response and result:
+                # Be careful not to log sensitive data
+                result_preview = str(result)[:100] + "..." if len(str(result)) > 100 else str(result)
+                audit_logger.debug(f"Response preview - ID: {call_id}: {result_preview}")
 
-                if log_response and result:
-                    # Be careful not to log sensitive data
-                    result_preview = str(result)[:100] + "..." if len(str(result)) > 100 else str(result)
-                    audit_logger.debug(f"Response preview - ID: {call_id}: {result_preview}")
+        def log_failure(call_id, start_time, error):
+            elapsed = time.time() - start_time
+            audit_logger.error(
+                f"API call failed - ID: {call_id}, "
+                f"Duration: {elapsed:.3f}s, "
+                f"Error: {str(error)}"
+            )
 
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                call_id, start_time = log_start()
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    log_failure(call_id, start_time, e)
+                    raise
+                log_success(call_id, start_time, result)
                 return result
+            return async_wrapper
 
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            call_id, start_time = log_start()
+
+            try:
+                # Call the function
+                result = func(*args, **kwargs)
             except Exception as e:
-                # Log failure
-                elapsed = time.time() - start_time
-                audit_logger.error(
-                    f"API call failed - ID: {call_id}, "
-                    f"Duration: {elapsed:.3f}s, "
-                    f"Error: {str(e)}"
-                )
+                log_failure(call_id, start_time, e)
                 raise
+
+            log_success(call_id, start_time, result)
+            return result
         
         return wrapper
     return decorator
@@ -228,7 +283,6 @@ def secure_api_call(provider: str, rate_limit: bool = True, sanitize: bool = Tru
         # Apply input sanitization if requested
         if sanitize:
             # Try to detect prompt-like arguments
-            import inspect
             sig = inspect.signature(func)
             prompt_args = []
             
@@ -0,0 +1,252 @@
+"""
+Startup Profiler
+
+Records how long each component takes to import and initialise while the
+application starts, so cold start can be inspected and held to a budget.
+
+Usage:
+    from utils.startup_profiler import get_startup_profiler
+
+    profiler = get_startup_profiler()
+    with profiler.measure("database", kind="init"):
+        setup_database()
+    profiler.mark_interactive()
+    logger.info(profiler.report())
+
+    # In a test: fail when a cold import of a module exceeds its budget
+    profile = measure_cold_import("core.app", src_path)
+    profile.check_budget(2.5)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from utils.structured_logging import get_logger
+
+logger = get_logger(__name__)
+
+IMPORT = "import"
+INIT = "init"
+
+
+class StartupBudgetExceeded(AssertionError):
+    """Raised when startup takes longer than its configured budget."""
+
+
+def _budget_message(what: str, seconds: float, budget: float,
+                    offenders: List[Tuple[str, float]]) -> str:
+    slowest = ", ".join(f"{name} {cost * 1000:.0f} ms" for name, cost in offenders)
+    return f"{what} took {seconds:.2f}s, over the {budget:.2f}s budget (slowest: {slowest})"
+
+
+@dataclass
+class ComponentTiming:
+    """Time spent importing or initialising one component."""
+    name: str
+    kind: str
+    seconds: float
+    started_at: float  # seconds since the profiler started
+
+
+class StartupProfiler:
+    """Collects per-component import and initialisation timings.
+
+    Timings are recorded from any thread. Nested measurements are recorded
+    independently, so an outer phase includes the time of inner components.
+    """
+
+    def __init__(self):
+        self._start = time.perf_counter()
+        self._timings: List[ComponentTiming] = []
+        self._interactive_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float, kind: str = INIT,
+               started_at: Optional[float] = None) -> None:
+        """Record a timing measured elsewhere."""
+        if started_at is None:
+            started_at = time.perf_counter() - self._start - seconds
+        with self._lock:
+            self._timings.append(ComponentTiming(name, kind, seconds, started_at))
+
+    @contextmanager
+    def measure(self, name: str, kind: str = INIT) -> Iterator[None]:
+        """Time the body of a ``with`` block as one component."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.record(name, elapsed, kind, started_at=start - self._start)
+            logger.debug(f"Startup {kind} {name}", duration_ms=round(elapsed * 1000, 2))
+
+    def mark_interactive(self) -> float:
+        """Mark the first interactive frame; returns seconds since start."""
+        with self._lock:
+            if self._interactive_at is None:
+                self._interactive_at = time.perf_counter() - self._start
+            return self._interactive_at
+
+    @property
+    def time_to_interactive(self) -> Optional[float]:
+        """Seconds from profiler start to the first interactive frame."""
+        return self._interactive_at
+
+    def timings(self, kind: Optional[str] = None) -> List[ComponentTiming]:
+        """Recorded timings in the order they finished."""
+        with self._lock:
+            return [t for t in self._timings if kind is None or t.kind == kind]
+
+    def slowest(self, limit: int = 5, kind: Optional[str] = None) -> List[ComponentTiming]:
+        """The ``limit`` most expensive components."""
+        return sorted(self.timings(kind), key=lambda t: t.seconds, reverse=True)[:limit]
+
+    def report(self, limit: int = 15) -> str:
+        """Human-readable summary of the slowest components."""
+        lines = []
+        if self._interactive_at is not None:
+            lines.append(f"Startup: first interactive frame after {self._interactive_at:.2f}s")
+        else:
+            lines.append(f"Startup: {time.perf_counter() - self._start:.2f}s elapsed")
+        for timing in self.slowest(limit):
+            lines.append(f"  {timing.seconds * 1000:8.1f} ms  {timing.kind:<6}  {timing.name}")
+        return "\n".join(lines)
+
+    def check_budget(self, budget_seconds: float) -> None:
+        """Raise StartupBudgetExceeded if the first frame came too late.
+
+        Falls back to the time elapsed so far when no interactive frame has
+        been marked yet.
+        """
+        seconds = self._interactive_at
+        if seconds is None:
+            seconds = time.perf_counter() - self._start
+        if seconds > budget_seconds:
+            offenders = [(t.name, t.seconds) for t in self.slowest(5)]
+            raise StartupBudgetExceeded(
+                _budget_message("Startup", seconds, budget_seconds, offenders)
+            )
+
+
+@dataclass
+class ImportProfile:
+    """Cold import cost of a module, measured in a fresh interpreter."""
+    module: str
+    seconds: float
+    modules: Dict[str, float] = field(default_factory=dict)  # cumulative seconds per imported module
+    direct: Dict[str, float] = field(default_factory=dict)  # imports made by the module itself
+    loaded: List[str] = field(default_factory=list)  # sys.modules after the import
+
+    def cost(self, module: str) -> float:
+        """Cumulative import time of ``module``, 0.0 if it was not imported."""
+        return self.modules.get(module, 0.0)
+
+    def slowest(self, limit: int = 5) -> List[Tuple[str, float]]:
+        """The most expensive direct imports of the profiled module."""
+        return sorted(self.direct.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+    def check_budget(self, budget_seconds: float) -> None:
+        """Raise StartupBudgetExceeded if the cold import was too slow."""
+        if self.seconds > budget_seconds:
+            raise StartupBudgetExceeded(
+                _budget_message(f"Importing {self.module}", self.seconds, budget_seconds, self.slowest())
+            )
+
+
+# -X importtime only times import statements, not importlib.import_module
+_PROBE = (
+    "import json, sys, time\n"
+    "start = time.perf_counter()\n"
+    "exec('import ' + sys.argv[1])\n"
+    "print(json.dumps({'seconds': time.perf_counter() - start, 'loaded': sorted(sys.modules)}))\n"
+)
+
+
+def _parse_importtime(stderr: str, module: str) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Parse ``-X importtime`` output.
+
+    Returns cumulative seconds per imported module, and the same for the
+    modules imported directly by ``module``. The output lists children
+    before their parent, indented two spaces per level.
+    """
+    costs: Dict[str, float] = {}
+    direct: Dict[str, float] = {}
+    pending: Dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].lstrip(" ")
+        depth = (len(parts[2]) - len(name) - 1) // 2
+        name = name.strip()
+        costs[name] = int(parts[1]) / 1_000_000
+        if depth == 1:
+            pending[name] = costs[name]
+        elif depth == 0:
+            if name == module:
+                direct = pending
+            pending = {}
+    return costs, direct
+
+
+def measure_cold_import(module: str, src_path: Optional[str] = None,
+                        timeout: float = 120.0) -> ImportProfile:
+    """Import ``module`` in a fresh interpreter and report what it cost.
+
+    Args:
+        module: Dotted module name to import
+        src_path: Directory to put on PYTHONPATH (defaults to the src tree)
+        timeout: Seconds to wait for the child interpreter
+
+    Raises:
+        ImportError: If the module cannot be imported
+    """
+    src_path = src_path or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_path, env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE, module],
+        capture_output=True, text=True, env=env, timeout=timeout,
+    )
+    if proc.returncode != 0:
+        last_line = proc.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise ImportError(f"Cold import of {module} failed: {last_line[0]}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    modules, direct = _parse_importtime(proc.stderr, module)
+    return ImportProfile(
+        module=module,
+        seconds=result["seconds"],
+        modules=modules,
+        direct=direct,
+        loaded=result["loaded"],
+    )
+
+
+_profiler: Optional[StartupProfiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """Get the process-wide startup profiler."""
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = StartupProfiler()
+    return _profiler
+
+
+def reset_startup_profiler() -> None:
+    """Discard the startup profiler (for testing)."""
+    global _profiler
+    with _profiler_lock:
+        _profiler = None
@@ -34,6 +34,7 @@ import json
 import time
 import os
 import functools
+import inspect
 import threading
 from typing import Any, Dict, Optional, Callable, TypeVar
 from datetime import datetime
@@ -389,6 +390,9 @@ def get_logger(name: str, json_format: bool = False) -> StructuredLogger:
 def timed(operation_name: str = None, logger: StructuredLogger = None, level: int = logging.DEBUG):
     """Decorator to log function execution time.
 
+    Each call is also recorded as a pipeline tracing span named after the
+    operation (see utils.tracing).
+
     Args:
         operation_name: Name for the operation (defaults to function name)
         logger: Logger to use (creates one if not provided)
@@ -405,37 +409,65 @@ def timed(operation_name: str = None, logger: StructuredLogger = None, level: in
             pass
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs) -> T:
+        # Imported here: tracing logs through this module
+        from utils.tracing import get_tracer
+
+        op_name = operation_name or func.__name__
+
+        def get_log():
             nonlocal logger
             if logger is None:
                 logger = get_logger(func.__module__)
+            return logger
+
+        def log_success(start_time):
+            elapsed = time.perf_counter() - start_time
+            get_log().log(
+                level,
+                f"Completed {op_name}",
+                duration_ms=round(elapsed * 1000, 2),
+                status="success"
+            )
+
+        def log_failure(start_time, e):
+            elapsed = time.perf_counter() - start_time
+            get_log().error(
+                f"Failed {op_name}",
+                duration_ms=round(elapsed * 1000, 2),
+                status="error",
+                error=str(e)
+            )
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> T:
+                start_time = time.perf_counter()
+                get_log().debug(f"Starting {op_name}")
+                with get_tracer().span(op_name, start=start_time):
+                    try:
+                        result = await func(*args, **kwargs)
+                    except Exception as e:
+                        log_failure(start_time, e)
+                        raise
+                log_success(start_time)
+                return result
+            return async_wrapper
 
-            op_name = operation_name or func.__name__
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> T:
             start_time = time.perf_counter()
 
-            logger.debug(f"Starting {op_name}")
-
-            try:
-                result = func(*args, **kwargs)
-                elapsed = time.perf_counter() - start_time
-                logger.log(
-                    level,
-                    f"Completed {op_name}",
-                    duration_ms=round(elapsed * 1000, 2),
-                    status="success"
-                )
-                return result
+            get_log().debug(f"Starting {op_name}")
+
+            with get_tracer().span(op_name, start=start_time):
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as e:
+                    log_failure(start_time, e)
+                    raise
 
-            except Exception as e:
-                elapsed = time.perf_counter() - start_time
-                logger.error(
-                    f"Failed {op_name}",
-                    duration_ms=round(elapsed * 1000, 2),
-                    status="error",
-                    error=str(e)
-                )
-                raise
+            log_success(start_time)
+            return result
 
         return wrapper
     return decorator
@@ -0,0 +1,587 @@
+"""
+Local Terminology Index
+
+Indexes the full ICD-10-CM and RxNorm release files from local disk so
+code validation and term-to-code lookups scale to the ~74k ICD-10-CM codes
+and the RxNorm drug vocabulary instead of the small built-in dictionaries.
+
+Layout (one directory, rebuilt when the source files change):
+- terminology.db: SQLite table of terms (one row per code/term pair) with
+  B-tree indexes on (system, code) for exact and prefix code lookup and on
+  (system, normalized term) for exact name lookup
+- trigram_offsets.npy / trigram_postings.npy / term_trigram_counts.npy:
+  CSR inverted index from word-padded character trigrams to term ids,
+  memory-mapped at open
+
+Description search ranks candidates sharing the most trigrams by Dice
+coefficient, then re-scores the best of them by edit distance so typos
+like "metfromin" still find "metformin".
+
+Usage:
+    from utils.terminology_index import get_terminology_index, ICD10CM
+
+    index = get_terminology_index()  # None if not configured or still building
+    if index:
+        index.get_description(ICD10CM, "E11.65")
+        index.search("type 2 diabetes with hyperglycemia", system=ICD10CM)
+"""
+
+import json
+import os
+import re
+import shutil
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from utils.structured_logging import get_logger
+
+logger = get_logger(__name__)
+
+ICD10CM = "ICD-10-CM"
+RXNORM = "RXNORM"
+SYSTEMS = (ICD10CM, RXNORM)
+
+# RxNorm term types worth indexing, most preferred first (ingredients and
+# brands before clinical drugs and packs)
+RXNORM_TERM_TYPES = ("IN", "PIN", "MIN", "BN", "SCD", "SBD", "SCDF", "SBDF", "GPCK", "BPCK")
+
+_DB_NAME = "terminology.db"
+_OFFSETS_NAME = "trigram_offsets.npy"
+_POSTINGS_NAME = "trigram_postings.npy"
+_COUNTS_NAME = "term_trigram_counts.npy"
+_SYSTEMS_NAME = "term_systems.npy"
+_FORMAT_VERSION = 1
+_EDIT_DISTANCE_MAX_CHARS = 32
+
+# Fixed-width icd10cm_order_*.txt: order, code, billable flag, short, long
+_ICD10_ORDER_LINE = re.compile(r"^\d{5} (.{7}) ([01]) (.{60}) (.+)$")
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_term(text: str) -> str:
+    """Lower-case and reduce punctuation runs to single spaces."""
+    return _NON_ALNUM.sub(" ", text.lower()).strip()
+
+
+def term_trigrams(normalized: str) -> set:
+    """Character trigrams of each word, padded so short words still count."""
+    grams = set()
+    for word in normalized.split():
+        padded = f" {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def format_icd10_code(code: str) -> str:
+    """Insert the decimal point release files omit (E1165 -> E11.65)."""
+    code = code.strip().upper().replace(".", "")
+    return f"{code[:3]}.{code[3:]}" if len(code) > 3 else code
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance between two strings."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        current = [i]
+        for j, cb in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+@dataclass
+class TerminologyTerm:
+    """A term to index."""
+    system: str
+    code: str
+    term: str
+    description: str  # Preferred description of the code
+    term_type: str = ""
+    billable: bool = True
+
+
+@dataclass
+class TerminologyMatch:
+    """A description search result."""
+    system: str
+    code: str
+    term: str
+    description: str
+    score: float
+
+
+def iter_icd10cm_file(path: str) -> Iterator[TerminologyTerm]:
+    """Parse an ICD-10-CM order file or plain codes file.
+
+    Order files (icd10cm_order_YYYY.txt) include non-billable category
+    headers and short descriptions, which are indexed as extra terms.
+    Codes files (icd10cm_codes_YYYY.txt) are "CODE description" per line.
+    """
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            if not line.strip():
+                continue
+            match = _ICD10_ORDER_LINE.match(line)
+            if match:
+                code = format_icd10_code(match.group(1))
+                billable = match.group(2) == "1"
+                short, long = match.group(3).strip(), match.group(4).strip()
+                yield TerminologyTerm(ICD10CM, code, long, long, "LONG", billable)
+                if short and short.lower() != long.lower():
+                    yield TerminologyTerm(ICD10CM, code, short, long, "SHORT", billable)
+            else:
+                parts = line.split(None, 1)
+                if len(parts) == 2:
+                    code = format_icd10_code(parts[0])
+                    description = parts[1].strip()
+                    yield TerminologyTerm(ICD10CM, code, description, description, "LONG")
+
+
+def iter_rxnconso_file(path: str, term_types: Iterable[str] = RXNORM_TERM_TYPES) -> Iterator[TerminologyTerm]:
+    """Parse RXNCONSO.RRF, keeping current English RXNORM-sourced names.
+
+    The preferred description of each RXCUI is its name with the most
+    preferred term type in ``term_types``.
+    """
+    priority = {tty: rank for rank, tty in enumerate(term_types)}
+    rows: List[Tuple[str, str, str]] = []
+    preferred: Dict[str, Tuple[int, str]] = {}
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            fields = line.split("|")
+            if len(fields) < 17:
+                continue
+            rxcui, lat, sab, tty, name, suppress = fields[0], fields[1], fields[11], fields[12], fields[14], fields[16]
+            if lat != "ENG" or sab != "RXNORM" or tty not in priority or suppress not in ("", "N"):
+                continue
+            rows.append((rxcui, tty, name))
+            rank = priority[tty]
+            if rxcui not in preferred or rank < preferred[rxcui][0]:
+                preferred[rxcui] = (rank, name)
+    for rxcui, tty, name in rows:
+        yield TerminologyTerm(RXNORM, rxcui, name, preferred[rxcui][1], tty)
+
+
+def _source_fingerprint(paths: Dict[str, Optional[str]]) -> Dict[str, Optional[list]]:
+    """Size and mtime of each configured source file."""
+    fingerprint = {}
+    for system, path in paths.items():
+        if path and os.path.isfile(path):
+            stat = os.stat(path)
+            fingerprint[system] = [os.path.abspath(path), stat.st_size, int(stat.st_mtime)]
+        else:
+            fingerprint[system] = None
+    return fingerprint
+
+
+class TerminologyIndex:
+    """Read-only terminology index over a built directory."""
+
+    def __init__(self, directory: Path):
+        """Open a built index.
+
+        Args:
+            directory: Directory written by TerminologyIndex.build
+
+        Raises:
+            FileNotFoundError: If the directory has not been built
+        """
+        self.directory = Path(directory)
+        db_path = self.directory / _DB_NAME
+        if not db_path.exists():
+            raise FileNotFoundError(f"Terminology index not built: {self.directory}")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+        meta = dict(self._conn.execute("SELECT key, value FROM index_meta").fetchall())
+        self.sources = json.loads(meta.get("sources", "{}"))
+        self.format_version = int(meta.get("format_version", 0))
+        self._trigram_ids = {gram: i for i, gram in enumerate(json.loads(meta["trigrams"]))}
+        self._offsets = np.load(self.directory / _OFFSETS_NAME, mmap_mode="r")
+        self._postings = np.load(self.directory / _POSTINGS_NAME, mmap_mode="r")
+        self._term_counts = np.load(self.directory / _COUNTS_NAME, mmap_mode="r")
+        self._term_systems = np.load(self.directory / _SYSTEMS_NAME, mmap_mode="r")
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        directory: Path,
+        icd10cm_path: Optional[str] = None,
+        rxnorm_path: Optional[str] = None,
+        extra_terms: Iterable[TerminologyTerm] = (),
+    ) -> "TerminologyIndex":
+        """Build (or rebuild) an index from release files.
+
+        The index is written to a sibling temporary directory and swapped
+        in, so a failed build leaves the previous index intact.
+
+        Args:
+            directory: Target directory
+            icd10cm_path: ICD-10-CM order or codes file
+            rxnorm_path: RxNorm RXNCONSO.RRF file
+            extra_terms: Additional terms (aliases, local codes)
+
+        Returns:
+            The opened TerminologyIndex
+        """
+        directory = Path(directory)
+        staging = directory.with_name(directory.name + ".building")
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+
+        def terms() -> Iterator[TerminologyTerm]:
+            if icd10cm_path:
+                yield from iter_icd10cm_file(icd10cm_path)
+            if rxnorm_path:
+                yield from iter_rxnconso_file(rxnorm_path)
+            yield from extra_terms
+
+        conn = sqlite3.connect(str(staging / _DB_NAME))
+        try:
+            conn.executescript("""
+                PRAGMA journal_mode=OFF;
+                PRAGMA synchronous=OFF;
+                CREATE TABLE terms (
+                    id INTEGER PRIMARY KEY,
+                    system TEXT NOT NULL,
+                    code TEXT NOT NULL,
+                    term TEXT NOT NULL,
+                    normalized TEXT NOT NULL,
+                    description TEXT NOT NULL,
+                    term_type TEXT NOT NULL,
+                    billable INTEGER NOT NULL
+                );
+                CREATE TABLE index_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            """)
+
+            trigram_ids: Dict[str, int] = {}
+            gram_rows: List[int] = []
+            gram_cols: List[int] = []
+            counts: List[int] = []
+            systems: List[int] = []
+            batch = []
+            seen = set()
+            for item in terms():
+                normalized = normalize_term(item.term)
+                key = (item.system, item.code, normalized)
+                if not normalized or key in seen:
+                    continue
+                seen.add(key)
+                term_id = len(counts)
+                grams = term_trigrams(normalized)
+                for gram in grams:
+                    gram_cols.append(trigram_ids.setdefault(gram, len(trigram_ids)))
+                    gram_rows.append(term_id)
+                counts.append(len(grams))
+                systems.append(SYSTEMS.index(item.system) if item.system in SYSTEMS else len(SYSTEMS))
+                batch.append((term_id, item.system, item.code, item.term, normalized,
+                              item.description, item.term_type, int(item.billable)))
+                if len(batch) >= 10000:
+                    conn.executemany("INSERT INTO terms VALUES (?, ?, ?, ?, ?, ?, ?, ?)", batch)
+                    batch = []
+            if batch:
+                conn.executemany("INSERT INTO terms VALUES (?, ?, ?, ?, ?, ?, ?, ?)", batch)
+
+            conn.executescript("""
+                CREATE INDEX idx_terms_code ON terms(system, code);
+                CREATE INDEX idx_terms_normalized ON terms(system, normalized);
+            """)
+            fingerprint = _source_fingerprint({ICD10CM: icd10cm_path, RXNORM: rxnorm_path})
+            vocabulary = sorted(trigram_ids, key=trigram_ids.get)
+            conn.executemany("INSERT INTO index_meta VALUES (?, ?)", [
+                ("format_version", str(_FORMAT_VERSION)),
+                ("sources", json.dumps(fingerprint)),
+                ("trigrams", json.dumps(vocabulary)),
+            ])
+            conn.commit()
+        finally:
+            conn.close()
+
+        cols = np.asarray(gram_cols, dtype=np.int32)
+        rows = np.asarray(gram_rows, dtype=np.int32)
+        offsets = np.zeros(len(trigram_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cols, minlength=len(trigram_ids)), out=offsets[1:])
+        np.save(staging / _OFFSETS_NAME, offsets)
+        np.save(staging / _POSTINGS_NAME, rows[np.argsort(cols, kind="stable")])
+        np.save(staging / _COUNTS_NAME, np.asarray(counts, dtype=np.int16))
+        np.save(staging / _SYSTEMS_NAME, np.asarray(systems, dtype=np.int8))
+
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(staging, directory)
+        logger.info(f"Built terminology index with {len(counts)} terms", directory=str(directory))
+        return cls(directory)
+
+    # ------------------------------------------------------------------
+    # Code lookup
+    # ------------------------------------------------------------------
+
+    def get_description(self, system: str, code: str) -> Optional[str]:
+        """Preferred description of a code, or None if the code is unknown."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT description FROM terms WHERE system = ? AND code = ? LIMIT 1",
+                (system, code)
+            ).fetchone()
+        return row[0] if row else None
+
+    def has_code(self, system: str, code: str) -> bool:
+        """Whether a code exists in the index."""
+        return self.get_description(system, code) is not None
+
+    def codes_with_prefix(self, system: str, prefix: str, limit: int = 10) -> List[str]:
+        """Codes starting with a prefix, in code order.
+
+        Uses a range scan on the (system, code) index, so the cost depends
+        on the number of results rather than the size of the vocabulary.
+        """
+        if not prefix:
+            return []
+        upper_bound = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT code FROM terms WHERE system = ? AND code >= ? AND code < ? "
+                "ORDER BY code LIMIT ?",
+                (system, prefix, upper_bound, limit)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    # ------------------------------------------------------------------
+    # Description search
+    # ------------------------------------------------------------------
+
+    def find_code(
+        self, text: str, system: str, min_score: float = 0.85, fuzzy: bool = True
+    ) -> Optional[TerminologyMatch]:
+        """Best code for a term: an exact name match, else a close fuzzy match.
+
+        Args:
+            text: Condition or medication name
+            system: ICD10CM or RXNORM
+            min_score: Minimum fuzzy score to accept
+            fuzzy: Fall back to a fuzzy match when no name matches exactly
+
+        Returns:
+            TerminologyMatch or None
+        """
+        normalized = normalize_term(text)
+        if not normalized:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT code, term, description FROM terms WHERE system = ? AND normalized = ? "
+                "ORDER BY id LIMIT 1",
+                (system, normalized)
+            ).fetchone()
+        if row:
+            return TerminologyMatch(system, row[0], row[1], row[2], 1.0)
+        if not fuzzy:
+            return None
+        matches = self.search(text, system=system, limit=1, min_score=min_score)
+        return matches[0] if matches else None
+
+    def search(
+        self,
+        text: str,
+        system: Optional[str] = None,
+        limit: int = 10,
+        min_score: float = 0.3,
+    ) -> List[TerminologyMatch]:
+        """Typo-tolerant description search.
+
+        Args:
+            text: Free-text description or name
+            system: Restrict to ICD10CM or RXNORM
+            limit: Maximum codes returned (one match per code)
+            min_score: Minimum similarity (0-1)
+
+        Returns:
+            Matches, best first
+        """
+        normalized = normalize_term(text)
+        query_grams = term_trigrams(normalized)
+        gram_ids = [self._trigram_ids[g] for g in query_grams if g in self._trigram_ids]
+        if not gram_ids:
+            return []
+
+        hits = np.concatenate([self._postings[self._offsets[i]:self._offsets[i + 1]] for i in gram_ids])
+        shared = np.bincount(hits, minlength=len(self._term_counts))
+        dice = 2.0 * shared / (len(query_grams) + self._term_counts)
+        if system is not None:
+            dice[self._term_systems != SYSTEMS.index(system)] = 0.0
+        pool = min(len(dice), max(50, limit * 5))
+        top = np.argpartition(-dice, pool - 1)[:pool]
+        top = top[dice[top] > 0]
+        if top.size == 0:
+            return []
+        scored = dict(zip(top.tolist(), dice[top].tolist()))
+
+        placeholders = ", ".join("?" * len(scored))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, system, code, term, normalized, description FROM terms WHERE id IN ({placeholders})",
+                tuple(scored)
+            ).fetchall()
+
+        best: Dict[Tuple[str, str], TerminologyMatch] = {}
+        for term_id, term_system, code, term, term_normalized, description in rows:
+            score = scored[term_id]
+            # Edit distance rescues typos that break several trigrams of a
+            # short name; longer descriptions keep enough trigrams intact
+            if len(normalized) <= _EDIT_DISTANCE_MAX_CHARS and len(term_normalized) <= _EDIT_DISTANCE_MAX_CHARS:
+                longest = max(len(normalized), len(term_normalized))
+                score = max(score, 1.0 - edit_distance(normalized, term_normalized) / longest)
+            key = (term_system, code)
+            if score >= min_score and (key not in best or score > best[key].score):
+                best[key] = TerminologyMatch(term_system, code, term, description, round(score, 4))
+
+        return sorted(best.values(), key=lambda m: (-m.score, m.code))[:limit]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Term and code counts per system."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT system, COUNT(*), COUNT(DISTINCT code) FROM terms GROUP BY system"
+            ).fetchall()
+        return {
+            "trigrams": len(self._trigram_ids),
+            **{f"{system}_terms": terms for system, terms, _ in rows},
+            **{f"{system}_codes": codes for system, _, codes in rows},
+        }
+
+    def close(self) -> None:
+        """Close the SQLite connection and release the memory maps."""
+        with self._lock:
+            self._conn.close()
+            self._offsets = self._postings = self._term_counts = self._term_systems = None
+
+
+# Global instance with thread-safe initialization
+_terminology_index: Optional[TerminologyIndex] = None
+_terminology_index_initialized = False
+_terminology_index_lock = threading.Lock()
+_terminology_build_thread: Optional[threading.Thread] = None
+# Bumped by reset so a build started before it cannot install a stale index
+_terminology_generation = 0
+
+
+def _index_sources() -> Optional[Tuple[Path, Optional[str], Optional[str]]]:
+    """Index directory and configured release files, or None if not configured."""
+    try:
+        from settings.settings_manager import settings_manager
+        terminology_settings = settings_manager.get("terminology", {}) or {}
+    except Exception:
+        terminology_settings = {}
+
+    icd10cm_path = terminology_settings.get("icd10cm_path") or None
+    rxnorm_path = terminology_settings.get("rxnorm_path") or None
+    if not terminology_settings.get("enabled", True) or not (icd10cm_path or rxnorm_path):
+        return None
+
+    try:
+        from managers.data_folder_manager import data_folder_manager
+        return data_folder_manager.data_folder / "terminology", icd10cm_path, rxnorm_path
+    except Exception as e:
+        logger.warning(f"Terminology index disabled: {e}")
+        return None
+
+
+def _build_in_background(directory: Path, icd10cm_path: Optional[str], rxnorm_path: Optional[str]) -> None:
+    """Build the index on a daemon thread and install it when done."""
+    global _terminology_build_thread
+    generation = _terminology_generation
+
+    def _build():
+        global _terminology_index
+        try:
+            logger.info("Building terminology index from release files")
+            index = TerminologyIndex.build(directory, icd10cm_path=icd10cm_path, rxnorm_path=rxnorm_path)
+        except (OSError, sqlite3.Error, ValueError) as e:
+            logger.warning(f"Terminology index unavailable: {e}")
+            return
+        with _terminology_index_lock:
+            if generation == _terminology_generation:
+                _terminology_index = index
+                return
+        index.close()
+
+    _terminology_build_thread = threading.Thread(target=_build, daemon=True, name="terminology-build")
+    _terminology_build_thread.start()
+
+
+def _create_from_settings() -> Optional[TerminologyIndex]:
+    """Open the shared index, or start rebuilding it if the configured files changed.
+
+    Called with the lock held. Returns None while a rebuild is running.
+    """
+    sources = _index_sources()
+    if sources is None:
+        return None
+    directory, icd10cm_path, rxnorm_path = sources
+
+    wanted = _source_fingerprint({ICD10CM: icd10cm_path, RXNORM: rxnorm_path})
+    try:
+        index = TerminologyIndex(directory)
+        if index.sources == wanted and index.format_version == _FORMAT_VERSION:
+            return index
+        index.close()
+    except (FileNotFoundError, sqlite3.Error, KeyError, ValueError, OSError):
+        pass
+
+    _build_in_background(directory, icd10cm_path, rxnorm_path)
+    return None
+
+
+def get_terminology_index() -> Optional[TerminologyIndex]:
+    """Get the process-wide TerminologyIndex, or None if not available yet.
+
+    Never builds on the calling thread: a missing or outdated index is
+    rebuilt on a background thread (a few seconds for full release files)
+    and this returns None until it is ready. Call it once at startup to
+    get the build going early.
+
+    Thread-safe implementation using double-checked locking pattern.
+    """
+    global _terminology_index, _terminology_index_initialized
+    if not _terminology_index_initialized:
+        with _terminology_index_lock:
+            if not _terminology_index_initialized:
+                _terminology_index = _create_from_settings()
+                _terminology_index_initialized = True
+    return _terminology_index
+
+
+def reset_terminology_index() -> None:
+    """Close and forget the shared index (settings changes, tests)."""
+    global _terminology_index, _terminology_index_initialized, _terminology_generation
+    with _terminology_index_lock:
+        if _terminology_index is not None:
+            _terminology_index.close()
+        _terminology_index = None
+        _terminology_index_initialized = False
+        _terminology_generation += 1
+
+
+__all__ = [
+    "ICD10CM",
+    "RXNORM",
+    "TerminologyIndex",
+    "TerminologyMatch",
+    "TerminologyTerm",
+    "format_icd10_code",
+    "get_terminology_index",
+    "iter_icd10cm_file",
+    "iter_rxnconso_file",
+    "normalize_term",
+    "reset_terminology_index",
+]
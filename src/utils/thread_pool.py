@@ -33,6 +33,7 @@ from typing import Optional, Callable, Any, TypeVar
 from functools import wraps
 
 from utils.structured_logging import get_logger
+from utils.tracing import propagate
 
 logger = get_logger(__name__)
 
@@ -95,7 +96,8 @@ class ThreadPoolManager:
             Future representing the pending result
         """
         executor = cls.get_executor()
-        future = executor.submit(fn, *args, **kwargs)
+        # Carry the caller's tracing span over to the worker thread
+        future = executor.submit(propagate(fn), *args, **kwargs)
         logger.debug(f"Submitted task: {fn.__name__}")
         return future
 
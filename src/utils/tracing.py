@@ -0,0 +1,382 @@
+"""
+Pipeline Tracing
+
+Lightweight in-process tracing for the recording pipeline. Spans form a
+tree per recording (queue wait, STT, SOAP/referral/letter generation,
+database writes, RAG retrieval) and every finished span is folded into a
+latency histogram keyed by stage and provider, so p50/p95/p99 are
+available without keeping every sample.
+
+The current span lives in a ContextVar, so nesting works across async
+code; ThreadPoolManager.submit wraps tasks with propagate() so spans
+opened on a pool thread attach to the span that submitted them.
+
+Finished spans are kept in a bounded ring and can be exported in the
+Chrome Trace Event format, which chrome://tracing and Perfetto open.
+
+Set MEDICAL_ASSISTANT_TRACING=0 to disable recording.
+
+Usage:
+    from utils.tracing import get_tracer
+
+    tracer = get_tracer()
+    with tracer.span("transcribe", provider="deepgram") as span:
+        text = provider.transcribe(audio)
+        span.set_attribute("chars", len(text))
+
+    for stats in tracer.summary():
+        print(stats.stage, stats.provider, stats.p95_ms)
+
+    tracer.export_chrome_trace("pipeline_trace.json")
+"""
+
+import bisect
+import contextvars
+import functools
+import itertools
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from utils.structured_logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+# Upper bounds (ms) of the histogram buckets; the last bucket is open-ended
+BUCKET_BOUNDS_MS = (
+    1, 2, 5, 10, 20, 50, 100, 200, 500,
+    1_000, 2_000, 5_000, 10_000, 20_000, 60_000, float("inf"),
+)
+
+# Finished spans kept for export
+DEFAULT_MAX_SPANS = 10_000
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "medical_assistant_span", default=None
+)
+_span_ids = itertools.count(1)
+
+
+def _tracing_enabled() -> bool:
+    value = os.environ.get("MEDICAL_ASSISTANT_TRACING", "1").strip().lower()
+    return value not in ("0", "false", "off", "no")
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start: float  # time.perf_counter() seconds
+    end: Optional[float] = None
+    thread_id: int = 0
+    thread_name: str = ""
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end if self.end is not None else time.perf_counter()
+        return (end - self.start) * 1000
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, error: Any) -> None:
+        """Mark the span as failed."""
+        self.status = "error"
+        self.attributes["error"] = str(error)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with approximate percentiles."""
+
+    def __init__(self, bounds: tuple = BUCKET_BOUNDS_MS):
+        self.bounds = bounds
+        self.buckets = [0] * len(bounds)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.min_ms = float("inf")
+        self.max_ms = 0.0
+
+    def record(self, duration_ms: float, error: bool = False) -> None:
+        self.buckets[bisect.bisect_left(self.bounds, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.min_ms = min(self.min_ms, duration_ms)
+        self.max_ms = max(self.max_ms, duration_ms)
+        if error:
+            self.errors += 1
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Approximate q-th percentile (0-100), interpolated within a bucket."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.buckets):
+            if not bucket_count or seen + bucket_count < rank:
+                seen += bucket_count
+                continue
+            lower = max(self.bounds[i - 1] if i else 0.0, self.min_ms)
+            upper = min(self.bounds[i], self.max_ms)
+            fraction = (rank - seen) / bucket_count
+            return lower + (upper - lower) * max(0.0, min(1.0, fraction))
+        return self.max_ms
+
+
+@dataclass
+class StageStats:
+    """Latency summary for one stage/provider pair."""
+    stage: str
+    provider: Optional[str]
+    count: int
+    errors: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class Tracer:
+    """Records spans and aggregates them into per-stage histograms."""
+
+    def __init__(self, max_spans: int = DEFAULT_MAX_SPANS, enabled: Optional[bool] = None):
+        self.enabled = _tracing_enabled() if enabled is None else enabled
+        self._lock = threading.Lock()
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+        self._histograms: dict[tuple[str, Optional[str]], LatencyHistogram] = {}
+        # Offset from perf_counter() to wall-clock time, for exported timestamps
+        self._epoch = time.time() - time.perf_counter()
+
+    def _new_span(self, name: str, parent: Optional[Span], start: float, attributes: dict) -> Span:
+        span_id = format(next(_span_ids), "x")
+        thread = threading.current_thread()
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent else span_id,
+            span_id=span_id,
+            parent_id=parent.span_id if parent else None,
+            start=start,
+            thread_id=thread.ident or 0,
+            thread_name=thread.name,
+            attributes=attributes,
+        )
+
+    def _finish(self, span: Span) -> None:
+        key = (span.name, span.attributes.get("provider"))
+        with self._lock:
+            self._spans.append(span)
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(span.duration_ms, span.status == "error")
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        parent: Optional[Span] = None,
+        start: Optional[float] = None,
+        **attributes,
+    ) -> Iterator[Span]:
+        """Time the enclosed block as a child of the current span.
+
+        Args:
+            name: Stage name, the histogram key together with a
+                ``provider`` attribute if given
+            parent: Parent span (defaults to the current span)
+            start: perf_counter() start time if the stage began earlier,
+                e.g. when the recording was queued
+            **attributes: Attributes attached to the span
+
+        Yields:
+            The open span; exceptions raised in the block mark it failed
+        """
+        span = self._new_span(
+            name, parent or _current_span.get(),
+            time.perf_counter() if start is None else start, attributes,
+        )
+        if not self.enabled:
+            yield span
+            return
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end = time.perf_counter()
+            self._finish(span)
+
+    def record_span(
+        self,
+        name: str,
+        start: float,
+        end: Optional[float] = None,
+        parent: Optional[Span] = None,
+        **attributes,
+    ) -> Optional[Span]:
+        """Record an already elapsed interval, such as time spent queued.
+
+        Args:
+            name: Stage name
+            start: perf_counter() start time
+            end: perf_counter() end time (defaults to now)
+            parent: Parent span (defaults to the current span)
+            **attributes: Attributes attached to the span
+
+        Returns:
+            The recorded span, or None when tracing is disabled
+        """
+        if not self.enabled:
+            return None
+        span = self._new_span(name, parent or _current_span.get(), start, attributes)
+        span.end = time.perf_counter() if end is None else end
+        self._finish(span)
+        return span
+
+    def spans(self) -> list[Span]:
+        """Snapshot of the finished spans, oldest first."""
+        with self._lock:
+            return list(self._spans)
+
+    def histogram(self, stage: str, provider: Optional[str] = None) -> Optional[LatencyHistogram]:
+        with self._lock:
+            return self._histograms.get((stage, provider))
+
+    def summary(self) -> list[StageStats]:
+        """Latency statistics per stage and provider, sorted by stage."""
+        with self._lock:
+            items = sorted(self._histograms.items(), key=lambda kv: (kv[0][0], kv[0][1] or ""))
+            return [
+                StageStats(
+                    stage=stage,
+                    provider=provider,
+                    count=h.count,
+                    errors=h.errors,
+                    mean_ms=h.mean_ms,
+                    p50_ms=h.percentile(50),
+                    p95_ms=h.percentile(95),
+                    p99_ms=h.percentile(99),
+                    max_ms=h.max_ms,
+                )
+                for (stage, provider), h in items
+            ]
+
+    def to_chrome_trace(self) -> dict:
+        """Finished spans as a Chrome Trace Event Format document."""
+        pid = os.getpid()
+        events = []
+        threads = {}
+        for span in self.spans():
+            threads[span.thread_id] = span.thread_name
+            args = {key: value if isinstance(value, (int, float, bool)) else str(value)
+                    for key, value in span.attributes.items()}
+            args.update(trace_id=span.trace_id, span_id=span.span_id,
+                        parent_id=span.parent_id, status=span.status)
+            events.append({
+                "name": span.name,
+                "cat": span.attributes.get("provider") or "pipeline",
+                "ph": "X",
+                "ts": round((self._epoch + span.start) * 1e6, 3),
+                "dur": round(span.duration_ms * 1000, 3),
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": args,
+            })
+        for thread_id, thread_name in threads.items():
+            events.append({
+                "name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id,
+                "args": {"name": thread_name},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> int:
+        """Write the finished spans to path as Chrome trace JSON.
+
+        The file is written atomically so a viewer never sees a partial
+        trace.
+
+        Returns:
+            Number of spans written
+        """
+        document = self.to_chrome_trace()
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(document, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        count = sum(1 for event in document["traceEvents"] if event["ph"] == "X")
+        logger.info(f"Exported {count} spans to {path}")
+        return count
+
+    def reset(self) -> None:
+        """Discard finished spans and histograms."""
+        with self._lock:
+            self._spans.clear()
+            self._histograms.clear()
+
+
+def current_span() -> Optional[Span]:
+    """The span active in the calling context, if any."""
+    return _current_span.get()
+
+
+def propagate(fn: Callable[..., T]) -> Callable[..., T]:
+    """Bind fn to a copy of the caller's context for running on another thread.
+
+    Spans opened inside fn become children of the span that was current
+    when propagate() was called.
+    """
+    context = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def run(*args, **kwargs) -> T:
+        return context.run(fn, *args, **kwargs)
+    return run
+
+
+# Global tracer instance
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Get the global tracer instance."""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = Tracer()
+    return _tracer
+
+
+def reset_tracer() -> None:
+    """Reset the global tracer (for testing)."""
+    global _tracer
+    with _tracer_lock:
+        _tracer = None
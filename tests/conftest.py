@@ -217,6 +217,32 @@ def cleanup_audio_handler_class_state():
         pass
 
 
+# Process-wide singletons reset around every test, as (module, reset function).
+# Only modules a test has already imported are touched, so registering one here
+# never drags its dependencies into unrelated tests.
+_SHARED_SINGLETON_RESETS = (
+    ('ai.response_cache', 'reset_response_cache'),
+    ('rag.query_cache', 'reset_query_cache'),
+    ('rag.drug_interactions', 'reset_drug_interaction_kb'),
+)
+
+
+def _reset_shared_singletons():
+    """Reset every registered singleton whose module is loaded."""
+    for module_name, reset_name in _SHARED_SINGLETON_RESETS:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            getattr(module, reset_name)()
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_singletons():
+    """Reset process-wide caches so tests don't share entries."""
+    _reset_shared_singletons()
+    yield
+    _reset_shared_singletons()
+
+
 def _cleanup_ttkbootstrap_state():
     """Helper to clean up ttkbootstrap cached state."""
     # Reset ttkbootstrap Publisher subscriptions
@@ -543,6 +569,14 @@ def mock_text_widget():
 
 
 # Pytest hooks
+def pytest_addoption(parser):
+    """Register command line options."""
+    parser.addoption(
+        "--run-benchmarks", action="store_true", default=False,
+        help="run timing benchmarks (also enabled by RUN_BENCHMARKS=1)"
+    )
+
+
 def pytest_configure(config):
     """Configure pytest with custom markers."""
     config.addinivalue_line(
@@ -560,11 +594,21 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "network: marks tests that require network access"
     )
+    config.addinivalue_line(
+        "markers", "benchmark: marks timing benchmarks (skipped unless --run-benchmarks)"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers based on test location."""
+    run_benchmarks = (config.getoption("--run-benchmarks")
+                      or os.environ.get("RUN_BENCHMARKS") == "1")
+    skip_benchmark = pytest.mark.skip(reason="benchmark: use --run-benchmarks to run")
     for item in items:
+        # Timing benchmarks are opt-in: wall-clock assertions are noisy on shared runners
+        if not run_benchmarks and "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
         # Add markers based on test file location
         if "integration" in str(item.fspath):
             item.add_marker(pytest.mark.integration)
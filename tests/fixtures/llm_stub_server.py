@@ -0,0 +1,106 @@
+"""Local OpenAI-compatible HTTP server for provider tests and benchmarks.
+
+Answers POST /v1/chat/completions after a fixed delay, echoing the last user
+message. Requests with ``"stream": true`` get a server-sent-events response
+split into word chunks.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+
+
+def _completion(model: str, text: str) -> dict:
+    return {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": text},
+            "finish_reason": "stop",
+        }],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+    }
+
+
+def _chunk(model: str, text: str) -> dict:
+    return {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": {"content": text}, "finish_reason": None}],
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(self.server.delay)
+        model = body.get("model", "stub")
+        reply = f"echo: {body['messages'][-1]['content']}"
+
+        if body.get("stream"):
+            payload = "".join(
+                f"data: {json.dumps(_chunk(model, word + ' '))}\n\n" for word in reply.split()
+            ) + "data: [DONE]\n\n"
+            data = payload.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+        else:
+            data = json.dumps(_completion(model, reply)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+def start_stub_server(delay: float = 0.0) -> Tuple[ThreadingHTTPServer, str]:
+    """Start the stub server on a free port.
+
+    Returns:
+        (server, base_url); call server.shutdown() when done
+    """
+    server = _StubServer(("127.0.0.1", 0), _Handler)
+    server.delay = delay
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+def spawn_stub_server(delay: float = 0.0):
+    """Run the stub server in a child process so it does not share the GIL.
+
+    Returns:
+        (process, base_url); terminate the process when done
+    """
+    import subprocess
+    import sys
+
+    process = subprocess.Popen(
+        [sys.executable, __file__, str(delay)],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    return process, process.stdout.readline().strip()
+
+
+if __name__ == "__main__":
+    import sys
+
+    server, url = start_stub_server(float(sys.argv[1]) if len(sys.argv) > 1 else 0.0)
+    print(url, flush=True)
+    threading.Event().wait()
@@ -0,0 +1,67 @@
+"""Minimal stdio MCP server used by the MCP transport tests.
+
+Speaks line-delimited JSON-RPC 2.0 and supports batch arrays. tools/call
+requests are handled on worker threads (so pipelined requests overlap) and
+sleep for ``arguments["delay"]`` seconds before echoing their arguments.
+"""
+import json
+import sys
+import threading
+import time
+
+_write_lock = threading.Lock()
+
+TOOLS = [
+    {"name": "echo", "description": "Echo arguments back", "inputSchema": {"type": "object"}},
+]
+
+
+def _send(message):
+    with _write_lock:
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+
+
+def _handle(request):
+    method = request.get("method")
+    params = request.get("params", {})
+    if method == "initialize":
+        result = {"protocolVersion": "1.0", "capabilities": {"tools": {}}}
+    elif method == "tools/list":
+        result = {"tools": TOOLS}
+    elif method == "tools/call":
+        arguments = params.get("arguments", {})
+        time.sleep(arguments.get("delay", 0))
+        result = {"content": [{"type": "text", "text": json.dumps(arguments)}]}
+    elif method == "test/add_tool":
+        TOOLS.append({"name": params["name"], "description": "", "inputSchema": {}})
+        _send({"jsonrpc": "2.0", "method": "notifications/tools/list_changed"})
+        result = {}
+    elif method == "test/exit":
+        sys.stdout.flush()
+        sys.exit(3)
+    else:
+        return {"jsonrpc": "2.0", "id": request.get("id"),
+                "error": {"code": -32601, "message": f"Method not found: {method}"}}
+    return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+
+
+def _respond(request):
+    _send(_handle(request))
+
+
+def main():
+    for line in sys.stdin:
+        message = json.loads(line)
+        if isinstance(message, list):
+            _send([_handle(request) for request in message])
+        elif message.get("method") == "tools/call":
+            threading.Thread(target=_respond, args=(message,), daemon=True).start()
+        elif message.get("method") == "test/exit":
+            sys.exit(3)
+        else:
+            _respond(message)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+Unit tests for the agent chain builder and DAG executor.
+
+Tests cover planning (topological order, cycle and join handling),
+concurrent execution of independent nodes, conditional branches, loops
+and memoization of agent-node results.
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ai.agents.chain_builder import ChainBuilder, ChainExecutor
+from ai.agents.models import AgentConfig, AgentResponse, AgentType, ChainNode, ChainNodeType
+
+
+AGENT_DELAY = 0.1
+
+
+class _FakeAgentManager:
+    """Stands in for agent_manager; each task sleeps and echoes its input."""
+
+    def __init__(self):
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        self.config = AgentConfig(name="fake", description="fake", system_prompt="fake")
+
+    def get_agent(self, agent_type):
+        return Mock(config=self.config)
+
+    def execute_agent_task(self, agent_type, task):
+        with self._lock:
+            self.calls.append((agent_type, task))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(AGENT_DELAY)
+        with self._lock:
+            self.active -= 1
+        inputs = ",".join(f"{k}={v}" for k, v in sorted(task.input_data.items()))
+        return AgentResponse(result=f"{agent_type.value}({inputs})")
+
+
+@pytest.fixture
+def agents():
+    fake = _FakeAgentManager()
+    with patch("ai.agents.chain_builder.agent_manager", fake):
+        yield fake
+
+
+def _fan_out_chain():
+    """note -> diagnostic, medication, compliance (independent) -> report."""
+    return (
+        ChainBuilder("review")
+        .add_transformer_node("note", "format_template", input_key="text", output_key="note", template="{}")
+        .add_agent_node("diagnosis", AgentType.DIAGNOSTIC, input_keys=["note"], output_key="dx")
+        .add_agent_node("meds", AgentType.MEDICATION, input_keys=["note"], output_key="meds", depends_on=["note"])
+        .add_agent_node("compliance", AgentType.COMPLIANCE, input_keys=["note"], output_key="cx", depends_on=["note"])
+        .add_aggregator_node("report", ["dx", "meds", "cx"], depends_on=["diagnosis", "meds", "compliance"])
+        .build()
+    )
+
+
+class TestPlanning:
+    """Tests for ChainExecutor.build_plan."""
+
+    def test_plan_is_topological(self):
+        chain = _fan_out_chain()
+        node_map = {n.id: n for n in chain.nodes}
+        names = {n.id: n.name for n in chain.nodes}
+
+        plan = ChainExecutor().build_plan(chain.start_node_id, node_map)
+
+        order = [names[i] for i in plan.order]
+        assert order[0] == "note" and order[-1] == "report"
+        assert {names[p] for p in plan.predecessors[chain.nodes[-1].id]} == {"diagnosis", "meds", "compliance"}
+
+    def test_cycles_are_broken(self):
+        builder = ChainBuilder("cycle").add_transformer_node("a", "extract_field").add_transformer_node("b", "extract_field")
+        builder.connect("b", "a")
+        chain = builder.build()
+
+        plan = ChainExecutor().build_plan(chain.start_node_id, {n.id: n for n in chain.nodes})
+
+        assert len(plan.order) == 2
+        assert plan.successors[chain.nodes[1].id] == []
+
+
+class TestExecution:
+    """Tests for concurrent DAG execution."""
+
+    def test_independent_agents_run_concurrently(self, agents):
+        start = time.perf_counter()
+        context = ChainExecutor(memoize=False).execute_chain(_fan_out_chain(), {"text": "chest pain"})
+        elapsed = time.perf_counter() - start
+
+        assert context.errors == []
+        assert agents.peak == 3
+        assert elapsed < AGENT_DELAY * 2.5
+        assert context.get("report_result").split("\n\n") == [
+            "diagnostic(note=chest pain)",
+            "medication(note=chest pain)",
+            "compliance(note=chest pain)",
+        ]
+        assert len(context.results) == 3
+
+    def test_condition_skips_untaken_branch(self, agents):
+        builder = (
+            ChainBuilder("triage")
+            .add_condition_node("urgent", "severity > 5")
+            .add_agent_node("diagnosis", AgentType.DIAGNOSTIC, output_key="dx", depends_on=[])
+            .add_agent_node("referral", AgentType.REFERRAL, output_key="ref", depends_on=[])
+        )
+        chain = builder.build()
+        condition, diagnosis, referral = chain.nodes
+        condition.config["true_outputs"] = [diagnosis.id]
+        condition.config["false_outputs"] = [referral.id]
+        referral.inputs.append(diagnosis.id)
+        diagnosis.outputs.append(referral.id)
+
+        context = ChainExecutor(memoize=False).execute_chain(chain, {"severity": 8})
+
+        # referral is only activated by the false branch or by diagnosis
+        assert context.get("dx") == "diagnostic()"
+        assert context.get("ref") == "referral()"
+
+        context = ChainExecutor(memoize=False).execute_chain(chain, {"severity": 2})
+        assert context.get("dx") is None
+        assert context.get("ref") == "referral()"
+
+    def test_parallel_outputs_wait_for_branches(self, agents):
+        nodes = [
+            ChainNode(id="p", type=ChainNodeType.PARALLEL, name="p",
+                      config={"parallel_nodes": ["a", "b"]}, outputs=["join"]),
+            ChainNode(id="a", type=ChainNodeType.AGENT, name="a", agent_type=AgentType.DIAGNOSTIC,
+                      config={"output_key": "a"}),
+            ChainNode(id="b", type=ChainNodeType.AGENT, name="b", agent_type=AgentType.MEDICATION,
+                      config={"output_key": "b"}),
+            ChainNode(id="join", type=ChainNodeType.AGGREGATOR, name="join",
+                      config={"input_keys": ["a", "b"], "type": "list", "output_key": "joined"}),
+        ]
+        chain = ChainBuilder("parallel").build().model_copy(update={"nodes": nodes, "start_node_id": "p"})
+
+        context = ChainExecutor(memoize=False).execute_chain(chain, {})
+
+        assert context.get("joined") == ["diagnostic()", "medication()"]
+        assert agents.peak == 2
+
+    def test_loop_iterations_see_previous_outputs(self, agents):
+        nodes = [
+            ChainNode(id="loop", type=ChainNodeType.LOOP, name="loop",
+                      config={"loop_type": "count", "count": 3, "loop_nodes": ["fmt"]}),
+            ChainNode(id="fmt", type=ChainNodeType.TRANSFORMER, name="fmt",
+                      config={"transformer": "format_template", "template": "{acc}{loop_iteration}",
+                              "output_key": "acc"}),
+        ]
+        chain = ChainBuilder("loop").build().model_copy(update={"nodes": nodes, "start_node_id": "loop"})
+
+        context = ChainExecutor().execute_chain(chain, {"acc": ""})
+
+        assert context.get("acc") == "123"
+        assert context.get("loop_iteration") == 3
+
+    def test_failed_node_stops_its_outputs(self, agents):
+        chain = (
+            ChainBuilder("broken")
+            .add_transformer_node("missing", "no_such_transformer")
+            .add_agent_node("diagnosis", AgentType.DIAGNOSTIC)
+            .build()
+        )
+
+        context = ChainExecutor().execute_chain(chain, {})
+
+        assert context.errors == ["Transformer no_such_transformer not found"]
+        assert agents.calls == []
+
+
+class TestMemoization:
+    """Tests for agent-node memoization."""
+
+    def test_results_are_reused_across_runs(self, agents):
+        executor = ChainExecutor()
+        executor.execute_chain(_fan_out_chain(), {"text": "chest pain"})
+        assert len(agents.calls) == 3
+
+        start = time.perf_counter()
+        context = ChainExecutor().execute_chain(_fan_out_chain(), {"text": "chest pain"})
+        assert time.perf_counter() - start < AGENT_DELAY
+        assert len(agents.calls) == 3
+        assert context.results[next(iter(context.results))].result.endswith("(note=chest pain)")
+
+        ChainExecutor().execute_chain(_fan_out_chain(), {"text": "dyspnea"})
+        assert len(agents.calls) == 6
+
+    def test_agent_config_and_opt_out_change_the_key(self, agents):
+        ChainExecutor().execute_chain(_fan_out_chain(), {"text": "chest pain"})
+
+        agents.config = agents.config.model_copy(update={"temperature": 0.1})
+        ChainExecutor().execute_chain(_fan_out_chain(), {"text": "chest pain"})
+        assert len(agents.calls) == 6
+
+        ChainExecutor(memoize=False).execute_chain(_fan_out_chain(), {"text": "chest pain"})
+        assert len(agents.calls) == 9
+
+    def test_failed_responses_are_not_memoized(self, agents):
+        agents.execute_agent_task = Mock(return_value=AgentResponse(result="", success=False, error="boom"))
+        chain = ChainBuilder("one").add_agent_node("diagnosis", AgentType.DIAGNOSTIC).build()
+
+        ChainExecutor().execute_chain(chain, {})
+        ChainExecutor().execute_chain(chain, {})
+
+        assert agents.execute_agent_task.call_count == 2
@@ -0,0 +1,175 @@
+"""
+Unit tests for the asyncio provider layer.
+
+Tests run the async OpenAI path against a local OpenAI-compatible stub
+server and cover routing, the fallback chain, streaming and the
+call_ai_many sync shim.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ai.providers.openai_provider import call_openai_async, call_openai_streaming_async
+from ai.providers.router import call_ai_async, call_ai_many, call_ai_streaming_async
+from tests.fixtures.llm_stub_server import start_stub_server
+from utils.exceptions import AIResult
+from utils.security_decorators import rate_limited, require_api_key
+
+
+def _security_manager():
+    manager = MagicMock()
+    manager.get_api_key.return_value = "sk-test-0123456789abcdefghijklmnop"
+    manager.validate_api_key.return_value = (True, None)
+    manager.check_rate_limit.return_value = (True, None)
+    manager.sanitize_input.side_effect = lambda text, input_type="prompt": text
+    manager.generate_secure_token.return_value = "call-id"
+    return manager
+
+
+@pytest.fixture
+def stub_openai(monkeypatch):
+    """Route the OpenAI SDK to a local stub server with security checks stubbed."""
+    server, base_url = start_stub_server(delay=0.0)
+    monkeypatch.setenv("OPENAI_BASE_URL", base_url)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-0123456789abcdefghijklmnop")
+    manager = _security_manager()
+    with patch('ai.providers.openai_provider.get_security_manager', return_value=manager), \
+         patch('utils.security_decorators.get_security_manager', return_value=manager), \
+         patch('utils.security.get_security_manager', return_value=manager), \
+         patch('settings.settings_manager.settings_manager.get_all', return_value={"ai_provider": "openai"}):
+        yield base_url
+    server.shutdown()
+
+
+class TestOpenAIAsync:
+    """Tests for the async OpenAI provider against the stub server."""
+
+    def test_call_openai_async(self, stub_openai):
+        result = asyncio.run(call_openai_async("gpt-4o", "system", "hello", 0.2))
+
+        assert result.is_success
+        assert result.text == "echo: hello"
+        assert result.usage["total_tokens"] == 15
+
+    def test_streaming_async_delivers_chunks(self, stub_openai):
+        chunks = []
+        result = asyncio.run(
+            call_openai_streaming_async("gpt-4o", "system", "one two three", 0.2, chunks.append)
+        )
+
+        assert result.is_success
+        assert len(chunks) == 4
+        assert "".join(chunks).strip() == "echo: one two three"
+
+
+class TestRouterAsync:
+    """Tests for call_ai_async routing and fallback."""
+
+    def test_routes_to_configured_provider(self, stub_openai):
+        result = asyncio.run(call_ai_async("gpt-4o", "system", "routed", 0.2))
+        assert result.text == "echo: routed"
+
+    def test_fallback_chain(self):
+        failing = AsyncMock(return_value=AIResult.failure("down"))
+        succeeding = AsyncMock(return_value=AIResult.success("from anthropic"))
+        manager = _security_manager()
+
+        with patch('ai.providers.router.call_openai_async', failing), \
+             patch('ai.providers.router.call_anthropic_async', succeeding), \
+             patch('utils.security.get_security_manager', return_value=manager), \
+             patch('settings.settings_manager.settings_manager.get_all', return_value={"ai_provider": "openai"}):
+            result = asyncio.run(call_ai_async("gpt-4o", "system", "prompt", 0.2))
+
+        assert result.text == "from anthropic"
+        failing.assert_awaited_once()
+        succeeding.assert_awaited_once()
+
+    def test_explicit_provider_does_not_fall_back(self):
+        failing = AsyncMock(return_value=AIResult.failure("down"))
+        fallback = AsyncMock(return_value=AIResult.success("unexpected"))
+
+        with patch('ai.providers.router.call_groq_async', failing), \
+             patch('ai.providers.router.call_openai_async', fallback), \
+             patch('settings.settings_manager.settings_manager.get_all', return_value={}):
+            result = asyncio.run(call_ai_async("llama", "system", "prompt", 0.2, provider="groq"))
+
+        assert not result.is_success
+        fallback.assert_not_awaited()
+
+    def test_settings_resolved_off_the_event_loop(self, stub_openai):
+        import threading
+        loop_thread = []
+        settings_thread = []
+
+        def get_all():
+            settings_thread.append(threading.get_ident())
+            return {"ai_provider": "openai"}
+
+        async def run():
+            loop_thread.append(threading.get_ident())
+            return await call_ai_async("gpt-4o", "system", "prompt", 0.2)
+
+        with patch('settings.settings_manager.settings_manager.get_all', side_effect=get_all):
+            result = asyncio.run(run())
+
+        assert result.is_success
+        assert settings_thread and loop_thread[0] not in settings_thread
+
+    def test_streaming_router(self, stub_openai):
+        chunks = []
+        result = asyncio.run(call_ai_streaming_async("gpt-4o", "system", "streamed", 0.2, chunks.append))
+        assert result.is_success
+        assert "".join(chunks).strip() == "echo: streamed"
+
+
+class TestSecurityChecksAsync:
+    """Blocking security checks in the decorators run off the event loop."""
+
+    @pytest.mark.parametrize("decorator", [require_api_key("openai"), rate_limited("openai")])
+    def test_check_does_not_block_loop(self, decorator):
+        import threading
+        import time
+
+        check_threads = []
+
+        def slow_check(*args, **kwargs):
+            check_threads.append(threading.get_ident())
+            time.sleep(0.3)  # e.g. reading and decrypting the key file
+
+        manager = _security_manager()
+        manager.get_api_key.side_effect = lambda provider: slow_check() or "sk-test"
+        manager.check_rate_limit.side_effect = lambda *args: slow_check() or (True, None)
+
+        @decorator
+        async def call():
+            return "done"
+
+        async def run():
+            # A short sleep must finish on time while the check is running
+            heartbeat = asyncio.ensure_future(asyncio.sleep(0.05))
+            start = time.perf_counter()
+            task = asyncio.ensure_future(call())
+            await heartbeat
+            heartbeat_delay = time.perf_counter() - start
+            return await task, heartbeat_delay, threading.get_ident()
+
+        with patch('utils.security_decorators.get_security_manager', return_value=manager):
+            result, heartbeat_delay, loop_thread = asyncio.run(run())
+
+        assert result == "done"
+        assert check_threads and loop_thread not in check_threads
+        assert heartbeat_delay < 0.25
+
+
+class TestSyncShim:
+    """Tests for call_ai_many on the shared event loop."""
+
+    def test_results_in_request_order(self, stub_openai):
+        requests = [
+            {"model": "gpt-4o", "system_message": "system", "prompt": f"p{i}", "temperature": 0.2}
+            for i in range(5)
+        ]
+        results = call_ai_many(requests, max_concurrency=2, timeout=30)
+        assert [r.text for r in results] == [f"echo: p{i}" for i in range(5)]
@@ -0,0 +1,70 @@
+"""Performance tests for the asyncio provider layer against a local stub server."""
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ai.providers.openai_provider import call_openai, call_openai_async
+from tests.fixtures.llm_stub_server import spawn_stub_server
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.benchmark
+
+
+_CALLS = 100
+_STUB_DELAY = 0.2
+# Worker count the thread-based callers typically use for fan-out
+_THREAD_WORKERS = 10
+
+
+@pytest.fixture
+def stub_openai(monkeypatch):
+    process, base_url = spawn_stub_server(delay=_STUB_DELAY)
+    monkeypatch.setenv("OPENAI_BASE_URL", base_url)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-0123456789abcdefghijklmnop")
+    manager = MagicMock()
+    manager.get_api_key.return_value = "sk-test-0123456789abcdefghijklmnop"
+    manager.validate_api_key.return_value = (True, None)
+    manager.check_rate_limit.return_value = (True, None)
+    manager.sanitize_input.side_effect = lambda text, input_type="prompt": text
+    with patch('ai.providers.openai_provider.get_security_manager', return_value=manager), \
+         patch('utils.security_decorators.get_security_manager', return_value=manager):
+        yield
+    process.terminate()
+    process.wait(timeout=5)
+
+
+class TestConcurrentCalls:
+    """One event loop should sustain more in-flight calls than the thread path."""
+
+    def test_async_vs_threads(self, stub_openai):
+        prompts = [f"prompt {i}" for i in range(_CALLS)]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=_THREAD_WORKERS) as pool:
+            thread_results = list(pool.map(
+                lambda p: call_openai("gpt-4o", "system", p, 0.2), prompts
+            ))
+        thread_time = time.perf_counter() - start
+
+        async def run_all():
+            return await asyncio.gather(
+                *(call_openai_async("gpt-4o", "system", p, 0.2) for p in prompts)
+            )
+
+        start = time.perf_counter()
+        async_results = asyncio.run(run_all())
+        async_time = time.perf_counter() - start
+
+        assert all(r.is_success for r in thread_results)
+        assert [r.text for r in async_results] == [f"echo: {p}" for p in prompts]
+        assert async_time < thread_time, (
+            f"Async {async_time:.3f}s vs threads {thread_time:.3f}s"
+        )
+        logger.info(f"{_CALLS} calls ({_STUB_DELAY * 1000:.0f}ms stub latency): "
+                    f"threads[{_THREAD_WORKERS}] {thread_time:.3f}s, "
+                    f"asyncio {async_time:.3f}s ({thread_time / async_time:.1f}x)")
@@ -219,6 +219,46 @@ class TestCacheKeyComputation:
         key2 = test_agent._compute_cache_key("prompt", temperature=0.9)
         assert key1 != key2
 
+    def test_system_prompts_differing_late_have_different_keys(self, test_agent):
+        """Test that the whole system message is part of the key."""
+        shared = "x" * 600
+        key1 = test_agent._compute_cache_key("prompt", system_message=shared + "A")
+        key2 = test_agent._compute_cache_key("prompt", system_message=shared + "B")
+        assert key1 != key2
+
+    def test_default_system_prompt_is_part_of_key(self, test_agent):
+        """Test that the configured system prompt is used when none is passed."""
+        key_default = test_agent._compute_cache_key("prompt")
+        key_explicit = test_agent._compute_cache_key(
+            "prompt", system_message=test_agent.config.system_prompt
+        )
+        test_agent.config.system_prompt = "a different system prompt"
+        assert test_agent._compute_cache_key("prompt") != key_default
+        assert key_default == key_explicit
+
+    def test_different_providers_different_keys(self, test_agent):
+        """Test that the configured provider is part of the key."""
+        test_agent.config.provider = "openai"
+        key1 = test_agent._compute_cache_key("prompt")
+        test_agent.config.provider = "anthropic"
+        key2 = test_agent._compute_cache_key("prompt")
+        assert key1 != key2
+
+    def test_different_max_tokens_different_keys(self, test_agent):
+        """Test that max_tokens from kwargs or config is part of the key."""
+        key1 = test_agent._compute_cache_key("prompt", max_tokens=100)
+        key2 = test_agent._compute_cache_key("prompt", max_tokens=2000)
+        assert key1 != key2
+        test_agent.config.max_tokens = 100
+        assert test_agent._compute_cache_key("prompt") == key1
+
+    def test_other_generation_parameters_are_part_of_key(self, test_agent):
+        """Test that extra call parameters change the key."""
+        key1 = test_agent._compute_cache_key("prompt", top_p=0.5)
+        key2 = test_agent._compute_cache_key("prompt", top_p=0.9)
+        assert key1 != key2
+        assert key1 != test_agent._compute_cache_key("prompt")
+
     def test_cache_key_is_sha256(self, test_agent):
         """Test that cache key is a valid SHA256 hash."""
         key = test_agent._compute_cache_key("prompt")
@@ -252,12 +292,12 @@ class TestResponseCaching:
 
         test_agent._cache_response(key, response)
 
-        # Manually expire the cache entry
-        test_agent._response_cache[key] = (response, time.time() - AGENT_CACHE_TTL_SECONDS - 1)
-
-        cached = test_agent._get_cached_response(key)
+        # Move the clock past the TTL
+        with patch('ai.response_cache.time.time',
+                   return_value=time.time() + AGENT_CACHE_TTL_SECONDS + 1):
+            cached = test_agent._get_cached_response(key)
         assert cached is None
-        assert key not in test_agent._response_cache  # Should be removed
+        assert test_agent._response_cache.size(test_agent._cache_namespace) == 0  # Should be removed
 
     def test_cache_disabled(self, test_agent):
         """Test caching when disabled."""
@@ -267,7 +307,7 @@ class TestResponseCaching:
         result = test_agent._get_cached_response("key")
 
         assert result is None
-        assert len(test_agent._response_cache) == 0
+        assert test_agent._response_cache.size(test_agent._cache_namespace) == 0
 
     def test_cache_eviction_on_max_entries(self, test_agent):
         """Test that old entries are evicted when cache is full."""
@@ -275,7 +315,7 @@ class TestResponseCaching:
         for i in range(MAX_CACHE_ENTRIES + 10):
             test_agent._cache_response(f"key_{i}", f"value_{i}")
 
-        assert len(test_agent._response_cache) <= MAX_CACHE_ENTRIES
+        assert test_agent._response_cache.size(test_agent._cache_namespace) <= MAX_CACHE_ENTRIES
 
     def test_clear_cache(self, test_agent):
         """Test clearing the cache."""
@@ -284,16 +324,16 @@ class TestResponseCaching:
 
         test_agent.clear_cache()
 
-        assert len(test_agent._response_cache) == 0
+        assert test_agent._response_cache.size(test_agent._cache_namespace) == 0
 
     def test_set_cache_enabled(self, test_agent):
         """Test enabling/disabling cache."""
         test_agent._cache_response("key", "value")
-        assert len(test_agent._response_cache) == 1
+        assert test_agent._response_cache.size(test_agent._cache_namespace) == 1
 
         test_agent.set_cache_enabled(False)
         assert test_agent._cache_enabled is False
-        assert len(test_agent._response_cache) == 0
+        assert test_agent._response_cache.size(test_agent._cache_namespace) == 0
 
         test_agent.set_cache_enabled(True)
         assert test_agent._cache_enabled is True
@@ -312,6 +352,29 @@ class TestResponseCaching:
         assert result2 == "AI response"
         assert len(mock_ai_caller.call_history) == 1  # No additional call
 
+    def test_cache_shared_between_instances(self, test_config, mock_ai_caller):
+        """Test that instances of the same agent share cached responses."""
+        mock_ai_caller.default_response = "AI response"
+        first = ConcreteTestAgent(test_config, ai_caller=mock_ai_caller)
+        second = ConcreteTestAgent(test_config, ai_caller=mock_ai_caller)
+
+        first._call_ai_cached("shared prompt")
+        result = second._call_ai_cached("shared prompt")
+
+        assert result == "AI response"
+        assert len(mock_ai_caller.call_history) == 1
+
+    def test_cache_metrics(self, test_agent, mock_ai_caller):
+        """Test that hits and misses are recorded per agent."""
+        mock_ai_caller.default_response = "AI response"
+
+        test_agent._call_ai_cached("metrics prompt")
+        test_agent._call_ai_cached("metrics prompt")
+
+        metrics = test_agent.get_cache_metrics()
+        assert metrics["hits"] == 1
+        assert metrics["misses"] == 1
+
 
 class TestHistoryManagement:
     """Tests for history management methods."""
@@ -0,0 +1,82 @@
+"""Wall time of exporting a month of recordings.
+
+Compares the previous export loop (one get_recording query and one
+synchronous file write per selected row) with BulkExporter, which reads
+ascending-ID batches and renders on a worker pool, for plain text to a
+folder and to a ZIP archive. Plain text is bound by file writes, so the
+fetch is timed separately; Word and PDF gain from the process pool only
+on multi-core machines and are not timed here.
+"""
+import logging
+import os
+import time
+import zipfile
+
+import pytest
+
+from database.database import Database
+from exporters.bulk_exporter import DEST_ZIP, FORMAT_TEXT, BulkExporter
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.benchmark
+
+
+_RECORDINGS = 1500  # ~50 visits a day for a month
+_NOTE = "Subjective:\n" + "Patient reports intermittent headaches. " * 40
+
+
+def _old_export(db, ids, export_dir):
+    """The previous loop in RecordingsDialogManager."""
+    for recording_id in ids:
+        recording = db.get_recording(recording_id)
+        base = f"recording_{recording['id']}_{recording['timestamp']}".replace(":", "-").replace(" ", "_")
+        for key, suffix in (("transcript", "transcript"), ("soap_note", "soap")):
+            if recording.get(key):
+                with open(os.path.join(export_dir, f"{base}_{suffix}.txt"), "w", encoding="utf-8") as f:
+                    f.write(recording[key])
+
+
+def test_month_export(tmp_path):
+    (tmp_path / "db").mkdir()
+    db = Database(str(tmp_path / "db" / "perf.db"))
+    db.create_tables()
+    ids = [db.add_recording(f"rec{i}.mp3", transcript=_NOTE * 2, soap_note=_NOTE) for i in range(_RECORDINGS)]
+
+    start = time.perf_counter()
+    for recording_id in ids:
+        db.get_recording(recording_id)
+    per_row_fetch_s = time.perf_counter() - start
+    start = time.perf_counter()
+    fetched = sum(len(batch) for batch in db.iter_recordings_by_ids(ids))
+    batched_fetch_s = time.perf_counter() - start
+
+    old_dir = tmp_path / "old"
+    old_dir.mkdir()
+    start = time.perf_counter()
+    _old_export(db, ids, str(old_dir))
+    old_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = BulkExporter(db, FORMAT_TEXT).export(ids, str(tmp_path / "new"))
+    new_s = time.perf_counter() - start
+
+    archive = tmp_path / "month.zip"
+    start = time.perf_counter()
+    zipped = BulkExporter(db, FORMAT_TEXT).export(ids, str(archive), DEST_ZIP)
+    zip_s = time.perf_counter() - start
+
+    logger.info(f"{_RECORDINGS} recordings: fetch per-row {per_row_fetch_s * 1000:.0f} ms, "
+                f"batched {batched_fetch_s * 1000:.0f} ms")
+    logger.info(f"{_RECORDINGS} recordings: per-row loop {old_s * 1000:.0f} ms, "
+                f"bulk to folder {new_s * 1000:.0f} ms, bulk to ZIP {zip_s * 1000:.0f} ms "
+                f"({archive.stat().st_size // 1024} KiB)")
+
+    assert result.files == zipped.files == 2 * _RECORDINGS
+    assert len(os.listdir(old_dir)) == len(os.listdir(tmp_path / "new"))
+    with zipfile.ZipFile(archive) as zf:
+        assert len(zf.namelist()) == 2 * _RECORDINGS
+    assert fetched == _RECORDINGS
+    assert batched_fetch_s < per_row_fetch_s
+    # Generous bound: thread hand-off must not make small text exports slower
+    assert new_s < old_s * 2
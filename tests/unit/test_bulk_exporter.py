@@ -0,0 +1,213 @@
+"""
+Unit tests for bulk export of recordings.
+
+Covers batched fetching by ID, each destination (directory, ZIP, FHIR
+Bundle), rendering formats, per-recording failures, progress reporting
+and cancellation.
+"""
+
+import json
+import threading
+import zipfile
+
+import pytest
+
+from database.database import Database
+from exporters import bulk_exporter
+from exporters.bulk_exporter import (
+    DEST_FHIR_BUNDLE,
+    DEST_ZIP,
+    FORMAT_DOCX,
+    FORMAT_FHIR,
+    FORMAT_PDF,
+    FORMAT_TEXT,
+    BulkExporter,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    (tmp_path / "db").mkdir()
+    db = Database(str(tmp_path / "db" / "test.db"))
+    db.create_tables()
+    yield db
+
+
+def _add(db, count, **fields):
+    return [
+        db.add_recording(
+            f"rec{i}.mp3",
+            transcript=f"transcript {i}",
+            soap_note=f"Subjective:\nheadache {i}\nPlan:\nrest",
+            **fields,
+        )
+        for i in range(count)
+    ]
+
+
+class TestIterRecordingsByIds:
+    """Tests for Database.iter_recordings_by_ids."""
+
+    def test_batches_in_id_order_and_skips_unknown(self, db):
+        ids = _add(db, 7)
+
+        batches = list(db.iter_recordings_by_ids(list(reversed(ids)) + [9999, ids[0]], batch_size=3))
+
+        assert [len(b) for b in batches] == [3, 3, 1]
+        assert [r["id"] for b in batches for r in b] == sorted(ids)
+        assert batches[0][0]["transcript"] == "transcript 0"
+
+    def test_empty_selection(self, db):
+        assert list(db.iter_recordings_by_ids([])) == []
+
+
+class TestBulkExporter:
+    """Tests for BulkExporter."""
+
+    def test_text_export_to_directory(self, db, tmp_path):
+        ids = _add(db, 5)
+        db.update_recording(ids[0], letter="Dear colleague")
+        out = tmp_path / "out"
+
+        result = BulkExporter(db, FORMAT_TEXT, max_workers=2, batch_size=2).export(ids, str(out))
+
+        assert (result.exported, result.failed, result.files, result.cancelled) == (5, 0, 11, False)
+        files = sorted(p.name for p in out.iterdir())
+        assert len(files) == 11
+        assert any(name.startswith(f"recording_{ids[0]}_") and name.endswith("_letter.txt") for name in files)
+        soap = next(out.glob(f"recording_{ids[3]}_*_soap.txt"))
+        assert soap.read_text(encoding="utf-8").startswith("Subjective:\nheadache 3")
+
+    def test_zip_export_streams_and_cleans_up(self, db, tmp_path):
+        ids = _add(db, 4)
+        archive = tmp_path / "export.zip"
+
+        result = BulkExporter(db, FORMAT_TEXT).export(ids, str(archive), DEST_ZIP)
+
+        assert result.files == 8
+        with zipfile.ZipFile(archive) as zf:
+            names = zf.namelist()
+            assert len(names) == 8
+            assert zf.read(names[0]).decode("utf-8").startswith("transcript 0")
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["db", "export.zip"]
+
+    def test_fhir_bundle_combines_all_documents(self, db, tmp_path):
+        ids = _add(db, 3)
+        bundle_path = tmp_path / "bundle.json"
+
+        exporter = BulkExporter(db, FORMAT_FHIR, max_workers=3, doctor_name="Dr Smith")
+        result = exporter.export(ids, str(bundle_path), DEST_FHIR_BUNDLE)
+
+        bundle = json.loads(bundle_path.read_text(encoding="utf-8"))
+        assert result.files == 6
+        assert bundle["resourceType"] == "Bundle" and bundle["type"] == "collection"
+        resources = [entry["resource"] for entry in bundle["entry"]]
+        assert sorted(r["resourceType"] for r in resources) == ["Bundle"] * 3 + ["DocumentReference"] * 3
+        assert len({entry["fullUrl"] for entry in bundle["entry"]}) == 6
+        assert len({r["id"] for r in resources}) == 6
+
+    def test_fhir_bundle_requires_fhir_format(self, db, tmp_path):
+        with pytest.raises(ValueError):
+            BulkExporter(db, FORMAT_TEXT).export([], str(tmp_path / "b.json"), DEST_FHIR_BUNDLE)
+
+    @pytest.mark.parametrize("export_format, magic", [(FORMAT_DOCX, b"PK"), (FORMAT_PDF, b"%PDF")])
+    def test_binary_formats(self, db, tmp_path, export_format, magic):
+        pytest.importorskip("docx" if export_format == FORMAT_DOCX else "reportlab")
+        ids = _add(db, 2)
+        db.update_recording(ids[1], referral="Please see this patient")
+        out = tmp_path / "out"
+
+        result = BulkExporter(db, export_format, max_workers=2, clinic_name="Clinic").export(ids, str(out))
+
+        assert (result.exported, result.files) == (2, 5)
+        for path in out.iterdir():
+            assert path.read_bytes().startswith(magic)
+
+    def test_failed_recording_does_not_stop_export(self, db, tmp_path, monkeypatch):
+        ids = _add(db, 4)
+        render = bulk_exporter._render_recording
+
+        def flaky(recording, *args):
+            if recording["id"] == ids[1]:
+                raise OSError("disk full")
+            return render(recording, *args)
+
+        monkeypatch.setattr(bulk_exporter, "_render_recording", flaky)
+        result = BulkExporter(db, FORMAT_TEXT).export(ids, str(tmp_path / "out"))
+
+        assert (result.exported, result.failed) == (3, 1)
+        assert "disk full" in result.errors[0]
+
+    def test_progress_reports_final_totals(self, db, tmp_path):
+        ids = _add(db, 6)
+        reports = []
+
+        BulkExporter(db, FORMAT_TEXT).export(
+            ids, str(tmp_path / "out"), on_progress=lambda p: reports.append((p.done, p.total))
+        )
+
+        assert reports[-1] == (6, 6)
+
+    def test_cancel_discards_zip(self, db, tmp_path, monkeypatch):
+        ids = _add(db, 50)
+        cancel = threading.Event()
+        archive = tmp_path / "export.zip"
+        render = bulk_exporter._render_recording
+
+        def render_then_cancel(recording, *args):
+            if recording["id"] == ids[5]:
+                cancel.set()
+            return render(recording, *args)
+
+        monkeypatch.setattr(bulk_exporter, "_render_recording", render_then_cancel)
+        exporter = BulkExporter(db, FORMAT_TEXT, max_workers=2)
+        result = exporter.export(ids, str(archive), DEST_ZIP, cancel_event=cancel)
+
+        assert result.cancelled
+        assert result.exported < 50
+        assert not archive.exists()
+        assert [p.name for p in tmp_path.iterdir()] == ["db"]
+
+    def test_cancel_counts_files_left_in_directory(self, db, tmp_path, monkeypatch):
+        ids = _add(db, 50)
+        cancel = threading.Event()
+        out = tmp_path / "out"
+        render = bulk_exporter._render_recording
+
+        def render_then_cancel(recording, *args):
+            if recording["id"] == ids[5]:
+                cancel.set()
+            return render(recording, *args)
+
+        monkeypatch.setattr(bulk_exporter, "_render_recording", render_then_cancel)
+        exporter = BulkExporter(db, FORMAT_TEXT, max_workers=4)
+        result = exporter.export(ids, str(out), cancel_event=cancel)
+
+        assert result.cancelled
+        assert 0 < result.exported < 50
+        assert result.files == len(list(out.iterdir()))
+
+    def test_process_pool_failure_falls_back_to_threads(self, db, tmp_path, monkeypatch):
+        pytest.importorskip("reportlab")
+        ids = _add(db, bulk_exporter.PROCESS_MIN_RECORDINGS)
+
+        class BrokenPool:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def submit(self, *args, **kwargs):
+                raise bulk_exporter.BrokenProcessPool("spawn refused")
+
+            def shutdown(self, *args, **kwargs):
+                pass
+
+        monkeypatch.setattr(bulk_exporter, "ProcessPoolExecutor", BrokenPool)
+        monkeypatch.setattr(bulk_exporter.os, "cpu_count", lambda: 4)
+        result = BulkExporter(db, FORMAT_PDF).export(ids, str(tmp_path / "out"))
+
+        assert (result.exported, result.failed) == (len(ids), 0)
+        assert len(list((tmp_path / "out").iterdir())) == 2 * len(ids)
+
+    def test_unknown_format(self, db):
+        with pytest.raises(ValueError):
+            BulkExporter(db, "rtf")
@@ -196,6 +196,94 @@ class TestToolExecution:
         assert results["failing_tool"].error == "Tool failed"
 
 
+class TestParallelToolExecution:
+    """Tests for concurrent execution of independent tool calls."""
+
+    def test_results_preserve_request_order(self, chat_agent, mock_tool_executor):
+        """Test that results come back in request order regardless of finish order."""
+        import time
+        from ai.tools import ToolResult
+
+        delays = {"slow": 0.1, "medium": 0.05, "fast": 0.0}
+
+        def execute(name, args, batch_id=None):
+            time.sleep(delays[name])
+            return ToolResult(success=True, output=name)
+
+        mock_tool_executor.execute_tool.side_effect = execute
+        tool_calls = [ToolCall(tool_name=n, arguments={}) for n in ("slow", "medium", "fast")]
+
+        results = chat_agent._execute_tools(tool_calls)
+
+        assert list(results.keys()) == ["slow", "medium", "fast"]
+        assert [r.output for r in results.values()] == ["slow", "medium", "fast"]
+
+    def test_tools_run_concurrently(self, chat_agent, mock_tool_executor):
+        """Test that total latency is close to the slowest tool, not the sum."""
+        import time
+        from ai.tools import ToolResult
+
+        def execute(name, args, batch_id=None):
+            time.sleep(0.2)
+            return ToolResult(success=True, output=name)
+
+        mock_tool_executor.execute_tool.side_effect = execute
+        tool_calls = [ToolCall(tool_name=f"tool{i}", arguments={}) for i in range(4)]
+
+        start = time.perf_counter()
+        chat_agent._execute_tools(tool_calls)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.6
+
+    def test_agents_share_one_tool_pool(self, chat_agent, mock_ai_caller, mock_tool_executor):
+        """Test that every agent reuses the process-wide pool instead of creating its own."""
+        with patch('ai.agents.chat.tool_registry') as mock_registry:
+            mock_registry.get_all_definitions.return_value = []
+            mock_registry.get_cache_info.return_value = (1, True)
+            other = ChatAgent(tool_executor=mock_tool_executor, ai_caller=mock_ai_caller)
+
+        assert chat_agent._get_tool_pool() is other._get_tool_pool()
+
+    def test_calls_in_batch_share_batch_id(self, chat_agent, mock_tool_executor):
+        """Test that parallel calls are tagged with one batch id."""
+        tool_calls = [ToolCall(tool_name="a", arguments={}), ToolCall(tool_name="b", arguments={})]
+
+        chat_agent._execute_tools(tool_calls)
+
+        batch_ids = {c.args[2] for c in mock_tool_executor.execute_tool.call_args_list}
+        assert len(batch_ids) == 1
+
+    def test_repeated_tool_name_keeps_all_results(self, chat_agent, mock_tool_executor):
+        """Test that two calls to the same tool both appear in the results."""
+        tool_calls = [
+            ToolCall(tool_name="search", arguments={"query": "a"}),
+            ToolCall(tool_name="search", arguments={"query": "b"}),
+        ]
+
+        results = chat_agent._execute_tools(tool_calls)
+
+        assert list(results.keys()) == ["search", "search #2"]
+
+    def test_exception_in_one_tool_does_not_fail_batch(self, chat_agent, mock_tool_executor):
+        """Test that an unexpected error becomes a failed ToolResult."""
+        from ai.tools import ToolResult
+
+        def execute(name, args, batch_id=None):
+            if name == "bad":
+                raise RuntimeError("crashed")
+            return ToolResult(success=True, output=name)
+
+        mock_tool_executor.execute_tool.side_effect = execute
+        tool_calls = [ToolCall(tool_name="good", arguments={}), ToolCall(tool_name="bad", arguments={})]
+
+        results = chat_agent._execute_tools(tool_calls)
+
+        assert results["good"].success is True
+        assert results["bad"].success is False
+        assert "crashed" in results["bad"].error
+
+
 class TestPromptBuilding:
     """Tests for prompt building methods."""
 
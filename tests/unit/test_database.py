@@ -236,6 +236,22 @@ class TestDatabase:
         assert len(temp_db.search_recordings("HEADACHE")) == 1
         assert len(temp_db.search_recordings("HeAdAcHe")) == 1
     
+    def test_document_flags_maintained_on_write(self, temp_db):
+        """Test has_* flags follow the text columns on insert and update."""
+        temp_db.create_tables()
+        temp_db.create_queue_tables()
+
+        rec = temp_db.add_recording("test.mp3", transcript="Patient has cough")
+        row = temp_db.get_recordings_lightweight()[0]
+        assert row['has_transcript'] is True
+        assert row['has_soap'] is False
+
+        temp_db.update_recording(rec, transcript="", soap_note="S: cough")
+        row = temp_db.get_recordings_lightweight()[0]
+        assert row['has_transcript'] is False
+        assert row['has_soap'] is True
+        assert 'transcript' not in row
+    
     def test_search_recordings_no_results(self, temp_db):
         """Test search with no matching results."""
         temp_db.create_tables()
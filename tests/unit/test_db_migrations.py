@@ -338,6 +338,124 @@ class TestSchemaIntegrity(unittest.TestCase):
             self.assertIn(col, columns, f"recordings table should have {col} column")
 
 
+
+class TestDocumentFlagsMigration(unittest.TestCase):
+    """Test migration 19 on a database created before the flag columns."""
+
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute("""
+            CREATE TABLE recordings (
+                id INTEGER PRIMARY KEY,
+                filename TEXT,
+                transcript TEXT,
+                soap_note TEXT,
+                referral TEXT,
+                letter TEXT,
+                timestamp TEXT,
+                processing_status TEXT,
+                patient_name TEXT
+            )
+        """)
+        self.conn.executemany(
+            "INSERT INTO recordings (filename, transcript, soap_note, letter) VALUES (?, ?, ?, ?)",
+            [("a.wav", "text", "", None), ("b.wav", None, "S: ok", "Dear Dr")]
+        )
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_adds_backfills_and_indexes(self):
+        manager = MigrationManager.__new__(MigrationManager)
+        manager.logger = logging.getLogger(__name__)
+        migration = next(m for m in get_migrations() if m.version == 19)
+
+        manager._apply_migration_19(self.conn, migration)
+
+        rows = self.conn.execute(
+            "SELECT has_transcript, has_soap, has_referral, has_letter FROM recordings ORDER BY id"
+        ).fetchall()
+        self.assertEqual(rows, [(1, 0, 0, 0), (0, 1, 0, 1)])
+
+        plan = " ".join(str(row) for row in self.conn.execute("""
+            EXPLAIN QUERY PLAN
+            SELECT id, filename, patient_name, timestamp, duration, processing_status,
+                   has_transcript, has_soap, has_referral, has_letter
+            FROM recordings ORDER BY timestamp DESC LIMIT 50
+        """).fetchall())
+        self.assertIn("COVERING INDEX idx_recordings_list", plan)
+
+    def test_rollback_drops_flag_columns(self):
+        manager = MigrationManager.__new__(MigrationManager)
+        manager.logger = logging.getLogger(__name__)
+        migration = next(m for m in get_migrations() if m.version == 19)
+        manager._apply_migration_19(self.conn, migration)
+
+        self.conn.executescript(migration.down_sql)
+
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(recordings)")}
+        self.assertFalse({'has_transcript', 'has_soap', 'has_referral', 'has_letter'} & columns)
+        self.assertIn('duration', columns)
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM recordings").fetchone()[0], 2)
+
+
+class TestFreshInstall(unittest.TestCase):
+    """Run every migration through MigrationManager against a blank database."""
+
+    def setUp(self):
+        from database.db_pool import ConnectionPool, DatabaseConnectionManager
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "fresh.db")
+        # Bypass the singleton so the manager points at the temporary file
+        self.db_manager = object.__new__(DatabaseConnectionManager)
+        self.db_manager.logger = logging.getLogger(__name__)
+        self.db_manager._pool = ConnectionPool(self.db_path, pool_size=1)
+
+        self.manager = MigrationManager.__new__(MigrationManager)
+        self.manager.logger = logging.getLogger(__name__)
+        self.manager.db_manager = self.db_manager
+        self.manager._migrations = []
+        self.manager._init_migrations_table()
+        for migration in get_migrations():
+            self.manager.register(migration)
+
+    def tearDown(self):
+        self.db_manager.close()
+        self.temp_dir.cleanup()
+
+    def test_all_migrations_apply(self):
+        latest = max(m.version for m in get_migrations())
+
+        self.manager.migrate()
+
+        self.assertEqual(self.manager.get_current_version(), latest)
+        columns = {row[1] for row in self.db_manager.fetchall("PRAGMA table_info(recordings)")}
+        self.assertTrue({'duration', 'processing_status', 'has_soap'} <= columns)
+
+    def test_rollback_restores_previous_search_index(self):
+        self.manager.migrate()
+        self.db_manager.execute(
+            "INSERT INTO recordings (filename, transcript) VALUES ('a.wav', 'persistent cough')"
+        )
+
+        self.manager.rollback(17)
+
+        self.assertEqual(self.manager.get_current_version(), 17)
+        fts_columns = [row[1] for row in self.db_manager.fetchall("PRAGMA table_info(recordings_fts)")]
+        self.assertEqual(fts_columns, ['transcript', 'soap_note', 'referral', 'letter', 'chat'])
+        hits = self.db_manager.fetchall(
+            "SELECT rowid FROM recordings_fts WHERE recordings_fts MATCH 'cough'"
+        )
+        self.assertEqual(len(hits), 1)
+
+        # Migrating forward again rebuilds the ranked index
+        self.manager.migrate()
+        self.assertEqual(
+            self.manager.get_current_version(), max(m.version for m in get_migrations())
+        )
+
+
 if __name__ == '__main__':
     # Set up logging
     logging.basicConfig(level=logging.WARNING)
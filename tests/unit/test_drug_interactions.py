@@ -0,0 +1,221 @@
+"""
+Unit tests for the local drug-interaction knowledge base.
+
+Runs against an in-memory SQLite database built from the real migration
+SQL and covers name normalization, pairwise lookups, dataset import and
+the MedicationAgent interaction check that consults the database first.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from unittest.mock import Mock
+
+import pytest
+
+from ai.agents.medication import MedicationAgent
+from ai.agents.models import AgentTask
+from database.migration_definitions import get_all_migrations
+from rag.drug_interactions import (
+    DrugInteractionKB,
+    interaction_pairs,
+    iter_interaction_dataset,
+    normalize_drug_name,
+)
+
+
+class _CountingDB:
+    """Minimal database manager over one SQLite connection."""
+
+    def __init__(self):
+        self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+        migrations = {m.version: m for m in get_all_migrations()}
+        self.conn.executescript(migrations[7].up_sql)
+        self.conn.executescript(migrations[21].up_sql)
+        self.queries = []
+
+    def fetchone(self, query, params=None):
+        rows = self.fetchall(query, params)
+        return rows[0] if rows else None
+
+    def fetchall(self, query, params=None):
+        self.queries.append(query)
+        return self.conn.execute(query, params or ()).fetchall()
+
+    @contextmanager
+    def transaction(self):
+        yield self.conn
+        self.conn.commit()
+
+
+DATASET = """Drug_A,Drug_B,Level,Description,Management
+Warfarin,Aspirin,Major,Increased bleeding risk,Avoid or monitor INR closely
+Lisinopril,Spironolactone,Moderate,Hyperkalemia,Monitor potassium
+Simvastatin,Amiodarone,Major,Myopathy risk,Limit simvastatin to 20 mg
+Metformin,Lisinopril,Unknown,,
+"""
+
+
+@pytest.fixture
+def db():
+    database = _CountingDB()
+    yield database
+    database.conn.close()
+
+
+@pytest.fixture
+def kb(db, tmp_path):
+    path = tmp_path / "ddinter.csv"
+    path.write_text(DATASET)
+    knowledge_base = DrugInteractionKB(db)
+    assert knowledge_base.import_dataset(str(path)) == 3
+    db.queries.clear()
+    return knowledge_base
+
+
+class TestNormalization:
+    """Tests for drug name normalization and pair expansion."""
+
+    def test_normalize_drug_name(self):
+        assert normalize_drug_name("Warfarin 5mg PO daily") == "warfarin"
+        assert normalize_drug_name("Metoprolol succinate ER 50 mg") == "metoprolol"
+        assert normalize_drug_name("Lipitor (atorvastatin) 20 mg") == "atorvastatin"
+        assert normalize_drug_name("Insulin glargine 20 units") == "insulin glargine"
+        assert normalize_drug_name("Sodium bicarbonate") == "sodium bicarbonate"
+
+    def test_normalize_keeps_leading_digits_and_product_numbers(self):
+        assert normalize_drug_name("5-fluorouracil 500 mg/m2 IV") == "5-fluorouracil"
+        assert normalize_drug_name("5-FU") == "5-fu"
+        assert normalize_drug_name("6-mercaptopurine") == "6-mercaptopurine"
+        assert normalize_drug_name("IV heparin 5000 units") == "heparin"
+        assert normalize_drug_name("Tylenol #3") == "tylenol #3"
+        assert normalize_drug_name("Tylenol 500 mg") == "acetaminophen"
+
+    def test_pairs_never_drop_a_medication(self):
+        assert interaction_pairs(["Warfarin", "Aspirin", "5-fluorouracil"]) == [
+            ("5-fluorouracil", "aspirin"),
+            ("5-fluorouracil", "warfarin"),
+            ("aspirin", "warfarin"),
+        ]
+        assert ("(study drug)", "warfarin") in interaction_pairs(["Warfarin", "(study drug)"])
+
+    def test_pairs_collapse_brand_and_generic(self):
+        assert interaction_pairs(["Coumadin 5mg", "warfarin", "Aspirin 81mg", "Lipitor"]) == [
+            ("aspirin", "atorvastatin"),
+            ("aspirin", "warfarin"),
+            ("atorvastatin", "warfarin"),
+        ]
+
+    def test_dataset_rows_are_normalized_and_filtered(self, tmp_path):
+        path = tmp_path / "ddinter.csv"
+        path.write_text(DATASET)
+
+        rows = list(iter_interaction_dataset(str(path)))
+
+        assert [(r.drug1, r.drug2, r.severity) for r in rows] == [
+            ("aspirin", "warfarin", "major"),
+            ("lisinopril", "spironolactone", "moderate"),
+            ("amiodarone", "simvastatin", "major"),
+        ]
+
+
+class TestKnowledgeBase:
+    """Tests for table lookups and dataset import."""
+
+    def test_check_resolves_known_pairs_in_one_query(self, kb, db):
+        check = kb.check(["Warfarin 5mg", "Aspirin 81mg", "Lisinopril", "Spironolactone 25mg", "Metformin"])
+
+        assert len(db.queries) == 1
+        assert [(i.drug1, i.drug2, i.severity) for i in check.known] == [
+            ("aspirin", "warfarin", "major"),
+            ("lisinopril", "spironolactone", "moderate"),
+        ]
+        assert check.has_major
+        assert check.pair_count == 10
+        assert ("lisinopril", "metformin") in check.unresolved
+
+    def test_lookup_matches_rows_stored_in_either_order(self, kb, db):
+        db.conn.execute(
+            "INSERT INTO drug_interactions (drug1_name, drug2_name, severity) VALUES ('warfarin', 'fluconazole', 'major')"
+        )
+
+        assert kb.lookup([("fluconazole", "warfarin")])[("fluconazole", "warfarin")].severity == "major"
+
+    def test_reimport_replaces_rows_from_same_source(self, kb, db, tmp_path):
+        path = tmp_path / "ddinter.csv"
+        path.write_text("Drug_A,Drug_B,Level\nWarfarin,Aspirin,Moderate\n")
+
+        assert kb.import_dataset(str(path)) == 1
+        assert kb.check(["warfarin", "aspirin"]).known[0].severity == "moderate"
+        assert kb.check(["simvastatin", "amiodarone"]).known == []
+        assert db.conn.execute("SELECT row_count FROM drug_interaction_imports").fetchone() == (1,)
+        assert kb.imported_fingerprint("ddinter.csv") is not None
+
+    def test_migration_rollback_drops_source_column(self, db):
+        migration = {m.version: m for m in get_all_migrations()}[21]
+
+        db.conn.executescript(migration.down_sql)
+
+        columns = {row[1] for row in db.conn.execute("PRAGMA table_info(drug_interactions)")}
+        assert "source" not in columns
+        assert db.conn.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'drug_interaction_imports'"
+        ).fetchone() is None
+
+
+class TestMedicationAgent:
+    """Tests for MedicationAgent interaction checks backed by the database."""
+
+    @staticmethod
+    def _task(*medications, **input_data):
+        return AgentTask(
+            task_description="Check drug interactions",
+            input_data={"medications": list(medications), **input_data},
+        )
+
+    def test_fully_resolved_list_skips_ai(self, kb):
+        agent = MedicationAgent(interaction_kb=kb)
+        agent._call_ai = Mock()
+
+        response = agent.execute(self._task("Warfarin 5mg", "Aspirin 81mg"))
+
+        agent._call_ai.assert_not_called()
+        assert response.success
+        assert "Increased bleeding risk" in response.result
+        assert response.metadata["has_major_interaction"] is True
+        assert response.metadata["unresolved_pair_count"] == 0
+
+    def test_only_unresolved_pairs_go_to_ai(self, kb):
+        agent = MedicationAgent(interaction_kb=kb)
+        agent._call_ai = Mock(return_value="## MODERATE PRIORITY INTERACTIONS\nNone identified.")
+
+        response = agent.execute(self._task("Warfarin", "Aspirin", "Metformin 500mg"))
+        agent.execute(self._task("Warfarin", "Aspirin", "Metformin 500mg"))
+
+        assert agent._call_ai.call_count == 1  # repeat check served from the response cache
+        assert "Medication list: Warfarin, Aspirin, Metformin 500mg" in agent._call_ai.call_args[0][0]
+        pairs_section = agent._call_ai.call_args[0][0].split("Check ONLY the following medication pairs")[1]
+        assert "- aspirin + metformin" in pairs_section
+        assert "- metformin + warfarin" in pairs_section
+        assert "- aspirin + warfarin" not in pairs_section
+        assert "Increased bleeding risk" in response.result
+        assert response.metadata["unresolved_pair_count"] == 2
+
+    def test_unnormalized_name_sends_full_list_to_ai(self, kb):
+        agent = MedicationAgent(interaction_kb=kb)
+        agent._call_ai = Mock(return_value="None identified.")
+
+        response = agent.execute(self._task("Warfarin", "Aspirin", "(study drug)"))
+
+        prompt = agent._call_ai.call_args[0][0]
+        assert "Check for drug-drug interactions between the following medications" in prompt
+        assert "- (study drug)" in prompt
+        assert "Increased bleeding risk" in response.result
+
+    def test_unknown_pairs_use_full_prompt(self, kb):
+        agent = MedicationAgent(interaction_kb=kb)
+        agent._call_ai = Mock(return_value="None identified.")
+
+        response = agent.execute(self._task("Metformin", "Atorvastatin"))
+
+        assert "Check for drug-drug interactions between the following medications" in agent._call_ai.call_args[0][0]
+        assert response.metadata["known_interactions"] == []
@@ -0,0 +1,159 @@
+"""
+Unit tests for the content-addressed extraction cache.
+
+Tests cover file hashing, encrypted round trips, LRU eviction and
+DocumentProcessor reuse of cached extractions.
+"""
+
+import hashlib
+from unittest.mock import patch
+
+import pytest
+
+from rag.document_processor import DocumentProcessor
+from rag.extraction_cache import ExtractionCache, forget_extraction, hash_file
+from rag.models import DocumentMetadata
+
+
+class XorCipher:
+    """Reversible stand-in for the key storage cipher."""
+
+    def encrypt_data(self, data: bytes) -> bytes:
+        return bytes(b ^ 0x5A for b in data)
+
+    def decrypt_data(self, token: bytes) -> bytes:
+        return bytes(b ^ 0x5A for b in token)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    store = ExtractionCache(tmp_path / "extraction.db", cipher=XorCipher(), max_entries=3)
+    yield store
+    store.close()
+
+
+class TestHashFile:
+
+    def test_matches_sha256_of_bytes(self, tmp_path):
+        path = tmp_path / "doc.bin"
+        data = b"x" * (3 * 1024 * 1024 + 17)
+        path.write_bytes(data)
+        assert hash_file(str(path)) == hashlib.sha256(data).hexdigest()
+
+
+class TestExtractionCache:
+
+    def test_round_trip_is_encrypted_at_rest(self, cache, tmp_path):
+        cache.put("abc", "pdf:ocr", "Patient has hypertension", {"title": "Note"}, 3, True)
+
+        entry = cache.get("abc", "pdf:ocr")
+        assert entry.text == "Patient has hypertension"
+        assert entry.metadata == {"title": "Note"}
+        assert (entry.page_count, entry.ocr_used) == (3, True)
+        assert b"hypertension" not in (tmp_path / "extraction.db").read_bytes()
+
+    def test_modes_are_separate(self, cache):
+        cache.put("abc", "pdf:ocr", "with ocr", {}, 1, True)
+        assert cache.get("abc", "pdf:text") is None
+
+    def test_least_recently_used_evicted(self, cache):
+        for key in ("a", "b", "c"):
+            cache.put(key, "pdf:ocr", key, {}, 1, False)
+        cache.get("a", "pdf:ocr")
+        cache.put("d", "pdf:ocr", "d", {}, 1, False)
+
+        assert len(cache) == 3
+        assert cache.get("b", "pdf:ocr") is None
+        assert cache.get("a", "pdf:ocr") is not None
+
+    def test_undecryptable_entry_is_a_miss(self, tmp_path):
+        path = tmp_path / "extraction.db"
+        ExtractionCache(path, cipher=XorCipher()).put("abc", "pdf:ocr", "text", {}, 1, False)
+
+        class RejectingCipher(XorCipher):
+            def decrypt_data(self, token):
+                raise ValueError("wrong key")
+
+        reopened = ExtractionCache(path, cipher=RejectingCipher())
+        assert reopened.get("abc", "pdf:ocr") is None
+        assert len(reopened) == 0
+
+
+class TestDocumentProcessorCache:
+
+    def test_second_extraction_served_from_cache(self, cache, tmp_path, monkeypatch):
+        path = tmp_path / "scan.png"
+        path.write_bytes(b"\x89PNG fake image bytes")
+        processor = DocumentProcessor(extraction_cache=cache)
+        calls = []
+
+        def fake_extract(file_path, enable_ocr):
+            calls.append(file_path)
+            return "OCR text of the scanned letter", DocumentMetadata(title="Scan", keywords=["renal"]), 1, True
+
+        monkeypatch.setattr(processor, "_extract_from_image", fake_extract)
+
+        first = processor.extract_text(str(path))
+        # Same bytes under another name hit the cache too
+        copy = tmp_path / "copy.png"
+        copy.write_bytes(path.read_bytes())
+        second = processor.extract_text(str(copy))
+
+        assert len(calls) == 1
+        assert second[0] == first[0]
+        assert second[1].keywords == ["renal"]
+        assert second[2:] == (1, True)
+
+    def test_ocr_setting_is_part_of_key(self, cache, tmp_path, monkeypatch):
+        path = tmp_path / "scan.png"
+        path.write_bytes(b"image")
+        processor = DocumentProcessor(extraction_cache=cache)
+        monkeypatch.setattr(
+            processor, "_extract_from_image",
+            lambda file_path, enable_ocr: ("ocr text" if enable_ocr else "", DocumentMetadata(), 1, enable_ocr)
+        )
+
+        assert processor.extract_text(str(path), enable_ocr=True)[0] == "ocr text"
+        assert processor.extract_text(str(path), enable_ocr=False)[0] == ""
+
+    def test_ocr_language_is_part_of_key(self, cache, tmp_path, monkeypatch):
+        path = tmp_path / "scan.png"
+        path.write_bytes(b"image")
+        english = DocumentProcessor(extraction_cache=cache, ocr_language="eng")
+        french = DocumentProcessor(extraction_cache=cache, ocr_language="fra")
+        for processor in (english, french):
+            monkeypatch.setattr(
+                processor, "_extract_from_image",
+                lambda file_path, enable_ocr, lang=processor.ocr_language: (
+                    f"{lang} text", DocumentMetadata(), 1, True
+                )
+            )
+
+        assert english.extract_text(str(path))[0] == "eng text"
+        assert french.extract_text(str(path))[0] == "fra text"
+
+    def test_file_hash_recorded_and_forgotten(self, cache, tmp_path, monkeypatch):
+        path = tmp_path / "scan.png"
+        path.write_bytes(b"image")
+        processor = DocumentProcessor(extraction_cache=cache)
+        monkeypatch.setattr(
+            processor, "_extract_from_image",
+            lambda file_path, enable_ocr: ("PHI text", DocumentMetadata(), 1, True)
+        )
+
+        metadata = processor.extract_text(str(path))[1]
+        assert metadata.file_hash == hash_file(str(path))
+        assert processor.extract_text(str(path))[1].file_hash == metadata.file_hash
+
+        with patch("rag.extraction_cache.get_extraction_cache", return_value=cache):
+            forget_extraction(metadata.file_hash)
+        assert len(cache) == 0
+
+    def test_forget_hashes_stored_file_without_recorded_hash(self, cache, tmp_path):
+        path = tmp_path / "scan.png"
+        path.write_bytes(b"image")
+        cache.put(hash_file(str(path)), "png:text", "text", {}, 1, False)
+
+        with patch("rag.extraction_cache.get_extraction_cache", return_value=cache):
+            forget_extraction(None, str(path))
+        assert len(cache) == 0
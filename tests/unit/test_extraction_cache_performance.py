@@ -0,0 +1,48 @@
+"""Performance tests for re-ingesting a scanned PDF through the extraction cache."""
+import logging
+import time
+
+import pytest
+
+pytest.importorskip("pdfplumber")
+pytest.importorskip("reportlab")
+
+from rag.document_processor import DocumentProcessor
+from rag.extraction_cache import ExtractionCache
+from tests.unit.test_pdf_page_extractor import make_pdf
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.benchmark
+
+
+_SCANNED_PAGES = 20
+_OCR_LATENCY = 0.05
+
+
+def test_reingest_skips_ocr(tmp_path, monkeypatch):
+    pdf = make_pdf(tmp_path / "scanned.pdf", [None] * _SCANNED_PAGES)
+    processor = DocumentProcessor(extraction_cache=ExtractionCache(tmp_path / "cache.db"))
+    processor._page_extractor.render_resolution = 36
+    ocr_calls = []
+
+    def slow_ocr(image):
+        ocr_calls.append(1)
+        time.sleep(_OCR_LATENCY)
+        return "Recognised text from a scanned guideline page"
+
+    monkeypatch.setattr(processor, "_ocr_pil_image", slow_ocr)
+
+    start = time.perf_counter()
+    first = processor.extract_text(pdf)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    second = processor.extract_text(pdf)
+    warm = time.perf_counter() - start
+
+    assert second[0] == first[0]
+    assert len(ocr_calls) == _SCANNED_PAGES
+    assert warm < cold / 10
+    logger.info(f"{_SCANNED_PAGES}-page scanned PDF: first extraction {cold * 1000:.0f}ms, "
+                f"re-ingest from cache {warm * 1000:.1f}ms ({cold / warm:.0f}x)")
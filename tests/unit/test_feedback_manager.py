@@ -0,0 +1,162 @@
+"""
+Unit tests for RAGFeedbackManager boost lookups.
+
+Runs against an in-memory SQLite database built from the real migration
+SQL, wrapped in the execute/fetchone/fetchall surface of the app's
+database manager so queries can be counted.
+"""
+
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from database.migration_definitions import get_all_migrations
+from rag.feedback_manager import FeedbackType, RAGFeedbackManager
+
+
+class _CountingDB:
+    """Minimal database manager over one SQLite connection."""
+
+    def __init__(self):
+        self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+        migrations = {m.version: m for m in get_all_migrations()}
+        self.conn.executescript(migrations[16].up_sql)
+        self.conn.executescript(migrations[20].up_sql)
+        self.queries = []
+
+    def execute(self, query, params=None):
+        self.queries.append(query)
+        cursor = self.conn.execute(query, params or ())
+        self.conn.commit()
+        return cursor
+
+    def fetchone(self, query, params=None):
+        return self.execute(query, params).fetchone()
+
+    def fetchall(self, query, params=None):
+        return self.execute(query, params).fetchall()
+
+
+@pytest.fixture
+def db():
+    database = _CountingDB()
+    yield database
+    database.conn.close()
+
+
+def _vote(manager, document_id, chunk_index, feedback_type, session="s1"):
+    assert manager.record_feedback(document_id, chunk_index, feedback_type, "query", session, 0.5)
+
+
+def _results(*keys):
+    return [SimpleNamespace(document_id=d, chunk_index=c, combined_score=0.5, feedback_boost=0.0) for d, c in keys]
+
+
+class TestBulkBoosts:
+    """Tests for get_boosts and apply_boosts."""
+
+    def test_apply_boosts_uses_one_query(self, db):
+        manager = RAGFeedbackManager(db)
+        for session in ("a", "b", "c"):
+            _vote(manager, "doc-1", 0, FeedbackType.UPVOTE, session)
+            _vote(manager, "doc-2", 3, FeedbackType.DOWNVOTE, session)
+        db.queries.clear()
+
+        results = manager.apply_boosts(_results(("doc-2", 3), ("doc-3", 0), ("doc-1", 0)))
+
+        assert len(db.queries) == 1
+        assert [(r.document_id, r.chunk_index) for r in results] == [("doc-1", 0), ("doc-3", 0), ("doc-2", 3)]
+        assert results[0].combined_score == pytest.approx(0.5 + RAGFeedbackManager.MAX_BOOST)
+        assert results[1].feedback_boost == 0.0
+
+        # Hits and no-feedback chunks are both cached
+        manager.apply_boosts(_results(("doc-2", 3), ("doc-3", 0)))
+        assert len(db.queries) == 1
+
+    def test_large_result_sets_are_batched(self, db):
+        manager = RAGFeedbackManager(db)
+        _vote(manager, "doc-x", 999, FeedbackType.UPVOTE)
+        db.queries.clear()
+
+        boosts = manager.get_boosts([("doc-x", i) for i in range(1000)])
+
+        assert len(boosts) == 1000
+        assert boosts[("doc-x", 999)].upvotes == 1
+        assert len(db.queries) == -(-1000 // RAGFeedbackManager.BOOST_QUERY_BATCH)
+
+    def test_flags_are_read_from_aggregates(self, db):
+        manager = RAGFeedbackManager(db)
+        _vote(manager, "doc-1", 0, FeedbackType.UPVOTE, "a")
+        _vote(manager, "doc-1", 0, FeedbackType.FLAG, "b")
+        _vote(manager, "doc-1", 0, FeedbackType.FLAG, "c")
+
+        row = db.conn.execute("SELECT flag_count FROM rag_feedback_aggregates").fetchone()
+        assert row == (2,)
+        db.queries.clear()
+        boost = manager.get_boost("doc-1", 0)
+        assert (boost.upvotes, boost.flags) == (1, 2)
+        assert not any("rag_result_feedback" in q for q in db.queries)
+
+    def test_no_database_returns_zero_boosts(self):
+        boost = RAGFeedbackManager().get_boost("doc-1", 0)
+        assert (boost.boost_factor, boost.confidence) == (0.0, 0.0)
+
+
+class TestBoostCache:
+    """Tests for cache bounds and invalidation."""
+
+    def test_feedback_invalidates_other_managers(self, db):
+        reader = RAGFeedbackManager(db)
+        writer = RAGFeedbackManager(db)
+        assert reader.get_boost("doc-1", 0).upvotes == 0
+
+        _vote(writer, "doc-1", 0, FeedbackType.UPVOTE)
+        assert reader.get_boost("doc-1", 0).upvotes == 1
+
+        assert writer.remove_feedback("doc-1", 0, "s1")
+        assert reader.get_boost("doc-1", 0).upvotes == 0
+
+    def test_cache_is_bounded(self, db, monkeypatch):
+        monkeypatch.setattr(RAGFeedbackManager, "MAX_CACHED_BOOSTS", 10)
+        manager = RAGFeedbackManager(db)
+
+        manager.get_boosts([("doc", i) for i in range(25)])
+        assert len(manager._boost_cache) == 10
+        assert ("doc", 24) in manager._boost_cache
+        assert ("doc", 0) not in manager._boost_cache
+
+
+def test_migration_backfills_flag_counts():
+    conn = sqlite3.connect(":memory:")
+    migrations = {m.version: m for m in get_all_migrations()}
+    conn.executescript(migrations[16].up_sql)
+    conn.executemany(
+        "INSERT INTO rag_result_feedback (result_document_id, result_chunk_index, feedback_type) VALUES (?, ?, ?)",
+        [("doc-1", 0, "flag"), ("doc-1", 0, "flag"), ("doc-1", 0, "upvote"), ("doc-1", 1, "flag")]
+    )
+    conn.execute("INSERT INTO rag_feedback_aggregates (document_id, chunk_index, upvote_count) VALUES ('doc-1', 0, 1)")
+
+    conn.executescript(migrations[20].up_sql)
+
+    assert conn.execute("SELECT chunk_index, flag_count FROM rag_feedback_aggregates").fetchall() == [(0, 2)]
+    conn.close()
+
+
+def test_migration_rollback_drops_flag_count():
+    conn = sqlite3.connect(":memory:")
+    migrations = {m.version: m for m in get_all_migrations()}
+    conn.executescript(migrations[16].up_sql)
+    conn.execute("INSERT INTO rag_feedback_aggregates (document_id, chunk_index, upvote_count) VALUES ('doc-1', 0, 1)")
+    conn.executescript(migrations[20].up_sql)
+
+    conn.executescript(migrations[20].down_sql)
+
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(rag_feedback_aggregates)")}
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert "flag_count" not in columns
+    assert "idx_feedback_chunk" not in indexes
+    assert conn.execute("SELECT upvote_count FROM rag_feedback_aggregates").fetchall() == [(1,)]
+    # Re-applying the migration works after a rollback
+    conn.executescript(migrations[20].up_sql)
+    conn.close()
@@ -0,0 +1,73 @@
+"""Viewport queries and level of detail on a large knowledge graph.
+
+Times the spatial grid against scanning every node for a zoomed-in
+viewport, and checks that a zoomed-out view of the whole graph is drawn
+as a bounded number of clusters instead of one item per node.
+"""
+import logging
+import random
+import time
+
+import pytest
+
+from rag.graph_data_provider import EntityType, GraphNode
+from ui.components.graph_spatial_index import MAX_DETAIL_NODES, SpatialGrid
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.benchmark
+
+
+_NODES = 20_000
+_WORLD = 20_000.0
+_QUERIES = 500
+
+
+def _scan(nodes, bounds):
+    min_x, min_y, max_x, max_y = bounds
+    return [n for n in nodes if min_x <= n.x <= max_x and min_y <= n.y <= max_y]
+
+
+def test_viewport_culling_and_clustering():
+    rng = random.Random(42)
+    types = list(EntityType)
+    nodes = [
+        GraphNode(id=str(i), name=str(i), entity_type=rng.choice(types),
+                  x=rng.uniform(0, _WORLD), y=rng.uniform(0, _WORLD))
+        for i in range(_NODES)
+    ]
+
+    start = time.perf_counter()
+    grid = SpatialGrid()
+    grid.rebuild(nodes)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    # 1200x800 canvas at zoom 1.0, panned around the graph
+    viewports = []
+    for _ in range(_QUERIES):
+        x, y = rng.uniform(0, _WORLD - 1200), rng.uniform(0, _WORLD - 800)
+        viewports.append((x, y, x + 1200, y + 800))
+
+    start = time.perf_counter()
+    visible = [grid.query(bounds) for bounds in viewports]
+    grid_us = (time.perf_counter() - start) / _QUERIES * 1e6
+
+    start = time.perf_counter()
+    scanned = [_scan(nodes, bounds) for bounds in viewports[:50]]
+    scan_us = (time.perf_counter() - start) / 50 * 1e6
+
+    # Whole graph in view, as after Fit
+    zoom = 1200 / _WORLD
+    start = time.perf_counter()
+    shown, clusters = grid.level_of_detail((0, 0, _WORLD, _WORLD), zoom)
+    lod_ms = (time.perf_counter() - start) * 1000
+
+    logger.info(f"{_NODES} nodes: grid build {build_ms:.1f} ms, viewport query grid {grid_us:.0f} us "
+                f"vs scan {scan_us:.0f} us; full view {len(shown) + len(clusters)} items "
+                f"({len(clusters)} clusters) in {lod_ms:.1f} ms")
+
+    for found, expected in zip(visible, scanned):
+        assert {n.id for n in found} == {n.id for n in expected}
+    assert len(shown) + len(clusters) <= MAX_DETAIL_NODES
+    assert len(shown) + sum(c.count for c in clusters) == _NODES
+    assert grid_us * 5 < scan_us
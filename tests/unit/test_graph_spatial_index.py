@@ -0,0 +1,262 @@
+"""
+Unit tests for paged knowledge-graph loading and the graph spatial index.
+
+Covers viewport and hit-test queries on SpatialGrid, level-of-detail
+clustering, incremental placement of paged-in nodes, GraphData merging
+and the paged GraphDataProvider queries.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from rag.graph_data_provider import EntityType, GraphData, GraphDataProvider, GraphEdge, GraphNode
+from ui.components.graph_spatial_index import SpatialGrid, place_nodes
+
+
+def _node(node_id, x=0.0, y=0.0, entity_type=EntityType.CONDITION):
+    return GraphNode(id=node_id, name=node_id, entity_type=entity_type, x=x, y=y)
+
+
+def _edge(source, target):
+    return GraphEdge(id=f"{source}-{target}", source_id=source, target_id=target, relationship_type="RELATES_TO")
+
+
+def _grid_of(count, step=10.0):
+    """count x count nodes on a square lattice."""
+    return [_node(f"n{i}_{j}", i * step, j * step) for i in range(count) for j in range(count)]
+
+
+class TestSpatialGrid:
+    """Tests for SpatialGrid."""
+
+    def test_query_returns_nodes_inside_bounds(self):
+        grid = SpatialGrid(cell_size=25)
+        grid.rebuild(_grid_of(10))
+
+        found = {n.id for n in grid.query((0, 0, 20, 15))}
+
+        assert found == {"n0_0", "n0_1", "n1_0", "n1_1", "n2_0", "n2_1"}
+        assert len(grid.query((-1000, -1000, 1000, 1000))) == 100
+
+    def test_move_rebuckets_dragged_node(self):
+        grid = SpatialGrid(cell_size=25)
+        node = _node("a")
+        grid.insert(node)
+
+        node.x, node.y = 500, 500
+        grid.move(node)
+
+        assert grid.query((0, 0, 10, 10)) == []
+        assert grid.query((490, 490, 510, 510)) == [node]
+        grid.remove("a")
+        assert len(grid) == 0
+
+    def test_nearest_respects_radius(self):
+        grid = SpatialGrid(cell_size=25)
+        grid.rebuild([_node("a", 0, 0), _node("b", 30, 0)])
+
+        assert grid.nearest(20, 0, 24).id == "b"
+        assert grid.nearest(15, 40, 24) is None
+
+    def test_few_visible_nodes_are_drawn_individually(self):
+        grid = SpatialGrid()
+        grid.rebuild(_grid_of(10))
+
+        nodes, clusters = grid.level_of_detail((0, 0, 1000, 1000), zoom=1.0, max_nodes=100)
+
+        assert len(nodes) == 100
+        assert clusters == []
+
+    def test_dense_view_collapses_into_clusters(self):
+        grid = SpatialGrid()
+        grid.rebuild(_grid_of(30))
+
+        nodes, clusters = grid.level_of_detail(
+            (0, 0, 1000, 1000), zoom=0.5, max_nodes=100, keep={"n5_5"},
+        )
+
+        assert "n5_5" in {n.id for n in nodes}
+        assert all("n5_5" not in {n.id for n in c.nodes} for c in clusters)
+        assert len(nodes) + sum(c.count for c in clusters) == 900
+        assert len(clusters) < 100
+        assert clusters[0].dominant_type == EntityType.CONDITION
+        for cluster in clusters:
+            assert min(n.x for n in cluster.nodes) <= cluster.x <= max(n.x for n in cluster.nodes)
+
+
+class TestPlaceNodes:
+    """Tests for incremental placement of paged-in nodes."""
+
+    def test_new_nodes_go_next_to_their_neighbours(self):
+        hub = _node("hub", 1000, 1000)
+        other = _node("other", 0, 0)
+        placed = {"hub": hub, "other": other}
+        new = [_node(f"leaf{i}") for i in range(5)]
+
+        place_nodes(new, [_edge("hub", n.id) for n in new], placed, spacing=50)
+
+        assert (hub.x, hub.y) == (1000, 1000)  # existing positions untouched
+        positions = {(round(n.x), round(n.y)) for n in new}
+        assert len(positions) == 5
+        for node in new:
+            assert 40 <= ((node.x - 1000) ** 2 + (node.y - 1000) ** 2) ** 0.5 <= 150
+            assert placed[node.id] is node
+
+    def test_unconnected_nodes_go_outside_the_graph(self):
+        placed = {"a": _node("a", 0, 0), "b": _node("b", 100, 0)}
+        orphan = _node("orphan")
+
+        place_nodes([orphan], [], placed, spacing=50)
+
+        assert ((orphan.x - 50) ** 2 + orphan.y ** 2) ** 0.5 > 50
+
+
+class TestGraphDataMerge:
+    """Tests for merging graph pages."""
+
+    def test_merge_returns_only_new_items(self):
+        data = GraphData(nodes=[_node("a"), _node("b")], edges=[_edge("a", "b")])
+        page = GraphData(nodes=[_node("b"), _node("c")], edges=[_edge("a", "b"), _edge("b", "c")])
+
+        added = data.merge(page)
+
+        assert [n.id for n in added.nodes] == ["c"]
+        assert [e.id for e in added.edges] == ["b-c"]
+        assert [n.id for n in data.nodes] == ["a", "b", "c"]
+        assert data.get_node("c") is page.nodes[1]
+
+    def test_get_node_sees_replaced_nodes(self):
+        data = GraphData(nodes=[_node("a"), _node("b")])
+        assert data.get_node("a") is not None
+
+        data.nodes.remove(data.nodes[0])
+        data.nodes.append(_node("c"))
+
+        assert data.get_node("a") is None
+        assert data.get_node("c") is data.nodes[1]
+
+        data.nodes = [_node("d")]
+        assert data.get_node("c") is None and data.get_node("d") is not None
+
+    def test_get_node_sees_appended_nodes(self):
+        data = GraphData(nodes=[_node("a")])
+        assert data.get_node("a") is not None
+
+        data.nodes.append(_node("b"))
+
+        assert data.get_node("b") is data.nodes[1]
+        assert data.get_node("missing") is None
+
+
+def _record(**values):
+    return values
+
+
+@pytest.fixture
+def provider():
+    provider = GraphDataProvider()
+    provider._is_circuit_open = lambda: False
+    session = MagicMock()
+    driver = MagicMock()
+    driver.session.return_value.__enter__.return_value = session
+    provider._driver = driver
+    yield provider, session
+    provider._driver = None
+
+
+def _node_record(node_id, entity_type="condition"):
+    return _record(id=node_id, name=node_id, entity_type=entity_type, props={"embedding": [0.1]})
+
+
+def _edge_record(source, target):
+    return _record(id=f"{source}-{target}", source=source, target=target,
+                   rel_type="TREATS", fact="", props={})
+
+
+class TestGraphDataProviderPaging:
+    """Tests for paged and neighbourhood graph queries."""
+
+    def test_full_page_reports_next_offset(self, provider):
+        provider, session = provider
+        session.run.side_effect = [
+            [_node_record("a"), _node_record("b", "medication")],
+            [_edge_record("b", "a"), _edge_record("b", "z")],
+        ]
+
+        page = provider.get_graph_page(offset=4, limit=2, known_node_ids={"z"})
+
+        assert [n.id for n in page.nodes] == ["a", "b"]
+        assert "embedding" not in page.nodes[0].properties
+        assert page.next_offset == 6
+        assert len(page.edges) == 2
+        node_query, node_params = session.run.call_args_list[0].args[0], session.run.call_args_list[0].kwargs
+        assert "SKIP $offset" in node_query and node_params == {"offset": 4, "limit": 2}
+        edge_params = session.run.call_args_list[1].kwargs
+        assert sorted(edge_params["loaded_ids"]) == ["a", "b", "z"]
+
+    def test_short_page_is_the_last(self, provider):
+        provider, session = provider
+        session.run.side_effect = [[_node_record("a", "medication"), _node_record("b")], []]
+
+        page = provider.get_graph_page(limit=5, entity_types=["medication"])
+
+        assert [n.id for n in page.nodes] == ["a"]
+        assert page.next_offset is None
+
+    def test_neighborhood_links_to_expanded_node(self, provider):
+        provider, session = provider
+        session.run.side_effect = [[_node_record("b")], [_edge_record("a", "b")]]
+
+        data = provider.get_neighborhood("a", limit=10, known_node_ids={"c"})
+
+        assert [n.id for n in data.nodes] == ["b"]
+        assert session.run.call_args_list[0].kwargs == {"node_id": "a", "limit": 10}
+        assert sorted(session.run.call_args_list[1].kwargs["loaded_ids"]) == ["a", "b", "c"]
+
+    def test_cluster_summary_groups_by_entity_type(self, provider):
+        provider, session = provider
+        session.run.return_value = [
+            _record(entity_type="drug", count=3),
+            _record(entity_type="medication", count=2),
+            _record(entity_type="Condition", count=7),
+        ]
+
+        summary = provider.get_cluster_summary()
+
+        assert summary == {EntityType.MEDICATION: 5, EntityType.CONDITION: 7}
+
+    def test_unlabelled_graph_falls_back_to_all_nodes(self, provider):
+        provider, session = provider
+        labels = MagicMock()
+        labels.single.return_value = _record(labels=["Person"])
+        session.run.side_effect = [
+            [], labels, [_record(entity_type="person", count=4)],
+            [_node_record("a")], [],
+        ]
+
+        summary = provider.get_cluster_summary()
+        page = provider.get_graph_page(offset=0, limit=5)
+
+        assert sum(summary.values()) == 4
+        assert [n.id for n in page.nodes] == ["a"]
+        queries = [c.args[0] for c in session.run.call_args_list]
+        assert "EntityNode" in queries[0]
+        assert "db.labels()" in queries[1]
+        assert "EntityNode" not in queries[2] and "EntityNode" not in queries[3]
+
+    def test_empty_graph_stays_empty(self, provider):
+        provider, session = provider
+        labels = MagicMock()
+        labels.single.return_value = _record(labels=[])
+        session.run.side_effect = [[], labels]
+
+        assert provider.get_graph_page().nodes == []
+        assert provider._match_all_labels is False
+
+    def test_open_circuit_returns_empty_page(self):
+        provider = GraphDataProvider()
+        provider._is_circuit_open = lambda: True
+
+        assert provider.get_graph_page().nodes == []
+        assert provider.get_cluster_summary() == {}
@@ -0,0 +1,134 @@
+"""
+Unit tests for batched clinical guideline retrieval.
+
+Tests cover the single embedding request per batch, concurrent backend
+searches, and chunk deduplication across condition and medication queries.
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from rag.guidelines_models import GuidelineSearchResult
+from rag.guidelines_retriever import GuidelinesRetriever
+
+
+SEARCH_DELAY = 0.05
+
+
+def _chunk(guideline_id, chunk_index, score):
+    return GuidelineSearchResult(
+        guideline_id=guideline_id,
+        chunk_index=chunk_index,
+        chunk_text=f"{guideline_id} chunk {chunk_index}",
+        similarity_score=score,
+    )
+
+
+class _SlowVectorStore:
+    """Vector store whose searches take SEARCH_DELAY and return shared chunks."""
+
+    def __init__(self):
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def search(self, query_embedding, top_k=10, **kwargs):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(SEARCH_DELAY)
+        with self._lock:
+            self.active -= 1
+        # Every query matches the shared chunk plus one of its own
+        return [
+            _chunk("shared", 0, 0.9),
+            _chunk(f"g{int(query_embedding[0])}", 1, 0.8),
+        ][:top_k]
+
+
+@pytest.fixture
+def store():
+    return _SlowVectorStore()
+
+
+@pytest.fixture
+def retriever(store):
+    retriever = GuidelinesRetriever(
+        enable_bm25=False,
+        enable_graph=False,
+        enable_query_expansion=False,
+        enable_adaptive_threshold=False,
+        enable_mmr=False,
+    )
+    retriever._get_embeddings = Mock(side_effect=lambda texts: [[float(i), 1.0] for i in range(len(texts))])
+    with patch("rag.guidelines_retriever.get_guidelines_vector_store", return_value=store):
+        yield retriever
+
+
+class TestSearchBatch:
+    """Tests for GuidelinesRetriever.search_batch."""
+
+    def test_one_embedding_request_and_concurrent_searches(self, retriever, store):
+        queries = [f"condition {i}" for i in range(8)]
+
+        start = time.perf_counter()
+        results = retriever.search_batch(queries, top_k=2)
+        elapsed = time.perf_counter() - start
+
+        assert retriever._get_embeddings.call_count == 1
+        assert retriever._get_embeddings.call_args[0][0] == queries
+        assert len(results) == 8 and all(len(r) == 2 for r in results)
+        assert store.calls == 8
+        assert store.peak > 1
+        assert elapsed < SEARCH_DELAY * 8 / 2
+
+    def test_duplicate_queries_are_searched_once(self, retriever, store):
+        results = retriever.search_batch(["htn", "dm", "htn"], top_k=2)
+
+        assert store.calls == 2
+        assert results[0] is results[2]
+
+    def test_embedding_failure_returns_empty_results(self, retriever, store):
+        retriever._get_embeddings.side_effect = RuntimeError("no key")
+
+        assert retriever.search_batch(["htn", "dm"]) == [[], []]
+        assert store.calls == 0
+
+
+class TestConditionRetrieval:
+    """Tests for the condition and medication entry points."""
+
+    def test_search_for_conditions_dedupes_and_boosts_shared_chunks(self, retriever):
+        results = retriever.search_for_conditions(["hypertension", "diabetes"], top_k=2)
+
+        keys = [(r.guideline_id, r.chunk_index) for r in results]
+        assert len(keys) == len(set(keys)) == 3
+        assert results[0].guideline_id == "shared"
+        assert results[0].similarity_score == pytest.approx(0.99)
+
+    def test_get_guidelines_for_conditions_uses_one_batch(self, retriever, store):
+        conditions = [
+            {"condition": "Hypertension", "medications": ["lisinopril", "amlodipine"]},
+            {"condition": "Type 2 diabetes", "medications": ["metformin", "lisinopril"]},
+            {"condition": ""},
+        ]
+
+        results = retriever.get_guidelines_for_conditions(conditions, top_k_per_condition=3)
+
+        assert set(results) == {"Hypertension", "Type 2 diabetes"}
+        assert retriever._get_embeddings.call_count == 1
+        # Two condition queries plus three distinct medications
+        assert store.calls == 5
+        for found in results.values():
+            keys = [(r.guideline_id, r.chunk_index) for r in found]
+            assert len(keys) == len(set(keys)) <= 3
+            assert found[0].similarity_score == pytest.approx(0.9)  # inputs were not boosted in place
+
+    def test_no_conditions_skips_search(self, retriever, store):
+        assert retriever.get_guidelines_for_conditions([{"medications": ["aspirin"]}]) == {}
+        assert retriever._get_embeddings.call_count == 0
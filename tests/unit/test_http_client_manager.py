@@ -261,3 +261,33 @@ class TestPoolConfig:
         known_providers = ["openai", "anthropic", "ollama", "gemini"]
         for p in known_providers:
             assert p in manager.POOL_CONFIG or manager.get_httpx_client(p) is not None
+
+
+class TestGetAsyncHttpxClient:
+    def test_same_loop_returns_same_client(self):
+        import asyncio
+        manager = HTTPClientManager.get_instance()
+
+        async def get_twice():
+            return (manager.get_async_httpx_client("openai"),
+                    manager.get_async_httpx_client("openai"))
+
+        first, second = asyncio.run(get_twice())
+        assert isinstance(first, httpx.AsyncClient)
+        assert first is second
+
+    def test_new_loop_gets_new_client(self):
+        import asyncio
+        manager = HTTPClientManager.get_instance()
+
+        async def get():
+            return manager.get_async_httpx_client("openai")
+
+        assert asyncio.run(get()) is not asyncio.run(get())
+        # Clients of closed loops are pruned
+        assert len(manager._async_clients) == 1
+
+    def test_requires_running_loop(self):
+        manager = HTTPClientManager.get_instance()
+        with pytest.raises(RuntimeError):
+            manager.get_async_httpx_client("openai")
@@ -0,0 +1,144 @@
+"""
+Unit tests for the streaming ingest pipeline.
+
+Tests cover ordering and batching, bounded look-ahead, error propagation
+from either stage, and the guideline upsert transaction consuming a
+streamed row generator.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from rag.ingest_pipeline import StreamingIngestPipeline
+
+
+def _fake_embed(texts):
+    return [[float(len(t))] for t in texts]
+
+
+class TestStreamingIngestPipeline:
+
+    def test_batches_in_input_order(self):
+        pipeline = StreamingIngestPipeline(_fake_embed, embed_batch_size=4, embed_workers=3)
+        items = [f"chunk {'x' * i}" for i in range(10)]
+
+        batches = list(pipeline.stream(items, text_of=lambda s: s))
+
+        assert [len(b) for b in batches] == [4, 4, 2]
+        flat = [pair for batch in batches for pair in batch]
+        assert [item for item, _ in flat] == items
+        assert [vector[0] for _, vector in flat] == [float(len(s)) for s in items]
+        assert (pipeline.stats.items, pipeline.stats.batches) == (10, 3)
+
+    def test_lookahead_is_bounded(self):
+        embedded = []
+
+        def embed(texts):
+            embedded.append(len(texts))
+            return _fake_embed(texts)
+
+        pipeline = StreamingIngestPipeline(embed, embed_batch_size=1, max_pending_batches=2)
+        stream = pipeline.stream((str(i) for i in range(100)), text_of=lambda s: s)
+
+        next(stream)
+        time.sleep(0.3)
+        # One consumed, two queued, at most one more in flight
+        assert len(embedded) <= 4
+        stream.close()
+
+    def test_embed_error_propagates(self):
+        def embed(texts):
+            if "bad" in texts:
+                raise RuntimeError("embedding service unavailable")
+            return _fake_embed(texts)
+
+        pipeline = StreamingIngestPipeline(embed, embed_batch_size=2)
+        stream = pipeline.stream(["a", "b", "bad", "c"], text_of=lambda s: s)
+
+        assert len(next(stream)) == 2
+        with pytest.raises(RuntimeError, match="unavailable"):
+            next(stream)
+
+    def test_source_error_propagates(self):
+        def chunks():
+            yield "a"
+            raise ValueError("chunker failed")
+
+        pipeline = StreamingIngestPipeline(_fake_embed, embed_batch_size=8)
+        with pytest.raises(ValueError, match="chunker failed"):
+            list(pipeline.stream(chunks(), text_of=lambda s: s))
+
+    def test_mismatched_embedding_count_rejected(self):
+        pipeline = StreamingIngestPipeline(lambda texts: [[0.0]], embed_batch_size=2)
+        with pytest.raises(ValueError, match="mismatch"):
+            list(pipeline.stream(["a", "b"], text_of=lambda s: s))
+
+    def test_consumer_stop_ends_producer(self):
+        pulled = []
+
+        def chunks():
+            for i in range(1000):
+                pulled.append(i)
+                yield str(i)
+
+        pipeline = StreamingIngestPipeline(_fake_embed, embed_batch_size=1, max_pending_batches=1)
+        before = threading.active_count()
+        stream = pipeline.stream(chunks(), text_of=lambda s: s)
+        next(stream)
+        stream.close()
+        time.sleep(0.3)
+
+        assert len(pulled) < 10
+        assert threading.active_count() <= before
+
+
+class TestStreamedGuidelineSync:
+    """_atomic_neon_sync consuming rows from a generator."""
+
+    def _store(self):
+        vector_store = MagicMock()
+        conn = MagicMock()
+        cursor = MagicMock()
+        vector_store._get_pool.return_value.connection.return_value.__enter__.return_value = conn
+        conn.cursor.return_value.__enter__.return_value = cursor
+        return vector_store, conn, cursor
+
+    def _sync(self, manager, vector_store, rows):
+        manager._atomic_neon_sync(
+            vector_store=vector_store, guideline_id="00000000-0000-0000-0000-000000000001",
+            title="Hypertension", filename="htn.pdf", specialty="cardiology", source="AHA",
+            version=None, effective_date=None, expiration_date=None, document_type=None,
+            file_path=None, content_hash="abc", metadata={"chunk_count": 130}, batch_data=rows,
+        )
+
+    def test_rows_upserted_in_micro_batches(self):
+        from rag.guidelines_upload_manager import INGEST_UPSERT_BATCH_SIZE, GuidelinesUploadManager
+
+        vector_store, conn, cursor = self._store()
+        rows = ((i, f"text {i}", [0.1], "recommendation", None, None, {"chunk_index": i}) for i in range(130))
+
+        self._sync(GuidelinesUploadManager(), vector_store, rows)
+
+        sizes = [len(call.args[1]) for call in cursor.executemany.call_args_list]
+        assert sizes == [INGEST_UPSERT_BATCH_SIZE, INGEST_UPSERT_BATCH_SIZE, 130 - 2 * INGEST_UPSERT_BATCH_SIZE]
+        conn.commit.assert_called_once()
+        conn.rollback.assert_not_called()
+
+    def test_failure_mid_stream_rolls_back(self):
+        from rag.guidelines_upload_manager import GuidelinesUploadManager
+
+        vector_store, conn, cursor = self._store()
+
+        def rows():
+            for i in range(100):
+                yield (i, "text", [0.1], "recommendation", None, None, None)
+            raise RuntimeError("embedding batch failed")
+
+        with pytest.raises(RuntimeError, match="embedding batch failed"):
+            self._sync(GuidelinesUploadManager(), vector_store, rows())
+
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
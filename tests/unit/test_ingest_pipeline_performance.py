@@ -0,0 +1,93 @@
+"""Throughput and peak memory of staged vs streamed embed-and-upsert ingest.
+
+Stand-ins: a stub embedder with fixed per-request latency and an SQLite
+table whose executemany pays a simulated network round trip. Peak memory
+is measured with tracemalloc (Python allocations, not process RSS).
+"""
+import json
+import logging
+import sqlite3
+import time
+import tracemalloc
+
+import pytest
+
+from rag.ingest_pipeline import StreamingIngestPipeline
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.benchmark
+
+
+_CHUNKS = 2000
+_DIMENSIONS = 384
+_BATCH = 64
+_EMBED_LATENCY = 0.03
+_UPSERT_LATENCY = 0.015
+
+
+def _stub_embed(texts):
+    time.sleep(_EMBED_LATENCY)
+    return [[0.001 * i] * _DIMENSIONS for i in range(len(texts))]
+
+
+def _store():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.execute("CREATE TABLE embeddings (chunk_index INTEGER PRIMARY KEY, chunk_text TEXT, embedding TEXT)")
+    return conn
+
+
+def _upsert(conn, rows):
+    time.sleep(_UPSERT_LATENCY)
+    conn.executemany(
+        "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?)",
+        [(index, text, json.dumps(vector[:4])) for index, text, vector in rows]
+    )
+
+
+def _chunks():
+    return [(i, f"Recommendation {i}: titrate therapy to target blood pressure") for i in range(_CHUNKS)]
+
+
+def staged_ingest(conn):
+    chunks = _chunks()
+    vectors = []
+    for start in range(0, len(chunks), _BATCH):
+        vectors.extend(_stub_embed([text for _, text in chunks[start:start + _BATCH]]))
+    rows = [(index, text, vector) for (index, text), vector in zip(chunks, vectors)]
+    for start in range(0, len(rows), _BATCH):
+        _upsert(conn, rows[start:start + _BATCH])
+    conn.commit()
+
+
+def streamed_ingest(conn):
+    pipeline = StreamingIngestPipeline(_stub_embed, embed_batch_size=_BATCH, max_pending_batches=2)
+    for batch in pipeline.stream(_chunks(), text_of=lambda chunk: chunk[1]):
+        _upsert(conn, [(index, text, vector) for (index, text), vector in batch])
+    conn.commit()
+
+
+def _measure(ingest):
+    conn = _store()
+    start = time.perf_counter()
+    ingest(conn)
+    elapsed = time.perf_counter() - start
+    count = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    tracemalloc.start()
+    ingest(_store())
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, count
+
+
+def test_streamed_ingest_faster_and_smaller():
+    staged_time, staged_peak, staged_rows = _measure(staged_ingest)
+    streamed_time, streamed_peak, streamed_rows = _measure(streamed_ingest)
+
+    assert staged_rows == streamed_rows == _CHUNKS
+    assert streamed_time < staged_time * 0.85
+    assert streamed_peak < staged_peak / 4
+    logger.info(f"{_CHUNKS} chunks x {_DIMENSIONS}d: staged {staged_time:.2f}s / {staged_peak / 1e6:.1f}MB peak, "
+                f"streamed {streamed_time:.2f}s / {streamed_peak / 1e6:.1f}MB peak "
+                f"({staged_time / streamed_time:.2f}x throughput, {staged_peak / streamed_peak:.0f}x less memory)")
@@ -0,0 +1,239 @@
+"""
+Unit tests for the embedded local vector store and its Neon sync job.
+
+Tests cover upsert/search/delete against the memory-mapped vectors and
+SQLite metadata, the IVF path and its persistence, FTS5 keyword search,
+and LocalIndexSync against an in-memory stand-in for NeonVectorStore.
+"""
+
+import numpy as np
+import pytest
+
+from rag.bm25_search import BM25Searcher
+from rag.exceptions import VectorSearchError
+from rag.local_index_sync import LocalIndexSync
+from rag.local_vector_store import LocalVectorStore
+from rag.search_config import SearchQualityConfig
+
+
+def _unit(*values):
+    vector = np.array(values, dtype=np.float32)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+@pytest.fixture
+def store(tmp_path):
+    vector_store = LocalVectorStore(tmp_path / "index")
+    yield vector_store
+    vector_store.close()
+
+
+def _random_chunks(rng, count, dimensions=16, start=0):
+    vectors = rng.normal(size=(count, dimensions))
+    return [(start + i, f"chunk {start + i}", vectors[i].tolist(), {"n": start + i}) for i in range(count)]
+
+
+class TestUpsertAndSearch:
+    """Tests for the exact-scan path."""
+
+    def test_search_orders_by_cosine_similarity(self, store):
+        store.upsert_embeddings_batch("doc-a", [
+            (0, "east", _unit(1, 0, 0), {"filename": "a.pdf"}),
+            (1, "north-east", _unit(1, 1, 0), None),
+            (2, "north", _unit(0, 1, 0), None),
+        ])
+
+        results = store.search(_unit(1, 0.1, 0), top_k=2)
+
+        assert [r.chunk_text for r in results] == ["east", "north-east"]
+        assert results[0].similarity_score == pytest.approx(0.995, abs=1e-3)
+        assert results[0].metadata == {"filename": "a.pdf"}
+        assert results[1].metadata is None
+
+    def test_threshold_and_document_filter(self, store):
+        store.upsert_embeddings_batch("doc-a", [(0, "a", _unit(1, 0, 0), None)])
+        store.upsert_embeddings_batch("doc-b", [(0, "b", _unit(1, 0.2, 0), None), (1, "c", _unit(0, 0, 1), None)])
+
+        assert [r.chunk_text for r in store.search(_unit(1, 0, 0), similarity_threshold=0.5)] == ["a", "b"]
+        filtered = store.search(_unit(1, 0, 0), filter_document_ids=["doc-b"])
+        assert [r.chunk_text for r in filtered] == ["b", "c"]
+
+    def test_upsert_replaces_existing_chunk(self, store):
+        first = store.upsert_embeddings_batch("doc-a", [(0, "old", _unit(1, 0), None), (1, "keep", _unit(0, 1), None)])
+        second = store.upsert_embeddings_batch("doc-a", [(0, "new", _unit(1, 1), None)])
+
+        assert second == first[:1]
+        assert [c["chunk_text"] for c in store.get_document_chunks("doc-a")] == ["new", "keep"]
+        assert store.search(_unit(1, 1), top_k=1)[0].chunk_text == "new"
+        assert store.get_stats()["total_embeddings"] == 2
+
+    def test_delete_document_frees_slots(self, store):
+        ids = store.upsert_embeddings_batch("doc-a", [(0, "a", _unit(1, 0), None), (1, "b", _unit(0, 1), None)])
+        store.upsert_embeddings_batch("doc-b", [(0, "c", _unit(1, 1), None)])
+
+        assert store.delete_document("doc-a") == 2
+        assert [r.document_id for r in store.search(_unit(1, 0))] == ["doc-b"]
+
+        reused = store.upsert_embeddings_batch("doc-c", [(0, "d", _unit(1, 0), None)])
+        assert reused[0] in ids
+        assert store.delete_chunk("doc-c", 0) is True
+        assert store.delete_chunk("doc-c", 0) is False
+
+    def test_dimension_mismatch(self, store):
+        store.upsert_embeddings_batch("doc-a", [(0, "a", [1.0, 0.0, 0.0], None)])
+
+        with pytest.raises(ValueError):
+            store.upsert_embeddings_batch("doc-b", [(0, "b", [1.0, 0.0], None)])
+        with pytest.raises(VectorSearchError):
+            store.search([1.0, 0.0])
+
+    def test_empty_store(self, store):
+        assert store.search([1.0, 0.0]) == []
+        assert store.delete_document("missing") == 0
+        assert store.get_stats()["total_embeddings"] == 0
+
+
+class TestIVFIndex:
+    """Tests for the inverted-file index."""
+
+    def test_ivf_finds_exact_matches_and_survives_reopen(self, tmp_path):
+        rng = np.random.default_rng(3)
+        store = LocalVectorStore(tmp_path / "index", ivf_min_vectors=500, nprobe=4)
+        chunks = _random_chunks(rng, 800)
+        store.upsert_embeddings_batch("doc-a", chunks[:400])
+        assert store.get_index_health()["ivf_index_exists"] is False
+        store.upsert_embeddings_batch("doc-b", chunks[400:])
+
+        health = store.get_index_health()
+        assert health["ivf_index_exists"] is True
+        assert health["ivf_lists"] == round(np.sqrt(800))
+
+        # Added after training: assigned to the nearest list on insert
+        late = rng.normal(size=16).tolist()
+        store.upsert_embeddings_batch("doc-c", [(0, "late", late, None)])
+        assert store.search(late, top_k=1)[0].chunk_text == "late"
+        store.close()
+
+        reopened = LocalVectorStore(tmp_path / "index", ivf_min_vectors=500, nprobe=4)
+        for chunk_index, text, vector, _ in chunks[::97]:
+            assert reopened.search(vector, top_k=1)[0].chunk_text == text
+        assert reopened.get_stats()["total_embeddings"] == 801
+        reopened.close()
+
+
+class TestKeywordSearch:
+    """Tests for FTS5 BM25 search."""
+
+    def test_bm25_ranks_and_filters(self, store):
+        store.upsert_embeddings_batch("doc-a", [
+            (0, "Metformin is first-line therapy for type 2 diabetes", [1.0, 0.0], None),
+            (1, "Blood pressure targets in chronic kidney disease", [0.0, 1.0], None),
+        ])
+        store.upsert_embeddings_batch("doc-b", [(0, "Metformin dosing and renal function", [1.0, 1.0], None)])
+
+        results = store.search_bm25("metformin diabetes", top_k=5)
+        assert [(r.document_id, r.chunk_index) for r in results] == [("doc-a", 0), ("doc-b", 0)]
+        assert 0 < results[1].similarity_score < results[0].similarity_score < 1
+
+        assert [r.document_id for r in store.search_bm25("metformin", filter_document_ids=["doc-b"])] == ["doc-b"]
+        # FTS5 operators in user input are treated as plain words
+        assert store.search_bm25('kidney NOT ("')[0].chunk_index == 1
+        assert store.search_bm25("!!!") == []
+
+    def test_bm25_follows_updates_and_deletes(self, store):
+        store.upsert_embeddings_batch("doc-a", [(0, "aspirin", [1.0], None)])
+        store.upsert_embeddings_batch("doc-a", [(0, "warfarin", [1.0], None)])
+
+        assert store.search_bm25("aspirin") == []
+        assert len(store.search_bm25("warfarin")) == 1
+        store.delete_document("doc-a")
+        assert store.search_bm25("warfarin") == []
+
+    def test_bm25_searcher_uses_local_store(self, store):
+        store.upsert_embeddings_batch("doc-a", [(0, "Hypertension management", [1.0], {"filename": "h.pdf"})])
+        searcher = BM25Searcher(vector_store=store, config=SearchQualityConfig())
+
+        results = searcher.search("hypertension", expanded_terms=["HTN"])
+
+        assert [r.chunk_text for r in results] == ["Hypertension management"]
+        assert results[0].metadata == {"filename": "h.pdf"}
+        assert searcher.check_search_vector_exists() is True
+
+
+class _FakeRemote:
+    """In-memory stand-in for NeonVectorStore's sync surface."""
+
+    def __init__(self):
+        self.documents = {}
+        self.versions = {}
+        self.fail = set()
+
+    def put(self, document_id, chunks, version):
+        self.documents[document_id] = chunks
+        self.versions[document_id] = version
+
+    def get_document_versions(self):
+        return dict(self.versions)
+
+    def iter_document_embeddings(self, document_id, batch_size=500):
+        chunks = self.documents[document_id]
+        for start in range(0, len(chunks), batch_size):
+            if document_id in self.fail and start > 0:
+                raise ConnectionError("connection lost")
+            yield chunks[start:start + batch_size]
+
+
+class TestLocalIndexSync:
+    """Tests for mirroring remote documents into the local store."""
+
+    def test_sync_adds_updates_and_removes(self, store):
+        rng = np.random.default_rng(5)
+        remote = _FakeRemote()
+        remote.put("doc-a", _random_chunks(rng, 7, dimensions=8), "7:t1")
+        remote.put("doc-b", _random_chunks(rng, 3, dimensions=8), "3:t1")
+        store.upsert_embeddings_batch("uploaded-offline", _random_chunks(rng, 2, dimensions=8))
+        sync = LocalIndexSync(remote, store, batch_size=3)
+
+        stats = sync.run()
+        assert (stats.added, stats.chunks_copied) == (2, 10)
+        assert len(store.get_document_chunks("doc-a")) == 7
+
+        assert sync.run().unchanged == 2
+
+        remote.put("doc-a", _random_chunks(rng, 4, dimensions=8), "4:t2")
+        del remote.documents["doc-b"], remote.versions["doc-b"]
+        stats = sync.run()
+        assert (stats.updated, stats.removed, stats.unchanged) == (1, 1, 0)
+        assert len(store.get_document_chunks("doc-a")) == 4
+        assert store.get_document_chunks("doc-b") == []
+        # Documents that never came from the remote store are left alone
+        assert len(store.get_document_chunks("uploaded-offline")) == 2
+
+    def test_failed_copy_is_dropped_and_retried(self, store):
+        rng = np.random.default_rng(6)
+        remote = _FakeRemote()
+        remote.put("doc-a", _random_chunks(rng, 6, dimensions=8), "6:t1")
+        remote.fail.add("doc-a")
+        sync = LocalIndexSync(remote, store, batch_size=4)
+
+        assert sync.run().failed == 1
+        assert store.get_document_chunks("doc-a") == []
+
+        remote.fail.clear()
+        assert sync.run().added == 1
+        assert len(store.get_document_chunks("doc-a")) == 6
+
+    def test_sync_lock_released_when_remote_cannot_connect(self, monkeypatch):
+        from rag import local_index_sync, local_vector_store, neon_vector_store
+
+        def refuse(*args, **kwargs):
+            raise ConnectionError("neon unreachable")
+
+        monkeypatch.setattr(local_vector_store, "get_vector_backend", lambda: "local")
+        monkeypatch.setattr(neon_vector_store, "NeonVectorStore", refuse)
+        monkeypatch.setenv("NEON_DATABASE_URL", "postgresql://example/db")
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                local_index_sync.sync_local_index()
+        assert not local_index_sync._sync_lock.locked()
@@ -0,0 +1,88 @@
+"""Recall@10 and query latency of the local vector index at 100k chunks.
+
+Synthetic embeddings are drawn around 2,000 topic centres, so that (as with
+real text embeddings) near neighbours are meaningful rather than noise.
+Ground truth is an exact numpy scan. Dimensions are 384 to keep the
+fixture small; latency scales roughly linearly with dimensions.
+"""
+import logging
+import time
+
+import numpy as np
+import pytest
+
+from rag.local_vector_store import LocalVectorStore
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.benchmark
+
+
+_CHUNKS = 100_000
+_DIMENSIONS = 384
+_TOPICS = 2_000
+_QUERIES = 200
+_PER_DOCUMENT = 500
+
+
+def _embeddings(rng, count, centres):
+    topics = rng.integers(0, len(centres), size=count)
+    # Noise of norm ~0.8 around unit centres: same-topic cosine ~0.6
+    noise = rng.normal(scale=0.8 / np.sqrt(_DIMENSIONS), size=(count, _DIMENSIONS)).astype(np.float32)
+    vectors = centres[topics] + noise
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _percentile_ms(samples, q):
+    return float(np.percentile(samples, q)) * 1000
+
+
+def test_recall_and_latency_at_100k(tmp_path):
+    rng = np.random.default_rng(7)
+    centres = rng.normal(size=(_TOPICS, _DIMENSIONS)).astype(np.float32)
+    centres /= np.linalg.norm(centres, axis=1, keepdims=True)
+    data = _embeddings(rng, _CHUNKS, centres)
+    queries = _embeddings(rng, _QUERIES, centres)
+
+    store = LocalVectorStore(tmp_path / "index")
+    start = time.perf_counter()
+    for doc in range(_CHUNKS // _PER_DOCUMENT):
+        base = doc * _PER_DOCUMENT
+        store.upsert_embeddings_batch(f"doc-{doc}", [
+            (i, f"chunk {base + i}", data[base + i], None) for i in range(_PER_DOCUMENT)
+        ])
+    ingest = time.perf_counter() - start
+    health = store.get_index_health()
+
+    truth = np.argsort(-(queries @ data.T), axis=1)[:, :10]
+
+    def measure(**kwargs):
+        latencies, hits = [], 0
+        for q, expected in zip(queries, truth):
+            t0 = time.perf_counter()
+            results = store.search(q, top_k=10, **kwargs)
+            latencies.append(time.perf_counter() - t0)
+            found = {int(r.document_id[4:]) * _PER_DOCUMENT + r.chunk_index for r in results}
+            hits += len(found & set(expected.tolist()))
+        return hits / truth.size, latencies
+
+    ivf_recall, ivf_latency = measure()
+    wide_recall, wide_latency = measure(ef_search=100)
+
+    # Exact scan over the same store for comparison
+    store.ivf_min_vectors = _CHUNKS + 1
+    exact_recall, exact_latency = measure()
+    store.close()
+
+    logger.info(f"{_CHUNKS} chunks x {_DIMENSIONS} dims, ingest {ingest:.1f}s, {health['ivf_lists']} IVF lists")
+    for name, recall, latency in (
+        ("IVF nprobe=16", ivf_recall, ivf_latency),
+        ("IVF nprobe=40", wide_recall, wide_latency),
+        ("exact scan", exact_recall, exact_latency),
+    ):
+        logger.info(f"  {name:14s} recall@10 {recall:.3f}  p50 {_percentile_ms(latency, 50):6.2f} ms"
+                    f"  p99 {_percentile_ms(latency, 99):6.2f} ms")
+
+    assert exact_recall == 1.0
+    assert ivf_recall >= 0.9
+    assert _percentile_ms(ivf_latency, 50) < _percentile_ms(exact_latency, 50)
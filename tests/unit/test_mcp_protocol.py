@@ -0,0 +1,191 @@
+"""
+Unit tests for the MCP JSON-RPC transport.
+
+Tests run against a stub stdio MCP server subprocess and cover request
+multiplexing, batch requests, the asyncio API, failure of pending requests
+when the server dies, and the manager's tool-list cache.
+"""
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from ai.mcp.mcp_manager import MCPManager, MCPProtocol, MCPServer, MCPTransportError
+
+
+STUB_SERVER = Path(__file__).resolve().parents[1] / "fixtures" / "mcp_stub_server.py"
+
+
+def _spawn_stub():
+    return subprocess.Popen(
+        [sys.executable, str(STUB_SERVER)],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        text=True, bufsize=1,
+    )
+
+
+@pytest.fixture
+def protocol():
+    process = _spawn_stub()
+    proto = MCPProtocol(process)
+    yield proto
+    proto.close()
+    process.kill()
+    process.wait(timeout=5)
+
+
+@pytest.fixture
+def manager():
+    mgr = MCPManager()
+    mgr.servers["stub"] = MCPServer(
+        name="stub", command=sys.executable, args=[str(STUB_SERVER)], env={}, enabled=True
+    )
+    yield mgr
+    mgr.stop_all()
+
+
+class TestRequests:
+    """Tests for single and concurrent requests."""
+
+    def test_send_request(self, protocol):
+        result = protocol.send_request("tools/list")
+        assert result["tools"][0]["name"] == "echo"
+
+    def test_error_response_raises(self, protocol):
+        with pytest.raises(Exception, match="MCP error \\(code -32601\\)"):
+            protocol.send_request("no/such/method")
+
+    def test_concurrent_requests_matched_by_id(self, protocol):
+        results = {}
+
+        def call(i):
+            # Later requests finish first, so responses arrive out of order
+            results[i] = protocol.send_request(
+                "tools/call", {"name": "echo", "arguments": {"i": i, "delay": (8 - i) * 0.01}}
+            )
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+
+        for i in range(8):
+            assert f'"i": {i}' in results[i]["content"][0]["text"]
+
+    def test_timeout(self, protocol):
+        with pytest.raises(MCPTransportError, match="Timeout"):
+            protocol.send_request("tools/call", {"name": "echo", "arguments": {"delay": 1}}, timeout=0.05)
+        assert protocol._pending_requests == {}
+
+
+class TestBatch:
+    """Tests for JSON-RPC batch requests."""
+
+    def test_results_in_order(self, protocol):
+        results = protocol.send_batch([
+            ("tools/list", None),
+            ("tools/call", {"name": "echo", "arguments": {"x": 1}}),
+        ])
+        assert results[0]["tools"][0]["name"] == "echo"
+        assert '"x": 1' in results[1]["content"][0]["text"]
+
+    def test_failed_entry_is_exception(self, protocol):
+        results = protocol.send_batch([("tools/list", None), ("bogus", None)])
+        assert "tools" in results[0]
+        assert isinstance(results[1], Exception)
+
+    def test_empty_batch(self, protocol):
+        assert protocol.send_batch([]) == []
+
+
+class TestAsync:
+    """Tests for the asyncio-compatible API."""
+
+    def test_gather(self, protocol):
+        async def run():
+            return await asyncio.gather(*[
+                protocol.send_request_async("tools/call", {"name": "echo", "arguments": {"i": i}})
+                for i in range(5)
+            ])
+
+        results = asyncio.run(run())
+        assert len(results) == 5
+        assert '"i": 4' in results[4]["content"][0]["text"]
+
+
+class TestServerExit:
+    """Pending requests fail promptly when the server goes away."""
+
+    def test_pending_fail_on_exit(self, protocol):
+        _, pending = protocol.send_request_future(
+            "tools/call", {"name": "echo", "arguments": {"delay": 5}}
+        )
+        protocol.send_request_future("test/exit")
+
+        start = time.monotonic()
+        with pytest.raises(MCPTransportError):
+            pending.result(timeout=5)
+        assert time.monotonic() - start < 2
+
+
+class TestToolListCache:
+    """Tests for the manager's tool-list cache."""
+
+    def test_get_all_tools_does_not_rediscover(self, manager):
+        manager.start_server("stub")
+        protocol = manager.servers["stub"].protocol
+        calls = []
+        original = protocol.send_request
+        protocol.send_request = lambda *a, **kw: calls.append(a) or original(*a, **kw)
+
+        first = manager.get_all_tools()
+        second = manager.get_all_tools()
+
+        assert first == second == [("stub", manager.servers["stub"].tools[0])]
+        assert calls == []
+
+    def test_invalidated_on_stop_and_restart(self, manager):
+        manager.start_server("stub")
+        assert len(manager.get_all_tools()) == 1
+
+        manager.stop_server("stub")
+        assert manager.get_all_tools() == []
+
+        manager.start_server("stub")
+        assert len(manager.get_all_tools()) == 1
+
+    def test_list_changed_notification_refreshes(self, manager):
+        manager.start_server("stub")
+        manager.get_all_tools()
+
+        manager.servers["stub"].protocol.send_request("test/add_tool", {"name": "added"})
+
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            names = [tool["name"] for _, tool in manager.get_all_tools()]
+            if "added" in names:
+                break
+            time.sleep(0.02)
+        assert names == ["echo", "added"]
+
+    def test_failed_start_closes_protocol(self, manager, monkeypatch):
+        closed = []
+        original_close = MCPProtocol.close
+        monkeypatch.setattr(MCPProtocol, "close", lambda self: closed.append(self) or original_close(self))
+
+        def fail_discovery(protocol):
+            raise RuntimeError("discovery failed")
+        monkeypatch.setattr(manager, "_discover_tools", fail_discovery)
+
+        with pytest.raises(RuntimeError):
+            manager.start_server("stub")
+
+        server = manager.servers["stub"]
+        assert len(closed) == 1
+        assert server.protocol is None and server.process is None
@@ -0,0 +1,114 @@
+"""
+Unit tests for NeonVectorStore bulk writes and query vector binding.
+
+The connection pool is mocked, so these check the statements sent and the
+rows streamed through COPY; SQL semantics are covered by the benchmark in
+test_neon_bulk_upsert_performance.py when a Postgres URL is configured.
+"""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from rag.neon_vector_store import NeonVectorStore
+
+
+def _mock_store():
+    """NeonVectorStore over a mock pool; returns (store, cursor, copied_rows)."""
+    store = NeonVectorStore(connection_string="postgresql://unused")
+    mock_pool = MagicMock()
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    copy = MagicMock()
+    copied_rows = []
+
+    mock_pool.connection.return_value.__enter__ = MagicMock(return_value=mock_conn)
+    mock_pool.connection.return_value.__exit__ = MagicMock(return_value=False)
+    mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
+    mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+    mock_cursor.copy.return_value.__enter__ = MagicMock(return_value=copy)
+    mock_cursor.copy.return_value.__exit__ = MagicMock(return_value=False)
+    copy.write_row.side_effect = copied_rows.append
+
+    store._get_pool = MagicMock(return_value=mock_pool)
+    store._ensure_pgvector = MagicMock()
+    return store, mock_cursor, copied_rows
+
+
+class TestUpsertEmbeddingsBatch:
+    """Tests for the COPY + merge write path."""
+
+    def test_copies_rows_and_merges_once(self):
+        store, cursor, copied = _mock_store()
+        cursor.fetchall.return_value = [(11, 0), (12, 1)]
+
+        ids = store.upsert_embeddings_batch("doc-1", [
+            (0, "first", [0.1, 0.2], {"page": 1}),
+            (1, "second", [0.3, 0.4], None),
+        ])
+
+        assert ids == [11, 12]
+        assert "FORMAT BINARY" in cursor.copy.call_args[0][0]
+        assert [row[0] for row in copied] == [0, 1]
+        assert copied[0][2].dtype == np.float32
+        assert copied[0][3].obj == {"page": 1}
+        assert copied[1][3] is None
+
+        statements = [call[0][0] for call in cursor.execute.call_args_list]
+        assert len(statements) == 2
+        assert "CREATE TEMP TABLE" in statements[0]
+        assert "INSERT INTO document_embeddings" in statements[1]
+        assert "FROM document_embeddings_staging" in statements[1]
+        assert cursor.execute.call_args_list[1][0][1] == ("doc-1",)
+
+    def test_repeated_chunk_index_keeps_last(self):
+        store, cursor, copied = _mock_store()
+        cursor.fetchall.return_value = [(5, 2)]
+
+        ids = store.upsert_embeddings_batch("doc-1", [
+            (2, "old", [0.0], None),
+            (2, "new", [1.0], None),
+        ])
+
+        assert [row[1] for row in copied] == ["new"]
+        assert ids == [5, 5]
+
+    def test_ids_follow_input_order(self):
+        store, cursor, _ = _mock_store()
+        # The merge may return rows in any order
+        cursor.fetchall.return_value = [(30, 2), (10, 0), (20, 1)]
+
+        ids = store.upsert_embeddings_batch("doc-1", [
+            (i, f"c{i}", [float(i)], None) for i in range(3)
+        ])
+
+        assert ids == [10, 20, 30]
+
+    def test_empty_batch_skips_database(self):
+        store, cursor, _ = _mock_store()
+        assert store.upsert_embeddings_batch("doc-1", []) == []
+        store._get_pool.assert_not_called()
+
+
+class TestSearchVectorBinding:
+    """Tests that the query vector is sent once, as a typed parameter."""
+
+    @pytest.mark.parametrize("threshold", [0.0, 0.5])
+    def test_vector_bound_once(self, threshold):
+        store, cursor, _ = _mock_store()
+        cursor.fetchall.return_value = [("doc-1", 0, "text", 0.9, None)]
+
+        results = store.search([0.1, 0.2, 0.3], top_k=5, similarity_threshold=threshold,
+                               filter_document_ids=["doc-1"])
+
+        query, params = cursor.execute.call_args[0]
+        vectors = [p for p in params if isinstance(p, np.ndarray)]
+        assert len(vectors) == 1
+        assert query.count("%s::vector") == 1
+        assert "WITH q AS" in query
+        assert params[-1] == 5
+        if threshold:
+            # Compared as a distance, so the vector expression isn't repeated
+            assert params[-2] == pytest.approx(1 - threshold)
+        assert results[0].similarity_score == pytest.approx(0.9)
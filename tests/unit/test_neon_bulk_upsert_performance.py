@@ -0,0 +1,119 @@
+"""10k-chunk ingest latency: per-row upserts vs COPY + set-based merge.
+
+Needs a Postgres with the pgvector extension; set PGVECTOR_BENCHMARK_URL
+(e.g. postgresql://postgres@localhost/postgres) to run it. The benchmark
+works in a throwaway schema and drops it afterwards.
+"""
+import json
+import logging
+import os
+import time
+import uuid
+
+import numpy as np
+import pytest
+
+from rag.neon_vector_store import NeonVectorStore
+
+logger = logging.getLogger(__name__)
+
+_URL = os.environ.get("PGVECTOR_BENCHMARK_URL")
+_CHUNKS = 10_000
+_DIMENSIONS = 384
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(not _URL, reason="PGVECTOR_BENCHMARK_URL not set"),
+]
+
+
+def _chunks():
+    rng = np.random.default_rng(0)
+    vectors = rng.random((_CHUNKS, _DIMENSIONS), dtype=np.float32)
+    return [(i, f"chunk {i} " * 20, vectors[i].tolist(), {"page": i // 40}) for i in range(_CHUNKS)]
+
+
+def _row_by_row(store, document_id, chunks):
+    """The previous write path: one INSERT ... RETURNING per chunk."""
+    with store._get_pool().connection() as conn:
+        store._ensure_pgvector(conn)
+        with conn.cursor() as cur:
+            for chunk_index, chunk_text, embedding, metadata in chunks:
+                cur.execute(
+                    """
+                    INSERT INTO document_embeddings
+                    (document_id, chunk_index, chunk_text, embedding, metadata)
+                    VALUES (%s::uuid, %s, %s, %s, %s)
+                    ON CONFLICT (document_id, chunk_index)
+                    DO UPDATE SET
+                        chunk_text = EXCLUDED.chunk_text,
+                        embedding = EXCLUDED.embedding,
+                        metadata = EXCLUDED.metadata,
+                        created_at = NOW()
+                    RETURNING id
+                    """,
+                    (document_id, chunk_index, chunk_text, np.asarray(embedding, dtype=np.float32),
+                     json.dumps(metadata)),
+                )
+                cur.fetchone()
+            conn.commit()
+
+
+@pytest.fixture
+def store():
+    import psycopg
+
+    schema = f"bench_{uuid.uuid4().hex[:8]}"
+    with psycopg.connect(_URL, autocommit=True) as conn:
+        conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
+        conn.execute(f"CREATE SCHEMA {schema}")
+        conn.execute(f"""
+            CREATE TABLE {schema}.document_embeddings (
+                id BIGSERIAL PRIMARY KEY,
+                document_id UUID NOT NULL,
+                chunk_index INTEGER NOT NULL,
+                chunk_text TEXT NOT NULL,
+                embedding vector({_DIMENSIONS}) NOT NULL,
+                metadata JSONB,
+                created_at TIMESTAMPTZ DEFAULT NOW(),
+                UNIQUE (document_id, chunk_index)
+            )
+        """)
+
+    separator = "&" if "?" in _URL else "?"
+    vector_store = NeonVectorStore(f"{_URL}{separator}options=-csearch_path%3D{schema},public")
+    yield vector_store
+    vector_store.close()
+    with psycopg.connect(_URL, autocommit=True) as conn:
+        conn.execute(f"DROP SCHEMA {schema} CASCADE")
+
+
+def test_bulk_upsert_latency(store):
+    chunks = _chunks()
+
+    start = time.perf_counter()
+    _row_by_row(store, str(uuid.uuid4()), chunks)
+    row_by_row = time.perf_counter() - start
+
+    document_id = str(uuid.uuid4())
+    start = time.perf_counter()
+    ids = store.upsert_embeddings_batch(document_id, chunks)
+    bulk = time.perf_counter() - start
+
+    # Re-ingest of the same document exercises the ON CONFLICT update path
+    start = time.perf_counter()
+    again = store.upsert_embeddings_batch(document_id, chunks)
+    bulk_update = time.perf_counter() - start
+
+    logger.info(f"{_CHUNKS} chunks x {_DIMENSIONS} dims")
+    logger.info(f"  per-row INSERT:        {row_by_row:.2f}s")
+    logger.info(f"  COPY + merge (insert): {bulk:.2f}s  ({row_by_row / bulk:.1f}x)")
+    logger.info(f"  COPY + merge (update): {bulk_update:.2f}s")
+
+    assert len(ids) == _CHUNKS
+    assert again == ids
+    assert bulk < row_by_row
+
+    results = store.search(chunks[123][2], top_k=3)
+    assert results[0].chunk_index == 123
+    assert results[0].similarity_score == pytest.approx(1.0, abs=1e-4)
@@ -0,0 +1,104 @@
+"""
+Unit tests for page-parallel PDF extraction.
+
+Tests cover ordered reassembly across worker processes, OCR of sparse
+pages only, progress reporting and DocumentProcessor integration.
+"""
+
+import pytest
+
+pytest.importorskip("pdfplumber")
+pytest.importorskip("reportlab")
+
+from reportlab.pdfgen import canvas
+
+from rag.pdf_page_extractor import PDFPageExtractor
+
+
+def make_pdf(path, pages):
+    """Write a PDF with one page per entry; None makes a blank (scanned-looking) page."""
+    pdf = canvas.Canvas(str(path))
+    for text in pages:
+        if text:
+            y = 800
+            for line in text.splitlines():
+                pdf.drawString(72, y, line)
+                y -= 14
+        pdf.showPage()
+    pdf.save()
+    return str(path)
+
+
+def _page_text(n):
+    return f"Page {n} guideline text\nRecommendation {n}: review dosing and renal function"
+
+
+class TestPDFPageExtractor:
+    """Tests for PDFPageExtractor.iter_pages."""
+
+    def test_pages_in_order_with_process_pool(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf", [_page_text(n) for n in range(1, 12)])
+        extractor = PDFPageExtractor(max_workers=2, pages_per_task=2, parallel_threshold=4)
+
+        pages = list(extractor.iter_pages(pdf, 11))
+
+        assert [p.page_number for p in pages] == list(range(1, 12))
+        assert all(f"Recommendation {p.page_number}:" in p.text for p in pages)
+        assert not any(p.ocr_used for p in pages)
+
+    def test_only_sparse_pages_are_ocred(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf", [_page_text(1), None, _page_text(3), None])
+        calls = []
+
+        def fake_ocr(image):
+            calls.append(image.size)
+            return f"OCR text from a scanned page of {image.size[0]}px width"
+
+        pages = list(PDFPageExtractor(pages_per_task=3, render_resolution=72).iter_pages(pdf, 4, fake_ocr))
+
+        assert len(calls) == 2
+        assert [p.ocr_used for p in pages] == [False, True, False, True]
+        assert pages[1].text.startswith("OCR text")
+        assert "Recommendation 3" in pages[2].text
+
+    def test_failed_ocr_keeps_parsed_text(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf", ["short"])
+
+        def broken_ocr(image):
+            raise RuntimeError("OCR service down")
+
+        pages = list(PDFPageExtractor(render_resolution=72).iter_pages(pdf, 1, broken_ocr))
+
+        assert pages[0].text == "short"
+        assert not pages[0].ocr_used
+
+    def test_progress_reports_every_page(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf", [_page_text(n) for n in range(1, 6)])
+        progress = []
+
+        list(PDFPageExtractor(pages_per_task=2).iter_pages(pdf, 5, progress_callback=lambda d, t: progress.append((d, t))))
+
+        assert progress == [(n, 5) for n in range(1, 6)]
+
+
+class TestDocumentProcessorPDF:
+    """DocumentProcessor PDF extraction on top of the page extractor."""
+
+    def test_extract_text_with_ocr_and_progress(self, tmp_path, monkeypatch):
+        from rag.document_processor import DocumentProcessor
+        from rag.extraction_cache import ExtractionCache
+
+        pdf = make_pdf(tmp_path / "doc.pdf", [_page_text(1), None])
+        processor = DocumentProcessor(extraction_cache=ExtractionCache(tmp_path / "cache.db"))
+        processor._page_extractor.render_resolution = 72
+        monkeypatch.setattr(processor, "_ocr_pil_image", lambda image: "Scanned page recognised by OCR")
+        progress = []
+
+        text, metadata, page_count, ocr_used = processor.extract_text(
+            pdf, enable_ocr=True, progress_callback=lambda d, t: progress.append(d)
+        )
+
+        assert page_count == 2
+        assert ocr_used
+        assert text.index("[Page 1]") < text.index("[Page 2]\nScanned page recognised by OCR")
+        assert progress == [1, 2]
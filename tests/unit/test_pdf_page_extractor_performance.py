@@ -0,0 +1,45 @@
+"""Performance tests for page-parallel PDF extraction with concurrent OCR."""
+import logging
+import time
+
+import pytest
+
+pytest.importorskip("pdfplumber")
+pytest.importorskip("reportlab")
+
+from rag.pdf_page_extractor import PDFPageExtractor
+from tests.unit.test_pdf_page_extractor import make_pdf
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.benchmark
+
+
+_SCANNED_PAGES = 40
+# Typical round trip for one page to a cloud OCR service is far higher;
+# kept small so the test stays fast
+_OCR_LATENCY = 0.05
+
+
+def _slow_ocr(image):
+    time.sleep(_OCR_LATENCY)
+    return "Recognised text from a scanned guideline page"
+
+
+def test_concurrent_ocr_faster_than_serial(tmp_path):
+    pdf = make_pdf(tmp_path / "scanned.pdf", [None] * _SCANNED_PAGES)
+
+    def run(ocr_concurrency):
+        extractor = PDFPageExtractor(ocr_concurrency=ocr_concurrency, render_resolution=36)
+        start = time.perf_counter()
+        pages = list(extractor.iter_pages(pdf, _SCANNED_PAGES, _slow_ocr))
+        return time.perf_counter() - start, pages
+
+    serial_time, serial_pages = run(1)
+    parallel_time, parallel_pages = run(8)
+
+    assert [p.page_number for p in parallel_pages] == list(range(1, _SCANNED_PAGES + 1))
+    assert [p.text for p in parallel_pages] == [p.text for p in serial_pages]
+    assert parallel_time < serial_time / 2
+    logger.info(f"{_SCANNED_PAGES} scanned pages, {_OCR_LATENCY * 1000:.0f}ms OCR: serial {serial_time:.2f}s, "
+                f"8 concurrent {parallel_time:.2f}s ({serial_time / parallel_time:.1f}x)")
@@ -0,0 +1,166 @@
+"""
+Unit tests for the RAG query-result cache.
+
+Tests cover the exact and semantic tiers, TTL, LRU bounds and
+invalidation, and the cache wired into HybridRetriever.search.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from rag.hybrid_retriever import HybridRetriever
+from rag.models import RAGQueryRequest, RAGQueryResponse, VectorSearchResult
+from rag.query_cache import QueryResultCache, normalize_query
+from rag.search_config import SearchQualityConfig
+from rag.search_syntax_parser import ParsedQuery
+
+
+def _response(query="q"):
+    return RAGQueryResponse(query=query, results=[], total_results=0, processing_time_ms=1.0, context_text="")
+
+
+class TestQueryResultCache:
+    """Tests for QueryResultCache on its own."""
+
+    def test_exact_key_normalizes_query_text(self):
+        options = QueryResultCache.options_key(RAGQueryRequest(query="x"))
+
+        assert normalize_query("  What is  HTN? ") == "what is htn"
+        assert QueryResultCache.query_key("What is HTN?", options) == QueryResultCache.query_key("what is htn", options)
+        assert QueryResultCache.query_key("what is dm", options) != QueryResultCache.query_key("what is htn", options)
+
+    def test_options_cover_request_filters_and_config(self):
+        base = QueryResultCache.options_key(RAGQueryRequest(query="a"), config=SearchQualityConfig())
+
+        assert base == QueryResultCache.options_key(
+            RAGQueryRequest(query="b", is_followup=True), config=SearchQualityConfig()
+        )
+        assert base != QueryResultCache.options_key(RAGQueryRequest(query="a", top_k=10), config=SearchQualityConfig())
+        assert base != QueryResultCache.options_key(
+            RAGQueryRequest(query="a"), config=SearchQualityConfig(enable_mmr=False)
+        )
+        filtered = ParsedQuery(text="a", original_query="a type:pdf", document_types=["pdf"])
+        assert base != QueryResultCache.options_key(
+            RAGQueryRequest(query="a"), filtered, config=SearchQualityConfig()
+        )
+
+    def test_semantic_tier_respects_threshold_and_options(self):
+        cache = QueryResultCache(semantic_threshold=0.95)
+        cache.put("k1", "opts", _response("first"), embedding=[1.0, 0.0, 0.0])
+
+        assert cache.get_similar("opts", [0.99, 0.1, 0.0]).query == "first"
+        assert cache.get_similar("opts", [0.7, 0.7, 0.0]) is None
+        assert cache.get_similar("other-opts", [1.0, 0.0, 0.0]) is None
+        assert cache.get_similar("opts", [1.0, 0.0]) is None
+        assert QueryResultCache(semantic_threshold=None).get_similar("opts", [1.0, 0.0, 0.0]) is None
+
+    def test_ttl_and_lru_bound(self):
+        cache = QueryResultCache(max_entries=2, ttl_seconds=60)
+        with patch("rag.query_cache.time.time", return_value=1000.0):
+            cache.put("a", "opts", _response("a"))
+            cache.put("b", "opts", _response("b"))
+            cache.get("a")
+            cache.put("c", "opts", _response("c"))
+            assert cache.get("b") is None
+            assert cache.get("a").query == "a"
+
+        with patch("rag.query_cache.time.time", return_value=1061.0):
+            assert cache.get("a") is None
+
+    def test_invalidation_drops_entries_and_late_puts(self):
+        cache = QueryResultCache()
+        cache.put("a", "opts", _response())
+        generation = cache.generation
+
+        cache.invalidate()
+        cache.put("b", "opts", _response(), generation=generation)
+
+        assert len(cache) == 0
+        assert cache.get_metrics()["invalidations"] == 1
+
+
+@pytest.fixture
+def retriever():
+    embedding_manager = Mock()
+    embedding_manager.generate_embedding.side_effect = lambda text: (
+        [1.0, 0.0, 0.0] if "hypertension" in text.lower() else [0.0, 1.0, 0.0]
+    )
+    vector_store = Mock()
+    vector_store.search.return_value = [
+        VectorSearchResult(
+            chunk_text="Hypertension management guidelines",
+            document_id="doc1",
+            chunk_index=0,
+            similarity_score=0.85,
+            metadata={"filename": "guidelines.pdf"},
+        )
+    ]
+    retriever = HybridRetriever(
+        embedding_manager=embedding_manager,
+        vector_store=vector_store,
+        config=SearchQualityConfig(enable_bm25=False, enable_query_expansion=False),
+    )
+    retriever._query_cache = QueryResultCache(semantic_threshold=0.95)
+    retriever._feedback_manager = Mock(apply_boosts=lambda results: results)
+    return retriever
+
+
+def _request(query, **kwargs):
+    return RAGQueryRequest(query=query, use_graph_search=False, similarity_threshold=0.1, **kwargs)
+
+
+class TestRetrieverCaching:
+    """Tests for the cache inside HybridRetriever.search."""
+
+    def test_repeat_query_is_served_from_cache(self, retriever):
+        first = retriever.search(_request("Hypertension treatment"))
+        first.results[0].combined_score = -1.0  # caller mutation must not leak into the cache
+        second = retriever.search(_request("hypertension  treatment?"))
+
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.results[0].combined_score > 0
+        assert retriever._vector_store.search.call_count == 1
+        # Exact hits skip the embedding too
+        assert retriever._embedding_manager.generate_embedding.call_count == 1
+
+    def test_paraphrase_uses_semantic_tier_unless_followup(self, retriever):
+        retriever.search(_request("Hypertension treatment"))
+
+        paraphrase = retriever.search(_request("how to treat hypertension"))
+        assert paraphrase.cache_hit is True
+
+        followup = retriever.search(_request("and hypertension in pregnancy", is_followup=True))
+        assert followup.cache_hit is False
+        assert retriever._vector_store.search.call_count == 2
+
+    def test_disabled_or_invalidated_cache_searches_again(self, retriever):
+        retriever.search(_request("Hypertension treatment"))
+
+        assert retriever.search(_request("Hypertension treatment", enable_cache=False)).cache_hit is False
+        retriever._query_cache.invalidate()
+        assert retriever.search(_request("Hypertension treatment")).cache_hit is False
+        assert retriever._vector_store.search.call_count == 3
+
+    def test_feedback_changes_bypass_cached_results(self, retriever):
+        retriever.search(_request("Hypertension treatment"))
+
+        with patch("rag.feedback_manager.get_feedback_version", return_value=-1):
+            assert retriever.search(_request("Hypertension treatment")).cache_hit is False
+
+
+def test_document_manager_invalidates_on_delete():
+    from managers.rag_document_manager import RAGDocumentManager
+
+    manager = RAGDocumentManager.__new__(RAGDocumentManager)
+    manager._get_vector_store = Mock()
+    manager._get_db_manager = Mock()
+    cache = QueryResultCache()
+    cache.put("a", "opts", _response())
+
+    with patch("rag.query_cache._query_cache", cache):
+        assert manager.delete_document("doc1") is True
+
+    assert len(cache) == 0
+    assert cache.get_metrics()["invalidations"] == 1
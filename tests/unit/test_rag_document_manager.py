@@ -624,6 +624,16 @@ class TestDeleteDocument:
         vector.delete_document.assert_called_once_with("doc-456")
         assert db.execute.call_count == 2
 
+    def test_delete_drops_cached_extraction(self):
+        db = MagicMock()
+        db.fetchone.return_value = ("/docs/scan.pdf", json.dumps({"file_hash": "abc123"}))
+        mgr = _make_manager(db=db, vector=MagicMock())
+
+        with patch("managers.rag_document_manager.forget_extraction") as forget:
+            assert mgr.delete_document("doc-456") is True
+
+        forget.assert_called_once_with("abc123", "/docs/scan.pdf")
+
     def test_delete_failure(self):
         db = MagicMock()
         vector = MagicMock()
@@ -0,0 +1,72 @@
+"""Per-call cost of rate limit checks with a busy embedding window.
+
+Times RateLimiter.check_rate_limit against the previous approach of
+rebuilding the list of call timestamps on every check, with thousands of
+calls inside the window, and checks that no check touches the disk.
+"""
+import logging
+import threading
+import time
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.benchmark
+
+
+_LIMIT = 3000          # openai_embeddings requests per minute
+_CHECKS = 20_000
+_THREADS = 8
+
+
+def _list_filter_checks(count, max_calls, window_seconds):
+    """The old per-key algorithm: filter the whole list, then append."""
+    calls = []
+    for _ in range(count):
+        now = time.time()
+        window_start = now - window_seconds
+        calls = [ts for ts in calls if ts > window_start]
+        if len(calls) < max_calls:
+            calls.append(now)
+
+
+def test_check_cost_with_full_embedding_window(tmp_path):
+    from utils.security.rate_limiter import RateLimiter
+
+    storage = tmp_path / ".rate_limits.json"
+    limiter = RateLimiter(storage_path=storage)
+    limiter.set_limit("openai_embeddings", _LIMIT, 60)
+
+    start = time.perf_counter()
+    allowed = sum(limiter.check_rate_limit("openai_embeddings")[0] for _ in range(_CHECKS))
+    ring_us = (time.perf_counter() - start) / _CHECKS * 1e6
+
+    start = time.perf_counter()
+    _list_filter_checks(_CHECKS, _LIMIT, 60)
+    list_us = (time.perf_counter() - start) / _CHECKS * 1e6
+
+    providers = ["openai", "anthropic", "groq", "deepgram", "elevenlabs", "gemini", "cerebras", "modulate"]
+    for provider in providers:
+        limiter.set_limit(provider, _CHECKS, 60)
+
+    def worker(provider):
+        for _ in range(_CHECKS // _THREADS):
+            limiter.check_rate_limit(provider)
+
+    threads = [threading.Thread(target=worker, args=(p,)) for p in providers]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    threaded_us = (time.perf_counter() - start) / _CHECKS * 1e6
+
+    logger.info(f"Rate limit check ({_LIMIT} calls in window): ring {ring_us:.2f} us, "
+                f"list filter {list_us:.1f} us, {_THREADS} providers in parallel {threaded_us:.2f} us/check")
+
+    assert allowed == _LIMIT
+    assert not storage.exists()  # nothing written on the request path
+    limiter.close()
+    assert storage.exists()
+    assert ring_us * 5 < list_us
@@ -0,0 +1,121 @@
+"""Performance tests for recording list loads with materialized document flags."""
+import logging
+import random
+import time
+
+import pytest
+
+from database.database import Database
+from database.migration_definitions import get_all_migrations
+from database.schema import RecordingSchema
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.benchmark
+
+
+_RECORDINGS = 20_000
+# Large enough that every document spills onto overflow pages
+_DOCUMENT_CHARS = 6_000
+
+
+@pytest.fixture(scope="module")
+def large_db(tmp_path_factory):
+    db = Database(str(tmp_path_factory.mktemp("list") / "list.db"))
+    db.create_tables()
+    db.create_queue_tables()
+    rng = random.Random(7)
+    text = "x" * _DOCUMENT_CHARS
+    rows = []
+    for i in range(_RECORDINGS):
+        has_soap = rng.random() < 0.7
+        rows.append((f"recording_{i}.wav", text, text if has_soap else None, int(has_soap),
+                     f"2024-01-01 00:00:{i:05d}", "completed"))
+    migration = next(m for m in get_all_migrations() if m.version == 19)
+    with db.connection() as (conn, cursor):
+        cursor.executemany(
+            "INSERT INTO recordings (filename, transcript, soap_note, has_soap, timestamp, processing_status) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        conn.executescript(migration.up_sql)
+    yield db
+    db.close_all_connections()
+
+
+def _derived_flags_page(db, limit, offset):
+    """The pre-migration list query that derived flags from the text columns."""
+    columns = ', '.join(RecordingSchema.LIGHTWEIGHT_COLUMNS)
+    with db.connection() as (conn, cursor):
+        cursor.execute(f"""
+            SELECT {columns},
+                   CASE WHEN transcript IS NOT NULL AND transcript != '' THEN 1 ELSE 0 END,
+                   CASE WHEN soap_note IS NOT NULL AND soap_note != '' THEN 1 ELSE 0 END,
+                   CASE WHEN referral IS NOT NULL AND referral != '' THEN 1 ELSE 0 END,
+                   CASE WHEN letter IS NOT NULL AND letter != '' THEN 1 ELSE 0 END
+            FROM recordings ORDER BY timestamp DESC LIMIT ? OFFSET ?
+        """, (limit, offset))
+        return cursor.fetchall()
+
+
+def _best_of(fn, runs=3):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+class TestListLoadPerformance:
+    """Flag columns plus the covering index should avoid reading document text."""
+
+    def test_uses_covering_index(self, large_db):
+        with large_db.connection() as (conn, cursor):
+            cursor.execute("""
+                EXPLAIN QUERY PLAN
+                SELECT id, filename, patient_name, timestamp, duration, processing_status,
+                       has_transcript, has_soap, has_referral, has_letter
+                FROM recordings ORDER BY timestamp DESC LIMIT 500
+            """)
+            plan = " ".join(str(row) for row in cursor.fetchall())
+        assert "COVERING INDEX idx_recordings_list" in plan
+
+    def test_list_page_faster_than_derived_flags(self, large_db):
+        derived_time, derived = _best_of(lambda: _derived_flags_page(large_db, 5000, 0))
+        flag_time, flagged = _best_of(lambda: large_db.get_recordings_lightweight(limit=5000))
+
+        assert [row[0] for row in derived] == [r['id'] for r in flagged]
+        assert [bool(row[-3]) for row in derived] == [r['has_soap'] for r in flagged]
+        assert flag_time < derived_time
+        logger.info(f"5000-row list page over {_RECORDINGS} recordings: derived flags "
+                    f"{derived_time * 1000:.1f}ms, materialized flags {flag_time * 1000:.1f}ms "
+                    f"({derived_time / flag_time:.1f}x)")
+
+
+class TestDeepPagePerformance:
+    """Keyset pages cost the same at any depth; OFFSET pages grow with it."""
+
+    def test_keyset_uses_index(self, large_db):
+        with large_db.connection() as (conn, cursor):
+            cursor.execute("""
+                EXPLAIN QUERY PLAN
+                SELECT id FROM recordings WHERE (timestamp, id) < (?, ?)
+                ORDER BY timestamp DESC, id DESC LIMIT 100
+            """, ("2024-01-01 00:00:10000", 10000))
+            plan = " ".join(str(row) for row in cursor.fetchall())
+        assert "idx_recordings_list" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_deep_keyset_page_faster_than_offset(self, large_db):
+        depth = _RECORDINGS - 200
+        page = large_db.get_recordings_page(limit=depth)
+        cursor = page["next_cursor"]
+
+        offset_time, by_offset = _best_of(lambda: large_db.get_recordings_lightweight(limit=100, offset=depth))
+        keyset_time, by_keyset = _best_of(lambda: large_db.get_recordings_page(limit=100, cursor=cursor))
+
+        assert [r['id'] for r in by_offset] == [r['id'] for r in by_keyset["results"]]
+        assert keyset_time < offset_time
+        logger.info(f"100-row page at depth {depth}: OFFSET {offset_time * 1000:.2f}ms, "
+                    f"keyset {keyset_time * 1000:.2f}ms ({offset_time / keyset_time:.1f}x)")
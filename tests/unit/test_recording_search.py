@@ -0,0 +1,184 @@
+"""
+Unit tests for FTS-backed recording search.
+
+Tests cover MATCH expression building, bm25 ranking with column weights,
+snippets, keyset pagination, date/patient filters and the LIKE fallback
+for substrings the index cannot match and databases without the index.
+"""
+
+import pytest
+
+from database.database import Database
+from database.migration_definitions import get_all_migrations
+from database.mixins.recording_mixin import _build_fts_query
+
+
+def _apply_search_index(db: Database) -> None:
+    """Bring a bare test database up to the migration 18 search index."""
+    db.create_tables()
+    db.create_queue_tables()
+    migration = next(m for m in get_all_migrations() if m.version == 18)
+    with db.connection() as (conn, cursor):
+        cursor.execute("PRAGMA table_info(recordings)")
+        if 'chat' not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute("ALTER TABLE recordings ADD COLUMN chat TEXT")
+        conn.executescript(migration.up_sql)
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "search.db"))
+    _apply_search_index(database)
+    yield database
+    database.close_all_connections()
+
+
+class TestBuildFtsQuery:
+    """Tests for free-text to MATCH translation."""
+
+    def test_words_become_prefix_terms(self):
+        assert _build_fts_query("chest pain") == '"chest"* "pain"*'
+
+    def test_quoted_phrase(self):
+        assert _build_fts_query('"chest pain" hyper') == '"chest pain" "hyper"*'
+
+    def test_operators_and_punctuation_stripped(self):
+        assert _build_fts_query("'; DROP TABLE -- NEAR(") == '"DROP"* "TABLE"* "NEAR"*'
+
+    def test_no_words(self):
+        assert _build_fts_query("  -- ** ") == ""
+
+
+class TestRankedSearch:
+    """Tests for search_recordings_ranked against the FTS index."""
+
+    def test_weighted_ranking_and_snippet(self, db):
+        in_transcript = db.add_recording("a.wav", transcript="patient mentions asthma once in a long talk")
+        in_soap = db.add_recording("b.wav", soap_note="Assessment: asthma exacerbation")
+
+        page = db.search_recordings_ranked("asthma")
+
+        assert [r['id'] for r in page['results']] == [in_soap, in_transcript]
+        assert page['results'][0]['snippet'] == "Assessment: [asthma] exacerbation"
+        assert page['results'][0]['has_soap'] is True
+        assert page['next_cursor'] is None
+
+    def test_prefix_and_phrase(self, db):
+        rec = db.add_recording("a.wav", transcript="known hypertension, reports chest pain")
+        db.add_recording("b.wav", transcript="pain in the chest wall")
+
+        assert [r['id'] for r in db.search_recordings_ranked("hyper")['results']] == [rec]
+        assert [r['id'] for r in db.search_recordings_ranked('"chest pain"')['results']] == [rec]
+
+    def test_keyset_pagination_covers_all_hits_once(self, db):
+        ids = {db.add_recording(f"r{i}.wav", transcript="follow up visit " * (i + 1)) for i in range(7)}
+
+        seen, cursor = [], None
+        while True:
+            page = db.search_recordings_ranked("follow", limit=3, cursor=cursor)
+            seen.extend(r['id'] for r in page['results'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+
+        assert len(seen) == len(set(seen)) == 7
+        assert set(seen) == ids
+
+    def test_patient_and_date_filters(self, db):
+        jane = db.add_recording("a.wav", transcript="migraine", patient_name="Jane Doe")
+        db.add_recording("b.wav", transcript="migraine", patient_name="John Roe")
+
+        page = db.search_recordings_ranked("migraine", patient_name="jane doe")
+        assert [r['id'] for r in page['results']] == [jane]
+
+        page = db.search_recordings_ranked("migraine", end_date="2000-01-01")
+        assert page['results'] == []
+
+    def test_index_follows_updates_and_deletes(self, db):
+        rec = db.add_recording("a.wav", transcript="initial words")
+        db.update_recording(rec, transcript="replacement text")
+        assert db.search_recordings_ranked("initial")['results'] == []
+        assert len(db.search_recordings_ranked("replacement")['results']) == 1
+
+        db.delete_recording(rec)
+        assert db.search_recordings_ranked("replacement")['results'] == []
+
+    def test_filename_and_patient_name_indexed(self, db):
+        rec = db.add_recording("cardiology_followup.wav", patient_name="Maria Lopez")
+        assert [r['id'] for r in db.search_recordings("cardiology")] == [rec]
+        assert [r['id'] for r in db.search_recordings("lopez")] == [rec]
+
+    def test_substring_inside_word_falls_back_to_like(self, db):
+        rec = db.add_recording("a.wav", transcript="known hypertension", patient_name="MRN 0048213")
+        db.add_recording("b.wav", transcript="no relevant findings")
+
+        page = db.search_recordings_ranked("ertension")
+        assert [r['id'] for r in page['results']] == [rec]
+        assert page['results'][0]['score'] == 0.0
+        assert [r['id'] for r in db.search_recordings("ertension")] == [rec]
+        assert [r['id'] for r in db.search_recordings("8213")] == [rec]
+        assert [r['id'] for r in db.search_recordings_ranked("48213")['results']] == [rec]
+
+    def test_word_and_substring_matches_are_combined(self, db):
+        substring_only = db.add_recording("a.wav", transcript="known hypertension")
+        word_match = db.add_recording("b.wav", transcript="tension headache since monday")
+
+        page = db.search_recordings_ranked("tension")
+        assert [r['id'] for r in page['results']] == [word_match, substring_only]
+        assert page['results'][0]['snippet'] == "[tension] headache since monday"
+        assert page['results'][1]['score'] == 0.0
+        assert {r['id'] for r in db.search_recordings("tension")} == {word_match, substring_only}
+
+    def test_pages_continue_from_word_matches_into_substring_matches(self, db):
+        word_ids = {db.add_recording(f"w{i}.wav", transcript="tension headache") for i in range(3)}
+        substring_ids = {db.add_recording(f"s{i}.wav", transcript="hypertension") for i in range(3)}
+
+        seen, cursor = [], None
+        while True:
+            page = db.search_recordings_ranked("tension", limit=2, cursor=cursor)
+            seen.extend(r['id'] for r in page['results'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+
+        assert len(seen) == len(set(seen)) == 6
+        assert set(seen[:3]) == word_ids and set(seen[3:]) == substring_ids
+
+    def test_like_fallback_pages_with_cursor(self, db):
+        ids = {db.add_recording(f"r{i}.wav", transcript="hypertensive crisis") for i in range(5)}
+
+        seen, cursor = [], None
+        while True:
+            page = db.search_recordings_ranked("pertens", limit=2, cursor=cursor)
+            seen.extend(r['id'] for r in page['results'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+
+        assert len(seen) == len(set(seen)) == 5
+        assert set(seen) == ids
+
+    def test_last_fts_page_does_not_repeat_hits(self, db):
+        for i in range(2):
+            db.add_recording(f"r{i}.wav", transcript="asthma review")
+
+        page = db.search_recordings_ranked("asthma", limit=2)
+        assert page['next_cursor'] is not None
+        assert db.search_recordings_ranked("asthma", limit=2, cursor=page['next_cursor'])['results'] == []
+
+
+class TestWithoutIndex:
+    """Databases without recordings_fts fall back to LIKE."""
+
+    def test_like_fallback(self, tmp_path):
+        database = Database(str(tmp_path / "plain.db"))
+        database.create_tables()
+        database.create_queue_tables()
+        rec = database.add_recording("a.wav", transcript="Patient has hypertension")
+
+        page = database.search_recordings_ranked("tension")
+
+        assert [r['id'] for r in page['results']] == [rec]
+        assert page['results'][0]['score'] == 0.0
+        assert page['results'][0]['snippet'] is None
+        database.close_all_connections()
@@ -0,0 +1,115 @@
+"""Performance tests for FTS-backed recording search on a synthetic 50k-recording database."""
+import logging
+import random
+import time
+
+import pytest
+
+from database.database import Database
+from database.schema import RecordingSchema
+from tests.unit.test_recording_search import _apply_search_index
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.benchmark
+
+
+_RECORDINGS = 50_000
+_RARE_TERM = "pheochromocytoma"
+
+_VOCABULARY = (
+    "patient reports pain fever cough headache nausea fatigue dizziness blood pressure "
+    "stable improving worse follow up medication dose daily twice review history exam "
+    "normal abnormal chest abdomen lungs clear heart regular rhythm rash swelling knee "
+    "back shoulder sleep appetite weight diet exercise plan referral labs imaging"
+).split()
+
+
+def _note(rng, words):
+    return " ".join(rng.choice(_VOCABULARY) for _ in range(words))
+
+
+@pytest.fixture(scope="module")
+def large_db(tmp_path_factory):
+    db = Database(str(tmp_path_factory.mktemp("search") / "large.db"))
+    _apply_search_index(db)
+    rng = random.Random(42)
+    rows = []
+    for i in range(_RECORDINGS):
+        transcript = _note(rng, 120)
+        if i % 1000 == 0:
+            transcript += f" suspected {_RARE_TERM}"
+        rows.append((f"recording_{i}.wav", transcript, _note(rng, 40), f"Patient {i % 500}",
+                     f"2024-{1 + i % 12:02d}-{1 + i % 28:02d} 10:00:00"))
+    with db.connection() as (conn, cursor):
+        cursor.executemany(
+            "INSERT INTO recordings (filename, transcript, soap_note, patient_name, timestamp) VALUES (?, ?, ?, ?, ?)",
+            rows
+        )
+    yield db
+    db.close_all_connections()
+
+
+def _like_search(db, term):
+    """The pre-FTS search_recordings query."""
+    columns = ', '.join(RecordingSchema.SELECT_COLUMNS)
+    pattern = f"%{term}%"
+    with db.connection() as (conn, cursor):
+        cursor.execute(
+            f"""SELECT {columns} FROM recordings
+                WHERE filename LIKE ? OR transcript LIKE ? OR soap_note LIKE ?
+                OR referral LIKE ? OR letter LIKE ?
+                ORDER BY timestamp DESC""",
+            (pattern,) * 5
+        )
+        return cursor.fetchall()
+
+
+def _best_of(fn, runs=3):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+class TestSearchPerformance:
+    """Ranked pages should beat the LIKE scan once word matches fill them."""
+
+    def test_rare_term(self, large_db):
+        like_time, like_rows = _best_of(lambda: _like_search(large_db, _RARE_TERM))
+        fts_time, fts_rows = _best_of(lambda: large_db.search_recordings(_RARE_TERM))
+        ranked_time, page = _best_of(lambda: large_db.search_recordings_ranked(_RARE_TERM, limit=50))
+
+        # Few word matches: both searches still scan for substring matches,
+        # so the FTS half should only add a small overhead to the LIKE scan
+        assert len(like_rows) == len(fts_rows) == len(page['results']) == _RECORDINGS // 1000
+        assert fts_time < like_time * 2
+        assert ranked_time < like_time * 2
+        logger.info(f"Rare term over {_RECORDINGS} recordings: LIKE {like_time * 1000:.1f}ms, "
+                    f"FTS + LIKE {fts_time * 1000:.1f}ms, ranked page {ranked_time * 1000:.1f}ms")
+
+    def test_common_term_first_page(self, large_db):
+        like_time, like_rows = _best_of(lambda: _like_search(large_db, "headache"))
+        ranked_time, page = _best_of(lambda: large_db.search_recordings_ranked("headache", limit=50))
+
+        assert len(page['results']) == 50
+        assert page['next_cursor'] is not None
+        assert all('[headache]' in r['snippet'] for r in page['results'])
+        assert ranked_time < like_time
+        logger.info(f"Common term ({len(like_rows)} hits): LIKE all rows {like_time * 1000:.1f}ms, "
+                    f"ranked first page {ranked_time * 1000:.1f}ms")
+
+    def test_filtered_second_page(self, large_db):
+        first = large_db.search_recordings_ranked("fever", limit=20, patient_name="Patient 7")
+        start = time.perf_counter()
+        second = large_db.search_recordings_ranked(
+            "fever", limit=20, patient_name="Patient 7", cursor=first['next_cursor']
+        )
+        elapsed = time.perf_counter() - start
+
+        first_ids = {r['id'] for r in first['results']}
+        assert second['results'] and first_ids.isdisjoint(r['id'] for r in second['results'])
+        assert all(r['patient_name'] == "Patient 7" for r in second['results'])
+        logger.info(f"Filtered keyset page 2: {elapsed * 1000:.1f}ms")
@@ -0,0 +1,125 @@
+"""
+Unit tests for the virtualized recordings list.
+
+Tests cover keyset paging in the database (get_recordings_page) and the
+RecordingsListModel page cache: cursor walking, viewport-sized eviction
+and row counts for sources without a known total.
+"""
+
+import pytest
+
+from database.database import Database
+from ui.components.recordings_list_model import RecordingsListModel
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "list.db"))
+    database.create_tables()
+    database.create_queue_tables()
+    yield database
+    database.close_all_connections()
+
+
+def _list_source(count):
+    """In-memory keyset source over ids count..1 that records every fetch."""
+    ids = list(range(count, 0, -1))
+    calls = []
+
+    def fetch_page(limit, cursor):
+        calls.append(cursor)
+        start = 0 if cursor is None else ids.index(cursor) + 1
+        rows = [{"id": i} for i in ids[start:start + limit]]
+        next_cursor = rows[-1]["id"] if len(rows) == limit else None
+        return {"results": rows, "next_cursor": next_cursor}
+
+    return fetch_page, calls
+
+
+class TestGetRecordingsPage:
+    """Tests for keyset pagination in RecordingMixin."""
+
+    def test_pages_cover_all_rows_in_order(self, db):
+        for i in range(7):
+            db.add_recording(f"r{i}.wav", transcript="t" if i % 2 else None)
+        # Two rows share a timestamp so ordering must fall back to id
+        with db.connection() as (conn, cursor):
+            cursor.execute("UPDATE recordings SET timestamp = '2024-01-01 10:00:00'")
+
+        seen, cursor = [], None
+        while True:
+            page = db.get_recordings_page(limit=3, cursor=cursor)
+            seen.extend(page["results"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert [r["id"] for r in seen] == [7, 6, 5, 4, 3, 2, 1]
+        assert [r["has_transcript"] for r in seen] == [False, True, False, True, False, True, False]
+        assert "transcript" not in seen[0]
+        assert db.get_recordings_count() == 7
+
+    def test_empty_table(self, db):
+        assert db.get_recordings_page(limit=10) == {"results": [], "next_cursor": None}
+        assert db.get_recordings_count() == 0
+
+
+class TestRecordingsListModel:
+    """Tests for the windowed page cache."""
+
+    def test_rows_placeholder_until_loaded(self):
+        fetch_page, _ = _list_source(250)
+        model = RecordingsListModel(fetch_page, page_size=100, total=250)
+
+        assert model.rows(95, 10) == [None] * 10
+        assert model.missing_pages(95, 10) == [0, 1]
+
+        model.load_pages([0, 1])
+        assert [r["id"] for r in model.rows(95, 10)] == list(range(155, 145, -1))
+        assert model.missing_pages(95, 10) == []
+
+    def test_jump_walks_forward_from_nearest_cursor(self):
+        fetch_page, calls = _list_source(1000)
+        model = RecordingsListModel(fetch_page, page_size=100, total=1000, max_cached_pages=2)
+
+        model.load_pages([5])
+        assert len(calls) == 6
+        assert model.rows(500, 1)[0]["id"] == 500
+
+        # Cursors are remembered, so revisiting an evicted page is one query
+        model.load_pages([1])
+        assert len(calls) == 7
+        assert model.rows(100, 1)[0]["id"] == 900
+
+    def test_eviction_follows_viewport(self):
+        fetch_page, _ = _list_source(1000)
+        model = RecordingsListModel(fetch_page, page_size=100, total=1000)
+        model.set_viewport(50)
+
+        model.load_pages(list(range(10)))
+        assert model.cached_page_count == 3
+        # Most recently used pages survive
+        assert model.missing_pages(700, 300) == []
+
+    def test_unknown_total_grows_until_last_page(self):
+        fetch_page, _ = _list_source(230)
+        model = RecordingsListModel(fetch_page, page_size=100)
+
+        assert model.row_count == 100
+        model.load_pages([0])
+        assert model.row_count == 200
+        assert not model.is_complete
+
+        model.load_pages([2])
+        assert model.row_count == 230
+        assert model.is_complete
+        assert model.missing_pages(200, 100) == []
+        assert len(model.rows(220, 50)) == 10
+
+    def test_over_database(self, db):
+        for i in range(25):
+            db.add_recording(f"r{i}.wav")
+        model = RecordingsListModel(db.get_recordings_page, page_size=10, total=db.get_recordings_count())
+
+        model.load_pages(model.missing_pages(18, 5))
+        assert [r["filename"] for r in model.rows(18, 5)] == [f"r{i}.wav" for i in range(6, 1, -1)]
@@ -325,5 +325,41 @@ def test_integration_with_actual_api_call():
     assert client.call_count == 3
 
 
+class TestAsyncDecorators:
+    """Decorators applied to coroutine functions stay awaitable."""
+
+    def test_retry_async(self):
+        import asyncio
+        calls = []
+
+        @retry(max_retries=2, initial_delay=0.01)
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise APIError("Failed")
+            return "success"
+
+        assert asyncio.iscoroutinefunction(flaky)
+        assert asyncio.run(flaky()) == "success"
+        assert len(calls) == 3
+
+    def test_resilient_api_call_async_opens_circuit(self):
+        import asyncio
+
+        @resilient_api_call(max_retries=0, initial_delay=0.01, failure_threshold=2, recovery_timeout=60)
+        async def always_fail():
+            raise APIError("Always fails")
+
+        async def run():
+            for _ in range(2):
+                with pytest.raises(APIError):
+                    await always_fail()
+            with pytest.raises(ServiceUnavailableError):
+                await always_fail()
+
+        asyncio.run(run())
+        assert always_fail.circuit_breaker.state == CircuitState.OPEN
+
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
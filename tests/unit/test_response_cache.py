@@ -0,0 +1,201 @@
+"""
+Unit tests for the shared LLM response cache.
+
+Tests cover LRU/TTL eviction, namespacing, single-flight coalescing of
+concurrent identical requests, metrics and encrypted SQLite persistence.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from cryptography.fernet import Fernet
+
+from ai.response_cache import ResponseCache, get_response_cache, reset_response_cache
+
+
+class _FernetCipher:
+    """Test cipher matching SecureKeyStorage.encrypt_data/decrypt_data."""
+
+    def __init__(self):
+        self._fernet = Fernet(Fernet.generate_key())
+
+    def encrypt_data(self, data: bytes) -> bytes:
+        return self._fernet.encrypt(data)
+
+    def decrypt_data(self, token: bytes) -> bytes:
+        return self._fernet.decrypt(token)
+
+
+class TestLRUAndTTL:
+    """Tests for in-memory eviction."""
+
+    def test_put_and_get(self):
+        cache = ResponseCache()
+        cache.put("k", "v", namespace="agent")
+        assert cache.get("k", namespace="agent") == "v"
+
+    def test_namespaces_are_isolated(self):
+        cache = ResponseCache()
+        cache.put("k", "v", namespace="a")
+        assert cache.get("k", namespace="b") is None
+
+    def test_lru_eviction_per_namespace(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put("k1", "v1", namespace="a")
+        cache.put("k2", "v2", namespace="a")
+        cache.get("k1", namespace="a")
+        cache.put("k3", "v3", namespace="a")
+
+        assert cache.get("k2", namespace="a") is None
+        assert cache.get("k1", namespace="a") == "v1"
+        assert cache.size("a") == 2
+        assert cache.get_metrics("a")["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        cache = ResponseCache(ttl_seconds=10)
+        cache.put("k", "v", namespace="a")
+
+        with patch('ai.response_cache.time.time', return_value=time.time() + 11):
+            assert cache.get("k", namespace="a") is None
+        assert cache.size("a") == 0
+
+    def test_invalidate_namespace(self):
+        cache = ResponseCache()
+        cache.put("k", "v", namespace="a")
+        cache.put("k", "v", namespace="b")
+
+        cache.invalidate("a")
+
+        assert cache.size("a") == 0
+        assert cache.size("b") == 1
+
+
+class TestSingleFlight:
+    """Tests for get_or_compute coalescing."""
+
+    def test_concurrent_identical_requests_call_once(self):
+        cache = ResponseCache()
+        calls = []
+        release = threading.Event()
+
+        def compute():
+            calls.append(1)
+            release.wait(timeout=5)
+            return "response"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                cache.get_or_compute("k", compute, namespace="a")))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        # Give followers time to join the in-flight request
+        time.sleep(0.1)
+        release.set()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert len(calls) == 1
+        assert results == ["response"] * 5
+        assert cache.get_metrics("a")["coalesced"] == 4
+
+    def test_error_propagates_and_is_not_cached(self):
+        cache = ResponseCache()
+
+        def fail():
+            raise RuntimeError("api down")
+
+        with pytest.raises(RuntimeError, match="api down"):
+            cache.get_or_compute("k", fail, namespace="a")
+        assert cache.get_or_compute("k", lambda: "ok", namespace="a") == "ok"
+
+    def test_latency_saved_recorded_on_hit(self):
+        cache = ResponseCache()
+
+        def slow():
+            time.sleep(0.02)
+            return "v"
+
+        cache.get_or_compute("k", slow, namespace="a")
+        cache.get_or_compute("k", slow, namespace="a")
+
+        metrics = cache.get_metrics("a")
+        assert metrics["hits"] == 1
+        assert metrics["misses"] == 1
+        assert metrics["latency_saved_seconds"] > 0
+
+
+class TestPersistence:
+    """Tests for encrypted SQLite persistence."""
+
+    def test_survives_restart(self, tmp_path):
+        cipher = _FernetCipher()
+        db_path = tmp_path / "response_cache.db"
+
+        first = ResponseCache(persist_path=db_path, cipher=cipher)
+        first.put("k", "patient has hypertension", namespace="a")
+        first.close()
+
+        second = ResponseCache(persist_path=db_path, cipher=cipher)
+        assert second.get("k", namespace="a") == "patient has hypertension"
+        assert second.get_metrics("a")["disk_hits"] == 1
+        second.close()
+
+    def test_values_encrypted_at_rest(self, tmp_path):
+        db_path = tmp_path / "response_cache.db"
+        cache = ResponseCache(persist_path=db_path, cipher=_FernetCipher())
+        cache.put("k", "patient has hypertension", namespace="a")
+        cache.close()
+
+        assert b"hypertension" not in db_path.read_bytes()
+
+    def test_wrong_key_is_a_miss(self, tmp_path):
+        db_path = tmp_path / "response_cache.db"
+        cache = ResponseCache(persist_path=db_path, cipher=_FernetCipher())
+        cache.put("k", "v", namespace="a")
+        cache.close()
+
+        other = ResponseCache(persist_path=db_path, cipher=_FernetCipher())
+        assert other.get("k", namespace="a") is None
+        other.close()
+
+    def test_invalidate_clears_disk(self, tmp_path):
+        db_path = tmp_path / "response_cache.db"
+        cipher = _FernetCipher()
+        cache = ResponseCache(persist_path=db_path, cipher=cipher)
+        cache.put("k", "v", namespace="a")
+        cache.invalidate("a")
+        cache.close()
+
+        reopened = ResponseCache(persist_path=db_path, cipher=cipher)
+        assert reopened.get("k", namespace="a") is None
+        reopened.close()
+
+    def test_disk_pruned_during_use(self, tmp_path):
+        import sqlite3
+        db_path = tmp_path / "response_cache.db"
+        cache = ResponseCache(persist_path=db_path, max_disk_entries=5)
+        with patch("ai.response_cache.DISK_PRUNE_INTERVAL", 10):
+            for i in range(10):
+                cache.put(f"k{i}", "v", namespace="a")
+        cache.close()
+
+        with sqlite3.connect(db_path) as conn:
+            count = conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+        assert count == 5
+
+
+class TestGlobalInstance:
+    """Tests for the process-wide singleton."""
+
+    def test_returns_same_instance(self):
+        assert get_response_cache() is get_response_cache()
+
+    def test_reset_creates_new_instance(self):
+        first = get_response_cache()
+        reset_response_cache()
+        assert get_response_cache() is not first
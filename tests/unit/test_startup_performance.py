@@ -0,0 +1,67 @@
+"""Cold-start import cost of the startup path, held to a budget.
+
+Each module is imported in a fresh interpreter with -X importtime. The
+provider SDKs and rarely used dialogs must stay off the startup path; that
+check always runs. The wall-clock budgets are several times the measured
+cost, but still depend on the machine, so they only run as benchmarks.
+"""
+import logging
+
+import pytest
+
+from utils.startup_profiler import measure_cold_import
+
+logger = logging.getLogger(__name__)
+
+# Modules that must only load on first use
+_DEFERRED = ("openai", "anthropic", "google.genai", "ui.dialogs.rsvp_dialog",
+             "ui.dialogs.translation_settings_dialog", "ai.rag_processor")
+
+# (module, budget in seconds)
+_STARTUP_MODULES = (
+    ("ai.ai_processor", 2.5),
+    ("ui.dialogs.dialogs", 1.0),
+    ("ui.dialogs.unified_settings_dialog", 2.0),
+)
+
+
+def _report(profile):
+    slowest = ", ".join(f"{name} {cost * 1000:.0f} ms" for name, cost in profile.slowest(3))
+    logger.info(f"{profile.module}: cold import {profile.seconds * 1000:.0f} ms ({slowest})")
+
+
+def _app_initializer_profile():
+    try:
+        return measure_cold_import("core.app_initializer")
+    except ImportError as e:
+        pytest.skip(f"application dependencies not installed: {e}")
+
+
+@pytest.mark.parametrize("module", [module for module, _ in _STARTUP_MODULES])
+def test_startup_modules_defer_heavy_imports(module):
+    profile = measure_cold_import(module)
+
+    assert [name for name in _DEFERRED if name in profile.loaded] == []
+
+
+def test_app_initializer_defers_heavy_imports():
+    profile = _app_initializer_profile()
+
+    assert [name for name in _DEFERRED if name in profile.loaded] == []
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("module,budget", _STARTUP_MODULES)
+def test_startup_module_import_budget(module, budget):
+    profile = measure_cold_import(module)
+    _report(profile)
+
+    profile.check_budget(budget)
+
+
+@pytest.mark.benchmark
+def test_app_initializer_import_budget():
+    profile = _app_initializer_profile()
+    _report(profile)
+
+    profile.check_budget(5.0)
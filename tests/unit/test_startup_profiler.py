@@ -0,0 +1,189 @@
+"""
+Unit tests for the startup profiler and the lazy loading helpers.
+
+Covers per-component timing and budgets, lazy module and component
+proxies, lazily re-exported facade names and -X importtime parsing.
+"""
+
+import sys
+import threading
+import time
+import types
+from unittest.mock import Mock
+
+import pytest
+
+from utils.lazy_loader import LazyComponent, is_loaded, lazy_exports, lazy_import, resolve
+from utils.startup_profiler import (
+    IMPORT,
+    INIT,
+    ImportProfile,
+    StartupBudgetExceeded,
+    StartupProfiler,
+    _parse_importtime,
+    get_startup_profiler,
+    reset_startup_profiler,
+)
+
+
+@pytest.fixture
+def profiler():
+    reset_startup_profiler()
+    yield get_startup_profiler()
+    reset_startup_profiler()
+
+
+class TestStartupProfiler:
+    """Tests for StartupProfiler."""
+
+    def test_measure_records_components_by_kind(self):
+        profiler = StartupProfiler()
+
+        with profiler.measure("database"):
+            time.sleep(0.01)
+        profiler.record("openai", 0.25, kind=IMPORT)
+
+        assert [t.name for t in profiler.timings(INIT)] == ["database"]
+        assert profiler.timings(INIT)[0].seconds >= 0.01
+        assert [t.name for t in profiler.slowest(1)] == ["openai"]
+        assert "openai" in profiler.report()
+
+    def test_measure_records_failed_components(self):
+        profiler = StartupProfiler()
+
+        with pytest.raises(RuntimeError):
+            with profiler.measure("audio"):
+                raise RuntimeError("no device")
+
+        assert [t.name for t in profiler.timings()] == ["audio"]
+
+    def test_budget_uses_first_interactive_frame(self):
+        profiler = StartupProfiler()
+        profiler.record("create_ui", 0.5)
+        interactive = profiler.mark_interactive()
+
+        assert profiler.mark_interactive() == interactive  # only the first frame counts
+        profiler.check_budget(interactive + 1.0)
+        with pytest.raises(StartupBudgetExceeded, match="create_ui 500 ms"):
+            profiler.check_budget(interactive / 2)
+
+    def test_import_profile_budget_names_slowest_imports(self):
+        profile = ImportProfile("core.app", 3.0, direct={"ai.ai_processor": 2.0, "ttkbootstrap": 0.1})
+
+        profile.check_budget(5.0)
+        with pytest.raises(StartupBudgetExceeded, match="ai.ai_processor 2000 ms"):
+            profile.check_budget(2.5)
+
+    def test_parse_importtime_finds_direct_imports(self):
+        stderr = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 |     openai._client",
+            "import time:       200 |        300 |   openai",
+            "import time:        50 |         50 |   json",
+            "import time:        10 |        360 | ai.providers",
+        ])
+
+        costs, direct = _parse_importtime(stderr, "ai.providers")
+
+        assert costs["openai._client"] == pytest.approx(0.0001)
+        assert direct == {"openai": pytest.approx(0.0003), "json": pytest.approx(0.00005)}
+
+
+class TestLazyModule:
+    """Tests for lazy_import."""
+
+    def test_imports_on_first_attribute_access(self, profiler, monkeypatch):
+        monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+        colorsys = lazy_import("colorsys")
+
+        assert "colorsys" not in sys.modules
+        assert not is_loaded(colorsys)
+        assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+        assert is_loaded(colorsys)
+        assert [t.name for t in profiler.timings(IMPORT)] == ["colorsys"]
+
+    def test_patching_the_real_module_is_seen(self, monkeypatch):
+        json = lazy_import("json")
+        monkeypatch.setattr("json.dumps", Mock(return_value="patched"))
+
+        assert json.dumps({}) == "patched"
+
+    def test_missing_module_raises_on_use(self):
+        missing = lazy_import("no_such_module_for_tests")
+
+        with pytest.raises(ImportError):
+            missing.anything
+
+
+class TestLazyComponent:
+    """Tests for LazyComponent."""
+
+    def test_builds_once_on_first_use(self, profiler):
+        factory = Mock(return_value=types.SimpleNamespace(mode="local"))
+        component = LazyComponent("rag_processor", factory)
+
+        assert component  # truthiness does not build it
+        factory.assert_not_called()
+        assert component.mode == "local"
+        assert component.mode == "local"
+        assert factory.call_count == 1
+        assert [t.name for t in profiler.timings(INIT)] == ["rag_processor"]
+
+    def test_attribute_writes_reach_the_component(self):
+        target = types.SimpleNamespace()
+        component = LazyComponent("queue", lambda: target)
+
+        component.status_callback = print
+
+        assert target.status_callback is print
+        assert resolve(component) is target
+        assert resolve(target) is target
+
+    def test_concurrent_first_use_builds_once(self):
+        calls = []
+
+        def factory():
+            calls.append(1)
+            time.sleep(0.02)
+            return types.SimpleNamespace(value=1)
+
+        component = LazyComponent("slow", factory)
+        threads = [threading.Thread(target=lambda: component.value) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+
+    def test_failed_build_is_retried(self):
+        factory = Mock(side_effect=[RuntimeError("offline"), types.SimpleNamespace(ok=True)])
+        component = LazyComponent("rag_document_manager", factory)
+
+        with pytest.raises(RuntimeError):
+            component.ok
+        assert not is_loaded(component)
+        assert component.ok is True
+
+
+class TestLazyExports:
+    """Tests for lazily re-exported facade names."""
+
+    def test_facade_imports_names_on_demand(self, monkeypatch):
+        facade = types.ModuleType("facade_for_tests")
+        monkeypatch.setitem(sys.modules, "facade_for_tests", facade)
+        facade.__getattr__ = lazy_exports("facade_for_tests", {"rgb_to_hsv": "colorsys"})
+
+        from facade_for_tests import rgb_to_hsv
+
+        assert rgb_to_hsv(0.0, 1.0, 0.0)[0] == pytest.approx(1 / 3)
+        assert "rgb_to_hsv" in vars(facade)  # cached after the first lookup
+        with pytest.raises(AttributeError):
+            facade.hsv_to_rgb
+
+    def test_dialog_facade_resolves_reexports(self):
+        import ui.dialogs.dialogs as dialogs
+
+        assert "show_translation_settings_dialog" in dialogs.__all__
+        assert callable(dialogs.clear_model_cache)
+        assert callable(dialogs.show_translation_settings_dialog)
@@ -3,6 +3,7 @@ Unit tests for StreamingMixin.
 
 Tests cover:
 - _append_streaming_chunk schedules on main thread
+- Frame coalescing and backpressure in StreamingTextBuffer
 - Widget enable/disable during streaming
 - Auto-scroll behavior
 - Start/finish streaming display
@@ -13,7 +14,7 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock, call
 import threading
 
-from processing.generators.base import StreamingMixin
+from processing.generators.base import FRAME_INTERVAL_MS, StreamingMixin, StreamingTextBuffer
 
 
 @pytest.fixture
@@ -56,8 +57,8 @@ class TestAppendStreamingChunk:
         streaming_mixin._append_streaming_chunk(mock_text_widget, "test chunk")
 
         mock_app.after.assert_called_once()
-        # First arg should be 0 (immediate)
-        assert mock_app.after.call_args[0][0] == 0
+        # Flushed on the next display frame
+        assert mock_app.after.call_args[0][0] == FRAME_INTERVAL_MS
 
     def test_inserts_chunk_at_end(self, streaming_mixin, mock_text_widget):
         """Test that chunk is inserted at end of widget."""
@@ -92,11 +93,11 @@ class TestAppendStreamingChunk:
 
         mock_text_widget.see.assert_called_once_with('end')
 
-    def test_forces_update(self, streaming_mixin, mock_text_widget):
-        """Test that widget update is forced."""
+    def test_does_not_force_layout_pass(self, streaming_mixin, mock_text_widget):
+        """Test that the widget is left to redraw when the main loop is idle."""
         streaming_mixin._append_streaming_chunk(mock_text_widget, "chunk")
 
-        mock_text_widget.update_idletasks.assert_called_once()
+        mock_text_widget.update_idletasks.assert_not_called()
 
     def test_handles_widget_exception(self, streaming_mixin, mock_text_widget):
         """Test that exceptions in widget updates are handled."""
@@ -338,4 +339,112 @@ class TestThreadSafety:
         for t in threads:
             t.join()
 
-        assert call_count[0] == 10
+        # Chunks that arrive while a flush is pending share its callback
+        assert 1 <= call_count[0] <= 10
+        inserted = "".join(c[0][1] for c in mock_text_widget.insert.call_args_list)
+        assert inserted.count("chunk") == 10
+
+
+class ManualMainLoop:
+    """Collects after() callbacks so tests decide when frames run."""
+
+    def __init__(self):
+        self.callbacks = []
+        self.delays = []
+
+    def after(self, delay, fn):
+        self.delays.append(delay)
+        self.callbacks.append(fn)
+
+    def run_frame(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for fn in callbacks:
+            fn()
+
+
+class TestStreamingTextBuffer:
+    """Tests for frame-coalesced streaming inserts."""
+
+    def test_chunks_in_one_frame_become_one_insert(self, mock_text_widget):
+        loop = ManualMainLoop()
+        buffer = StreamingTextBuffer(loop, mock_text_widget)
+
+        for token in ["Subjective", ":", " patient", " reports"]:
+            buffer.append(token)
+
+        assert len(loop.callbacks) == 1
+        loop.run_frame()
+        mock_text_widget.insert.assert_called_once_with('end', "Subjective: patient reports")
+        mock_text_widget.see.assert_called_once_with('end')
+        assert buffer.flush_count == 1
+
+    def test_slow_flush_stretches_next_interval(self, mock_text_widget):
+        loop = ManualMainLoop()
+        buffer = StreamingTextBuffer(loop, mock_text_widget)
+        clock = iter([0.0, 0.010, 1.0, 1.001])
+
+        with patch("processing.generators.base.time.perf_counter", side_effect=lambda: next(clock)):
+            buffer.append("a")
+            loop.run_frame()  # 10 ms flush
+            buffer.append("b")
+            loop.run_frame()  # 1 ms flush
+            buffer.append("c")
+
+        assert loop.delays == [FRAME_INTERVAL_MS, 40, FRAME_INTERVAL_MS]
+
+    def test_producer_waits_for_ui_to_catch_up(self, mock_text_widget):
+        loop = ManualMainLoop()
+        buffer = StreamingTextBuffer(loop, mock_text_widget, max_pending_chars=10)
+        first = threading.Thread(target=buffer.append, args=("0123456789",))
+        first.start()
+        first.join()
+        done = threading.Event()
+
+        def produce():
+            buffer.append("more")
+            done.set()
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        assert not done.wait(0.1)  # blocked on a full buffer
+
+        loop.run_frame()
+        assert done.wait(1.0)
+        thread.join()
+        assert buffer.pending_chars == 4
+
+    def test_destroyed_widget_closes_buffer(self, mock_text_widget):
+        loop = ManualMainLoop()
+        buffer = StreamingTextBuffer(loop, mock_text_widget)
+        mock_text_widget.winfo_exists.return_value = False
+
+        buffer.append("lost")
+        loop.run_frame()
+        buffer.append("ignored")
+
+        mock_text_widget.insert.assert_not_called()
+        assert buffer.pending_chars == 0
+        assert loop.callbacks == []
+
+    def test_replaced_content_drops_buffered_chunks(self, mock_app, mock_text_widget):
+        loop = ManualMainLoop()
+        mock_app.after = Mock(side_effect=loop.after)
+        mixin = StreamingMixin()
+        mixin.app = mock_app
+
+        mixin._append_streaming_chunk(mock_text_widget, "raw stream")
+        mixin._update_text_widget_content(mock_text_widget, "Formatted note")
+        loop.run_frame()
+
+        mock_text_widget.insert.assert_called_once_with('1.0', 'Formatted note')
+
+    def test_finish_writes_remaining_chunks(self, mock_app, mock_text_widget):
+        loop = ManualMainLoop()
+        mixin = StreamingMixin()
+        mixin.app = mock_app
+        mixin._stream_buffer(mock_text_widget).app = loop
+
+        mixin._append_streaming_chunk(mock_text_widget, "last words")
+        mixin._finish_streaming_display(mock_text_widget, "Done")
+
+        mock_text_widget.insert.assert_called_once_with('end', 'last words')
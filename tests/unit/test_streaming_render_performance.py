@@ -0,0 +1,142 @@
+"""Main-thread cost of rendering a streamed SOAP note.
+
+A worker thread streams tokens while the test thread plays the Tk main
+loop, running after() callbacks when due against a text widget whose
+inserts and layout passes cost CPU. Compares one callback per token with
+update_idletasks() (the previous approach) against StreamingTextBuffer.
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+import pytest
+
+from processing.generators.base import StreamingTextBuffer
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.benchmark
+
+
+_TOKENS = 3000
+_TOKEN_INTERVAL = 0.0001  # up to 10k tokens/s, a fast provider
+
+
+def _spin(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class _Widget:
+    """Text widget stand-in whose operations cost main-thread time."""
+
+    def __init__(self):
+        self.text = []
+        self.layout_passes = 0
+
+    def winfo_exists(self):
+        return True
+
+    def cget(self, option):
+        return "normal"
+
+    def configure(self, **kwargs):
+        pass
+
+    def insert(self, index, text):
+        _spin(0.00002)
+        self.text.append(text)
+
+    def see(self, index):
+        _spin(0.00002)
+
+    def update_idletasks(self):
+        _spin(0.0002)
+        self.layout_passes += 1
+
+
+class _MainLoop:
+    """Runs after() callbacks on the calling thread when they are due."""
+
+    def __init__(self):
+        self._queue = []
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self.callbacks = 0
+        self.busy = 0.0
+
+    def after(self, delay, fn):
+        with self._lock:
+            heapq.heappush(self._queue, (time.monotonic() + delay / 1000, next(self._order), fn))
+
+    def run_until(self, done):
+        while True:
+            with self._lock:
+                item = self._queue[0] if self._queue else None
+                if item is not None and item[0] <= time.monotonic():
+                    heapq.heappop(self._queue)
+                else:
+                    item = None
+            if item is None:
+                if done.is_set() and not self._queue:
+                    return
+                time.sleep(0.0005)
+                continue
+            start = time.perf_counter()
+            item[2]()
+            self.busy += time.perf_counter() - start
+            self.callbacks += 1
+
+
+def _stream(on_chunk, done):
+    for i in range(_TOKENS):
+        on_chunk(f" tok{i}")
+        if i % 10 == 0:
+            time.sleep(_TOKEN_INTERVAL * 10)
+    done.set()
+
+
+def _render(make_on_chunk):
+    loop = _MainLoop()
+    widget = _Widget()
+    done = threading.Event()
+    producer = threading.Thread(target=_stream, args=(make_on_chunk(loop, widget), done))
+    start = time.perf_counter()
+    producer.start()
+    loop.run_until(done)
+    producer.join()
+    return loop, widget, time.perf_counter() - start
+
+
+def _per_token(loop, widget):
+    """The previous approach: one callback and layout pass per token."""
+    def on_chunk(chunk):
+        def update():
+            widget.configure(state="normal")
+            widget.insert("end", chunk)
+            widget.see("end")
+            widget.update_idletasks()
+        loop.after(0, update)
+    return on_chunk
+
+
+def _coalesced(loop, widget):
+    return StreamingTextBuffer(loop, widget).append
+
+
+def test_streamed_note_render_cost():
+    old_loop, old_widget, old_wall = _render(_per_token)
+    new_loop, new_widget, new_wall = _render(_coalesced)
+
+    logger.info(f"{_TOKENS} tokens: per-token {old_loop.callbacks} callbacks, "
+                f"{old_loop.busy * 1000:.0f} ms main thread ({old_wall * 1000:.0f} ms wall); "
+                f"coalesced {new_loop.callbacks} callbacks, {new_loop.busy * 1000:.0f} ms main thread "
+                f"({new_wall * 1000:.0f} ms wall)")
+
+    assert "".join(new_widget.text) == "".join(old_widget.text)
+    assert new_widget.layout_passes == 0
+    assert new_loop.callbacks * 10 < _TOKENS
+    assert new_loop.busy * 5 < old_loop.busy
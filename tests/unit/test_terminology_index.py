@@ -0,0 +1,192 @@
+"""
+Unit tests for the local ICD-10-CM / RxNorm terminology index.
+
+Tests cover release-file parsing, code and prefix lookup, typo-tolerant
+description search, and the validator and code-lookup integrations.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from rag import medical_code_lookup
+from utils import terminology_index
+from utils.icd_validator import ICDValidator
+from utils.terminology_index import (
+    ICD10CM,
+    RXNORM,
+    TerminologyIndex,
+    TerminologyTerm,
+    format_icd10_code,
+    iter_icd10cm_file,
+    iter_rxnconso_file,
+)
+
+
+def _order_line(order, code, billable, short, long):
+    return f"{order:05d} {code:<7} {billable} {short:<60} {long}\n"
+
+
+ICD10_ORDER = "".join([
+    _order_line(1, "E11", 0, "Type 2 diabetes mellitus", "Type 2 diabetes mellitus"),
+    _order_line(2, "E1165", 1, "Type 2 diabetes mellitus w hyperglycemia",
+                "Type 2 diabetes mellitus with hyperglycemia"),
+    _order_line(3, "E119", 1, "Type 2 diabetes mellitus without complications",
+                "Type 2 diabetes mellitus without complications"),
+    _order_line(4, "I10", 1, "Essential (primary) hypertension", "Essential (primary) hypertension"),
+    _order_line(5, "N184", 1, "Chronic kidney disease, stage 4 (severe)", "Chronic kidney disease, stage 4 (severe)"),
+    _order_line(6, "A000", 1, "Cholera due to Vibrio cholerae 01, biovar cholerae",
+                "Cholera due to Vibrio cholerae 01, biovar cholerae"),
+])
+
+
+def _rrf(rxcui, tty, name, sab="RXNORM", suppress="N"):
+    fields = [rxcui, "ENG", "P", "L1", "PF", "S1", "Y", "A1", "", "", "", sab, tty, rxcui, name, "0", suppress, "4096"]
+    return "|".join(fields) + "|\n"
+
+
+RXNCONSO = "".join([
+    _rrf("6809", "IN", "metformin"),
+    _rrf("861007", "SCD", "metformin hydrochloride 500 MG Oral Tablet"),
+    _rrf("29046", "IN", "lisinopril"),
+    _rrf("203160", "BN", "Glucophage"),
+    _rrf("11289", "IN", "warfarin", sab="MTHSPL"),
+    _rrf("99999", "IN", "obsoletamine", suppress="O"),
+])
+
+
+@pytest.fixture
+def release_files(tmp_path):
+    icd10 = tmp_path / "icd10cm_order_2025.txt"
+    icd10.write_text(ICD10_ORDER)
+    rxnorm = tmp_path / "RXNCONSO.RRF"
+    rxnorm.write_text(RXNCONSO)
+    return str(icd10), str(rxnorm)
+
+
+@pytest.fixture
+def index(tmp_path, release_files):
+    built = TerminologyIndex.build(tmp_path / "terminology", *release_files)
+    yield built
+    built.close()
+
+
+class TestParsing:
+    """Tests for release-file parsers."""
+
+    def test_icd10_order_file(self, release_files):
+        terms = list(iter_icd10cm_file(release_files[0]))
+
+        codes = [(t.code, t.term_type, t.billable) for t in terms]
+        assert ("E11", "LONG", False) in codes
+        assert ("E11.65", "SHORT", True) in codes
+        assert len([t for t in terms if t.code == "I10"]) == 1  # identical short name not repeated
+
+    def test_icd10_codes_file(self, tmp_path):
+        path = tmp_path / "icd10cm_codes_2025.txt"
+        path.write_text("A000    Cholera due to Vibrio cholerae 01, biovar cholerae\nI10     Essential hypertension\n")
+
+        assert [(t.code, t.description) for t in iter_icd10cm_file(str(path))] == [
+            ("A00.0", "Cholera due to Vibrio cholerae 01, biovar cholerae"),
+            ("I10", "Essential hypertension"),
+        ]
+
+    def test_rxnconso_filters_and_prefers_ingredient(self, release_files):
+        terms = list(iter_rxnconso_file(release_files[1]))
+
+        assert {t.code for t in terms} == {"6809", "861007", "29046", "203160"}
+        assert all(t.description == t.term for t in terms if t.term_type == "IN")
+
+    def test_format_icd10_code(self):
+        assert format_icd10_code("e1165") == "E11.65"
+        assert format_icd10_code("I10") == "I10"
+
+
+class TestLookup:
+    """Tests for code lookup and description search."""
+
+    def test_code_and_prefix_lookup(self, index):
+        assert index.get_description(ICD10CM, "E11.65") == "Type 2 diabetes mellitus with hyperglycemia"
+        assert index.get_description(RXNORM, "6809") == "metformin"
+        assert index.has_code(ICD10CM, "E11.99") is False
+        assert index.codes_with_prefix(ICD10CM, "E11") == ["E11", "E11.65", "E11.9"]
+        assert index.codes_with_prefix(ICD10CM, "E11.", limit=1) == ["E11.65"]
+
+    def test_search_ranks_and_tolerates_typos(self, index):
+        results = index.search("diabetes hyperglycemia", system=ICD10CM)
+        assert results[0].code == "E11.65"
+        assert len({r.code for r in results}) == len(results)
+
+        assert index.search("metfromin", system=RXNORM)[0].code == "6809"
+        assert index.search("lisinoprill")[0].code == "29046"
+        assert index.search("zzzz") == []
+
+    def test_find_code_prefers_exact_name(self, index):
+        assert index.find_code("Essential (primary) hypertension", ICD10CM).score == 1.0
+        assert index.find_code("glucophage", RXNORM).code == "203160"
+        assert index.find_code("chronic disease", ICD10CM) is None
+
+    def test_rebuild_replaces_index(self, tmp_path, release_files):
+        directory = tmp_path / "terminology"
+        TerminologyIndex.build(directory, *release_files).close()
+        rebuilt = TerminologyIndex.build(
+            directory, icd10cm_path=release_files[0],
+            extra_terms=[TerminologyTerm(ICD10CM, "Z00.00", "Annual physical", "Annual physical")],
+        )
+
+        assert rebuilt.has_code(ICD10CM, "Z00.00")
+        assert rebuilt.search("metformin") == []
+        assert rebuilt.sources[ICD10CM][0].endswith("icd10cm_order_2025.txt")
+        rebuilt.close()
+
+
+class TestIntegrations:
+    """Tests for validator and code-lookup use of the index."""
+
+    def test_validator_uses_index(self, index):
+        validator = ICDValidator(terminology=index)
+
+        result = validator.validate("A00.0")
+        assert result.description == "Cholera due to Vibrio cholerae 01, biovar cholerae"
+        assert result.warning is None
+        assert "E11.65" in validator.suggest_similar_codes("E11", limit=10)
+
+        unknown = validator.validate("E11.99")
+        assert unknown.warning is not None
+        assert unknown.suggested_code == "E11.9"
+
+    def test_closest_code_needs_more_than_the_category(self, index):
+        validator = ICDValidator(icd10_codes={"Z00.00": "General exam"}, terminology=index)
+
+        assert validator.closest_code("E11.649") == "E11.65"
+        assert validator.closest_code("I10.1") == "I10"
+        assert validator.closest_code("N18.30") is None
+        assert validator.suggest_similar_codes("N18.30") == ["N18.4"]
+
+    def test_code_lookup_falls_back_to_index(self, index):
+        with patch.object(medical_code_lookup, "get_terminology_index", return_value=index):
+            assert medical_code_lookup.lookup_rxnorm("lisinoprill", fuzzy=True) == "RxNorm:29046"
+            assert medical_code_lookup.lookup_rxnorm("lisinoprill") is None
+            assert medical_code_lookup.lookup_rxnorm("Glucophage") == "RxNorm:203160"
+            assert medical_code_lookup.lookup_icd10("chronic kidney disease stage 4 (severe)") == "N18.4"
+            assert medical_code_lookup.lookup_icd10("chronic kidney disease stage 4 severe", fuzzy=True) == "N18.4"
+            # Static dictionary entries still win
+            assert medical_code_lookup.lookup_icd10("hypertension") == "I10"
+
+        with patch.object(medical_code_lookup, "get_terminology_index", return_value=None):
+            assert medical_code_lookup.lookup_rxnorm("lisinoprill", fuzzy=True) is None
+
+    def test_shared_index_builds_in_background(self, tmp_path, release_files):
+        sources = (tmp_path / "shared", *release_files)
+        terminology_index.reset_terminology_index()
+        with patch.object(terminology_index, "_index_sources", return_value=sources):
+            assert terminology_index.get_terminology_index() is None
+            terminology_index._terminology_build_thread.join(timeout=30)
+
+            built = terminology_index.get_terminology_index()
+            assert built is not None and built.has_code(ICD10CM, "E11.65")
+
+            # A later run opens the built index without rebuilding
+            terminology_index.reset_terminology_index()
+            assert terminology_index.get_terminology_index().has_code(ICD10CM, "I10")
+            terminology_index.reset_terminology_index()
@@ -0,0 +1,97 @@
+"""Lookup and search latency of the terminology index at ICD-10-CM scale.
+
+Builds a synthetic 75,000-code order file with descriptions assembled from
+clinical vocabulary, then times code lookups, prefix suggestions and
+typo-tolerant description searches against the old linear prefix scan.
+"""
+import logging
+import random
+import time
+
+import numpy as np
+import pytest
+
+from utils.icd_validator import ICDValidator
+from utils.terminology_index import ICD10CM, TerminologyIndex
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.benchmark
+
+
+_CODES = 75_000
+_LOOKUPS = 2_000
+_SEARCHES = 200
+
+_WORDS = (
+    "acute chronic bilateral unspecified left right upper lower recurrent primary secondary "
+    "diabetes hypertension fracture infection neoplasm malignant benign disorder syndrome "
+    "stenosis obstruction hemorrhage ulcer dislocation sprain strain injury abscess lesion "
+    "kidney liver heart lung femur tibia radius ulna shoulder wrist ankle knee spine colon "
+    "initial subsequent encounter sequela with without complication mellitus insufficiency"
+).split()
+
+
+def _order_file(path, rng):
+    codes = []
+    with open(path, "w") as f:
+        for order in range(_CODES):
+            code = f"{chr(65 + order % 26)}{order // 26 % 100:02d}{order // 2600:02d}"
+            description = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(4, 9))).capitalize()
+            f.write(f"{order:05d} {code:<7} 1 {description[:60]:<60} {description}\n")
+            codes.append((f"{code[:3]}.{code[3:]}", description))
+    return codes
+
+
+def _typo(rng, text):
+    i = rng.randrange(1, len(text) - 1)
+    return text[:i] + text[i + 1] + text[i] + text[i + 2:]
+
+
+def _ms(samples, q):
+    return float(np.percentile(samples, q)) * 1000
+
+
+def test_lookup_and_search_at_icd10_scale(tmp_path):
+    rng = random.Random(11)
+    codes = _order_file(tmp_path / "icd10cm_order.txt", rng)
+
+    start = time.perf_counter()
+    index = TerminologyIndex.build(tmp_path / "terminology", icd10cm_path=str(tmp_path / "icd10cm_order.txt"))
+    build = time.perf_counter() - start
+
+    sample = rng.sample(codes, _LOOKUPS)
+    start = time.perf_counter()
+    for code, description in sample:
+        assert index.get_description(ICD10CM, code) == description
+    lookup_us = (time.perf_counter() - start) / _LOOKUPS * 1e6
+
+    full = dict(codes)
+    indexed = ICDValidator(icd10_codes=full, terminology=index)
+    prefixes = [code[:3] for code, _ in sample[:_SEARCHES]]
+    start = time.perf_counter()
+    for prefix in prefixes:
+        assert indexed.suggest_similar_codes(prefix, limit=5)
+    bisect_us = (time.perf_counter() - start) / _SEARCHES * 1e6
+
+    start = time.perf_counter()
+    for prefix in prefixes:
+        [c for c in full if c.startswith(prefix)][:5]
+    scan_us = (time.perf_counter() - start) / _SEARCHES * 1e6
+
+    latencies, found = [], 0
+    for code, description in sample[:_SEARCHES]:
+        query = _typo(rng, description)
+        t0 = time.perf_counter()
+        results = index.search(query, system=ICD10CM, limit=10)
+        latencies.append(time.perf_counter() - t0)
+        found += any(r.description == description for r in results)
+    index.close()
+
+    logger.info(f"Terminology index ({_CODES} codes): build {build:.1f}s")
+    logger.info(f"  code lookup {lookup_us:.1f} us, prefix suggestion {bisect_us:.1f} us (linear scan {scan_us:.0f} us)")
+    logger.info(f"  typo search p50 {_ms(latencies, 50):.1f} ms, p99 {_ms(latencies, 99):.1f} ms, "
+                f"recall@10 {found / _SEARCHES:.2f}")
+
+    assert found / _SEARCHES >= 0.9
+    assert bisect_us < scan_us
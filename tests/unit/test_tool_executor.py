@@ -0,0 +1,91 @@
+"""
+Unit tests for ToolExecutor.
+
+Tests cover per-tool timeouts, execution history (latency and batch id)
+and thread-safety of concurrent execute_tool calls.
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ai.tools import ToolResult
+from ai.tools.tool_executor import ToolExecutor
+
+
+def _make_tool(delay: float = 0.0, output: str = "ok"):
+    """Create a mock tool whose safe_execute sleeps for delay seconds."""
+    tool = Mock()
+
+    def safe_execute(**kwargs):
+        time.sleep(delay)
+        return ToolResult(success=True, output=output)
+
+    tool.safe_execute.side_effect = safe_execute
+    return tool
+
+
+@pytest.fixture
+def executor():
+    """Create a ToolExecutor with default settings."""
+    ex = ToolExecutor()
+    ex.timeout_seconds = 5
+    ex.tool_timeouts = {}
+    yield ex
+    ex.shutdown()
+
+
+class TestTimeouts:
+    """Tests for per-tool timeout handling."""
+
+    def test_default_timeout(self, executor):
+        assert executor.get_timeout("anything") == 5
+
+    def test_per_tool_timeout_override(self, executor):
+        executor.tool_timeouts = {"mcp_slow_search": 0.05}
+
+        with patch('ai.tools.tool_executor.tool_registry') as registry:
+            registry.get_tool.return_value = _make_tool(delay=0.5)
+            result = executor.execute_tool("mcp_slow_search", {})
+
+        assert result.success is False
+        assert "timed out after 0.05" in result.error
+
+
+class TestExecutionHistory:
+    """Tests for execution history recording."""
+
+    def test_records_latency_and_batch(self, executor):
+        with patch('ai.tools.tool_executor.tool_registry') as registry:
+            registry.get_tool.return_value = _make_tool(delay=0.02)
+            executor.execute_tool("lookup", {"q": "x"}, batch_id="b1")
+
+        history = executor.get_execution_history()
+        assert len(history) == 1
+        assert history[0]["tool_name"] == "lookup"
+        assert history[0]["batch_id"] == "b1"
+        assert history[0]["execution_time"] >= 0.02
+
+    def test_concurrent_calls_all_recorded(self, executor):
+        with patch('ai.tools.tool_executor.tool_registry') as registry:
+            registry.get_tool.return_value = _make_tool(delay=0.01)
+            threads = [
+                threading.Thread(target=executor.execute_tool, args=(f"tool{i}", {}))
+                for i in range(8)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(timeout=5)
+
+        assert len(executor.get_execution_history()) == 8
+
+    def test_unknown_tool(self, executor):
+        with patch('ai.tools.tool_executor.tool_registry') as registry:
+            registry.get_tool.return_value = None
+            result = executor.execute_tool("missing", {})
+
+        assert result.success is False
+        assert "not found" in result.error
@@ -0,0 +1,211 @@
+"""
+Unit tests for pipeline tracing.
+
+Covers span nesting and propagation across the thread pool, latency
+histograms, Chrome trace export and the spans recorded by the timed
+decorator, the STT failover loop and the recording pipeline.
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from utils.tracing import LatencyHistogram, Tracer, current_span, get_tracer, propagate, reset_tracer
+
+
+@pytest.fixture
+def tracer():
+    reset_tracer()
+    tracer = get_tracer()
+    tracer.enabled = True
+    yield tracer
+    reset_tracer()
+
+
+class TestSpans:
+    """Tests for span nesting and context propagation."""
+
+    def test_nested_spans_share_trace_and_link_parents(self, tracer):
+        with tracer.span("recording_pipeline", recording_id=7) as root:
+            with tracer.span("transcribe") as child:
+                assert current_span() is child
+            assert current_span() is root
+        assert current_span() is None
+
+        spans = {s.name: s for s in tracer.spans()}
+        assert spans["transcribe"].parent_id == root.span_id
+        assert spans["transcribe"].trace_id == root.trace_id == root.span_id
+        assert spans["recording_pipeline"].attributes == {"recording_id": 7}
+        assert root.end >= child.end
+
+    def test_exception_marks_span_failed(self, tracer):
+        with pytest.raises(ValueError):
+            with tracer.span("generate_soap"):
+                raise ValueError("boom")
+
+        (span,) = tracer.spans()
+        assert span.status == "error"
+        assert span.attributes["error"] == "boom"
+        assert tracer.histogram("generate_soap").errors == 1
+
+    def test_propagate_carries_span_to_worker_thread(self, tracer):
+        def work():
+            with tracer.span("stt", provider="deepgram"):
+                pass
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with tracer.span("transcribe") as parent:
+                executor.submit(propagate(work)).result()
+            executor.submit(work).result()
+
+        stt_spans = [s for s in tracer.spans() if s.name == "stt"]
+        assert stt_spans[0].parent_id == parent.span_id
+        assert stt_spans[1].parent_id is None
+
+    def test_thread_pool_manager_propagates(self, tracer):
+        from utils.thread_pool import ThreadPoolManager
+
+        with tracer.span("recording_pipeline") as parent:
+            child_parent = ThreadPoolManager.submit(lambda: current_span()).result(timeout=5)
+
+        assert child_parent is parent
+
+    def test_record_span_for_elapsed_interval(self, tracer):
+        queued = time.perf_counter() - 0.25
+        with tracer.span("recording_pipeline", start=queued) as root:
+            wait = tracer.record_span("queue_wait", queued)
+
+        assert wait.parent_id == root.span_id
+        assert 250 <= wait.duration_ms < root.duration_ms + 1
+
+    def test_disabled_tracer_records_nothing(self):
+        tracer = Tracer(enabled=False)
+        with tracer.span("transcribe") as span:
+            span.set_attribute("chars", 10)
+            assert current_span() is None
+        assert tracer.record_span("queue_wait", time.perf_counter()) is None
+        assert tracer.spans() == []
+        assert tracer.summary() == []
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_percentiles_fall_in_the_right_bucket(self):
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.record(8.0)
+        for _ in range(10):
+            histogram.record(900.0)
+
+        assert 5 <= histogram.percentile(50) <= 10
+        assert 500 <= histogram.percentile(95) <= 900
+        assert histogram.percentile(100) == 900
+        assert histogram.count == 100
+        assert histogram.mean_ms == pytest.approx(97.2)
+
+    def test_empty_histogram(self):
+        assert LatencyHistogram().percentile(99) == 0.0
+
+    def test_summary_keys_by_stage_and_provider(self, tracer):
+        for provider in ("deepgram", "groq", "deepgram"):
+            with tracer.span("stt", provider=provider):
+                pass
+        with tracer.span("generate_soap"):
+            pass
+
+        rows = [(s.stage, s.provider, s.count) for s in tracer.summary()]
+        assert rows == [("generate_soap", None, 1), ("stt", "deepgram", 2), ("stt", "groq", 1)]
+
+
+class TestChromeTraceExport:
+    """Tests for Chrome Trace Event export."""
+
+    def test_export_writes_complete_events(self, tracer, tmp_path):
+        with tracer.span("recording_pipeline", recording_id=3):
+            with tracer.span("stt", provider="groq", segment=object()):
+                time.sleep(0.002)
+
+        path = tmp_path / "trace.json"
+        count = tracer.export_chrome_trace(str(path))
+
+        document = json.loads(path.read_text())
+        events = [e for e in document["traceEvents"] if e["ph"] == "X"]
+        assert count == len(events) == 2
+        stt = next(e for e in events if e["name"] == "stt")
+        root = next(e for e in events if e["name"] == "recording_pipeline")
+        assert stt["cat"] == "groq"
+        assert stt["dur"] >= 2000
+        assert root["ts"] <= stt["ts"]
+        assert stt["args"]["parent_id"] == root["args"]["span_id"]
+        assert isinstance(stt["args"]["segment"], str)
+        assert any(e["ph"] == "M" and e["name"] == "thread_name" for e in document["traceEvents"])
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_reset_clears_spans_and_histograms(self, tracer):
+        with tracer.span("transcribe"):
+            pass
+        tracer.reset()
+        assert tracer.spans() == [] and tracer.summary() == []
+
+
+class TestInstrumentation:
+    """Tests for the spans recorded by instrumented code."""
+
+    def test_timed_decorator_records_span(self, tracer):
+        from utils.structured_logging import timed
+
+        @timed("rag_search")
+        def search():
+            return current_span().name
+
+        assert search() == "rag_search"
+        assert tracer.histogram("rag_search").count == 1
+
+    def test_failover_records_span_per_provider(self, tracer):
+        from stt_providers.base import TranscriptionResult
+        from stt_providers.failover import STTFailoverManager
+
+        failing = MagicMock(provider_name="deepgram", is_configured=True)
+        failing.transcribe_with_result.side_effect = ConnectionError("down")
+        working = MagicMock(provider_name="groq", is_configured=True)
+        working.transcribe_with_result.return_value = TranscriptionResult.success_result(text="hello")
+
+        result = STTFailoverManager([failing, working]).transcribe_with_result(MagicMock())
+
+        assert result.text == "hello"
+        stt = {s.attributes["provider"]: s for s in tracer.spans() if s.name == "stt"}
+        assert stt["deepgram"].status == "error"
+        assert stt["groq"].status == "ok"
+
+    def test_recording_pipeline_spans(self, tracer):
+        from processing.task_executor_mixin import TaskExecutorMixin
+
+        class Executor(TaskExecutorMixin):
+            lock = MagicMock()
+            active_tasks = {}
+
+            def __init__(self):
+                self.app = MagicMock()
+                self._notify_status_update = MagicMock()
+                self._generate_soap_note = MagicMock(return_value="SOAP")
+
+            def _mark_completed(self, task_id, recording_data, result, elapsed):
+                recording_data["status"] = "completed"
+
+        recording = {
+            "recording_id": 1, "transcript": "words", "queued_perf": time.perf_counter() - 0.05,
+            "process_options": {"generate_soap": True},
+        }
+        Executor()._process_recording("task", recording)
+
+        spans = {s.name: s for s in tracer.spans()}
+        root = spans["recording_pipeline"]
+        assert root.status == "ok"
+        assert root.attributes["attempt"] == 1
+        assert root.duration_ms >= 50
+        assert spans["queue_wait"].parent_id == root.span_id
+        assert spans["generate_soap"].parent_id == root.span_id
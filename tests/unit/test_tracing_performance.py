@@ -0,0 +1,61 @@
+"""Per-span cost of pipeline tracing on hot paths.
+
+Times a nested span pair against the same block untraced, and a traced
+db_execute-style call from several threads at once, and checks that the
+histograms still add up afterwards.
+"""
+import logging
+import threading
+import time
+
+import pytest
+
+from utils.tracing import Tracer
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.benchmark
+
+
+_SPANS = 20_000
+_THREADS = 8
+
+
+def test_span_overhead():
+    tracer = Tracer(max_spans=_SPANS)
+    tracer.enabled = True
+
+    start = time.perf_counter()
+    for _ in range(_SPANS):
+        pass
+    bare_us = (time.perf_counter() - start) / _SPANS * 1e6
+
+    start = time.perf_counter()
+    for _ in range(_SPANS // 2):
+        with tracer.span("recording_pipeline"):
+            with tracer.span("stt", provider="deepgram"):
+                pass
+    span_us = (time.perf_counter() - start) / _SPANS * 1e6
+
+    tracer.reset()
+
+    def worker():
+        for _ in range(_SPANS // _THREADS):
+            with tracer.span("db_execute"):
+                pass
+
+    threads = [threading.Thread(target=worker) for _ in range(_THREADS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    threaded_us = (time.perf_counter() - start) / _SPANS * 1e6
+
+    logger.info(f"Tracing: {span_us:.2f} us/span (bare loop {bare_us:.3f} us), "
+                f"{_THREADS} threads {threaded_us:.2f} us/span")
+
+    assert tracer.histogram("db_execute").count == _SPANS
+    assert len(tracer.spans()) == _SPANS
+    # Negligible next to the millisecond-scale stages being traced
+    assert span_us < 50
@@ -450,6 +450,108 @@ class TestSynthesizeAndPlay:
                 self.manager.synthesize_and_play("Hello", language="en")
 
 
+class TestSynthesizeCached:
+    """Tests for synthesize_cached."""
+
+    def setup_method(self):
+        self.manager = _make_manager()
+        self.mock_provider = Mock()
+        self.manager._provider_instance = self.mock_provider
+        self.manager._current_provider = "pyttsx3"
+
+    @patch('src.managers.tts_manager.settings_manager')
+    def test_repeated_text_synthesized_once(self, mock_settings):
+        """Test that identical requests reuse the cached audio."""
+        mock_settings.get.return_value = {"provider": "pyttsx3"}
+        mock_audio = Mock()
+        self.mock_provider.synthesize.return_value = mock_audio
+
+        first = self.manager.synthesize_cached("Hello", language="en", voice="v1")
+        second = self.manager.synthesize_cached("Hello", language="en", voice="v1")
+
+        assert first is mock_audio
+        assert second is mock_audio
+        self.mock_provider.synthesize.assert_called_once()
+
+    @patch('src.managers.tts_manager.settings_manager')
+    def test_different_language_not_shared(self, mock_settings):
+        """Test that the cache key includes the language."""
+        mock_settings.get.return_value = {"provider": "pyttsx3"}
+        self.mock_provider.synthesize.side_effect = lambda *a, **k: Mock()
+
+        self.manager.synthesize_cached("Hello", language="en", voice="v1")
+        self.manager.synthesize_cached("Hello", language="es", voice="v1")
+
+        assert self.mock_provider.synthesize.call_count == 2
+
+    @patch('src.managers.tts_manager.settings_manager')
+    def test_update_settings_clears_cache(self, mock_settings):
+        """Test that changing settings discards cached audio."""
+        mock_settings.get.return_value = {"provider": "pyttsx3"}
+        self.mock_provider.synthesize.return_value = Mock()
+        self.manager.synthesize_cached("Hello", language="en", voice="v1")
+
+        self.manager.update_settings({"provider": "pyttsx3"})
+
+        assert len(self.manager._audio_cache) == 0
+
+
+class TestSynthesizeAndPlayStreaming:
+    """Tests for synthesize_and_play_streaming."""
+
+    def setup_method(self):
+        self.manager = _make_manager()
+        self.mock_provider = Mock()
+        self.manager._provider_instance = self.mock_provider
+        self.manager._current_provider = "pyttsx3"
+
+    @patch('src.managers.tts_manager.settings_manager')
+    def test_plays_each_sentence_in_order(self, mock_settings):
+        """Test that sentences are synthesized separately and played in order."""
+        mock_settings.get.return_value = {"provider": "pyttsx3"}
+        self.mock_provider.synthesize.side_effect = lambda text, *a, **k: f"audio:{text}"
+        text = "Please take this medication twice a day. Come back in two weeks for a follow up."
+
+        with patch.object(self.manager, '_play_audio_blocking') as mock_play:
+            stats = self.manager.synthesize_and_play_streaming(text, language="en", blocking=True)
+
+        assert stats.played == 2
+        assert stats.time_to_first_audio is not None
+        played = [c.args[0] for c in mock_play.call_args_list]
+        assert played == [
+            "audio:Please take this medication twice a day.",
+            "audio:Come back in two weeks for a follow up.",
+        ]
+
+    @patch('src.managers.tts_manager.settings_manager')
+    def test_empty_text_raises(self, mock_settings):
+        """Test that empty text is rejected."""
+        with pytest.raises(ValueError):
+            self.manager.synthesize_and_play_streaming("")
+
+    @patch('src.managers.tts_manager.settings_manager')
+    def test_synthesis_error_propagates_when_blocking(self, mock_settings):
+        """Test that synthesis errors surface to blocking callers."""
+        mock_settings.get.return_value = {"provider": "pyttsx3"}
+        self.mock_provider.synthesize.side_effect = RuntimeError("provider down")
+
+        with patch.object(self.manager, '_play_audio_blocking'):
+            with pytest.raises(RuntimeError, match="provider down"):
+                self.manager.synthesize_and_play_streaming("Hello there, how are you?", blocking=True)
+
+    @patch('src.managers.tts_manager.settings_manager')
+    def test_stop_playback_cancels_active_stream(self, mock_settings):
+        """Test that stop_playback cancels the running pipeline."""
+        mock_settings.get.return_value = {"provider": "pyttsx3"}
+        pipeline = Mock()
+        self.manager._active_stream = pipeline
+
+        self.manager.stop_playback()
+
+        pipeline.cancel.assert_called_once()
+        assert self.manager._active_stream is None
+
+
 class TestPlayAudioBlocking:
     """Tests for _play_audio_blocking."""
 
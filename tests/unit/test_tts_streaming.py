@@ -0,0 +1,157 @@
+"""
+Unit tests for the sentence-streaming TTS pipeline.
+
+Tests cover sentence splitting, the synthesized audio LRU cache and
+ordered, bounded-concurrency playback in StreamingTTSPipeline.
+"""
+
+import threading
+import time
+
+import pytest
+
+from managers.tts_streaming import (
+    StreamingTTSPipeline,
+    TTSAudioCache,
+    split_sentences,
+)
+
+
+class TestSplitSentences:
+    """Tests for split_sentences."""
+
+    def test_empty_text(self):
+        assert split_sentences("") == []
+        assert split_sentences("   ") == []
+
+    def test_splits_on_terminators(self):
+        text = "How long have you had this pain? Please take this twice a day. Rest well!"
+        assert split_sentences(text, min_chars=1) == [
+            "How long have you had this pain?",
+            "Please take this twice a day.",
+            "Rest well!",
+        ]
+
+    def test_keeps_decimal_numbers_together(self):
+        chunks = split_sentences("Take 2.5 mg every morning with food.", min_chars=1)
+        assert chunks == ["Take 2.5 mg every morning with food."]
+
+    def test_merges_short_fragments(self):
+        chunks = split_sentences("Hi. Dr. Smith will see you shortly.", min_chars=20)
+        assert chunks == ["Hi. Dr. Smith will see you shortly."]
+
+    def test_trailing_short_fragment_joins_previous(self):
+        chunks = split_sentences("Please follow up in one week. OK.", min_chars=20)
+        assert chunks == ["Please follow up in one week. OK."]
+
+    def test_cjk_terminators(self):
+        assert split_sentences("你好。你好吗？我很好", min_chars=1) == ["你好。", "你好吗？", "我很好"]
+
+    def test_long_sentence_is_broken(self):
+        text = ", ".join(["word"] * 100) + "."
+        chunks = split_sentences(text, max_chars=50)
+        assert all(len(c) <= 50 for c in chunks)
+        assert " ".join(chunks).replace("  ", " ") == text
+
+    def test_text_without_punctuation(self):
+        assert split_sentences("No punctuation here") == ["No punctuation here"]
+
+
+class TestTTSAudioCache:
+    """Tests for TTSAudioCache."""
+
+    def test_miss_then_hit(self):
+        cache = TTSAudioCache(max_entries=4)
+        key = TTSAudioCache.make_key("pyttsx3", "v", "en", "Hello")
+        assert cache.get(key) is None
+        cache.put(key, "audio")
+        assert cache.get(key) == "audio"
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_key_distinguishes_parameters(self):
+        a = TTSAudioCache.make_key("pyttsx3", "v", "en", "Hello")
+        b = TTSAudioCache.make_key("elevenlabs", "v", "en", "Hello")
+        c = TTSAudioCache.make_key("pyttsx3", "v", "es", "Hello")
+        assert len({a, b, c}) == 3
+
+    def test_lru_eviction(self):
+        cache = TTSAudioCache(max_entries=2)
+        cache.put(("p", "v", "en", "a"), 1)
+        cache.put(("p", "v", "en", "b"), 2)
+        cache.get(("p", "v", "en", "a"))
+        cache.put(("p", "v", "en", "c"), 3)
+        assert cache.get(("p", "v", "en", "b")) is None
+        assert cache.get(("p", "v", "en", "a")) == 1
+        assert len(cache) == 2
+
+    def test_zero_size_disables_cache(self):
+        cache = TTSAudioCache(max_entries=0)
+        cache.put(("p", "v", "en", "a"), 1)
+        assert len(cache) == 0
+
+
+class TestStreamingTTSPipeline:
+    """Tests for StreamingTTSPipeline."""
+
+    def test_plays_in_order_despite_out_of_order_synthesis(self):
+        delays = {"one": 0.05, "two": 0.0, "three": 0.01}
+        played = []
+
+        def synth(text):
+            time.sleep(delays[text])
+            return text.upper()
+
+        pipeline = StreamingTTSPipeline(synth, played.append, max_concurrency=3)
+        stats = pipeline.run(["one", "two", "three"])
+
+        assert played == ["ONE", "TWO", "THREE"]
+        assert stats.played == 3
+        assert not stats.cancelled
+
+    def test_concurrency_is_bounded(self):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def synth(text):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return text
+
+        pipeline = StreamingTTSPipeline(synth, lambda audio: None, max_concurrency=2)
+        pipeline.run([str(i) for i in range(10)])
+
+        assert peak <= 2
+
+    def test_cancel_stops_playback(self):
+        played = []
+        pipeline = StreamingTTSPipeline(lambda t: t, lambda a: None, max_concurrency=2)
+
+        def play(audio):
+            played.append(audio)
+            pipeline.cancel()
+
+        pipeline.play_fn = play
+        stats = pipeline.run(["a", "b", "c"])
+
+        assert played == ["a"]
+        assert stats.cancelled
+
+    def test_synthesis_error_propagates(self):
+        def synth(text):
+            raise RuntimeError("boom")
+
+        pipeline = StreamingTTSPipeline(synth, lambda a: None)
+        with pytest.raises(RuntimeError, match="boom"):
+            pipeline.run(["a", "b"])
+
+    def test_empty_sentences(self):
+        stats = StreamingTTSPipeline(lambda t: t, lambda a: None).run([])
+        assert stats.played == 0
+        assert stats.time_to_first_audio is None
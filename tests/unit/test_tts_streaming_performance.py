@@ -0,0 +1,66 @@
+"""Performance tests for sentence-streaming TTS playback."""
+import logging
+import time
+
+import pytest
+
+from managers.tts_streaming import StreamingTTSPipeline, split_sentences
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.benchmark
+
+
+# Stub provider cost: fixed latency plus a per-character rendering cost
+_BASE_LATENCY = 0.02
+_PER_CHAR = 0.0004
+
+_LONG_REPLY = (
+    "Please take this medication twice a day with food. "
+    "You may feel a little dizzy for the first few days. "
+    "If the dizziness does not improve, stop taking it and call the clinic. "
+    "Drink plenty of fluids and avoid alcohol while on this treatment. "
+    "We will check your blood pressure again at your next visit. "
+    "Please come back in two weeks, or sooner if your symptoms get worse."
+)
+
+
+def _stub_synthesize(text):
+    time.sleep(_BASE_LATENCY + _PER_CHAR * len(text))
+    return text
+
+
+class TestStreamingTimeToFirstAudio:
+    """Streaming should start playback well before the whole reply is rendered."""
+
+    def test_time_to_first_audio(self):
+        # Whole-text path: playback can only begin once everything is synthesized
+        start = time.perf_counter()
+        _stub_synthesize(_LONG_REPLY)
+        whole_text_first_audio = time.perf_counter() - start
+
+        pipeline = StreamingTTSPipeline(_stub_synthesize, lambda audio: None, max_concurrency=3)
+        stats = pipeline.run(split_sentences(_LONG_REPLY))
+
+        assert stats.played == stats.sentences > 1
+        assert stats.time_to_first_audio < whole_text_first_audio / 2, (
+            f"Streaming first audio {stats.time_to_first_audio:.3f}s vs "
+            f"whole-text {whole_text_first_audio:.3f}s"
+        )
+        logger.info(f"Time to first audio: streaming {stats.time_to_first_audio * 1000:.1f}ms, "
+                    f"whole-text {whole_text_first_audio * 1000:.1f}ms")
+
+    def test_concurrent_synthesis_total_time(self):
+        sentences = split_sentences(_LONG_REPLY)
+
+        start = time.perf_counter()
+        for sentence in sentences:
+            _stub_synthesize(sentence)
+        serial = time.perf_counter() - start
+
+        pipeline = StreamingTTSPipeline(_stub_synthesize, lambda audio: None, max_concurrency=3)
+        stats = pipeline.run(sentences)
+
+        assert stats.total_time < serial
+        logger.info(f"Total synthesis: concurrent {stats.total_time * 1000:.1f}ms, "
+                    f"serial {serial * 1000:.1f}ms")